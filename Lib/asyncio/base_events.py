@@ -24,8 +24,10 @@ import time
 import os
 import sys
 
+from . import constants
 from . import events
 from . import futures
+from . import protocols
 from . import tasks
 from .log import logger
 
@@ -36,6 +38,14 @@ __all__ = ['BaseEventLoop', 'Server']
 # Argument for default thread pool executor creation.
 _MAX_WORKERS = 5
 
+# Minimum number of _scheduled timer handles before cleanup of
+# cancelled handles is performed.
+_MIN_SCHEDULED_TIMER_HANDLES = 100
+
+# Minimum fraction of _scheduled timer handles that are cancelled
+# before cleanup of cancelled handles is performed.
+_MIN_CANCELLED_TIMER_HANDLES_FRACTION = 0.5
+
 
 class _StopError(BaseException):
     """Raised to stop the event loop."""
@@ -47,19 +57,42 @@ def _raise_stop_error(*args):
 
 class Server(events.AbstractServer):
 
-    def __init__(self, loop, sockets):
+    def __init__(self, loop, sockets, max_connections=None):
         self.loop = loop
         self.sockets = sockets
         self.active_count = 0
         self.waiters = []
+        self._max_connections = max_connections
+        self._paused = False  # Set while max_connections are active.
+        self._serving_args = None  # Set by _start_serving().
+
+    def _start_serving(self, protocol_factory, ssl, backlog):
+        self._serving_args = (protocol_factory, ssl, backlog)
+        for sock in self.sockets:
+            self.loop._start_serving(protocol_factory, sock, ssl, self,
+                                     backlog)
 
     def attach(self, transport):
         assert self.sockets is not None
         self.active_count += 1
+        if (self._max_connections is not None and not self._paused and
+                self.active_count >= self._max_connections):
+            # Leave new connections in the listen queue until an active
+            # one is closed.
+            self._paused = True
+            for sock in self.sockets:
+                self.loop._pause_serving(sock)
 
     def detach(self, transport):
         assert self.active_count > 0
         self.active_count -= 1
+        if (self._paused and self.sockets is not None and
+                self.active_count < self._max_connections):
+            self._paused = False
+            protocol_factory, ssl, backlog = self._serving_args
+            for sock in self.sockets:
+                self.loop._start_serving(protocol_factory, sock, ssl, self,
+                                         backlog)
         if self.active_count == 0 and self.sockets is None:
             self._wakeup()
 
@@ -88,14 +121,99 @@ class Server(events.AbstractServer):
         yield from waiter
 
 
+class _SendfileFallbackProtocol(protocols.Protocol):
+    """Protocol temporarily installed on a transport by sendfile().
+
+    It forwards everything to the original protocol but intercepts
+    pause_writing()/resume_writing(), so that the read/write fallback
+    waits for the transport buffer to drain before writing more.
+    """
+
+    def __init__(self, transp):
+        self._transport = transp
+        self._proto = transp.get_protocol()
+        self._should_resume_writing = getattr(transp, '_protocol_paused',
+                                              False)
+        transp.set_protocol(self)
+        if self._should_resume_writing:
+            self._write_ready_fut = futures.Future(loop=transp._loop)
+        else:
+            self._write_ready_fut = None
+
+    @tasks.coroutine
+    def drain(self):
+        if self._transport._conn_lost:
+            raise ConnectionError("Connection closed by peer")
+        fut = self._write_ready_fut
+        if fut is None:
+            return
+        yield from fut
+
+    def connection_made(self, transport):
+        raise RuntimeError("Invalid state: "
+                           "connection should have been established already.")
+
+    def connection_lost(self, exc):
+        if self._write_ready_fut is not None:
+            # Never happens if peer disconnects after sending the whole
+            # content, thus disconnection is always an exception from the
+            # user's perspective.
+            if exc is None:
+                self._write_ready_fut.set_exception(
+                    ConnectionError("Connection is closed by peer"))
+            else:
+                self._write_ready_fut.set_exception(exc)
+        self._proto.connection_lost(exc)
+
+    def pause_writing(self):
+        if self._write_ready_fut is not None:
+            return
+        self._write_ready_fut = futures.Future(loop=self._transport._loop)
+
+    def resume_writing(self):
+        if self._write_ready_fut is None:
+            return
+        self._write_ready_fut.set_result(False)
+        self._write_ready_fut = None
+
+    def data_received(self, data):
+        self._proto.data_received(data)
+
+    def get_buffer(self, sizehint):
+        return self._proto.get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes):
+        self._proto.buffer_updated(nbytes)
+
+    def eof_received(self):
+        return self._proto.eof_received()
+
+    def restore(self):
+        if self._transport.get_protocol() is self:
+            self._transport.set_protocol(self._proto)
+        # Keep the original protocol's view of the flow control state in
+        # sync with the transport's.
+        still_paused = self._write_ready_fut is not None
+        if still_paused:
+            self._write_ready_fut.cancel()
+            self._write_ready_fut = None
+            if not self._should_resume_writing:
+                self._proto.pause_writing()
+        elif self._should_resume_writing:
+            self._proto.resume_writing()
+
+
 class BaseEventLoop(events.AbstractEventLoop):
 
     def __init__(self):
         self._ready = collections.deque()
         self._scheduled = []
+        self._timer_cancelled_count = 0
         self._default_executor = None
         self._internal_fds = 0
         self._running = False
+        self._stats = None
+        self._task_factory = None
 
     def _make_socket_transport(self, sock, protocol, waiter=None, *,
                                extra=None, server=None):
@@ -193,6 +311,7 @@ class BaseEventLoop(events.AbstractEventLoop):
         """
         self._ready.clear()
         self._scheduled.clear()
+        self._timer_cancelled_count = 0
         executor = self._default_executor
         if executor is not None:
             self._default_executor = None
@@ -202,6 +321,16 @@ class BaseEventLoop(events.AbstractEventLoop):
         """Returns running status of event loop."""
         return self._running
 
+    def get_stats(self):
+        """Return the LoopStats installed with set_stats(), or None."""
+        return self._stats
+
+    def set_stats(self, stats):
+        """Install a LoopStats to update, or None to stop measuring."""
+        if stats is not None and not isinstance(stats, events.LoopStats):
+            raise TypeError('stats must be a LoopStats or None')
+        self._stats = stats
+
     def time(self):
         """Return the time according to the event loop's clock."""
         return time.monotonic()
@@ -226,8 +355,9 @@ class BaseEventLoop(events.AbstractEventLoop):
 
     def call_at(self, when, callback, *args):
         """Like call_later(), but uses an absolute time."""
-        timer = events.TimerHandle(when, callback, args)
+        timer = events.TimerHandle(when, callback, args, self)
         heapq.heappush(self._scheduled, timer)
+        timer._scheduled = True
         return timer
 
     def call_soon(self, callback, *args):
@@ -244,6 +374,35 @@ class BaseEventLoop(events.AbstractEventLoop):
         self._ready.append(handle)
         return handle
 
+    def create_task(self, coro):
+        """Schedule a coroutine object.
+
+        Return a Task object, created by the task factory if one was set
+        with set_task_factory().
+        """
+        if self._task_factory is None:
+            return tasks.Task(coro, loop=self)
+        return self._task_factory(self, coro)
+
+    def set_task_factory(self, factory):
+        """Set a task factory that will be used by create_task().
+
+        If factory is None the default task factory will be set.
+
+        If factory is a callable, it should have a signature matching
+        '(loop, coro)', where 'loop' will be a reference to the active
+        event loop, 'coro' will be a coroutine object.  The callable
+        must return a Future.  tasks.eager_task_factory is such a
+        callable.
+        """
+        if factory is not None and not callable(factory):
+            raise TypeError('task factory must be a callable or None')
+        self._task_factory = factory
+
+    def get_task_factory(self):
+        """Return a task factory, or None if the default one is in use."""
+        return self._task_factory
+
     def call_soon_threadsafe(self, callback, *args):
         """XXX"""
         handle = self.call_soon(callback, *args)
@@ -456,6 +615,111 @@ class BaseEventLoop(events.AbstractEventLoop):
         transport = self._make_datagram_transport(sock, protocol, r_addr)
         return transport, protocol
 
+    @tasks.coroutine
+    def sendfile(self, transport, file, offset=0, count=None,
+                 *, fallback=True):
+        """Send a file to transport.
+
+        Return the total number of bytes which were sent.
+
+        The method uses high-performance os.sendfile if available.
+
+        file must be a regular file object opened in binary mode.
+
+        offset tells from where to start reading the file. If specified,
+        count is the total number of bytes to transmit as opposed to
+        sending the file until EOF is reached. File position is updated on
+        return or also in case of error in which case file.tell()
+        can be used to figure out the number of bytes
+        which were sent.
+
+        fallback set to True makes asyncio to manually read and send
+        the file when the platform does not support the sendfile syscall
+        (e.g. Windows or SSL socket on Unix).
+
+        Raise SendfileNotAvailableError if the system does not support
+        sendfile syscall and fallback is False.
+        """
+        if transport._closing:
+            raise RuntimeError("Transport is closing")
+        mode = getattr(transport, '_sendfile_compatible',
+                       constants._SendfileMode.UNSUPPORTED)
+        if mode is constants._SendfileMode.UNSUPPORTED:
+            raise RuntimeError(
+                "sendfile is not supported for transport {!r}".format(
+                    transport))
+        self._check_sendfile_params(file, offset, count)
+        if mode is constants._SendfileMode.TRY_NATIVE:
+            try:
+                return (yield from self._sendfile_native(transport, file,
+                                                         offset, count))
+            except events.SendfileNotAvailableError:
+                if not fallback:
+                    raise
+
+        if not fallback:
+            raise events.SendfileNotAvailableError(
+                "fallback is disabled and native sendfile is not "
+                "supported for transport {!r}".format(transport))
+
+        return (yield from self._sendfile_fallback(transport, file,
+                                                   offset, count))
+
+    @tasks.coroutine
+    def _sendfile_native(self, transp, file, offset, count):
+        raise events.SendfileNotAvailableError(
+            "sendfile syscall is not supported")
+
+    @tasks.coroutine
+    def _sendfile_fallback(self, transp, file, offset, count):
+        file.seek(offset)
+        blocksize = min(count, constants.SENDFILE_FALLBACK_READBUFFER_SIZE) \
+            if count else constants.SENDFILE_FALLBACK_READBUFFER_SIZE
+        # One buffer is reused for the whole file: transports copy the data
+        # they can't send immediately, so it can be overwritten right away.
+        buf = bytearray(blocksize)
+        total_sent = 0
+        proto = _SendfileFallbackProtocol(transp)
+        try:
+            while True:
+                if count:
+                    blocksize = min(count - total_sent, blocksize)
+                    if blocksize <= 0:
+                        return total_sent
+                view = memoryview(buf)[:blocksize]
+                read = yield from self.run_in_executor(None, file.readinto,
+                                                       view)
+                if not read:
+                    return total_sent
+                yield from proto.drain()
+                transp.write(view[:read])
+                total_sent += read
+        finally:
+            if total_sent > 0 and hasattr(file, 'seek'):
+                file.seek(offset + total_sent)
+            proto.restore()
+
+    def _check_sendfile_params(self, file, offset, count):
+        if 'b' not in getattr(file, 'mode', 'b'):
+            raise ValueError("file should be opened in binary mode")
+        if not isinstance(offset, int):
+            raise TypeError(
+                "offset must be a non-negative integer (got {!r})".format(
+                    offset))
+        if offset < 0:
+            raise ValueError(
+                "offset must be a non-negative integer (got {!r})".format(
+                    offset))
+        if count is not None:
+            if not isinstance(count, int):
+                raise TypeError(
+                    "count must be a positive integer (got {!r})".format(
+                        count))
+            if count <= 0:
+                raise ValueError(
+                    "count must be a positive integer (got {!r})".format(
+                        count))
+
     @tasks.coroutine
     def create_server(self, protocol_factory, host=None, port=None,
                       *,
@@ -464,10 +728,16 @@ class BaseEventLoop(events.AbstractEventLoop):
                       sock=None,
                       backlog=100,
                       ssl=None,
-                      reuse_address=None):
+                      reuse_address=None,
+                      reuse_port=None,
+                      max_connections=None):
         """XXX"""
         if isinstance(ssl, bool):
             raise TypeError('ssl argument must be an SSLContext or None')
+        if max_connections is not None and max_connections < 1:
+            raise ValueError('max_connections must be at least 1')
+        if reuse_port and not hasattr(socket, 'SO_REUSEPORT'):
+            raise ValueError('reuse_port not supported by socket module')
         if host is not None or port is not None:
             if sock is not None:
                 raise ValueError(
@@ -499,6 +769,14 @@ class BaseEventLoop(events.AbstractEventLoop):
                     if reuse_address:
                         sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR,
                                         True)
+                    if reuse_port:
+                        try:
+                            sock.setsockopt(socket.SOL_SOCKET,
+                                            socket.SO_REUSEPORT, True)
+                        except OSError:
+                            raise ValueError('reuse_port not supported by '
+                                             'socket module, SO_REUSEPORT '
+                                             'defined but not implemented')
                     # Disable IPv4/IPv6 dual stack support (enabled by
                     # default on Linux) which makes a single socket
                     # listen on both address families.
@@ -523,11 +801,11 @@ class BaseEventLoop(events.AbstractEventLoop):
                     'host and port was not specified and no sock specified')
             sockets = [sock]
 
-        server = Server(self, sockets)
+        server = Server(self, sockets, max_connections)
         for sock in sockets:
             sock.listen(backlog)
             sock.setblocking(False)
-            self._start_serving(protocol_factory, sock, ssl, server)
+        server._start_serving(protocol_factory, ssl, backlog)
         return server
 
     @tasks.coroutine
@@ -581,6 +859,10 @@ class BaseEventLoop(events.AbstractEventLoop):
         else:
             self._ready.append(handle)
 
+    def _timer_handle_cancelled(self, handle):
+        """Notification that a TimerHandle in _scheduled was cancelled."""
+        self._timer_cancelled_count += 1
+
     def _add_callback_signalsafe(self, handle):
         """Like _add_callback() but called from a signal handler."""
         self._add_callback(handle)
@@ -593,9 +875,29 @@ class BaseEventLoop(events.AbstractEventLoop):
         schedules the resulting callbacks, and finally schedules
         'call_later' callbacks.
         """
-        # Remove delayed calls that were cancelled from head of queue.
-        while self._scheduled and self._scheduled[0]._cancelled:
-            heapq.heappop(self._scheduled)
+        sched_count = len(self._scheduled)
+        if (sched_count > _MIN_SCHEDULED_TIMER_HANDLES and
+            self._timer_cancelled_count / sched_count >
+                _MIN_CANCELLED_TIMER_HANDLES_FRACTION):
+            # Remove delayed calls that were cancelled if their number
+            # is too high, instead of waiting for them to reach the head
+            # of the queue.
+            new_scheduled = []
+            for handle in self._scheduled:
+                if handle._cancelled:
+                    handle._scheduled = False
+                else:
+                    new_scheduled.append(handle)
+            heapq.heapify(new_scheduled)
+            self._scheduled = new_scheduled
+            self._timer_cancelled_count = 0
+        else:
+            # Remove delayed calls that were cancelled from head of queue.
+            while self._scheduled and self._scheduled[0]._cancelled:
+                handle = heapq.heappop(self._scheduled)
+                if handle._scheduled:
+                    handle._scheduled = False
+                    self._timer_cancelled_count -= 1
 
         timeout = None
         if self._ready:
@@ -619,6 +921,9 @@ class BaseEventLoop(events.AbstractEventLoop):
         else:
             level = logging.DEBUG
         logger.log(level, 'poll%s took %.3f seconds', argstr, t1-t0)
+        stats = self._stats
+        if stats is not None:
+            stats._record_select(t1 - t0)
         self._process_events(event_list)
 
         # Handle 'later' callbacks that are ready.
@@ -628,6 +933,10 @@ class BaseEventLoop(events.AbstractEventLoop):
             if handle._when > now:
                 break
             handle = heapq.heappop(self._scheduled)
+            if handle._scheduled:
+                handle._scheduled = False
+                if handle._cancelled:
+                    self._timer_cancelled_count -= 1
             self._ready.append(handle)
 
         # This is the only place where callbacks are actually *called*.
@@ -637,8 +946,17 @@ class BaseEventLoop(events.AbstractEventLoop):
         # they will be run the next time (after another I/O poll).
         # Use an idiom that is threadsafe without using locks.
         ntodo = len(self._ready)
-        for i in range(ntodo):
-            handle = self._ready.popleft()
-            if not handle._cancelled:
-                handle._run()
+        if stats is None:
+            for i in range(ntodo):
+                handle = self._ready.popleft()
+                if not handle._cancelled:
+                    handle._run()
+        else:
+            stats._record_queues(ntodo, len(self._scheduled))
+            for i in range(ntodo):
+                handle = self._ready.popleft()
+                if not handle._cancelled:
+                    t0 = self.time()
+                    handle._run()
+                    stats._record_callback(handle, self.time() - t0)
         handle = None  # Needed to break cycles when an exception occurs.
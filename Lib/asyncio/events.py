@@ -2,12 +2,16 @@
 
 __all__ = ['AbstractEventLoopPolicy',
            'AbstractEventLoop', 'AbstractServer',
-           'Handle', 'TimerHandle',
+           'Handle', 'TimerHandle', 'SendfileNotAvailableError',
+           'LoopStats',
            'get_event_loop_policy', 'set_event_loop_policy',
            'get_event_loop', 'set_event_loop', 'new_event_loop',
            'get_child_watcher', 'set_child_watcher',
            ]
 
+import bisect
+import collections
+import functools
 import subprocess
 import sys
 import threading
@@ -16,6 +20,14 @@ import socket
 from .log import logger
 
 
+class SendfileNotAvailableError(RuntimeError):
+    """Sendfile syscall is not available.
+
+    Raised if OS does not support sendfile syscall for given socket or
+    file type.
+    """
+
+
 class Handle:
     """Object returned by callback registration methods."""
 
@@ -51,11 +63,15 @@ def make_handle(callback, args):
 class TimerHandle(Handle):
     """Object returned by timed callback registration methods."""
 
-    def __init__(self, when, callback, args):
+    def __init__(self, when, callback, args, loop=None):
         assert when is not None
         super().__init__(callback, args)
 
         self._when = when
+        # The loop which is told when the handle is cancelled while it is
+        # in its heap of scheduled calls (then _scheduled is true).
+        self._loop = loop
+        self._scheduled = False
 
     def __repr__(self):
         res = 'TimerHandle({}, {}, {})'.format(self._when,
@@ -97,6 +113,127 @@ class TimerHandle(Handle):
         equal = self.__eq__(other)
         return NotImplemented if equal is NotImplemented else not equal
 
+    def cancel(self):
+        if self._scheduled and not self._cancelled:
+            self._loop._timer_handle_cancelled(self)
+        super().cancel()
+
+
+def _callback_source(callback):
+    """Return (filename, lineno) of the code behind a callback, or None.
+
+    For the step of a Task, this is where its coroutine is suspended.
+    """
+    while isinstance(callback, functools.partial):
+        callback = callback.func
+    coro = getattr(getattr(callback, '__self__', None), '_coro', None)
+    frame = getattr(coro, 'gi_frame', None)
+    if frame is not None:
+        return frame.f_code.co_filename, frame.f_lineno
+    code = getattr(coro, 'gi_code', None)
+    if code is None:
+        code = getattr(getattr(callback, '__func__', callback),
+                       '__code__', None)
+    if code is not None:
+        return code.co_filename, code.co_firstlineno
+    return None
+
+
+class LoopStats:
+    """Counters an event loop updates while it runs.
+
+    Install an instance with loop.set_stats(); the loop then times the
+    poll for I/O and every callback it runs.  When no LoopStats is
+    installed, the loop does not time its callbacks at all.
+
+    Callbacks which take at least slow_callback_duration seconds are
+    passed to slow_callback(), which by default keeps the
+    max_slow_callbacks most recent of them in slow_callbacks.
+    """
+
+    # Upper bounds in seconds of the buckets of callback_histogram; the
+    # last bucket counts the longer callbacks.
+    histogram_bounds = (0.0001, 0.001, 0.01, 0.1, 1.0)
+
+    def __init__(self, slow_callback_duration=0.1, max_slow_callbacks=100):
+        self.slow_callback_duration = slow_callback_duration
+        self.slow_callbacks = collections.deque(maxlen=max_slow_callbacks)
+        self.reset()
+
+    def reset(self):
+        """Reset all counters to zero."""
+        self.iterations = 0
+        self.select_time = 0.0
+        self.max_select_time = 0.0
+        self.callbacks = 0
+        self.callback_time = 0.0
+        self.max_callback_time = 0.0
+        self.max_callbacks_per_iteration = 0
+        self.callback_histogram = [0] * (len(self.histogram_bounds) + 1)
+        self.slow_callback_count = 0
+        self.slow_callbacks.clear()
+        self.ready_depth = 0
+        self.max_ready_depth = 0
+        self.scheduled_depth = 0
+        self.max_scheduled_depth = 0
+
+    def as_dict(self):
+        """Return a snapshot of the counters as a dictionary."""
+        return {
+            'iterations': self.iterations,
+            'select_time': self.select_time,
+            'max_select_time': self.max_select_time,
+            'callbacks': self.callbacks,
+            'callback_time': self.callback_time,
+            'max_callback_time': self.max_callback_time,
+            'max_callbacks_per_iteration': self.max_callbacks_per_iteration,
+            'callback_histogram': list(zip(self.histogram_bounds +
+                                           (float('inf'),),
+                                           self.callback_histogram)),
+            'slow_callback_count': self.slow_callback_count,
+            'slow_callbacks': list(self.slow_callbacks),
+            'ready_depth': self.ready_depth,
+            'max_ready_depth': self.max_ready_depth,
+            'scheduled_depth': self.scheduled_depth,
+            'max_scheduled_depth': self.max_scheduled_depth,
+        }
+
+    def slow_callback(self, handle, duration):
+        """Called with the handle of every slow callback and its duration.
+
+        Records (duration, callback, source) in slow_callbacks, source
+        being the (filename, lineno) of the callback's code, or None.
+        """
+        self.slow_callbacks.append((duration, handle._callback,
+                                    _callback_source(handle._callback)))
+
+    def _record_select(self, duration):
+        self.iterations += 1
+        self.select_time += duration
+        if duration > self.max_select_time:
+            self.max_select_time = duration
+
+    def _record_queues(self, nready, nscheduled):
+        self.ready_depth = nready
+        if nready > self.max_ready_depth:
+            self.max_ready_depth = nready
+        if nready > self.max_callbacks_per_iteration:
+            self.max_callbacks_per_iteration = nready
+        self.scheduled_depth = nscheduled
+        if nscheduled > self.max_scheduled_depth:
+            self.max_scheduled_depth = nscheduled
+
+    def _record_callback(self, handle, duration):
+        self.callbacks += 1
+        self.callback_time += duration
+        if duration > self.max_callback_time:
+            self.max_callback_time = duration
+        self.callback_histogram[
+            bisect.bisect_left(self.histogram_bounds, duration)] += 1
+        if duration >= self.slow_callback_duration:
+            self.slow_callback_count += 1
+            self.slow_callback(handle, duration)
+
 
 class AbstractServer:
     """Abstract server returned by create_server()."""
@@ -138,6 +275,14 @@ class AbstractEventLoop:
         """Return whether the event loop is currently running."""
         raise NotImplementedError
 
+    def get_stats(self):
+        """Return the LoopStats installed with set_stats(), or None."""
+        raise NotImplementedError
+
+    def set_stats(self, stats):
+        """Install a LoopStats to update, or None to stop measuring."""
+        raise NotImplementedError
+
     def close(self):
         """Close the loop.
 
@@ -163,6 +308,17 @@ class AbstractEventLoop:
     def time(self):
         raise NotImplementedError
 
+    # Methods scheduling coroutines.  All these return Tasks.
+
+    def create_task(self, coro):
+        raise NotImplementedError
+
+    def set_task_factory(self, factory):
+        raise NotImplementedError
+
+    def get_task_factory(self):
+        raise NotImplementedError
+
     # Methods for interacting with threads.
 
     def call_soon_threadsafe(self, callback, *args):
@@ -189,7 +345,8 @@ class AbstractEventLoop:
 
     def create_server(self, protocol_factory, host=None, port=None, *,
                       family=socket.AF_UNSPEC, flags=socket.AI_PASSIVE,
-                      sock=None, backlog=100, ssl=None, reuse_address=None):
+                      sock=None, backlog=100, ssl=None, reuse_address=None,
+                      reuse_port=None, max_connections=None):
         """A coroutine which creates a TCP server bound to host and port.
 
         The return value is a Server object which can be used to stop
@@ -209,7 +366,8 @@ class AbstractEventLoop:
         socket object.
 
         backlog is the maximum number of queued connections passed to
-        listen() (defaults to 100).
+        listen() (defaults to 100).  It is also the maximum number of
+        connections accepted at once when the server socket is ready.
 
         ssl can be set to an SSLContext to enable SSL over the
         accepted connections.
@@ -218,6 +376,17 @@ class AbstractEventLoop:
         TIME_WAIT state, without waiting for its natural timeout to
         expire. If not specified will automatically be set to True on
         UNIX.
+
+        reuse_port tells the kernel to allow this endpoint to be bound to
+        the same port as other existing endpoints are bound to, so long as
+        they all set this flag when being created. The kernel then
+        balances incoming connections between them. This option is not
+        supported on Windows.
+
+        max_connections is the maximum number of connections the server
+        keeps open at the same time.  While it is reached, the server stops
+        accepting connections, which wait in the listen queue, until one
+        of the connections is closed.  Defaults to no limit.
         """
         raise NotImplementedError
 
@@ -226,6 +395,25 @@ class AbstractEventLoop:
                                  family=0, proto=0, flags=0):
         raise NotImplementedError
 
+    def sendfile(self, transport, file, offset=0, count=None,
+                 *, fallback=True):
+        """A coroutine which sends a file through a transport.
+
+        The file must be a regular file object opened in binary mode.
+        Sending starts at offset and stops after count bytes or at the
+        end of the file when count is None.  The file position is
+        updated to the end of the sent data.
+
+        The data is sent with os.sendfile() when both the transport and
+        the platform allow it.  Otherwise, if fallback is true, the file
+        is read into a reused buffer and written to the transport,
+        respecting its flow control; if fallback is false,
+        SendfileNotAvailableError is raised.
+
+        Return the total number of bytes sent.
+        """
+        raise NotImplementedError
+
     # Pipes and subprocesses.
 
     def connect_read_pipe(self, protocol_factory, pipe):
@@ -9,6 +9,7 @@ import socket
 from . import base_events
 from . import constants
 from . import futures
+from . import tasks
 from . import transports
 from .log import logger
 
@@ -41,6 +42,12 @@ class _ProactorBasePipeTransport(transports.BaseTransport):
     def _set_extra(self, sock):
         self._extra['pipe'] = sock
 
+    def set_protocol(self, protocol):
+        self._protocol = protocol
+
+    def get_protocol(self):
+        return self._protocol
+
     def close(self):
         if self._closing:
             return
@@ -300,6 +307,8 @@ class _ProactorSocketTransport(_ProactorReadPipeTransport,
                                transports.Transport):
     """Transport for connected sockets."""
 
+    _sendfile_compatible = constants._SendfileMode.FALLBACK
+
     def _set_extra(self, sock):
         self._extra['socket'] = sock
         try:
@@ -410,7 +419,17 @@ class BaseProactorEventLoop(base_events.BaseEventLoop):
     def _write_to_self(self):
         self._csock.send(b'x')
 
-    def _start_serving(self, protocol_factory, sock, ssl=None, server=None):
+    @tasks.coroutine
+    def create_server(self, protocol_factory, host=None, port=None, *,
+                      max_connections=None, **kwargs):
+        # Checked before any socket is created, so that none is left open.
+        if max_connections is not None:
+            raise ValueError('IocpEventLoop does not support max_connections.')
+        return (yield from super().create_server(protocol_factory, host, port,
+                                                 **kwargs))
+
+    def _start_serving(self, protocol_factory, sock, ssl=None, server=None,
+                       backlog=100):
         if ssl:
             raise ValueError('IocpEventLoop is incompatible with SSL.')
 
@@ -1,6 +1,6 @@
 """Abstract Protocol class."""
 
-__all__ = ['Protocol', 'DatagramProtocol']
+__all__ = ['Protocol', 'BufferedProtocol', 'DatagramProtocol']
 
 
 class BaseProtocol:
@@ -94,6 +94,81 @@ class Protocol(BaseProtocol):
         """
 
 
+class BufferedProtocol(BaseProtocol):
+    """Interface for stream protocol with manual buffer control.
+
+    Transports which support it read incoming data directly into a
+    buffer provided by the protocol, instead of allocating a new bytes
+    object for every chunk and passing it to data_received().
+
+    When the connection is made successfully, connection_made() is
+    called with a suitable transport object.  Then get_buffer() is
+    called to obtain a buffer, the transport writes the data it
+    receives into it, and buffer_updated() is called with the number
+    of bytes written.  This happens 0 or more times; finally,
+    connection_lost() will be called exactly once with either an
+    exception object or None as an argument.
+
+    Transports which do not support this interface call data_received()
+    instead; the implementation here copies the data through
+    get_buffer() and buffer_updated().
+
+    State machine of calls:
+
+      start -> CM [-> GB [-> BU?]]* [-> ER?] -> CL -> end
+    """
+
+    def get_buffer(self, sizehint):
+        """Called to allocate a new receive buffer.
+
+        sizehint is the recommended minimal size for the returned
+        buffer; it is acceptable to return smaller or larger buffers
+        than what sizehint suggests.  When set to -1, the buffer size
+        can be arbitrary.
+
+        Must return an object that implements the writable buffer
+        protocol, such as a bytearray or a memoryview.  It is an error
+        to return a zero-sized buffer.
+
+        get_buffer() can be called without a subsequent call to
+        buffer_updated(), for instance when the read would block.
+        """
+
+    def buffer_updated(self, nbytes):
+        """Called when the buffer was updated with the received data.
+
+        nbytes is the total number of bytes that were written to the
+        buffer returned by the last get_buffer() call.
+        """
+
+    def data_received(self, data):
+        """Called by transports which cannot fill the buffer themselves.
+
+        Copies data into the buffers returned by get_buffer() and calls
+        buffer_updated() for each of them.
+        """
+        data = memoryview(data)
+        size = len(data)
+        offset = 0
+        while offset < size:
+            buf = memoryview(self.get_buffer(size - offset))
+            if not buf:
+                raise RuntimeError('get_buffer() returned an empty buffer')
+            nbytes = min(len(buf), size - offset)
+            buf[:nbytes] = data[offset:offset + nbytes]
+            buf.release()
+            self.buffer_updated(nbytes)
+            offset += nbytes
+
+    def eof_received(self):
+        """Called when the other end calls write_eof() or equivalent.
+
+        If this returns a false value (including None), the transport
+        will close itself.  If it returns a true value, closing the
+        transport is up to the protocol.
+        """
+
+
 class DatagramProtocol(BaseProtocol):
     """Interface for datagram protocol."""
 
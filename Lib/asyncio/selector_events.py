@@ -16,7 +16,9 @@ from . import base_events
 from . import constants
 from . import events
 from . import futures
+from . import protocols
 from . import selectors
+from . import tasks
 from . import transports
 from .log import logger
 
@@ -91,42 +93,61 @@ class BaseSelectorEventLoop(base_events.BaseEventLoop):
             pass
 
     def _start_serving(self, protocol_factory, sock,
-                       sslcontext=None, server=None):
+                       sslcontext=None, server=None, backlog=100):
+        if server is not None and server._paused:
+            # The server resumes serving when a connection is closed.
+            return
         self.add_reader(sock.fileno(), self._accept_connection,
-                        protocol_factory, sock, sslcontext, server)
+                        protocol_factory, sock, sslcontext, server, backlog)
+
+    def _pause_serving(self, sock):
+        self.remove_reader(sock.fileno())
 
     def _accept_connection(self, protocol_factory, sock,
-                           sslcontext=None, server=None):
-        try:
-            conn, addr = sock.accept()
-            conn.setblocking(False)
-        except (BlockingIOError, InterruptedError, ConnectionAbortedError):
-            pass  # False alarm.
-        except OSError as exc:
-            # There's nowhere to send the error, so just log it.
-            # TODO: Someone will want an error handler for this.
-            if exc.errno in (errno.EMFILE, errno.ENFILE,
-                             errno.ENOBUFS, errno.ENOMEM):
-                # Some platforms (e.g. Linux keep reporting the FD as
-                # ready, so we remove the read handler temporarily.
-                # We'll try again in a while.
-                logger.exception('Accept out of system resource (%s)', exc)
-                self.remove_reader(sock.fileno())
-                self.call_later(constants.ACCEPT_RETRY_DELAY,
-                                self._start_serving,
-                                protocol_factory, sock, sslcontext, server)
-            else:
-                raise  # The event loop will catch, log and ignore it.
-        else:
-            if sslcontext:
-                self._make_ssl_transport(
-                    conn, protocol_factory(), sslcontext, None,
-                    server_side=True, extra={'peername': addr}, server=server)
+                           sslcontext=None, server=None, backlog=100):
+        # This is called once per event loop iteration in which the
+        # listening socket is readable, and there may be many connections
+        # waiting: accept up to backlog of them before going back to the
+        # other callbacks, rather than one per iteration.
+        for _ in range(backlog):
+            try:
+                conn, addr = sock.accept()
+                conn.setblocking(False)
+            except (BlockingIOError, InterruptedError,
+                    ConnectionAbortedError):
+                return  # The accept queue is empty, or false alarm.
+            except OSError as exc:
+                # There's nowhere to send the error, so just log it.
+                # TODO: Someone will want an error handler for this.
+                if exc.errno in (errno.EMFILE, errno.ENFILE,
+                                 errno.ENOBUFS, errno.ENOMEM):
+                    # Some platforms (e.g. Linux keep reporting the FD as
+                    # ready, so we remove the read handler temporarily.
+                    # We'll try again in a while.
+                    logger.exception('Accept out of system resource (%s)',
+                                     exc)
+                    self.remove_reader(sock.fileno())
+                    self.call_later(constants.ACCEPT_RETRY_DELAY,
+                                    self._start_serving,
+                                    protocol_factory, sock, sslcontext,
+                                    server, backlog)
+                    return
+                else:
+                    raise  # The event loop will catch, log and ignore it.
             else:
-                self._make_socket_transport(
-                    conn, protocol_factory(), extra={'peername': addr},
-                    server=server)
-        # It's now up to the protocol to handle the connection.
+                if sslcontext:
+                    self._make_ssl_transport(
+                        conn, protocol_factory(), sslcontext, None,
+                        server_side=True, extra={'peername': addr},
+                        server=server)
+                else:
+                    self._make_socket_transport(
+                        conn, protocol_factory(), extra={'peername': addr},
+                        server=server)
+                # It's now up to the protocol to handle the connection.
+                if server is not None and server._paused:
+                    # The server reached its max_connections.
+                    return
 
     def add_reader(self, fd, callback, *args):
         """Add a reader callback."""
@@ -317,6 +338,23 @@ class BaseSelectorEventLoop(base_events.BaseEventLoop):
         else:
             fut.set_result((conn, address))
 
+    @tasks.coroutine
+    def _sendfile_native(self, transp, file, offset, count):
+        # Wait until the data already written to the transport is sent,
+        # then send the file directly from the socket; write() is refused
+        # meanwhile so the two streams can't interleave.
+        yield from transp._make_empty_waiter()
+        try:
+            return (yield from self._sock_sendfile_native(transp._sock, file,
+                                                          offset, count))
+        finally:
+            transp._reset_empty_waiter()
+
+    @tasks.coroutine
+    def _sock_sendfile_native(self, sock, file, offset, count):
+        raise events.SendfileNotAvailableError(
+            "sendfile syscall is not supported on this platform")
+
     def _process_events(self, event_list):
         for key, mask in event_list:
             fileobj, (reader, writer) = key.fileobj, key.data
@@ -340,6 +378,8 @@ class _SelectorTransport(transports.Transport):
 
     max_size = 256 * 1024  # Buffer size passed to recv().
 
+    _sendfile_compatible = constants._SendfileMode.FALLBACK
+
     _buffer_factory = bytearray  # Constructs initial value for self._buffer.
 
     def __init__(self, loop, sock, protocol, extra, server=None):
@@ -360,10 +400,19 @@ class _SelectorTransport(transports.Transport):
         self._conn_lost = 0  # Set when call to connection_lost scheduled.
         self._closing = False  # Set when close() called.
         self._protocol_paused = False
+        # Future waiting for the write buffer to be flushed, set by
+        # sendfile().
+        self._empty_waiter = None
         self.set_write_buffer_limits()
         if self._server is not None:
             self._server.attach(self)
 
+    def set_protocol(self, protocol):
+        self._protocol = protocol
+
+    def get_protocol(self):
+        return self._protocol
+
     def abort(self):
         self._force_close(None)
 
@@ -385,6 +434,7 @@ class _SelectorTransport(transports.Transport):
     def _force_close(self, exc):
         if self._conn_lost:
             return
+        self._fail_empty_waiter(exc)
         if self._buffer:
             self._buffer.clear()
             self._loop.remove_writer(self._sock_fd)
@@ -444,20 +494,38 @@ class _SelectorTransport(transports.Transport):
     def get_write_buffer_size(self):
         return len(self._buffer)
 
+    def _fail_empty_waiter(self, exc):
+        waiter = self._empty_waiter
+        if waiter is not None and not waiter.done():
+            if exc is None:
+                exc = ConnectionError("Connection is closed by peer")
+            waiter.set_exception(exc)
+
 
 class _SelectorSocketTransport(_SelectorTransport):
 
+    _sendfile_compatible = constants._SendfileMode.TRY_NATIVE
+
     def __init__(self, loop, sock, protocol, waiter=None,
                  extra=None, server=None):
         super().__init__(loop, sock, protocol, extra, server)
         self._eof = False
         self._paused = False
+        self.set_protocol(protocol)
 
         self._loop.add_reader(self._sock_fd, self._read_ready)
         self._loop.call_soon(self._protocol.connection_made, self)
         if waiter is not None:
             self._loop.call_soon(waiter.set_result, None)
 
+    def set_protocol(self, protocol):
+        # The way data is received depends on the type of the protocol.
+        if isinstance(protocol, protocols.BufferedProtocol):
+            self._read_ready_cb = self._read_ready__get_buffer
+        else:
+            self._read_ready_cb = self._read_ready__data_received
+        super().set_protocol(protocol)
+
     def pause_reading(self):
         if self._closing:
             raise RuntimeError('Cannot pause_reading() when closing')
@@ -475,6 +543,32 @@ class _SelectorSocketTransport(_SelectorTransport):
         self._loop.add_reader(self._sock_fd, self._read_ready)
 
     def _read_ready(self):
+        self._read_ready_cb()
+
+    def _read_ready__get_buffer(self):
+        try:
+            buf = self._protocol.get_buffer(self.max_size)
+            if not len(buf):
+                raise RuntimeError('get_buffer() returned an empty buffer')
+        except Exception as exc:
+            self._fatal_error(exc)
+            return
+        try:
+            nbytes = self._sock.recv_into(buf)
+        except (BlockingIOError, InterruptedError):
+            pass
+        except Exception as exc:
+            self._fatal_error(exc)
+        else:
+            # Drop our reference first, so that the protocol is free to
+            # resize the object which backs the buffer.
+            del buf
+            if nbytes:
+                self._protocol.buffer_updated(nbytes)
+            else:
+                self._read_ready__on_eof()
+
+    def _read_ready__data_received(self):
         try:
             data = self._sock.recv(self.max_size)
         except (BlockingIOError, InterruptedError):
@@ -485,14 +579,17 @@ class _SelectorSocketTransport(_SelectorTransport):
             if data:
                 self._protocol.data_received(data)
             else:
-                keep_open = self._protocol.eof_received()
-                if keep_open:
-                    # We're keeping the connection open so the
-                    # protocol can write more, but we still can't
-                    # receive more, so remove the reader callback.
-                    self._loop.remove_reader(self._sock_fd)
-                else:
-                    self.close()
+                self._read_ready__on_eof()
+
+    def _read_ready__on_eof(self):
+        keep_open = self._protocol.eof_received()
+        if keep_open:
+            # We're keeping the connection open so the
+            # protocol can write more, but we still can't
+            # receive more, so remove the reader callback.
+            self._loop.remove_reader(self._sock_fd)
+        else:
+            self.close()
 
     def write(self, data):
         if not isinstance(data, (bytes, bytearray, memoryview)):
@@ -500,6 +597,8 @@ class _SelectorSocketTransport(_SelectorTransport):
                             type(data))
         if self._eof:
             raise RuntimeError('Cannot call write() after write_eof()')
+        if self._empty_waiter is not None:
+            raise RuntimeError('unable to write; sendfile is in progress')
         if not data:
             return
 
@@ -546,6 +645,8 @@ class _SelectorSocketTransport(_SelectorTransport):
             self._maybe_resume_protocol()  # May append to buffer.
             if not self._buffer:
                 self._loop.remove_writer(self._sock_fd)
+                if self._empty_waiter is not None:
+                    self._empty_waiter.set_result(None)
                 if self._closing:
                     self._call_connection_lost(None)
                 elif self._eof:
@@ -561,6 +662,17 @@ class _SelectorSocketTransport(_SelectorTransport):
     def can_write_eof(self):
         return True
 
+    def _make_empty_waiter(self):
+        if self._empty_waiter is not None:
+            raise RuntimeError("Empty waiter is already set")
+        self._empty_waiter = futures.Future(loop=self._loop)
+        if not self._buffer:
+            self._empty_waiter.set_result(None)
+        return self._empty_waiter
+
+    def _reset_empty_waiter(self):
+        self._empty_waiter = None
+
 
 class _SelectorSslTransport(_SelectorTransport):
 
@@ -2,9 +2,10 @@
 
 __all__ = ['StreamReader', 'StreamWriter', 'StreamReaderProtocol',
            'open_connection', 'start_server',
+           'IncompleteReadError', 'LimitOverrunError',
            ]
 
-import collections
+import struct
 
 from . import events
 from . import futures
@@ -15,6 +16,32 @@ from . import tasks
 _DEFAULT_LIMIT = 2**16
 
 
+class IncompleteReadError(EOFError):
+    """
+    Incomplete read error. Attributes:
+
+    - partial: read bytes string before the end of stream was reached
+    - expected: total number of expected bytes (or None if unknown)
+    """
+    def __init__(self, partial, expected):
+        super().__init__("%s bytes read on a total of %r expected bytes"
+                         % (len(partial), expected))
+        self.partial = partial
+        self.expected = expected
+
+
+class LimitOverrunError(Exception):
+    """
+    Reached the buffer limit while looking for a separator, or a frame
+    is larger than allowed.  Attributes:
+
+    - consumed: total number of bytes to be consumed
+    """
+    def __init__(self, message, consumed):
+        super().__init__(message)
+        self.consumed = consumed
+
+
 @tasks.coroutine
 def open_connection(host=None, port=None, *,
                     loop=None, limit=_DEFAULT_LIMIT, **kwds):
@@ -81,9 +108,12 @@ def start_server(client_connected_cb, host=None, port=None, *,
     return (yield from loop.create_server(factory, host, port, **kwds))
 
 
-class StreamReaderProtocol(protocols.Protocol):
+class StreamReaderProtocol(protocols.BufferedProtocol):
     """Trivial helper class to adapt between Protocol and StreamReader.
 
+    Transports which support BufferedProtocol receive data directly
+    into the buffer of the StreamReader.
+
     (This is a helper class instead of making StreamReader itself a
     Protocol subclass, because the StreamReader has other potential
     uses, and to prevent the user of the StreamReader to accidentally
@@ -107,7 +137,7 @@ class StreamReaderProtocol(protocols.Protocol):
             res = self._client_connected_cb(self._stream_reader,
                                             self._stream_writer)
             if tasks.iscoroutine(res):
-                tasks.Task(res, loop=self._loop)
+                self._loop.create_task(res)
 
     def connection_lost(self, exc):
         if exc is None:
@@ -125,6 +155,12 @@ class StreamReaderProtocol(protocols.Protocol):
                     else:
                         waiter.set_exception(exc)
 
+    def get_buffer(self, sizehint):
+        return self._stream_reader._get_buffer(sizehint)
+
+    def buffer_updated(self, nbytes):
+        self._stream_reader._buffer_updated(nbytes)
+
     def data_received(self, data):
         self._stream_reader.feed_data(data)
 
@@ -220,13 +256,18 @@ class StreamReader:
         if loop is None:
             loop = events.get_event_loop()
         self._loop = loop
-        self._buffer = collections.deque()  # Deque of bytes objects.
-        self._byte_count = 0  # Bytes in buffer.
+        self._buffer = bytearray()
         self._eof = False  # Whether we're done.
         self._waiter = None  # A future.
         self._exception = None
         self._transport = None
         self._paused = False
+        # Receive buffer handed out by _get_buffer(), kept from one call to
+        # the next and only replaced when a larger one is needed.
+        self._recv_buffer = None
+        # Memoryview returned by the last _get_buffer() call, until
+        # _buffer_updated() is called.
+        self._spare = None
 
     def exception(self):
         return self._exception
@@ -244,8 +285,29 @@ class StreamReader:
         assert self._transport is None, 'Transport already set'
         self._transport = transport
 
+    def _wakeup_waiter(self):
+        waiter = self._waiter
+        if waiter is not None:
+            self._waiter = None
+            if not waiter.cancelled():
+                waiter.set_result(False)
+
+    def _maybe_pause_transport(self):
+        if (self._transport is not None and
+            not self._paused and
+            len(self._buffer) > 2*self._limit):
+            try:
+                self._transport.pause_reading()
+            except NotImplementedError:
+                # The transport can't be paused.
+                # We'll just have to buffer all data.
+                # Forget the transport so we don't keep trying.
+                self._transport = None
+            else:
+                self._paused = True
+
     def _maybe_resume_transport(self):
-        if self._paused and self._byte_count <= self._limit:
+        if self._paused and len(self._buffer) <= self._limit:
             self._paused = False
             self._transport.resume_reading()
 
@@ -261,74 +323,201 @@ class StreamReader:
         if not data:
             return
 
-        self._buffer.append(data)
-        self._byte_count += len(data)
+        self._buffer.extend(data)
+        self._wakeup_waiter()
+        self._maybe_pause_transport()
 
-        waiter = self._waiter
-        if waiter is not None:
+    def _get_buffer(self, sizehint):
+        """Return a writable memoryview for the transport to receive data
+        into.
+
+        The space is at most sizehint bytes and at most the limit; what is
+        written into it does not count as data until _buffer_updated() is
+        called.  The same receive buffer is reused by each call, and is
+        only reallocated when it is too small.
+        """
+        nbytes = self._limit
+        if 0 < sizehint < nbytes:
+            nbytes = sizehint
+        recv_buffer = self._recv_buffer
+        if recv_buffer is None or len(recv_buffer) < nbytes:
+            # Views returned by previous calls may still be alive, so the
+            # buffer is replaced rather than resized.
+            recv_buffer = self._recv_buffer = bytearray(nbytes)
+        self._spare = memoryview(recv_buffer)[:nbytes]
+        return self._spare
+
+    def _buffer_updated(self, nbytes):
+        """Append the first nbytes of the space returned by _get_buffer()
+        to the data.
+
+        This copies the received bytes once.  Receiving directly at the
+        end of self._buffer would avoid the copy, but the bytearray could
+        then not be resized by the read methods while a view of it is held
+        by the transport, and it would have to be grown by filling its
+        spare capacity first, which costs as much as the copy.
+        """
+        spare = self._spare
+        assert spare is not None, '_buffer_updated() without _get_buffer()'
+        self._spare = None
+        if nbytes:
+            self._buffer.extend(spare[:nbytes])
+        spare.release()
+        if nbytes:
+            self._wakeup_waiter()
+            self._maybe_pause_transport()
+
+    @tasks.coroutine
+    def _wait_for_data(self):
+        """Wait until feed_data(), _buffer_updated() or feed_eof() is
+        called."""
+        assert not self._waiter
+        # The caller needs more data than the buffer holds: if the buffer
+        # filled up to the point the transport was paused, waiting would
+        # deadlock.
+        if self._paused:
+            self._paused = False
+            self._transport.resume_reading()
+        self._waiter = futures.Future(loop=self._loop)
+        try:
+            yield from self._waiter
+        finally:
             self._waiter = None
-            if not waiter.cancelled():
-                waiter.set_result(False)
 
-        if (self._transport is not None and
-            not self._paused and
-            self._byte_count > 2*self._limit):
-            try:
-                self._transport.pause_reading()
-            except NotImplementedError:
-                # The transport can't be paused.
-                # We'll just have to buffer all data.
-                # Forget the transport so we don't keep trying.
-                self._transport = None
+    @tasks.coroutine
+    def readline(self):
+        """Read chunk of data from the stream until newline (b'\\n') is
+        found.
+
+        On success, return chunk that ends with newline.  If only partial
+        line can be read due to EOF, return incomplete line without
+        terminating newline.  When EOF was reached while no bytes read,
+        empty bytes object is returned.
+
+        If the limit is reached, ValueError is raised and the line,
+        up to and including the newline if it was found, is dropped.
+        """
+        sep = b'\n'
+        try:
+            line = yield from self.readuntil(sep)
+        except IncompleteReadError as e:
+            return e.partial
+        except LimitOverrunError as e:
+            if self._buffer.startswith(sep, e.consumed):
+                del self._buffer[:e.consumed + len(sep)]
             else:
-                self._paused = True
+                self._buffer.clear()
+            self._maybe_resume_transport()
+            raise ValueError('Line is too long') from None
+        return line
 
     @tasks.coroutine
-    def readline(self):
+    def readuntil(self, separator=b'\n'):
+        """Read data from the stream until separator is found.
+
+        On success, the data and separator will be removed from the
+        internal buffer (consumed).  Returned data will include the
+        separator at the end.
+
+        The search resumes where the previous scan stopped whenever new
+        data arrives, so long records are not rescanned from the start.
+
+        If the amount of data read exceeds the limit before the separator
+        is found, LimitOverrunError is raised, and the data is left in the
+        internal buffer; its consumed attribute is the number of bytes
+        before the separator, or scanned so far if it was not found.
+
+        If EOF is reached before the complete separator is found,
+        IncompleteReadError is raised with the remaining data as its
+        partial attribute, and the internal buffer is reset.
+        """
+        seplen = len(separator)
+        if seplen == 0:
+            raise ValueError('Separator should be at least one-byte string')
+
         if self._exception is not None:
             raise self._exception
 
-        parts = []
-        parts_size = 0
-        not_enough = True
-
-        while not_enough:
-            while self._buffer and not_enough:
-                data = self._buffer.popleft()
-                ichar = data.find(b'\n')
-                if ichar < 0:
-                    parts.append(data)
-                    parts_size += len(data)
-                else:
-                    ichar += 1
-                    head, tail = data[:ichar], data[ichar:]
-                    if tail:
-                        self._buffer.appendleft(tail)
-                    not_enough = False
-                    parts.append(head)
-                    parts_size += len(head)
-
-                if parts_size > self._limit:
-                    self._byte_count -= parts_size
-                    self._maybe_resume_transport()
-                    raise ValueError('Line is too long')
+        # Offset from which the next search starts: everything before it
+        # is known not to contain the start of the separator.
+        offset = 0
+        while True:
+            buflen = len(self._buffer)
+            if buflen - offset >= seplen:
+                isep = self._buffer.find(separator, offset)
+                if isep != -1:
+                    break
+                offset = buflen + 1 - seplen
+                if offset > self._limit:
+                    raise LimitOverrunError(
+                        'Separator is not found, and chunk exceeds the limit',
+                        offset)
 
             if self._eof:
-                break
+                chunk = bytes(self._buffer)
+                self._buffer.clear()
+                raise IncompleteReadError(chunk, None)
+
+            yield from self._wait_for_data()
 
-            if not_enough:
-                assert self._waiter is None
-                self._waiter = futures.Future(loop=self._loop)
-                try:
-                    yield from self._waiter
-                finally:
-                    self._waiter = None
+        if isep > self._limit:
+            raise LimitOverrunError(
+                'Separator is found, but chunk is longer than limit', isep)
 
-        line = b''.join(parts)
-        self._byte_count -= parts_size
+        chunk = bytes(self._buffer[:isep + seplen])
+        del self._buffer[:isep + seplen]
         self._maybe_resume_transport()
+        return chunk
 
-        return line
+    @tasks.coroutine
+    def readframe(self, header_format='!I', max_size=None):
+        """Read a length-prefixed frame from the stream.
+
+        The frame starts with a header which is unpacked with the struct
+        format header_format and whose last field is the length of the
+        payload which follows.  Return the payload, without the header.
+
+        If max_size is not None and the payload is longer, the header is
+        left in the internal buffer and LimitOverrunError is raised.
+        ValueError is raised, leaving the header in the internal buffer
+        too, if the length is negative, which a signed format allows.
+
+        If EOF is reached before the end of the frame, IncompleteReadError
+        is raised with the remaining data as its partial attribute, and
+        the internal buffer is reset.
+        """
+        header = struct.Struct(header_format)
+
+        if self._exception is not None:
+            raise self._exception
+
+        length = None
+        while True:
+            buflen = len(self._buffer)
+            if length is None and buflen >= header.size:
+                length = header.unpack_from(self._buffer)[-1]
+                if length < 0:
+                    raise ValueError('Negative frame length %d' % length)
+                if max_size is not None and length > max_size:
+                    raise LimitOverrunError(
+                        'Frame of %d bytes is longer than %d bytes'
+                        % (length, max_size), header.size + length)
+            if length is not None and buflen >= header.size + length:
+                break
+
+            if self._eof:
+                chunk = bytes(self._buffer)
+                self._buffer.clear()
+                raise IncompleteReadError(
+                    chunk, None if length is None else header.size + length)
+
+            yield from self._wait_for_data()
+
+        end = header.size + length
+        frame = bytes(self._buffer[header.size:end])
+        del self._buffer[:end]
+        self._maybe_resume_transport()
+        return frame
 
     @tasks.coroutine
     def read(self, n=-1):
@@ -340,44 +529,20 @@ class StreamReader:
 
         if n < 0:
             while not self._eof:
-                assert not self._waiter
-                self._waiter = futures.Future(loop=self._loop)
-                try:
-                    yield from self._waiter
-                finally:
-                    self._waiter = None
+                yield from self._wait_for_data()
         else:
-            if not self._byte_count and not self._eof:
-                assert not self._waiter
-                self._waiter = futures.Future(loop=self._loop)
-                try:
-                    yield from self._waiter
-                finally:
-                    self._waiter = None
-
-        if n < 0 or self._byte_count <= n:
-            data = b''.join(self._buffer)
+            if not self._buffer and not self._eof:
+                yield from self._wait_for_data()
+
+        if n < 0 or len(self._buffer) <= n:
+            data = bytes(self._buffer)
             self._buffer.clear()
-            self._byte_count = 0
-            self._maybe_resume_transport()
-            return data
-
-        parts = []
-        parts_bytes = 0
-        while self._buffer and parts_bytes < n:
-            data = self._buffer.popleft()
-            data_bytes = len(data)
-            if n < parts_bytes + data_bytes:
-                data_bytes = n - parts_bytes
-                data, rest = data[:data_bytes], data[data_bytes:]
-                self._buffer.appendleft(rest)
-
-            parts.append(data)
-            parts_bytes += data_bytes
-            self._byte_count -= data_bytes
-            self._maybe_resume_transport()
+        else:
+            data = bytes(self._buffer[:n])
+            del self._buffer[:n]
 
-        return b''.join(parts)
+        self._maybe_resume_transport()
+        return data
 
     @tasks.coroutine
     def readexactly(self, n):
@@ -387,12 +552,7 @@ class StreamReader:
         if n <= 0:
             return b''
 
-        while self._byte_count < n and not self._eof:
-            assert not self._waiter
-            self._waiter = futures.Future(loop=self._loop)
-            try:
-                yield from self._waiter
-            finally:
-                self._waiter = None
+        while len(self._buffer) < n and not self._eof:
+            yield from self._wait_for_data()
 
         return (yield from self.read(n))
@@ -3,7 +3,7 @@
 __all__ = ['coroutine', 'Task',
            'FIRST_COMPLETED', 'FIRST_EXCEPTION', 'ALL_COMPLETED',
            'wait', 'wait_for', 'as_completed', 'sleep', 'async',
-           'gather', 'shield',
+           'gather', 'shield', 'eager_task_factory',
            ]
 
 import collections
@@ -148,14 +148,17 @@ class Task(futures.Future):
             loop = events.get_event_loop()
         return {t for t in cls._all_tasks if t._loop is loop}
 
-    def __init__(self, coro, *, loop=None):
+    def __init__(self, coro, *, loop=None, eager_start=False):
         assert iscoroutine(coro), repr(coro)  # Not a coroutine function!
         super().__init__(loop=loop)
         self._coro = iter(coro)  # Use the iterator just in case.
         self._fut_waiter = None
         self._must_cancel = False
-        self._loop.call_soon(self._step)
         self.__class__._all_tasks.add(self)
+        if eager_start and self._loop.is_running():
+            self._eager_start()
+        else:
+            self._loop.call_soon(self._step)
 
     def __repr__(self):
         res = super().__repr__()
@@ -259,6 +262,19 @@ class Task(futures.Future):
         self._must_cancel = True
         return True
 
+    def _eager_start(self):
+        # Run the first step right away, within the caller: a coroutine
+        # which does not block completes the task without ever being
+        # scheduled.  The caller may itself be a task of the same loop,
+        # so the current task is restored afterwards.
+        current_tasks = self.__class__._current_tasks
+        prev_task = current_tasks.pop(self._loop, None)
+        try:
+            self._step()
+        finally:
+            if prev_task is not None:
+                current_tasks[self._loop] = prev_task
+
     def _step(self, value=None, exc=None):
         assert not self.done(), \
             '_step(): already done: {!r}, {!r}, {!r}'.format(self, value, exc)
@@ -517,11 +533,29 @@ def async(coro_or_future, *, loop=None):
             raise ValueError('loop argument must agree with Future')
         return coro_or_future
     elif iscoroutine(coro_or_future):
-        return Task(coro_or_future, loop=loop)
+        if loop is None:
+            loop = events.get_event_loop()
+        return loop.create_task(coro_or_future)
     else:
         raise TypeError('A Future or coroutine is required')
 
 
+def eager_task_factory(loop, coro):
+    """Task factory running the first step of tasks eagerly.
+
+    Install it with loop.set_task_factory(eager_task_factory).  Tasks
+    created while the loop is running then execute their coroutine
+    synchronously, within create_task() or async(), until it blocks on
+    a future: a coroutine which returns without blocking, e.g. because
+    its result was cached, gives an already completed task and costs no
+    loop iteration at all.
+
+    Unlike with the default factory, the coroutine starts running before
+    create_task() returns, and in the context of the caller.
+    """
+    return Task(coro, loop=loop, eager_start=True)
+
+
 class _GatheringFuture(futures.Future):
     """Helper for gather().
 
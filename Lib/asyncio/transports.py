@@ -19,6 +19,14 @@ class BaseTransport:
         """Get optional transport information."""
         return self._extra.get(name, default)
 
+    def set_protocol(self, protocol):
+        """Set a new protocol."""
+        raise NotImplementedError
+
+    def get_protocol(self):
+        """Return the current protocol."""
+        raise NotImplementedError
+
     def close(self):
         """Close the transport.
 
@@ -2,6 +2,7 @@
 
 import errno
 import fcntl
+import io
 import os
 import signal
 import socket
@@ -9,11 +10,13 @@ import stat
 import subprocess
 import sys
 import threading
+import traceback
 
 
 from . import base_subprocess
 from . import constants
 from . import events
+from . import futures
 from . import protocols
 from . import selector_events
 from . import tasks
@@ -24,6 +27,7 @@ from .log import logger
 __all__ = ['SelectorEventLoop', 'STDIN', 'STDOUT', 'STDERR',
            'AbstractChildWatcher', 'SafeChildWatcher',
            'FastChildWatcher', 'DefaultEventLoopPolicy',
+           'fork_server_workers',
            ]
 
 STDIN = 0
@@ -53,6 +57,99 @@ class _UnixSelectorEventLoop(selector_events.BaseSelectorEventLoop):
             self.remove_signal_handler(sig)
         super().close()
 
+    @tasks.coroutine
+    def _sock_sendfile_native(self, sock, file, offset, count):
+        try:
+            os.sendfile
+        except AttributeError:
+            raise events.SendfileNotAvailableError(
+                "os.sendfile() is not available")
+        try:
+            fileno = file.fileno()
+        except (AttributeError, io.UnsupportedOperation):
+            raise events.SendfileNotAvailableError("not a regular file")
+        try:
+            fsize = os.fstat(fileno).st_size
+        except OSError:
+            raise events.SendfileNotAvailableError("not a regular file")
+        blocksize = count if count else fsize
+        if not blocksize:
+            return 0  # empty file
+
+        fut = futures.Future(loop=self)
+        self._sock_sendfile_native_impl(fut, None, sock, fileno,
+                                        offset, count, blocksize, 0)
+        return (yield from fut)
+
+    def _sock_sendfile_native_impl(self, fut, registered_fd, sock, fileno,
+                                   offset, count, blocksize, total_sent):
+        fd = sock.fileno()
+        if registered_fd is not None:
+            # Remove the callback early.  It should be rare that the
+            # selector says the fd is ready but the call still returns
+            # EAGAIN, and I am willing to take a hit in that case in
+            # order to simplify the common case.
+            self.remove_writer(registered_fd)
+        if fut.cancelled():
+            self._sock_sendfile_update_filepos(fileno, offset, total_sent)
+            return
+        if count:
+            blocksize = count - total_sent
+            if blocksize <= 0:
+                self._sock_sendfile_update_filepos(fileno, offset, total_sent)
+                fut.set_result(total_sent)
+                return
+
+        try:
+            sent = os.sendfile(fd, fileno, offset, blocksize)
+        except (BlockingIOError, InterruptedError):
+            if registered_fd is None:
+                self._sock_add_cancellation_callback(fut, sock)
+            self.add_writer(fd, self._sock_sendfile_native_impl, fut,
+                            fd, sock, fileno,
+                            offset, count, blocksize, total_sent)
+        except OSError as exc:
+            self._sock_sendfile_update_filepos(fileno, offset, total_sent)
+            if total_sent == 0:
+                # We can get here for different reasons, the main
+                # one being 'file' is not a regular mmap(2)-like
+                # file, in which case we'll fall back on using
+                # plain send().
+                err = events.SendfileNotAvailableError(
+                    "os.sendfile call failed")
+                err.__cause__ = exc
+                fut.set_exception(err)
+            else:
+                fut.set_exception(exc)
+        except Exception as exc:
+            self._sock_sendfile_update_filepos(fileno, offset, total_sent)
+            fut.set_exception(exc)
+        else:
+            if sent == 0:
+                # EOF
+                self._sock_sendfile_update_filepos(fileno, offset, total_sent)
+                fut.set_result(total_sent)
+            else:
+                offset += sent
+                total_sent += sent
+                if registered_fd is None:
+                    self._sock_add_cancellation_callback(fut, sock)
+                self.add_writer(fd, self._sock_sendfile_native_impl, fut,
+                                fd, sock, fileno,
+                                offset, count, blocksize, total_sent)
+
+    def _sock_sendfile_update_filepos(self, fileno, offset, total_sent):
+        if total_sent > 0:
+            os.lseek(fileno, offset, os.SEEK_SET)
+
+    def _sock_add_cancellation_callback(self, fut, sock):
+        def cb(fut):
+            if fut.cancelled():
+                fd = sock.fileno()
+                if fd != -1:
+                    self.remove_writer(fd)
+        fut.add_done_callback(cb)
+
     def add_signal_handler(self, sig, callback, *args):
         """Add a handler for a signal.  UNIX only.
 
@@ -400,6 +497,63 @@ class _UnixSubprocessTransport(base_subprocess.BaseSubprocessTransport):
             self._proc.stdin = open(stdin_w.detach(), 'rb', buffering=bufsize)
 
 
+def fork_server_workers(protocol_factory, host=None, port=None, *,
+                        workers=None, **kwds):
+    """Fork worker processes serving the same TCP port.
+
+    Each of the workers (defaults to the number of CPUs) creates its own
+    event loop and its own listening socket with
+    loop.create_server(protocol_factory, host, port, reuse_port=True,
+    **kwds), so that the kernel balances the incoming connections between
+    them instead of waking up every worker for each of them.  A worker
+    runs until it receives SIGTERM or SIGINT; it then stops accepting
+    connections and exits with status 0, or with status 1 if the server
+    could not be started.
+
+    Returns the list of the process ids of the workers.  Since every
+    worker binds its own socket, port must be given explicitly.
+    """
+    if not port:
+        raise ValueError('port must be specified')
+    if not hasattr(socket, 'SO_REUSEPORT'):
+        raise ValueError('reuse_port not supported by socket module')
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise ValueError('workers must be at least 1')
+
+    pids = []
+    for i in range(workers):
+        pid = os.fork()
+        if pid == 0:
+            status = 1
+            try:
+                _run_server_worker(protocol_factory, host, port, kwds)
+                status = 0
+            except BaseException:
+                traceback.print_exc()
+            finally:
+                os._exit(status)
+        pids.append(pid)
+    return pids
+
+
+def _run_server_worker(protocol_factory, host, port, kwds):
+    # The event loop inherited from the parent shares its selector with
+    # the parent: leave it alone and run a new one.
+    loop = events.new_event_loop()
+    events.set_event_loop(loop)
+    try:
+        server = loop.run_until_complete(loop.create_server(
+            protocol_factory, host, port, reuse_port=True, **kwds))
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(signum, loop.stop)
+        loop.run_forever()
+        server.close()
+    finally:
+        loop.close()
+
+
 class AbstractChildWatcher:
     """Abstract base class for monitoring child processes.
 
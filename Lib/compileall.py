@@ -14,35 +14,34 @@ import os
 import sys
 import errno
 import importlib.util
+import io
 import py_compile
 import struct
 
-__all__ = ["compile_dir","compile_file","compile_path"]
+try:
+    from concurrent.futures import ProcessPoolExecutor
+except ImportError:
+    ProcessPoolExecutor = None
 
-def compile_dir(dir, maxlevels=10, ddir=None, force=False, rx=None,
-                quiet=False, legacy=False, optimize=-1):
-    """Byte-compile all modules in the given directory tree.
+__all__ = ["compile_dir","compile_file","compile_path"]
 
-    Arguments (only dir is required):
+def _walk_dir(dir, ddir=None, maxlevels=10, quiet=False):
+    """Yield what compile_dir() has to do for the given directory tree.
 
-    dir:       the directory to byte-compile
-    maxlevels: maximum recursion level (default 10)
-    ddir:      the directory that will be prepended to the path to the
-               file as it is compiled into each byte-code file.
-    force:     if True, force compilation, even if timestamps are up-to-date
-    quiet:     if True, be quiet during compilation
-    legacy:    if True, produce legacy pyc paths instead of PEP 3147 paths
-    optimize:  optimization level or -1 for level of the interpreter
+    Files are yielded as (fullname, ddir) pairs, in the order the serial
+    compile_dir() has always visited them.  The messages printed while
+    listing directories are yielded in the same stream as (None, message)
+    pairs, so that callers compiling files out of order can still emit
+    them at the right place.
     """
     if not quiet:
-        print('Listing {!r}...'.format(dir))
+        yield None, 'Listing {!r}...'.format(dir)
     try:
         names = os.listdir(dir)
     except OSError:
-        print("Can't list {!r}".format(dir))
+        yield None, "Can't list {!r}".format(dir)
         names = []
     names.sort()
-    success = 1
     for name in names:
         if name == '__pycache__':
             continue
@@ -52,16 +51,84 @@ def compile_dir(dir, maxlevels=10, ddir=None, force=False, rx=None,
         else:
             dfile = None
         if not os.path.isdir(fullname):
-            if not compile_file(fullname, ddir, force, rx, quiet,
-                                legacy, optimize):
-                success = 0
+            yield fullname, ddir
         elif (maxlevels > 0 and name != os.curdir and name != os.pardir and
               os.path.isdir(fullname) and not os.path.islink(fullname)):
-            if not compile_dir(fullname, maxlevels - 1, dfile, force, rx,
-                               quiet, legacy, optimize):
+            yield from _walk_dir(fullname, dfile, maxlevels - 1, quiet)
+
+def compile_dir(dir, maxlevels=10, ddir=None, force=False, rx=None,
+                quiet=False, legacy=False, optimize=-1, workers=1):
+    """Byte-compile all modules in the given directory tree.
+
+    Arguments (only dir is required):
+
+    dir:       the directory to byte-compile
+    maxlevels: maximum recursion level (default 10)
+    ddir:      the directory that will be prepended to the path to the
+               file as it is compiled into each byte-code file.
+    force:     if True, force compilation, even if timestamps are up-to-date
+    quiet:     if True, be quiet during compilation
+    legacy:    if True, produce legacy pyc paths instead of PEP 3147 paths
+    optimize:  optimization level or -1 for level of the interpreter
+    workers:   maximum number of parallel workers, 0 for one per CPU
+    """
+    if workers < 0:
+        raise ValueError('workers must be greater or equal to 0')
+    walker = _walk_dir(dir, ddir, maxlevels, quiet)
+    success = 1
+    if workers != 1 and ProcessPoolExecutor is not None:
+        # Keep the output of every file in the order of the serial path:
+        # workers capture what they print and hand it back with the result.
+        with ProcessPoolExecutor(max_workers=workers or None) as executor:
+            pending = []
+            for fullname, arg in walker:
+                if fullname is None:
+                    pending.append(arg)
+                else:
+                    pending.append(executor.submit(
+                        _compile_file_captured, fullname, arg, force, rx,
+                        quiet, legacy, optimize))
+            for item in pending:
+                if isinstance(item, str):
+                    print(item)
+                    continue
+                ok, output = item.result()
+                sys.stdout.write(output)
+                if not ok:
+                    success = 0
+    else:
+        for fullname, arg in walker:
+            if fullname is None:
+                print(arg)
+            elif not compile_file(fullname, arg, force, rx, quiet,
+                                  legacy, optimize):
                 success = 0
     return success
 
+class _CapturedOutput(io.StringIO):
+    # compile_file() escapes error messages for the encoding of stdout,
+    # so the capture buffer has to advertise the real one.
+    def __init__(self, encoding):
+        super().__init__()
+        self._encoding = encoding
+
+    @property
+    def encoding(self):
+        return self._encoding
+
+def _compile_file_captured(fullname, ddir, force, rx, quiet, legacy,
+                           optimize):
+    """Run compile_file() in a worker, returning (success, output)."""
+    stdout = sys.stdout
+    sys.stdout = _CapturedOutput(getattr(stdout, 'encoding', None) or
+                                 'utf-8')
+    try:
+        ok = compile_file(fullname, ddir, force, rx, quiet, legacy,
+                          optimize)
+        return ok, sys.stdout.getvalue()
+    finally:
+        sys.stdout = stdout
+
 def compile_file(fullname, ddir=None, force=False, rx=None, quiet=False,
                  legacy=False, optimize=-1):
     """Byte-compile one file.
@@ -138,7 +205,7 @@ def compile_file(fullname, ddir=None, force=False, rx=None, quiet=False,
     return success
 
 def compile_path(skip_curdir=1, maxlevels=0, force=False, quiet=False,
-                 legacy=False, optimize=-1):
+                 legacy=False, optimize=-1, workers=1):
     """Byte-compile all module on sys.path.
 
     Arguments (all optional):
@@ -149,6 +216,7 @@ def compile_path(skip_curdir=1, maxlevels=0, force=False, quiet=False,
     quiet: as for compile_dir() (default False)
     legacy: as for compile_dir() (default False)
     optimize: as for compile_dir() (default -1)
+    workers: as for compile_dir() (default 1)
     """
     success = 1
     for dir in sys.path:
@@ -157,7 +225,8 @@ def compile_path(skip_curdir=1, maxlevels=0, force=False, quiet=False,
         else:
             success = success and compile_dir(dir, maxlevels, None,
                                               force, quiet=quiet,
-                                              legacy=legacy, optimize=optimize)
+                                              legacy=legacy, optimize=optimize,
+                                              workers=workers)
     return success
 
 
@@ -193,6 +262,9 @@ def main():
                         help=('zero or more file and directory names '
                               'to compile; if no arguments given, defaults '
                               'to the equivalent of -l sys.path'))
+    parser.add_argument('-j', '--workers', default=1, type=int,
+                        help=('run up to WORKERS compilations in parallel; '
+                              '0 means one per CPU (default: 1)'))
     args = parser.parse_args()
 
     compile_dests = args.compile_dest
@@ -200,6 +272,8 @@ def main():
     if (args.ddir and (len(compile_dests) != 1
             or not os.path.isdir(compile_dests[0]))):
         parser.exit('-d destdir requires exactly one directory argument')
+    if args.workers < 0:
+        parser.error('-j/--workers must be greater or equal to 0')
     if args.rx:
         import re
         args.rx = re.compile(args.rx)
@@ -225,11 +299,11 @@ def main():
                 else:
                     if not compile_dir(dest, args.maxlevels, args.ddir,
                                        args.force, args.rx, args.quiet,
-                                       args.legacy):
+                                       args.legacy, workers=args.workers):
                         success = False
             return success
         else:
-            return compile_path(legacy=args.legacy)
+            return compile_path(legacy=args.legacy, workers=args.workers)
     except KeyboardInterrupt:
         print("\n[interrupted]")
         return False
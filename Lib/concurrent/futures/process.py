@@ -48,10 +48,11 @@ __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 import atexit
 import os
 from concurrent.futures import _base
+from functools import partial
+import itertools
 import queue
 from queue import Full
 import multiprocessing
-from multiprocessing import SimpleQueue
 from multiprocessing.connection import wait
 import threading
 import weakref
@@ -96,10 +97,11 @@ class _WorkItem(object):
         self.kwargs = kwargs
 
 class _ResultItem(object):
-    def __init__(self, work_id, exception=None, result=None):
+    def __init__(self, work_id, exception=None, result=None, exit_pid=None):
         self.work_id = work_id
         self.exception = exception
         self.result = result
+        self.exit_pid = exit_pid
 
 class _CallItem(object):
     def __init__(self, work_id, fn, args, kwargs):
@@ -108,7 +110,39 @@ class _CallItem(object):
         self.args = args
         self.kwargs = kwargs
 
-def _process_worker(call_queue, result_queue):
+def _get_chunks(*iterables, chunksize):
+    """ Iterates over zip()ed iterables in chunks. """
+    it = zip(*iterables)
+    while True:
+        chunk = tuple(itertools.islice(it, chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+def _process_chunk(fn, chunk):
+    """ Processes a chunk of an iterable passed to map.
+
+    Runs the function passed to map() on a chunk of the
+    iterable passed to map.
+
+    This function is run in a separate process.
+
+    """
+    return [fn(*args) for args in chunk]
+
+def _chain_from_iterable_of_lists(iterable):
+    """
+    Specialized implementation of itertools.chain.from_iterable.
+    Each item in *iterable* should be a list.  This function is
+    careful not to keep references to yielded objects.
+    """
+    for element in iterable:
+        element.reverse()
+        while element:
+            yield element.pop()
+
+def _process_worker(call_queue, result_queue, initializer, initargs,
+                    max_tasks=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
@@ -118,23 +152,48 @@ def _process_worker(call_queue, result_queue):
             evaluated by the worker.
         result_queue: A multiprocessing.Queue of _ResultItems that will written
             to by the worker.
-        shutdown: A multiprocessing.Event that will be set as a signal to the
-            worker that it should exit when call_queue is empty.
+        initializer: A callable initializer, or None
+        initargs: A tuple of args for the initializer
+        max_tasks: The number of calls after which the worker exits, or None
+            to run until told to stop.
     """
+    if initializer is not None:
+        try:
+            initializer(*initargs)
+        except BaseException:
+            _base.LOGGER.critical('Exception in initializer:', exc_info=True)
+            # The parent will notice that the process stopped and
+            # mark the pool broken
+            return
+    num_tasks = 0
+    exit_pid = None
     while True:
         call_item = call_queue.get(block=True)
         if call_item is None:
             # Wake up queue management thread
             result_queue.put(os.getpid())
             return
+        if max_tasks is not None:
+            num_tasks += 1
+            if num_tasks >= max_tasks:
+                exit_pid = os.getpid()
         try:
             r = call_item.fn(*call_item.args, **call_item.kwargs)
         except BaseException as e:
             result_queue.put(_ResultItem(call_item.work_id,
-                                         exception=e))
+                                         exception=e,
+                                         exit_pid=exit_pid))
         else:
             result_queue.put(_ResultItem(call_item.work_id,
-                                         result=r))
+                                         result=r,
+                                         exit_pid=exit_pid))
+        # Liberate the resources as soon as possible, to avoid holding onto
+        # open files or shared memory that is not needed anymore
+        del call_item
+        if exit_pid is not None:
+            # The queue management thread replaces this worker when it
+            # receives the result above.
+            return
 
 def _add_call_item_to_queue(pending_work_items,
                             work_ids,
@@ -269,6 +328,15 @@ def _queue_management_worker(executor_reference,
                     work_item.future.set_result(result_item.result)
                 # Delete references to object. See issue16284
                 del work_item
+            if result_item.exit_pid is not None:
+                # The worker reached max_tasks_per_child and is exiting
+                p = processes.pop(result_item.exit_pid)
+                p.join()
+                executor = executor_reference()
+                if executor is not None and (pending_work_items or
+                                             not shutting_down()):
+                    executor._adjust_process_count()
+                executor = None
         # Check whether we should start shutting down.
         executor = executor_reference()
         # No more work items can be added if:
@@ -313,7 +381,7 @@ def _check_system_limits():
     raise NotImplementedError(_system_limited)
 
 
-class BrokenProcessPool(RuntimeError):
+class BrokenProcessPool(_base.BrokenExecutor):
     """
     Raised when a process in a ProcessPoolExecutor terminated abruptly
     while a future was in the running state.
@@ -321,13 +389,23 @@ class BrokenProcessPool(RuntimeError):
 
 
 class ProcessPoolExecutor(_base.Executor):
-    def __init__(self, max_workers=None):
+    def __init__(self, max_workers=None, initializer=None, initargs=(),
+                 max_tasks_per_child=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
             max_workers: The maximum number of processes that can be used to
                 execute the given calls. If None or not given then as many
                 worker processes will be created as the machine has processors.
+            initializer: A callable used to initialize worker processes.
+            initargs: A tuple of arguments to pass to the initializer.
+            max_tasks_per_child: The maximum number of tasks a worker process
+                can complete before it will exit and be replaced with a fresh
+                worker process. If None or not given then worker processes
+                will live as long as the pool. When a maximum is given,
+                worker processes are started with the "spawn" method, as
+                starting them with fork() from the queue management thread
+                would not be safe.
         """
         _check_system_limits()
 
@@ -336,16 +414,31 @@ class ProcessPoolExecutor(_base.Executor):
         else:
             self._max_workers = max_workers
 
+        if initializer is not None and not callable(initializer):
+            raise TypeError("initializer must be a callable")
+        self._initializer = initializer
+        self._initargs = initargs
+
+        if max_tasks_per_child is not None:
+            if not isinstance(max_tasks_per_child, int):
+                raise TypeError("max_tasks_per_child must be an integer")
+            elif max_tasks_per_child <= 0:
+                raise ValueError("max_tasks_per_child must be >= 1")
+            self._mp_context = multiprocessing.get_context("spawn")
+        else:
+            self._mp_context = multiprocessing.get_context()
+        self._max_tasks_per_child = max_tasks_per_child
+
         # Make the call queue slightly larger than the number of processes to
         # prevent the worker processes from idling. But don't make it too big
         # because futures in the call queue cannot be cancelled.
-        self._call_queue = multiprocessing.Queue(self._max_workers +
-                                                 EXTRA_QUEUED_CALLS)
+        self._call_queue = self._mp_context.Queue(self._max_workers +
+                                                  EXTRA_QUEUED_CALLS)
         # Killed worker processes can produce spurious "broken pipe"
         # tracebacks in the queue's own worker thread. But we detect killed
         # processes anyway, so silence the tracebacks.
         self._call_queue._ignore_epipe = True
-        self._result_queue = SimpleQueue()
+        self._result_queue = self._mp_context.SimpleQueue()
         self._work_ids = queue.Queue()
         self._queue_management_thread = None
         # Map of pids to processes
@@ -380,10 +473,13 @@ class ProcessPoolExecutor(_base.Executor):
 
     def _adjust_process_count(self):
         for _ in range(len(self._processes), self._max_workers):
-            p = multiprocessing.Process(
+            p = self._mp_context.Process(
                     target=_process_worker,
                     args=(self._call_queue,
-                          self._result_queue))
+                          self._result_queue,
+                          self._initializer,
+                          self._initargs,
+                          self._max_tasks_per_child))
             p.start()
             self._processes[p.pid] = p
 
@@ -408,6 +504,35 @@ class ProcessPoolExecutor(_base.Executor):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
+    def map(self, fn, *iterables, timeout=None, chunksize=1):
+        """Returns a iterator equivalent to map(fn, iter).
+
+        Args:
+            fn: A callable that will take as many arguments as there are
+                passed iterables.
+            timeout: The maximum number of seconds to wait. If None, then there
+                is no limit on the wait time.
+            chunksize: If greater than one, the iterables will be chopped into
+                chunks of size chunksize and submitted to the process pool.
+                If set to one, the items in the list will be sent one at a time.
+
+        Returns:
+            An iterator equivalent to: map(func, *iterables) but the calls may
+            be evaluated out-of-order.
+
+        Raises:
+            TimeoutError: If the entire result iterator could not be generated
+                before the given timeout.
+            Exception: If fn(*args) raises for any values.
+        """
+        if chunksize < 1:
+            raise ValueError("chunksize must be >= 1.")
+
+        results = super().map(partial(_process_chunk, fn),
+                              _get_chunks(*iterables, chunksize=chunksize),
+                              timeout=timeout)
+        return _chain_from_iterable_of_lists(results)
+
     def shutdown(self, wait=True):
         with self._shutdown_lock:
             self._shutdown_thread = True
@@ -26,19 +26,24 @@ def iglob(pathname):
     patterns.
 
     """
+    return _iglob(pathname, False)
+
+def _iglob(pathname, dironly):
     if not has_magic(pathname):
         if os.path.lexists(pathname):
             yield pathname
         return
     dirname, basename = os.path.split(pathname)
     if not dirname:
-        yield from glob1(None, basename)
+        yield from glob1(None, basename, dironly)
         return
     # `os.path.split()` returns the argument itself as a dirname if it is a
     # drive or UNC path.  Prevent an infinite recursion if a drive or UNC path
     # contains magic characters (i.e. r'\\?\C:').
     if dirname != pathname and has_magic(dirname):
-        dirs = iglob(dirname)
+        # Only directories can contain further matches, so the parent
+        # components are matched against directory entries only.
+        dirs = _iglob(dirname, True)
     else:
         dirs = [dirname]
     if has_magic(basename):
@@ -46,28 +51,25 @@ def iglob(pathname):
     else:
         glob_in_dir = glob0
     for dirname in dirs:
-        for name in glob_in_dir(dirname, basename):
+        for name in glob_in_dir(dirname, basename, dironly):
             yield os.path.join(dirname, name)
 
 # These 2 helper functions non-recursively glob inside a literal directory.
 # They return a list of basenames. `glob1` accepts a pattern while `glob0`
 # takes a literal basename (so it only has to check for its existence).
 
-def glob1(dirname, pattern):
+def glob1(dirname, pattern, dironly=False):
     if not dirname:
         if isinstance(pattern, bytes):
             dirname = bytes(os.curdir, 'ASCII')
         else:
             dirname = os.curdir
-    try:
-        names = os.listdir(dirname)
-    except OSError:
-        return []
+    names = list(_iterdir(dirname, dironly))
     if not _ishidden(pattern):
         names = [x for x in names if not _ishidden(x)]
     return fnmatch.filter(names, pattern)
 
-def glob0(dirname, basename):
+def glob0(dirname, basename, dironly=False):
     if not basename:
         # `os.path.split()` returns an empty basename for paths ending with a
         # directory separator.  'q*x/' should match only directories.
@@ -78,6 +80,22 @@ def glob0(dirname, basename):
             return [basename]
     return []
 
+# Iterate over the names in a directory.  os.scandir() reports the file
+# type of each entry, so if dironly is true the non-directories are skipped
+# without an extra stat() call per name.
+
+def _iterdir(dirname, dironly):
+    try:
+        with os.scandir(dirname) as it:
+            for entry in it:
+                try:
+                    if not dironly or entry.is_dir():
+                        yield entry.name
+                except OSError:
+                    pass
+    except OSError:
+        return
+
 
 magic_check = re.compile('([*?[])')
 magic_check_bytes = re.compile(b'([*?[])')
@@ -56,6 +56,12 @@ Note: this enforcement is applied by the HTTPConnection class. The
       requests cannot be placed into the pipeline until it is known that
       the server will NOT be closing the connection.
 
+      HTTPConnection.pipeline() sends several requests in a row anyway,
+      for the client which accepts to send again the requests following
+      one whose response closes the connection.  The connection stays in
+      the Request-sent state until getresponse() has returned the
+      response to each of them.
+
 Logical State                  __state            __response
 -------------                  -------            ----------
 Idle                           _CS_IDLE           None
@@ -495,17 +501,31 @@ class HTTPResponse(io.RawIOBase):
             self._close_conn()
             return b""
 
+        if amt is not None and amt < 0:
+            # A negative amount is the RawIOBase way to read everything.
+            amt = None
+
+        if self.chunked:
+            return self._read_chunked(amt)
+
         if amt is not None:
-            # Amount is given, so call base class version
-            # (which is implemented in terms of self.readinto)
-            return super(HTTPResponse, self).read(amt)
+            # Read straight from the buffered file: going through
+            # readinto() would need a temporary buffer and a copy.
+            if self.length is not None and amt > self.length:
+                # clip the read to the "end of response"
+                amt = self.length
+            s = self.fp.read(amt)
+            if not s and amt:
+                # Ideally, we would raise IncompleteRead if the content-length
+                # wasn't satisfied, but it might break compatibility.
+                self._close_conn()
+            elif self.length is not None:
+                self.length -= len(s)
+                if not self.length:
+                    self._close_conn()
+            return s
         else:
             # Amount is not given (unbounded read) so we must check self.length
-            # and self.chunked
-
-            if self.chunked:
-                return self._readall_chunked()
-
             if self.length is None:
                 s = self.fp.read()
             else:
@@ -538,7 +558,7 @@ class HTTPResponse(io.RawIOBase):
         # connection, and the user is reading more bytes than will be provided
         # (for example, reading in 1k chunks)
         n = self.fp.readinto(b)
-        if not n:
+        if not n and b:
             # Ideally, we would raise IncompleteRead if the content-length
             # wasn't satisfied, but it might break compatibility.
             self._close_conn()
@@ -548,6 +568,75 @@ class HTTPResponse(io.RawIOBase):
                 self._close_conn()
         return n
 
+    def read1(self, n=-1):
+        """Read and return up to n bytes, with at most one read on the
+        socket unless data is buffered.  Return b"" at the end of the body.
+        """
+        if self.fp is None or self._method == "HEAD":
+            return b""
+        if self.chunked:
+            return self._read1_chunked(n)
+        if self.length is not None and (n < 0 or n > self.length):
+            n = self.length
+        if n < 0:
+            n = MAXAMOUNT
+        result = self.fp.read1(n)
+        if not result and n:
+            self._close_conn()
+        elif self.length is not None:
+            self.length -= len(result)
+            if not self.length:
+                self._close_conn()
+        return result
+
+    def peek(self, n=-1):
+        """Return buffered bytes of the body without consuming them.
+
+        Fewer or more than n bytes may be returned; at most one read is
+        done on the socket, and only if nothing is buffered.
+        """
+        if self.fp is None or self._method == "HEAD":
+            return b""
+        if self.chunked:
+            return self._peek_chunked(n)
+        result = self.fp.peek(n)
+        if self.length is not None:
+            result = result[:self.length]
+        return result
+
+    def readline(self, limit=-1):
+        if self.fp is None or self._method == "HEAD":
+            return b""
+        if self.chunked:
+            # IOBase.readline() reads through peek() and read()
+            return super().readline(limit)
+        if self.length is not None and (limit < 0 or limit > self.length):
+            limit = self.length
+        result = self.fp.readline(limit)
+        if not result and limit:
+            self._close_conn()
+        elif self.length is not None:
+            self.length -= len(result)
+            if not self.length:
+                self._close_conn()
+        return result
+
+    def iter_chunks(self, size=65536):
+        """Iterate over the rest of the body in bytes objects of at most
+        size bytes.
+
+        Unlike read(), this never holds more than size bytes of the body
+        in memory, whatever its length.  The pieces do not follow the
+        chunks of a body sent with the chunked transfer coding.
+        """
+        if size <= 0:
+            raise ValueError("size must be positive")
+        while True:
+            data = self.read(size)
+            if not data:
+                return
+            yield data
+
     def _read_next_chunk_size(self):
         # Read the next chunk size from the file
         line = self.fp.readline(_MAXLINE + 1)
@@ -578,110 +667,119 @@ class HTTPResponse(io.RawIOBase):
             if line in (b'\r\n', b'\n', b''):
                 break
 
-    def _readall_chunked(self):
-        assert self.chunked != _UNKNOWN
+    def _get_chunk_left(self):
+        # Return self.chunk_left, reading a new chunk size if necessary:
+        #   chunk_left == 0: at the end of the current chunk, its CRLF is
+        #                    still to be read
+        #   chunk_left is None: no current chunk
+        # Return None once the last chunk has been read.
         chunk_left = self.chunk_left
-        value = []
-        while True:
-            if chunk_left is None:
-                try:
-                    chunk_left = self._read_next_chunk_size()
-                    if chunk_left == 0:
-                        break
-                except ValueError:
-                    raise IncompleteRead(b''.join(value))
-            value.append(self._safe_read(chunk_left))
-
-            # we read the whole chunk, get another
-            self._safe_read(2)      # toss the CRLF at the end of the chunk
-            chunk_left = None
-
-        self._read_and_discard_trailer()
-
-        # we read everything; close the "file"
-        self._close_conn()
+        if not chunk_left: # Can be 0 or None
+            if chunk_left is not None:
+                # We are at the end of chunk, discard chunk end
+                self._safe_read(2)  # toss the CRLF at the end of the chunk
+            try:
+                chunk_left = self._read_next_chunk_size()
+            except ValueError:
+                raise IncompleteRead(b'')
+            if chunk_left == 0:
+                # last chunk: 1*("0") [ chunk-extension ] CRLF
+                self._read_and_discard_trailer()
+                # we read everything; close the "file"
+                self._close_conn()
+                chunk_left = None
+            self.chunk_left = chunk_left
+        return chunk_left
 
-        return b''.join(value)
+    def _read_chunked(self, amt=None):
+        assert self.chunked != _UNKNOWN
+        value = []
+        try:
+            while amt is None or amt > 0:
+                chunk_left = self._get_chunk_left()
+                if chunk_left is None:
+                    break
+                if amt is not None and amt < chunk_left:
+                    value.append(self._safe_read(amt))
+                    self.chunk_left = chunk_left - amt
+                    break
+                value.append(self._safe_read(chunk_left))
+                if amt is not None:
+                    amt -= chunk_left
+                self.chunk_left = 0
+            return b''.join(value)
+        except IncompleteRead:
+            raise IncompleteRead(b''.join(value))
 
     def _readinto_chunked(self, b):
         assert self.chunked != _UNKNOWN
-        chunk_left = self.chunk_left
-
         total_bytes = 0
         mvb = memoryview(b)
-        while True:
-            if chunk_left is None:
-                try:
-                    chunk_left = self._read_next_chunk_size()
-                    if chunk_left == 0:
-                        break
-                except ValueError:
-                    raise IncompleteRead(bytes(b[0:total_bytes]))
-
-            if len(mvb) < chunk_left:
-                n = self._safe_readinto(mvb)
-                self.chunk_left = chunk_left - n
-                return total_bytes + n
-            elif len(mvb) == chunk_left:
-                n = self._safe_readinto(mvb)
-                self._safe_read(2)  # toss the CRLF at the end of the chunk
-                self.chunk_left = None
-                return total_bytes + n
-            else:
+        try:
+            while True:
+                chunk_left = self._get_chunk_left()
+                if chunk_left is None:
+                    return total_bytes
+
+                if len(mvb) <= chunk_left:
+                    n = self._safe_readinto(mvb)
+                    self.chunk_left = chunk_left - n
+                    return total_bytes + n
+
                 temp_mvb = mvb[0:chunk_left]
                 n = self._safe_readinto(temp_mvb)
                 mvb = mvb[n:]
                 total_bytes += n
-
-            # we read the whole chunk, get another
-            self._safe_read(2)      # toss the CRLF at the end of the chunk
-            chunk_left = None
-
-        self._read_and_discard_trailer()
-
-        # we read everything; close the "file"
-        self._close_conn()
-
-        return total_bytes
+                self.chunk_left = 0
+        except IncompleteRead:
+            raise IncompleteRead(bytes(b[0:total_bytes]))
+
+    def _read1_chunked(self, n):
+        # _get_chunk_left() may read more than once, but only to satisfy
+        # the chunked protocol.
+        chunk_left = self._get_chunk_left()
+        if chunk_left is None or n == 0:
+            return b''
+        if not (0 <= n <= chunk_left):
+            n = chunk_left # if n is negative or larger than chunk_left
+        read = self.fp.read1(n)
+        self.chunk_left -= len(read)
+        if not read:
+            raise IncompleteRead(b"")
+        return read
+
+    def _peek_chunked(self, n):
+        try:
+            chunk_left = self._get_chunk_left()
+        except IncompleteRead:
+            return b'' # peek doesn't worry about protocol
+        if chunk_left is None:
+            return b'' # eof
+        # peek is allowed to return more than requested.  Just request the
+        # entire chunk, and truncate what we get.
+        return self.fp.peek(chunk_left)[:chunk_left]
 
     def _safe_read(self, amt):
-        """Read the number of bytes requested, compensating for partial reads.
-
-        Normally, we have a blocking socket, but a read() can be interrupted
-        by a signal (resulting in a partial read).
-
-        Note that we cannot distinguish between EOF and an interrupt when zero
-        bytes have been read. IncompleteRead() will be raised in this
-        situation.
+        """Read the number of bytes requested.
 
         This function should be used when <amt> bytes "should" be present for
         reading. If the bytes are truly not available (due to EOF), then the
         IncompleteRead exception can be used to detect the problem.
         """
-        s = []
-        while amt > 0:
-            chunk = self.fp.read(min(amt, MAXAMOUNT))
-            if not chunk:
-                raise IncompleteRead(b''.join(s), amt)
-            s.append(chunk)
-            amt -= len(chunk)
-        return b"".join(s)
+        # The buffered file retries partial reads itself, and reading all
+        # at once allocates the result only once.
+        data = self.fp.read(amt)
+        if len(data) < amt:
+            raise IncompleteRead(data, amt - len(data))
+        return data
 
     def _safe_readinto(self, b):
         """Same as _safe_read, but for reading into a buffer."""
-        total_bytes = 0
-        mvb = memoryview(b)
-        while total_bytes < len(b):
-            if MAXAMOUNT < len(mvb):
-                temp_mvb = mvb[0:MAXAMOUNT]
-                n = self.fp.readinto(temp_mvb)
-            else:
-                n = self.fp.readinto(mvb)
-            if not n:
-                raise IncompleteRead(bytes(mvb[0:total_bytes]), len(b))
-            mvb = mvb[n:]
-            total_bytes += n
-        return total_bytes
+        amt = len(b)
+        n = self.fp.readinto(b)
+        if n < amt:
+            raise IncompleteRead(bytes(b[:n]), amt - n)
+        return n
 
     def fileno(self):
         return self.fp.fileno()
@@ -717,6 +815,25 @@ class HTTPResponse(io.RawIOBase):
     def getcode(self):
         return self.status
 
+class _PipelinedSocket:
+    # Stands for the socket of a connection which pipelines requests.
+    # Its responses must all read from the same buffered file, which may
+    # already hold the beginning of the next response: this one is never
+    # closed by the responses.
+
+    def __init__(self, fp):
+        self._fp = fp
+
+    def makefile(self, mode):
+        return self
+
+    def close(self):
+        pass
+
+    def __getattr__(self, name):
+        return getattr(self._fp, name)
+
+
 class HTTPConnection:
 
     _http_vsn = 11
@@ -744,6 +861,12 @@ class HTTPConnection:
         self.__response = None
         self.__state = _CS_IDLE
         self._method = None
+        # Methods of the pipelined requests whose response was not read
+        self.__pipelined = collections.deque()
+        # Buffered file shared by the responses once requests were
+        # pipelined, and the data to send while pipeline() buffers it.
+        self._reader = None
+        self._send_buffer = None
         self._tunnel_host = None
         self._tunnel_port = None
         self._tunnel_headers = {}
@@ -823,12 +946,17 @@ class HTTPConnection:
 
     def close(self):
         """Close the connection to the HTTP server."""
+        if self._reader:
+            self._reader.close()
+            self._reader = None
         if self.sock:
             self.sock.close()   # close it manually... there may be other refs
             self.sock = None
         if self.__response:
             self.__response.close()
             self.__response = None
+        self.__pipelined.clear()
+        self._send_buffer = None
         self.__state = _CS_IDLE
 
     def send(self, data):
@@ -845,28 +973,16 @@ class HTTPConnection:
 
         if self.debuglevel > 0:
             print("send:", repr(data))
-        blocksize = 8192
+        if self._send_buffer is not None:
+            # pipeline() sends the requests together.
+            if isinstance(data, bytes) and len(data) < self.mss:
+                self._send_buffer.append(data)
+                return
+            if self._send_buffer:
+                self.sock.sendall(b"".join(self._send_buffer))
+                del self._send_buffer[:]
         if hasattr(data, "read") :
-            if self.debuglevel > 0:
-                print("sendIng a read()able")
-            encode = False
-            try:
-                mode = data.mode
-            except AttributeError:
-                # io.BytesIO and other file-like objects don't have a `mode`
-                # attribute.
-                pass
-            else:
-                if "b" not in mode:
-                    encode = True
-                    if self.debuglevel > 0:
-                        print("encoding file using iso-8859-1")
-            while 1:
-                datablock = data.read(blocksize)
-                if not datablock:
-                    break
-                if encode:
-                    datablock = datablock.encode("iso-8859-1")
+            for datablock in self._read_readable(data):
                 self.sock.sendall(datablock)
             return
         try:
@@ -879,6 +995,59 @@ class HTTPConnection:
                 raise TypeError("data should be a bytes-like object "
                                 "or an iterable, got %r" % type(data))
 
+    def _read_readable(self, readable):
+        """Generate the blocks of bytes read from a file-like object."""
+        blocksize = 8192
+        if self.debuglevel > 0:
+            print("sendIng a read()able")
+        encode = False
+        try:
+            mode = readable.mode
+        except AttributeError:
+            # io.BytesIO and other file-like objects don't have a `mode`
+            # attribute.
+            pass
+        else:
+            if "b" not in mode:
+                encode = True
+                if self.debuglevel > 0:
+                    print("encoding file using iso-8859-1")
+        while 1:
+            datablock = readable.read(blocksize)
+            if not datablock:
+                break
+            if encode:
+                datablock = datablock.encode("iso-8859-1")
+            yield datablock
+
+    def _send_chunked(self, message_body):
+        """Send message_body with the chunked transfer coding.
+
+        message_body may be a bytes-like object, a file-like object or an
+        iterable of bytes-like objects.
+        """
+        if hasattr(message_body, "read"):
+            chunks = self._read_readable(message_body)
+        elif isinstance(message_body, str):
+            chunks = (message_body,)
+        else:
+            try:
+                memoryview(message_body)
+            except TypeError:
+                chunks = message_body
+            else:
+                chunks = (message_body,)
+        for chunk in chunks:
+            if isinstance(chunk, str):
+                chunk = chunk.encode("iso-8859-1")
+            size = memoryview(chunk).nbytes
+            if not size:
+                # An empty chunk would end the body.
+                continue
+            self.send(b"".join([("%X\r\n" % size).encode("ascii"),
+                                chunk, b"\r\n"]))
+        self.send(b"0\r\n\r\n")
+
     def _output(self, s):
         """Add a line of output to the current request buffer.
 
@@ -886,11 +1055,13 @@ class HTTPConnection:
         """
         self._buffer.append(s)
 
-    def _send_output(self, message_body=None):
+    def _send_output(self, message_body=None, encode_chunked=False):
         """Send the currently buffered request and clear the buffer.
 
         Appends an extra \\r\\n to the buffer.
         A message_body may be specified, to be appended to the request.
+        If encode_chunked is true, it is sent with the chunked transfer
+        coding.
         """
         self._buffer.extend((b"", b""))
         msg = b"\r\n".join(self._buffer)
@@ -901,11 +1072,14 @@ class HTTPConnection:
         # there is no performance gain if the message is larger
         # than MSS (and there is a memory penalty for the message
         # copy).
-        if isinstance(message_body, bytes) and len(message_body) < self.mss:
+        if (not encode_chunked and isinstance(message_body, bytes) and
+            len(message_body) < self.mss):
             msg += message_body
             message_body = None
         self.send(msg)
-        if message_body is not None:
+        if message_body is not None and encode_chunked:
+            self._send_chunked(message_body)
+        elif message_body is not None:
             # message_body was not a string (i.e. it is a file), and
             # we must run the risk of Nagle.
             self.send(message_body)
@@ -1046,27 +1220,83 @@ class HTTPConnection:
         header = header + b': ' + value
         self._output(header)
 
-    def endheaders(self, message_body=None):
+    def endheaders(self, message_body=None, *, encode_chunked=False):
         """Indicate that the last header line has been sent to the server.
 
         This method sends the request to the server.  The optional message_body
         argument can be used to pass a message body associated with the
         request.  The message body will be sent in the same packet as the
         message headers if it is a string, otherwise it is sent as a separate
-        packet.
+        packet.  If encode_chunked is true, the message body is sent with
+        the chunked transfer coding: a 'Transfer-Encoding: chunked' header
+        must have been sent.
         """
         if self.__state == _CS_REQ_STARTED:
             self.__state = _CS_REQ_SENT
         else:
             raise CannotSendHeader()
-        self._send_output(message_body)
+        self._send_output(message_body, encode_chunked)
+
+    def request(self, method, url, body=None, headers={}, *,
+                encode_chunked=False):
+        """Send a complete request to the server.
+
+        If no Content-Length or Transfer-Encoding header is given and the
+        length of the body cannot be determined, e.g. because it is an
+        iterable, the body is sent with the chunked transfer coding.  If
+        a Transfer-Encoding header is given, encode_chunked tells whether
+        the body must be chunk-encoded by request() rather than being
+        already encoded.
+        """
+        self._send_request(method, url, body, headers, encode_chunked)
 
-    def request(self, method, url, body=None, headers={}):
-        """Send a complete request to the server."""
-        self._send_request(method, url, body, headers)
+    def pipeline(self, requests):
+        """Send several requests before reading any of their responses.
+
+        requests is an iterable of tuples of arguments for request(), e.g.
+        ('GET', '/index.html').  The requests are sent together, then
+        getresponse() must be called once for each of them, in order, and
+        each response must be read before the next one is requested.
+
+        Only idempotent requests should be pipelined: if a response
+        closes the connection, the server did not process the following
+        requests, getresponse() raises ResponseNotReady for them and they
+        have to be sent again.  Return the number of requests sent.
+        """
+        if self.__response and self.__response.isclosed():
+            self.__response = None
+        if self.__state != _CS_IDLE or self.__response:
+            raise CannotSendRequest(self.__state)
+        if self.sock is None:
+            if self.auto_open:
+                self.connect()
+            else:
+                raise NotConnected()
+        if self._reader is None:
+            self._reader = self.sock.makefile("rb")
+
+        methods = []
+        self._send_buffer = []
+        try:
+            for args in requests:
+                self.request(*args)
+                methods.append(self._method)
+                self.__state = _CS_IDLE
+            data = b"".join(self._send_buffer)
+            self._send_buffer = None
+            if data:
+                self.send(data)
+        except:
+            self.close()
+            raise
+        if methods:
+            self.__pipelined.extend(methods)
+            self.__state = _CS_REQ_SENT
+        return len(methods)
 
     def _set_content_length(self, body):
-        # Set the content-length based on the body.
+        # Set the content-length based on the body.  Return whether it
+        # could be determined.
         thelen = None
         try:
             thelen = str(len(body))
@@ -1081,8 +1311,10 @@ class HTTPConnection:
 
         if thelen is not None:
             self.putheader('Content-Length', thelen)
+            return True
+        return False
 
-    def _send_request(self, method, url, body, headers):
+    def _send_request(self, method, url, body, headers, encode_chunked=False):
         # Honor explicitly requested Host: and Accept-Encoding: headers.
         header_names = dict.fromkeys([k.lower() for k in headers])
         skips = {}
@@ -1093,15 +1325,22 @@ class HTTPConnection:
 
         self.putrequest(method, url, **skips)
 
-        if body is not None and ('content-length' not in header_names):
-            self._set_content_length(body)
+        if 'content-length' in header_names:
+            encode_chunked = False
+        elif 'transfer-encoding' not in header_names:
+            encode_chunked = False
+            if body is not None and not self._set_content_length(body):
+                # Stream a body of unknown length, e.g. a generator.
+                if self._http_vsn == 11:
+                    encode_chunked = True
+                    self.putheader('Transfer-Encoding', 'chunked')
         for hdr, value in headers.items():
             self.putheader(hdr, value)
         if isinstance(body, str):
             # RFC 2616 Section 3.7.1 says that text default has a
             # default charset of iso-8859-1.
             body = body.encode('iso-8859-1')
-        self.endheaders(body)
+        self.endheaders(body, encode_chunked=encode_chunked)
 
     def getresponse(self):
         """Get the response from the server.
@@ -1139,17 +1378,28 @@ class HTTPConnection:
         if self.__state != _CS_REQ_SENT or self.__response:
             raise ResponseNotReady(self.__state)
 
+        method = self._method
+        sock = self.sock
+        if self.__pipelined:
+            method = self.__pipelined.popleft()
+        if self._reader is not None:
+            sock = _PipelinedSocket(self._reader)
         if self.debuglevel > 0:
-            response = self.response_class(self.sock, self.debuglevel,
-                                           method=self._method)
+            response = self.response_class(sock, self.debuglevel,
+                                           method=method)
         else:
-            response = self.response_class(self.sock, method=self._method)
+            response = self.response_class(sock, method=method)
 
         response.begin()
         assert response.will_close != _UNKNOWN
-        self.__state = _CS_IDLE
+        if not self.__pipelined:
+            self.__state = _CS_IDLE
 
         if response.will_close:
+            if self._reader is not None:
+                # the response reads the rest of the shared file alone
+                response.fp = self._reader
+                self._reader = None
             # this effectively passes the connection to the response
             self.close()
         else:
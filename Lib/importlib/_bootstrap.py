@@ -37,6 +37,16 @@ def _make_relax_case():
     return _relax_case
 
 
+def _use_dir_index():
+    """True if FileFinder should persist directory listings."""
+    if 'dirindex' in sys._xoptions:
+        return True
+    if sys.flags.ignore_environment:
+        return False
+    key = 'PYTHONDIRINDEX' if _os.__name__ == 'nt' else b'PYTHONDIRINDEX'
+    return bool(_os.environ.get(key))
+
+
 def _w_long(x):
     """Convert a 32-bit integer to little-endian."""
     return (int(x) & 0xFFFFFFFF).to_bytes(4, 'little')
@@ -428,6 +438,12 @@ _RAW_MAGIC_NUMBER = int.from_bytes(MAGIC_NUMBER, 'little')  # For import.c
 
 _PYCACHE = '__pycache__'
 
+# Directory listings persisted by FileFinder are stored in __pycache__ as
+# '<cache tag>.dirindex' files.  The first line is the magic followed by the
+# directory mtime, the rest the NUL-separated listing.
+_DIR_INDEX_SUFFIX = '.dirindex'
+_DIR_INDEX_MAGIC = b'dirindex1 '
+
 SOURCE_SUFFIXES = ['.py']  # _setup() adds .pyw as needed.
 
 DEBUG_BYTECODE_SUFFIXES = ['.pyc']
@@ -1920,6 +1936,10 @@ class FileFinder:
         self._path_cache = set()
         self._relaxed_path_cache = set()
 
+    # Whether the directory listing is persisted in __pycache__ across
+    # processes; set by _setup() from -X dirindex or PYTHONDIRINDEX.
+    _use_index = False
+
     def invalidate_caches(self):
         """Invalidate the directory mtime."""
         self._path_mtime = -1
@@ -1954,7 +1974,7 @@ class FileFinder:
         except OSError:
             mtime = -1
         if mtime != self._path_mtime:
-            self._fill_cache()
+            self._fill_cache(mtime)
             self._path_mtime = mtime
         # tail_module keeps the original casing, for __file__ and friends
         if _relax_case():
@@ -1989,15 +2009,21 @@ class FileFinder:
             return spec
         return None
 
-    def _fill_cache(self):
-        """Fill the cache of potential modules and packages for this directory."""
-        path = self.path
-        try:
-            contents = _os.listdir(path or _os.getcwd())
-        except (FileNotFoundError, PermissionError, NotADirectoryError):
-            # Directory has either been removed, turned into a file, or made
-            # unreadable.
-            contents = []
+    def _fill_cache(self, mtime=-1):
+        """Fill the cache of potential modules and packages for this directory.
+
+        If the persistent directory index is enabled and the directory
+        mtime is given, the listing comes from the index when it was taken
+        at that mtime; otherwise the directory is listed and the index
+        refreshed.
+
+        """
+        if self._use_index and mtime != -1:
+            contents = self._read_index(mtime)
+            if contents is None:
+                contents = self._listdir_and_index(mtime)
+        else:
+            contents = self._listdir()
         # We store two cached versions, to handle runtime changes of the
         # PYTHONCASEOK environment variable.
         if not sys.platform.startswith('win'):
@@ -2020,6 +2046,98 @@ class FileFinder:
         if sys.platform.startswith(_CASE_INSENSITIVE_PLATFORMS):
             self._relaxed_path_cache = {fn.lower() for fn in contents}
 
+    def _listdir(self):
+        """List the directory, treating an unusable one as empty."""
+        try:
+            return _os.listdir(self.path or _os.getcwd())
+        except (FileNotFoundError, PermissionError, NotADirectoryError):
+            # Directory has either been removed, turned into a file, or made
+            # unreadable.
+            return []
+
+    def _index_path(self):
+        """Return the path to the directory index, or None."""
+        tag = sys.implementation.cache_tag
+        if tag is None:
+            return None
+        filename = '{}{}'.format(tag, _DIR_INDEX_SUFFIX)
+        return _path_join(self.path, _PYCACHE, filename)
+
+    def _read_index(self, mtime):
+        """Return the listing stored in the directory index.
+
+        None is returned if there is no index or if it was not taken at the
+        given directory mtime.
+
+        """
+        index_path = self._index_path()
+        if index_path is None:
+            return None
+        try:
+            with _io.FileIO(index_path, 'r') as file:
+                data = file.read()
+        except OSError:
+            return None
+        header, sep, body = data.partition(b'\n')
+        if not sep or header != _DIR_INDEX_MAGIC + repr(mtime).encode():
+            return None
+        _verbose_message('{} matches {}', index_path, self.path,
+                         verbosity=2)
+        if not body:
+            return []
+        return body.decode('utf-8', 'surrogatepass').split('\0')
+
+    def _listdir_and_index(self, mtime):
+        """List the directory and store the listing in the directory index.
+
+        Filesystem timestamps are coarse, so a change made to the directory
+        in the same tick as its listing would not show in its mtime.  The
+        index is therefore only written if the directory was last modified
+        before the creation of the temporary index file, which is done
+        before listing.
+
+        """
+        index_path = self._index_path()
+        if index_path is None or sys.dont_write_bytecode:
+            return self._listdir()
+        path_tmp = '{}.{}'.format(index_path, id(self))
+        try:
+            fd = _os.open(path_tmp,
+                          _os.O_EXCL | _os.O_CREAT | _os.O_WRONLY, 0o666)
+        except FileNotFoundError:
+            # Creating __pycache__ changes the mtime of the directory, so
+            # the index will only be written the next time.
+            try:
+                _os.mkdir(_path_split(index_path)[0])
+            except OSError:
+                pass
+            return self._listdir()
+        except OSError:
+            return self._listdir()
+        contents = None
+        try:
+            with _io.FileIO(fd, 'wb') as file:
+                if mtime < _os.fstat(fd).st_mtime:
+                    contents = self._listdir()
+                    body = '\0'.join(contents).encode('utf-8',
+                                                      'surrogatepass')
+                    file.write(_DIR_INDEX_MAGIC + repr(mtime).encode() +
+                               b'\n' + body)
+            if contents is None:
+                _os.unlink(path_tmp)
+            else:
+                _os.replace(path_tmp, index_path)
+                _verbose_message('wrote {!r}', index_path, verbosity=2)
+        except OSError:
+            try:
+                _os.unlink(path_tmp)
+            except OSError:
+                pass
+        if contents is None:
+            # The directory was not listed, or listing it failed.
+            return self._listdir()
+        return contents
+
     @classmethod
     def path_hook(cls, *loader_details):
         """A class method which returns a closure to use on sys.path_hook
@@ -2365,6 +2483,7 @@ def _setup(sys_module, _imp_module):
 
     # Constants
     setattr(self_module, '_relax_case', _make_relax_case())
+    FileFinder._use_index = _use_dir_index()
     EXTENSION_SUFFIXES.extend(_imp.extension_suffixes())
     if builtin_os == 'nt':
         SOURCE_SUFFIXES.append('.pyw')
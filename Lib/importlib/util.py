@@ -1,5 +1,6 @@
 """Utility code for constructing importers, etc."""
 
+from . import abc
 from ._bootstrap import MAGIC_NUMBER
 from ._bootstrap import cache_from_source
 from ._bootstrap import decode_source
@@ -11,8 +12,14 @@ from ._bootstrap import _resolve_name
 from contextlib import contextmanager
 import functools
 import sys
+import types
 import warnings
 
+try:
+    import _thread
+except ImportError:
+    import _dummy_thread as _thread
+
 
 def resolve_name(name, package):
     """Resolve a relative module name to an absolute one."""
@@ -118,3 +125,177 @@ def module_for_loader(fxn):
             return fxn(self, module, *args, **kwargs)
 
     return module_for_loader_wrapper
+
+
+class _Module(types.ModuleType):
+
+    """A subclass of the module type to allow __class__ manipulation."""
+
+
+class _LazyModule(types.ModuleType):
+
+    """A subclass of the module type which triggers loading upon attribute access."""
+
+    def __getattribute__(self, attr):
+        """Trigger the load of the module and return the attribute."""
+        __spec__ = object.__getattribute__(self, '__spec__')
+        # The import system looks up __spec__ whenever an import statement
+        # finds the module in sys.modules; that must not trigger the load.
+        if attr == '__spec__':
+            return __spec__
+        loader_state = __spec__.loader_state
+        with loader_state['lock']:
+            # Only the first thread to get the lock triggers the load and
+            # resets the module's class.  The others simply getattr() below.
+            if object.__getattribute__(self, '__class__') is _LazyModule:
+                # The module's own code may reach it through getattr() while
+                # it is being executed.
+                if loader_state['is_loading']:
+                    return object.__getattribute__(self, attr)
+                loader_state['is_loading'] = True
+                __dict__ = object.__getattribute__(self, '__dict__')
+                # All module metadata must be garnered from __spec__ in order
+                # to avoid using mutated values.
+                # Get the original name to make sure no object substitution
+                # occurred in sys.modules.
+                original_name = __spec__.name
+                # Figure out exactly what attributes were mutated between the
+                # creation of the module and now.
+                attrs_then = loader_state['__dict__']
+                attrs_updated = {}
+                for key, value in __dict__.items():
+                    # Code that set the attribute may have kept a reference to
+                    # the assigned object, making identity more important than
+                    # equality.
+                    if key not in attrs_then or value is not attrs_then[key]:
+                        attrs_updated[key] = value
+                try:
+                    __spec__.loader.exec_module(self)
+                    # If exec_module() was used directly there is no
+                    # guarantee the module object was put into sys.modules.
+                    if original_name in sys.modules:
+                        if self is not sys.modules[original_name]:
+                            msg = ('module object for {!r} substituted in '
+                                   'sys.modules during a lazy load')
+                            raise ValueError(msg.format(original_name))
+                    # Update after loading since that's what would happen in
+                    # an eager loading situation.
+                    __dict__.update(attrs_updated)
+                    # Stop triggering this method.
+                    self.__class__ = _Module
+                finally:
+                    # If the load failed, the module stays lazy and the next
+                    # attribute access raises again instead of exposing a
+                    # partially executed module.
+                    loader_state['is_loading'] = False
+        return getattr(self, attr)
+
+    def __delattr__(self, attr):
+        """Trigger the load and then perform the deletion."""
+        # To trigger the load and raise an exception if the attribute
+        # doesn't exist.
+        self.__getattribute__(attr)
+        delattr(self, attr)
+
+
+class LazyLoader(abc.Loader):
+
+    """A loader that creates a module which defers loading until attribute access."""
+
+    @staticmethod
+    def __check_eager_loader(loader):
+        if not hasattr(loader, 'exec_module'):
+            raise TypeError('loader must define exec_module()')
+        elif hasattr(loader.__class__, 'create_module'):
+            if abc.Loader.create_module != loader.__class__.create_module:
+                # Only care if create_module() is overridden in a subclass of
+                # importlib.abc.Loader.
+                raise TypeError('loader cannot define create_module()')
+
+    @classmethod
+    def factory(cls, loader):
+        """Construct a callable which returns the eager loader made lazy."""
+        cls.__check_eager_loader(loader)
+        return lambda *args, **kwargs: cls(loader(*args, **kwargs))
+
+    def __init__(self, loader):
+        self.__check_eager_loader(loader)
+        self.loader = loader
+
+    def create_module(self, spec):
+        """Create a module which can have its __class__ manipulated."""
+        return _Module(spec.name)
+
+    def exec_module(self, module):
+        """Make the module load lazily."""
+        module.__spec__.loader = self.loader
+        module.__loader__ = self.loader
+        # Don't need to worry about deep-copying as trying to set an attribute
+        # on an object would have triggered the load,
+        # e.g. ``module.__spec__.loader = None`` would trigger a load from
+        # trying to access module.__spec__.
+        loader_state = {}
+        loader_state['__dict__'] = module.__dict__.copy()
+        loader_state['lock'] = _thread.RLock()
+        loader_state['is_loading'] = False
+        module.__spec__.loader_state = loader_state
+        module.__class__ = _LazyModule
+
+
+class _LazyFinder:
+
+    """Meta path finder making the loaders of selected modules lazy.
+
+    The spec is found by the finders which follow on sys.meta_path.  Modules
+    whose loader cannot be made lazy are loaded as usual.
+
+    """
+
+    def __init__(self, names):
+        self.names = frozenset(names)
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Find the spec for fullname and wrap its loader in LazyLoader."""
+        if fullname not in self.names:
+            return None
+        for finder in sys.meta_path:
+            if isinstance(finder, _LazyFinder):
+                continue
+            try:
+                find_spec = finder.find_spec
+            except AttributeError:
+                try:
+                    find_module = finder.find_module
+                except AttributeError:
+                    continue
+                loader = find_module(fullname, path)
+                if loader is None:
+                    continue
+                spec = spec_from_loader(fullname, loader)
+            else:
+                spec = find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        try:
+            spec.loader = LazyLoader(spec.loader)
+        except TypeError:
+            pass
+        return spec
+
+    def __repr__(self):
+        return '{}({!r})'.format(self.__class__.__name__, sorted(self.names))
+
+
+def install_lazy_finder(names):
+    """Make the modules named in names load lazily when imported.
+
+    A finder is inserted at the front of sys.meta_path and returned; remove it
+    from sys.meta_path to restore eager imports.  Modules already in
+    sys.modules are not affected.
+
+    """
+    finder = _LazyFinder(names)
+    sys.meta_path.insert(0, finder)
+    return finder
@@ -97,13 +97,13 @@ Using json.tool from the shell to validate and pretty-print::
 """
 __version__ = '2.0.9'
 __all__ = [
-    'dump', 'dumps', 'load', 'loads',
-    'JSONDecoder', 'JSONEncoder',
+    'dump', 'dumps', 'load', 'loads', 'iterload',
+    'JSONDecoder', 'JSONEncoder', 'JSONStreamDecoder',
 ]
 
 __author__ = 'Bob Ippolito <bob@redivi.com>'
 
-from .decoder import JSONDecoder
+from .decoder import JSONDecoder, JSONStreamDecoder
 from .encoder import JSONEncoder
 
 _default_encoder = JSONEncoder(
@@ -329,3 +329,44 @@ def loads(s, encoding=None, cls=None, object_hook=None, parse_float=None,
     if parse_constant is not None:
         kw['parse_constant'] = parse_constant
     return cls(**kw).decode(s)
+
+
+def iterload(fp, cls=None, object_hook=None, parse_float=None,
+        parse_int=None, parse_constant=None, object_pairs_hook=None,
+        items=False, chunk_size=65536, **kw):
+    """Deserialize the JSON documents of ``fp`` (a ``.read()``-supporting
+    text or binary file-like object containing any number of JSON
+    documents, optionally separated by whitespace, such as newline-delimited
+    JSON) and iterate over the resulting Python objects.
+
+    ``fp`` is read in chunks of ``chunk_size`` characters or bytes, bytes
+    being decoded as UTF-8, so that only the document being decoded is held
+    in memory.  If ``items`` is true, the elements of a top-level array are
+    produced one by one instead of the array itself.
+
+    The other arguments have the same meaning as in ``load()``.
+
+    """
+    if cls is None:
+        cls = JSONDecoder
+    if object_hook is not None:
+        kw['object_hook'] = object_hook
+    if object_pairs_hook is not None:
+        kw['object_pairs_hook'] = object_pairs_hook
+    if parse_float is not None:
+        kw['parse_float'] = parse_float
+    if parse_int is not None:
+        kw['parse_int'] = parse_int
+    if parse_constant is not None:
+        kw['parse_constant'] = parse_constant
+    if cls is JSONDecoder and not kw:
+        decoder = _default_decoder
+    else:
+        decoder = cls(**kw)
+    stream = JSONStreamDecoder(decoder, items=items)
+    while True:
+        chunk = fp.read(chunk_size)
+        if not chunk:
+            break
+        yield from stream.feed(chunk)
+    yield from stream.close()
@@ -1,5 +1,6 @@
 """Implementation of JSONDecoder
 """
+import codecs
 import re
 
 from json import scanner
@@ -8,7 +9,7 @@ try:
 except ImportError:
     c_scanstring = None
 
-__all__ = ['JSONDecoder']
+__all__ = ['JSONDecoder', 'JSONStreamDecoder']
 
 FLAGS = re.VERBOSE | re.MULTILINE | re.DOTALL
 
@@ -360,3 +361,198 @@ class JSONDecoder(object):
         except StopIteration as err:
             raise ValueError(errmsg("Expecting value", s, err.value)) from None
         return obj, end
+
+
+STRUCTURE = re.compile(r'["\[\]{}]')
+STRING_STOP = re.compile(r'["\\]')
+SCALAR_END = re.compile(r'[ \t\n\r,:\[\]{}"]')
+
+
+class JSONStreamDecoder(object):
+    """Incremental decoder for a stream of JSON documents
+
+    The stream is fed in chunks of ``str`` or ``bytes`` with ``feed()``,
+    which returns the list of the values completed by each chunk; the end
+    of the stream is signalled with ``close()``.  The stream can hold any
+    number of JSON documents, optionally separated by whitespace, such as
+    newline-delimited JSON.
+
+    Each value is decoded with the ``raw_decode()`` method of a
+    ``JSONDecoder``.  A value which is not complete at the end of a chunk
+    is decoded again once more data is fed; a value spanning several
+    chunks is tracked by matching its brackets and quotes, so that it is
+    only decoded once it is complete.
+
+    """
+
+    def __init__(self, decoder=None, items=False, encoding='utf-8'):
+        """``decoder`` is the ``JSONDecoder`` used to decode each value;
+        a default ``JSONDecoder`` is used if it is not specified.
+
+        If ``items`` is true, the elements of a top-level array are
+        returned one by one instead of the array itself, so that a large
+        array is never held in memory at once.
+
+        ``encoding`` is used to decode the chunks fed as ``bytes``.
+
+        """
+        self.decoder = decoder or JSONDecoder()
+        self.items = items
+        self._codec = codecs.getincrementaldecoder(encoding)()
+        self._buffer = ''
+        # State of a top-level array whose elements are returned: None
+        # outside of such an array, then 'first' after the opening bracket,
+        # 'sep' after an element and 'value' after a comma.
+        self._array = None
+        # Chunks of a value spanning several chunks, and the state of the
+        # search for its end.
+        self._parts = None
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, data):
+        """Feed a chunk of the stream and return the list of the values
+        it completes.
+
+        """
+        if not isinstance(data, str):
+            data = self._codec.decode(data)
+        return self._decode(data, False)
+
+    def close(self):
+        """Signal the end of the stream and return the list of the values
+        it completes.
+
+        Raise ``ValueError`` if the stream ends inside a value.
+
+        """
+        return self._decode(self._codec.decode(b'', True), True)
+
+    def _find_end(self, s):
+        # Return the index following the end of the value whose first
+        # characters were passed to previous calls, or None if the value
+        # does not end in s.
+        pos = 0
+        n = len(s)
+        if self._escape:
+            if not n:
+                return None
+            pos = 1
+            self._escape = False
+        depth = self._depth
+        in_string = self._in_string
+        while True:
+            if in_string:
+                m = STRING_STOP.search(s, pos)
+                if m is None:
+                    break
+                pos = m.end()
+                if m.group() == '\\':
+                    if pos == n:
+                        self._escape = True
+                        break
+                    pos += 1
+                    continue
+                in_string = False
+                if not depth:
+                    return pos
+            else:
+                m = STRUCTURE.search(s, pos)
+                if m is None:
+                    break
+                pos = m.end()
+                c = m.group()
+                if c == '"':
+                    in_string = True
+                elif c in '[{':
+                    depth += 1
+                else:
+                    depth -= 1
+                    if not depth:
+                        return pos
+        self._depth = depth
+        self._in_string = in_string
+        return None
+
+    def _end_value(self):
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        if self._array is not None:
+            self._array = 'sep'
+
+    def _decode(self, text, final, _w=WHITESPACE.match):
+        values = []
+        if self._parts is not None:
+            end = self._find_end(text)
+            if end is None:
+                self._parts.append(text)
+                if final:
+                    self._unterminated(''.join(self._parts), 0)
+                return values
+            self._parts.append(text[:end])
+            doc = ''.join(self._parts)
+            self._parts = None
+            self._end_value()
+            values.append(self.decoder.raw_decode(doc)[0])
+            text = text[end:]
+        s = self._buffer + text
+        pos = 0
+        n = len(s)
+        while True:
+            pos = _w(s, pos).end()
+            if pos == n:
+                break
+            c = s[pos]
+            state = self._array
+            if state == 'sep':
+                if c == ',':
+                    self._array = 'value'
+                elif c == ']':
+                    self._array = None
+                else:
+                    raise ValueError(errmsg("Expecting ',' delimiter", s, pos))
+                pos += 1
+                continue
+            if c == ']' and state == 'first':
+                self._array = None
+                pos += 1
+                continue
+            if c == '[' and state is None and self.items:
+                self._array = 'first'
+                pos += 1
+                continue
+            if c in '[{"':
+                try:
+                    obj, end = self.decoder.raw_decode(s, pos)
+                except ValueError:
+                    # Either the value is incomplete or it is invalid, which
+                    # is only known once its end is found.
+                    if self._find_end(s[pos:]) is not None:
+                        raise
+                    self._parts = [s[pos:]]
+                    if final:
+                        self._unterminated(s, pos)
+                    pos = n
+                    break
+            elif final or SCALAR_END.search(s, pos) is not None:
+                obj, end = self.decoder.raw_decode(s, pos)
+            else:
+                # A number or a constant may go on in the next chunk.
+                break
+            values.append(obj)
+            self._end_value()
+            pos = end
+        self._buffer = s[pos:]
+        if final:
+            if self._buffer:
+                self._unterminated(s, pos)
+            if self._array is not None:
+                raise ValueError(errmsg("Expecting ']'", s, n))
+        return values
+
+    def _unterminated(self, s, pos):
+        # Let the decoder describe the error, the value being incomplete.
+        self.decoder.raw_decode(s, pos)
+        raise ValueError(errmsg("Unterminated value", s, pos))
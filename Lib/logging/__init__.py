@@ -33,7 +33,8 @@ __all__ = ['BASIC_FORMAT', 'BufferingFormatter', 'CRITICAL', 'DEBUG', 'ERROR',
            'captureWarnings', 'critical', 'debug', 'disable', 'error',
            'exception', 'fatal', 'getLevelName', 'getLogger', 'getLoggerClass',
            'info', 'log', 'makeLogRecord', 'setLoggerClass', 'warn', 'warning',
-           'getLogRecordFactory', 'setLogRecordFactory', 'lastResort']
+           'getLogRecordFactory', 'setLogRecordFactory', 'lastResort',
+           'LazyLogRecord']
 
 try:
     import threading
@@ -313,6 +314,203 @@ class LogRecord(object):
             msg = msg % self.args
         return msg
 
+class _LazyAttribute(object):
+    """
+    An attribute of a LazyLogRecord which is computed on first access and
+    then kept in the slot whose name is the attribute's name prefixed by an
+    underscore.
+    """
+    def __init__(self, compute):
+        self.compute = compute
+        self.slot = None
+
+    def __get__(self, record, owner=None):
+        if record is None:
+            return self
+        try:
+            return self.slot.__get__(record, owner)
+        except AttributeError:
+            value = self.compute(record)
+            self.slot.__set__(record, value)
+            return value
+
+    def __set__(self, record, value):
+        self.slot.__set__(record, value)
+
+def _computeFilename(record):
+    try:
+        return os.path.basename(record.pathname)
+    except (TypeError, ValueError, AttributeError):
+        return record.pathname
+
+def _computeModule(record):
+    try:
+        return os.path.splitext(os.path.basename(record.pathname))[0]
+    except (TypeError, ValueError, AttributeError):
+        return "Unknown module"
+
+def _computeThreadName(record):
+    return record._currentThread.name
+
+def _computeProcessName(record):
+    try:
+        return record._currentProcess.name
+    except Exception: #pragma: no cover
+        return 'MainProcess'
+
+class LazyLogRecord(object):
+    """
+    A compact alternative to LogRecord, which can be installed with
+    setLogRecordFactory(LazyLogRecord).
+
+    The standard attributes are stored in slots, so that no dictionary is
+    allocated unless extra attributes are set on the record. The filename,
+    module, msecs and relativeCreated attributes are only computed when
+    they are first accessed, which formatters do for the fields their
+    format strings reference. The same goes for the threadName and
+    processName attributes: the current thread and process are recorded
+    when the record is created, their names are looked up on first access.
+
+    The record's __dict__ only holds its extra attributes; the handlers
+    and formatters of this package know to look up the standard attributes
+    as well.
+    """
+    __slots__ = ('name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+                 'exc_info', 'exc_text', 'stack_info', 'lineno', 'funcName',
+                 'created', 'thread', 'process',
+                 'message', 'asctime', '_filename', '_module', '_msecs',
+                 '_relativeCreated', '_threadName', '_processName',
+                 '_currentThread', '_currentProcess', '__dict__')
+
+    _attributes = ('name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+                   'filename', 'module', 'exc_info', 'exc_text', 'stack_info',
+                   'lineno', 'funcName', 'created', 'msecs', 'relativeCreated',
+                   'thread', 'threadName', 'processName', 'process',
+                   'message', 'asctime')
+
+    def __init__(self, name, level, pathname, lineno,
+                 msg, args, exc_info, func=None, sinfo=None, **kwargs):
+        """
+        Initialize a logging record with interesting information.
+        """
+        self.created = time.time()
+        self.name = name
+        self.msg = msg
+        # See LogRecord.__init__() for the handling of a sole dictionary.
+        if args and len(args) == 1 and isinstance(args[0], dict) and args[0]:
+            args = args[0]
+        self.args = args
+        self.levelname = getLevelName(level)
+        self.levelno = level
+        self.pathname = pathname
+        self.exc_info = exc_info
+        self.exc_text = None      # used to cache the traceback text
+        self.stack_info = sinfo
+        self.lineno = lineno
+        self.funcName = func
+        if logThreads and threading:
+            self.thread = threading.get_ident()
+            self._currentThread = threading.current_thread()
+        else: # pragma: no cover
+            self.thread = None
+            self.threadName = None
+        if not logMultiprocessing: # pragma: no cover
+            self.processName = None
+        else:
+            mp = sys.modules.get('multiprocessing')
+            if mp is None:
+                self.processName = 'MainProcess'
+            else:
+                try:
+                    self._currentProcess = mp.current_process()
+                except Exception: #pragma: no cover
+                    self.processName = 'MainProcess'
+        if logProcesses and hasattr(os, 'getpid'):
+            self.process = os.getpid()
+        else:
+            self.process = None
+
+    filename = _LazyAttribute(_computeFilename)
+    module = _LazyAttribute(_computeModule)
+    msecs = _LazyAttribute(
+        lambda record: (record.created - int(record.created)) * 1000)
+    relativeCreated = _LazyAttribute(
+        lambda record: (record.created - _startTime) * 1000)
+    threadName = _LazyAttribute(_computeThreadName)
+    processName = _LazyAttribute(_computeProcessName)
+
+    __str__ = LogRecord.__str__
+    getMessage = LogRecord.getMessage
+
+    def __getstate__(self):
+        return dict(_LazyRecordAttributes(self))
+
+    def __setstate__(self, state):
+        _LazyRecordAttributes(self).update(state)
+
+for _name in ('filename', 'module', 'msecs', 'relativeCreated', 'threadName',
+              'processName'):
+    LazyLogRecord.__dict__[_name].slot = LazyLogRecord.__dict__['_' + _name]
+del _name
+
+class _LazyRecordAttributes(object):
+    """
+    A mapping of all the attributes of a LazyLogRecord, the standard ones
+    which are set or can be computed, then the extra ones.
+    """
+    __slots__ = ('record',)
+
+    def __init__(self, record):
+        self.record = record
+
+    def __getitem__(self, key):
+        try:
+            return getattr(self.record, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        setattr(self.record, key, value)
+
+    def __delitem__(self, key):
+        try:
+            delattr(self.record, key)
+        except AttributeError:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        return hasattr(self.record, key)
+
+    def keys(self):
+        record = self.record
+        keys = [key for key in record._attributes if hasattr(record, key)]
+        keys.extend(record.__dict__)
+        return keys
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+    def get(self, key, default=None):
+        return getattr(self.record, key, default)
+
+    def update(self, other):
+        for key in other:
+            setattr(self.record, key, other[key])
+
+def _recordAttributes(record):
+    """
+    Return a mapping of the attributes of a record, as used to format it.
+    """
+    if isinstance(record, LazyLogRecord):
+        return _LazyRecordAttributes(record)
+    return record.__dict__
+
 #
 #   Determine which class to use when instantiating log records.
 #
@@ -327,6 +525,7 @@ def setLogRecordFactory(factory):
     """
     global _logRecordFactory
     _logRecordFactory = factory
+    Logger.manager._clear_cache()
 
 def getLogRecordFactory():
     """
@@ -343,18 +542,23 @@ def makeLogRecord(dict):
     instance.
     """
     rv = _logRecordFactory(None, None, "", 0, "", (), None, None)
-    rv.__dict__.update(dict)
+    _recordAttributes(rv).update(dict)
     return rv
 
 #---------------------------------------------------------------------------
 #   Formatter classes and functions
 #---------------------------------------------------------------------------
 
+# The attributes of a record which Logger.findCaller() provides.
+_CALLER_FIELDS = ('pathname', 'filename', 'module', 'lineno', 'funcName',
+                  'stack_info')
+
 class PercentStyle(object):
 
     default_format = '%(message)s'
     asctime_format = '%(asctime)s'
     asctime_search = '%(asctime)'
+    field_search = '%%(%s)'
 
     def __init__(self, fmt):
         self._fmt = fmt or self.default_format
@@ -362,16 +566,24 @@ class PercentStyle(object):
     def usesTime(self):
         return self._fmt.find(self.asctime_search) >= 0
 
+    def _usesCaller(self):
+        fmt = self._fmt
+        for name in _CALLER_FIELDS:
+            if fmt.find(self.field_search % name) >= 0:
+                return True
+        return False
+
     def format(self, record):
-        return self._fmt % record.__dict__
+        return self._fmt % _recordAttributes(record)
 
 class StrFormatStyle(PercentStyle):
     default_format = '{message}'
     asctime_format = '{asctime}'
     asctime_search = '{asctime'
+    field_search = '{%s'
 
     def format(self, record):
-        return self._fmt.format(**record.__dict__)
+        return self._fmt.format_map(_recordAttributes(record))
 
 
 class StringTemplateStyle(PercentStyle):
@@ -387,8 +599,15 @@ class StringTemplateStyle(PercentStyle):
         fmt = self._fmt
         return fmt.find('$asctime') >= 0 or fmt.find(self.asctime_format) >= 0
 
+    def _usesCaller(self):
+        fmt = self._fmt
+        for name in _CALLER_FIELDS:
+            if fmt.find('$' + name) >= 0 or fmt.find('${%s}' % name) >= 0:
+                return True
+        return False
+
     def format(self, record):
-        return self._tpl.substitute(**record.__dict__)
+        return self._tpl.substitute(_recordAttributes(record))
 
 _STYLES = {
     '%': PercentStyle,
@@ -665,6 +884,7 @@ class Filterer(object):
         """
         if not (filter in self.filters):
             self.filters.append(filter)
+            Logger.manager._clear_cache()
 
     def removeFilter(self, filter):
         """
@@ -672,6 +892,7 @@ class Filterer(object):
         """
         if filter in self.filters:
             self.filters.remove(filter)
+            Logger.manager._clear_cache()
 
     def filter(self, record):
         """
@@ -746,11 +967,29 @@ class Handler(Filterer):
         Filterer.__init__(self)
         self._name = None
         self.level = _checkLevel(level)
-        self.formatter = None
+        self._formatter = None
         # Add the handler to the global _handlerList (for cleanup on shutdown)
         _addHandlerRef(self)
         self.createLock()
 
+    # Whether emit() only uses the record through self.format(), so that
+    # the formatter decides which attributes of the record are used.  The
+    # attribute is looked up in the class's own namespace, since a subclass
+    # may override emit().
+    _formatsOnly = False
+
+    _formatter = None
+
+    @property
+    def formatter(self):
+        return self._formatter
+
+    @formatter.setter
+    def formatter(self, fmt):
+        # The formatter decides whether loggers need to find the caller.
+        self._formatter = fmt
+        Logger.manager._clear_cache()
+
     def get_name(self):
         return self._name
 
@@ -819,6 +1058,17 @@ class Handler(Filterer):
         raise NotImplementedError('emit must be implemented '
                                   'by Handler subclasses')
 
+    def emit_batch(self, records):
+        """
+        Do whatever it takes to actually log a sequence of logging records.
+
+        The caller holds the I/O thread lock and has already applied the
+        handler's filters. This version calls emit() for each record;
+        subclasses may override it to output the whole batch at once.
+        """
+        for record in records:
+            self.emit(record)
+
     def handle(self, record):
         """
         Conditionally emit the specified logging record.
@@ -843,6 +1093,20 @@ class Handler(Filterer):
         """
         self.formatter = fmt
 
+    def _needsCaller(self):
+        """
+        Return whether this handler may use the location of the logging call
+        which Logger.findCaller() records.
+
+        Handlers which only use records through a Formatter whose format
+        string does not reference the location, and which have no filters,
+        do not need it.
+        """
+        if self.filters or not type(self).__dict__.get('_formatsOnly'):
+            return True
+        fmt = self.formatter or _defaultFormatter
+        return type(fmt) is not Formatter or fmt._style._usesCaller()
+
     def flush(self):
         """
         Ensure all logging output has been flushed.
@@ -916,6 +1180,8 @@ class StreamHandler(Handler):
 
     terminator = '\n'
 
+    _formatsOnly = True
+
     def __init__(self, stream=None):
         """
         Initialize the handler.
@@ -958,10 +1224,34 @@ class StreamHandler(Handler):
         except Exception:
             self.handleError(record)
 
+    def emit_batch(self, records):
+        """
+        Emit a sequence of records.
+
+        The records are formatted as by emit() and written to the stream
+        with a single call to its writelines() method, then the stream is
+        flushed once.
+        """
+        lines = []
+        terminator = self.terminator
+        for record in records:
+            try:
+                lines.append(self.format(record) + terminator)
+            except Exception:
+                self.handleError(record)
+        if lines:
+            try:
+                self.stream.writelines(lines)
+                self.flush()
+            except Exception:
+                self.handleError(records[-1])
+
 class FileHandler(StreamHandler):
     """
     A handler class which writes formatted logging records to disk files.
     """
+    _formatsOnly = True
+
     def __init__(self, filename, mode='a', encoding=None, delay=False):
         """
         Open the specified file and use it as the stream for logging.
@@ -1015,12 +1305,25 @@ class FileHandler(StreamHandler):
             self.stream = self._open()
         StreamHandler.emit(self, record)
 
+    def emit_batch(self, records):
+        """
+        Emit a sequence of records.
+
+        If the stream was not opened because 'delay' was specified in the
+        constructor, open it before calling the superclass's emit_batch.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        StreamHandler.emit_batch(self, records)
+
 class _StderrHandler(StreamHandler):
     """
     This class is like a StreamHandler using sys.stderr, but always uses
     whatever sys.stderr is currently set to rather than the value of
     sys.stderr at handler construction time.
     """
+    _formatsOnly = True
+
     def __init__(self, level=NOTSET):
         """
         Initialize the handler.
@@ -1093,12 +1396,21 @@ class Manager(object):
         Initialize the manager with the root node of the logger hierarchy.
         """
         self.root = rootnode
-        self.disable = 0
+        self._disable = 0
         self.emittedNoHandlerWarning = False
         self.loggerDict = {}
         self.loggerClass = None
         self.logRecordFactory = None
 
+    @property
+    def disable(self):
+        return self._disable
+
+    @disable.setter
+    def disable(self, value):
+        self._disable = value
+        self._clear_cache()
+
     def getLogger(self, name):
         """
         Get a logger with the specified name (channel name), creating it
@@ -1124,6 +1436,7 @@ class Manager(object):
                     self.loggerDict[name] = rv
                     self._fixupChildren(ph, rv)
                     self._fixupParents(rv)
+                    self._clear_cache()
             else:
                 rv = (self.loggerClass or _loggerClass)(name)
                 rv.manager = self
@@ -1187,10 +1500,34 @@ class Manager(object):
                 alogger.parent = c.parent
                 c.parent = alogger
 
+    def _clear_cache(self):
+        """
+        Clear the cache of enabled levels, and of whether the caller must be
+        found, held by every logger in the hierarchy.
+
+        This must be called whenever something that affects the result of
+        Logger.isEnabledFor() changes: a logger's level, the manager's
+        disable level or the parent/child relationships between loggers.  It
+        must also be called when the handlers, filters or formatters which
+        records reach change, see Logger._needsCaller().
+        """
+        _acquireLock()
+        try:
+            for logger in self.loggerDict.values():
+                if isinstance(logger, Logger):
+                    logger._cache.clear()
+            self.root._cache.clear()
+        finally:
+            _releaseLock()
+
 #---------------------------------------------------------------------------
 #   Logger classes and functions
 #---------------------------------------------------------------------------
 
+# The key under which Logger._needsCaller() caches its answer in the cache
+# of enabled levels.
+_CALLER_KEY = 'caller'
+
 class Logger(Filterer):
     """
     Instances of the Logger class represent a single logging channel. A
@@ -1212,11 +1549,24 @@ class Logger(Filterer):
         """
         Filterer.__init__(self)
         self.name = name
-        self.level = _checkLevel(level)
+        self._level = _checkLevel(level)
         self.parent = None
-        self.propagate = True
-        self.handlers = []
+        self._propagate = True
+        self._handlers = []
         self.disabled = False
+        self._cache = {}
+
+    @property
+    def level(self):
+        return self._level
+
+    @level.setter
+    def level(self, value):
+        # Any change of level may alter the effective level of every
+        # descendant, so the whole hierarchy's cache is invalidated.
+        self._level = value
+        self._cache.clear()
+        self.manager._clear_cache()
 
     def setLevel(self, level):
         """
@@ -1224,6 +1574,28 @@ class Logger(Filterer):
         """
         self.level = _checkLevel(level)
 
+    # The handlers and propagation decide which handlers records reach, so
+    # changing them invalidates the caches of this logger and its
+    # descendants.
+
+    @property
+    def handlers(self):
+        return self._handlers
+
+    @handlers.setter
+    def handlers(self, value):
+        self._handlers = value
+        self.manager._clear_cache()
+
+    @property
+    def propagate(self):
+        return self._propagate
+
+    @propagate.setter
+    def propagate(self, value):
+        self._propagate = value
+        self.manager._clear_cache()
+
     def debug(self, msg, *args, **kwargs):
         """
         Log 'msg % args' with severity 'DEBUG'.
@@ -1354,10 +1726,11 @@ class Logger(Filterer):
         rv = _logRecordFactory(name, level, fn, lno, msg, args, exc_info, func,
                              sinfo)
         if extra is not None:
+            attributes = _recordAttributes(rv)
             for key in extra:
-                if (key in ["message", "asctime"]) or (key in rv.__dict__):
+                if (key in ["message", "asctime"]) or (key in attributes):
                     raise KeyError("Attempt to overwrite %r in LogRecord" % key)
-                rv.__dict__[key] = extra[key]
+                attributes[key] = extra[key]
         return rv
 
     def _log(self, level, msg, args, exc_info=None, extra=None, stack_info=False):
@@ -1366,7 +1739,7 @@ class Logger(Filterer):
         all the handlers of this logger to handle the record.
         """
         sinfo = None
-        if _srcfile:
+        if _srcfile and (stack_info or self._needsCaller()):
             #IronPython doesn't track Python frames, so findCaller raises an
             #exception on some versions of IronPython. We trap it here so that
             #IronPython can use logging.
@@ -1374,7 +1747,7 @@ class Logger(Filterer):
                 fn, lno, func, sinfo = self.findCaller(stack_info)
             except ValueError: # pragma: no cover
                 fn, lno, func = "(unknown file)", 0, "(unknown function)"
-        else: # pragma: no cover
+        else:
             fn, lno, func = "(unknown file)", 0, "(unknown function)"
         if exc_info:
             if not isinstance(exc_info, tuple):
@@ -1383,6 +1756,47 @@ class Logger(Filterer):
                                  exc_info, func, extra, sinfo)
         self.handle(record)
 
+    def _needsCaller(self):
+        """
+        Return whether the records logged by this logger need the location
+        of the logging call, which findCaller() is costly to determine.
+
+        It is not needed when the logger has no filters, the standard record
+        factories and methods are used, and every handler the records reach
+        does without it (see Handler._needsCaller()).  The answer is cached
+        along with the enabled levels.
+        """
+        try:
+            return self._cache[_CALLER_KEY]
+        except KeyError:
+            pass
+        _acquireLock()
+        try:
+            cls = type(self)
+            factory = _logRecordFactory
+            needed = bool(self.filters or
+                          factory not in (LogRecord, LazyLogRecord) or
+                          cls.makeRecord is not Logger.makeRecord or
+                          cls.handle is not Logger.handle or
+                          cls.callHandlers is not Logger.callHandlers)
+            found = False
+            c = self
+            while c and not needed:
+                for hdlr in c.handlers:
+                    found = True
+                    if hdlr._needsCaller():
+                        needed = True
+                        break
+                if not c.propagate:
+                    break
+                c = c.parent
+            # Records which reach no handler go to lastResort, which may be
+            # replaced at any time.
+            needed = self._cache[_CALLER_KEY] = needed or not found
+        finally:
+            _releaseLock()
+        return needed
+
     def handle(self, record):
         """
         Call the handlers for the specified record.
@@ -1401,6 +1815,7 @@ class Logger(Filterer):
         try:
             if not (hdlr in self.handlers):
                 self.handlers.append(hdlr)
+                self.manager._clear_cache()
         finally:
             _releaseLock()
 
@@ -1412,6 +1827,7 @@ class Logger(Filterer):
         try:
             if hdlr in self.handlers:
                 self.handlers.remove(hdlr)
+                self.manager._clear_cache()
         finally:
             _releaseLock()
 
@@ -1476,18 +1892,32 @@ class Logger(Filterer):
         """
         logger = self
         while logger:
-            if logger.level:
-                return logger.level
+            if logger._level:
+                return logger._level
             logger = logger.parent
         return NOTSET
 
     def isEnabledFor(self, level):
         """
         Is this logger enabled for level 'level'?
+
+        The answer is cached per logger and level; the cache is cleared
+        throughout the hierarchy whenever a level, the disable level or the
+        hierarchy itself changes.
         """
-        if self.manager.disable >= level:
-            return False
-        return level >= self.getEffectiveLevel()
+        try:
+            return self._cache[level]
+        except KeyError:
+            _acquireLock()
+            try:
+                if self.manager.disable >= level:
+                    is_enabled = self._cache[level] = False
+                else:
+                    is_enabled = self._cache[level] = (
+                        level >= self.getEffectiveLevel())
+            finally:
+                _releaseLock()
+            return is_enabled
 
     def getChild(self, suffix):
         """
@@ -1613,9 +2043,7 @@ class LoggerAdapter(object):
         """
         Is this logger enabled for level 'level'?
         """
-        if self.logger.manager.disable >= level:
-            return False
-        return level >= self.getEffectiveLevel()
+        return self.logger.isEnabledFor(level)
 
     def setLevel(self, level):
         """
@@ -1876,6 +2304,8 @@ class NullHandler(Handler):
     a NullHandler and add it to the top-level logger of the library module or
     package.
     """
+    _formatsOnly = True
+
     def handle(self, record):
         """Stub."""
 
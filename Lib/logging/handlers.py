@@ -75,6 +75,15 @@ class BaseRotatingHandler(logging.FileHandler):
         except Exception:
             self.handleError(record)
 
+    def emit_batch(self, records):
+        """
+        Emit a sequence of records.
+
+        Each record is emitted in turn, so that rollover is checked for
+        every record.
+        """
+        logging.Handler.emit_batch(self, records)
+
     def rotation_filename(self, default_name):
         """
         Modify the filename of a log file when rotating.
@@ -120,7 +129,11 @@ class RotatingFileHandler(BaseRotatingHandler):
     Handler for logging to a set of files, which switches from one file
     to the next when the current file reaches a certain size.
     """
-    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding=None, delay=False):
+    _formatsOnly = True
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0,
+                 encoding=None, delay=False, bufferSize=0,
+                 flushLevel=logging.ERROR, flushInterval=None):
         """
         Open the specified file and use it as the stream for logging.
 
@@ -140,6 +153,19 @@ class RotatingFileHandler(BaseRotatingHandler):
         respectively.
 
         If maxBytes is zero, rollover never occurs.
+
+        The size of the file is measured once when it is opened, the handler
+        then counts the bytes it writes, once encoded, so that each record
+        is formatted only once and no seek is needed per record.
+
+        If bufferSize is greater than zero, formatted records are kept in
+        memory and written out together once they reach bufferSize
+        characters, when a record of severity flushLevel or higher is
+        emitted, or when a record is emitted more than flushInterval seconds
+        after the last write (if flushInterval is not None). The interval is
+        only checked when a record is emitted, there is no timer. The buffer
+        is also written out before a rollover and when the handler is
+        flushed or closed.
         """
         # If rotation/rollover is wanted, it doesn't make sense to use another
         # mode. If for example 'w' were specified, then if there were multiple
@@ -148,17 +174,126 @@ class RotatingFileHandler(BaseRotatingHandler):
         # on each run.
         if maxBytes > 0:
             mode = 'a'
-        BaseRotatingHandler.__init__(self, filename, mode, encoding, delay)
+        # These are needed by _open(), which the base class may call.
         self.maxBytes = maxBytes
         self.backupCount = backupCount
+        self.bufferSize = bufferSize
+        self.flushLevel = flushLevel
+        self.flushInterval = flushInterval
+        self._size = 0
+        self._buffer = []
+        self._bufferedChars = 0
+        self._lastWrite = time.time()
+        BaseRotatingHandler.__init__(self, filename, mode, encoding, delay)
+
+    def _open(self):
+        """
+        Open the current base file and measure its size.
+        """
+        stream = BaseRotatingHandler._open(self)
+        if self.maxBytes > 0:
+            self._size = stream.seek(0, 2)
+        return stream
+
+    def _encodedLength(self, msg):
+        """
+        Return the number of bytes msg takes up once written to the stream.
+        """
+        stream = self.stream
+        size = len(msg.encode(stream.encoding, stream.errors))
+        if os.linesep != '\n':
+            # Account for the newline translation of text files.
+            size += msg.count('\n') * (len(os.linesep) - 1)
+        return size
+
+    def emit(self, record):
+        """
+        Emit a record.
+
+        The record is formatted once; its size is added to the count of
+        bytes written to decide whether a rollover is needed, as described
+        in doRollover().
+        """
+        if type(self).shouldRollover is not RotatingFileHandler.shouldRollover:
+            # A subclass decides on rollover itself, let it see the file.
+            BaseRotatingHandler.emit(self, record)
+            return
+        try:
+            if self._append(record):
+                self.flush()
+        except Exception:
+            self.handleError(record)
+
+    def emit_batch(self, records):
+        """
+        Emit a sequence of records.
+
+        The records are formatted and checked for rollover in turn, as by
+        emit(), and written out together.
+        """
+        if type(self).shouldRollover is not RotatingFileHandler.shouldRollover:
+            BaseRotatingHandler.emit_batch(self, records)
+            return
+        flush = False
+        for record in records:
+            try:
+                if self._append(record):
+                    flush = True
+            except Exception:
+                self.handleError(record)
+        if flush:
+            try:
+                self.flush()
+            except Exception:
+                self.handleError(records[-1])
+
+    def _append(self, record):
+        """
+        Format a record, do a rollover if needed and add the record to the
+        buffer. Return whether the buffer should now be written out.
+        """
+        msg = self.format(record) + self.terminator
+        if self.stream is None:                 # delay was set...
+            self.stream = self._open()
+        if self.maxBytes > 0:                   # are we rolling over?
+            size = self._encodedLength(msg)
+            if self._size + size >= self.maxBytes:
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self._size += size
+        self._buffer.append(msg)
+        self._bufferedChars += len(msg)
+        return (self._bufferedChars >= self.bufferSize or
+                record.levelno >= self.flushLevel or
+                (self.flushInterval is not None and
+                 time.time() - self._lastWrite >= self.flushInterval))
+
+    def flush(self):
+        """
+        Write out any buffered records, then flush the stream.
+        """
+        self.acquire()
+        try:
+            if self._buffer:
+                if self.stream:
+                    self.stream.write(''.join(self._buffer))
+                del self._buffer[:]
+                self._bufferedChars = 0
+                self._lastWrite = time.time()
+            BaseRotatingHandler.flush(self)
+        finally:
+            self.release()
 
     def doRollover(self):
         """
         Do a rollover, as described in __init__().
         """
         if self.stream:
+            self.flush()
             self.stream.close()
             self.stream = None
+        self._size = 0
         if self.backupCount > 0:
             for i in range(self.backupCount - 1, 0, -1):
                 sfn = self.rotation_filename("%s.%d" % (self.baseFilename, i))
@@ -181,6 +316,9 @@ class RotatingFileHandler(BaseRotatingHandler):
 
         Basically, see if the supplied record would cause the file to exceed
         the size limit we have.
+
+        emit() does not call this method but uses the count of bytes written
+        instead, unless it is overridden by a subclass.
         """
         if self.stream is None:                 # delay was set...
             self.stream = self._open()
@@ -199,6 +337,8 @@ class TimedRotatingFileHandler(BaseRotatingHandler):
     If backupCount is > 0, when rollover is done, no more than backupCount
     files are kept - the oldest ones are deleted.
     """
+    _formatsOnly = True
+
     def __init__(self, filename, when='h', interval=1, backupCount=0, encoding=None, delay=False, utc=False, atTime=None):
         BaseRotatingHandler.__init__(self, filename, 'a', encoding, delay)
         self.when = when.upper()
@@ -431,6 +571,8 @@ class WatchedFileHandler(logging.FileHandler):
     This handler is based on a suggestion and patch by Chad J.
     Schroeder.
     """
+    _formatsOnly = True
+
     def __init__(self, filename, mode='a', encoding=None, delay=False):
         logging.FileHandler.__init__(self, filename, mode, encoding, delay)
         self.dev, self.ino = -1, -1
@@ -584,7 +726,7 @@ class SocketHandler(logging.Handler):
         # See issue #14436: If msg or args are objects, they may not be
         # available on the receiving end. So we convert the msg % args
         # to a string, save it as msg and zap the args.
-        d = dict(record.__dict__)
+        d = dict(logging._recordAttributes(record))
         d['msg'] = record.getMessage()
         d['args'] = None
         d['exc_info'] = None
@@ -621,6 +763,25 @@ class SocketHandler(logging.Handler):
         except Exception:
             self.handleError(record)
 
+    def emit_batch(self, records):
+        """
+        Emit a sequence of records.
+
+        The records are pickled as by emit() and written to the socket with
+        a single call to send().
+        """
+        pickles = []
+        for record in records:
+            try:
+                pickles.append(self.makePickle(record))
+            except Exception:
+                self.handleError(record)
+        if pickles:
+            try:
+                self.send(b''.join(pickles))
+            except Exception:
+                self.handleError(records[-1])
+
     def close(self):
         """
         Closes the socket.
@@ -676,6 +837,14 @@ class DatagramHandler(SocketHandler):
             self.createSocket()
         self.sock.sendto(s, self.address)
 
+    def emit_batch(self, records):
+        """
+        Emit a sequence of records.
+
+        Each record is sent in a datagram of its own, as by emit().
+        """
+        logging.Handler.emit_batch(self, records)
+
 class SysLogHandler(logging.Handler):
     """
     A handler class which sends formatted logging records to a syslog
@@ -1110,7 +1279,7 @@ class HTTPHandler(logging.Handler):
         that is sent as the CGI data. Overwrite in your class.
         Contributed by Franz Glasner.
         """
-        return record.__dict__
+        return logging._recordAttributes(record)
 
     def emit(self, record):
         """
@@ -1283,22 +1452,71 @@ class QueueHandler(logging.Handler):
     user code for use with earlier Python versions.
     """
 
-    def __init__(self, queue):
+    def __init__(self, queue, overflow=None):
         """
         Initialise an instance, using the passed queue.
+
+        The overflow policy decides what happens when a bounded queue is
+        full. With 'block', the caller waits for room in the queue. With
+        'drop_oldest', the oldest record in the queue is discarded to make
+        room for the new one. With 'drop', the new record is discarded. The
+        number of records discarded by either of the last two policies is
+        kept in the dropped attribute. If overflow is None, queue.Full is
+        raised and handled by handleError().
         """
+        if overflow not in (None, 'block', 'drop_oldest', 'drop'):
+            raise ValueError('Invalid overflow policy: %r' % (overflow,))
         logging.Handler.__init__(self)
         self.queue = queue
+        self.overflow = overflow
+        self.dropped = 0
 
     def enqueue(self, record):
         """
         Enqueue a record.
 
-        The base implementation uses put_nowait. You may want to override
-        this method if you want to use blocking, timeouts or custom queue
-        implementations.
+        The base implementation uses put_nowait, or put if the overflow
+        policy is 'block', and applies the overflow policy when the queue
+        is full. You may want to override this method if you want to use
+        timeouts or custom queue implementations.
         """
-        self.queue.put_nowait(record)
+        if self.overflow == 'block':
+            self.queue.put(record)
+            return
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if self.overflow == 'drop':
+                self.dropped += 1
+            elif self.overflow == 'drop_oldest':
+                self._drop_oldest(record)
+            else:
+                raise
+
+    def _drop_oldest(self, record):
+        """
+        Discard records from the head of the queue until the passed record
+        fits in it.
+        """
+        while True:
+            try:
+                oldest = self.queue.get_nowait()
+            except queue.Empty:
+                pass
+            else:
+                if hasattr(self.queue, 'task_done'):
+                    self.queue.task_done()
+                if oldest is None:
+                    # Never discard the sentinel of a stopping listener.
+                    self.queue.put_nowait(oldest)
+                    self.dropped += 1
+                    return
+                self.dropped += 1
+            try:
+                self.queue.put_nowait(record)
+                return
+            except queue.Full:
+                pass
 
     def prepare(self, record):
         """
@@ -1345,13 +1563,20 @@ if threading:
         """
         _sentinel = None
 
-        def __init__(self, queue, *handlers):
+        def __init__(self, queue, *handlers, batch_size=1):
             """
             Initialise an instance with the specified queue and
             handlers.
+
+            If batch_size is greater than one, up to that many records
+            which are already waiting in the queue are removed together
+            and passed to the handlers' emit_batch() methods.
             """
+            if batch_size < 1:
+                raise ValueError('batch_size must be at least 1')
             self.queue = queue
             self.handlers = handlers
+            self.batch_size = batch_size
             self._stop = threading.Event()
             self._thread = None
 
@@ -1396,6 +1621,42 @@ if threading:
             for handler in self.handlers:
                 handler.handle(record)
 
+        def handle_batch(self, records):
+            """
+            Handle a list of records.
+
+            Each handler is offered the records which pass its filters, in
+            a single call to its emit_batch() method made with its lock
+            held.
+            """
+            records = [self.prepare(record) for record in records]
+            for handler in self.handlers:
+                batch = [record for record in records
+                         if handler.filter(record)]
+                if batch:
+                    handler.acquire()
+                    try:
+                        handler.emit_batch(batch)
+                    finally:
+                        handler.release()
+
+        def _dequeue_batch(self):
+            """
+            Dequeue a list of records, blocking until there is at least
+            one. Return the list and whether the sentinel was seen.
+            """
+            records = []
+            record = self.dequeue(True)
+            while record is not self._sentinel:
+                records.append(record)
+                if len(records) >= self.batch_size:
+                    break
+                try:
+                    record = self.dequeue(False)
+                except queue.Empty:
+                    break
+            return records, record is self._sentinel
+
         def _monitor(self):
             """
             Monitor the queue for records, and ask the handler
@@ -1408,6 +1669,16 @@ if threading:
             has_task_done = hasattr(q, 'task_done')
             while not self._stop.isSet():
                 try:
+                    if self.batch_size > 1:
+                        records, stop = self._dequeue_batch()
+                        if records:
+                            self.handle_batch(records)
+                        if has_task_done:
+                            for record in records:
+                                q.task_done()
+                        if stop:
+                            break
+                        continue
                     record = self.dequeue(True)
                     if record is self._sentinel:
                         break
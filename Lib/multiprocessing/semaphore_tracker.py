@@ -10,6 +10,10 @@
 # the next reboot.  Without this semaphore tracker process, "killall
 # python" would probably leave unlinked semaphores.
 #
+# The same applies to the POSIX shared memory segments created by
+# multiprocessing.shared_memory, which are tracked as a second type of
+# resource.
+#
 
 import errno
 import os
@@ -25,6 +29,23 @@ from . import current_process
 
 __all__ = ['ensure_running', 'register', 'unregister']
 
+_CLEANUP_FUNCS = {
+    'semaphore': _multiprocessing.sem_unlink,
+}
+
+try:
+    import _posixshmem
+except ImportError:
+    pass
+else:
+    _CLEANUP_FUNCS['shared_memory'] = _posixshmem.shm_unlink
+
+# What a leaked resource of each type is called in the warnings.
+_RESOURCE_NAMES = {
+    'semaphore': 'semaphores',
+    'shared_memory': 'shared_memory objects',
+}
+
 
 class SemaphoreTracker(object):
 
@@ -66,17 +87,19 @@ class SemaphoreTracker(object):
             finally:
                 os.close(r)
 
-    def register(self, name):
-        '''Register name of semaphore with semaphore tracker.'''
-        self._send('REGISTER', name)
+    def register(self, name, rtype='semaphore'):
+        '''Register name of a resource of type rtype with the tracker.'''
+        self._send('REGISTER', name, rtype)
 
-    def unregister(self, name):
-        '''Unregister name of semaphore with semaphore tracker.'''
-        self._send('UNREGISTER', name)
+    def unregister(self, name, rtype='semaphore'):
+        '''Unregister name of a resource of type rtype with the tracker.'''
+        self._send('UNREGISTER', name, rtype)
 
-    def _send(self, cmd, name):
+    def _send(self, cmd, name, rtype):
+        if rtype not in _CLEANUP_FUNCS:
+            raise ValueError('cannot track resources of type %r' % rtype)
         self.ensure_running()
-        msg = '{0}:{1}\n'.format(cmd, name).encode('ascii')
+        msg = '{0}:{1}:{2}\n'.format(cmd, name, rtype).encode('ascii')
         if len(name) > 512:
             # posix guarantees that writes to a pipe of less than PIPE_BUF
             # bytes are atomic, and that PIPE_BUF >= 512
@@ -104,17 +127,22 @@ def main(fd):
         except Exception:
             pass
 
-    cache = set()
+    cache = {rtype: set() for rtype in _CLEANUP_FUNCS}
     try:
-        # keep track of registered/unregistered semaphores
+        # keep track of registered/unregistered resources
         with open(fd, 'rb') as f:
             for line in f:
                 try:
-                    cmd, name = line.strip().split(b':')
-                    if cmd == b'REGISTER':
-                        cache.add(name)
-                    elif cmd == b'UNREGISTER':
-                        cache.remove(name)
+                    # names may contain colons, resource types may not
+                    cmd, rest = line.strip().decode('ascii').split(':', 1)
+                    name, rtype = rest.rsplit(':', 1)
+                    if rtype not in cache:
+                        raise ValueError('unrecognized resource type %r'
+                                         % rtype)
+                    if cmd == 'REGISTER':
+                        cache[rtype].add(name)
+                    elif cmd == 'UNREGISTER':
+                        cache[rtype].remove(name)
                     else:
                         raise RuntimeError('unrecognized command %r' % cmd)
                 except Exception:
@@ -123,23 +151,20 @@ def main(fd):
                     except:
                         pass
     finally:
-        # all processes have terminated; cleanup any remaining semaphores
-        if cache:
-            try:
-                warnings.warn('semaphore_tracker: There appear to be %d '
-                              'leaked semaphores to clean up at shutdown' %
-                              len(cache))
-            except Exception:
-                pass
-        for name in cache:
-            # For some reason the process which created and registered this
-            # semaphore has failed to unregister it. Presumably it has died.
-            # We therefore unlink it.
-            try:
-                name = name.decode('ascii')
+        # all processes have terminated; cleanup any remaining resources
+        for rtype, rtype_cache in cache.items():
+            if rtype_cache:
+                try:
+                    warnings.warn('semaphore_tracker: There appear to be %d '
+                                  'leaked %s to clean up at shutdown' %
+                                  (len(rtype_cache), _RESOURCE_NAMES[rtype]))
+                except Exception:
+                    pass
+            for name in rtype_cache:
+                # For some reason the process which created and registered
+                # this resource has failed to unregister it. Presumably it
+                # has died.  We therefore unlink it.
                 try:
-                    _multiprocessing.sem_unlink(name)
+                    _CLEANUP_FUNCS[rtype](name)
                 except Exception as e:
                     warnings.warn('semaphore_tracker: %r: %s' % (name, e))
-            finally:
-                pass
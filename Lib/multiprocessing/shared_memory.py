@@ -0,0 +1,397 @@
+#
+# Named shared memory blocks which can be attached by unrelated processes
+#
+# multiprocessing/shared_memory.py
+#
+# Licensed to PSF under a Contributor Agreement.
+#
+
+import binascii
+import functools
+import mmap
+import os
+import struct
+import sys
+
+__all__ = ['SharedMemory', 'ShareableList']
+
+if sys.platform == 'win32':
+    _USE_POSIX = False
+else:
+    import _posixshmem
+    _USE_POSIX = True
+
+
+# Shared memory names are limited to 14 characters on some platforms,
+# FreeBSD and macOS among them.
+_SHM_SAFE_NAME_LENGTH = 14
+
+if _USE_POSIX:
+    _SHM_NAME_PREFIX = '/psm_'
+else:
+    _SHM_NAME_PREFIX = 'wnsm_'
+
+
+def _make_filename():
+    "Create a random filename for the shared memory object."
+    # number of random bytes to use for name
+    nbytes = (_SHM_SAFE_NAME_LENGTH - len(_SHM_NAME_PREFIX)) // 2
+    assert nbytes >= 2, '_SHM_NAME_PREFIX too long'
+    return _SHM_NAME_PREFIX + binascii.hexlify(os.urandom(nbytes)).decode()
+
+
+class SharedMemory(object):
+    """Creates a new shared memory block or attaches to an existing
+    shared memory block.
+
+    Every shared memory block is assigned a unique name.  This enables
+    one process to create a shared memory block with a particular name
+    so that a different process can attach to that same shared memory
+    block using that same name.
+
+    As a resource for sharing data across processes, shared memory blocks
+    may outlive the original process that created them.  When one process
+    no longer needs access to a shared memory block that might still be
+    needed by other processes, the close() method should be called.
+    When a shared memory block is no longer needed by any process, the
+    unlink() method should be called to ensure proper cleanup."""
+
+    # Defaults; enables close() and unlink() to run without errors.
+    _name = None
+    _fd = -1
+    _mmap = None
+    _buf = None
+    _mode = 0o600
+    # Whether this instance created the block and registered it with the
+    # semaphore tracker.
+    _created = False
+
+    def __init__(self, name=None, create=False, size=0):
+        if not size >= 0:
+            raise ValueError("'size' must be a positive integer")
+        if create and size == 0:
+            raise ValueError("'size' must be a positive number different "
+                             "from zero")
+        if name is None and not create:
+            raise ValueError("'name' can only be None if create=True")
+
+        if _USE_POSIX:
+            flags = os.O_RDWR
+            if create:
+                flags |= os.O_CREAT | os.O_EXCL
+            if name is None:
+                while True:
+                    name = _make_filename()
+                    try:
+                        self._fd = _posixshmem.shm_open(name, flags,
+                                                        mode=self._mode)
+                    except FileExistsError:
+                        continue
+                    self._name = name
+                    break
+            else:
+                if not name.startswith('/'):
+                    name = '/' + name
+                self._fd = _posixshmem.shm_open(name, flags, mode=self._mode)
+                self._name = name
+            try:
+                if create:
+                    os.ftruncate(self._fd, size)
+                size = os.fstat(self._fd).st_size
+                self._mmap = mmap.mmap(self._fd, size)
+            except BaseException:
+                if create:
+                    _posixshmem.shm_unlink(self._name)
+                self.close()
+                raise
+            if create:
+                # The creator owns the block: if it dies before calling
+                # unlink(), the tracker process removes the block.
+                from .semaphore_tracker import register
+                register(self._name, 'shared_memory')
+                self._created = True
+
+        else:
+            # Windows has no separate namespace object: a named file
+            # mapping lives as long as one of its handles is open.  The
+            # size of an existing mapping cannot be queried through mmap,
+            # so it must be given when attaching.
+            if name is None:
+                name = _make_filename()
+            elif not create and size == 0:
+                raise ValueError("'size' must be given to attach to a shared "
+                                 "memory block on Windows")
+            self._mmap = mmap.mmap(-1, size, tagname=name)
+            self._name = name
+
+        self._size = size
+        self._buf = memoryview(self._mmap)
+
+    def __del__(self):
+        try:
+            self.close()
+        except OSError:
+            pass
+
+    def __reduce__(self):
+        return (self.__class__, (self.name, False, self.size))
+
+    def __repr__(self):
+        return '%s(%r, size=%d)' % (self.__class__.__name__, self.name,
+                                    self.size)
+
+    @property
+    def buf(self):
+        "A memoryview of contents of the shared memory block."
+        return self._buf
+
+    @property
+    def name(self):
+        "Unique name that identifies the shared memory block."
+        reported_name = self._name
+        if _USE_POSIX and reported_name.startswith('/'):
+            reported_name = reported_name[1:]
+        return reported_name
+
+    @property
+    def size(self):
+        "Size in bytes."
+        return self._size
+
+    def close(self):
+        """Closes access to the shared memory from this instance but does
+        not destroy the shared memory block."""
+        if self._buf is not None:
+            self._buf.release()
+            self._buf = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        if _USE_POSIX and self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def unlink(self):
+        """Requests that the underlying shared memory block be destroyed.
+
+        In order to ensure proper cleanup of resources, unlink should be
+        called once (and only once) across all processes which have access
+        to the shared memory block.  On Windows, the block is destroyed when
+        the last handle to it is closed and this method does nothing.
+
+        Only the instance which created the block unregisters it from the
+        semaphore tracker, whose process registered it."""
+        if _USE_POSIX and self._name:
+            _posixshmem.shm_unlink(self._name)
+            if self._created:
+                from .semaphore_tracker import unregister
+                unregister(self._name, 'shared_memory')
+
+
+_encoding = 'utf8'
+
+class ShareableList(object):
+    """Pattern for a mutable list-like object shareable via a shared
+    memory block.  It differs from the built-in list type in that these
+    lists can not change their overall length (i.e. no append, insert,
+    etc.)
+
+    Because values are packed into a memoryview as bytes, the struct
+    packing format for any storable value must require no more than 8
+    characters to describe its format."""
+
+    # Layout of the shared memory block, all integers being native:
+    #
+    #   q            number of items n
+    #   (n + 1) q    offsets of the items in the data area, the last one
+    #                being the size of the data area
+    #   n 8s         struct format of each item
+    #   n b          back transform code of each item
+    #   ...          data area
+    #
+    # str and bytes items get slots of a multiple of 8 bytes, every other
+    # type an 8-byte slot.  Their struct format records their current
+    # length, which may be less than the size of their slot.
+
+    _types_mapping = {
+        int: 'q',
+        float: 'd',
+        bool: '?',
+        str: '%ds',
+        bytes: '%ds',
+        type(None): 'x',
+    }
+    _alignment = 8
+    _back_transforms_mapping = {
+        0: lambda value: value,                 # int, float, bool
+        1: lambda value: value.decode(_encoding),
+        2: lambda value: value,                 # bytes
+        3: lambda value: None,
+    }
+
+    @staticmethod
+    def _extract_recreation_code(value):
+        """Used in concert with _back_transforms_mapping to convert values
+        into the appropriate Python objects when retrieving them from
+        the list as well as when storing them."""
+        if isinstance(value, str):
+            return 1
+        elif isinstance(value, bytes):
+            return 2
+        elif value is None:
+            return 3
+        else:
+            return 0
+
+    def _encode(self, value):
+        """Return the struct format and the packed form of value."""
+        if type(value) not in self._types_mapping:
+            raise TypeError('ShareableList cannot store values of type %s'
+                            % type(value).__name__)
+        if isinstance(value, str):
+            value = value.encode(_encoding)
+        fmt = self._types_mapping[type(value)]
+        if isinstance(value, bytes):
+            fmt = fmt % len(value)
+            if len(fmt) > 8:
+                raise ValueError('str and bytes items are limited to '
+                                 '9999999 bytes')
+        return fmt, value
+
+    def __init__(self, sequence=None, *, name=None):
+        if name is None or sequence is not None:
+            sequence = list(sequence or ())
+            encoded = [self._encode(item) for item in sequence]
+            self._list_len = len(sequence)
+            self._allocated_offsets = [0]
+            offset = 0
+            for fmt, value in encoded:
+                if fmt.endswith('s'):
+                    slot = max(self._alignment,
+                               -(-len(value) // self._alignment) *
+                               self._alignment)
+                else:
+                    slot = self._alignment
+                offset += slot
+                self._allocated_offsets.append(offset)
+            requested_size = max(1, self._offset_data_start + offset)
+            self.shm = SharedMemory(name, create=True, size=requested_size)
+
+            buf = self.shm.buf
+            struct.pack_into('q' * (self._list_len + 2), buf, 0,
+                             self._list_len, *self._allocated_offsets)
+            for position, (fmt, value) in enumerate(encoded):
+                self._set_packing_format_and_transform(
+                    position, fmt, self._extract_recreation_code(
+                        sequence[position]))
+                if value is not None:
+                    struct.pack_into(fmt, buf, self._offset_data_start +
+                                     self._allocated_offsets[position], value)
+        else:
+            self.shm = SharedMemory(name)
+            self._list_len = struct.unpack_from('q', self.shm.buf, 0)[0]
+            self._allocated_offsets = list(struct.unpack_from(
+                'q' * (self._list_len + 1), self.shm.buf, 8))
+
+    @property
+    def _offset_packing_formats(self):
+        return 8 * (self._list_len + 2)
+
+    @property
+    def _offset_back_transform_codes(self):
+        return self._offset_packing_formats + 8 * self._list_len
+
+    @property
+    def _offset_data_start(self):
+        end = self._offset_back_transform_codes + self._list_len
+        return -(-end // self._alignment) * self._alignment
+
+    def _get_packing_format(self, position):
+        "Gets the packing format for a single value stored in the list."
+        fmt = struct.unpack_from('8s', self.shm.buf,
+                                 self._offset_packing_formats + position * 8)
+        return fmt[0].rstrip(b'\x00').decode(_encoding)
+
+    def _get_back_transform(self, position):
+        "Gets the back transformation function for a single value."
+        transform_code = struct.unpack_from(
+            'b', self.shm.buf, self._offset_back_transform_codes + position)
+        return self._back_transforms_mapping[transform_code[0]]
+
+    def _set_packing_format_and_transform(self, position, fmt, code):
+        """Sets the packing format and back transformation code for a
+        single value in the list at the specified position."""
+        struct.pack_into('8s', self.shm.buf,
+                         self._offset_packing_formats + position * 8,
+                         fmt.encode(_encoding))
+        struct.pack_into('b', self.shm.buf,
+                         self._offset_back_transform_codes + position, code)
+
+    def _check_position(self, position):
+        try:
+            position = position.__index__()
+        except AttributeError:
+            raise TypeError('list indices must be integers, not %s'
+                            % type(position).__name__) from None
+        if position < 0:
+            position += self._list_len
+        if not 0 <= position < self._list_len:
+            raise IndexError('list index out of range')
+        return position
+
+    def __getitem__(self, position):
+        position = self._check_position(position)
+        fmt = self._get_packing_format(position)
+        back_transform = self._get_back_transform(position)
+        if fmt == 'x':
+            return back_transform(None)
+        value, = struct.unpack_from(fmt, self.shm.buf,
+                                    self._offset_data_start +
+                                    self._allocated_offsets[position])
+        return back_transform(value)
+
+    def __setitem__(self, position, value):
+        position = self._check_position(position)
+        fmt, encoded = self._encode(value)
+        slot = (self._allocated_offsets[position + 1] -
+                self._allocated_offsets[position])
+        if struct.calcsize(fmt) > slot:
+            raise ValueError('exceeds available storage for existing '
+                             '%s item' % type(value).__name__)
+        if encoded is not None:
+            struct.pack_into(fmt, self.shm.buf, self._offset_data_start +
+                             self._allocated_offsets[position], encoded)
+        self._set_packing_format_and_transform(
+            position, fmt, self._extract_recreation_code(value))
+
+    def __reduce__(self):
+        return functools.partial(self.__class__, name=self.shm.name), ()
+
+    def __len__(self):
+        return self._list_len
+
+    def __iter__(self):
+        for position in range(self._list_len):
+            yield self[position]
+
+    def __repr__(self):
+        return '%s(%r, name=%r)' % (self.__class__.__name__, list(self),
+                                    self.shm.name)
+
+    @property
+    def format(self):
+        "The struct packing format used by all currently stored items."
+        return ''.join(self._get_packing_format(position)
+                       for position in range(self._list_len))
+
+    def count(self, value):
+        "L.count(value) -> integer -- return number of occurrences of value."
+        return sum(value == entry for entry in self)
+
+    def index(self, value):
+        """L.index(value) -> integer -- return first index of value.
+        Raises ValueError if the value is not present."""
+        for position, entry in enumerate(self):
+            if value == entry:
+                return position
+        raise ValueError('%r not in this container' % (value,))
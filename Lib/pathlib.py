@@ -332,6 +332,8 @@ class _NormalAccessor(_Accessor):
 
     listdir = _wrap_strfunc(os.listdir)
 
+    scandir = _wrap_strfunc(os.scandir)
+
     chmod = _wrap_strfunc(os.chmod)
 
     if hasattr(os, "lchmod"):
@@ -387,7 +389,7 @@ def _cached(func):
             try:
                 return cache[args]
             except KeyError:
-                value = cache[args] = func(*args)
+                value = cache[args] = list(func(*args))
                 return value
         wrapper.__cached__ = True
         try:
@@ -420,8 +422,11 @@ class _Selector:
         self.child_parts = child_parts
         if child_parts:
             self.successor = _make_selector(child_parts)
+            # Only directories can match the following pattern parts
+            self.dironly = True
         else:
             self.successor = _TerminatingSelector()
+            self.dironly = False
 
     def select_from(self, parent_path):
         """Iterate over all child paths of `parent_path` matched by this
@@ -429,28 +434,35 @@ class _Selector:
         path_cls = type(parent_path)
         is_dir = path_cls.is_dir
         exists = path_cls.exists
-        listdir = parent_path._accessor.listdir
-        return self._select_from(parent_path, is_dir, exists, listdir)
+        scandir = parent_path._accessor.scandir
+        if not is_dir(parent_path):
+            return iter([])
+        return self._select_from(parent_path, is_dir, exists, scandir)
 
 
 class _TerminatingSelector:
 
-    def _select_from(self, parent_path, is_dir, exists, listdir):
+    def _select_from(self, parent_path, is_dir, exists, scandir):
         yield parent_path
 
 
+def _entry_is_dir(entry):
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
 class _PreciseSelector(_Selector):
 
     def __init__(self, name, child_parts):
         self.name = name
         _Selector.__init__(self, child_parts)
 
-    def _select_from(self, parent_path, is_dir, exists, listdir):
-        if not is_dir(parent_path):
-            return
+    def _select_from(self, parent_path, is_dir, exists, scandir):
         path = parent_path._make_child_relpath(self.name)
-        if exists(path):
-            for p in self.successor._select_from(path, is_dir, exists, listdir):
+        if (is_dir if self.dironly else exists)(path):
+            for p in self.successor._select_from(path, is_dir, exists, scandir):
                 yield p
 
 
@@ -460,15 +472,18 @@ class _WildcardSelector(_Selector):
         self.pat = re.compile(fnmatch.translate(pat))
         _Selector.__init__(self, child_parts)
 
-    def _select_from(self, parent_path, is_dir, exists, listdir):
-        if not is_dir(parent_path):
-            return
+    def _select_from(self, parent_path, is_dir, exists, scandir):
         cf = parent_path._flavour.casefold
-        for name in listdir(parent_path):
+        # The directory entries know their file type, so filtering on
+        # directories doesn't cost a stat() call per child.
+        for entry in scandir(parent_path):
+            if self.dironly and not _entry_is_dir(entry):
+                continue
+            name = entry.name
             casefolded = cf(name)
             if self.pat.match(casefolded):
                 path = parent_path._make_child_relpath(name)
-                for p in self.successor._select_from(path, is_dir, exists, listdir):
+                for p in self.successor._select_from(path, is_dir, exists, scandir):
                     yield p
 
 
@@ -477,23 +492,21 @@ class _RecursiveWildcardSelector(_Selector):
     def __init__(self, pat, child_parts):
         _Selector.__init__(self, child_parts)
 
-    def _iterate_directories(self, parent_path, is_dir, listdir):
+    def _iterate_directories(self, parent_path, is_dir, scandir):
         yield parent_path
-        for name in listdir(parent_path):
-            path = parent_path._make_child_relpath(name)
-            if is_dir(path):
-                for p in self._iterate_directories(path, is_dir, listdir):
+        for entry in scandir(parent_path):
+            if _entry_is_dir(entry):
+                path = parent_path._make_child_relpath(entry.name)
+                for p in self._iterate_directories(path, is_dir, scandir):
                     yield p
 
-    def _select_from(self, parent_path, is_dir, exists, listdir):
-        if not is_dir(parent_path):
-            return
-        with _cached(listdir) as listdir:
+    def _select_from(self, parent_path, is_dir, exists, scandir):
+        with _cached(scandir) as scandir:
             yielded = set()
             try:
                 successor_select = self.successor._select_from
-                for starting_point in self._iterate_directories(parent_path, is_dir, listdir):
-                    for p in successor_select(starting_point, is_dir, exists, listdir):
+                for starting_point in self._iterate_directories(parent_path, is_dir, scandir):
+                    for p in successor_select(starting_point, is_dir, exists, scandir):
                         if p not in yielded:
                             yield p
                             yielded.add(p)
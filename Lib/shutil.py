@@ -30,6 +30,9 @@ try:
 except ImportError:
     getgrnam = None
 
+COPY_BUFSIZE = 1024 * 1024 if os.name == 'nt' else 64 * 1024
+_USE_CP_SENDFILE = hasattr(os, "sendfile") and sys.platform.startswith("linux")
+
 __all__ = ["copyfileobj", "copyfile", "copymode", "copystat", "copy", "copy2",
            "copytree", "move", "rmtree", "Error", "SpecialFileError",
            "ExecError", "make_archive", "get_archive_formats",
@@ -59,14 +62,100 @@ class RegistryError(Exception):
     """Raised when a registry operation with the archiving
     and unpacking registeries fails"""
 
+class _GiveupOnFastCopy(Exception):
+    """Raised as a signal to fallback on using raw read()/write()
+    file copy when fast-copy functions fail to do so.
+    """
+
+
+def _fastcopy_sendfile(fsrc, fdst):
+    """Copy data from one regular file object to another by using the
+    in-kernel sendfile(2) syscall.  This works on Linux >= 2.6.33 only.
+
+    Raise _GiveupOnFastCopy if the copy cannot be done this way and no
+    data has been written yet, so that the caller can fall back on a
+    read()/write() based copy.
+    """
+    global _USE_CP_SENDFILE
+    try:
+        infd = fsrc.fileno()
+        outfd = fdst.fileno()
+    except Exception as err:
+        raise _GiveupOnFastCopy(err)  # not a regular file
+
+    # Hopefully the whole file will be copied in a single call.
+    # sendfile() is called in a loop until EOF is reached (0 return),
+    # so a blocksize smaller or bigger than the actual file size does
+    # not make any difference, also in case the file content changes
+    # while being copied.
+    try:
+        blocksize = max(os.fstat(infd).st_size, 2 ** 23)  # min 8MiB
+    except OSError:
+        blocksize = 2 ** 27  # 128MiB
+    # On 32-bit architectures truncate to 1GiB to avoid OverflowError.
+    if sys.maxsize < 2 ** 32:
+        blocksize = min(blocksize, 2 ** 30)
+
+    offset = 0
+    while True:
+        try:
+            sent = os.sendfile(outfd, infd, offset, blocksize)
+        except OSError as err:
+            # ...in order to have a more informative exception.
+            err.filename = fsrc.name
+            err.filename2 = fdst.name
+
+            if err.errno == errno.ENOTSOCK:
+                # sendfile() on this platform (probably Linux < 2.6.33)
+                # does not support copies between regular files (only
+                # sockets).
+                _USE_CP_SENDFILE = False
+                raise _GiveupOnFastCopy(err)
+
+            if err.errno == errno.ENOSPC:  # filesystem is full
+                raise err from None
+
+            # Give up on first call and if no data was copied.
+            if offset == 0 and os.lseek(outfd, 0, os.SEEK_CUR) == 0:
+                raise _GiveupOnFastCopy(err)
+
+            raise err
+        else:
+            if sent == 0:
+                break  # EOF
+            offset += sent
+
+def _copyfileobj_readinto(fsrc, fdst, length=COPY_BUFSIZE):
+    """readinto()/memoryview() based variant of copyfileobj().
+
+    *fsrc* must support the readinto() method and both files must be
+    open in binary mode.  A single buffer is reused for the whole copy,
+    so no new bytes object is allocated per chunk.
+    """
+    # Localize variable access to minimize overhead.
+    fsrc_readinto = fsrc.readinto
+    fdst_write = fdst.write
+    with memoryview(bytearray(length)) as mv:
+        while True:
+            n = fsrc_readinto(mv)
+            if not n:
+                break
+            elif n < length:
+                with mv[:n] as smv:
+                    fdst_write(smv)
+            else:
+                fdst_write(mv)
 
-def copyfileobj(fsrc, fdst, length=16*1024):
+def copyfileobj(fsrc, fdst, length=COPY_BUFSIZE):
     """copy data from file-like object fsrc to file-like object fdst"""
+    # Localize variable access to minimize overhead.
+    fsrc_read = fsrc.read
+    fdst_write = fdst.write
     while 1:
-        buf = fsrc.read(length)
+        buf = fsrc_read(length)
         if not buf:
             break
-        fdst.write(buf)
+        fdst_write(buf)
 
 def _samefile(src, dst):
     # Macintosh, Unix.
@@ -106,7 +195,24 @@ def copyfile(src, dst, *, follow_symlinks=True):
     else:
         with open(src, 'rb') as fsrc:
             with open(dst, 'wb') as fdst:
-                copyfileobj(fsrc, fdst)
+                # Linux: copy in-kernel, without going through user space.
+                if _USE_CP_SENDFILE:
+                    try:
+                        _fastcopy_sendfile(fsrc, fdst)
+                        return dst
+                    except _GiveupOnFastCopy:
+                        pass
+
+                # Otherwise read into a single preallocated buffer, sized
+                # down for small files.
+                try:
+                    size = os.fstat(fsrc.fileno()).st_size
+                except OSError:
+                    size = 0
+                if 0 < size < COPY_BUFSIZE:
+                    _copyfileobj_readinto(fsrc, fdst, size)
+                else:
+                    _copyfileobj_readinto(fsrc, fdst)
     return dst
 
 def copymode(src, dst, *, follow_symlinks=True):
@@ -293,7 +399,9 @@ def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
     function that supports the same signature (like copy()) can be used.
 
     """
-    names = os.listdir(src)
+    with os.scandir(src) as it:
+        entries = list(it)
+    names = [entry.name for entry in entries]
     if ignore is not None:
         ignored_names = ignore(src, names)
     else:
@@ -301,13 +409,16 @@ def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
 
     os.makedirs(dst)
     errors = []
-    for name in names:
+    for srcentry in entries:
+        name = srcentry.name
         if name in ignored_names:
             continue
         srcname = os.path.join(src, name)
         dstname = os.path.join(dst, name)
         try:
-            if os.path.islink(srcname):
+            # The entry caches the file type reported by the directory
+            # listing, so classifying it normally needs no stat() call.
+            if srcentry.is_symlink():
                 linkto = os.readlink(srcname)
                 if symlinks:
                     # We can't just leave it to `copy_function` because legacy
@@ -321,7 +432,7 @@ def copytree(src, dst, symlinks=False, ignore=None, copy_function=copy2,
                         continue
                     # otherwise let the copy occurs. copy2 will raise an error
                     copy_function(srcname, dstname)
-            elif os.path.isdir(srcname):
+            elif srcentry.is_dir():
                 copytree(srcname, dstname, symlinks, ignore, copy_function)
             else:
                 # Will raise a SpecialFileError for unsupported file types
@@ -352,18 +463,19 @@ def _rmtree_unsafe(path, onerror):
         onerror(os.path.islink, path, sys.exc_info())
         # can't continue even if onerror hook returns
         return
-    names = []
+    entries = []
     try:
-        names = os.listdir(path)
+        with os.scandir(path) as scandir_it:
+            entries = list(scandir_it)
     except OSError:
-        onerror(os.listdir, path, sys.exc_info())
-    for name in names:
-        fullname = os.path.join(path, name)
+        onerror(os.scandir, path, sys.exc_info())
+    for entry in entries:
+        fullname = entry.path
         try:
-            mode = os.lstat(fullname).st_mode
+            is_dir = entry.is_dir(follow_symlinks=False)
         except OSError:
-            mode = 0
-        if stat.S_ISDIR(mode):
+            is_dir = False
+        if is_dir:
             _rmtree_unsafe(fullname, onerror)
         else:
             try:
@@ -377,20 +489,26 @@ def _rmtree_unsafe(path, onerror):
 
 # Version using fd-based APIs to protect against races
 def _rmtree_safe_fd(topfd, path, onerror):
-    names = []
+    entries = []
     try:
-        names = os.listdir(topfd)
+        with os.scandir(topfd) as scandir_it:
+            entries = list(scandir_it)
     except OSError as err:
         err.filename = path
-        onerror(os.listdir, path, sys.exc_info())
-    for name in names:
+        onerror(os.scandir, path, sys.exc_info())
+    for entry in entries:
+        name = entry.name
         fullname = os.path.join(path, name)
         try:
-            orig_st = os.stat(name, dir_fd=topfd, follow_symlinks=False)
-            mode = orig_st.st_mode
+            is_dir = entry.is_dir(follow_symlinks=False)
+            if is_dir:
+                # Only directories need the stat result, to guard against
+                # a directory being replaced by a symlink below.
+                orig_st = entry.stat(follow_symlinks=False)
+                is_dir = stat.S_ISDIR(orig_st.st_mode)
         except OSError:
-            mode = 0
-        if stat.S_ISDIR(mode):
+            is_dir = False
+        if is_dir:
             try:
                 dirfd = os.open(name, os.O_RDONLY, dir_fd=topfd)
             except OSError:
@@ -422,7 +540,7 @@ def _rmtree_safe_fd(topfd, path, onerror):
 
 _use_fd_functions = ({os.open, os.stat, os.unlink, os.rmdir} <=
                      os.supports_dir_fd and
-                     os.listdir in os.supports_fd and
+                     os.scandir in os.supports_fd and
                      os.stat in os.supports_follow_symlinks)
 
 def rmtree(path, ignore_errors=False, onerror=None):
@@ -5,6 +5,7 @@
 #
 
 import unittest
+import unittest.mock
 import queue as pyqueue
 import time
 import io
@@ -20,6 +21,7 @@ import random
 import logging
 import struct
 import operator
+import pickle
 import test.support
 import test.script_helper
 
@@ -53,6 +55,12 @@ try:
 except ImportError:
     HAS_SHAREDCTYPES = False
 
+try:
+    from multiprocessing import shared_memory
+    HAS_SHMEM = True
+except ImportError:
+    HAS_SHMEM = False
+
 try:
     import msvcrt
 except ImportError:
@@ -2775,6 +2783,214 @@ class _TestSharedCTypes(BaseTestCase):
         self.assertEqual(bar.x, 2)
         self.assertAlmostEqual(bar.y, 5.0)
 
+#
+# Test named shared memory
+#
+
+@unittest.skipUnless(HAS_SHMEM, "requires multiprocessing.shared_memory")
+class _TestSharedMemory(BaseTestCase):
+
+    ALLOWED_TYPES = ('processes',)
+
+    @classmethod
+    def _attach_existing_shmem_then_write(cls, shmem_name_or_obj,
+                                          binary_data):
+        if isinstance(shmem_name_or_obj, str):
+            local_sms = shared_memory.SharedMemory(shmem_name_or_obj)
+        else:
+            local_sms = shmem_name_or_obj
+        local_sms.buf[:len(binary_data)] = binary_data
+        local_sms.close()
+
+    @staticmethod
+    def _new_shm_name(prefix):
+        # The name must not collide with the blocks of tests running
+        # concurrently, and be short enough for every platform.
+        return '%s%x%04x' % (prefix, os.getpid(), random.getrandbits(16))
+
+    def test_shared_memory_basics(self):
+        name = self._new_shm_name('tm')
+        sms = shared_memory.SharedMemory(name, create=True, size=512)
+        self.addCleanup(sms.unlink)
+        self.addCleanup(sms.close)
+
+        # Verify attributes are readable.
+        self.assertEqual(sms.name, name)
+        self.assertGreaterEqual(sms.size, 512)
+        self.assertGreaterEqual(len(sms.buf), sms.size)
+        self.assertIn(sms.name, repr(sms))
+
+        # Modify contents of shared memory segment through memoryview.
+        sms.buf[0] = 42
+        self.assertEqual(sms.buf[0], 42)
+
+        # Attach to existing shared memory segment.
+        also_sms = shared_memory.SharedMemory(name)
+        self.assertEqual(also_sms.buf[0], 42)
+        also_sms.close()
+
+        # Attach by pickling, as when passing a block to a child process.
+        pickled_sms = pickle.loads(pickle.dumps(sms))
+        self.assertEqual(pickled_sms.name, sms.name)
+        self.assertEqual(pickled_sms.buf[0], 42)
+        pickled_sms.buf[1] = 7
+        self.assertEqual(sms.buf[1], 7)
+        pickled_sms.close()
+
+        # Creating a block which already exists fails.
+        with self.assertRaises(FileExistsError):
+            shared_memory.SharedMemory(name, create=True, size=512)
+
+        # Closing twice is harmless.
+        also_sms.close()
+
+        # Without a name, a random one is generated.
+        unnamed = shared_memory.SharedMemory(create=True, size=16)
+        self.addCleanup(unnamed.unlink)
+        self.addCleanup(unnamed.close)
+        self.assertNotEqual(unnamed.name, sms.name)
+
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory(create=True, size=-2)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory(create=True, size=0)
+        with self.assertRaises(ValueError):
+            shared_memory.SharedMemory()
+
+    @unittest.skipIf(WIN32, "blocks are destroyed with their last handle")
+    def test_shared_memory_unlink(self):
+        sms = shared_memory.SharedMemory(create=True, size=64)
+        name = sms.name
+        sms.close()
+        sms.unlink()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name)
+
+    @unittest.skipIf(WIN32, "blocks are destroyed with their last handle")
+    def test_shared_memory_unlink_unregisters_creator_only(self):
+        sms = shared_memory.SharedMemory(create=True, size=64)
+        self.addCleanup(sms.unlink)
+        self.addCleanup(sms.close)
+        also_sms = shared_memory.SharedMemory(sms.name)
+        self.addCleanup(also_sms.close)
+
+        with unittest.mock.patch.object(shared_memory._posixshmem,
+                                        'shm_unlink'), \
+             unittest.mock.patch('multiprocessing.semaphore_tracker.'
+                                 'unregister') as unregister:
+            also_sms.unlink()
+            self.assertFalse(unregister.called)
+            sms.unlink()
+            unregister.assert_called_once_with(sms._name, 'shared_memory')
+
+    def test_shared_memory_across_processes(self):
+        sms = shared_memory.SharedMemory(create=True, size=512)
+        self.addCleanup(sms.unlink)
+        self.addCleanup(sms.close)
+
+        # Verify remote attachment to existing block by name is working.
+        p = self.Process(target=self._attach_existing_shmem_then_write,
+                         args=(sms.name, b'howdy'))
+        p.daemon = True
+        p.start()
+        p.join()
+        self.assertEqual(bytes(sms.buf[:5]), b'howdy')
+
+        # Verify pickling of SharedMemory instance also works.
+        p = self.Process(target=self._attach_existing_shmem_then_write,
+                         args=(sms, b'HELLO'))
+        p.daemon = True
+        p.start()
+        p.join()
+        self.assertEqual(bytes(sms.buf[:5]), b'HELLO')
+
+    def test_shareable_list_basics(self):
+        sl = shared_memory.ShareableList(
+            ['howdy', b'HoWdY', -273.154, 100, None, True, 42]
+        )
+        self.addCleanup(sl.shm.unlink)
+        self.addCleanup(sl.shm.close)
+
+        # Verify attributes are readable.
+        self.assertEqual(sl.format, '5s5sdqx?q')
+        self.assertEqual(len(sl), 7)
+        self.assertIn(sl.shm.name, repr(sl))
+
+        # Index Out of Range (get)
+        with self.assertRaises(IndexError):
+            sl[7]
+        # Index Out of Range (set)
+        with self.assertRaises(IndexError):
+            sl[7] = 2
+        # Assign value without format change (str -> str)
+        current_format = sl._get_packing_format(0)
+        sl[0] = 'howdy'
+        self.assertEqual(current_format, sl._get_packing_format(0))
+
+        # Verify attributes are readable.
+        self.assertEqual(sl[0], 'howdy')
+        self.assertEqual(sl[-1], 42)
+        self.assertEqual(list(sl),
+                         ['howdy', b'HoWdY', -273.154, 100, None, True, 42])
+        self.assertEqual(sl.count(42), 1)
+        self.assertEqual(sl.index(True), 5)
+        with self.assertRaises(ValueError):
+            sl.index(3.5)
+
+        # Exercise retrieving individual values.
+        self.assertEqual(sl[3], 100)
+        self.assertIs(sl[4], None)
+        self.assertIs(sl[5], True)
+
+        # Exercise assigning values, changing their type when they fit.
+        sl[3] = 42
+        self.assertEqual(sl[3], 42)
+        sl[4] = 'some'  # Change type at a given position.
+        self.assertEqual(sl[4], 'some')
+        self.assertEqual(sl.format, '5s5sdq4s?q')
+        sl[6] = b'\x00bytes\x00'  # Trailing NULs are preserved.
+        self.assertEqual(sl[6], b'\x00bytes\x00')
+        with self.assertRaises(ValueError):
+            sl[4] = 'far too many'  # Exceeds available storage.
+        self.assertEqual(sl[4], 'some')
+        with self.assertRaises(TypeError):
+            sl[0] = [1]
+
+        # Attach to the same block by name, or by pickling.
+        sl_attached = shared_memory.ShareableList(name=sl.shm.name)
+        self.addCleanup(sl_attached.shm.close)
+        self.assertEqual(list(sl_attached), list(sl))
+        sl_attached[0] = 'HI'
+        self.assertEqual(sl[0], 'HI')
+        sl_pickled = pickle.loads(pickle.dumps(sl))
+        self.addCleanup(sl_pickled.shm.close)
+        self.assertEqual(list(sl_pickled), list(sl))
+
+        # Creating an empty list is allowed.
+        empty_sl = shared_memory.ShareableList()
+        self.addCleanup(empty_sl.shm.unlink)
+        self.addCleanup(empty_sl.shm.close)
+        self.assertEqual(len(empty_sl), 0)
+        self.assertEqual(empty_sl.format, '')
+        self.assertEqual(list(empty_sl), [])
+
+    @classmethod
+    def _increment_shareable_list(cls, sl):
+        for position in range(len(sl)):
+            sl[position] += 1
+        sl.shm.close()
+
+    def test_shareable_list_across_processes(self):
+        sl = shared_memory.ShareableList(range(10))
+        self.addCleanup(sl.shm.unlink)
+        self.addCleanup(sl.shm.close)
+
+        p = self.Process(target=self._increment_shareable_list, args=(sl,))
+        p.daemon = True
+        p.start()
+        p.join()
+        self.assertEqual(list(sl), list(range(1, 11)))
+
 #
 #
 #
@@ -2863,6 +3079,9 @@ class _TestImportStar(unittest.TestCase):
         if c_int is None:
             # This module requires _ctypes
             modules.remove('multiprocessing.sharedctypes')
+        if not HAS_SHMEM:
+            # This module requires _posixshmem on Unix
+            modules.remove('multiprocessing.shared_memory')
 
         for name in modules:
             __import__(name)
@@ -3667,6 +3886,42 @@ class TestSemaphoreTracker(unittest.TestCase):
         self.assertRegex(err, expected)
         self.assertRegex(err, 'semaphore_tracker: %r: \[Errno' % name1)
 
+    @unittest.skipUnless(HAS_SHMEM, "requires multiprocessing.shared_memory")
+    def test_shared_memory_cleanup(self):
+        import subprocess
+        cmd = '''if 1:
+            from multiprocessing import shared_memory
+            import os, time
+            sms = shared_memory.SharedMemory(create=True, size=16)
+            other = shared_memory.SharedMemory(create=True, size=16)
+            os.write(%d, sms.name.encode("ascii") + b"\\n")
+            time.sleep(10)
+        '''
+        r, w = os.pipe()
+        p = subprocess.Popen([sys.executable, '-c', cmd % w],
+                             pass_fds=[w],
+                             stderr=subprocess.PIPE)
+        os.close(w)
+        with open(r, 'rb', closefd=True) as f:
+            name = f.readline().rstrip().decode('ascii')
+        p.terminate()
+        p.wait()
+        deadline = time.time() + 5.0
+        while time.time() < deadline:
+            time.sleep(0.1)
+            try:
+                sms = shared_memory.SharedMemory(name)
+            except FileNotFoundError:
+                break
+            sms.close()
+        else:
+            self.fail('shared memory block %r was not unlinked' % name)
+        err = p.stderr.read().decode('utf-8')
+        p.stderr.close()
+        expected = ('semaphore_tracker: There appear to be 2 leaked '
+                    'shared_memory objects')
+        self.assertRegex(err, expected)
+
 #
 # Mixins
 #
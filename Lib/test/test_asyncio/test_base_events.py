@@ -1,6 +1,7 @@
 """Tests for base_events.py"""
 
 import errno
+import io
 import logging
 import socket
 import time
@@ -93,6 +94,34 @@ class BaseEventLoopTests(unittest.TestCase):
         self.assertIsInstance(h, events.Handle)
         self.assertIn(h, self.loop._ready)
 
+    def test_create_task(self):
+        @tasks.coroutine
+        def coro():
+            pass
+
+        self.assertIsNone(self.loop.get_task_factory())
+        task = self.loop.create_task(coro())
+        self.assertIsInstance(task, tasks.Task)
+        self.assertIs(task._loop, self.loop)
+        task.cancel()
+
+    def test_set_task_factory(self):
+        @tasks.coroutine
+        def coro():
+            pass
+
+        factory = unittest.mock.Mock()
+        self.loop.set_task_factory(factory)
+        self.assertIs(self.loop.get_task_factory(), factory)
+        c = coro()
+        self.assertIs(self.loop.create_task(c), factory.return_value)
+        factory.assert_called_with(self.loop, c)
+        c.close()
+
+        self.loop.set_task_factory(None)
+        self.assertIsNone(self.loop.get_task_factory())
+        self.assertRaises(TypeError, self.loop.set_task_factory, 1)
+
     def test_call_later(self):
         def cb():
             pass
@@ -213,6 +242,80 @@ class BaseEventLoopTests(unittest.TestCase):
         self.loop._run_once()
         self.assertEqual(logging.DEBUG, m_logging.log.call_args[0][0])
 
+    def test_timer_handle_cancelled_count(self):
+        h1 = self.loop.call_later(10.0, lambda: True)
+        h2 = self.loop.call_later(20.0, lambda: True)
+        self.assertEqual(0, self.loop._timer_cancelled_count)
+        h1.cancel()
+        h1.cancel()
+        self.assertEqual(1, self.loop._timer_cancelled_count)
+        h2.cancel()
+        self.assertEqual(2, self.loop._timer_cancelled_count)
+
+        # Cancelled handles are not counted once out of the heap.
+        self.loop._process_events = unittest.mock.Mock()
+        self.loop._run_once()
+        self.assertEqual([], self.loop._scheduled)
+        self.assertEqual(0, self.loop._timer_cancelled_count)
+        h3 = self.loop.call_soon(lambda: True)
+        h3.cancel()
+        self.assertEqual(0, self.loop._timer_cancelled_count)
+
+    def test__run_once_cancelled_event_cleanup(self):
+        self.loop._process_events = unittest.mock.Mock()
+        min_handles = base_events._MIN_SCHEDULED_TIMER_HANDLES
+        cancel_fraction = base_events._MIN_CANCELLED_TIMER_HANDLES_FRACTION
+
+        def cb():
+            pass
+
+        # Not enough scheduled handles: only the head of the heap is
+        # cleaned up.
+        not_cancelled_count = 1
+        self.loop.call_later(3000, cb)
+        ncancel = int(min_handles * cancel_fraction) + 1
+        for x in range(ncancel):
+            self.loop.call_later(3600, cb).cancel()
+        self.loop._run_once()
+        self.assertEqual(not_cancelled_count + ncancel,
+                         len(self.loop._scheduled))
+        self.assertEqual(ncancel, self.loop._timer_cancelled_count)
+
+        # Enough scheduled handles, but not enough of them cancelled.
+        for x in range(min_handles):
+            self.loop.call_later(3000, cb)
+        not_cancelled_count += min_handles
+        self.loop._run_once()
+        self.assertEqual(not_cancelled_count + ncancel,
+                         len(self.loop._scheduled))
+
+        # Enough of them cancelled: the heap is rebuilt without them.
+        handles = [self.loop.call_later(3600, cb)
+                   for x in range(min_handles * 2)]
+        for handle in handles:
+            handle.cancel()
+        self.loop._run_once()
+        self.assertEqual(not_cancelled_count, len(self.loop._scheduled))
+        self.assertEqual(0, self.loop._timer_cancelled_count)
+        self.assertTrue(all(not h._cancelled for h in self.loop._scheduled))
+        self.assertFalse(any(h._scheduled for h in handles))
+
+        # The heap invariant holds after the rebuild.
+        when = [h._when for h in self.loop._scheduled]
+        for i in range(1, len(when)):
+            self.assertLessEqual(when[(i - 1) // 2], when[i])
+
+    def test__run_once_cancelled_due_handle(self):
+        # A cancelled handle which becomes due is not counted anymore.
+        self.loop._process_events = unittest.mock.Mock()
+        h1 = self.loop.call_at(self.loop.time() - 1, lambda: True)
+        h2 = self.loop.call_at(self.loop.time() - 0.5, lambda: True)
+        h2.cancel()
+        self.assertEqual(1, self.loop._timer_cancelled_count)
+        self.loop._run_once()
+        self.assertEqual(0, self.loop._timer_cancelled_count)
+        self.assertEqual([], self.loop._scheduled)
+
     def test__run_once_schedule_handle(self):
         handle = None
         processed = False
@@ -235,6 +338,39 @@ class BaseEventLoopTests(unittest.TestCase):
         self.assertRaises(
             TypeError, self.loop.run_until_complete, 'blah')
 
+    def test_sendfile_fallback_disabled(self):
+        # Transports which only support the read/write fallback refuse
+        # fallback=False like the native attempt does.
+        transport = unittest.mock.Mock(
+            _closing=False,
+            _sendfile_compatible=constants._SendfileMode.FALLBACK)
+        file = io.BytesIO(b'data')
+        coro = self.loop.sendfile(transport, file, fallback=False)
+        self.assertRaises(events.SendfileNotAvailableError, next, coro)
+        self.assertFalse(transport.write.called)
+
+    def test_sendfile_fallback_protocol(self):
+        # The protocol installed by the sendfile() fallback forwards
+        # incoming data, whether it comes as data_received() calls or
+        # through get_buffer() and buffer_updated().
+        proto = unittest.mock.Mock(protocols.BufferedProtocol)
+        proto.get_buffer.return_value = buf = bytearray(10)
+        transp = unittest.mock.Mock(_protocol_paused=False)
+        transp.get_protocol.return_value = proto
+        fallback = base_events._SendfileFallbackProtocol(transp)
+        transp.set_protocol.assert_called_with(fallback)
+
+        self.assertIs(fallback.get_buffer(100), buf)
+        proto.get_buffer.assert_called_with(100)
+        fallback.buffer_updated(4)
+        proto.buffer_updated.assert_called_with(4)
+        fallback.data_received(b'data')
+        proto.data_received.assert_called_with(b'data')
+
+        transp.get_protocol.return_value = fallback
+        fallback.restore()
+        transp.set_protocol.assert_called_with(proto)
+
 
 class MyProto(protocols.Protocol):
     done = None
@@ -550,6 +686,11 @@ class BaseEventLoopWithSelectorTests(unittest.TestCase):
         fut = self.loop.create_server(MyProto)
         self.assertRaises(ValueError, self.loop.run_until_complete, fut)
 
+    def test_create_server_max_connections(self):
+        fut = self.loop.create_server(MyProto, '0.0.0.0', 0,
+                                      max_connections=0)
+        self.assertRaises(ValueError, self.loop.run_until_complete, fut)
+
     def test_create_server_no_getaddrinfo(self):
         getaddrinfo = self.loop.getaddrinfo = unittest.mock.Mock()
         getaddrinfo.return_value = []
@@ -572,6 +713,40 @@ class BaseEventLoopWithSelectorTests(unittest.TestCase):
         self.assertRaises(OSError, self.loop.run_until_complete, fut)
         self.assertTrue(m_sock.close.called)
 
+    @unittest.mock.patch('asyncio.base_events.socket')
+    def test_create_server_reuse_port(self, m_socket):
+        m_socket.getaddrinfo.return_value = [
+            (2, 1, 6, '', ('127.0.0.1', 10100))]
+        m_sock = m_socket.socket.return_value = unittest.mock.Mock()
+        self.loop._start_serving = unittest.mock.Mock()
+
+        fut = self.loop.create_server(MyProto, '0.0.0.0', 10100,
+                                      reuse_port=True)
+        self.loop.run_until_complete(fut)
+        m_sock.setsockopt.assert_any_call(
+            m_socket.SOL_SOCKET, m_socket.SO_REUSEPORT, True)
+
+        m_sock.setsockopt.reset_mock()
+        fut = self.loop.create_server(MyProto, '0.0.0.0', 10100)
+        self.loop.run_until_complete(fut)
+        for call in m_sock.setsockopt.call_args_list:
+            self.assertNotEqual(call[0][1], m_socket.SO_REUSEPORT)
+
+        m_sock.setsockopt.side_effect = OSError
+        fut = self.loop.create_server(MyProto, '0.0.0.0', 10100,
+                                      reuse_address=False, reuse_port=True)
+        self.assertRaises(ValueError, self.loop.run_until_complete, fut)
+        self.assertTrue(m_sock.close.called)
+
+    @unittest.mock.patch('asyncio.base_events.socket')
+    def test_create_server_reuse_port_unsupported(self, m_socket):
+        del m_socket.SO_REUSEPORT
+
+        fut = self.loop.create_server(MyProto, '0.0.0.0', 10100,
+                                      reuse_port=True)
+        self.assertRaises(ValueError, self.loop.run_until_complete, fut)
+        self.assertFalse(m_socket.socket.called)
+
     @unittest.mock.patch('asyncio.base_events.socket')
     def test_create_datagram_endpoint_no_addrinfo(self, m_socket):
         m_socket.getaddrinfo.return_value = []
@@ -677,7 +852,100 @@ class BaseEventLoopWithSelectorTests(unittest.TestCase):
         self.loop.call_later.assert_called_with(constants.ACCEPT_RETRY_DELAY,
                                                 # self.loop._start_serving
                                                 unittest.mock.ANY,
-                                                MyProto, sock, None, None)
+                                                MyProto, sock, None, None,
+                                                100)
+
+    def test_accept_connection_multiple(self):
+        sock = unittest.mock.Mock()
+        conns = [unittest.mock.Mock() for i in range(3)]
+        sock.accept.side_effect = (
+            [(conn, ('127.0.0.1', 1000 + i)) for i, conn in enumerate(conns)]
+            + [BlockingIOError()])
+        self.loop._make_socket_transport = unittest.mock.Mock()
+
+        self.loop._accept_connection(MyProto, sock)
+        self.assertEqual(4, sock.accept.call_count)
+        self.assertEqual(3, self.loop._make_socket_transport.call_count)
+        for conn in conns:
+            conn.setblocking.assert_called_with(False)
+
+    def test_accept_connection_backlog(self):
+        # No more than backlog connections are accepted per call.
+        sock = unittest.mock.Mock()
+        sock.accept.return_value = (unittest.mock.Mock(), ('127.0.0.1', 1))
+        self.loop._make_socket_transport = unittest.mock.Mock()
+
+        self.loop._accept_connection(MyProto, sock, backlog=5)
+        self.assertEqual(5, sock.accept.call_count)
+        self.assertEqual(5, self.loop._make_socket_transport.call_count)
+
+    def test_accept_connection_max_connections(self):
+        sock = unittest.mock.Mock()
+        sock.fileno.return_value = 10
+        sock.accept.return_value = (unittest.mock.Mock(), ('127.0.0.1', 1))
+        server = base_events.Server(self.loop, [sock], max_connections=2)
+        server._serving_args = (MyProto, None, 100)
+        self.loop.remove_reader = unittest.mock.Mock()
+
+        def make_transport(conn, protocol, extra, server):
+            server.attach(unittest.mock.Mock())
+        self.loop._make_socket_transport = make_transport
+
+        self.loop._accept_connection(MyProto, sock, None, server)
+        self.assertEqual(2, sock.accept.call_count)
+        self.assertTrue(server._paused)
+        self.loop.remove_reader.assert_called_with(10)
+
+
+class ServerTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = unittest.mock.Mock()
+        self.socks = [unittest.mock.Mock(), unittest.mock.Mock()]
+
+    def test_start_serving(self):
+        server = base_events.Server(self.loop, self.socks)
+        server._start_serving(MyProto, None, 50)
+        self.loop._start_serving.assert_has_calls([
+            unittest.mock.call(MyProto, sock, None, server, 50)
+            for sock in self.socks])
+
+    def test_max_connections(self):
+        server = base_events.Server(self.loop, self.socks, max_connections=2)
+        server._start_serving(MyProto, None, 50)
+        self.loop._start_serving.reset_mock()
+
+        server.attach(unittest.mock.Mock())
+        self.assertFalse(server._paused)
+        self.assertFalse(self.loop._pause_serving.called)
+
+        server.attach(unittest.mock.Mock())
+        self.assertTrue(server._paused)
+        self.loop._pause_serving.assert_has_calls([
+            unittest.mock.call(sock) for sock in self.socks])
+
+        server.detach(unittest.mock.Mock())
+        self.assertFalse(server._paused)
+        self.loop._start_serving.assert_has_calls([
+            unittest.mock.call(MyProto, sock, None, server, 50)
+            for sock in self.socks])
+
+        self.loop._start_serving.reset_mock()
+        server.detach(unittest.mock.Mock())
+        self.assertFalse(self.loop._start_serving.called)
+
+    def test_max_connections_closed(self):
+        # A closed server does not resume serving.
+        server = base_events.Server(self.loop, self.socks, max_connections=1)
+        server._start_serving(MyProto, None, 50)
+        self.loop._start_serving.reset_mock()
+
+        server.attach(unittest.mock.Mock())
+        self.assertTrue(server._paused)
+        server.close()
+        server.detach(unittest.mock.Mock())
+        self.assertFalse(self.loop._start_serving.called)
+        self.assertIsNone(server.waiters)
 
 
 if __name__ == '__main__':
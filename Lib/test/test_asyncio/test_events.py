@@ -77,6 +77,19 @@ class MyProto(protocols.Protocol):
             self.done.set_result(None)
 
 
+class MySendfileProto(protocols.Protocol):
+
+    def __init__(self, loop):
+        self.data = bytearray()
+        self.done = futures.Future(loop=loop)
+
+    def data_received(self, data):
+        self.data.extend(data)
+
+    def connection_lost(self, exc):
+        self.done.set_result(None)
+
+
 class MyDatagramProto(protocols.DatagramProtocol):
     done = None
 
@@ -604,6 +617,108 @@ class EventLoopTestsMixin:
         # close server
         server.close()
 
+    def _make_sendfile_connection(self):
+        srv_proto = MySendfileProto(loop=self.loop)
+        f = self.loop.create_server(lambda: srv_proto, '127.0.0.1', 0)
+        server = self.loop.run_until_complete(f)
+        port = server.sockets[0].getsockname()[1]
+        f = self.loop.create_connection(protocols.Protocol, '127.0.0.1', port)
+        transport, _ = self.loop.run_until_complete(f)
+
+        def cleanup():
+            transport.close()
+            self.loop.run_until_complete(srv_proto.done)
+            server.close()
+            self.loop.run_until_complete(server.wait_closed())
+        return transport, srv_proto, cleanup
+
+    def _make_sendfile_data(self, size=1024 * 1024 + 17):
+        data = bytes(range(256)) * (size // 256) + b'x' * (size % 256)
+        fp = open(support.TESTFN, 'wb+')
+        self.addCleanup(support.unlink, support.TESTFN)
+        self.addCleanup(fp.close)
+        fp.write(data)
+        fp.seek(0)
+        return data, fp
+
+    def test_sendfile(self):
+        data, fp = self._make_sendfile_data()
+        transport, srv_proto, cleanup = self._make_sendfile_connection()
+        transport.write(b'head')
+        ret = self.loop.run_until_complete(self.loop.sendfile(transport, fp))
+        transport.write(b'tail')
+        cleanup()
+        self.assertEqual(ret, len(data))
+        self.assertEqual(fp.tell(), len(data))
+        self.assertEqual(bytes(srv_proto.data), b'head' + data + b'tail')
+
+    def test_sendfile_offset_and_count(self):
+        data, fp = self._make_sendfile_data()
+        transport, srv_proto, cleanup = self._make_sendfile_connection()
+        ret = self.loop.run_until_complete(
+            self.loop.sendfile(transport, fp, 1000, 100000))
+        cleanup()
+        self.assertEqual(ret, 100000)
+        self.assertEqual(fp.tell(), 101000)
+        self.assertEqual(bytes(srv_proto.data), data[1000:101000])
+
+    def test_sendfile_fallback(self):
+        data, fp = self._make_sendfile_data()
+        transport, srv_proto, cleanup = self._make_sendfile_connection()
+        protocol = transport._protocol
+
+        @tasks.coroutine
+        def sendfile_native(transp, file, offset, count):
+            raise events.SendfileNotAvailableError("not supported")
+
+        self.loop._sendfile_native = sendfile_native
+        # small write buffer limits make the fallback wait for the
+        # transport to drain
+        transport.set_write_buffer_limits(high=4096)
+        ret = self.loop.run_until_complete(
+            self.loop.sendfile(transport, fp, 10))
+        self.assertIs(transport._protocol, protocol)
+        cleanup()
+        self.assertEqual(ret, len(data) - 10)
+        self.assertEqual(fp.tell(), len(data))
+        self.assertEqual(bytes(srv_proto.data), data[10:])
+
+    def test_sendfile_no_fallback(self):
+        data, fp = self._make_sendfile_data()
+        transport, srv_proto, cleanup = self._make_sendfile_connection()
+
+        @tasks.coroutine
+        def sendfile_native(transp, file, offset, count):
+            raise events.SendfileNotAvailableError("not supported")
+
+        self.loop._sendfile_native = sendfile_native
+        with self.assertRaises(events.SendfileNotAvailableError):
+            self.loop.run_until_complete(
+                self.loop.sendfile(transport, fp, fallback=False))
+        cleanup()
+        self.assertEqual(fp.tell(), 0)
+        self.assertEqual(srv_proto.data, b'')
+
+    def test_sendfile_invalid_params(self):
+        data, fp = self._make_sendfile_data(10)
+        transport, srv_proto, cleanup = self._make_sendfile_connection()
+        try:
+            with self.assertRaises(ValueError):
+                self.loop.run_until_complete(
+                    self.loop.sendfile(transport, fp, -1))
+            with self.assertRaises(TypeError):
+                self.loop.run_until_complete(
+                    self.loop.sendfile(transport, fp, 0, 1.5))
+            with self.assertRaises(ValueError):
+                self.loop.run_until_complete(
+                    self.loop.sendfile(transport, fp, 0, 0))
+            with open(support.TESTFN, 'r') as textfile:
+                with self.assertRaises(ValueError):
+                    self.loop.run_until_complete(
+                        self.loop.sendfile(transport, textfile))
+        finally:
+            cleanup()
+
     def _make_ssl_server(self, factory, certfile, keyfile=None):
         sslcontext = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
         sslcontext.options |= ssl.OP_NO_SSLv2
@@ -794,6 +909,57 @@ class EventLoopTestsMixin:
 
         server.close()
 
+    def test_create_server_max_connections(self):
+        protos = []
+
+        def factory():
+            proto = MyProto(loop=self.loop)
+            protos.append(proto)
+            return proto
+
+        f = self.loop.create_server(factory, '127.0.0.1', 0,
+                                    max_connections=1)
+        server = self.loop.run_until_complete(f)
+        port = server.sockets[0].getsockname()[1]
+
+        client1 = socket.socket()
+        client1.connect(('127.0.0.1', port))
+        test_utils.run_until(self.loop, lambda: protos)
+        self.assertEqual(1, len(protos))
+
+        # The second connection waits in the listen queue.
+        client2 = socket.socket()
+        client2.connect(('127.0.0.1', port))
+        test_utils.run_briefly(self.loop)
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(1, len(protos))
+
+        client1.close()
+        test_utils.run_until(self.loop, lambda: len(protos) == 2)
+        self.assertEqual('CONNECTED', protos[1].state)
+
+        client2.close()
+        test_utils.run_until(self.loop, lambda: protos[1].state == 'CLOSED')
+        server.close()
+
+    @unittest.skipUnless(hasattr(socket, 'SO_REUSEPORT'),
+                         'SO_REUSEPORT required')
+    def test_create_server_reuse_port(self):
+        f = self.loop.create_server(MyProto, '127.0.0.1', 0, reuse_port=True)
+        server = self.loop.run_until_complete(f)
+        sock = server.sockets[0]
+        self.assertTrue(sock.getsockopt(socket.SOL_SOCKET,
+                                        socket.SO_REUSEPORT))
+        host, port = sock.getsockname()
+
+        # A second endpoint can be bound to the same port.
+        f = self.loop.create_server(MyProto, host, port, reuse_port=True)
+        server2 = self.loop.run_until_complete(f)
+        self.assertEqual(port, server2.sockets[0].getsockname()[1])
+
+        server2.close()
+        server.close()
+
     @unittest.skipUnless(support.IPV6_ENABLED, 'IPv6 not supported or enabled')
     def test_create_server_dual_stack(self):
         f_proto = futures.Future(loop=self.loop)
@@ -1407,6 +1573,10 @@ if sys.platform == 'win32':
         def test_create_server_ssl_verified(self):
             raise unittest.SkipTest("IocpEventLoop incompatible with SSL")
 
+        def test_create_server_max_connections(self):
+            raise unittest.SkipTest(
+                "IocpEventLoop does not support max_connections")
+
         def test_reader_callback(self):
             raise unittest.SkipTest("IocpEventLoop does not have add_reader()")
 
@@ -1586,6 +1756,105 @@ class TimerTests(unittest.TestCase):
         self.assertIs(NotImplemented, h1.__ne__(h3))
 
 
+class LoopStatsTests(unittest.TestCase):
+
+    def test_record(self):
+        stats = events.LoopStats(slow_callback_duration=0.05)
+        stats._record_select(0.5)
+        stats._record_select(0.25)
+        stats._record_queues(3, 10)
+        stats._record_queues(1, 12)
+        for duration in (0.00001, 0.002, 0.002, 0.06, 5.0):
+            stats._record_callback(events.Handle(print, ()), duration)
+
+        self.assertEqual(2, stats.iterations)
+        self.assertEqual(0.75, stats.select_time)
+        self.assertEqual(0.5, stats.max_select_time)
+        self.assertEqual(1, stats.ready_depth)
+        self.assertEqual(3, stats.max_ready_depth)
+        self.assertEqual(3, stats.max_callbacks_per_iteration)
+        self.assertEqual(12, stats.scheduled_depth)
+        self.assertEqual(12, stats.max_scheduled_depth)
+        self.assertEqual(5, stats.callbacks)
+        self.assertAlmostEqual(5.06401, stats.callback_time)
+        self.assertEqual(5.0, stats.max_callback_time)
+        self.assertEqual([1, 0, 2, 1, 0, 1], stats.callback_histogram)
+        self.assertEqual(2, stats.slow_callback_count)
+        self.assertEqual([(0.06, print, None), (5.0, print, None)],
+                         list(stats.slow_callbacks))
+
+        d = stats.as_dict()
+        self.assertEqual(5, d['callbacks'])
+        self.assertEqual((float('inf'), 1), d['callback_histogram'][-1])
+
+        stats.reset()
+        self.assertEqual(0, stats.callbacks)
+        self.assertEqual([0] * 6, stats.callback_histogram)
+        self.assertEqual(0, len(stats.slow_callbacks))
+
+    def test_max_slow_callbacks(self):
+        stats = events.LoopStats(slow_callback_duration=0,
+                                 max_slow_callbacks=2)
+        for duration in (1.0, 2.0, 3.0):
+            stats._record_callback(events.Handle(print, ()), duration)
+        self.assertEqual(3, stats.slow_callback_count)
+        self.assertEqual([2.0, 3.0],
+                         [entry[0] for entry in stats.slow_callbacks])
+
+    def test_callback_source(self):
+        def callback():
+            pass
+        code = callback.__code__
+        source = (code.co_filename, code.co_firstlineno)
+        self.assertEqual(source, events._callback_source(callback))
+        self.assertEqual(source, events._callback_source(
+            functools.partial(callback)))
+
+        class Obj:
+            def method(self):
+                pass
+        code = Obj.method.__code__
+        self.assertEqual((code.co_filename, code.co_firstlineno),
+                         events._callback_source(Obj().method))
+
+        self.assertIsNone(events._callback_source(print))
+
+    def test_loop_stats(self):
+        loop = events.new_event_loop()
+        self.addCleanup(loop.close)
+        self.assertIsNone(loop.get_stats())
+        self.assertRaises(TypeError, loop.set_stats, {})
+
+        stats = events.LoopStats(slow_callback_duration=0.01)
+        loop.set_stats(stats)
+        self.assertIs(stats, loop.get_stats())
+
+        def slow():
+            time.sleep(0.02)
+
+        @tasks.coroutine
+        def coro():
+            loop.call_soon(slow)
+            loop.call_soon(lambda: None)
+            yield from tasks.sleep(0.01, loop=loop)
+
+        loop.run_until_complete(coro())
+        self.assertGreater(stats.iterations, 0)
+        self.assertGreaterEqual(stats.callbacks, 3)
+        self.assertGreaterEqual(stats.max_ready_depth, 2)
+        self.assertGreater(stats.select_time, 0)
+        self.assertEqual(stats.callbacks, sum(stats.callback_histogram))
+        duration, callback, source = stats.slow_callbacks[0]
+        self.assertIs(slow, callback)
+        self.assertGreaterEqual(duration, 0.01)
+        self.assertEqual(slow.__code__.co_firstlineno, source[1])
+
+        loop.set_stats(None)
+        callbacks = stats.callbacks
+        loop.run_until_complete(tasks.sleep(0, loop=loop))
+        self.assertEqual(callbacks, stats.callbacks)
+
+
 class AbstractEventLoopTests(unittest.TestCase):
 
     def test_not_implemented(self):
@@ -1599,6 +1868,10 @@ class AbstractEventLoopTests(unittest.TestCase):
             NotImplementedError, loop.stop)
         self.assertRaises(
             NotImplementedError, loop.is_running)
+        self.assertRaises(
+            NotImplementedError, loop.get_stats)
+        self.assertRaises(
+            NotImplementedError, loop.set_stats, None)
         self.assertRaises(
             NotImplementedError, loop.close)
         self.assertRaises(
@@ -1609,6 +1882,12 @@ class AbstractEventLoopTests(unittest.TestCase):
             NotImplementedError, loop.call_soon, None)
         self.assertRaises(
             NotImplementedError, loop.time)
+        self.assertRaises(
+            NotImplementedError, loop.create_task, None)
+        self.assertRaises(
+            NotImplementedError, loop.set_task_factory, None)
+        self.assertRaises(
+            NotImplementedError, loop.get_task_factory)
         self.assertRaises(
             NotImplementedError, loop.call_soon_threadsafe, None)
         self.assertRaises(
@@ -1625,6 +1904,8 @@ class AbstractEventLoopTests(unittest.TestCase):
             NotImplementedError, loop.create_server, f)
         self.assertRaises(
             NotImplementedError, loop.create_datagram_endpoint, f)
+        self.assertRaises(
+            NotImplementedError, loop.sendfile, f, f)
         self.assertRaises(
             NotImplementedError, loop.add_reader, 1, f)
         self.assertRaises(
@@ -473,6 +473,14 @@ class BaseProactorEventLoopTests(unittest.TestCase):
         loop(fut)
         self.assertTrue(self.sock.close.called)
 
+    @unittest.mock.patch('asyncio.base_events.socket')
+    def test_create_server_max_connections(self, m_socket):
+        coro = self.loop.create_server(unittest.mock.Mock(), '0.0.0.0', 0,
+                                       max_connections=1)
+        self.assertRaises(ValueError, next, coro)
+        # No socket was created, so none is leaked.
+        self.assertFalse(m_socket.socket.called)
+
     def test_stop_serving(self):
         sock = unittest.mock.Mock()
         self.loop._stop_serving(sock)
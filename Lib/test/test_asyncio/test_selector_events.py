@@ -16,7 +16,7 @@ except ImportError:
 from asyncio import futures
 from asyncio import selectors
 from asyncio import test_utils
-from asyncio.protocols import DatagramProtocol, Protocol
+from asyncio.protocols import BufferedProtocol, DatagramProtocol, Protocol
 from asyncio.selector_events import BaseSelectorEventLoop
 from asyncio.selector_events import _SelectorTransport
 from asyncio.selector_events import _SelectorSslTransport
@@ -1032,6 +1032,129 @@ class SelectorSocketTransportTests(unittest.TestCase):
         tr.close()
 
 
+class SelectorSocketTransportBufferedProtocolTests(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = test_utils.TestLoop()
+        self.protocol = test_utils.make_test_protocol(BufferedProtocol)
+        self.buf = bytearray(50)
+        self.protocol.get_buffer.side_effect = lambda hint: self.buf
+        self.sock = unittest.mock.Mock(socket.socket)
+        self.sock_fd = self.sock.fileno.return_value = 7
+
+    def test_ctor(self):
+        tr = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        self.loop.assert_reader(7, tr._read_ready)
+        test_utils.run_briefly(self.loop)
+        self.protocol.connection_made.assert_called_with(tr)
+
+    def test_set_protocol(self):
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        protocol = test_utils.make_test_protocol(Protocol)
+        transport.set_protocol(protocol)
+        self.assertIs(transport.get_protocol(), protocol)
+
+        self.sock.recv.return_value = b'data'
+        transport._read_ready()
+        protocol.data_received.assert_called_with(b'data')
+        self.assertFalse(self.protocol.get_buffer.called)
+
+        transport.set_protocol(self.protocol)
+        self.sock.recv_into.return_value = 4
+        transport._read_ready()
+        self.sock.recv_into.assert_called_with(self.buf)
+        self.protocol.buffer_updated.assert_called_with(4)
+
+    def test_read_ready(self):
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+
+        def recv_into(buf):
+            buf[:4] = b'data'
+            return 4
+        self.sock.recv_into.side_effect = recv_into
+        transport._read_ready()
+
+        self.protocol.get_buffer.assert_called_with(transport.max_size)
+        self.sock.recv_into.assert_called_with(self.buf)
+        self.protocol.buffer_updated.assert_called_with(4)
+        self.assertEqual(self.buf[:4], b'data')
+        self.assertFalse(self.sock.recv.called)
+
+    def test_read_ready_eof(self):
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport.close = unittest.mock.Mock()
+
+        self.sock.recv_into.return_value = 0
+        transport._read_ready()
+
+        self.assertFalse(self.protocol.buffer_updated.called)
+        self.protocol.eof_received.assert_called_with()
+        transport.close.assert_called_with()
+
+    def test_read_ready_eof_keep_open(self):
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport.close = unittest.mock.Mock()
+
+        self.sock.recv_into.return_value = 0
+        self.protocol.eof_received.return_value = True
+        transport._read_ready()
+
+        self.protocol.eof_received.assert_called_with()
+        self.assertFalse(transport.close.called)
+
+    def test_read_ready_empty_buffer(self):
+        self.protocol.get_buffer.side_effect = lambda hint: bytearray()
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport._fatal_error = unittest.mock.Mock()
+        transport._read_ready()
+
+        self.assertTrue(transport._fatal_error.called)
+        exc = transport._fatal_error.call_args[0][0]
+        self.assertIsInstance(exc, RuntimeError)
+        self.assertFalse(self.sock.recv_into.called)
+
+    def test_read_ready_get_buffer_err(self):
+        err = self.protocol.get_buffer.side_effect = MemoryError()
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport._fatal_error = unittest.mock.Mock()
+        transport._read_ready()
+
+        transport._fatal_error.assert_called_with(err)
+        self.assertFalse(self.sock.recv_into.called)
+        self.assertFalse(self.protocol.buffer_updated.called)
+
+    @unittest.mock.patch('logging.exception')
+    def test_read_ready_tryagain(self, m_exc):
+        self.sock.recv_into.side_effect = BlockingIOError
+
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport._fatal_error = unittest.mock.Mock()
+        transport._read_ready()
+
+        self.assertFalse(transport._fatal_error.called)
+        self.assertFalse(self.protocol.buffer_updated.called)
+
+    @unittest.mock.patch('logging.exception')
+    def test_read_ready_err(self, m_exc):
+        err = self.sock.recv_into.side_effect = OSError()
+
+        transport = _SelectorSocketTransport(
+            self.loop, self.sock, self.protocol)
+        transport._fatal_error = unittest.mock.Mock()
+        transport._read_ready()
+
+        transport._fatal_error.assert_called_with(err)
+        self.assertFalse(self.protocol.buffer_updated.called)
+
+
 @unittest.skipIf(ssl is None, 'No ssl module')
 class SelectorSslTransportTests(unittest.TestCase):
 
@@ -9,6 +9,7 @@ except ImportError:
     ssl = None
 
 from asyncio import events
+from asyncio import protocols
 from asyncio import streams
 from asyncio import tasks
 from asyncio import test_utils
@@ -81,13 +82,13 @@ class StreamReaderTests(unittest.TestCase):
         stream = streams.StreamReader(loop=self.loop)
 
         stream.feed_data(b'')
-        self.assertEqual(0, stream._byte_count)
+        self.assertEqual(0, len(stream._buffer))
 
     def test_feed_data_byte_count(self):
         stream = streams.StreamReader(loop=self.loop)
 
         stream.feed_data(self.DATA)
-        self.assertEqual(len(self.DATA), stream._byte_count)
+        self.assertEqual(len(self.DATA), len(stream._buffer))
 
     def test_read_zero(self):
         # Read zero bytes.
@@ -96,7 +97,7 @@ class StreamReaderTests(unittest.TestCase):
 
         data = self.loop.run_until_complete(stream.read(0))
         self.assertEqual(b'', data)
-        self.assertEqual(len(self.DATA), stream._byte_count)
+        self.assertEqual(len(self.DATA), len(stream._buffer))
 
     def test_read(self):
         # Read bytes.
@@ -109,7 +110,7 @@ class StreamReaderTests(unittest.TestCase):
 
         data = self.loop.run_until_complete(read_task)
         self.assertEqual(self.DATA, data)
-        self.assertFalse(stream._byte_count)
+        self.assertFalse(len(stream._buffer))
 
     def test_read_line_breaks(self):
         # Read bytes without line breaks.
@@ -120,7 +121,7 @@ class StreamReaderTests(unittest.TestCase):
         data = self.loop.run_until_complete(stream.read(5))
 
         self.assertEqual(b'line1', data)
-        self.assertEqual(5, stream._byte_count)
+        self.assertEqual(5, len(stream._buffer))
 
     def test_read_eof(self):
         # Read bytes, stop at eof.
@@ -133,7 +134,7 @@ class StreamReaderTests(unittest.TestCase):
 
         data = self.loop.run_until_complete(read_task)
         self.assertEqual(b'', data)
-        self.assertFalse(stream._byte_count)
+        self.assertFalse(len(stream._buffer))
 
     def test_read_until_eof(self):
         # Read all bytes until eof.
@@ -149,7 +150,7 @@ class StreamReaderTests(unittest.TestCase):
         data = self.loop.run_until_complete(read_task)
 
         self.assertEqual(b'chunk1\nchunk2', data)
-        self.assertFalse(stream._byte_count)
+        self.assertFalse(len(stream._buffer))
 
     def test_read_exception(self):
         stream = streams.StreamReader(loop=self.loop)
@@ -176,7 +177,7 @@ class StreamReaderTests(unittest.TestCase):
 
         line = self.loop.run_until_complete(read_task)
         self.assertEqual(b'chunk1 chunk2 chunk3 \n', line)
-        self.assertEqual(len(b'\n chunk4')-1, stream._byte_count)
+        self.assertEqual(len(b'\n chunk4')-1, len(stream._buffer))
 
     def test_readline_limit_with_existing_data(self):
         stream = streams.StreamReader(3, loop=self.loop)
@@ -185,17 +186,18 @@ class StreamReaderTests(unittest.TestCase):
 
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readline())
-        self.assertEqual([b'line2\n'], list(stream._buffer))
+        self.assertEqual(b'line2\n', stream._buffer)
 
         stream = streams.StreamReader(3, loop=self.loop)
         stream.feed_data(b'li')
         stream.feed_data(b'ne1')
         stream.feed_data(b'li')
 
+        # No b'\n' in the buffer: readline() consumes all of it before
+        # waiting for more data, finds the line too long and raises.
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readline())
-        self.assertEqual([b'li'], list(stream._buffer))
-        self.assertEqual(2, stream._byte_count)
+        self.assertEqual(b'', stream._buffer)
 
     def test_readline_limit(self):
         stream = streams.StreamReader(7, loop=self.loop)
@@ -207,10 +209,11 @@ class StreamReaderTests(unittest.TestCase):
             stream.feed_eof()
         self.loop.call_soon(cb)
 
+        # The buffer held a single line, which is consumed by the
+        # failed readline().
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readline())
-        self.assertEqual([b'chunk3\n'], list(stream._buffer))
-        self.assertEqual(7, stream._byte_count)
+        self.assertEqual(b'', stream._buffer)
 
     def test_readline_line_byte_count(self):
         stream = streams.StreamReader(loop=self.loop)
@@ -220,7 +223,7 @@ class StreamReaderTests(unittest.TestCase):
         line = self.loop.run_until_complete(stream.readline())
 
         self.assertEqual(b'line1\n', line)
-        self.assertEqual(len(self.DATA) - len(b'line1\n'), stream._byte_count)
+        self.assertEqual(len(self.DATA) - len(b'line1\n'), len(stream._buffer))
 
     def test_readline_eof(self):
         stream = streams.StreamReader(loop=self.loop)
@@ -248,7 +251,7 @@ class StreamReaderTests(unittest.TestCase):
         self.assertEqual(b'line2\nl', data)
         self.assertEqual(
             len(self.DATA) - len(b'line1\n') - len(b'line2\nl'),
-            stream._byte_count)
+            len(stream._buffer))
 
     def test_readline_exception(self):
         stream = streams.StreamReader(loop=self.loop)
@@ -261,6 +264,171 @@ class StreamReaderTests(unittest.TestCase):
         self.assertRaises(
             ValueError, self.loop.run_until_complete, stream.readline())
 
+    def test_readuntil_separator(self):
+        stream = streams.StreamReader(loop=self.loop)
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(stream.readuntil(b''))
+
+    def test_readuntil_multi_chunk(self):
+        stream = streams.StreamReader(loop=self.loop)
+
+        stream.feed_data(b'lineAAA')
+        data = self.loop.run_until_complete(stream.readuntil(b'AAA'))
+        self.assertEqual(b'lineAAA', data)
+        self.assertEqual(b'', stream._buffer)
+
+        stream.feed_data(b'lineAAA')
+        data = self.loop.run_until_complete(stream.readuntil(b'AAA'))
+        self.assertEqual(b'lineAAA', data)
+        self.assertEqual(b'', stream._buffer)
+
+        stream.feed_data(b'lineAAAxxx')
+        data = self.loop.run_until_complete(stream.readuntil(b'AAA'))
+        self.assertEqual(b'lineAAA', data)
+        self.assertEqual(b'xxx', stream._buffer)
+
+    def test_readuntil_split_separator(self):
+        # The separator arrives across several chunks.
+        stream = streams.StreamReader(loop=self.loop)
+        read_task = tasks.Task(stream.readuntil(b'\r\n\r\n'),
+                               loop=self.loop)
+
+        def cb():
+            stream.feed_data(b'GET / HTTP/1.0\r')
+            stream.feed_data(b'\nHost: x\r\n')
+            stream.feed_data(b'\r')
+            stream.feed_data(b'\nbody')
+        self.loop.call_soon(cb)
+
+        data = self.loop.run_until_complete(read_task)
+        self.assertEqual(b'GET / HTTP/1.0\r\nHost: x\r\n\r\n', data)
+        self.assertEqual(b'body', stream._buffer)
+
+    def test_readuntil_eof(self):
+        stream = streams.StreamReader(loop=self.loop)
+        stream.feed_data(b'some dataAA')
+        stream.feed_eof()
+
+        with self.assertRaises(streams.IncompleteReadError) as cm:
+            self.loop.run_until_complete(stream.readuntil(b'AAA'))
+        self.assertEqual(cm.exception.partial, b'some dataAA')
+        self.assertIsNone(cm.exception.expected)
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readuntil_limit_found_sep(self):
+        stream = streams.StreamReader(loop=self.loop, limit=3)
+        stream.feed_data(b'some dataAA')
+
+        with self.assertRaises(streams.LimitOverrunError) as cm:
+            self.loop.run_until_complete(stream.readuntil(b'AAA'))
+        self.assertEqual(b'some dataAA', stream._buffer)
+
+        stream.feed_data(b'A')
+        with self.assertRaises(streams.LimitOverrunError) as cm:
+            self.loop.run_until_complete(stream.readuntil(b'AAA'))
+        self.assertEqual(9, cm.exception.consumed)
+        self.assertEqual(b'some dataAAA', stream._buffer)
+
+    def test_readuntil_limit_waiting(self):
+        # The limit is enforced while waiting for more data.
+        stream = streams.StreamReader(loop=self.loop, limit=5)
+        read_task = tasks.Task(stream.readuntil(b'\0'), loop=self.loop)
+
+        def cb():
+            stream.feed_data(b'abc')
+            stream.feed_data(b'defg')
+        self.loop.call_soon(cb)
+
+        with self.assertRaises(streams.LimitOverrunError) as cm:
+            self.loop.run_until_complete(read_task)
+        self.assertEqual(7, cm.exception.consumed)
+        self.assertEqual(b'abcdefg', stream._buffer)
+
+    def test_readframe(self):
+        stream = streams.StreamReader(loop=self.loop)
+        read_task = tasks.Task(stream.readframe(), loop=self.loop)
+
+        def cb():
+            stream.feed_data(b'\0\0')
+            stream.feed_data(b'\0\x05he')
+            stream.feed_data(b'llo\0\0\0\0\0\x01!')
+        self.loop.call_soon(cb)
+
+        self.assertEqual(b'hello', self.loop.run_until_complete(read_task))
+        self.assertEqual(b'', self.loop.run_until_complete(stream.readframe()))
+        data = self.loop.run_until_complete(stream.readframe('!H'))
+        self.assertEqual(b'!', data)
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readframe_header_format(self):
+        stream = streams.StreamReader(loop=self.loop)
+        stream.feed_data(b'\x07\x03\x00abcd')
+        data = self.loop.run_until_complete(stream.readframe('<BH'))
+        self.assertEqual(b'abc', data)
+        self.assertEqual(b'd', stream._buffer)
+
+    def test_readframe_max_size(self):
+        stream = streams.StreamReader(loop=self.loop)
+        stream.feed_data(b'\0\0\0\x05hello')
+
+        with self.assertRaises(streams.LimitOverrunError) as cm:
+            self.loop.run_until_complete(stream.readframe(max_size=4))
+        self.assertEqual(9, cm.exception.consumed)
+        self.assertEqual(b'\0\0\0\x05hello', stream._buffer)
+
+        data = self.loop.run_until_complete(stream.readframe(max_size=5))
+        self.assertEqual(b'hello', data)
+
+    def test_readframe_negative_length(self):
+        stream = streams.StreamReader(loop=self.loop)
+        stream.feed_data(b'\xff\xff\xff\xffdata')
+
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(stream.readframe('!i'))
+        self.assertEqual(b'\xff\xff\xff\xffdata', stream._buffer)
+
+    def test_readframe_eof(self):
+        stream = streams.StreamReader(loop=self.loop)
+        stream.feed_data(b'\0\0\0\x05hel')
+        stream.feed_eof()
+
+        with self.assertRaises(streams.IncompleteReadError) as cm:
+            self.loop.run_until_complete(stream.readframe())
+        self.assertEqual(b'\0\0\0\x05hel', cm.exception.partial)
+        self.assertEqual(9, cm.exception.expected)
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readframe_exception(self):
+        stream = streams.StreamReader(loop=self.loop)
+        stream.feed_data(b'\0\0')
+
+        @tasks.coroutine
+        def set_err():
+            stream.set_exception(ValueError())
+
+        t1 = tasks.Task(stream.readframe(), loop=self.loop)
+        t2 = tasks.Task(set_err(), loop=self.loop)
+        self.loop.run_until_complete(tasks.wait([t1, t2], loop=self.loop))
+        self.assertRaises(ValueError, t1.result)
+
+    def test_read_resumes_paused_transport(self):
+        # Waiting for more data than the buffer limit does not deadlock.
+        stream = streams.StreamReader(limit=1, loop=self.loop)
+        transport = unittest.mock.Mock()
+        stream.set_transport(transport)
+        read_task = tasks.Task(stream.readexactly(5), loop=self.loop)
+
+        def cb():
+            stream.feed_data(b'123')
+            transport.pause_reading.assert_called_with()
+        self.loop.call_soon(cb)
+        test_utils.run_briefly(self.loop)
+        test_utils.run_briefly(self.loop)
+        transport.resume_reading.assert_called_with()
+
+        stream.feed_data(b'45')
+        self.assertEqual(b'12345', self.loop.run_until_complete(read_task))
+
     def test_readexactly_zero_or_less(self):
         # Read exact number of bytes (zero or less).
         stream = streams.StreamReader(loop=self.loop)
@@ -268,11 +436,11 @@ class StreamReaderTests(unittest.TestCase):
 
         data = self.loop.run_until_complete(stream.readexactly(0))
         self.assertEqual(b'', data)
-        self.assertEqual(len(self.DATA), stream._byte_count)
+        self.assertEqual(len(self.DATA), len(stream._buffer))
 
         data = self.loop.run_until_complete(stream.readexactly(-1))
         self.assertEqual(b'', data)
-        self.assertEqual(len(self.DATA), stream._byte_count)
+        self.assertEqual(len(self.DATA), len(stream._buffer))
 
     def test_readexactly(self):
         # Read exact number of bytes.
@@ -289,7 +457,7 @@ class StreamReaderTests(unittest.TestCase):
 
         data = self.loop.run_until_complete(read_task)
         self.assertEqual(self.DATA + self.DATA, data)
-        self.assertEqual(len(self.DATA), stream._byte_count)
+        self.assertEqual(len(self.DATA), len(stream._buffer))
 
     def test_readexactly_eof(self):
         # Read exact number of bytes (eof).
@@ -304,7 +472,7 @@ class StreamReaderTests(unittest.TestCase):
 
         data = self.loop.run_until_complete(read_task)
         self.assertEqual(self.DATA, data)
-        self.assertFalse(stream._byte_count)
+        self.assertFalse(len(stream._buffer))
 
     def test_readexactly_exception(self):
         stream = streams.StreamReader(loop=self.loop)
@@ -359,6 +527,111 @@ class StreamReaderTests(unittest.TestCase):
         test_utils.run_briefly(self.loop)
         self.assertIs(stream._waiter, None)
 
+    def test_get_buffer(self):
+        stream = streams.StreamReader(loop=self.loop)
+        stream.feed_data(b'line1\n')
+
+        buf = stream._get_buffer(10)
+        self.assertEqual(10, len(buf))
+        buf[:6] = b'line2\n'
+        del buf
+        stream._buffer_updated(6)
+        self.assertEqual(b'line1\nline2\n', stream._buffer)
+
+        buf = stream._get_buffer(-1)
+        self.assertEqual(stream._limit, len(buf))
+        buf[:4] = b'last'
+        del buf
+        stream._buffer_updated(4)
+        self.assertEqual(b'line1\nline2\nlast', stream._buffer)
+
+    def test_get_buffer_wakes_reader(self):
+        stream = streams.StreamReader(loop=self.loop)
+        read_task = tasks.Task(stream.readline(), loop=self.loop)
+
+        def cb():
+            buf = stream._get_buffer(100)
+            buf[:6] = b'line1\n'
+            stream._buffer_updated(6)
+        self.loop.call_soon(cb)
+
+        line = self.loop.run_until_complete(read_task)
+        self.assertEqual(b'line1\n', line)
+        self.assertEqual(b'', stream._buffer)
+
+    def test_get_buffer_not_updated(self):
+        # What the transport writes into the space handed out by
+        # _get_buffer() only counts as data once _buffer_updated() is
+        # called, and the receive buffer is reused from one call to the
+        # next.
+        stream = streams.StreamReader(loop=self.loop)
+        stream.feed_data(b'data')
+        buf = stream._get_buffer(100)
+        buf[:3] = b'xyz'
+        del buf
+        recv_buffer = stream._recv_buffer
+        self.assertEqual(b'da', self.loop.run_until_complete(stream.read(2)))
+        self.assertEqual(b'ta', stream._buffer)
+
+        stream._get_buffer(50)
+        stream._get_buffer(100)
+        self.assertIs(recv_buffer, stream._recv_buffer)
+        stream.feed_data(b'!')
+        self.assertEqual(b'ta!', stream._buffer)
+
+        # The receive buffer is only replaced when it is too small.
+        buf = stream._get_buffer(200)
+        self.assertIsNot(recv_buffer, stream._recv_buffer)
+        buf[:1] = b'?'
+        stream._buffer_updated(1)
+        stream.feed_eof()
+        self.assertEqual(b'ta!?', self.loop.run_until_complete(stream.read()))
+
+    def test_get_buffer_pauses_transport(self):
+        stream = streams.StreamReader(limit=2, loop=self.loop)
+        transport = unittest.mock.Mock()
+        stream.set_transport(transport)
+
+        buf = stream._get_buffer(100)
+        self.assertEqual(2, len(buf))
+        buf[:2] = b'12'
+        stream._buffer_updated(2)
+        buf = stream._get_buffer(100)
+        buf[:2] = b'34'
+        stream._buffer_updated(2)
+        self.assertFalse(transport.pause_reading.called)
+        buf = stream._get_buffer(100)
+        buf[:1] = b'5'
+        stream._buffer_updated(1)
+        transport.pause_reading.assert_called_with()
+
+        self.assertEqual(b'123', self.loop.run_until_complete(stream.read(3)))
+        transport.resume_reading.assert_called_with()
+
+    def test_protocol_data_received(self):
+        # Transports which do not support BufferedProtocol feed the
+        # StreamReader directly.
+        stream = streams.StreamReader(loop=self.loop)
+        protocol = streams.StreamReaderProtocol(stream)
+        protocol.data_received(b'data')
+        self.assertEqual(b'data', stream._buffer)
+
+    def test_buffered_protocol_data_received(self):
+        # The BufferedProtocol fallback copies data through get_buffer()
+        # and buffer_updated(), in pieces as small as the buffers.
+        received = []
+
+        class Proto(protocols.BufferedProtocol):
+            def get_buffer(self, sizehint):
+                self.buf = bytearray(3)
+                return self.buf
+
+            def buffer_updated(self, nbytes):
+                received.append(bytes(self.buf[:nbytes]))
+
+        Proto().data_received(b'abcdefg')
+        self.assertEqual([b'abc', b'def', b'g'], received)
+
     def test_start_server(self):
 
         class MyServer:
@@ -105,6 +105,114 @@ class TaskTests(unittest.TestCase):
         with self.assertRaises(TypeError):
             tasks.async('ok')
 
+    def test_async_uses_task_factory(self):
+        @tasks.coroutine
+        def notmuch():
+            return 'ok'
+
+        created = []
+        def factory(loop, coro):
+            task = tasks.Task(coro, loop=loop)
+            created.append(task)
+            return task
+
+        self.loop.set_task_factory(factory)
+        t = tasks.async(notmuch(), loop=self.loop)
+        self.assertEqual(created, [t])
+        self.assertEqual(self.loop.run_until_complete(t), 'ok')
+
+        self.loop.set_task_factory(None)
+        t = tasks.async(notmuch(), loop=self.loop)
+        self.assertIsInstance(t, tasks.Task)
+        self.assertEqual(len(created), 1)
+        self.loop.run_until_complete(t)
+
+    def test_eager_task_factory_completes_immediately(self):
+        calls = []
+
+        @tasks.coroutine
+        def cached():
+            calls.append('cached')
+            return 'ok'
+
+        @tasks.coroutine
+        def main():
+            t = tasks.async(cached(), loop=self.loop)
+            # The coroutine ran within async() and the task is done,
+            # without a call scheduled on the loop.
+            self.assertEqual(calls, ['cached'])
+            self.assertTrue(t.done())
+            self.assertEqual(t.result(), 'ok')
+            self.assertEqual(len(self.loop._ready), 0)
+            return (yield from t)
+
+        self.loop.set_task_factory(tasks.eager_task_factory)
+        self.assertIs(self.loop.get_task_factory(), tasks.eager_task_factory)
+        # The loop is not running yet: the main task is scheduled.
+        task = tasks.async(main(), loop=self.loop)
+        self.assertEqual(calls, [])
+        self.assertFalse(task.done())
+        self.assertEqual(self.loop.run_until_complete(task), 'ok')
+
+    def test_eager_task_factory_blocks(self):
+        fut = futures.Future(loop=self.loop)
+        calls = []
+
+        @tasks.coroutine
+        def waiter():
+            calls.append('start')
+            res = yield from fut
+            calls.append('end')
+            return res
+
+        @tasks.coroutine
+        def main():
+            t = self.loop.create_task(waiter())
+            self.assertEqual(calls, ['start'])
+            self.assertFalse(t.done())
+            self.assertIs(t._fut_waiter, fut)
+            fut.set_result(42)
+            return (yield from t)
+
+        self.loop.set_task_factory(tasks.eager_task_factory)
+        res = self.loop.run_until_complete(tasks.Task(main(), loop=self.loop))
+        self.assertEqual(res, 42)
+        self.assertEqual(calls, ['start', 'end'])
+
+    def test_eager_task_exception(self):
+        @tasks.coroutine
+        def fail():
+            raise ValueError('boom')
+
+        @tasks.coroutine
+        def main():
+            t = self.loop.create_task(fail())
+            self.assertTrue(t.done())
+            self.assertIsInstance(t.exception(), ValueError)
+
+        self.loop.set_task_factory(tasks.eager_task_factory)
+        self.loop.run_until_complete(tasks.Task(main(), loop=self.loop))
+
+    def test_eager_task_current_task(self):
+        seen = []
+
+        @tasks.coroutine
+        def inner():
+            seen.append(tasks.Task.current_task(loop=self.loop))
+
+        @tasks.coroutine
+        def main():
+            outer = tasks.Task.current_task(loop=self.loop)
+            t = tasks.Task(inner(), loop=self.loop, eager_start=True)
+            self.assertEqual(seen, [t])
+            self.assertIs(tasks.Task.current_task(loop=self.loop), outer)
+            seen.append(outer)
+
+        task = tasks.Task(main(), loop=self.loop)
+        self.loop.run_until_complete(task)
+        self.assertIs(seen[1], task)
+        self.assertIsNone(tasks.Task.current_task(loop=self.loop))
+
     def test_task_repr(self):
         @tasks.coroutine
         def notmuch():
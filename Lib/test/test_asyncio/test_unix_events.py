@@ -7,9 +7,11 @@ import io
 import os
 import pprint
 import signal
+import socket
 import stat
 import sys
 import threading
+import time
 import unittest
 import unittest.mock
 
@@ -678,6 +680,63 @@ class UnixWritePipeTransportTests(unittest.TestCase):
         self.assertFalse(self.protocol.connection_lost.called)
 
 
+class ForkServerWorkersTests(unittest.TestCase):
+
+    def test_port_required(self):
+        self.assertRaises(ValueError, unix_events.fork_server_workers,
+                          protocols.Protocol, '127.0.0.1')
+
+    @unittest.skipUnless(hasattr(socket, 'SO_REUSEPORT'),
+                         'SO_REUSEPORT required')
+    def test_workers_count(self):
+        self.assertRaises(ValueError, unix_events.fork_server_workers,
+                          protocols.Protocol, '127.0.0.1', 10100, workers=0)
+
+    @unittest.skipUnless(hasattr(socket, 'SO_REUSEPORT'),
+                         'SO_REUSEPORT required')
+    def test_fork_server_workers(self):
+
+        class PidProtocol(protocols.Protocol):
+            def connection_made(self, transport):
+                transport.write(str(os.getpid()).encode('ascii'))
+                transport.close()
+
+        # Reserve a port; the socket does not listen, so it receives no
+        # connections.
+        probe = socket.socket()
+        self.addCleanup(probe.close)
+        probe.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, True)
+        probe.bind(('127.0.0.1', 0))
+        port = probe.getsockname()[1]
+
+        pids = unix_events.fork_server_workers(PidProtocol, '127.0.0.1',
+                                               port, workers=2)
+        try:
+            # Connect until both workers served a connection, which also
+            # guarantees they installed their SIGTERM handler.
+            seen = set()
+            deadline = time.time() + 10
+            while len(seen) < 2 and time.time() < deadline:
+                try:
+                    with socket.create_connection(('127.0.0.1', port)) as c:
+                        data = b''
+                        while True:
+                            chunk = c.recv(100)
+                            if not chunk:
+                                break
+                            data += chunk
+                except ConnectionRefusedError:
+                    time.sleep(0.01)
+                    continue
+                seen.add(int(data))
+            self.assertEqual(set(pids), seen)
+        finally:
+            for pid in pids:
+                os.kill(pid, signal.SIGTERM)
+            statuses = [os.waitpid(pid, 0)[1] for pid in pids]
+        self.assertEqual([0, 0], statuses)
+
+
 class AbstractChildWatcherTests(unittest.TestCase):
 
     def test_not_implemented(self):
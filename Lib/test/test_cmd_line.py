@@ -4,6 +4,7 @@
 
 import test.support, unittest
 import os
+import re
 import shutil
 import sys
 import subprocess
@@ -100,6 +101,41 @@ class CmdLineTest(unittest.TestCase):
         else:
             self.assertEqual(err, b'')
 
+    def test_importtime(self):
+        def import_times(err):
+            lines = err.decode('utf-8').splitlines()
+            self.assertIn(
+                'import time: self [us] | cumulative | imported package',
+                lines)
+            times = {}
+            for line in lines:
+                match = re.match(r'import time:\s*(\d+) \|\s*(\d+) \| ( *)(\S+)$',
+                                 line)
+                if match:
+                    self_us, cum_us, indent, name = match.groups()
+                    self.assertLessEqual(int(self_us), int(cum_us))
+                    times[name] = len(indent) // 2
+            return times
+
+        code = 'import json'
+        rc, out, err = assert_python_ok('-X', 'importtime', '-c', code)
+        times = import_times(err)
+        self.assertEqual(times['json'], 0)
+        self.assertEqual(times['json.decoder'], 1)
+        # Modules are only reported when actually loaded.
+        rc, out, err = assert_python_ok('-X', 'importtime', '-c',
+                                        code + '; import json')
+        self.assertEqual(len(re.findall(br'\| json$', err, re.M)), 1)
+
+        rc, out, err = assert_python_ok('-c', code,
+                                        PYTHONPROFILEIMPORTTIME='1')
+        self.assertIn('json', import_times(err))
+        rc, out, err = assert_python_ok('-E', '-c', code,
+                                        PYTHONPROFILEIMPORTTIME='1')
+        self.assertNotIn(b'import time:', err)
+        rc, out, err = assert_python_ok('-c', code)
+        self.assertNotIn(b'import time:', err)
+
     def test_run_module(self):
         # Test expected operation of the '-m' switch
         # Switch needs an argument
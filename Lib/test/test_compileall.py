@@ -10,10 +10,17 @@ import sys
 import tempfile
 import time
 import unittest
+import unittest.mock
 import io
 
 from test import support, script_helper
 
+try:
+    from concurrent.futures import ProcessPoolExecutor
+    _have_multiprocessing = True
+except ImportError:
+    _have_multiprocessing = False
+
 class CompileallTests(unittest.TestCase):
 
     def setUp(self):
@@ -108,6 +115,66 @@ class CompileallTests(unittest.TestCase):
                                                    debug_override=not optimize)
         self.assertTrue(os.path.isfile(cached3))
 
+    def test_compile_workers_non_positive(self):
+        with self.assertRaisesRegex(ValueError,
+                                    "workers must be greater or equal to 0"):
+            compileall.compile_dir(self.directory, workers=-1)
+
+    @unittest.mock.patch('compileall.ProcessPoolExecutor')
+    def test_compile_pool_called(self, pool_mock):
+        executor = pool_mock.return_value.__enter__.return_value
+        executor.submit.return_value.result.return_value = (True, '')
+        compileall.compile_dir(self.directory, quiet=True, workers=5)
+        self.assertTrue(pool_mock.called)
+        self.assertEqual(pool_mock.call_args[1], {'max_workers': 5})
+
+    @unittest.mock.patch('compileall.ProcessPoolExecutor')
+    def test_compile_workers_cpu_count(self, pool_mock):
+        executor = pool_mock.return_value.__enter__.return_value
+        executor.submit.return_value.result.return_value = (True, '')
+        compileall.compile_dir(self.directory, quiet=True, workers=0)
+        self.assertEqual(pool_mock.call_args[1], {'max_workers': None})
+
+    @unittest.mock.patch('compileall.ProcessPoolExecutor')
+    @unittest.mock.patch('compileall.compile_file')
+    def test_compile_one_worker(self, compile_file_mock, pool_mock):
+        compileall.compile_dir(self.directory, quiet=True)
+        self.assertFalse(pool_mock.called)
+        self.assertTrue(compile_file_mock.called)
+
+    @unittest.mock.patch('compileall.ProcessPoolExecutor', new=None)
+    @unittest.mock.patch('compileall.compile_file')
+    def test_compile_missing_multiprocessing(self, compile_file_mock):
+        compileall.compile_dir(self.directory, quiet=True, workers=5)
+        self.assertTrue(compile_file_mock.called)
+
+    @unittest.skipUnless(_have_multiprocessing, 'requires multiprocessing')
+    def test_compile_workers_same_as_serial(self):
+        # Results and output, including error messages, must not depend
+        # on the number of workers.
+        with open(os.path.join(self.subdirectory, '_bad.py'), 'w') as file:
+            file.write('x = (\n')
+        results = []
+        for workers in (1, 2):
+            for quiet in (False, True):
+                orig_stdout = sys.stdout
+                sys.stdout = io.TextIOWrapper(io.BytesIO(), encoding='utf-8')
+                try:
+                    ok = compileall.compile_dir(self.directory, force=True,
+                                                quiet=quiet, workers=workers)
+                    sys.stdout.flush()
+                    output = sys.stdout.buffer.getvalue()
+                finally:
+                    sys.stdout = orig_stdout
+                results.append((workers, quiet, ok, output))
+        serial, serial_quiet, parallel, parallel_quiet = results
+        self.assertFalse(serial[2])
+        self.assertIn(b'_bad.py', serial_quiet[3])
+        self.assertEqual(serial[2:], parallel[2:])
+        self.assertEqual(serial_quiet[2:], parallel_quiet[2:])
+        self.assertTrue(os.path.isfile(self.bc_path))
+        self.assertTrue(os.path.isfile(self.bc_path2))
+
 
 class EncodingTest(unittest.TestCase):
     """Issue 6716: compileall should escape source code when printing errors
@@ -354,6 +421,32 @@ class CommandLineTests(unittest.TestCase):
         self.assertCompiled(self.initfn)
         self.assertCompiled(self.barfn)
 
+    @unittest.skipUnless(_have_multiprocessing, 'requires multiprocessing')
+    def test_workers(self):
+        bar2fn = script_helper.make_script(self.directory, 'bar2', '')
+        files = []
+        for suffix in range(5):
+            pkgdir = os.path.join(self.directory, 'foo{}'.format(suffix))
+            os.mkdir(pkgdir)
+            script_helper.make_script(pkgdir, '__init__', '')
+            files.append(script_helper.make_script(pkgdir, 'bar2', ''))
+
+        self.assertRunOK(self.directory, '-j', '0')
+        self.assertCompiled(bar2fn)
+        for file in files:
+            self.assertCompiled(file)
+
+    @unittest.skipUnless(_have_multiprocessing, 'requires multiprocessing')
+    def test_workers_same_output(self):
+        script_helper.make_script(self.pkgdir, 'crunchyfrog', 'bad(syntax')
+        serial = self.assertRunNotOK('-f', self.pkgdir)
+        parallel = self.assertRunNotOK('-f', '-j', '3', self.pkgdir)
+        self.assertEqual(serial, parallel)
+
+    def test_workers_negative(self):
+        rc, out, err = self.assertRunNotOK('-j', '-1', self.pkgdir)
+        self.assertRegex(err, b'workers must be greater or equal to 0')
+
     def test_invalid_arg_produces_message(self):
         out = self.assertRunOK('badfilename')
         self.assertRegex(out, b"Can't list 'badfilename'")
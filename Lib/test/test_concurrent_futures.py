@@ -11,6 +11,11 @@ test.support.import_module('threading')
 
 from test.script_helper import assert_python_ok
 
+import contextlib
+import logging
+from logging.handlers import QueueHandler
+import os
+import queue
 import sys
 import threading
 import time
@@ -19,8 +24,10 @@ import weakref
 
 from concurrent import futures
 from concurrent.futures._base import (
-    PENDING, RUNNING, CANCELLED, CANCELLED_AND_NOTIFIED, FINISHED, Future)
+    PENDING, RUNNING, CANCELLED, CANCELLED_AND_NOTIFIED, FINISHED, Future,
+    BrokenExecutor)
 from concurrent.futures.process import BrokenProcessPool
+import multiprocessing
 
 
 def create_future(state=PENDING, exception=None, result=None):
@@ -58,13 +65,34 @@ class MyObject(object):
         pass
 
 
+INITIALIZER_STATUS = 'uninitialized'
+
+def init(x):
+    global INITIALIZER_STATUS
+    INITIALIZER_STATUS = x
+
+def get_init_status():
+    return INITIALIZER_STATUS
+
+def init_fail(log_queue=None):
+    if log_queue is not None:
+        logger = logging.getLogger('concurrent.futures')
+        logger.addHandler(QueueHandler(log_queue))
+        logger.setLevel('CRITICAL')
+        logger.propagate = False
+    time.sleep(0.1)  # let some futures be scheduled
+    raise ValueError('error in initializer')
+
+
 class ExecutorMixin:
     worker_count = 5
+    executor_kwargs = {}
 
     def setUp(self):
         self.t1 = time.time()
         try:
-            self.executor = self.executor_type(max_workers=self.worker_count)
+            self.executor = self.executor_type(max_workers=self.worker_count,
+                                               **self.executor_kwargs)
         except NotImplementedError as e:
             self.skipTest(str(e))
         self._prime_executor()
@@ -94,6 +122,111 @@ class ProcessPoolMixin(ExecutorMixin):
     executor_type = futures.ProcessPoolExecutor
 
 
+class InitializerMixin(ExecutorMixin):
+    worker_count = 2
+
+    def setUp(self):
+        global INITIALIZER_STATUS
+        INITIALIZER_STATUS = 'uninitialized'
+        self.executor_kwargs = dict(initializer=init,
+                                    initargs=('initialized',))
+        super().setUp()
+
+    def test_initializer(self):
+        futures = [self.executor.submit(get_init_status)
+                   for _ in range(self.worker_count)]
+
+        for f in futures:
+            self.assertEqual(f.result(), 'initialized')
+
+    def test_initializer_not_callable(self):
+        with self.assertRaises(TypeError):
+            self.executor_type(max_workers=1, initializer=42)
+
+
+class FailingInitializerMixin(ExecutorMixin):
+    worker_count = 2
+
+    def setUp(self):
+        if self.executor_type is futures.ProcessPoolExecutor:
+            # Pass a queue to redirect the child's logging output
+            self.log_queue = multiprocessing.Queue()
+            self.executor_kwargs = dict(initializer=init_fail,
+                                        initargs=(self.log_queue,))
+        else:
+            # In a thread pool, the child shares our logging setup
+            # (see _assert_logged())
+            self.log_queue = None
+            self.executor_kwargs = dict(initializer=init_fail)
+        super().setUp()
+
+    def _prime_executor(self):
+        pass
+
+    def test_initializer(self):
+        with self._assert_logged('ValueError: error in initializer'):
+            try:
+                future = self.executor.submit(get_init_status)
+            except BrokenExecutor:
+                # Perhaps the executor is already broken
+                pass
+            else:
+                with self.assertRaises(BrokenExecutor):
+                    future.result()
+            # At some point, the executor should break
+            t1 = time.time()
+            while not self.executor._broken:
+                if time.time() - t1 > 5:
+                    self.fail("executor not broken after 5 s.")
+                time.sleep(0.01)
+            # ... and from this point submit() is guaranteed to fail
+            with self.assertRaises(BrokenExecutor):
+                self.executor.submit(get_init_status)
+
+    @contextlib.contextmanager
+    def _assert_logged(self, msg):
+        if self.log_queue is not None:
+            yield
+            # The traceback of the records sent by QueueHandler is in their
+            # exc_text, which Formatter.format() appends to the message
+            formatter = logging.Formatter()
+            output = []
+            try:
+                while True:
+                    record = self.log_queue.get(timeout=1)
+                    output.append(formatter.format(record))
+            except queue.Empty:
+                pass
+        else:
+            with self.assertLogs('concurrent.futures', 'CRITICAL') as cm:
+                yield
+            output = cm.output
+        self.assertTrue(any(msg in line for line in output),
+                        output)
+
+
+class ThreadPoolInitializerTest(ThreadPoolMixin, InitializerMixin,
+                                unittest.TestCase):
+    pass
+
+
+class ProcessPoolInitializerTest(ProcessPoolMixin, InitializerMixin,
+                                 unittest.TestCase):
+    pass
+
+
+class ThreadPoolFailingInitializerTest(ThreadPoolMixin,
+                                       FailingInitializerMixin,
+                                       unittest.TestCase):
+    pass
+
+
+class ProcessPoolFailingInitializerTest(ProcessPoolMixin,
+                                        FailingInitializerMixin,
+                                        unittest.TestCase):
+    pass
+
+
 class ExecutorShutdownTest:
     def test_run_after_shutdown(self):
         self.executor.shutdown()
@@ -444,6 +577,66 @@ class ProcessPoolExecutorTest(ProcessPoolMixin, ExecutorTest, unittest.TestCase)
         # Submitting other jobs fails as well.
         self.assertRaises(BrokenProcessPool, self.executor.submit, pow, 2, 8)
 
+    def test_map_chunksize(self):
+        def bad_map():
+            list(self.executor.map(pow, range(40), range(40), chunksize=-1))
+
+        ref = list(map(pow, range(40), range(40)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(40), range(40), chunksize=6)),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, range(40), range(40), chunksize=50)),
+            ref)
+        self.assertEqual(
+            list(self.executor.map(pow, range(40), range(40), chunksize=40)),
+            ref)
+        self.assertRaises(ValueError, bad_map)
+
+    def test_map_chunksize_exception(self):
+        # An exception fails the chunk it was raised in; the results of the
+        # previous chunks are still delivered.
+        i = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5], chunksize=2)
+        self.assertEqual(next(i), (0, 1))
+        self.assertEqual(next(i), (0, 1))
+        self.assertRaises(ZeroDivisionError, next, i)
+
+    def test_max_tasks_per_child(self):
+        executor = self.executor_type(1, max_tasks_per_child=3)
+        self.addCleanup(executor.shutdown)
+        f1 = executor.submit(os.getpid)
+        original_pid = f1.result()
+        # The worker pid remains the same as the worker could be reused
+        f2 = executor.submit(os.getpid)
+        self.assertEqual(f2.result(), original_pid)
+        self.assertEqual(len(executor._processes), 1)
+        f3 = executor.submit(os.getpid)
+        self.assertEqual(f3.result(), original_pid)
+
+        # A new worker is spawned, with a statistically different pid,
+        # while the previous was reaped.
+        f4 = executor.submit(os.getpid)
+        new_pid = f4.result()
+        self.assertNotEqual(original_pid, new_pid)
+        self.assertEqual(len(executor._processes), 1)
+
+    def test_max_tasks_per_child_map(self):
+        executor = self.executor_type(2, max_tasks_per_child=2,
+                                      initializer=init,
+                                      initargs=('initialized',))
+        self.addCleanup(executor.shutdown)
+        self.assertEqual(list(executor.map(pow, range(20), range(20))),
+                         list(map(pow, range(20), range(20))))
+        # Replacement workers run the initializer too.
+        self.assertEqual(executor.submit(get_init_status).result(),
+                         'initialized')
+
+    def test_max_tasks_per_child_invalid(self):
+        with self.assertRaises(ValueError):
+            self.executor_type(1, max_tasks_per_child=0)
+        with self.assertRaises(TypeError):
+            self.executor_type(1, max_tasks_per_child=1.5)
+
 
 class FutureTests(unittest.TestCase):
     def test_done_callback_with_result(self):
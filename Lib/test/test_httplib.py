@@ -38,6 +38,9 @@ class FakeSocket:
             raise client.UnimplementedFileMode()
         return self.fileclass(self.text)
 
+    def close(self):
+        pass
+
 class EPipeSocket(FakeSocket):
 
     def __init__(self, text, pipe_trigger):
@@ -667,6 +670,120 @@ class BasicTest(TestCase):
         conn.request('POST', '/', body)
         self.assertGreater(sock.sendall_calls, 1)
 
+class ExtendedReadTest(TestCase):
+    """Test read1(), peek(), readline() and iter_chunks()."""
+
+    lines = (
+        'HTTP/1.1 200 OK\r\n'
+        '\r\n'
+        'hello world!\n'
+        'and now \n'
+        'for something completely different\n'
+        'foo'
+    )
+    lines_expected = lines[lines.find('hello'):].encode("ascii")
+    lines_chunked = (
+        'HTTP/1.1 200 OK\r\n'
+        'Transfer-Encoding: chunked\r\n\r\n'
+        'a\r\n'
+        'hello worl\r\n'
+        '3\r\n'
+        'd!\n\r\n'
+        '9\r\n'
+        'and now \n\r\n'
+        '23\r\n'
+        'for something completely different\n\r\n'
+        '3\r\n'
+        'foo\r\n'
+        '0\r\n'
+        '\r\n'
+    )
+
+    def make_response(self, text, length=True):
+        if length and 'chunked' not in text:
+            head, body = text.split('\r\n\r\n', 1)
+            text = '%s\r\nContent-Length: %d\r\n\r\n%s' % (head, len(body),
+                                                             body)
+        sock = FakeSocket(text, fileclass=lambda data: io.BufferedReader(
+            io.BytesIO(data), buffer_size=16))
+        resp = client.HTTPResponse(sock, method="GET")
+        resp.begin()
+        return resp
+
+    def check_all(self, text, length=True):
+        expected = self.lines_expected
+
+        resp = self.make_response(text, length)
+        self.assertEqual(list(resp), expected.splitlines(keepends=True))
+        self.assertTrue(resp.isclosed())
+
+        resp = self.make_response(text, length)
+        self.assertEqual(resp.readline(5), b'hello')
+        data = bytearray()
+        while True:
+            piece = resp.read1(7)
+            self.assertLessEqual(len(piece), 7)
+            if not piece:
+                break
+            data += piece
+        self.assertEqual(b'hello' + data, expected)
+
+        resp = self.make_response(text, length)
+        p = resp.peek(3)
+        self.assertTrue(p and expected.startswith(p))
+        self.assertEqual(resp.read(5), b'hello')
+        self.assertTrue(resp.peek(1).startswith(b' '))
+        self.assertEqual(resp.read(), expected[5:])
+        self.assertEqual(resp.peek(1), b'')
+        self.assertEqual(resp.read1(), b'')
+
+        for size in (1, 3, 10, 100):
+            resp = self.make_response(text, length)
+            pieces = list(resp.iter_chunks(size))
+            self.assertEqual(b''.join(pieces), expected)
+            self.assertTrue(all(0 < len(p) <= size for p in pieces))
+            self.assertTrue(resp.isclosed())
+
+    def test_content_length(self):
+        self.check_all(self.lines)
+
+    def test_no_content_length(self):
+        self.check_all(self.lines, length=False)
+
+    def test_chunked(self):
+        self.check_all(self.lines_chunked)
+
+    def test_read_negative(self):
+        # read(-1) reads the whole body, and nothing past it.
+        following = 'HTTP/1.1 200 OK\r\n'
+        head, body = self.lines.split('\r\n\r\n', 1)
+        text = '%s\r\nContent-Length: %d\r\n\r\n%s' % (head, len(body),
+                                                         body)
+        for text, length in ((text + following, False),
+                             (self.lines_chunked + following, True)):
+            resp = self.make_response(text, length)
+            self.assertEqual(resp.read(-1), self.lines_expected)
+            self.assertTrue(resp.isclosed())
+            self.assertEqual(resp.read(-1), b'')
+
+    def test_read1_chunked_stays_in_chunk(self):
+        resp = self.make_response(self.lines_chunked)
+        self.assertEqual(resp.read1(100), b'hello worl')
+        self.assertEqual(resp.read1(100), b'd!\n')
+
+    def test_iter_chunks_bad_size(self):
+        resp = self.make_response(self.lines)
+        self.assertRaises(ValueError, next, resp.iter_chunks(0))
+
+    def test_readinto_large_buffer(self):
+        resp = self.make_response(self.lines_chunked)
+        b = bytearray(1000)
+        n = resp.readinto(b)
+        self.assertEqual(b[:n], self.lines_expected)
+        self.assertEqual(resp.readinto(b), 0)
+        self.assertTrue(resp.isclosed())
+
+
 class OfflineTest(TestCase):
     def test_responses(self):
         self.assertEqual(client.responses[client.NOT_FOUND], "Not Found")
@@ -932,6 +1049,142 @@ class RequestBodyTest(TestCase):
             self.assertEqual(b'body\xc1', f.read())
 
 
+class ChunkedRequestBodyTest(TestCase):
+    """Test request bodies sent with the chunked transfer coding."""
+
+    def setUp(self):
+        self.conn = client.HTTPConnection('example.com')
+        self.conn.sock = self.sock = FakeSocket("")
+
+    def get_headers_and_fp(self):
+        f = io.BytesIO(self.sock.data)
+        f.readline()  # read the request line
+        message = client.parse_headers(f)
+        return message, f
+
+    def test_generator_body(self):
+        def body():
+            yield b"one"
+            yield b""
+            yield bytearray(b"two")
+            yield "three"
+            yield memoryview(b"0123456789abcdefg")
+        self.conn.request("POST", "/url", body())
+        message, f = self.get_headers_and_fp()
+        self.assertEqual("chunked", message.get("transfer-encoding"))
+        self.assertIsNone(message.get("content-length"))
+        self.assertEqual(b"3\r\none\r\n3\r\ntwo\r\n5\r\nthree\r\n"
+                         b"11\r\n0123456789abcdefg\r\n0\r\n\r\n", f.read())
+
+    def test_file_body_without_length(self):
+        # io.BytesIO has no file descriptor to find its size with.
+        self.conn.request("PUT", "/url", io.BytesIO(b"body"))
+        message, f = self.get_headers_and_fp()
+        self.assertEqual("chunked", message.get("transfer-encoding"))
+        self.assertEqual(b"4\r\nbody\r\n0\r\n\r\n", f.read())
+
+    def test_explicit_transfer_encoding(self):
+        self.conn.request("POST", "/url", [b"body"],
+                          {"Transfer-Encoding": "chunked"},
+                          encode_chunked=True)
+        message, f = self.get_headers_and_fp()
+        self.assertEqual("chunked", message.get("transfer-encoding"))
+        self.assertEqual(b"4\r\nbody\r\n0\r\n\r\n", f.read())
+
+        # The body is already encoded.
+        self.conn = client.HTTPConnection('example.com')
+        self.conn.sock = self.sock = FakeSocket("")
+        self.conn.request("POST", "/url", [b"4\r\nbody\r\n0\r\n\r\n"],
+                          {"Transfer-Encoding": "chunked"})
+        message, f = self.get_headers_and_fp()
+        self.assertEqual(b"4\r\nbody\r\n0\r\n\r\n", f.read())
+
+    def test_content_length_given(self):
+        self.conn.request("POST", "/url", iter([b"body"]),
+                          {"Content-Length": "4"}, encode_chunked=True)
+        message, f = self.get_headers_and_fp()
+        self.assertIsNone(message.get("transfer-encoding"))
+        self.assertEqual(b"body", f.read())
+
+    def test_http10(self):
+        class HTTP10Connection(client.HTTPConnection):
+            _http_vsn = 10
+            _http_vsn_str = 'HTTP/1.0'
+        self.conn = HTTP10Connection('example.com')
+        self.conn.sock = self.sock
+        self.conn.request("POST", "/url", iter([b"body"]))
+        message, f = self.get_headers_and_fp()
+        self.assertIsNone(message.get("transfer-encoding"))
+        self.assertEqual(b"body", f.read())
+
+
+class PipelineTest(TestCase):
+
+    def make_connection(self, *responses):
+        conn = client.HTTPConnection('example.com')
+        conn.sock = FakeSocket(b"".join(responses))
+        return conn
+
+    def response(self, body, *headers):
+        return (b"HTTP/1.1 200 OK\r\n" + b"".join(headers) +
+                b"Content-Length: " + str(len(body)).encode("ascii") +
+                b"\r\n\r\n" + body)
+
+    def test_pipeline(self):
+        conn = self.make_connection(self.response(b"first"),
+                                    self.response(b"", b"X-Head: 1\r\n"),
+                                    self.response(b"third"))
+        n = conn.pipeline([("GET", "/1"), ("HEAD", "/2"),
+                           ("POST", "/3", b"data")])
+        self.assertEqual(n, 3)
+        # All the requests were sent at once.
+        self.assertEqual(conn.sock.sendall_calls, 1)
+        self.assertEqual(conn.sock.data.count(b"HTTP/1.1\r\n"), 3)
+        self.assertTrue(conn.sock.data.endswith(b"\r\n\r\ndata"))
+
+        resp = conn.getresponse()
+        self.assertRaises(client.ResponseNotReady, conn.getresponse)
+        self.assertEqual(resp.read(), b"first")
+        resp = conn.getresponse()
+        self.assertEqual(resp.getheader("X-Head"), "1")
+        self.assertEqual(resp.read(), b"")
+        self.assertRaises(client.CannotSendRequest, conn.pipeline, [])
+        resp = conn.getresponse()
+        self.assertEqual(resp.read(), b"third")
+        self.assertRaises(client.ResponseNotReady, conn.getresponse)
+
+        # The connection can be used for requests again.
+        conn.pipeline([])
+        self.assertRaises(client.ResponseNotReady, conn.getresponse)
+
+    def test_pipeline_connection_close(self):
+        conn = self.make_connection(
+            self.response(b"first", b"Connection: close\r\n"))
+        conn.pipeline([("GET", "/1"), ("GET", "/2")])
+        resp = conn.getresponse()
+        self.assertIsNone(conn.sock)
+        self.assertEqual(resp.read(), b"first")
+        # The second request was not answered.
+        self.assertRaises(client.ResponseNotReady, conn.getresponse)
+
+    def test_pipeline_unread_response(self):
+        conn = self.make_connection(self.response(b"first"))
+        conn.request("GET", "/1")
+        resp = conn.getresponse()
+        self.assertRaises(client.CannotSendRequest, conn.pipeline,
+                          [("GET", "/2")])
+        resp.read()
+        self.assertEqual(conn.pipeline([("GET", "/2")]), 1)
+
+    def test_pipeline_error(self):
+        conn = self.make_connection()
+        sock = conn.sock
+        self.assertRaises(TypeError, conn.pipeline,
+                          [("GET", "/1"), ("POST", "/2", 42)])
+        self.assertIsNone(conn.sock)
+        self.assertEqual(sock.data, b"")
+
+
 class HTTPResponseTest(TestCase):
 
     def setUp(self):
@@ -970,7 +1223,8 @@ class HTTPResponseTest(TestCase):
 def test_main(verbose=None):
     support.run_unittest(HeaderTests, OfflineTest, BasicTest, TimeoutTest,
                          HTTPSTest, RequestBodyTest, SourceAddressTest,
-                         HTTPResponseTest)
+                         HTTPResponseTest, ChunkedRequestBodyTest,
+                         PipelineTest, ExtendedReadTest)
 
 if __name__ == '__main__':
     test_main()
@@ -10,8 +10,11 @@ import py_compile
 import stat
 import sys
 import tempfile
+from test import support
+from test.script_helper import assert_python_ok
 from test.support import make_legacy_pyc
 import unittest
+from unittest import mock
 import warnings
 
 
@@ -198,6 +201,143 @@ Frozen_FinderTestsPEP302, Source_FinderTestsPEP302 = util.test_both(
         FinderTestsPEP302, machinery=machinery)
 
 
+class DirIndexTests:
+
+    """Tests for the directory listings persisted by FileFinder."""
+
+    def setUp(self):
+        self.addCleanup(setattr, sys, 'dont_write_bytecode',
+                        sys.dont_write_bytecode)
+        sys.dont_write_bytecode = False
+        tempdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tempdir.cleanup)
+        self.path = tempdir.name
+        self.pycache = os.path.join(self.path, '__pycache__')
+        os.mkdir(self.pycache)
+        with open(os.path.join(self.path, 'mod.py'), 'w') as file:
+            file.write('# test file for importlib')
+        self.backdate()
+
+    def backdate(self):
+        # Directory changes in the current mtime tick make the index
+        # untrustworthy, so pretend the directory is an old one.
+        mtime = os.stat(self.path).st_mtime - 60
+        os.utime(self.path, (mtime, mtime))
+
+    def get_finder(self, use_index=True):
+        finder = self.machinery.FileFinder(self.path,
+            (self.machinery.SourceFileLoader, self.machinery.SOURCE_SUFFIXES))
+        finder._use_index = use_index
+        return finder
+
+    def index_files(self):
+        return [name for name in os.listdir(self.pycache)
+                if name.endswith('.dirindex')]
+
+    def find_without_listdir(self, name):
+        finder = self.get_finder()
+        def listdir():
+            self.fail('directory listed despite a valid index')
+        finder._listdir = listdir
+        return finder.find_spec(name)
+
+    def test_disabled(self):
+        self.assertIsNotNone(self.get_finder(False).find_spec('mod'))
+        self.assertEqual(self.index_files(), [])
+
+    def test_enabling(self):
+        code = ('import importlib.machinery; '
+                'print(importlib.machinery.FileFinder._use_index)')
+        with support.EnvironmentVarGuard() as env:
+            env.unset('PYTHONDIRINDEX')
+            rc, out, err = assert_python_ok('-c', code)
+            self.assertEqual(out.strip(), b'False')
+            rc, out, err = assert_python_ok('-X', 'dirindex', '-c', code)
+            self.assertEqual(out.strip(), b'True')
+            rc, out, err = assert_python_ok('-c', code, PYTHONDIRINDEX='1')
+            self.assertEqual(out.strip(), b'True')
+            rc, out, err = assert_python_ok('-E', '-c', code,
+                                            PYTHONDIRINDEX='1')
+            self.assertEqual(out.strip(), b'False')
+
+    def test_index_used(self):
+        self.assertIsNotNone(self.get_finder().find_spec('mod'))
+        self.assertEqual(len(self.index_files()), 1)
+        self.assertIsNotNone(self.find_without_listdir('mod'))
+        self.assertIsNone(self.find_without_listdir('nosuchmodule'))
+
+    def test_index_invalidated_by_mtime(self):
+        self.assertIsNotNone(self.get_finder().find_spec('mod'))
+        with open(os.path.join(self.path, 'mod2.py'), 'w') as file:
+            file.write('# test file for importlib')
+        self.assertIsNotNone(self.get_finder().find_spec('mod2'))
+        # The refreshed index is used once the directory is old enough.
+        self.backdate()
+        self.assertIsNotNone(self.get_finder().find_spec('mod2'))
+        self.assertIsNotNone(self.find_without_listdir('mod2'))
+
+    def test_recently_modified_directory(self):
+        # A change made in the same mtime tick as the listing could go
+        # unnoticed: no index is written for such a directory.
+        os.utime(self.path, None)
+        now = os.stat(self.path).st_mtime + 60
+        os.utime(self.path, (now, now))
+        self.assertIsNotNone(self.get_finder().find_spec('mod'))
+        self.assertEqual(self.index_files(), [])
+
+    def test_pycache_created(self):
+        os.rmdir(self.pycache)
+        self.backdate()
+        self.assertIsNotNone(self.get_finder().find_spec('mod'))
+        self.assertTrue(os.path.isdir(self.pycache))
+        self.assertEqual(self.index_files(), [])
+
+    def test_dont_write_bytecode(self):
+        sys.dont_write_bytecode = True
+        self.assertIsNotNone(self.get_finder().find_spec('mod'))
+        self.assertEqual(self.index_files(), [])
+
+    def test_index_write_error(self):
+        # The directory is still listed when the index cannot be written.
+        bootstrap = sys.modules[self.machinery.FileFinder.__module__]
+        mtime = os.stat(self.path).st_mtime
+        with mock.patch.object(bootstrap._os, 'fstat', side_effect=OSError):
+            contents = self.get_finder()._listdir_and_index(mtime)
+        self.assertIn('mod.py', contents)
+        # A directory modified too recently is not indexed, and removing
+        # the temporary index file fails.
+        with mock.patch.object(bootstrap._os, 'unlink', side_effect=OSError):
+            contents = self.get_finder()._listdir_and_index(mtime + 3600)
+        self.assertIn('mod.py', contents)
+        self.assertEqual(self.index_files(), [])
+
+    def test_bad_index_ignored(self):
+        self.assertIsNotNone(self.get_finder().find_spec('mod'))
+        index_path = os.path.join(self.pycache, self.index_files()[0])
+        for data in (b'', b'garbage', b'dirindex1 0.0\nmod.py'):
+            with open(index_path, 'wb') as file:
+                file.write(data)
+            self.assertIsNotNone(self.get_finder().find_spec('mod'))
+
+    def test_undecodable_names(self):
+        name = os.fsdecode(b'\xff')
+        try:
+            os.fsencode(name)
+        except UnicodeEncodeError:
+            self.skipTest('filesystem encoding cannot represent the name')
+        with open(os.path.join(self.path, name), 'w'):
+            pass
+        self.backdate()
+        finder = self.get_finder()
+        finder.find_spec('mod')
+        finder = self.get_finder()
+        finder._listdir = None
+        finder.find_spec('mod')
+        self.assertIn(name, finder._path_cache)
+
+Frozen_DirIndexTests, Source_DirIndexTests = util.test_both(
+        DirIndexTests, machinery=machinery)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,123 @@
+from io import StringIO, BytesIO
+from collections import OrderedDict
+from test.test_json import PyTest, CTest
+
+
+DOCS = '''{"a": [1, 2.5, {"b": "x\\\\\\"y]"}], "c": null}
+[true, false, "\\u00e9t\\u00e9", []]
+"string with [brackets] and {braces}"
+-12.5e3 7 true null {} ""
+'''
+
+class TestStream:
+    def decode_chunks(self, chunks, **kw):
+        stream = self.json.JSONStreamDecoder(**kw)
+        values = []
+        for chunk in chunks:
+            values.extend(stream.feed(chunk))
+        values.extend(stream.close())
+        return values
+
+    def expected(self, s):
+        decoder = self.json.JSONDecoder()
+        values = []
+        s = s.strip()
+        while s:
+            obj, end = decoder.raw_decode(s)
+            values.append(obj)
+            s = s[end:].lstrip()
+        return values
+
+    def test_whole(self):
+        self.assertEqual(self.decode_chunks([DOCS]), self.expected(DOCS))
+        self.assertEqual(len(self.decode_chunks([DOCS])), 9)
+
+    def test_split_everywhere(self):
+        expected = self.expected(DOCS)
+        for i in range(len(DOCS) + 1):
+            for j in range(i, len(DOCS) + 1, 7):
+                chunks = [DOCS[:i], DOCS[i:j], DOCS[j:]]
+                self.assertEqual(self.decode_chunks(chunks), expected,
+                                 (i, j))
+
+    def test_single_characters(self):
+        self.assertEqual(self.decode_chunks(DOCS), self.expected(DOCS))
+
+    def test_values_returned_early(self):
+        stream = self.json.JSONStreamDecoder()
+        self.assertEqual(stream.feed('{"a": 1}\n[1, '), [{'a': 1}])
+        self.assertEqual(stream.feed('2]\n12'), [[1, 2]])
+        # the number may go on
+        self.assertEqual(stream.feed('3'), [])
+        self.assertEqual(stream.feed(' "x'), [123])
+        self.assertEqual(stream.feed('"'), ['x'])
+        self.assertEqual(stream.close(), [])
+
+    def test_bytes(self):
+        data = DOCS.replace('\\u00e9', 'é').encode('utf-8')
+        expected = self.expected(DOCS)
+        chunks = [data[i:i+1] for i in range(len(data))]
+        self.assertEqual(self.decode_chunks(chunks), expected)
+        data = '"€"'.encode('utf-16-le')
+        self.assertEqual(self.decode_chunks([data[:3], data[3:]],
+                                            encoding='utf-16-le'),
+                         ['€'])
+
+    def test_items(self):
+        s = '[1, "a]", {"b": [2, 3]}, [], null, -4.5e1]'
+        expected = [1, 'a]', {'b': [2, 3]}, [], None, -45.0]
+        for size in (1, 2, 3, 5, len(s)):
+            chunks = [s[i:i+size] for i in range(0, len(s), size)]
+            self.assertEqual(self.decode_chunks(chunks, items=True),
+                             expected, size)
+        self.assertEqual(self.decode_chunks(['[]', ' [ ] [1]'], items=True),
+                         [1])
+        # values outside of an array are returned as is
+        self.assertEqual(self.decode_chunks(['{"a": [1]} 2 [3]'],
+                                            items=True),
+                         [{'a': [1]}, 2, 3])
+
+    def test_decoder(self):
+        decoder = self.json.JSONDecoder(object_pairs_hook=OrderedDict)
+        values = self.decode_chunks(['{"b": 1, ', '"a": 2}'],
+                                    decoder=decoder)
+        self.assertEqual(values, [OrderedDict([('b', 1), ('a', 2)])])
+        self.assertEqual(type(values[0]), OrderedDict)
+
+    def test_errors(self):
+        for chunks in (['[1,]'], ['[1', ',', ']'], ['{"a" 1}'], ['1 x'],
+                       ['[1', ''], ['"abc'], ['{"a": "b"', ' '], ['tru'],
+                       ['1 ]']):
+            with self.assertRaises(ValueError, msg=chunks):
+                self.decode_chunks(chunks)
+        for chunks in (['[1 2]'], ['[1,', ' 2'], ['[', '}'], ['[1,,2]']):
+            with self.assertRaises(ValueError, msg=chunks):
+                self.decode_chunks(chunks, items=True)
+
+    def test_iterload(self):
+        self.assertEqual(list(self.json.iterload(StringIO(DOCS),
+                                                 chunk_size=3)),
+                         self.expected(DOCS))
+        data = DOCS.encode('utf-8')
+        self.assertEqual(list(self.json.iterload(BytesIO(data),
+                                                 chunk_size=1)),
+                         self.expected(DOCS))
+        self.assertEqual(list(self.json.iterload(StringIO(''))), [])
+        self.assertEqual(list(self.json.iterload(StringIO('[1, 2]'),
+                                                 items=True)),
+                         [1, 2])
+        self.assertEqual(list(self.json.iterload(StringIO('{"a": 1.5}'),
+                                                 parse_float=str,
+                                                 object_pairs_hook=list)),
+                         [[('a', '1.5')]])
+
+    def test_iterload_lazy(self):
+        fp = StringIO('1\n2\n[')
+        it = self.json.iterload(fp, chunk_size=2)
+        self.assertEqual(next(it), 1)
+        self.assertEqual(next(it), 2)
+        self.assertRaises(ValueError, next, it)
+
+
+class TestPyStream(TestStream, PyTest): pass
+class TestCStream(TestStream, CTest): pass
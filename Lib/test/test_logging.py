@@ -1433,6 +1433,21 @@ class SocketHandlerTest(BaseTest):
         self.handled.acquire()
         self.assertEqual(self.log_output, "spam\neggs\n")
 
+    def test_emit_batch(self):
+        sent = []
+        send = self.sock_hdlr.send
+        def recording_send(s):
+            sent.append(s)
+            send(s)
+        self.sock_hdlr.send = recording_send
+        records = [logging.makeLogRecord({'msg': msg})
+                   for msg in ('spam', 'eggs')]
+        self.sock_hdlr.emit_batch(records)
+        self.handled.acquire()
+        self.handled.acquire()
+        self.assertEqual(self.log_output, "spam\neggs\n")
+        self.assertEqual(len(sent), 1)
+
     def test_noserver(self):
         # Avoid timing-related failures due to SocketHandler's own hard-wired
         # one-second timeout on socket.create_connection() (issue #16264).
@@ -3034,6 +3049,80 @@ class QueueHandlerTest(BaseTest):
         self.assertTrue(handler.matches(levelno=logging.ERROR, message='2'))
         self.assertTrue(handler.matches(levelno=logging.CRITICAL, message='3'))
 
+    def test_overflow_drop(self):
+        q = queue.Queue(2)
+        handler = logging.handlers.QueueHandler(q, overflow='drop')
+        for i in range(5):
+            handler.handle(logging.makeLogRecord({'msg': str(i)}))
+        self.assertEqual(handler.dropped, 3)
+        self.assertEqual([q.get_nowait().msg for i in range(2)], ['0', '1'])
+
+    def test_overflow_drop_oldest(self):
+        q = queue.Queue(2)
+        handler = logging.handlers.QueueHandler(q, overflow='drop_oldest')
+        for i in range(5):
+            handler.handle(logging.makeLogRecord({'msg': str(i)}))
+        self.assertEqual(handler.dropped, 3)
+        self.assertEqual([q.get_nowait().msg for i in range(2)], ['3', '4'])
+        # Discarded records are accounted for by task_done().
+        q.task_done()
+        q.task_done()
+        q.join()
+
+    def test_overflow_drop_oldest_keeps_sentinel(self):
+        q = queue.Queue(1)
+        q.put_nowait(None)
+        handler = logging.handlers.QueueHandler(q, overflow='drop_oldest')
+        handler.handle(logging.makeLogRecord({'msg': 'x'}))
+        self.assertEqual(handler.dropped, 1)
+        self.assertIsNone(q.get_nowait())
+
+    def test_overflow_default(self):
+        q = queue.Queue(1)
+        handler = logging.handlers.QueueHandler(q)
+        errors = []
+        handler.handleError = errors.append
+        for i in range(2):
+            handler.handle(logging.makeLogRecord({'msg': str(i)}))
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(handler.dropped, 0)
+        self.assertRaises(ValueError, logging.handlers.QueueHandler, q,
+                          overflow='spill')
+
+    @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
+                         'logging.handlers.QueueListener required for this test')
+    def test_queue_listener_batch(self):
+        class BatchHandler(logging.Handler):
+            def __init__(self):
+                logging.Handler.__init__(self)
+                self.batches = []
+            def emit_batch(self, records):
+                self.batches.append([r.msg for r in records])
+        handler = BatchHandler()
+        handler.addFilter(lambda record: record.msg != '2')
+        listener = logging.handlers.QueueListener(self.queue, handler,
+                                                  batch_size=3)
+        for i in range(5):
+            self.que_logger.warning(str(i))
+        listener.start()
+        listener.stop()
+        self.assertEqual(handler.batches, [['0', '1'], ['3', '4']])
+        self.assertRaises(ValueError, logging.handlers.QueueListener,
+                          self.queue, handler, batch_size=0)
+
+    def test_stream_handler_emit_batch(self):
+        class Stream(io.StringIO):
+            writes = 0
+            def writelines(self, lines):
+                self.writes += 1
+                io.StringIO.writelines(self, lines)
+        stream = Stream()
+        handler = logging.StreamHandler(stream)
+        records = [logging.makeLogRecord({'msg': str(i)}) for i in range(3)]
+        handler.emit_batch(records)
+        self.assertEqual(stream.getvalue(), '0\n1\n2\n')
+        self.assertEqual(stream.writes, 1)
+
 ZERO = datetime.timedelta(0)
 
 class UTC(datetime.tzinfo):
@@ -3451,6 +3540,111 @@ class LogRecordTest(BaseTest):
             logging.logProcesses = log_processes
             logging.logMultiprocessing = log_multiprocessing
 
+class LazyLogRecordTest(BaseTest):
+
+    def setUp(self):
+        BaseTest.setUp(self)
+        self.orig_factory = logging.getLogRecordFactory()
+        logging.setLogRecordFactory(logging.LazyLogRecord)
+        self.addCleanup(logging.setLogRecordFactory, self.orig_factory)
+
+    def test_lazy_attributes(self):
+        r = logging.LazyLogRecord('n', logging.INFO, '/spam/eggs.py', 1,
+                                  'msg', None, None)
+        self.assertRaises(AttributeError, getattr, r, '_filename')
+        self.assertRaises(AttributeError, getattr, r, '_msecs')
+        self.assertEqual(r.filename, 'eggs.py')
+        self.assertEqual(r._filename, 'eggs.py')
+        self.assertEqual(r.module, 'eggs')
+        self.assertEqual(r.msecs, (r.created - int(r.created)) * 1000)
+        self.assertEqual(r.relativeCreated,
+                         (r.created - logging._startTime) * 1000)
+        r.filename = 'ham.py'
+        self.assertEqual(r.filename, 'ham.py')
+        self.assertEqual(r.__dict__, {})
+        self.assertFalse(hasattr(r, 'message'))
+
+    @unittest.skipUnless(threading, 'Threading required for this test.')
+    def test_thread_name(self):
+        records = []
+        def target():
+            records.append(logging.LazyLogRecord('n', logging.INFO, None, 0,
+                                                 'msg', None, None))
+        t = threading.Thread(target=target, name='lazy-thread')
+        t.start()
+        t.join()
+        r = records[0]
+        self.assertRaises(AttributeError, getattr, r, '_threadName')
+        # The name is the one of the thread which created the record.
+        self.assertEqual(r.threadName, 'lazy-thread')
+        self.assertEqual(r._threadName, 'lazy-thread')
+        self.assertEqual(r.processName, 'MainProcess')
+        r2 = pickle.loads(pickle.dumps(r))
+        self.assertEqual(r2.threadName, 'lazy-thread')
+
+    def test_formatting(self):
+        logger = logging.getLogger('lazy')
+        for style, fmt in [
+            ('%', '%(name)s %(levelname)s %(filename)s:%(module)s '
+                  '%(threadName)s %(custom)s %(message)s'),
+            ('{', '{name} {levelname} {filename}:{module} {threadName} '
+                  '{custom} {message}'),
+            ('$', '$name $levelname $filename:$module $threadName '
+                  '$custom $message'),
+            ]:
+            self.root_hdlr.setFormatter(logging.Formatter(fmt, style=style))
+            logger.warning('spam %d', 1, extra={'custom': 'eggs'})
+        thread_name = threading.current_thread().name if threading else None
+        expected = ('lazy WARNING test_logging.py:test_logging %s eggs spam 1'
+                    % thread_name)
+        self.assertEqual(self.stream.getvalue().splitlines(), [expected] * 3)
+
+    def test_extra(self):
+        h = RecordingHandler()
+        logger = logging.getLogger('lazy')
+        logger.addHandler(h)
+        self.addCleanup(logger.removeHandler, h)
+        logger.warning('spam', extra={'custom': 1})
+        self.assertRaises(KeyError, logger.warning, 'spam',
+                          extra={'filename': 'x'})
+        r = h.records[0]
+        self.assertIsInstance(r, logging.LazyLogRecord)
+        self.assertEqual(r.__dict__, {'custom': 1})
+        r.other = 2
+        self.assertEqual(r.other, 2)
+
+    def test_make_log_record(self):
+        r = logging.makeLogRecord({'msg': 'spam', 'custom': 1,
+                                   'filename': 'x.py'})
+        self.assertIsInstance(r, logging.LazyLogRecord)
+        self.assertEqual(r.getMessage(), 'spam')
+        self.assertEqual(r.filename, 'x.py')
+        self.assertEqual(r.custom, 1)
+        self.assertTrue(str(r).startswith('<LogRecord: '))
+
+    def test_pickle(self):
+        r = logging.makeLogRecord({'msg': 'spam %s', 'args': ('eggs',),
+                                   'pathname': '/a/b.py', 'custom': 1})
+        for proto in range(pickle.HIGHEST_PROTOCOL + 1):
+            r2 = pickle.loads(pickle.dumps(r, proto))
+            self.assertIsInstance(r2, logging.LazyLogRecord)
+            self.assertEqual(r2.getMessage(), 'spam eggs')
+            self.assertEqual(r2.filename, 'b.py')
+            self.assertEqual(r2.msecs, r.msecs)
+            self.assertEqual(r2.custom, 1)
+
+    def test_socket_pickle(self):
+        handler = logging.handlers.SocketHandler('localhost', None)
+        self.addCleanup(handler.close)
+        r = logging.makeLogRecord({'msg': 'spam', 'pathname': '/a/b.py'})
+        s = handler.makePickle(r)
+        d = pickle.loads(s[4:])
+        self.assertEqual(d['filename'], 'b.py')
+        self.assertEqual(d['msg'], 'spam')
+        self.assertIn('relativeCreated', d)
+        r2 = logging.makeLogRecord(d)
+        self.assertEqual(r2.filename, 'b.py')
+
 class BasicConfigTest(unittest.TestCase):
 
     """Test suite for logging.basicConfig."""
@@ -3795,6 +3989,128 @@ class LoggerTest(BaseTest):
         self.addCleanup(setattr, self.logger.manager, 'disable', old_disable)
         self.assertFalse(self.logger.isEnabledFor(22))
 
+    def test_is_enabled_for_cache_set_level(self):
+        parent = logging.getLogger('cache')
+        child = logging.getLogger('cache.a.b')
+        parent.setLevel(logging.WARNING)
+        self.assertFalse(child.isEnabledFor(logging.INFO))
+        self.assertEqual(child._cache, {logging.INFO: False})
+        # Changing the level of an ancestor invalidates its descendants.
+        parent.setLevel(logging.DEBUG)
+        self.assertEqual(child._cache, {})
+        self.assertTrue(child.isEnabledFor(logging.INFO))
+        # So does assigning the attribute directly.
+        parent.level = logging.ERROR
+        self.assertFalse(child.isEnabledFor(logging.INFO))
+        # A logger inserted between a child and its parent replaces the
+        # placeholder and takes effect immediately.
+        child.isEnabledFor(logging.WARNING)
+        middle = logging.getLogger('cache.a')
+        self.assertIs(child.parent, middle)
+        middle.setLevel(logging.DEBUG)
+        self.assertTrue(child.isEnabledFor(logging.WARNING))
+
+    def test_is_enabled_for_cache_disable(self):
+        logger = logging.getLogger('cache')
+        logger.setLevel(logging.DEBUG)
+        self.assertTrue(logger.isEnabledFor(logging.INFO))
+        old_disable = logging.root.manager.disable
+        self.addCleanup(logging.disable, old_disable)
+        logging.disable(logging.INFO)
+        self.assertFalse(logger.isEnabledFor(logging.INFO))
+        self.assertTrue(logger.isEnabledFor(logging.WARNING))
+        logging.disable(logging.NOTSET)
+        self.assertTrue(logger.isEnabledFor(logging.INFO))
+
+    def test_is_enabled_for_cache_dict_config(self):
+        logger = logging.getLogger('cache.config')
+        logger.setLevel(logging.DEBUG)
+        self.assertTrue(logger.isEnabledFor(logging.INFO))
+        logging.config.dictConfig({
+            'version': 1,
+            'disable_existing_loggers': False,
+            'loggers': {'cache': {'level': 'WARNING'}},
+        })
+        self.assertEqual(logger.level, logging.NOTSET)
+        self.assertFalse(logger.isEnabledFor(logging.INFO))
+        logging.config.dictConfig({
+            'version': 1,
+            'disable_existing_loggers': False,
+            'loggers': {'cache': {'level': 'DEBUG'}},
+        })
+        self.assertTrue(logger.isEnabledFor(logging.INFO))
+
+    def test_caller_found_when_needed(self):
+        logger = logging.getLogger('caller')
+        logger.propagate = False
+        self.addCleanup(setattr, logger, 'propagate', True)
+        stream = io.StringIO()
+        h = logging.StreamHandler(stream)
+        logger.addHandler(h)
+        self.addCleanup(logger.removeHandler, h)
+        calls = []
+        def findCaller(stack_info=False):
+            calls.append(stack_info)
+            return ('spam.py', 42, 'eggs', None)
+        logger.findCaller = findCaller
+
+        def check(needed, stack_info=False):
+            del calls[:]
+            logger.warning('msg', stack_info=stack_info)
+            self.assertEqual(calls, [stack_info] if needed else [])
+
+        check(False)
+        check(True, stack_info=True)
+        for fmt, style, needed in [
+            ('%(lineno)d %(message)s', '%', True),
+            ('%(name)s %(message)s', '%', False),
+            ('{funcName} {message}', '{', True),
+            ('{levelname} {message}', '{', False),
+            ('$module $message', '$', True),
+            ('${filename}: $message', '$', True),
+            ('${name}: $message', '$', False),
+            ]:
+            h.setFormatter(logging.Formatter(fmt, style=style))
+            check(needed)
+        h.formatter = logging.Formatter('%(pathname)s %(message)s')
+        check(True)
+        h.formatter = None
+        check(False)
+        self.assertEqual(stream.getvalue().splitlines()[-2:],
+                         ['spam.py msg', 'msg'])
+        # Filters, other handlers and record factories may look at the
+        # location of the call.
+        h.addFilter(lambda record: True)
+        check(True)
+        h.removeFilter(h.filters[0])
+        check(False)
+        logger.addFilter(lambda record: True)
+        check(True)
+        logger.removeFilter(logger.filters[0])
+        check(False)
+        logger.addHandler(self.recording)
+        self.addCleanup(logger.removeHandler, self.recording)
+        check(True)
+        logger.removeHandler(self.recording)
+        check(False)
+        class MyStreamHandler(logging.StreamHandler):
+            pass
+        logger.handlers = [MyStreamHandler(stream)]
+        check(True)
+        logger.handlers = [h]
+        check(False)
+        self.addCleanup(logging.setLogRecordFactory,
+                        logging.getLogRecordFactory())
+        logging.setLogRecordFactory(lambda *args: logging.LogRecord(*args))
+        check(True)
+        logging.setLogRecordFactory(logging.LazyLogRecord)
+        check(False)
+        # The handlers of ancestors are reached through propagation.
+        logger.propagate = True
+        check(False)
+        self.root_hdlr.setFormatter(logging.Formatter('%(lineno)d'))
+        check(True)
+
     def test_root_logger_aliases(self):
         root = logging.getLogger()
         self.assertIs(root, logging.root)
@@ -3930,6 +4246,119 @@ class RotatingFileHandlerTest(BaseFileTest):
         self.assertFalse(os.path.exists(namer(self.fn + ".3")))
         rh.close()
 
+    def test_format_once(self):
+        formatted = []
+        class CountingFormatter(logging.Formatter):
+            def format(self, record):
+                formatted.append(record)
+                return logging.Formatter.format(self, record)
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, backupCount=1, maxBytes=1000)
+        rh.setFormatter(CountingFormatter())
+        for i in range(3):
+            rh.emit(self.next_rec())
+        rh.close()
+        self.assertEqual(len(formatted), 3)
+
+    def test_rollover_counts_existing_size(self):
+        with open(self.fn, "w") as f:
+            f.write("abcd\n")
+        size = os.path.getsize(self.fn)
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, backupCount=1, maxBytes=size + 3)
+        r1 = logging.makeLogRecord({'msg': 'x'})
+        rh.emit(r1)
+        # The file grows up to maxBytes, exclusive.
+        self.assertFalse(os.path.exists(self.fn + ".1"))
+        rh.emit(logging.makeLogRecord({'msg': 'y'}))
+        self.assertLogFile(self.fn + ".1")
+        rh.close()
+        with open(self.fn + ".1") as f:
+            self.assertEqual(f.read(), "abcd\nx\n")
+        with open(self.fn) as f:
+            self.assertEqual(f.read(), "y\n")
+
+    def test_rollover_counts_encoded_size(self):
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, backupCount=1, maxBytes=6, encoding='utf-8')
+        rh.emit(logging.makeLogRecord({'msg': '\xe9\xe9'}))
+        self.assertFalse(os.path.exists(self.fn + ".1"))
+        rh.emit(logging.makeLogRecord({'msg': 'a'}))
+        self.assertLogFile(self.fn + ".1")
+        rh.close()
+
+    def test_buffering(self):
+        rh = logging.handlers.RotatingFileHandler(self.fn, bufferSize=100)
+        rh.emit(logging.makeLogRecord({'msg': 'one',
+                                       'levelno': logging.INFO}))
+        self.assertEqual(os.path.getsize(self.fn), 0)
+        rh.emit(logging.makeLogRecord({'msg': 'two',
+                                       'levelno': logging.ERROR}))
+        with open(self.fn) as f:
+            self.assertEqual(f.read(), "one\ntwo\n")
+        rh.emit(logging.makeLogRecord({'msg': 'x' * 100,
+                                       'levelno': logging.INFO}))
+        self.assertEqual(os.path.getsize(self.fn), 106 + 3 * len(os.linesep))
+        rh.emit(logging.makeLogRecord({'msg': 'three',
+                                       'levelno': logging.INFO}))
+        rh.close()
+        with open(self.fn) as f:
+            self.assertEqual(f.read().splitlines()[-1], "three")
+
+    def test_buffering_flush_interval(self):
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, bufferSize=100, flushInterval=0)
+        rh.emit(logging.makeLogRecord({'msg': 'one',
+                                       'levelno': logging.INFO}))
+        rh.emit(logging.makeLogRecord({'msg': 'two',
+                                       'levelno': logging.INFO}))
+        with open(self.fn) as f:
+            self.assertEqual(f.read(), "one\ntwo\n")
+        rh.close()
+
+    def test_buffering_flush_interval_checked_on_emit(self):
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, bufferSize=100, flushInterval=0.2)
+        self.addCleanup(rh.close)
+        rh.emit(logging.makeLogRecord({'msg': 'one',
+                                       'levelno': logging.INFO}))
+        time.sleep(0.3)
+        # There is no timer: the buffer waits for the next record.
+        self.assertEqual(os.path.getsize(self.fn), 0)
+        rh.emit(logging.makeLogRecord({'msg': 'two',
+                                       'levelno': logging.INFO}))
+        with open(self.fn) as f:
+            self.assertEqual(f.read(), "one\ntwo\n")
+
+    def test_buffering_rollover(self):
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, backupCount=1, maxBytes=7, bufferSize=100)
+        for msg in ('ab', 'cd', 'ef'):
+            rh.emit(logging.makeLogRecord({'msg': msg,
+                                           'levelno': logging.INFO}))
+        self.assertLogFile(self.fn + ".1")
+        with open(self.fn + ".1") as f:
+            self.assertEqual(f.read(), "ab\ncd\n")
+        rh.close()
+        with open(self.fn) as f:
+            self.assertEqual(f.read(), "ef\n")
+
+    def test_emit_batch(self):
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, backupCount=1, maxBytes=7)
+        writes = []
+        rh.stream.write = writes.append
+        rh.emit_batch([logging.makeLogRecord({'msg': msg})
+                       for msg in ('ab', 'cd')])
+        self.assertEqual(writes, ["ab\ncd\n"])
+        del rh.stream.write
+        rh.emit_batch([logging.makeLogRecord({'msg': msg})
+                       for msg in ('ef', 'gh')])
+        rh.close()
+        self.assertLogFile(self.fn + ".1")
+        with open(self.fn) as f:
+            self.assertEqual(f.read(), "ef\ngh\n")
+
 class TimedRotatingFileHandlerTest(BaseFileTest):
     # other test methods added below
     def test_rollover(self):
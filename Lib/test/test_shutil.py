@@ -10,6 +10,8 @@ import os.path
 import errno
 import functools
 import subprocess
+import io
+import unittest.mock
 from test import support
 from test.support import TESTFN
 from os.path import splitdrive
@@ -185,7 +187,7 @@ class TestShutil(unittest.TestCase):
             errors.append(args)
         shutil.rmtree(filename, onerror=onerror)
         self.assertEqual(len(errors), 2)
-        self.assertIs(errors[0][0], os.listdir)
+        self.assertIs(errors[0][0], os.scandir)
         self.assertEqual(errors[0][1], filename)
         self.assertIsInstance(errors[0][2][1], NotADirectoryError)
         self.assertIn(errors[0][2][1].filename, possible_args)
@@ -244,7 +246,7 @@ class TestShutil(unittest.TestCase):
             elif func is os.rmdir:
                 self.assertEqual(arg, self.child_dir_path)
             else:
-                self.assertIs(func, os.listdir)
+                self.assertIs(func, os.scandir)
                 self.assertIn(arg, [TESTFN, self.child_dir_path])
             self.assertTrue(issubclass(exc[0], OSError))
             self.errorState += 1
@@ -587,7 +589,7 @@ class TestShutil(unittest.TestCase):
     def test_rmtree_uses_safe_fd_version_if_available(self):
         _use_fd_functions = ({os.open, os.stat, os.unlink, os.rmdir} <=
                              os.supports_dir_fd and
-                             os.listdir in os.supports_fd and
+                             os.scandir in os.supports_fd and
                              os.stat in os.supports_follow_symlinks)
         if _use_fd_functions:
             self.assertTrue(shutil._use_fd_functions)
@@ -1698,6 +1700,159 @@ class TestCopyFile(unittest.TestCase):
         finally:
             os.rmdir(dst_dir)
 
+class TestCopyFileObj(unittest.TestCase):
+    FILESIZE = 1024 * 1024 + 10
+
+    @classmethod
+    def setUpClass(cls):
+        cls.FILEDATA = os.urandom(cls.FILESIZE)
+        with open(TESTFN, 'wb') as f:
+            f.write(cls.FILEDATA)
+
+    @classmethod
+    def tearDownClass(cls):
+        support.unlink(TESTFN)
+
+    def tearDown(self):
+        support.unlink(TESTFN2)
+
+    def assert_files_eq(self, src, dst):
+        with open(src, 'rb') as fsrc:
+            with open(dst, 'rb') as fdst:
+                self.assertEqual(fsrc.read(), fdst.read())
+
+    def test_copyfileobj(self):
+        with open(TESTFN, 'rb') as src:
+            with open(TESTFN2, 'wb') as dst:
+                shutil.copyfileobj(src, dst, 1000)
+        self.assert_files_eq(TESTFN, TESTFN2)
+
+    def test_copyfileobj_readinto(self):
+        for length in (1, 1000, self.FILESIZE, self.FILESIZE * 2):
+            with open(TESTFN, 'rb') as src:
+                with open(TESTFN2, 'wb') as dst:
+                    shutil._copyfileobj_readinto(src, dst, length)
+            self.assert_files_eq(TESTFN, TESTFN2)
+
+    def test_copyfileobj_readinto_current_position(self):
+        with open(TESTFN, 'rb') as src:
+            src.seek(100)
+            with open(TESTFN2, 'wb') as dst:
+                shutil._copyfileobj_readinto(src, dst, 1000)
+        with open(TESTFN2, 'rb') as f:
+            self.assertEqual(f.read(), self.FILEDATA[100:])
+
+    def test_copyfile(self):
+        shutil.copyfile(TESTFN, TESTFN2)
+        self.assert_files_eq(TESTFN, TESTFN2)
+
+    def test_copyfile_small(self):
+        with open(TESTFN2 + 'src', 'wb') as f:
+            f.write(b'abc')
+        self.addCleanup(support.unlink, TESTFN2 + 'src')
+        shutil.copyfile(TESTFN2 + 'src', TESTFN2)
+        self.assert_files_eq(TESTFN2 + 'src', TESTFN2)
+
+    def test_copyfile_empty(self):
+        with open(TESTFN2 + 'src', 'wb'):
+            pass
+        self.addCleanup(support.unlink, TESTFN2 + 'src')
+        shutil.copyfile(TESTFN2 + 'src', TESTFN2)
+        self.assertEqual(os.path.getsize(TESTFN2), 0)
+
+    def test_copyfile_without_sendfile(self):
+        with unittest.mock.patch('shutil._USE_CP_SENDFILE', False):
+            with unittest.mock.patch('shutil._fastcopy_sendfile') as m:
+                shutil.copyfile(TESTFN, TESTFN2)
+        self.assertFalse(m.called)
+        self.assert_files_eq(TESTFN, TESTFN2)
+
+
+@unittest.skipUnless(shutil._USE_CP_SENDFILE, 'requires sendfile() on Linux')
+class TestZeroCopySendfile(unittest.TestCase):
+    FILESIZE = 1024 * 1024 + 10
+
+    @classmethod
+    def setUpClass(cls):
+        cls.FILEDATA = os.urandom(cls.FILESIZE)
+        with open(TESTFN, 'wb') as f:
+            f.write(cls.FILEDATA)
+
+    @classmethod
+    def tearDownClass(cls):
+        support.unlink(TESTFN)
+
+    def tearDown(self):
+        support.unlink(TESTFN2)
+        shutil._USE_CP_SENDFILE = True
+
+    def test_regular_copy(self):
+        with unittest.mock.patch('os.sendfile', wraps=os.sendfile) as m:
+            shutil.copyfile(TESTFN, TESTFN2)
+        self.assertTrue(m.called)
+        with open(TESTFN2, 'rb') as f:
+            self.assertEqual(f.read(), self.FILEDATA)
+
+    def test_non_existent_src(self):
+        name = tempfile.mktemp()
+        with self.assertRaises(FileNotFoundError) as cm:
+            shutil.copyfile(name, TESTFN2)
+        self.assertEqual(cm.exception.filename, name)
+
+    def test_non_regular_file_src(self):
+        with open(TESTFN, 'rb') as src:
+            with io.BytesIO() as dst:
+                with self.assertRaises(shutil._GiveupOnFastCopy):
+                    shutil._fastcopy_sendfile(src, dst)
+
+    def test_enotsock_disables_sendfile(self):
+        # sendfile() refusing regular files (Linux < 2.6.33) must make
+        # copyfile() fall back and stop trying on subsequent calls.
+        err = OSError(errno.ENOTSOCK, "Socket operation on non-socket")
+        with unittest.mock.patch('os.sendfile', side_effect=err) as m:
+            shutil.copyfile(TESTFN, TESTFN2)
+            self.assertEqual(m.call_count, 1)
+            self.assertFalse(shutil._USE_CP_SENDFILE)
+            shutil.copyfile(TESTFN, TESTFN2)
+            self.assertEqual(m.call_count, 1)
+        with open(TESTFN2, 'rb') as f:
+            self.assertEqual(f.read(), self.FILEDATA)
+
+    def test_einval_on_first_call_falls_back(self):
+        err = OSError(errno.EINVAL, "Invalid argument")
+        with unittest.mock.patch('os.sendfile', side_effect=err):
+            shutil.copyfile(TESTFN, TESTFN2)
+        self.assertTrue(shutil._USE_CP_SENDFILE)
+        with open(TESTFN2, 'rb') as f:
+            self.assertEqual(f.read(), self.FILEDATA)
+
+    def test_filesystem_full(self):
+        # Emulate a case where the filesystem is full and sendfile()
+        # fails on the first call.
+        err = OSError(errno.ENOSPC, "No space left on device")
+        with unittest.mock.patch('os.sendfile', side_effect=err):
+            with self.assertRaises(OSError) as cm:
+                shutil.copyfile(TESTFN, TESTFN2)
+        self.assertEqual(cm.exception.errno, errno.ENOSPC)
+        self.assertEqual(cm.exception.filename, TESTFN)
+        self.assertEqual(cm.exception.filename2, TESTFN2)
+
+    def test_exception_after_partial_copy(self):
+        # An error once some data has already been written must not be
+        # swallowed by a fallback which would duplicate that data.
+        calls = []
+        orig_sendfile = os.sendfile
+        def sendfile(outfd, infd, offset, count):
+            if calls:
+                raise OSError(errno.EIO, "I/O error")
+            calls.append(offset)
+            return orig_sendfile(outfd, infd, offset, 1000)
+        with unittest.mock.patch('os.sendfile', sendfile):
+            with self.assertRaises(OSError) as cm:
+                shutil.copyfile(TESTFN, TESTFN2)
+        self.assertEqual(cm.exception.errno, errno.EIO)
+
+
 class TermsizeTests(unittest.TestCase):
     def test_does_not_crash(self):
         """Check if get_terminal_size() returns a meaningful value.
@@ -5,8 +5,10 @@ import email
 import urllib.parse
 import urllib.request
 import http.server
+import socketserver
 import unittest
 import hashlib
+import socket
 from test import support
 threading = support.import_module('threading')
 try:
@@ -49,16 +51,21 @@ class LoopbackHttpServer(http.server.HTTPServer):
 
         return (request, client_address)
 
+class ThreadingLoopbackHttpServer(socketserver.ThreadingMixIn,
+                                  LoopbackHttpServer):
+    """Loopback http server serving several connections at a time."""
+
+    daemon_threads = True
+
 class LoopbackHttpServerThread(threading.Thread):
     """Stoppable thread that runs a loopback http server."""
 
-    def __init__(self, request_handler):
+    def __init__(self, request_handler, server_class=LoopbackHttpServer):
         threading.Thread.__init__(self)
         self._stop_server = False
         self.ready = threading.Event()
         request_handler.protocol_version = "HTTP/1.0"
-        self.httpd = LoopbackHttpServer(("127.0.0.1", 0),
-                                        request_handler)
+        self.httpd = server_class(("127.0.0.1", 0), request_handler)
         #print "Serving HTTP on %s port %s" % (self.httpd.server_name,
         #                                      self.httpd.server_port)
         self.port = self.httpd.server_port
@@ -592,9 +599,210 @@ class TestUrlopen(unittest.TestCase):
         self.assertEqual(index + 1, len(lines))
 
 
+class KeepAliveHandler(http.server.BaseHTTPRequestHandler):
+    """Answers every GET with its path, on persistent connections."""
+
+    clients = []
+
+    def do_GET(self):
+        self.clients.append(self.client_address)
+        body = self.path.encode('ascii') * 100
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        if self.path == '/close':
+            # Hang up after the response without telling the client.
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.clients.append(self.client_address)
+        self.send_response(200)
+        self.send_header("Content-Length", "1000")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+class PooledHTTPHandlerTests(unittest.TestCase):
+
+    def setUp(self):
+        super(PooledHTTPHandlerTests, self).setUp()
+        self.old_environ = os.environ.copy()
+        os.environ['NO_PROXY'] = '*'
+        KeepAliveHandler.clients = []
+        # Handlers sharing the pool keep several connections open.
+        self.server = LoopbackHttpServerThread(KeepAliveHandler,
+                                               ThreadingLoopbackHttpServer)
+        KeepAliveHandler.protocol_version = "HTTP/1.1"
+        self.server.start()
+        self.server.ready.wait()
+        self.pool = urllib.request.HTTPConnectionPool(maxsize=2)
+        self.opener = urllib.request.build_opener(
+            urllib.request.PooledHTTPHandler(pool=self.pool))
+        self.url = "http://localhost:%d" % self.server.port
+
+    def tearDown(self):
+        self.pool.clear()
+        self.server.stop()
+        os.environ.clear()
+        os.environ.update(self.old_environ)
+        super(PooledHTTPHandlerTests, self).tearDown()
+
+    def fetch(self, path):
+        with self.opener.open(self.url + path) as f:
+            return f.read()
+
+    def test_reuse(self):
+        self.assertEqual(self.fetch('/a'), b'/a' * 100)
+        self.assertEqual(len(self.pool), 1)
+        self.assertEqual(self.fetch('/b'), b'/b' * 100)
+        self.assertEqual(len(self.pool), 1)
+        clients = KeepAliveHandler.clients
+        self.assertEqual(len(clients), 2)
+        self.assertEqual(clients[0], clients[1])
+
+    def test_partial_read_not_reused(self):
+        f = self.opener.open(self.url + '/a')
+        self.assertEqual(f.read(10), b'/a/a/a/a/a')
+        f.close()
+        self.assertEqual(len(self.pool), 0)
+        self.assertEqual(self.fetch('/b'), b'/b' * 100)
+        clients = KeepAliveHandler.clients
+        self.assertNotEqual(clients[0], clients[1])
+
+    def test_response_without_body(self):
+        req = urllib.request.Request(self.url + '/a', method='HEAD')
+        with self.opener.open(req) as f:
+            # The connection is back in the pool before reading.
+            self.assertEqual(len(self.pool), 1)
+            self.assertEqual(f.read(), b'')
+        self.assertEqual(self.fetch('/b'), b'/b' * 100)
+        clients = KeepAliveHandler.clients
+        self.assertEqual(clients[0], clients[1])
+
+    def test_tls_settings_not_shared(self):
+        # Handlers with different TLS settings sharing a pool do not reuse
+        # each other's connections.
+        class ContextConnection(urllib.request.http.client.HTTPConnection):
+            def __init__(self, host, context=None, check_hostname=None,
+                         **kwargs):
+                super().__init__(host, **kwargs)
+                self.context = context
+
+        class ContextHandler(urllib.request.PooledHTTPHandler):
+            def __init__(self, context, pool):
+                super().__init__(pool=pool)
+                self.context = context
+
+            def http_open(self, req):
+                return self.do_open_pooled(ContextConnection, req,
+                                           context=self.context,
+                                           check_hostname=True)
+
+        opener1 = urllib.request.build_opener(
+            ContextHandler(object(), self.pool))
+        opener2 = urllib.request.build_opener(
+            ContextHandler(object(), self.pool))
+        for opener in (opener1, opener2, opener1):
+            with opener.open(self.url + '/a') as f:
+                self.assertEqual(f.read(), b'/a' * 100)
+        self.assertEqual(len(self.pool), 2)
+        clients = KeepAliveHandler.clients
+        self.assertNotEqual(clients[0], clients[1])
+        self.assertEqual(clients[0], clients[2])
+
+    @unittest.skipUnless(ssl, 'ssl support required')
+    def test_https_handlers_sharing_pool(self):
+        from test.ssl_servers import make_https_server
+        server = make_https_server(self, certfile=CERT_localhost,
+                                   handler_class=KeepAliveHandler)
+        url = 'https://localhost:%d/a' % server.port
+        unverified = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+        verified = ssl.SSLContext(ssl.PROTOCOL_SSLv23)
+        verified.verify_mode = ssl.CERT_REQUIRED
+        verified.load_verify_locations(CERT_fakehostname)
+        opener1 = urllib.request.build_opener(
+            urllib.request.PooledHTTPSHandler(context=unverified,
+                                              pool=self.pool))
+        opener2 = urllib.request.build_opener(
+            urllib.request.PooledHTTPSHandler(context=verified,
+                                              pool=self.pool))
+        with opener1.open(url) as f:
+            self.assertEqual(f.read(), b'/a' * 100)
+        self.assertEqual(len(self.pool), 1)
+        # The verifying handler opens its own connection, and rejects the
+        # certificate.
+        with self.assertRaises(urllib.error.URLError):
+            opener2.open(url)
+        self.assertEqual(len(self.pool), 1)
+
+    def test_connection_closed_by_server(self):
+        self.assertEqual(self.fetch('/close'), b'/close' * 100)
+        self.assertEqual(self.fetch('/b'), b'/b' * 100)
+        self.assertEqual(self.fetch('/c'), b'/c' * 100)
+        clients = KeepAliveHandler.clients
+        self.assertNotEqual(clients[0], clients[1])
+        self.assertEqual(clients[1], clients[2])
+
+
+class HTTPConnectionPoolTests(unittest.TestCase):
+
+    def make_connection(self):
+        conn = urllib.request.http.client.HTTPConnection('localhost')
+        conn.sock, peer = socket.socketpair()
+        self.addCleanup(conn.close)
+        self.addCleanup(peer.close)
+        return conn, peer
+
+    def test_get_put(self):
+        pool = urllib.request.HTTPConnectionPool(maxsize=2)
+        self.assertIsNone(pool.get('key'))
+        conns = [self.make_connection()[0] for i in range(3)]
+        for conn in conns:
+            pool.put('key', conn)
+        self.assertEqual(len(pool), 2)
+        # The connection over the limit was closed.
+        self.assertIsNone(conns[2].sock)
+        self.assertIs(pool.get('key'), conns[1])
+        self.assertIsNone(pool.get('other'))
+        self.assertIs(pool.get('key'), conns[0])
+        self.assertIsNone(pool.get('key'))
+
+    def test_idle_timeout(self):
+        pool = urllib.request.HTTPConnectionPool(idle_timeout=-1)
+        conn, peer = self.make_connection()
+        pool.put('key', conn)
+        self.assertIsNone(pool.get('key'))
+        self.assertIsNone(conn.sock)
+
+    def test_dropped_connection(self):
+        pool = urllib.request.HTTPConnectionPool()
+        conn1, peer1 = self.make_connection()
+        conn2, peer2 = self.make_connection()
+        pool.put('key', conn1)
+        pool.put('key', conn2)
+        peer2.close()
+        self.assertIs(pool.get('key'), conn1)
+        self.assertIsNone(conn2.sock)
+
+    def test_clear(self):
+        pool = urllib.request.HTTPConnectionPool()
+        conn, peer = self.make_connection()
+        pool.put('key', conn)
+        pool.clear()
+        self.assertEqual(len(pool), 0)
+        self.assertIsNone(conn.sock)
+
+    def test_maxsize(self):
+        self.assertRaises(ValueError, urllib.request.HTTPConnectionPool, 0)
+
+
 @support.reap_threads
 def test_main():
-    support.run_unittest(ProxyAuthTests, TestUrlopen)
+    support.run_unittest(ProxyAuthTests, TestUrlopen, PooledHTTPHandlerTests,
+                         HTTPConnectionPoolTests)
 
 if __name__ == "__main__":
     test_main()
@@ -90,6 +90,7 @@ import io
 import os
 import posixpath
 import re
+import select
 import socket
 import sys
 import time
@@ -97,6 +98,10 @@ import collections
 import tempfile
 import contextlib
 import warnings
+try:
+    import threading as _threading
+except ImportError:
+    import dummy_threading as _threading
 
 
 from urllib.error import URLError, HTTPError, ContentTooShortError
@@ -123,7 +128,8 @@ __all__ = [
     'AbstractBasicAuthHandler', 'HTTPBasicAuthHandler', 'ProxyBasicAuthHandler',
     'AbstractDigestAuthHandler', 'HTTPDigestAuthHandler', 'ProxyDigestAuthHandler',
     'HTTPHandler', 'FileHandler', 'FTPHandler', 'CacheFTPHandler', 'DataHandler',
-    'UnknownHandler', 'HTTPErrorProcessor',
+    'UnknownHandler', 'HTTPErrorProcessor', 'HTTPConnectionPool',
+    'PooledHTTPHandler',
     # Functions
     'urlopen', 'install_opener', 'build_opener',
     'pathname2url', 'url2pathname', 'getproxies',
@@ -1205,30 +1211,14 @@ class AbstractHTTPHandler(BaseHandler):
         # will parse host:port
         h = http_class(host, timeout=req.timeout, **http_conn_args)
 
-        headers = dict(req.unredirected_hdrs)
-        headers.update(dict((k, v) for k, v in req.headers.items()
-                            if k not in headers))
-
-        # TODO(jhylton): Should this be redesigned to handle
-        # persistent connections?
-
         # We want to make an HTTP/1.1 request, but the addinfourl
         # class isn't prepared to deal with a persistent connection.
         # It will try to read all remaining data from the socket,
         # which will block while the server waits for the next request.
         # So make sure the connection gets closed after the (only)
-        # request.
-        headers["Connection"] = "close"
-        headers = dict((name.title(), val) for name, val in headers.items())
-
+        # request.  PooledHTTPHandler keeps connections open instead.
+        headers, tunnel_headers = self._get_headers(req, "close")
         if req._tunnel_host:
-            tunnel_headers = {}
-            proxy_auth_hdr = "Proxy-Authorization"
-            if proxy_auth_hdr in headers:
-                tunnel_headers[proxy_auth_hdr] = headers[proxy_auth_hdr]
-                # Proxy-Authorization should not be sent to origin
-                # server.
-                del headers[proxy_auth_hdr]
             h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
 
         try:
@@ -1254,6 +1244,28 @@ class AbstractHTTPHandler(BaseHandler):
         r.msg = r.reason
         return r
 
+    def _get_headers(self, req, connection=None):
+        """Return the headers to send for req, and those for the tunnel.
+
+        The Connection header is set to connection unless it is None.
+        """
+        headers = dict(req.unredirected_hdrs)
+        headers.update(dict((k, v) for k, v in req.headers.items()
+                            if k not in headers))
+        if connection is not None:
+            headers["Connection"] = connection
+        headers = dict((name.title(), val) for name, val in headers.items())
+
+        tunnel_headers = {}
+        if req._tunnel_host:
+            proxy_auth_hdr = "Proxy-Authorization"
+            if proxy_auth_hdr in headers:
+                tunnel_headers[proxy_auth_hdr] = headers[proxy_auth_hdr]
+                # Proxy-Authorization should not be sent to origin
+                # server.
+                del headers[proxy_auth_hdr]
+        return headers, tunnel_headers
+
 
 class HTTPHandler(AbstractHTTPHandler):
 
@@ -1279,6 +1291,235 @@ if hasattr(http.client, 'HTTPSConnection'):
 
     __all__.append('HTTPSHandler')
 
+# Methods which a server may be asked again when a reused connection
+# turned out to be closed, RFC 7230 section 6.3.1.
+_IDEMPOTENT_METHODS = frozenset(
+    ['GET', 'HEAD', 'PUT', 'DELETE', 'OPTIONS', 'TRACE'])
+
+def _connection_dropped(sock):
+    """Return True if an idle connection can no longer be used.
+
+    An idle persistent connection has nothing to read: if its socket is
+    readable, the server closed its end or sent garbage.
+    """
+    if sock is None:
+        return True
+    try:
+        if hasattr(select, 'poll'):
+            poller = select.poll()
+            poller.register(sock, select.POLLIN)
+            return bool(poller.poll(0))
+        return bool(select.select([sock], [], [], 0)[0])
+    except (OSError, ValueError):
+        return True
+
+
+class HTTPConnectionPool:
+    """Idle persistent HTTP connections, shared by PooledHTTPHandler and
+    PooledHTTPSHandler instances.
+
+    At most maxsize idle connections are kept per (scheme, host, port) and
+    TLS settings, each one for at most idle_timeout seconds.  Connections are checked
+    out by a single request at a time; the pool may be shared by several
+    threads.
+    """
+
+    def __init__(self, maxsize=10, idle_timeout=60.0):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.idle_timeout = idle_timeout
+        self._lock = _threading.Lock()
+        # {key: [(connection, time it became idle), ...]}
+        self._idle = {}
+
+    def get(self, key):
+        """Check out an idle connection for key, or return None.
+
+        Connections which expired or were closed by the server are
+        closed and discarded.
+        """
+        deadline = time.monotonic() - self.idle_timeout
+        while True:
+            with self._lock:
+                idle = self._idle.get(key)
+                if not idle:
+                    return None
+                # The most recently used connection is the least likely
+                # to have been closed by the server.
+                conn, idle_since = idle.pop()
+                if not idle:
+                    del self._idle[key]
+            if idle_since >= deadline and not _connection_dropped(conn.sock):
+                return conn
+            conn.close()
+
+    def put(self, key, conn):
+        """Return a connection with no outstanding response to the pool."""
+        with self._lock:
+            idle = self._idle.setdefault(key, [])
+            if len(idle) < self.maxsize:
+                idle.append((conn, time.monotonic()))
+                return
+        conn.close()
+
+    def clear(self):
+        """Close all the idle connections."""
+        with self._lock:
+            idle, self._idle = self._idle, {}
+        for conns in idle.values():
+            for conn, idle_since in conns:
+                conn.close()
+
+    def __len__(self):
+        with self._lock:
+            return sum(len(conns) for conns in self._idle.values())
+
+
+class _PooledHTTPResponse(http.client.HTTPResponse):
+    # Calls _release(response) once the response is done with the
+    # connection; complete is true if the whole body was read, leaving
+    # the connection ready for another request.
+
+    _release = None
+    complete = False
+
+    def _read_and_discard_trailer(self):
+        super()._read_and_discard_trailer()
+        self.complete = True
+
+    def _close_conn(self):
+        if not self.chunked and self.length == 0:
+            self.complete = True
+        super()._close_conn()
+        release = self._release
+        if release is not None:
+            self._release = None
+            release(self)
+
+
+class _PooledHTTPHandlerMixin:
+
+    def _init_pool(self, pool):
+        if pool is None:
+            pool = HTTPConnectionPool()
+        self.pool = pool
+
+    def close(self):
+        self.pool.clear()
+
+    def do_open_pooled(self, http_class, req, **http_conn_args):
+        """Like do_open(), but reuse the connections of self.pool.
+
+        The connection goes back to the pool when the body of the
+        response has been completely read.
+        """
+        host = req.host
+        if not host:
+            raise URLError('no host given')
+        # Connections set up with different TLS settings are kept apart,
+        # so that a handler verifying certificates never gets a connection
+        # opened without verification.  A pooled connection keeps its
+        # context alive, so the id() of the context cannot be reused while
+        # the key is in the pool.
+        key = (http_class, host.lower(), req._tunnel_host,
+               id(http_conn_args.get('context')),
+               http_conn_args.get('check_hostname'))
+
+        headers, tunnel_headers = self._get_headers(req)
+        method = req.get_method()
+        data = req.data
+        retry = (data is None or isinstance(data, (bytes, bytearray)))
+        while True:
+            h = self.pool.get(key) if retry else None
+            reused = h is not None
+            if reused:
+                h.timeout = req.timeout
+                if req.timeout is socket._GLOBAL_DEFAULT_TIMEOUT:
+                    h.sock.settimeout(socket.getdefaulttimeout())
+                else:
+                    h.sock.settimeout(req.timeout)
+            else:
+                h = http_class(host, timeout=req.timeout, **http_conn_args)
+                if req._tunnel_host:
+                    h.set_tunnel(req._tunnel_host, headers=tunnel_headers)
+            h.set_debuglevel(self._debuglevel)
+            h.response_class = _PooledHTTPResponse
+
+            sent = False
+            try:
+                h.request(method, req.selector, data, headers)
+                sent = True
+                r = h.getresponse()
+            except (ConnectionError, http.client.BadStatusLine) as err:
+                h.close()
+                # The server may have closed the reused connection just
+                # before it got the request: try again on a new
+                # connection if sending the request again is harmless.
+                if reused and (not sent or method in _IDEMPOTENT_METHODS):
+                    retry = False
+                    continue
+                if not sent:
+                    raise URLError(err)
+                raise
+            except OSError as err: # timeout error
+                h.close()
+                if not sent:
+                    raise URLError(err)
+                raise
+            except:
+                h.close()
+                raise
+            break
+
+        def release(response):
+            if response.complete and not response.will_close and h.sock:
+                self.pool.put(key, h)
+            else:
+                h.close()
+        r._release = release
+        # Nothing more to read from a response without a body: the
+        # connection is available right away.
+        if not r.chunked and r.length == 0:
+            r._close_conn()
+
+        r.url = req.get_full_url()
+        r.msg = r.reason
+        return r
+
+
+class PooledHTTPHandler(_PooledHTTPHandlerMixin, HTTPHandler):
+    """HTTP handler keeping connections open for subsequent requests.
+
+    Connections are kept in pool, a new HTTPConnectionPool by default.
+    """
+
+    def __init__(self, debuglevel=0, pool=None):
+        HTTPHandler.__init__(self, debuglevel)
+        self._init_pool(pool)
+
+    def http_open(self, req):
+        return self.do_open_pooled(http.client.HTTPConnection, req)
+
+if hasattr(http.client, 'HTTPSConnection'):
+
+    class PooledHTTPSHandler(_PooledHTTPHandlerMixin, HTTPSHandler):
+        """HTTPS handler keeping connections open for subsequent requests.
+
+        Reusing a connection saves both the TCP and the TLS handshakes.
+        """
+
+        def __init__(self, debuglevel=0, context=None, check_hostname=None,
+                     pool=None):
+            HTTPSHandler.__init__(self, debuglevel, context, check_hostname)
+            self._init_pool(pool)
+
+        def https_open(self, req):
+            return self.do_open_pooled(http.client.HTTPSConnection, req,
+                context=self._context, check_hostname=self._check_hostname)
+
+    __all__.append('PooledHTTPSHandler')
+
 class HTTPCookieProcessor(BaseHandler):
     def __init__(self, cookiejar=None):
         import http.cookiejar
@@ -0,0 +1,102 @@
+/*
+ * POSIX named shared memory, used by multiprocessing.shared_memory
+ *
+ * posixshmem.c
+ *
+ * Licensed to PSF under a Contributor Agreement.
+ */
+
+#include "Python.h"
+
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+
+
+PyDoc_STRVAR(shm_open_doc,
+"shm_open(path, flags, mode=0o777) -> fd\n\
+\n\
+Open a shared memory object and return its file descriptor.\n\
+path is the name of the object, which should start with a slash.");
+
+static PyObject *
+posixshmem_shm_open(PyObject *self, PyObject *args, PyObject *kwds)
+{
+    static char *kwlist[] = {"path", "flags", "mode", NULL};
+    PyObject *path;
+    const char *name;
+    int flags, mode = 0777;
+    int fd;
+
+    if (!PyArg_ParseTupleAndKeywords(args, kwds, "Ui|i:shm_open", kwlist,
+                                     &path, &flags, &mode))
+        return NULL;
+    name = PyUnicode_AsUTF8(path);
+    if (name == NULL)
+        return NULL;
+
+    Py_BEGIN_ALLOW_THREADS
+    fd = shm_open(name, flags, (mode_t)mode);
+    Py_END_ALLOW_THREADS
+
+    if (fd < 0)
+        return PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path);
+    return PyLong_FromLong((long)fd);
+}
+
+
+PyDoc_STRVAR(shm_unlink_doc,
+"shm_unlink(path)\n\
+\n\
+Remove a shared memory object.  The memory is released once every\n\
+process which mapped it has unmapped it.");
+
+static PyObject *
+posixshmem_shm_unlink(PyObject *self, PyObject *args)
+{
+    PyObject *path;
+    const char *name;
+    int res;
+
+    if (!PyArg_ParseTuple(args, "U:shm_unlink", &path))
+        return NULL;
+    name = PyUnicode_AsUTF8(path);
+    if (name == NULL)
+        return NULL;
+
+    Py_BEGIN_ALLOW_THREADS
+    res = shm_unlink(name);
+    Py_END_ALLOW_THREADS
+
+    if (res < 0)
+        return PyErr_SetFromErrnoWithFilenameObject(PyExc_OSError, path);
+    Py_RETURN_NONE;
+}
+
+
+static PyMethodDef module_methods[] = {
+    {"shm_open", (PyCFunction)posixshmem_shm_open,
+     METH_VARARGS | METH_KEYWORDS, shm_open_doc},
+    {"shm_unlink", posixshmem_shm_unlink, METH_VARARGS, shm_unlink_doc},
+    {NULL}
+};
+
+
+static struct PyModuleDef posixshmem_module = {
+    PyModuleDef_HEAD_INIT,
+    "_posixshmem",
+    NULL,
+    -1,
+    module_methods,
+    NULL,
+    NULL,
+    NULL,
+    NULL
+};
+
+
+PyMODINIT_FUNC
+PyInit__posixshmem(void)
+{
+    return PyModule_Create(&posixshmem_module);
+}
@@ -1226,6 +1226,100 @@ done:
 }
 
 
+/* -X importtime / PYTHONPROFILEIMPORTTIME support */
+
+static int import_time = -1;
+
+/* Return a timestamp in microseconds for -X importtime, from a monotonic
+   clock when one can be used without extra libraries. */
+static PY_LONG_LONG
+import_time_clock(void)
+{
+#ifdef MS_WINDOWS
+    static LARGE_INTEGER frequency;
+    LARGE_INTEGER now;
+    if (frequency.QuadPart == 0)
+        QueryPerformanceFrequency(&frequency);
+    if (frequency.QuadPart != 0 && QueryPerformanceCounter(&now))
+        return (PY_LONG_LONG)(now.QuadPart * 1000000.0 / frequency.QuadPart);
+#elif defined(HAVE_CLOCK_GETTIME) && defined(CLOCK_MONOTONIC) \
+      && !defined(TIMEMODULE_LIB)
+    struct timespec ts;
+    if (clock_gettime(CLOCK_MONOTONIC, &ts) == 0)
+        return (PY_LONG_LONG)ts.tv_sec * 1000000 + ts.tv_nsec / 1000;
+#endif
+    {
+        _PyTime_timeval tv;
+        _PyTime_gettimeofday(&tv);
+        return (PY_LONG_LONG)tv.tv_sec * 1000000 + tv.tv_usec;
+    }
+}
+
+static int
+import_time_enabled(void)
+{
+    _Py_IDENTIFIER(importtime);
+    PyObject *xoptions;
+    char *p;
+
+    if (import_time >= 0)
+        return import_time;
+    import_time = 0;
+    xoptions = PySys_GetXOptions();
+    if (xoptions != NULL && _PyDict_GetItemId(xoptions, &PyId_importtime))
+        import_time = 1;
+    else if ((p = Py_GETENV("PYTHONPROFILEIMPORTTIME")) && *p != '\0')
+        import_time = 1;
+    if (import_time)
+        fputs("import time: self [us] | cumulative | imported package\n",
+              stderr);
+    return import_time;
+}
+
+/* Call _bootstrap._find_and_load(), printing how long it took to stderr
+   when -X importtime is in effect.  Nested imports are indented by two
+   spaces per level, and their time is excluded from the "self" column of
+   the importing module. */
+static PyObject *
+find_and_load(PyObject *abs_name, PyObject *builtins_import)
+{
+    _Py_IDENTIFIER(_find_and_load);
+    static int import_level;
+    static PY_LONG_LONG accumulated;
+    PyInterpreterState *interp = PyThreadState_GET()->interp;
+    PY_LONG_LONG t1 = 0, accumulated_copy = accumulated;
+    PyObject *mod;
+
+    if (import_time_enabled()) {
+        import_level++;
+        t1 = import_time_clock();
+        accumulated = 0;
+    }
+
+    mod = _PyObject_CallMethodIdObjArgs(interp->importlib,
+                                        &PyId__find_and_load, abs_name,
+                                        builtins_import, NULL);
+
+    if (import_time) {
+        PY_LONG_LONG cum = import_time_clock() - t1;
+        PyObject *exc, *val, *tb;
+        char *name;
+
+        import_level--;
+        PyErr_Fetch(&exc, &val, &tb);
+        name = PyUnicode_AsUTF8(abs_name);
+        if (name == NULL)
+            PyErr_Clear();
+        else
+            fprintf(stderr, "import time: %9" PY_FORMAT_LONG_LONG "d | "
+                    "%10" PY_FORMAT_LONG_LONG "d | %*s%s\n",
+                    cum - accumulated, cum, import_level * 2, "", name);
+        PyErr_Restore(exc, val, tb);
+        accumulated = accumulated_copy + cum;
+    }
+    return mod;
+}
+
 PyObject *
 PyImport_ImportModuleLevelObject(PyObject *name, PyObject *given_globals,
                                  PyObject *locals, PyObject *given_fromlist,
@@ -1237,7 +1331,6 @@ PyImport_ImportModuleLevelObject(PyObject *name, PyObject *given_globals,
     _Py_IDENTIFIER(__package__);
     _Py_IDENTIFIER(__path__);
     _Py_IDENTIFIER(__name__);
-    _Py_IDENTIFIER(_find_and_load);
     _Py_IDENTIFIER(_handle_fromlist);
     _Py_IDENTIFIER(_lock_unlock_module);
     _Py_static_string(single_dot, ".");
@@ -1470,9 +1563,7 @@ PyImport_ImportModuleLevelObject(PyObject *name, PyObject *given_globals,
     }
     else {
         /* _bootstrap._find_and_load() releases the import lock */
-        mod = _PyObject_CallMethodIdObjArgs(interp->importlib,
-                                            &PyId__find_and_load, abs_name,
-                                            builtins_import, NULL);
+        mod = find_and_load(abs_name, builtins_import);
         if (mod == NULL) {
             goto error;
         }
@@ -1,1549 +1,1574 @@
 /* Auto-generated by Modules/_freeze_importlib.c */
 const unsigned char _Py_M__importlib[] = {
     99,0,0,0,0,0,0,0,0,0,0,0,0,7,0,0,
-    0,64,0,0,0,115,201,4,0,0,100,0,0,90,0,0,
-    100,159,0,90,1,0,100,4,0,100,5,0,132,0,0,90,
+    0,64,0,0,0,115,225,4,0,0,100,0,0,90,0,0,
+    100,163,0,90,1,0,100,4,0,100,5,0,132,0,0,90,
     2,0,100,6,0,100,7,0,132,0,0,90,3,0,100,8,
     0,100,9,0,132,0,0,90,4,0,100,10,0,100,11,0,
     132,0,0,90,5,0,100,12,0,100,13,0,132,0,0,90,
     6,0,100,14,0,100,15,0,132,0,0,90,7,0,100,16,
     0,100,17,0,132,0,0,90,8,0,100,18,0,100,19,0,
     132,0,0,90,9,0,100,20,0,100,21,0,132,0,0,90,
-    10,0,100,22,0,100,23,0,100,24,0,132,1,0,90,11,
-    0,100,25,0,100,26,0,132,0,0,90,12,0,100,27,0,
-    100,28,0,132,0,0,90,13,0,101,14,0,101,12,0,106,
-    15,0,131,1,0,90,16,0,71,100,29,0,100,30,0,132,
-    0,0,100,30,0,131,2,0,90,17,0,105,0,0,90,18,
-    0,105,0,0,90,19,0,71,100,31,0,100,32,0,132,0,
-    0,100,32,0,101,20,0,131,3,0,90,21,0,71,100,33,
-    0,100,34,0,132,0,0,100,34,0,131,2,0,90,22,0,
-    71,100,35,0,100,36,0,132,0,0,100,36,0,131,2,0,
-    90,23,0,71,100,37,0,100,38,0,132,0,0,100,38,0,
-    131,2,0,90,24,0,100,39,0,100,40,0,132,0,0,90,
+    10,0,100,22,0,100,23,0,132,0,0,90,11,0,100,24,
+    0,100,25,0,100,26,0,132,1,0,90,12,0,100,27,0,
+    100,28,0,132,0,0,90,13,0,100,29,0,100,30,0,132,
+    0,0,90,14,0,101,15,0,101,13,0,106,16,0,131,1,
+    0,90,17,0,71,100,31,0,100,32,0,132,0,0,100,32,
+    0,131,2,0,90,18,0,105,0,0,90,19,0,105,0,0,
+    90,20,0,71,100,33,0,100,34,0,132,0,0,100,34,0,
+    101,21,0,131,3,0,90,22,0,71,100,35,0,100,36,0,
+    132,0,0,100,36,0,131,2,0,90,23,0,71,100,37,0,
+    100,38,0,132,0,0,100,38,0,131,2,0,90,24,0,71,
+    100,39,0,100,40,0,132,0,0,100,40,0,131,2,0,90,
     25,0,100,41,0,100,42,0,132,0,0,90,26,0,100,43,
-    0,100,44,0,132,0,0,90,27,0,100,45,0,106,28,0,
-    100,46,0,100,47,0,131,2,0,100,48,0,23,90,29,0,
-    101,30,0,106,31,0,101,29,0,100,47,0,131,2,0,90,
-    32,0,100,49,0,90,33,0,100,50,0,103,1,0,90,34,
-    0,100,51,0,103,1,0,90,35,0,100,52,0,103,1,0,
-    90,36,0,100,53,0,100,54,0,100,55,0,132,1,0,90,
-    37,0,100,56,0,100,57,0,132,0,0,90,38,0,100,58,
-    0,100,59,0,132,0,0,90,39,0,100,60,0,100,61,0,
-    132,0,0,90,40,0,100,62,0,100,63,0,100,64,0,100,
-    65,0,132,0,1,90,41,0,100,66,0,100,67,0,132,0,
-    0,90,42,0,100,68,0,100,69,0,132,0,0,90,43,0,
-    100,70,0,100,71,0,132,0,0,90,44,0,100,72,0,100,
-    73,0,132,0,0,90,45,0,100,74,0,100,75,0,132,0,
-    0,90,46,0,100,53,0,100,53,0,100,53,0,100,76,0,
-    100,77,0,132,3,0,90,47,0,100,53,0,100,53,0,100,
-    53,0,100,78,0,100,79,0,132,3,0,90,48,0,100,80,
-    0,100,80,0,100,81,0,100,82,0,132,2,0,90,49,0,
-    100,83,0,100,84,0,132,0,0,90,50,0,100,85,0,100,
-    86,0,132,0,0,90,51,0,71,100,87,0,100,88,0,132,
-    0,0,100,88,0,131,2,0,90,52,0,71,100,89,0,100,
-    90,0,132,0,0,100,90,0,131,2,0,90,53,0,100,91,
-    0,100,53,0,100,92,0,100,53,0,100,93,0,100,94,0,
-    132,0,2,90,54,0,101,55,0,131,0,0,90,56,0,100,
-    53,0,100,95,0,100,53,0,100,96,0,101,56,0,100,97,
-    0,100,98,0,132,1,2,90,57,0,100,53,0,100,53,0,
-    100,99,0,100,100,0,132,2,0,90,58,0,71,100,101,0,
-    100,102,0,132,0,0,100,102,0,131,2,0,90,59,0,71,
-    100,103,0,100,104,0,132,0,0,100,104,0,131,2,0,90,
-    60,0,71,100,105,0,100,106,0,132,0,0,100,106,0,131,
-    2,0,90,61,0,71,100,107,0,100,108,0,132,0,0,100,
-    108,0,131,2,0,90,62,0,71,100,109,0,100,110,0,132,
-    0,0,100,110,0,131,2,0,90,63,0,71,100,111,0,100,
-    112,0,132,0,0,100,112,0,101,63,0,131,3,0,90,64,
-    0,71,100,113,0,100,114,0,132,0,0,100,114,0,131,2,
-    0,90,65,0,71,100,115,0,100,116,0,132,0,0,100,116,
-    0,101,65,0,101,64,0,131,4,0,90,66,0,71,100,117,
-    0,100,118,0,132,0,0,100,118,0,101,65,0,101,63,0,
-    131,4,0,90,67,0,103,0,0,90,68,0,71,100,119,0,
-    100,120,0,132,0,0,100,120,0,131,2,0,90,69,0,71,
-    100,121,0,100,122,0,132,0,0,100,122,0,131,2,0,90,
-    70,0,71,100,123,0,100,124,0,132,0,0,100,124,0,131,
-    2,0,90,71,0,71,100,125,0,100,126,0,132,0,0,100,
-    126,0,131,2,0,90,72,0,71,100,127,0,100,128,0,132,
-    0,0,100,128,0,131,2,0,90,73,0,71,100,129,0,100,
-    130,0,132,0,0,100,130,0,131,2,0,90,74,0,100,131,
-    0,100,132,0,132,0,0,90,75,0,100,53,0,100,133,0,
-    100,134,0,132,1,0,90,76,0,100,135,0,100,136,0,132,
-    0,0,90,77,0,100,137,0,90,78,0,101,78,0,100,138,
-    0,23,90,79,0,100,139,0,100,140,0,132,0,0,90,80,
-    0,100,141,0,100,142,0,132,0,0,90,81,0,100,53,0,
-    100,80,0,100,143,0,100,144,0,132,2,0,90,82,0,100,
-    145,0,100,146,0,132,0,0,90,83,0,100,147,0,100,148,
-    0,132,0,0,90,84,0,100,149,0,100,150,0,132,0,0,
-    90,85,0,100,53,0,100,53,0,102,0,0,100,80,0,100,
-    151,0,100,152,0,132,4,0,90,86,0,100,153,0,100,154,
-    0,132,0,0,90,87,0,100,155,0,100,156,0,132,0,0,
-    90,88,0,100,157,0,100,158,0,132,0,0,90,89,0,100,
-    53,0,83,41,160,97,83,1,0,0,67,111,114,101,32,105,
-    109,112,108,101,109,101,110,116,97,116,105,111,110,32,111,102,
-    32,105,109,112,111,114,116,46,10,10,84,104,105,115,32,109,
-    111,100,117,108,101,32,105,115,32,78,79,84,32,109,101,97,
-    110,116,32,116,111,32,98,101,32,100,105,114,101,99,116,108,
-    121,32,105,109,112,111,114,116,101,100,33,32,73,116,32,104,
-    97,115,32,98,101,101,110,32,100,101,115,105,103,110,101,100,
-    32,115,117,99,104,10,116,104,97,116,32,105,116,32,99,97,
-    110,32,98,101,32,98,111,111,116,115,116,114,97,112,112,101,
-    100,32,105,110,116,111,32,80,121,116,104,111,110,32,97,115,
-    32,116,104,101,32,105,109,112,108,101,109,101,110,116,97,116,
-    105,111,110,32,111,102,32,105,109,112,111,114,116,46,32,65,
-    115,10,115,117,99,104,32,105,116,32,114,101,113,117,105,114,
-    101,115,32,116,104,101,32,105,110,106,101,99,116,105,111,110,
-    32,111,102,32,115,112,101,99,105,102,105,99,32,109,111,100,
-    117,108,101,115,32,97,110,100,32,97,116,116,114,105,98,117,
-    116,101,115,32,105,110,32,111,114,100,101,114,32,116,111,10,
-    119,111,114,107,46,32,79,110,101,32,115,104,111,117,108,100,
-    32,117,115,101,32,105,109,112,111,114,116,108,105,98,32,97,
-    115,32,116,104,101,32,112,117,98,108,105,99,45,102,97,99,
-    105,110,103,32,118,101,114,115,105,111,110,32,111,102,32,116,
-    104,105,115,32,109,111,100,117,108,101,46,10,10,218,3,119,
-    105,110,218,6,99,121,103,119,105,110,218,6,100,97,114,119,
-    105,110,99,0,0,0,0,0,0,0,0,1,0,0,0,2,
-    0,0,0,67,0,0,0,115,49,0,0,0,116,0,0,106,
-    1,0,106,2,0,116,3,0,131,1,0,114,33,0,100,1,
-    0,100,2,0,132,0,0,125,0,0,110,12,0,100,3,0,
-    100,2,0,132,0,0,125,0,0,124,0,0,83,41,4,78,
-    99,0,0,0,0,0,0,0,0,0,0,0,0,2,0,0,
-    0,83,0,0,0,115,13,0,0,0,100,1,0,116,0,0,
-    106,1,0,107,6,0,83,41,2,122,53,84,114,117,101,32,
-    105,102,32,102,105,108,101,110,97,109,101,115,32,109,117,115,
-    116,32,98,101,32,99,104,101,99,107,101,100,32,99,97,115,
-    101,45,105,110,115,101,110,115,105,116,105,118,101,108,121,46,
-    115,12,0,0,0,80,89,84,72,79,78,67,65,83,69,79,
-    75,41,2,218,3,95,111,115,90,7,101,110,118,105,114,111,
-    110,169,0,114,4,0,0,0,114,4,0,0,0,250,29,60,
-    102,114,111,122,101,110,32,105,109,112,111,114,116,108,105,98,
-    46,95,98,111,111,116,115,116,114,97,112,62,218,11,95,114,
-    101,108,97,120,95,99,97,115,101,30,0,0,0,115,2,0,
-    0,0,0,2,122,37,95,109,97,107,101,95,114,101,108,97,
-    120,95,99,97,115,101,46,60,108,111,99,97,108,115,62,46,
-    95,114,101,108,97,120,95,99,97,115,101,99,0,0,0,0,
-    0,0,0,0,0,0,0,0,1,0,0,0,83,0,0,0,
-    115,4,0,0,0,100,1,0,83,41,2,122,53,84,114,117,
-    101,32,105,102,32,102,105,108,101,110,97,109,101,115,32,109,
-    117,115,116,32,98,101,32,99,104,101,99,107,101,100,32,99,
-    97,115,101,45,105,110,115,101,110,115,105,116,105,118,101,108,
-    121,46,70,114,4,0,0,0,114,4,0,0,0,114,4,0,
-    0,0,114,4,0,0,0,114,5,0,0,0,114,6,0,0,
-    0,34,0,0,0,115,2,0,0,0,0,2,41,4,218,3,
-    115,121,115,218,8,112,108,97,116,102,111,114,109,218,10,115,
-    116,97,114,116,115,119,105,116,104,218,27,95,67,65,83,69,
-    95,73,78,83,69,78,83,73,84,73,86,69,95,80,76,65,
-    84,70,79,82,77,83,41,1,114,6,0,0,0,114,4,0,
-    0,0,114,4,0,0,0,114,5,0,0,0,218,16,95,109,
-    97,107,101,95,114,101,108,97,120,95,99,97,115,101,28,0,
-    0,0,115,8,0,0,0,0,1,18,1,15,4,12,3,114,
-    11,0,0,0,99,1,0,0,0,0,0,0,0,1,0,0,
-    0,3,0,0,0,67,0,0,0,115,26,0,0,0,116,0,
-    0,124,0,0,131,1,0,100,1,0,64,106,1,0,100,2,
-    0,100,3,0,131,2,0,83,41,4,122,42,67,111,110,118,
-    101,114,116,32,97,32,51,50,45,98,105,116,32,105,110,116,
-    101,103,101,114,32,116,111,32,108,105,116,116,108,101,45,101,
-    110,100,105,97,110,46,108,3,0,0,0,255,127,255,127,3,
-    0,233,4,0,0,0,218,6,108,105,116,116,108,101,41,2,
-    218,3,105,110,116,218,8,116,111,95,98,121,116,101,115,41,
-    1,218,1,120,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,218,7,95,119,95,108,111,110,103,40,0,0,0,
-    115,2,0,0,0,0,2,114,17,0,0,0,99,1,0,0,
+    0,100,44,0,132,0,0,90,27,0,100,45,0,100,46,0,
+    132,0,0,90,28,0,100,47,0,106,29,0,100,48,0,100,
+    49,0,131,2,0,100,50,0,23,90,30,0,101,31,0,106,
+    32,0,101,30,0,100,49,0,131,2,0,90,33,0,100,51,
+    0,90,34,0,100,52,0,90,35,0,100,53,0,90,36,0,
+    100,54,0,103,1,0,90,37,0,100,55,0,103,1,0,90,
+    38,0,100,56,0,103,1,0,90,39,0,100,57,0,100,58,
+    0,100,59,0,132,1,0,90,40,0,100,60,0,100,61,0,
+    132,0,0,90,41,0,100,62,0,100,63,0,132,0,0,90,
+    42,0,100,64,0,100,65,0,132,0,0,90,43,0,100,66,
+    0,100,67,0,100,68,0,100,69,0,132,0,1,90,44,0,
+    100,70,0,100,71,0,132,0,0,90,45,0,100,72,0,100,
+    73,0,132,0,0,90,46,0,100,74,0,100,75,0,132,0,
+    0,90,47,0,100,76,0,100,77,0,132,0,0,90,48,0,
+    100,78,0,100,79,0,132,0,0,90,49,0,100,57,0,100,
+    57,0,100,57,0,100,80,0,100,81,0,132,3,0,90,50,
+    0,100,57,0,100,57,0,100,57,0,100,82,0,100,83,0,
+    132,3,0,90,51,0,100,84,0,100,84,0,100,85,0,100,
+    86,0,132,2,0,90,52,0,100,87,0,100,88,0,132,0,
+    0,90,53,0,100,89,0,100,90,0,132,0,0,90,54,0,
+    71,100,91,0,100,92,0,132,0,0,100,92,0,131,2,0,
+    90,55,0,71,100,93,0,100,94,0,132,0,0,100,94,0,
+    131,2,0,90,56,0,100,95,0,100,57,0,100,96,0,100,
+    57,0,100,97,0,100,98,0,132,0,2,90,57,0,101,58,
+    0,131,0,0,90,59,0,100,57,0,100,99,0,100,57,0,
+    100,100,0,101,59,0,100,101,0,100,102,0,132,1,2,90,
+    60,0,100,57,0,100,57,0,100,103,0,100,104,0,132,2,
+    0,90,61,0,71,100,105,0,100,106,0,132,0,0,100,106,
+    0,131,2,0,90,62,0,71,100,107,0,100,108,0,132,0,
+    0,100,108,0,131,2,0,90,63,0,71,100,109,0,100,110,
+    0,132,0,0,100,110,0,131,2,0,90,64,0,71,100,111,
+    0,100,112,0,132,0,0,100,112,0,131,2,0,90,65,0,
+    71,100,113,0,100,114,0,132,0,0,100,114,0,131,2,0,
+    90,66,0,71,100,115,0,100,116,0,132,0,0,100,116,0,
+    101,66,0,131,3,0,90,67,0,71,100,117,0,100,118,0,
+    132,0,0,100,118,0,131,2,0,90,68,0,71,100,119,0,
+    100,120,0,132,0,0,100,120,0,101,68,0,101,67,0,131,
+    4,0,90,69,0,71,100,121,0,100,122,0,132,0,0,100,
+    122,0,101,68,0,101,66,0,131,4,0,90,70,0,103,0,
+    0,90,71,0,71,100,123,0,100,124,0,132,0,0,100,124,
+    0,131,2,0,90,72,0,71,100,125,0,100,126,0,132,0,
+    0,100,126,0,131,2,0,90,73,0,71,100,127,0,100,128,
+    0,132,0,0,100,128,0,131,2,0,90,74,0,71,100,129,
+    0,100,130,0,132,0,0,100,130,0,131,2,0,90,75,0,
+    71,100,131,0,100,132,0,132,0,0,100,132,0,131,2,0,
+    90,76,0,71,100,133,0,100,134,0,132,0,0,100,134,0,
+    131,2,0,90,77,0,100,135,0,100,136,0,132,0,0,90,
+    78,0,100,57,0,100,137,0,100,138,0,132,1,0,90,79,
+    0,100,139,0,100,140,0,132,0,0,90,80,0,100,141,0,
+    90,81,0,101,81,0,100,142,0,23,90,82,0,100,143,0,
+    100,144,0,132,0,0,90,83,0,100,145,0,100,146,0,132,
+    0,0,90,84,0,100,57,0,100,84,0,100,147,0,100,148,
+    0,132,2,0,90,85,0,100,149,0,100,150,0,132,0,0,
+    90,86,0,100,151,0,100,152,0,132,0,0,90,87,0,100,
+    153,0,100,154,0,132,0,0,90,88,0,100,57,0,100,57,
+    0,102,0,0,100,84,0,100,155,0,100,156,0,132,4,0,
+    90,89,0,100,157,0,100,158,0,132,0,0,90,90,0,100,
+    159,0,100,160,0,132,0,0,90,91,0,100,161,0,100,162,
+    0,132,0,0,90,92,0,100,57,0,83,41,164,97,83,1,
+    0,0,67,111,114,101,32,105,109,112,108,101,109,101,110,116,
+    97,116,105,111,110,32,111,102,32,105,109,112,111,114,116,46,
+    10,10,84,104,105,115,32,109,111,100,117,108,101,32,105,115,
+    32,78,79,84,32,109,101,97,110,116,32,116,111,32,98,101,
+    32,100,105,114,101,99,116,108,121,32,105,109,112,111,114,116,
+    101,100,33,32,73,116,32,104,97,115,32,98,101,101,110,32,
+    100,101,115,105,103,110,101,100,32,115,117,99,104,10,116,104,
+    97,116,32,105,116,32,99,97,110,32,98,101,32,98,111,111,
+    116,115,116,114,97,112,112,101,100,32,105,110,116,111,32,80,
+    121,116,104,111,110,32,97,115,32,116,104,101,32,105,109,112,
+    108,101,109,101,110,116,97,116,105,111,110,32,111,102,32,105,
+    109,112,111,114,116,46,32,65,115,10,115,117,99,104,32,105,
+    116,32,114,101,113,117,105,114,101,115,32,116,104,101,32,105,
+    110,106,101,99,116,105,111,110,32,111,102,32,115,112,101,99,
+    105,102,105,99,32,109,111,100,117,108,101,115,32,97,110,100,
+    32,97,116,116,114,105,98,117,116,101,115,32,105,110,32,111,
+    114,100,101,114,32,116,111,10,119,111,114,107,46,32,79,110,
+    101,32,115,104,111,117,108,100,32,117,115,101,32,105,109,112,
+    111,114,116,108,105,98,32,97,115,32,116,104,101,32,112,117,
+    98,108,105,99,45,102,97,99,105,110,103,32,118,101,114,115,
+    105,111,110,32,111,102,32,116,104,105,115,32,109,111,100,117,
+    108,101,46,10,10,218,3,119,105,110,218,6,99,121,103,119,
+    105,110,218,6,100,97,114,119,105,110,99,0,0,0,0,0,
+    0,0,0,1,0,0,0,2,0,0,0,67,0,0,0,115,
+    49,0,0,0,116,0,0,106,1,0,106,2,0,116,3,0,
+    131,1,0,114,33,0,100,1,0,100,2,0,132,0,0,125,
+    0,0,110,12,0,100,3,0,100,2,0,132,0,0,125,0,
+    0,124,0,0,83,41,4,78,99,0,0,0,0,0,0,0,
+    0,0,0,0,0,2,0,0,0,83,0,0,0,115,13,0,
+    0,0,100,1,0,116,0,0,106,1,0,107,6,0,83,41,
+    2,122,53,84,114,117,101,32,105,102,32,102,105,108,101,110,
+    97,109,101,115,32,109,117,115,116,32,98,101,32,99,104,101,
+    99,107,101,100,32,99,97,115,101,45,105,110,115,101,110,115,
+    105,116,105,118,101,108,121,46,115,12,0,0,0,80,89,84,
+    72,79,78,67,65,83,69,79,75,41,2,218,3,95,111,115,
+    218,7,101,110,118,105,114,111,110,169,0,114,5,0,0,0,
+    114,5,0,0,0,250,29,60,102,114,111,122,101,110,32,105,
+    109,112,111,114,116,108,105,98,46,95,98,111,111,116,115,116,
+    114,97,112,62,218,11,95,114,101,108,97,120,95,99,97,115,
+    101,30,0,0,0,115,2,0,0,0,0,2,122,37,95,109,
+    97,107,101,95,114,101,108,97,120,95,99,97,115,101,46,60,
+    108,111,99,97,108,115,62,46,95,114,101,108,97,120,95,99,
+    97,115,101,99,0,0,0,0,0,0,0,0,0,0,0,0,
+    1,0,0,0,83,0,0,0,115,4,0,0,0,100,1,0,
+    83,41,2,122,53,84,114,117,101,32,105,102,32,102,105,108,
+    101,110,97,109,101,115,32,109,117,115,116,32,98,101,32,99,
+    104,101,99,107,101,100,32,99,97,115,101,45,105,110,115,101,
+    110,115,105,116,105,118,101,108,121,46,70,114,5,0,0,0,
+    114,5,0,0,0,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,114,7,0,0,0,34,0,0,0,115,2,0,
+    0,0,0,2,41,4,218,3,115,121,115,218,8,112,108,97,
+    116,102,111,114,109,218,10,115,116,97,114,116,115,119,105,116,
+    104,218,27,95,67,65,83,69,95,73,78,83,69,78,83,73,
+    84,73,86,69,95,80,76,65,84,70,79,82,77,83,41,1,
+    114,7,0,0,0,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,218,16,95,109,97,107,101,95,114,101,108,97,
+    120,95,99,97,115,101,28,0,0,0,115,8,0,0,0,0,
+    1,18,1,15,4,12,3,114,12,0,0,0,99,0,0,0,
     0,0,0,0,0,1,0,0,0,3,0,0,0,67,0,0,
-    0,115,16,0,0,0,116,0,0,106,1,0,124,0,0,100,
-    1,0,131,2,0,83,41,2,122,47,67,111,110,118,101,114,
-    116,32,52,32,98,121,116,101,115,32,105,110,32,108,105,116,
-    116,108,101,45,101,110,100,105,97,110,32,116,111,32,97,110,
-    32,105,110,116,101,103,101,114,46,114,13,0,0,0,41,2,
-    114,14,0,0,0,218,10,102,114,111,109,95,98,121,116,101,
-    115,41,1,90,9,105,110,116,95,98,121,116,101,115,114,4,
-    0,0,0,114,4,0,0,0,114,5,0,0,0,218,7,95,
-    114,95,108,111,110,103,45,0,0,0,115,2,0,0,0,0,
-    2,114,19,0,0,0,99,0,0,0,0,0,0,0,0,1,
-    0,0,0,3,0,0,0,71,0,0,0,115,26,0,0,0,
-    116,0,0,106,1,0,100,1,0,100,2,0,132,0,0,124,
-    0,0,68,131,1,0,131,1,0,83,41,3,122,31,82,101,
-    112,108,97,99,101,109,101,110,116,32,102,111,114,32,111,115,
-    46,112,97,116,104,46,106,111,105,110,40,41,46,99,1,0,
-    0,0,0,0,0,0,2,0,0,0,4,0,0,0,83,0,
-    0,0,115,37,0,0,0,103,0,0,124,0,0,93,27,0,
-    125,1,0,124,1,0,114,6,0,124,1,0,106,0,0,116,
-    1,0,131,1,0,145,2,0,113,6,0,83,114,4,0,0,
-    0,41,2,218,6,114,115,116,114,105,112,218,15,112,97,116,
-    104,95,115,101,112,97,114,97,116,111,114,115,41,2,218,2,
-    46,48,218,4,112,97,114,116,114,4,0,0,0,114,4,0,
-    0,0,114,5,0,0,0,250,10,60,108,105,115,116,99,111,
-    109,112,62,52,0,0,0,115,2,0,0,0,9,1,122,30,
-    95,112,97,116,104,95,106,111,105,110,46,60,108,111,99,97,
-    108,115,62,46,60,108,105,115,116,99,111,109,112,62,41,2,
-    218,8,112,97,116,104,95,115,101,112,218,4,106,111,105,110,
-    41,1,218,10,112,97,116,104,95,112,97,114,116,115,114,4,
-    0,0,0,114,4,0,0,0,114,5,0,0,0,218,10,95,
-    112,97,116,104,95,106,111,105,110,50,0,0,0,115,4,0,
-    0,0,0,2,15,1,114,28,0,0,0,99,1,0,0,0,
-    0,0,0,0,5,0,0,0,5,0,0,0,67,0,0,0,
-    115,134,0,0,0,116,0,0,116,1,0,131,1,0,100,1,
-    0,107,2,0,114,52,0,124,0,0,106,2,0,116,3,0,
-    131,1,0,92,3,0,125,1,0,125,2,0,125,3,0,124,
-    1,0,124,3,0,102,2,0,83,120,69,0,116,4,0,124,
-    0,0,131,1,0,68,93,55,0,125,4,0,124,4,0,116,
-    1,0,107,6,0,114,65,0,124,0,0,106,5,0,124,4,
-    0,100,2,0,100,1,0,131,1,1,92,2,0,125,1,0,
-    125,3,0,124,1,0,124,3,0,102,2,0,83,113,65,0,
-    87,100,3,0,124,0,0,102,2,0,83,41,4,122,32,82,
-    101,112,108,97,99,101,109,101,110,116,32,102,111,114,32,111,
-    115,46,112,97,116,104,46,115,112,108,105,116,40,41,46,233,
-    1,0,0,0,90,8,109,97,120,115,112,108,105,116,218,0,
-    41,6,218,3,108,101,110,114,21,0,0,0,218,10,114,112,
-    97,114,116,105,116,105,111,110,114,25,0,0,0,218,8,114,
-    101,118,101,114,115,101,100,218,6,114,115,112,108,105,116,41,
-    5,218,4,112,97,116,104,90,5,102,114,111,110,116,218,1,
-    95,218,4,116,97,105,108,114,16,0,0,0,114,4,0,0,
-    0,114,4,0,0,0,114,5,0,0,0,218,11,95,112,97,
-    116,104,95,115,112,108,105,116,56,0,0,0,115,16,0,0,
-    0,0,2,18,1,24,1,10,1,19,1,12,1,27,1,14,
-    1,114,38,0,0,0,99,1,0,0,0,0,0,0,0,1,
-    0,0,0,2,0,0,0,67,0,0,0,115,13,0,0,0,
-    116,0,0,106,1,0,124,0,0,131,1,0,83,41,1,122,
-    126,83,116,97,116,32,116,104,101,32,112,97,116,104,46,10,
-    10,32,32,32,32,77,97,100,101,32,97,32,115,101,112,97,
-    114,97,116,101,32,102,117,110,99,116,105,111,110,32,116,111,
-    32,109,97,107,101,32,105,116,32,101,97,115,105,101,114,32,
-    116,111,32,111,118,101,114,114,105,100,101,32,105,110,32,101,
-    120,112,101,114,105,109,101,110,116,115,10,32,32,32,32,40,
-    101,46,103,46,32,99,97,99,104,101,32,115,116,97,116,32,
-    114,101,115,117,108,116,115,41,46,10,10,32,32,32,32,41,
-    2,114,3,0,0,0,90,4,115,116,97,116,41,1,114,35,
-    0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,0,
-    0,0,218,10,95,112,97,116,104,95,115,116,97,116,68,0,
-    0,0,115,2,0,0,0,0,7,114,39,0,0,0,99,2,
-    0,0,0,0,0,0,0,3,0,0,0,11,0,0,0,67,
-    0,0,0,115,58,0,0,0,121,16,0,116,0,0,124,0,
-    0,131,1,0,125,2,0,87,110,22,0,4,116,1,0,107,
-    10,0,114,40,0,1,1,1,100,1,0,83,89,110,1,0,
-    88,124,2,0,106,2,0,100,2,0,64,124,1,0,107,2,
-    0,83,41,3,122,49,84,101,115,116,32,119,104,101,116,104,
-    101,114,32,116,104,101,32,112,97,116,104,32,105,115,32,116,
-    104,101,32,115,112,101,99,105,102,105,101,100,32,109,111,100,
-    101,32,116,121,112,101,46,70,105,0,240,0,0,41,3,114,
-    39,0,0,0,218,7,79,83,69,114,114,111,114,218,7,115,
-    116,95,109,111,100,101,41,3,114,35,0,0,0,218,4,109,
-    111,100,101,90,9,115,116,97,116,95,105,110,102,111,114,4,
-    0,0,0,114,4,0,0,0,114,5,0,0,0,218,18,95,
-    112,97,116,104,95,105,115,95,109,111,100,101,95,116,121,112,
-    101,78,0,0,0,115,10,0,0,0,0,2,3,1,16,1,
-    13,1,9,1,114,43,0,0,0,99,1,0,0,0,0,0,
-    0,0,1,0,0,0,3,0,0,0,67,0,0,0,115,13,
-    0,0,0,116,0,0,124,0,0,100,1,0,131,2,0,83,
-    41,2,122,31,82,101,112,108,97,99,101,109,101,110,116,32,
-    102,111,114,32,111,115,46,112,97,116,104,46,105,115,102,105,
-    108,101,46,105,0,128,0,0,41,1,114,43,0,0,0,41,
-    1,114,35,0,0,0,114,4,0,0,0,114,4,0,0,0,
-    114,5,0,0,0,218,12,95,112,97,116,104,95,105,115,102,
-    105,108,101,87,0,0,0,115,2,0,0,0,0,2,114,44,
-    0,0,0,99,1,0,0,0,0,0,0,0,1,0,0,0,
-    3,0,0,0,67,0,0,0,115,34,0,0,0,124,0,0,
-    115,21,0,116,0,0,106,1,0,131,0,0,125,0,0,110,
-    0,0,116,2,0,124,0,0,100,1,0,131,2,0,83,41,
-    2,122,30,82,101,112,108,97,99,101,109,101,110,116,32,102,
-    111,114,32,111,115,46,112,97,116,104,46,105,115,100,105,114,
-    46,105,0,64,0,0,41,3,114,3,0,0,0,218,6,103,
-    101,116,99,119,100,114,43,0,0,0,41,1,114,35,0,0,
-    0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,
-    218,11,95,112,97,116,104,95,105,115,100,105,114,92,0,0,
-    0,115,6,0,0,0,0,2,6,1,15,1,114,46,0,0,
-    0,105,182,1,0,0,99,3,0,0,0,0,0,0,0,6,
-    0,0,0,17,0,0,0,67,0,0,0,115,192,0,0,0,
-    100,1,0,106,0,0,124,0,0,116,1,0,124,0,0,131,
-    1,0,131,2,0,125,3,0,116,2,0,106,3,0,124,3,
-    0,116,2,0,106,4,0,116,2,0,106,5,0,66,116,2,
-    0,106,6,0,66,124,2,0,100,2,0,64,131,3,0,125,
-    4,0,121,60,0,116,7,0,106,8,0,124,4,0,100,3,
-    0,131,2,0,143,20,0,125,5,0,124,5,0,106,9,0,
-    124,1,0,131,1,0,1,87,100,4,0,81,88,116,2,0,
-    106,10,0,124,3,0,124,0,0,131,2,0,1,87,110,59,
-    0,4,116,11,0,107,10,0,114,187,0,1,1,1,121,17,
-    0,116,2,0,106,12,0,124,3,0,131,1,0,1,87,110,
-    18,0,4,116,11,0,107,10,0,114,179,0,1,1,1,89,
-    110,1,0,88,130,0,0,89,110,1,0,88,100,4,0,83,
-    41,5,122,162,66,101,115,116,45,101,102,102,111,114,116,32,
-    102,117,110,99,116,105,111,110,32,116,111,32,119,114,105,116,
-    101,32,100,97,116,97,32,116,111,32,97,32,112,97,116,104,
-    32,97,116,111,109,105,99,97,108,108,121,46,10,32,32,32,
-    32,66,101,32,112,114,101,112,97,114,101,100,32,116,111,32,
-    104,97,110,100,108,101,32,97,32,70,105,108,101,69,120,105,
-    115,116,115,69,114,114,111,114,32,105,102,32,99,111,110,99,
-    117,114,114,101,110,116,32,119,114,105,116,105,110,103,32,111,
-    102,32,116,104,101,10,32,32,32,32,116,101,109,112,111,114,
-    97,114,121,32,102,105,108,101,32,105,115,32,97,116,116,101,
-    109,112,116,101,100,46,122,5,123,125,46,123,125,105,182,1,
-    0,0,90,2,119,98,78,41,13,218,6,102,111,114,109,97,
-    116,218,2,105,100,114,3,0,0,0,90,4,111,112,101,110,
-    90,6,79,95,69,88,67,76,90,7,79,95,67,82,69,65,
-    84,90,8,79,95,87,82,79,78,76,89,218,3,95,105,111,
-    218,6,70,105,108,101,73,79,218,5,119,114,105,116,101,218,
-    7,114,101,112,108,97,99,101,114,40,0,0,0,90,6,117,
-    110,108,105,110,107,41,6,114,35,0,0,0,218,4,100,97,
-    116,97,114,42,0,0,0,90,8,112,97,116,104,95,116,109,
-    112,90,2,102,100,218,4,102,105,108,101,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,218,13,95,119,114,105,
-    116,101,95,97,116,111,109,105,99,99,0,0,0,115,26,0,
-    0,0,0,5,24,1,9,1,33,1,3,3,21,1,19,1,
-    20,1,13,1,3,1,17,1,13,1,5,1,114,55,0,0,
-    0,99,2,0,0,0,0,0,0,0,3,0,0,0,7,0,
-    0,0,67,0,0,0,115,95,0,0,0,120,69,0,100,1,
-    0,100,2,0,100,3,0,100,4,0,103,4,0,68,93,49,
-    0,125,2,0,116,0,0,124,1,0,124,2,0,131,2,0,
-    114,19,0,116,1,0,124,0,0,124,2,0,116,2,0,124,
-    1,0,124,2,0,131,2,0,131,3,0,1,113,19,0,113,
-    19,0,87,124,0,0,106,3,0,106,4,0,124,1,0,106,
-    3,0,131,1,0,1,100,5,0,83,41,6,122,47,83,105,
-    109,112,108,101,32,115,117,98,115,116,105,116,117,116,101,32,
-    102,111,114,32,102,117,110,99,116,111,111,108,115,46,117,112,
-    100,97,116,101,95,119,114,97,112,112,101,114,46,218,10,95,
-    95,109,111,100,117,108,101,95,95,218,8,95,95,110,97,109,
-    101,95,95,218,12,95,95,113,117,97,108,110,97,109,101,95,
-    95,218,7,95,95,100,111,99,95,95,78,41,5,218,7,104,
-    97,115,97,116,116,114,218,7,115,101,116,97,116,116,114,218,
-    7,103,101,116,97,116,116,114,218,8,95,95,100,105,99,116,
-    95,95,218,6,117,112,100,97,116,101,41,3,90,3,110,101,
-    119,90,3,111,108,100,114,52,0,0,0,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,218,5,95,119,114,97,
-    112,121,0,0,0,115,8,0,0,0,0,2,25,1,15,1,
-    32,1,114,65,0,0,0,99,1,0,0,0,0,0,0,0,
-    1,0,0,0,2,0,0,0,67,0,0,0,115,16,0,0,
-    0,116,0,0,116,1,0,131,1,0,124,0,0,131,1,0,
-    83,41,1,78,41,2,218,4,116,121,112,101,114,7,0,0,
-    0,41,1,218,4,110,97,109,101,114,4,0,0,0,114,4,
-    0,0,0,114,5,0,0,0,218,11,95,110,101,119,95,109,
-    111,100,117,108,101,129,0,0,0,115,2,0,0,0,0,1,
-    114,68,0,0,0,99,0,0,0,0,0,0,0,0,0,0,
-    0,0,2,0,0,0,64,0,0,0,115,58,0,0,0,101,
-    0,0,90,1,0,100,0,0,90,2,0,100,1,0,90,3,
-    0,100,2,0,100,3,0,132,0,0,90,4,0,100,4,0,
-    100,5,0,132,0,0,90,5,0,100,6,0,100,7,0,132,
-    0,0,90,6,0,100,8,0,83,41,9,218,13,95,77,97,
-    110,97,103,101,82,101,108,111,97,100,122,63,77,97,110,97,
-    103,101,115,32,116,104,101,32,112,111,115,115,105,98,108,101,
-    32,99,108,101,97,110,45,117,112,32,111,102,32,115,121,115,
-    46,109,111,100,117,108,101,115,32,102,111,114,32,108,111,97,
-    100,95,109,111,100,117,108,101,40,41,46,99,2,0,0,0,
-    0,0,0,0,2,0,0,0,2,0,0,0,67,0,0,0,
-    115,13,0,0,0,124,1,0,124,0,0,95,0,0,100,0,
-    0,83,41,1,78,41,1,218,5,95,110,97,109,101,41,2,
-    218,4,115,101,108,102,114,67,0,0,0,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,218,8,95,95,105,110,
-    105,116,95,95,141,0,0,0,115,2,0,0,0,0,1,122,
-    22,95,77,97,110,97,103,101,82,101,108,111,97,100,46,95,
-    95,105,110,105,116,95,95,99,1,0,0,0,0,0,0,0,
-    1,0,0,0,2,0,0,0,67,0,0,0,115,25,0,0,
-    0,124,0,0,106,0,0,116,1,0,106,2,0,107,6,0,
-    124,0,0,95,3,0,100,0,0,83,41,1,78,41,4,114,
-    70,0,0,0,114,7,0,0,0,218,7,109,111,100,117,108,
-    101,115,218,10,95,105,115,95,114,101,108,111,97,100,41,1,
-    114,71,0,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,218,9,95,95,101,110,116,101,114,95,95,144,
-    0,0,0,115,2,0,0,0,0,1,122,23,95,77,97,110,
-    97,103,101,82,101,108,111,97,100,46,95,95,101,110,116,101,
-    114,95,95,99,1,0,0,0,0,0,0,0,2,0,0,0,
-    12,0,0,0,71,0,0,0,115,80,0,0,0,116,0,0,
-    100,1,0,100,2,0,132,0,0,124,1,0,68,131,1,0,
-    131,1,0,114,76,0,124,0,0,106,1,0,12,114,76,0,
-    121,17,0,116,2,0,106,3,0,124,0,0,106,4,0,61,
-    87,113,76,0,4,116,5,0,107,10,0,114,72,0,1,1,
-    1,89,113,76,0,88,110,0,0,100,0,0,83,41,3,78,
-    99,1,0,0,0,0,0,0,0,2,0,0,0,3,0,0,
-    0,115,0,0,0,115,27,0,0,0,124,0,0,93,17,0,
-    125,1,0,124,1,0,100,0,0,107,9,0,86,1,113,3,
-    0,100,0,0,83,41,1,78,114,4,0,0,0,41,2,114,
-    22,0,0,0,218,3,97,114,103,114,4,0,0,0,114,4,
-    0,0,0,114,5,0,0,0,250,9,60,103,101,110,101,120,
-    112,114,62,148,0,0,0,115,2,0,0,0,6,0,122,41,
-    95,77,97,110,97,103,101,82,101,108,111,97,100,46,95,95,
-    101,120,105,116,95,95,46,60,108,111,99,97,108,115,62,46,
-    60,103,101,110,101,120,112,114,62,41,6,218,3,97,110,121,
-    114,74,0,0,0,114,7,0,0,0,114,73,0,0,0,114,
-    70,0,0,0,218,8,75,101,121,69,114,114,111,114,41,2,
-    114,71,0,0,0,218,4,97,114,103,115,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,218,8,95,95,101,120,
-    105,116,95,95,147,0,0,0,115,10,0,0,0,0,1,35,
-    1,3,1,17,1,13,1,122,22,95,77,97,110,97,103,101,
-    82,101,108,111,97,100,46,95,95,101,120,105,116,95,95,78,
-    41,7,114,57,0,0,0,114,56,0,0,0,114,58,0,0,
-    0,114,59,0,0,0,114,72,0,0,0,114,75,0,0,0,
-    114,81,0,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    4,0,0,0,114,5,0,0,0,114,69,0,0,0,137,0,
-    0,0,115,8,0,0,0,12,2,6,2,12,3,12,3,114,
-    69,0,0,0,99,0,0,0,0,0,0,0,0,0,0,0,
-    0,1,0,0,0,64,0,0,0,115,16,0,0,0,101,0,
-    0,90,1,0,100,0,0,90,2,0,100,1,0,83,41,2,
-    218,14,95,68,101,97,100,108,111,99,107,69,114,114,111,114,
-    78,41,3,114,57,0,0,0,114,56,0,0,0,114,58,0,
-    0,0,114,4,0,0,0,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,114,82,0,0,0,162,0,0,0,115,
-    2,0,0,0,12,1,114,82,0,0,0,99,0,0,0,0,
-    0,0,0,0,0,0,0,0,2,0,0,0,64,0,0,0,
-    115,82,0,0,0,101,0,0,90,1,0,100,0,0,90,2,
-    0,100,1,0,90,3,0,100,2,0,100,3,0,132,0,0,
-    90,4,0,100,4,0,100,5,0,132,0,0,90,5,0,100,
-    6,0,100,7,0,132,0,0,90,6,0,100,8,0,100,9,
-    0,132,0,0,90,7,0,100,10,0,100,11,0,132,0,0,
-    90,8,0,100,12,0,83,41,13,218,11,95,77,111,100,117,
-    108,101,76,111,99,107,122,169,65,32,114,101,99,117,114,115,
-    105,118,101,32,108,111,99,107,32,105,109,112,108,101,109,101,
-    110,116,97,116,105,111,110,32,119,104,105,99,104,32,105,115,
-    32,97,98,108,101,32,116,111,32,100,101,116,101,99,116,32,
-    100,101,97,100,108,111,99,107,115,10,32,32,32,32,40,101,
-    46,103,46,32,116,104,114,101,97,100,32,49,32,116,114,121,
-    105,110,103,32,116,111,32,116,97,107,101,32,108,111,99,107,
-    115,32,65,32,116,104,101,110,32,66,44,32,97,110,100,32,
-    116,104,114,101,97,100,32,50,32,116,114,121,105,110,103,32,
-    116,111,10,32,32,32,32,116,97,107,101,32,108,111,99,107,
-    115,32,66,32,116,104,101,110,32,65,41,46,10,32,32,32,
-    32,99,2,0,0,0,0,0,0,0,2,0,0,0,2,0,
-    0,0,67,0,0,0,115,70,0,0,0,116,0,0,106,1,
-    0,131,0,0,124,0,0,95,2,0,116,0,0,106,1,0,
-    131,0,0,124,0,0,95,3,0,124,1,0,124,0,0,95,
-    4,0,100,0,0,124,0,0,95,5,0,100,1,0,124,0,
-    0,95,6,0,100,1,0,124,0,0,95,7,0,100,0,0,
-    83,41,2,78,233,0,0,0,0,41,8,218,7,95,116,104,
-    114,101,97,100,90,13,97,108,108,111,99,97,116,101,95,108,
-    111,99,107,218,4,108,111,99,107,218,6,119,97,107,101,117,
-    112,114,67,0,0,0,218,5,111,119,110,101,114,218,5,99,
-    111,117,110,116,218,7,119,97,105,116,101,114,115,41,2,114,
-    71,0,0,0,114,67,0,0,0,114,4,0,0,0,114,4,
-    0,0,0,114,5,0,0,0,114,72,0,0,0,172,0,0,
-    0,115,12,0,0,0,0,1,15,1,15,1,9,1,9,1,
-    9,1,122,20,95,77,111,100,117,108,101,76,111,99,107,46,
-    95,95,105,110,105,116,95,95,99,1,0,0,0,0,0,0,
-    0,4,0,0,0,2,0,0,0,67,0,0,0,115,87,0,
-    0,0,116,0,0,106,1,0,131,0,0,125,1,0,124,0,
-    0,106,2,0,125,2,0,120,59,0,116,3,0,106,4,0,
-    124,2,0,131,1,0,125,3,0,124,3,0,100,0,0,107,
-    8,0,114,55,0,100,1,0,83,124,3,0,106,2,0,125,
-    2,0,124,2,0,124,1,0,107,2,0,114,24,0,100,2,
-    0,83,113,24,0,100,0,0,83,41,3,78,70,84,41,5,
-    114,85,0,0,0,218,9,103,101,116,95,105,100,101,110,116,
-    114,88,0,0,0,218,12,95,98,108,111,99,107,105,110,103,
-    95,111,110,218,3,103,101,116,41,4,114,71,0,0,0,218,
-    2,109,101,218,3,116,105,100,114,86,0,0,0,114,4,0,
-    0,0,114,4,0,0,0,114,5,0,0,0,218,12,104,97,
-    115,95,100,101,97,100,108,111,99,107,180,0,0,0,115,18,
-    0,0,0,0,2,12,1,9,1,3,1,15,1,12,1,4,
-    1,9,1,12,1,122,24,95,77,111,100,117,108,101,76,111,
-    99,107,46,104,97,115,95,100,101,97,100,108,111,99,107,99,
-    1,0,0,0,0,0,0,0,2,0,0,0,17,0,0,0,
-    67,0,0,0,115,214,0,0,0,116,0,0,106,1,0,131,
-    0,0,125,1,0,124,0,0,116,2,0,124,1,0,60,122,
-    177,0,120,170,0,124,0,0,106,3,0,143,130,0,1,124,
-    0,0,106,4,0,100,1,0,107,2,0,115,68,0,124,0,
-    0,106,5,0,124,1,0,107,2,0,114,96,0,124,1,0,
-    124,0,0,95,5,0,124,0,0,4,106,4,0,100,2,0,
-    55,2,95,4,0,100,3,0,83,124,0,0,106,6,0,131,
-    0,0,114,127,0,116,7,0,100,4,0,124,0,0,22,131,
-    1,0,130,1,0,110,0,0,124,0,0,106,8,0,106,9,
-    0,100,5,0,131,1,0,114,163,0,124,0,0,4,106,10,
-    0,100,2,0,55,2,95,10,0,110,0,0,87,100,6,0,
-    81,88,124,0,0,106,8,0,106,9,0,131,0,0,1,124,
-    0,0,106,8,0,106,11,0,131,0,0,1,113,28,0,87,
-    100,6,0,116,2,0,124,1,0,61,88,100,6,0,83,41,
-    7,122,185,10,32,32,32,32,32,32,32,32,65,99,113,117,
-    105,114,101,32,116,104,101,32,109,111,100,117,108,101,32,108,
-    111,99,107,46,32,32,73,102,32,97,32,112,111,116,101,110,
-    116,105,97,108,32,100,101,97,100,108,111,99,107,32,105,115,
-    32,100,101,116,101,99,116,101,100,44,10,32,32,32,32,32,
-    32,32,32,97,32,95,68,101,97,100,108,111,99,107,69,114,
-    114,111,114,32,105,115,32,114,97,105,115,101,100,46,10,32,
-    32,32,32,32,32,32,32,79,116,104,101,114,119,105,115,101,
-    44,32,116,104,101,32,108,111,99,107,32,105,115,32,97,108,
-    119,97,121,115,32,97,99,113,117,105,114,101,100,32,97,110,
-    100,32,84,114,117,101,32,105,115,32,114,101,116,117,114,110,
-    101,100,46,10,32,32,32,32,32,32,32,32,114,84,0,0,
-    0,114,29,0,0,0,84,122,23,100,101,97,100,108,111,99,
-    107,32,100,101,116,101,99,116,101,100,32,98,121,32,37,114,
-    70,78,41,12,114,85,0,0,0,114,91,0,0,0,114,92,
-    0,0,0,114,86,0,0,0,114,89,0,0,0,114,88,0,
-    0,0,114,96,0,0,0,114,82,0,0,0,114,87,0,0,
-    0,218,7,97,99,113,117,105,114,101,114,90,0,0,0,218,
-    7,114,101,108,101,97,115,101,41,2,114,71,0,0,0,114,
-    95,0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,114,97,0,0,0,192,0,0,0,115,32,0,0,
-    0,0,6,12,1,10,1,3,1,3,1,10,1,30,1,9,
-    1,15,1,4,1,12,1,19,1,18,1,24,2,13,1,20,
-    2,122,19,95,77,111,100,117,108,101,76,111,99,107,46,97,
-    99,113,117,105,114,101,99,1,0,0,0,0,0,0,0,2,
-    0,0,0,10,0,0,0,67,0,0,0,115,165,0,0,0,
-    116,0,0,106,1,0,131,0,0,125,1,0,124,0,0,106,
-    2,0,143,138,0,1,124,0,0,106,3,0,124,1,0,107,
-    3,0,114,52,0,116,4,0,100,1,0,131,1,0,130,1,
-    0,110,0,0,124,0,0,106,5,0,100,2,0,107,4,0,
-    115,73,0,116,6,0,130,1,0,124,0,0,4,106,5,0,
-    100,3,0,56,2,95,5,0,124,0,0,106,5,0,100,2,
-    0,107,2,0,114,155,0,100,0,0,124,0,0,95,3,0,
-    124,0,0,106,7,0,114,155,0,124,0,0,4,106,7,0,
-    100,3,0,56,2,95,7,0,124,0,0,106,8,0,106,9,
-    0,131,0,0,1,113,155,0,110,0,0,87,100,0,0,81,
-    88,100,0,0,83,41,4,78,122,31,99,97,110,110,111,116,
-    32,114,101,108,101,97,115,101,32,117,110,45,97,99,113,117,
-    105,114,101,100,32,108,111,99,107,114,84,0,0,0,114,29,
-    0,0,0,41,10,114,85,0,0,0,114,91,0,0,0,114,
-    86,0,0,0,114,88,0,0,0,218,12,82,117,110,116,105,
-    109,101,69,114,114,111,114,114,89,0,0,0,218,14,65,115,
-    115,101,114,116,105,111,110,69,114,114,111,114,114,90,0,0,
-    0,114,87,0,0,0,114,98,0,0,0,41,2,114,71,0,
-    0,0,114,95,0,0,0,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,114,98,0,0,0,217,0,0,0,115,
-    22,0,0,0,0,1,12,1,10,1,15,1,15,1,21,1,
-    15,1,15,1,9,1,9,1,15,1,122,19,95,77,111,100,
-    117,108,101,76,111,99,107,46,114,101,108,101,97,115,101,99,
-    1,0,0,0,0,0,0,0,1,0,0,0,4,0,0,0,
-    67,0,0,0,115,25,0,0,0,100,1,0,106,0,0,124,
-    0,0,106,1,0,116,2,0,124,0,0,131,1,0,131,2,
-    0,83,41,2,78,122,23,95,77,111,100,117,108,101,76,111,
-    99,107,40,123,33,114,125,41,32,97,116,32,123,125,41,3,
-    114,47,0,0,0,114,67,0,0,0,114,48,0,0,0,41,
-    1,114,71,0,0,0,114,4,0,0,0,114,4,0,0,0,
-    114,5,0,0,0,218,8,95,95,114,101,112,114,95,95,230,
-    0,0,0,115,2,0,0,0,0,1,122,20,95,77,111,100,
-    117,108,101,76,111,99,107,46,95,95,114,101,112,114,95,95,
-    78,41,9,114,57,0,0,0,114,56,0,0,0,114,58,0,
-    0,0,114,59,0,0,0,114,72,0,0,0,114,96,0,0,
-    0,114,97,0,0,0,114,98,0,0,0,114,101,0,0,0,
-    114,4,0,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,114,83,0,0,0,166,0,0,0,115,12,0,
-    0,0,12,4,6,2,12,8,12,12,12,25,12,13,114,83,
-    0,0,0,99,0,0,0,0,0,0,0,0,0,0,0,0,
-    2,0,0,0,64,0,0,0,115,70,0,0,0,101,0,0,
-    90,1,0,100,0,0,90,2,0,100,1,0,90,3,0,100,
-    2,0,100,3,0,132,0,0,90,4,0,100,4,0,100,5,
-    0,132,0,0,90,5,0,100,6,0,100,7,0,132,0,0,
-    90,6,0,100,8,0,100,9,0,132,0,0,90,7,0,100,
-    10,0,83,41,11,218,16,95,68,117,109,109,121,77,111,100,
-    117,108,101,76,111,99,107,122,86,65,32,115,105,109,112,108,
-    101,32,95,77,111,100,117,108,101,76,111,99,107,32,101,113,
-    117,105,118,97,108,101,110,116,32,102,111,114,32,80,121,116,
-    104,111,110,32,98,117,105,108,100,115,32,119,105,116,104,111,
-    117,116,10,32,32,32,32,109,117,108,116,105,45,116,104,114,
-    101,97,100,105,110,103,32,115,117,112,112,111,114,116,46,99,
-    2,0,0,0,0,0,0,0,2,0,0,0,2,0,0,0,
-    67,0,0,0,115,22,0,0,0,124,1,0,124,0,0,95,
-    0,0,100,1,0,124,0,0,95,1,0,100,0,0,83,41,
-    2,78,114,84,0,0,0,41,2,114,67,0,0,0,114,89,
-    0,0,0,41,2,114,71,0,0,0,114,67,0,0,0,114,
-    4,0,0,0,114,4,0,0,0,114,5,0,0,0,114,72,
-    0,0,0,238,0,0,0,115,4,0,0,0,0,1,9,1,
-    122,25,95,68,117,109,109,121,77,111,100,117,108,101,76,111,
-    99,107,46,95,95,105,110,105,116,95,95,99,1,0,0,0,
-    0,0,0,0,1,0,0,0,3,0,0,0,67,0,0,0,
-    115,19,0,0,0,124,0,0,4,106,0,0,100,1,0,55,
-    2,95,0,0,100,2,0,83,41,3,78,114,29,0,0,0,
-    84,41,1,114,89,0,0,0,41,1,114,71,0,0,0,114,
-    4,0,0,0,114,4,0,0,0,114,5,0,0,0,114,97,
-    0,0,0,242,0,0,0,115,4,0,0,0,0,1,15,1,
-    122,24,95,68,117,109,109,121,77,111,100,117,108,101,76,111,
-    99,107,46,97,99,113,117,105,114,101,99,1,0,0,0,0,
+    0,115,84,0,0,0,100,1,0,116,0,0,106,1,0,107,
+    6,0,114,19,0,100,2,0,83,116,0,0,106,2,0,106,
+    3,0,114,35,0,100,3,0,83,116,4,0,106,5,0,100,
+    4,0,107,2,0,114,56,0,100,5,0,110,3,0,100,6,
+    0,125,0,0,116,6,0,116,4,0,106,7,0,106,8,0,
+    124,0,0,131,1,0,131,1,0,83,41,7,122,53,84,114,
+    117,101,32,105,102,32,70,105,108,101,70,105,110,100,101,114,
+    32,115,104,111,117,108,100,32,112,101,114,115,105,115,116,32,
+    100,105,114,101,99,116,111,114,121,32,108,105,115,116,105,110,
+    103,115,46,90,8,100,105,114,105,110,100,101,120,84,70,218,
+    2,110,116,90,14,80,89,84,72,79,78,68,73,82,73,78,
+    68,69,88,115,14,0,0,0,80,89,84,72,79,78,68,73,
+    82,73,78,68,69,88,41,9,114,8,0,0,0,218,9,95,
+    120,111,112,116,105,111,110,115,218,5,102,108,97,103,115,218,
+    18,105,103,110,111,114,101,95,101,110,118,105,114,111,110,109,
+    101,110,116,114,3,0,0,0,218,8,95,95,110,97,109,101,
+    95,95,218,4,98,111,111,108,114,4,0,0,0,218,3,103,
+    101,116,41,1,218,3,107,101,121,114,5,0,0,0,114,5,
+    0,0,0,114,6,0,0,0,218,14,95,117,115,101,95,100,
+    105,114,95,105,110,100,101,120,40,0,0,0,115,12,0,0,
+    0,0,2,15,1,4,1,12,1,4,1,27,1,114,21,0,
+    0,0,99,1,0,0,0,0,0,0,0,1,0,0,0,3,
+    0,0,0,67,0,0,0,115,26,0,0,0,116,0,0,124,
+    0,0,131,1,0,100,1,0,64,106,1,0,100,2,0,100,
+    3,0,131,2,0,83,41,4,122,42,67,111,110,118,101,114,
+    116,32,97,32,51,50,45,98,105,116,32,105,110,116,101,103,
+    101,114,32,116,111,32,108,105,116,116,108,101,45,101,110,100,
+    105,97,110,46,108,3,0,0,0,255,127,255,127,3,0,233,
+    4,0,0,0,218,6,108,105,116,116,108,101,41,2,218,3,
+    105,110,116,218,8,116,111,95,98,121,116,101,115,41,1,218,
+    1,120,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,218,7,95,119,95,108,111,110,103,50,0,0,0,115,2,
+    0,0,0,0,2,114,27,0,0,0,99,1,0,0,0,0,
     0,0,0,1,0,0,0,3,0,0,0,67,0,0,0,115,
-    49,0,0,0,124,0,0,106,0,0,100,1,0,107,2,0,
-    114,30,0,116,1,0,100,2,0,131,1,0,130,1,0,110,
-    0,0,124,0,0,4,106,0,0,100,3,0,56,2,95,0,
-    0,100,0,0,83,41,4,78,114,84,0,0,0,122,31,99,
-    97,110,110,111,116,32,114,101,108,101,97,115,101,32,117,110,
-    45,97,99,113,117,105,114,101,100,32,108,111,99,107,114,29,
-    0,0,0,41,2,114,89,0,0,0,114,99,0,0,0,41,
-    1,114,71,0,0,0,114,4,0,0,0,114,4,0,0,0,
-    114,5,0,0,0,114,98,0,0,0,246,0,0,0,115,6,
-    0,0,0,0,1,15,1,15,1,122,24,95,68,117,109,109,
-    121,77,111,100,117,108,101,76,111,99,107,46,114,101,108,101,
-    97,115,101,99,1,0,0,0,0,0,0,0,1,0,0,0,
-    4,0,0,0,67,0,0,0,115,25,0,0,0,100,1,0,
-    106,0,0,124,0,0,106,1,0,116,2,0,124,0,0,131,
-    1,0,131,2,0,83,41,2,78,122,28,95,68,117,109,109,
-    121,77,111,100,117,108,101,76,111,99,107,40,123,33,114,125,
-    41,32,97,116,32,123,125,41,3,114,47,0,0,0,114,67,
-    0,0,0,114,48,0,0,0,41,1,114,71,0,0,0,114,
-    4,0,0,0,114,4,0,0,0,114,5,0,0,0,114,101,
-    0,0,0,251,0,0,0,115,2,0,0,0,0,1,122,25,
+    16,0,0,0,116,0,0,106,1,0,124,0,0,100,1,0,
+    131,2,0,83,41,2,122,47,67,111,110,118,101,114,116,32,
+    52,32,98,121,116,101,115,32,105,110,32,108,105,116,116,108,
+    101,45,101,110,100,105,97,110,32,116,111,32,97,110,32,105,
+    110,116,101,103,101,114,46,114,23,0,0,0,41,2,114,24,
+    0,0,0,218,10,102,114,111,109,95,98,121,116,101,115,41,
+    1,90,9,105,110,116,95,98,121,116,101,115,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,218,7,95,114,95,
+    108,111,110,103,55,0,0,0,115,2,0,0,0,0,2,114,
+    29,0,0,0,99,0,0,0,0,0,0,0,0,1,0,0,
+    0,3,0,0,0,71,0,0,0,115,26,0,0,0,116,0,
+    0,106,1,0,100,1,0,100,2,0,132,0,0,124,0,0,
+    68,131,1,0,131,1,0,83,41,3,122,31,82,101,112,108,
+    97,99,101,109,101,110,116,32,102,111,114,32,111,115,46,112,
+    97,116,104,46,106,111,105,110,40,41,46,99,1,0,0,0,
+    0,0,0,0,2,0,0,0,4,0,0,0,83,0,0,0,
+    115,37,0,0,0,103,0,0,124,0,0,93,27,0,125,1,
+    0,124,1,0,114,6,0,124,1,0,106,0,0,116,1,0,
+    131,1,0,145,2,0,113,6,0,83,114,5,0,0,0,41,
+    2,218,6,114,115,116,114,105,112,218,15,112,97,116,104,95,
+    115,101,112,97,114,97,116,111,114,115,41,2,218,2,46,48,
+    218,4,112,97,114,116,114,5,0,0,0,114,5,0,0,0,
+    114,6,0,0,0,250,10,60,108,105,115,116,99,111,109,112,
+    62,62,0,0,0,115,2,0,0,0,9,1,122,30,95,112,
+    97,116,104,95,106,111,105,110,46,60,108,111,99,97,108,115,
+    62,46,60,108,105,115,116,99,111,109,112,62,41,2,218,8,
+    112,97,116,104,95,115,101,112,218,4,106,111,105,110,41,1,
+    218,10,112,97,116,104,95,112,97,114,116,115,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,218,10,95,112,97,
+    116,104,95,106,111,105,110,60,0,0,0,115,4,0,0,0,
+    0,2,15,1,114,38,0,0,0,99,1,0,0,0,0,0,
+    0,0,5,0,0,0,5,0,0,0,67,0,0,0,115,134,
+    0,0,0,116,0,0,116,1,0,131,1,0,100,1,0,107,
+    2,0,114,52,0,124,0,0,106,2,0,116,3,0,131,1,
+    0,92,3,0,125,1,0,125,2,0,125,3,0,124,1,0,
+    124,3,0,102,2,0,83,120,69,0,116,4,0,124,0,0,
+    131,1,0,68,93,55,0,125,4,0,124,4,0,116,1,0,
+    107,6,0,114,65,0,124,0,0,106,5,0,124,4,0,100,
+    2,0,100,1,0,131,1,1,92,2,0,125,1,0,125,3,
+    0,124,1,0,124,3,0,102,2,0,83,113,65,0,87,100,
+    3,0,124,0,0,102,2,0,83,41,4,122,32,82,101,112,
+    108,97,99,101,109,101,110,116,32,102,111,114,32,111,115,46,
+    112,97,116,104,46,115,112,108,105,116,40,41,46,233,1,0,
+    0,0,90,8,109,97,120,115,112,108,105,116,218,0,41,6,
+    218,3,108,101,110,114,31,0,0,0,218,10,114,112,97,114,
+    116,105,116,105,111,110,114,35,0,0,0,218,8,114,101,118,
+    101,114,115,101,100,218,6,114,115,112,108,105,116,41,5,218,
+    4,112,97,116,104,90,5,102,114,111,110,116,218,1,95,218,
+    4,116,97,105,108,114,26,0,0,0,114,5,0,0,0,114,
+    5,0,0,0,114,6,0,0,0,218,11,95,112,97,116,104,
+    95,115,112,108,105,116,66,0,0,0,115,16,0,0,0,0,
+    2,18,1,24,1,10,1,19,1,12,1,27,1,14,1,114,
+    48,0,0,0,99,1,0,0,0,0,0,0,0,1,0,0,
+    0,2,0,0,0,67,0,0,0,115,13,0,0,0,116,0,
+    0,106,1,0,124,0,0,131,1,0,83,41,1,122,126,83,
+    116,97,116,32,116,104,101,32,112,97,116,104,46,10,10,32,
+    32,32,32,77,97,100,101,32,97,32,115,101,112,97,114,97,
+    116,101,32,102,117,110,99,116,105,111,110,32,116,111,32,109,
+    97,107,101,32,105,116,32,101,97,115,105,101,114,32,116,111,
+    32,111,118,101,114,114,105,100,101,32,105,110,32,101,120,112,
+    101,114,105,109,101,110,116,115,10,32,32,32,32,40,101,46,
+    103,46,32,99,97,99,104,101,32,115,116,97,116,32,114,101,
+    115,117,108,116,115,41,46,10,10,32,32,32,32,41,2,114,
+    3,0,0,0,90,4,115,116,97,116,41,1,114,45,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
+    218,10,95,112,97,116,104,95,115,116,97,116,78,0,0,0,
+    115,2,0,0,0,0,7,114,49,0,0,0,99,2,0,0,
+    0,0,0,0,0,3,0,0,0,11,0,0,0,67,0,0,
+    0,115,58,0,0,0,121,16,0,116,0,0,124,0,0,131,
+    1,0,125,2,0,87,110,22,0,4,116,1,0,107,10,0,
+    114,40,0,1,1,1,100,1,0,83,89,110,1,0,88,124,
+    2,0,106,2,0,100,2,0,64,124,1,0,107,2,0,83,
+    41,3,122,49,84,101,115,116,32,119,104,101,116,104,101,114,
+    32,116,104,101,32,112,97,116,104,32,105,115,32,116,104,101,
+    32,115,112,101,99,105,102,105,101,100,32,109,111,100,101,32,
+    116,121,112,101,46,70,105,0,240,0,0,41,3,114,49,0,
+    0,0,218,7,79,83,69,114,114,111,114,218,7,115,116,95,
+    109,111,100,101,41,3,114,45,0,0,0,218,4,109,111,100,
+    101,90,9,115,116,97,116,95,105,110,102,111,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,218,18,95,112,97,
+    116,104,95,105,115,95,109,111,100,101,95,116,121,112,101,88,
+    0,0,0,115,10,0,0,0,0,2,3,1,16,1,13,1,
+    9,1,114,53,0,0,0,99,1,0,0,0,0,0,0,0,
+    1,0,0,0,3,0,0,0,67,0,0,0,115,13,0,0,
+    0,116,0,0,124,0,0,100,1,0,131,2,0,83,41,2,
+    122,31,82,101,112,108,97,99,101,109,101,110,116,32,102,111,
+    114,32,111,115,46,112,97,116,104,46,105,115,102,105,108,101,
+    46,105,0,128,0,0,41,1,114,53,0,0,0,41,1,114,
+    45,0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,218,12,95,112,97,116,104,95,105,115,102,105,108,
+    101,97,0,0,0,115,2,0,0,0,0,2,114,54,0,0,
+    0,99,1,0,0,0,0,0,0,0,1,0,0,0,3,0,
+    0,0,67,0,0,0,115,34,0,0,0,124,0,0,115,21,
+    0,116,0,0,106,1,0,131,0,0,125,0,0,110,0,0,
+    116,2,0,124,0,0,100,1,0,131,2,0,83,41,2,122,
+    30,82,101,112,108,97,99,101,109,101,110,116,32,102,111,114,
+    32,111,115,46,112,97,116,104,46,105,115,100,105,114,46,105,
+    0,64,0,0,41,3,114,3,0,0,0,218,6,103,101,116,
+    99,119,100,114,53,0,0,0,41,1,114,45,0,0,0,114,
+    5,0,0,0,114,5,0,0,0,114,6,0,0,0,218,11,
+    95,112,97,116,104,95,105,115,100,105,114,102,0,0,0,115,
+    6,0,0,0,0,2,6,1,15,1,114,56,0,0,0,105,
+    182,1,0,0,99,3,0,0,0,0,0,0,0,6,0,0,
+    0,17,0,0,0,67,0,0,0,115,192,0,0,0,100,1,
+    0,106,0,0,124,0,0,116,1,0,124,0,0,131,1,0,
+    131,2,0,125,3,0,116,2,0,106,3,0,124,3,0,116,
+    2,0,106,4,0,116,2,0,106,5,0,66,116,2,0,106,
+    6,0,66,124,2,0,100,2,0,64,131,3,0,125,4,0,
+    121,60,0,116,7,0,106,8,0,124,4,0,100,3,0,131,
+    2,0,143,20,0,125,5,0,124,5,0,106,9,0,124,1,
+    0,131,1,0,1,87,100,4,0,81,88,116,2,0,106,10,
+    0,124,3,0,124,0,0,131,2,0,1,87,110,59,0,4,
+    116,11,0,107,10,0,114,187,0,1,1,1,121,17,0,116,
+    2,0,106,12,0,124,3,0,131,1,0,1,87,110,18,0,
+    4,116,11,0,107,10,0,114,179,0,1,1,1,89,110,1,
+    0,88,130,0,0,89,110,1,0,88,100,4,0,83,41,5,
+    122,162,66,101,115,116,45,101,102,102,111,114,116,32,102,117,
+    110,99,116,105,111,110,32,116,111,32,119,114,105,116,101,32,
+    100,97,116,97,32,116,111,32,97,32,112,97,116,104,32,97,
+    116,111,109,105,99,97,108,108,121,46,10,32,32,32,32,66,
+    101,32,112,114,101,112,97,114,101,100,32,116,111,32,104,97,
+    110,100,108,101,32,97,32,70,105,108,101,69,120,105,115,116,
+    115,69,114,114,111,114,32,105,102,32,99,111,110,99,117,114,
+    114,101,110,116,32,119,114,105,116,105,110,103,32,111,102,32,
+    116,104,101,10,32,32,32,32,116,101,109,112,111,114,97,114,
+    121,32,102,105,108,101,32,105,115,32,97,116,116,101,109,112,
+    116,101,100,46,122,5,123,125,46,123,125,105,182,1,0,0,
+    218,2,119,98,78,41,13,218,6,102,111,114,109,97,116,218,
+    2,105,100,114,3,0,0,0,218,4,111,112,101,110,218,6,
+    79,95,69,88,67,76,218,7,79,95,67,82,69,65,84,218,
+    8,79,95,87,82,79,78,76,89,218,3,95,105,111,218,6,
+    70,105,108,101,73,79,218,5,119,114,105,116,101,218,7,114,
+    101,112,108,97,99,101,114,50,0,0,0,218,6,117,110,108,
+    105,110,107,41,6,114,45,0,0,0,218,4,100,97,116,97,
+    114,52,0,0,0,218,8,112,97,116,104,95,116,109,112,218,
+    2,102,100,218,4,102,105,108,101,114,5,0,0,0,114,5,
+    0,0,0,114,6,0,0,0,218,13,95,119,114,105,116,101,
+    95,97,116,111,109,105,99,109,0,0,0,115,26,0,0,0,
+    0,5,24,1,9,1,33,1,3,3,21,1,19,1,20,1,
+    13,1,3,1,17,1,13,1,5,1,114,73,0,0,0,99,
+    2,0,0,0,0,0,0,0,3,0,0,0,7,0,0,0,
+    67,0,0,0,115,95,0,0,0,120,69,0,100,1,0,100,
+    2,0,100,3,0,100,4,0,103,4,0,68,93,49,0,125,
+    2,0,116,0,0,124,1,0,124,2,0,131,2,0,114,19,
+    0,116,1,0,124,0,0,124,2,0,116,2,0,124,1,0,
+    124,2,0,131,2,0,131,3,0,1,113,19,0,113,19,0,
+    87,124,0,0,106,3,0,106,4,0,124,1,0,106,3,0,
+    131,1,0,1,100,5,0,83,41,6,122,47,83,105,109,112,
+    108,101,32,115,117,98,115,116,105,116,117,116,101,32,102,111,
+    114,32,102,117,110,99,116,111,111,108,115,46,117,112,100,97,
+    116,101,95,119,114,97,112,112,101,114,46,218,10,95,95,109,
+    111,100,117,108,101,95,95,114,17,0,0,0,218,12,95,95,
+    113,117,97,108,110,97,109,101,95,95,218,7,95,95,100,111,
+    99,95,95,78,41,5,218,7,104,97,115,97,116,116,114,218,
+    7,115,101,116,97,116,116,114,218,7,103,101,116,97,116,116,
+    114,218,8,95,95,100,105,99,116,95,95,218,6,117,112,100,
+    97,116,101,41,3,90,3,110,101,119,90,3,111,108,100,114,
+    67,0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,218,5,95,119,114,97,112,131,0,0,0,115,8,
+    0,0,0,0,2,25,1,15,1,32,1,114,82,0,0,0,
+    99,1,0,0,0,0,0,0,0,1,0,0,0,2,0,0,
+    0,67,0,0,0,115,16,0,0,0,116,0,0,116,1,0,
+    131,1,0,124,0,0,131,1,0,83,41,1,78,41,2,218,
+    4,116,121,112,101,114,8,0,0,0,41,1,218,4,110,97,
+    109,101,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,218,11,95,110,101,119,95,109,111,100,117,108,101,139,0,
+    0,0,115,2,0,0,0,0,1,114,85,0,0,0,99,0,
+    0,0,0,0,0,0,0,0,0,0,0,2,0,0,0,64,
+    0,0,0,115,58,0,0,0,101,0,0,90,1,0,100,0,
+    0,90,2,0,100,1,0,90,3,0,100,2,0,100,3,0,
+    132,0,0,90,4,0,100,4,0,100,5,0,132,0,0,90,
+    5,0,100,6,0,100,7,0,132,0,0,90,6,0,100,8,
+    0,83,41,9,218,13,95,77,97,110,97,103,101,82,101,108,
+    111,97,100,122,63,77,97,110,97,103,101,115,32,116,104,101,
+    32,112,111,115,115,105,98,108,101,32,99,108,101,97,110,45,
+    117,112,32,111,102,32,115,121,115,46,109,111,100,117,108,101,
+    115,32,102,111,114,32,108,111,97,100,95,109,111,100,117,108,
+    101,40,41,46,99,2,0,0,0,0,0,0,0,2,0,0,
+    0,2,0,0,0,67,0,0,0,115,13,0,0,0,124,1,
+    0,124,0,0,95,0,0,100,0,0,83,41,1,78,41,1,
+    218,5,95,110,97,109,101,41,2,218,4,115,101,108,102,114,
+    84,0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,218,8,95,95,105,110,105,116,95,95,151,0,0,
+    0,115,2,0,0,0,0,1,122,22,95,77,97,110,97,103,
+    101,82,101,108,111,97,100,46,95,95,105,110,105,116,95,95,
+    99,1,0,0,0,0,0,0,0,1,0,0,0,2,0,0,
+    0,67,0,0,0,115,25,0,0,0,124,0,0,106,0,0,
+    116,1,0,106,2,0,107,6,0,124,0,0,95,3,0,100,
+    0,0,83,41,1,78,41,4,114,87,0,0,0,114,8,0,
+    0,0,218,7,109,111,100,117,108,101,115,218,10,95,105,115,
+    95,114,101,108,111,97,100,41,1,114,88,0,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,218,9,95,
+    95,101,110,116,101,114,95,95,154,0,0,0,115,2,0,0,
+    0,0,1,122,23,95,77,97,110,97,103,101,82,101,108,111,
+    97,100,46,95,95,101,110,116,101,114,95,95,99,1,0,0,
+    0,0,0,0,0,2,0,0,0,12,0,0,0,71,0,0,
+    0,115,80,0,0,0,116,0,0,100,1,0,100,2,0,132,
+    0,0,124,1,0,68,131,1,0,131,1,0,114,76,0,124,
+    0,0,106,1,0,12,114,76,0,121,17,0,116,2,0,106,
+    3,0,124,0,0,106,4,0,61,87,113,76,0,4,116,5,
+    0,107,10,0,114,72,0,1,1,1,89,113,76,0,88,110,
+    0,0,100,0,0,83,41,3,78,99,1,0,0,0,0,0,
+    0,0,2,0,0,0,3,0,0,0,115,0,0,0,115,27,
+    0,0,0,124,0,0,93,17,0,125,1,0,124,1,0,100,
+    0,0,107,9,0,86,1,113,3,0,100,0,0,83,41,1,
+    78,114,5,0,0,0,41,2,114,32,0,0,0,218,3,97,
+    114,103,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,250,9,60,103,101,110,101,120,112,114,62,158,0,0,0,
+    115,2,0,0,0,6,0,122,41,95,77,97,110,97,103,101,
+    82,101,108,111,97,100,46,95,95,101,120,105,116,95,95,46,
+    60,108,111,99,97,108,115,62,46,60,103,101,110,101,120,112,
+    114,62,41,6,218,3,97,110,121,114,91,0,0,0,114,8,
+    0,0,0,114,90,0,0,0,114,87,0,0,0,218,8,75,
+    101,121,69,114,114,111,114,41,2,114,88,0,0,0,218,4,
+    97,114,103,115,114,5,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,218,8,95,95,101,120,105,116,95,95,157,0,0,
+    0,115,10,0,0,0,0,1,35,1,3,1,17,1,13,1,
+    122,22,95,77,97,110,97,103,101,82,101,108,111,97,100,46,
+    95,95,101,120,105,116,95,95,78,41,7,114,17,0,0,0,
+    114,74,0,0,0,114,75,0,0,0,114,76,0,0,0,114,
+    89,0,0,0,114,92,0,0,0,114,98,0,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,
+    0,0,114,86,0,0,0,147,0,0,0,115,8,0,0,0,
+    12,2,6,2,12,3,12,3,114,86,0,0,0,99,0,0,
+    0,0,0,0,0,0,0,0,0,0,1,0,0,0,64,0,
+    0,0,115,16,0,0,0,101,0,0,90,1,0,100,0,0,
+    90,2,0,100,1,0,83,41,2,218,14,95,68,101,97,100,
+    108,111,99,107,69,114,114,111,114,78,41,3,114,17,0,0,
+    0,114,74,0,0,0,114,75,0,0,0,114,5,0,0,0,
+    114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,
+    99,0,0,0,172,0,0,0,115,2,0,0,0,12,1,114,
+    99,0,0,0,99,0,0,0,0,0,0,0,0,0,0,0,
+    0,2,0,0,0,64,0,0,0,115,82,0,0,0,101,0,
+    0,90,1,0,100,0,0,90,2,0,100,1,0,90,3,0,
+    100,2,0,100,3,0,132,0,0,90,4,0,100,4,0,100,
+    5,0,132,0,0,90,5,0,100,6,0,100,7,0,132,0,
+    0,90,6,0,100,8,0,100,9,0,132,0,0,90,7,0,
+    100,10,0,100,11,0,132,0,0,90,8,0,100,12,0,83,
+    41,13,218,11,95,77,111,100,117,108,101,76,111,99,107,122,
+    169,65,32,114,101,99,117,114,115,105,118,101,32,108,111,99,
+    107,32,105,109,112,108,101,109,101,110,116,97,116,105,111,110,
+    32,119,104,105,99,104,32,105,115,32,97,98,108,101,32,116,
+    111,32,100,101,116,101,99,116,32,100,101,97,100,108,111,99,
+    107,115,10,32,32,32,32,40,101,46,103,46,32,116,104,114,
+    101,97,100,32,49,32,116,114,121,105,110,103,32,116,111,32,
+    116,97,107,101,32,108,111,99,107,115,32,65,32,116,104,101,
+    110,32,66,44,32,97,110,100,32,116,104,114,101,97,100,32,
+    50,32,116,114,121,105,110,103,32,116,111,10,32,32,32,32,
+    116,97,107,101,32,108,111,99,107,115,32,66,32,116,104,101,
+    110,32,65,41,46,10,32,32,32,32,99,2,0,0,0,0,
+    0,0,0,2,0,0,0,2,0,0,0,67,0,0,0,115,
+    70,0,0,0,116,0,0,106,1,0,131,0,0,124,0,0,
+    95,2,0,116,0,0,106,1,0,131,0,0,124,0,0,95,
+    3,0,124,1,0,124,0,0,95,4,0,100,0,0,124,0,
+    0,95,5,0,100,1,0,124,0,0,95,6,0,100,1,0,
+    124,0,0,95,7,0,100,0,0,83,41,2,78,233,0,0,
+    0,0,41,8,218,7,95,116,104,114,101,97,100,90,13,97,
+    108,108,111,99,97,116,101,95,108,111,99,107,218,4,108,111,
+    99,107,218,6,119,97,107,101,117,112,114,84,0,0,0,218,
+    5,111,119,110,101,114,218,5,99,111,117,110,116,218,7,119,
+    97,105,116,101,114,115,41,2,114,88,0,0,0,114,84,0,
+    0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,114,89,0,0,0,182,0,0,0,115,12,0,0,0,0,
+    1,15,1,15,1,9,1,9,1,9,1,122,20,95,77,111,
+    100,117,108,101,76,111,99,107,46,95,95,105,110,105,116,95,
+    95,99,1,0,0,0,0,0,0,0,4,0,0,0,2,0,
+    0,0,67,0,0,0,115,87,0,0,0,116,0,0,106,1,
+    0,131,0,0,125,1,0,124,0,0,106,2,0,125,2,0,
+    120,59,0,116,3,0,106,4,0,124,2,0,131,1,0,125,
+    3,0,124,3,0,100,0,0,107,8,0,114,55,0,100,1,
+    0,83,124,3,0,106,2,0,125,2,0,124,2,0,124,1,
+    0,107,2,0,114,24,0,100,2,0,83,113,24,0,100,0,
+    0,83,41,3,78,70,84,41,5,114,102,0,0,0,218,9,
+    103,101,116,95,105,100,101,110,116,114,105,0,0,0,218,12,
+    95,98,108,111,99,107,105,110,103,95,111,110,114,19,0,0,
+    0,41,4,114,88,0,0,0,218,2,109,101,218,3,116,105,
+    100,114,103,0,0,0,114,5,0,0,0,114,5,0,0,0,
+    114,6,0,0,0,218,12,104,97,115,95,100,101,97,100,108,
+    111,99,107,190,0,0,0,115,18,0,0,0,0,2,12,1,
+    9,1,3,1,15,1,12,1,4,1,9,1,12,1,122,24,
+    95,77,111,100,117,108,101,76,111,99,107,46,104,97,115,95,
+    100,101,97,100,108,111,99,107,99,1,0,0,0,0,0,0,
+    0,2,0,0,0,17,0,0,0,67,0,0,0,115,214,0,
+    0,0,116,0,0,106,1,0,131,0,0,125,1,0,124,0,
+    0,116,2,0,124,1,0,60,122,177,0,120,170,0,124,0,
+    0,106,3,0,143,130,0,1,124,0,0,106,4,0,100,1,
+    0,107,2,0,115,68,0,124,0,0,106,5,0,124,1,0,
+    107,2,0,114,96,0,124,1,0,124,0,0,95,5,0,124,
+    0,0,4,106,4,0,100,2,0,55,2,95,4,0,100,3,
+    0,83,124,0,0,106,6,0,131,0,0,114,127,0,116,7,
+    0,100,4,0,124,0,0,22,131,1,0,130,1,0,110,0,
+    0,124,0,0,106,8,0,106,9,0,100,5,0,131,1,0,
+    114,163,0,124,0,0,4,106,10,0,100,2,0,55,2,95,
+    10,0,110,0,0,87,100,6,0,81,88,124,0,0,106,8,
+    0,106,9,0,131,0,0,1,124,0,0,106,8,0,106,11,
+    0,131,0,0,1,113,28,0,87,100,6,0,116,2,0,124,
+    1,0,61,88,100,6,0,83,41,7,122,185,10,32,32,32,
+    32,32,32,32,32,65,99,113,117,105,114,101,32,116,104,101,
+    32,109,111,100,117,108,101,32,108,111,99,107,46,32,32,73,
+    102,32,97,32,112,111,116,101,110,116,105,97,108,32,100,101,
+    97,100,108,111,99,107,32,105,115,32,100,101,116,101,99,116,
+    101,100,44,10,32,32,32,32,32,32,32,32,97,32,95,68,
+    101,97,100,108,111,99,107,69,114,114,111,114,32,105,115,32,
+    114,97,105,115,101,100,46,10,32,32,32,32,32,32,32,32,
+    79,116,104,101,114,119,105,115,101,44,32,116,104,101,32,108,
+    111,99,107,32,105,115,32,97,108,119,97,121,115,32,97,99,
+    113,117,105,114,101,100,32,97,110,100,32,84,114,117,101,32,
+    105,115,32,114,101,116,117,114,110,101,100,46,10,32,32,32,
+    32,32,32,32,32,114,101,0,0,0,114,39,0,0,0,84,
+    122,23,100,101,97,100,108,111,99,107,32,100,101,116,101,99,
+    116,101,100,32,98,121,32,37,114,70,78,41,12,114,102,0,
+    0,0,114,108,0,0,0,114,109,0,0,0,114,103,0,0,
+    0,114,106,0,0,0,114,105,0,0,0,114,112,0,0,0,
+    114,99,0,0,0,114,104,0,0,0,218,7,97,99,113,117,
+    105,114,101,114,107,0,0,0,218,7,114,101,108,101,97,115,
+    101,41,2,114,88,0,0,0,114,111,0,0,0,114,5,0,
+    0,0,114,5,0,0,0,114,6,0,0,0,114,113,0,0,
+    0,202,0,0,0,115,32,0,0,0,0,6,12,1,10,1,
+    3,1,3,1,10,1,30,1,9,1,15,1,4,1,12,1,
+    19,1,18,1,24,2,13,1,20,2,122,19,95,77,111,100,
+    117,108,101,76,111,99,107,46,97,99,113,117,105,114,101,99,
+    1,0,0,0,0,0,0,0,2,0,0,0,10,0,0,0,
+    67,0,0,0,115,165,0,0,0,116,0,0,106,1,0,131,
+    0,0,125,1,0,124,0,0,106,2,0,143,138,0,1,124,
+    0,0,106,3,0,124,1,0,107,3,0,114,52,0,116,4,
+    0,100,1,0,131,1,0,130,1,0,110,0,0,124,0,0,
+    106,5,0,100,2,0,107,4,0,115,73,0,116,6,0,130,
+    1,0,124,0,0,4,106,5,0,100,3,0,56,2,95,5,
+    0,124,0,0,106,5,0,100,2,0,107,2,0,114,155,0,
+    100,0,0,124,0,0,95,3,0,124,0,0,106,7,0,114,
+    155,0,124,0,0,4,106,7,0,100,3,0,56,2,95,7,
+    0,124,0,0,106,8,0,106,9,0,131,0,0,1,113,155,
+    0,110,0,0,87,100,0,0,81,88,100,0,0,83,41,4,
+    78,122,31,99,97,110,110,111,116,32,114,101,108,101,97,115,
+    101,32,117,110,45,97,99,113,117,105,114,101,100,32,108,111,
+    99,107,114,101,0,0,0,114,39,0,0,0,41,10,114,102,
+    0,0,0,114,108,0,0,0,114,103,0,0,0,114,105,0,
+    0,0,218,12,82,117,110,116,105,109,101,69,114,114,111,114,
+    114,106,0,0,0,218,14,65,115,115,101,114,116,105,111,110,
+    69,114,114,111,114,114,107,0,0,0,114,104,0,0,0,114,
+    114,0,0,0,41,2,114,88,0,0,0,114,111,0,0,0,
+    114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,
+    114,0,0,0,227,0,0,0,115,22,0,0,0,0,1,12,
+    1,10,1,15,1,15,1,21,1,15,1,15,1,9,1,9,
+    1,15,1,122,19,95,77,111,100,117,108,101,76,111,99,107,
+    46,114,101,108,101,97,115,101,99,1,0,0,0,0,0,0,
+    0,1,0,0,0,4,0,0,0,67,0,0,0,115,25,0,
+    0,0,100,1,0,106,0,0,124,0,0,106,1,0,116,2,
+    0,124,0,0,131,1,0,131,2,0,83,41,2,78,122,23,
+    95,77,111,100,117,108,101,76,111,99,107,40,123,33,114,125,
+    41,32,97,116,32,123,125,41,3,114,58,0,0,0,114,84,
+    0,0,0,114,59,0,0,0,41,1,114,88,0,0,0,114,
+    5,0,0,0,114,5,0,0,0,114,6,0,0,0,218,8,
+    95,95,114,101,112,114,95,95,240,0,0,0,115,2,0,0,
+    0,0,1,122,20,95,77,111,100,117,108,101,76,111,99,107,
+    46,95,95,114,101,112,114,95,95,78,41,9,114,17,0,0,
+    0,114,74,0,0,0,114,75,0,0,0,114,76,0,0,0,
+    114,89,0,0,0,114,112,0,0,0,114,113,0,0,0,114,
+    114,0,0,0,114,117,0,0,0,114,5,0,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,114,100,0,
+    0,0,176,0,0,0,115,12,0,0,0,12,4,6,2,12,
+    8,12,12,12,25,12,13,114,100,0,0,0,99,0,0,0,
+    0,0,0,0,0,0,0,0,0,2,0,0,0,64,0,0,
+    0,115,70,0,0,0,101,0,0,90,1,0,100,0,0,90,
+    2,0,100,1,0,90,3,0,100,2,0,100,3,0,132,0,
+    0,90,4,0,100,4,0,100,5,0,132,0,0,90,5,0,
+    100,6,0,100,7,0,132,0,0,90,6,0,100,8,0,100,
+    9,0,132,0,0,90,7,0,100,10,0,83,41,11,218,16,
     95,68,117,109,109,121,77,111,100,117,108,101,76,111,99,107,
-    46,95,95,114,101,112,114,95,95,78,41,8,114,57,0,0,
-    0,114,56,0,0,0,114,58,0,0,0,114,59,0,0,0,
-    114,72,0,0,0,114,97,0,0,0,114,98,0,0,0,114,
-    101,0,0,0,114,4,0,0,0,114,4,0,0,0,114,4,
-    0,0,0,114,5,0,0,0,114,102,0,0,0,234,0,0,
-    0,115,10,0,0,0,12,2,6,2,12,4,12,4,12,5,
-    114,102,0,0,0,99,0,0,0,0,0,0,0,0,0,0,
-    0,0,2,0,0,0,64,0,0,0,115,52,0,0,0,101,
-    0,0,90,1,0,100,0,0,90,2,0,100,1,0,100,2,
-    0,132,0,0,90,3,0,100,3,0,100,4,0,132,0,0,
-    90,4,0,100,5,0,100,6,0,132,0,0,90,5,0,100,
-    7,0,83,41,8,218,18,95,77,111,100,117,108,101,76,111,
-    99,107,77,97,110,97,103,101,114,99,2,0,0,0,0,0,
-    0,0,2,0,0,0,2,0,0,0,67,0,0,0,115,22,
-    0,0,0,124,1,0,124,0,0,95,0,0,100,0,0,124,
-    0,0,95,1,0,100,0,0,83,41,1,78,41,2,114,70,
-    0,0,0,218,5,95,108,111,99,107,41,2,114,71,0,0,
-    0,114,67,0,0,0,114,4,0,0,0,114,4,0,0,0,
-    114,5,0,0,0,114,72,0,0,0,1,1,0,0,115,4,
-    0,0,0,0,1,9,1,122,27,95,77,111,100,117,108,101,
-    76,111,99,107,77,97,110,97,103,101,114,46,95,95,105,110,
+    122,86,65,32,115,105,109,112,108,101,32,95,77,111,100,117,
+    108,101,76,111,99,107,32,101,113,117,105,118,97,108,101,110,
+    116,32,102,111,114,32,80,121,116,104,111,110,32,98,117,105,
+    108,100,115,32,119,105,116,104,111,117,116,10,32,32,32,32,
+    109,117,108,116,105,45,116,104,114,101,97,100,105,110,103,32,
+    115,117,112,112,111,114,116,46,99,2,0,0,0,0,0,0,
+    0,2,0,0,0,2,0,0,0,67,0,0,0,115,22,0,
+    0,0,124,1,0,124,0,0,95,0,0,100,1,0,124,0,
+    0,95,1,0,100,0,0,83,41,2,78,114,101,0,0,0,
+    41,2,114,84,0,0,0,114,106,0,0,0,41,2,114,88,
+    0,0,0,114,84,0,0,0,114,5,0,0,0,114,5,0,
+    0,0,114,6,0,0,0,114,89,0,0,0,248,0,0,0,
+    115,4,0,0,0,0,1,9,1,122,25,95,68,117,109,109,
+    121,77,111,100,117,108,101,76,111,99,107,46,95,95,105,110,
     105,116,95,95,99,1,0,0,0,0,0,0,0,1,0,0,
-    0,10,0,0,0,67,0,0,0,115,53,0,0,0,122,22,
-    0,116,0,0,124,0,0,106,1,0,131,1,0,124,0,0,
-    95,2,0,87,100,0,0,116,3,0,106,4,0,131,0,0,
-    1,88,124,0,0,106,2,0,106,5,0,131,0,0,1,100,
-    0,0,83,41,1,78,41,6,218,16,95,103,101,116,95,109,
-    111,100,117,108,101,95,108,111,99,107,114,70,0,0,0,114,
-    104,0,0,0,218,4,95,105,109,112,218,12,114,101,108,101,
-    97,115,101,95,108,111,99,107,114,97,0,0,0,41,1,114,
-    71,0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,114,75,0,0,0,5,1,0,0,115,8,0,0,
-    0,0,1,3,1,22,2,11,1,122,28,95,77,111,100,117,
-    108,101,76,111,99,107,77,97,110,97,103,101,114,46,95,95,
-    101,110,116,101,114,95,95,99,1,0,0,0,0,0,0,0,
-    3,0,0,0,1,0,0,0,79,0,0,0,115,17,0,0,
-    0,124,0,0,106,0,0,106,1,0,131,0,0,1,100,0,
-    0,83,41,1,78,41,2,114,104,0,0,0,114,98,0,0,
-    0,41,3,114,71,0,0,0,114,80,0,0,0,218,6,107,
-    119,97,114,103,115,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,114,81,0,0,0,12,1,0,0,115,2,0,
-    0,0,0,1,122,27,95,77,111,100,117,108,101,76,111,99,
-    107,77,97,110,97,103,101,114,46,95,95,101,120,105,116,95,
-    95,78,41,6,114,57,0,0,0,114,56,0,0,0,114,58,
-    0,0,0,114,72,0,0,0,114,75,0,0,0,114,81,0,
-    0,0,114,4,0,0,0,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,114,103,0,0,0,255,0,0,0,115,
-    6,0,0,0,12,2,12,4,12,7,114,103,0,0,0,99,
-    1,0,0,0,0,0,0,0,3,0,0,0,11,0,0,0,
-    3,0,0,0,115,142,0,0,0,100,1,0,125,1,0,121,
-    17,0,116,0,0,136,0,0,25,131,0,0,125,1,0,87,
-    110,18,0,4,116,1,0,107,10,0,114,43,0,1,1,1,
-    89,110,1,0,88,124,1,0,100,1,0,107,8,0,114,138,
-    0,116,2,0,100,1,0,107,8,0,114,83,0,116,3,0,
-    136,0,0,131,1,0,125,1,0,110,12,0,116,4,0,136,
-    0,0,131,1,0,125,1,0,135,0,0,102,1,0,100,2,
-    0,100,3,0,134,0,0,125,2,0,116,5,0,106,6,0,
-    124,1,0,124,2,0,131,2,0,116,0,0,136,0,0,60,
-    110,0,0,124,1,0,83,41,4,122,109,71,101,116,32,111,
-    114,32,99,114,101,97,116,101,32,116,104,101,32,109,111,100,
-    117,108,101,32,108,111,99,107,32,102,111,114,32,97,32,103,
-    105,118,101,110,32,109,111,100,117,108,101,32,110,97,109,101,
-    46,10,10,32,32,32,32,83,104,111,117,108,100,32,111,110,
-    108,121,32,98,101,32,99,97,108,108,101,100,32,119,105,116,
-    104,32,116,104,101,32,105,109,112,111,114,116,32,108,111,99,
-    107,32,116,97,107,101,110,46,78,99,1,0,0,0,0,0,
-    0,0,1,0,0,0,2,0,0,0,19,0,0,0,115,11,
-    0,0,0,116,0,0,136,0,0,61,100,0,0,83,41,1,
-    78,41,1,218,13,95,109,111,100,117,108,101,95,108,111,99,
-    107,115,41,1,114,36,0,0,0,41,1,114,67,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,218,2,99,98,32,1,
-    0,0,115,2,0,0,0,0,1,122,28,95,103,101,116,95,
-    109,111,100,117,108,101,95,108,111,99,107,46,60,108,111,99,
-    97,108,115,62,46,99,98,41,7,114,109,0,0,0,114,79,
-    0,0,0,114,85,0,0,0,114,102,0,0,0,114,83,0,
-    0,0,218,8,95,119,101,97,107,114,101,102,90,3,114,101,
-    102,41,3,114,67,0,0,0,114,86,0,0,0,114,110,0,
-    0,0,114,4,0,0,0,41,1,114,67,0,0,0,114,5,
-    0,0,0,114,105,0,0,0,18,1,0,0,115,24,0,0,
-    0,0,4,6,1,3,1,17,1,13,1,5,1,12,1,12,
-    1,15,2,12,1,18,2,25,1,114,105,0,0,0,99,1,
-    0,0,0,0,0,0,0,2,0,0,0,11,0,0,0,67,
-    0,0,0,115,71,0,0,0,116,0,0,124,0,0,131,1,
-    0,125,1,0,116,1,0,106,2,0,131,0,0,1,121,14,
-    0,124,1,0,106,3,0,131,0,0,1,87,110,18,0,4,
-    116,4,0,107,10,0,114,56,0,1,1,1,89,110,11,0,
-    88,124,1,0,106,5,0,131,0,0,1,100,1,0,83,41,
-    2,97,21,1,0,0,82,101,108,101,97,115,101,32,116,104,
-    101,32,103,108,111,98,97,108,32,105,109,112,111,114,116,32,
-    108,111,99,107,44,32,97,110,100,32,97,99,113,117,105,114,
-    101,115,32,116,104,101,110,32,114,101,108,101,97,115,101,32,
-    116,104,101,10,32,32,32,32,109,111,100,117,108,101,32,108,
-    111,99,107,32,102,111,114,32,97,32,103,105,118,101,110,32,
-    109,111,100,117,108,101,32,110,97,109,101,46,10,32,32,32,
-    32,84,104,105,115,32,105,115,32,117,115,101,100,32,116,111,
-    32,101,110,115,117,114,101,32,97,32,109,111,100,117,108,101,
-    32,105,115,32,99,111,109,112,108,101,116,101,108,121,32,105,
-    110,105,116,105,97,108,105,122,101,100,44,32,105,110,32,116,
-    104,101,10,32,32,32,32,101,118,101,110,116,32,105,116,32,
-    105,115,32,98,101,105,110,103,32,105,109,112,111,114,116,101,
-    100,32,98,121,32,97,110,111,116,104,101,114,32,116,104,114,
-    101,97,100,46,10,10,32,32,32,32,83,104,111,117,108,100,
-    32,111,110,108,121,32,98,101,32,99,97,108,108,101,100,32,
-    119,105,116,104,32,116,104,101,32,105,109,112,111,114,116,32,
-    108,111,99,107,32,116,97,107,101,110,46,78,41,6,114,105,
-    0,0,0,114,106,0,0,0,114,107,0,0,0,114,97,0,
-    0,0,114,82,0,0,0,114,98,0,0,0,41,2,114,67,
-    0,0,0,114,86,0,0,0,114,4,0,0,0,114,4,0,
-    0,0,114,5,0,0,0,218,19,95,108,111,99,107,95,117,
-    110,108,111,99,107,95,109,111,100,117,108,101,37,1,0,0,
-    115,14,0,0,0,0,7,12,1,10,1,3,1,14,1,13,
-    3,5,2,114,112,0,0,0,99,1,0,0,0,0,0,0,
-    0,3,0,0,0,3,0,0,0,79,0,0,0,115,13,0,
-    0,0,124,0,0,124,1,0,124,2,0,142,0,0,83,41,
-    1,97,46,1,0,0,114,101,109,111,118,101,95,105,109,112,
-    111,114,116,108,105,98,95,102,114,97,109,101,115,32,105,110,
-    32,105,109,112,111,114,116,46,99,32,119,105,108,108,32,97,
-    108,119,97,121,115,32,114,101,109,111,118,101,32,115,101,113,
-    117,101,110,99,101,115,10,32,32,32,32,111,102,32,105,109,
-    112,111,114,116,108,105,98,32,102,114,97,109,101,115,32,116,
-    104,97,116,32,101,110,100,32,119,105,116,104,32,97,32,99,
-    97,108,108,32,116,111,32,116,104,105,115,32,102,117,110,99,
-    116,105,111,110,10,10,32,32,32,32,85,115,101,32,105,116,
-    32,105,110,115,116,101,97,100,32,111,102,32,97,32,110,111,
-    114,109,97,108,32,99,97,108,108,32,105,110,32,112,108,97,
-    99,101,115,32,119,104,101,114,101,32,105,110,99,108,117,100,
-    105,110,103,32,116,104,101,32,105,109,112,111,114,116,108,105,
-    98,10,32,32,32,32,102,114,97,109,101,115,32,105,110,116,
-    114,111,100,117,99,101,115,32,117,110,119,97,110,116,101,100,
-    32,110,111,105,115,101,32,105,110,116,111,32,116,104,101,32,
-    116,114,97,99,101,98,97,99,107,32,40,101,46,103,46,32,
-    119,104,101,110,32,101,120,101,99,117,116,105,110,103,10,32,
-    32,32,32,109,111,100,117,108,101,32,99,111,100,101,41,10,
-    32,32,32,32,114,4,0,0,0,41,3,218,1,102,114,80,
-    0,0,0,90,4,107,119,100,115,114,4,0,0,0,114,4,
-    0,0,0,114,5,0,0,0,218,25,95,99,97,108,108,95,
-    119,105,116,104,95,102,114,97,109,101,115,95,114,101,109,111,
-    118,101,100,57,1,0,0,115,2,0,0,0,0,8,114,114,
-    0,0,0,105,228,12,0,0,233,2,0,0,0,114,13,0,
-    0,0,115,2,0,0,0,13,10,90,11,95,95,112,121,99,
-    97,99,104,101,95,95,122,3,46,112,121,122,4,46,112,121,
-    99,122,4,46,112,121,111,78,99,2,0,0,0,0,0,0,
-    0,11,0,0,0,6,0,0,0,67,0,0,0,115,180,0,
-    0,0,124,1,0,100,1,0,107,8,0,114,25,0,116,0,
-    0,106,1,0,106,2,0,12,110,3,0,124,1,0,125,2,
-    0,124,2,0,114,46,0,116,3,0,125,3,0,110,6,0,
-    116,4,0,125,3,0,116,5,0,124,0,0,131,1,0,92,
-    2,0,125,4,0,125,5,0,124,5,0,106,6,0,100,2,
-    0,131,1,0,92,3,0,125,6,0,125,7,0,125,8,0,
-    116,0,0,106,7,0,106,8,0,125,9,0,124,9,0,100,
-    1,0,107,8,0,114,133,0,116,9,0,100,3,0,131,1,
-    0,130,1,0,110,0,0,100,4,0,106,10,0,124,6,0,
-    124,7,0,124,9,0,124,3,0,100,5,0,25,103,4,0,
-    131,1,0,125,10,0,116,11,0,124,4,0,116,12,0,124,
-    10,0,131,3,0,83,41,6,97,244,1,0,0,71,105,118,
-    101,110,32,116,104,101,32,112,97,116,104,32,116,111,32,97,
-    32,46,112,121,32,102,105,108,101,44,32,114,101,116,117,114,
-    110,32,116,104,101,32,112,97,116,104,32,116,111,32,105,116,
-    115,32,46,112,121,99,47,46,112,121,111,32,102,105,108,101,
-    46,10,10,32,32,32,32,84,104,101,32,46,112,121,32,102,
-    105,108,101,32,100,111,101,115,32,110,111,116,32,110,101,101,
-    100,32,116,111,32,101,120,105,115,116,59,32,116,104,105,115,
-    32,115,105,109,112,108,121,32,114,101,116,117,114,110,115,32,
-    116,104,101,32,112,97,116,104,32,116,111,32,116,104,101,10,
-    32,32,32,32,46,112,121,99,47,46,112,121,111,32,102,105,
-    108,101,32,99,97,108,99,117,108,97,116,101,100,32,97,115,
-    32,105,102,32,116,104,101,32,46,112,121,32,102,105,108,101,
-    32,119,101,114,101,32,105,109,112,111,114,116,101,100,46,32,
-    32,84,104,101,32,101,120,116,101,110,115,105,111,110,10,32,
-    32,32,32,119,105,108,108,32,98,101,32,46,112,121,99,32,
-    117,110,108,101,115,115,32,115,121,115,46,102,108,97,103,115,
-    46,111,112,116,105,109,105,122,101,32,105,115,32,110,111,110,
-    45,122,101,114,111,44,32,116,104,101,110,32,105,116,32,119,
-    105,108,108,32,98,101,32,46,112,121,111,46,10,10,32,32,
-    32,32,73,102,32,100,101,98,117,103,95,111,118,101,114,114,
-    105,100,101,32,105,115,32,110,111,116,32,78,111,110,101,44,
-    32,116,104,101,110,32,105,116,32,109,117,115,116,32,98,101,
-    32,97,32,98,111,111,108,101,97,110,32,97,110,100,32,105,
-    115,32,117,115,101,100,32,105,110,10,32,32,32,32,112,108,
-    97,99,101,32,111,102,32,115,121,115,46,102,108,97,103,115,
-    46,111,112,116,105,109,105,122,101,46,10,10,32,32,32,32,
-    73,102,32,115,121,115,46,105,109,112,108,101,109,101,110,116,
-    97,116,105,111,110,46,99,97,99,104,101,95,116,97,103,32,
-    105,115,32,78,111,110,101,32,116,104,101,110,32,78,111,116,
-    73,109,112,108,101,109,101,110,116,101,100,69,114,114,111,114,
-    32,105,115,32,114,97,105,115,101,100,46,10,10,32,32,32,
-    32,78,218,1,46,122,36,115,121,115,46,105,109,112,108,101,
-    109,101,110,116,97,116,105,111,110,46,99,97,99,104,101,95,
-    116,97,103,32,105,115,32,78,111,110,101,114,30,0,0,0,
-    114,84,0,0,0,41,13,114,7,0,0,0,218,5,102,108,
-    97,103,115,218,8,111,112,116,105,109,105,122,101,218,23,68,
-    69,66,85,71,95,66,89,84,69,67,79,68,69,95,83,85,
-    70,70,73,88,69,83,218,27,79,80,84,73,77,73,90,69,
-    68,95,66,89,84,69,67,79,68,69,95,83,85,70,70,73,
-    88,69,83,114,38,0,0,0,218,9,112,97,114,116,105,116,
-    105,111,110,218,14,105,109,112,108,101,109,101,110,116,97,116,
-    105,111,110,218,9,99,97,99,104,101,95,116,97,103,218,19,
+    0,3,0,0,0,67,0,0,0,115,19,0,0,0,124,0,
+    0,4,106,0,0,100,1,0,55,2,95,0,0,100,2,0,
+    83,41,3,78,114,39,0,0,0,84,41,1,114,106,0,0,
+    0,41,1,114,88,0,0,0,114,5,0,0,0,114,5,0,
+    0,0,114,6,0,0,0,114,113,0,0,0,252,0,0,0,
+    115,4,0,0,0,0,1,15,1,122,24,95,68,117,109,109,
+    121,77,111,100,117,108,101,76,111,99,107,46,97,99,113,117,
+    105,114,101,99,1,0,0,0,0,0,0,0,1,0,0,0,
+    3,0,0,0,67,0,0,0,115,49,0,0,0,124,0,0,
+    106,0,0,100,1,0,107,2,0,114,30,0,116,1,0,100,
+    2,0,131,1,0,130,1,0,110,0,0,124,0,0,4,106,
+    0,0,100,3,0,56,2,95,0,0,100,0,0,83,41,4,
+    78,114,101,0,0,0,122,31,99,97,110,110,111,116,32,114,
+    101,108,101,97,115,101,32,117,110,45,97,99,113,117,105,114,
+    101,100,32,108,111,99,107,114,39,0,0,0,41,2,114,106,
+    0,0,0,114,115,0,0,0,41,1,114,88,0,0,0,114,
+    5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,114,
+    0,0,0,0,1,0,0,115,6,0,0,0,0,1,15,1,
+    15,1,122,24,95,68,117,109,109,121,77,111,100,117,108,101,
+    76,111,99,107,46,114,101,108,101,97,115,101,99,1,0,0,
+    0,0,0,0,0,1,0,0,0,4,0,0,0,67,0,0,
+    0,115,25,0,0,0,100,1,0,106,0,0,124,0,0,106,
+    1,0,116,2,0,124,0,0,131,1,0,131,2,0,83,41,
+    2,78,122,28,95,68,117,109,109,121,77,111,100,117,108,101,
+    76,111,99,107,40,123,33,114,125,41,32,97,116,32,123,125,
+    41,3,114,58,0,0,0,114,84,0,0,0,114,59,0,0,
+    0,41,1,114,88,0,0,0,114,5,0,0,0,114,5,0,
+    0,0,114,6,0,0,0,114,117,0,0,0,5,1,0,0,
+    115,2,0,0,0,0,1,122,25,95,68,117,109,109,121,77,
+    111,100,117,108,101,76,111,99,107,46,95,95,114,101,112,114,
+    95,95,78,41,8,114,17,0,0,0,114,74,0,0,0,114,
+    75,0,0,0,114,76,0,0,0,114,89,0,0,0,114,113,
+    0,0,0,114,114,0,0,0,114,117,0,0,0,114,5,0,
+    0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,114,118,0,0,0,244,0,0,0,115,10,0,0,0,12,
+    2,6,2,12,4,12,4,12,5,114,118,0,0,0,99,0,
+    0,0,0,0,0,0,0,0,0,0,0,2,0,0,0,64,
+    0,0,0,115,52,0,0,0,101,0,0,90,1,0,100,0,
+    0,90,2,0,100,1,0,100,2,0,132,0,0,90,3,0,
+    100,3,0,100,4,0,132,0,0,90,4,0,100,5,0,100,
+    6,0,132,0,0,90,5,0,100,7,0,83,41,8,218,18,
+    95,77,111,100,117,108,101,76,111,99,107,77,97,110,97,103,
+    101,114,99,2,0,0,0,0,0,0,0,2,0,0,0,2,
+    0,0,0,67,0,0,0,115,22,0,0,0,124,1,0,124,
+    0,0,95,0,0,100,0,0,124,0,0,95,1,0,100,0,
+    0,83,41,1,78,41,2,114,87,0,0,0,218,5,95,108,
+    111,99,107,41,2,114,88,0,0,0,114,84,0,0,0,114,
+    5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,89,
+    0,0,0,11,1,0,0,115,4,0,0,0,0,1,9,1,
+    122,27,95,77,111,100,117,108,101,76,111,99,107,77,97,110,
+    97,103,101,114,46,95,95,105,110,105,116,95,95,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,10,0,0,0,67,0,
+    0,0,115,53,0,0,0,122,22,0,116,0,0,124,0,0,
+    106,1,0,131,1,0,124,0,0,95,2,0,87,100,0,0,
+    116,3,0,106,4,0,131,0,0,1,88,124,0,0,106,2,
+    0,106,5,0,131,0,0,1,100,0,0,83,41,1,78,41,
+    6,218,16,95,103,101,116,95,109,111,100,117,108,101,95,108,
+    111,99,107,114,87,0,0,0,114,120,0,0,0,218,4,95,
+    105,109,112,218,12,114,101,108,101,97,115,101,95,108,111,99,
+    107,114,113,0,0,0,41,1,114,88,0,0,0,114,5,0,
+    0,0,114,5,0,0,0,114,6,0,0,0,114,92,0,0,
+    0,15,1,0,0,115,8,0,0,0,0,1,3,1,22,2,
+    11,1,122,28,95,77,111,100,117,108,101,76,111,99,107,77,
+    97,110,97,103,101,114,46,95,95,101,110,116,101,114,95,95,
+    99,1,0,0,0,0,0,0,0,3,0,0,0,1,0,0,
+    0,79,0,0,0,115,17,0,0,0,124,0,0,106,0,0,
+    106,1,0,131,0,0,1,100,0,0,83,41,1,78,41,2,
+    114,120,0,0,0,114,114,0,0,0,41,3,114,88,0,0,
+    0,114,97,0,0,0,218,6,107,119,97,114,103,115,114,5,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,114,98,0,
+    0,0,22,1,0,0,115,2,0,0,0,0,1,122,27,95,
+    77,111,100,117,108,101,76,111,99,107,77,97,110,97,103,101,
+    114,46,95,95,101,120,105,116,95,95,78,41,6,114,17,0,
+    0,0,114,74,0,0,0,114,75,0,0,0,114,89,0,0,
+    0,114,92,0,0,0,114,98,0,0,0,114,5,0,0,0,
+    114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,
+    119,0,0,0,9,1,0,0,115,6,0,0,0,12,2,12,
+    4,12,7,114,119,0,0,0,99,1,0,0,0,0,0,0,
+    0,3,0,0,0,11,0,0,0,3,0,0,0,115,142,0,
+    0,0,100,1,0,125,1,0,121,17,0,116,0,0,136,0,
+    0,25,131,0,0,125,1,0,87,110,18,0,4,116,1,0,
+    107,10,0,114,43,0,1,1,1,89,110,1,0,88,124,1,
+    0,100,1,0,107,8,0,114,138,0,116,2,0,100,1,0,
+    107,8,0,114,83,0,116,3,0,136,0,0,131,1,0,125,
+    1,0,110,12,0,116,4,0,136,0,0,131,1,0,125,1,
+    0,135,0,0,102,1,0,100,2,0,100,3,0,134,0,0,
+    125,2,0,116,5,0,106,6,0,124,1,0,124,2,0,131,
+    2,0,116,0,0,136,0,0,60,110,0,0,124,1,0,83,
+    41,4,122,109,71,101,116,32,111,114,32,99,114,101,97,116,
+    101,32,116,104,101,32,109,111,100,117,108,101,32,108,111,99,
+    107,32,102,111,114,32,97,32,103,105,118,101,110,32,109,111,
+    100,117,108,101,32,110,97,109,101,46,10,10,32,32,32,32,
+    83,104,111,117,108,100,32,111,110,108,121,32,98,101,32,99,
+    97,108,108,101,100,32,119,105,116,104,32,116,104,101,32,105,
+    109,112,111,114,116,32,108,111,99,107,32,116,97,107,101,110,
+    46,78,99,1,0,0,0,0,0,0,0,1,0,0,0,2,
+    0,0,0,19,0,0,0,115,11,0,0,0,116,0,0,136,
+    0,0,61,100,0,0,83,41,1,78,41,1,218,13,95,109,
+    111,100,117,108,101,95,108,111,99,107,115,41,1,114,46,0,
+    0,0,41,1,114,84,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,218,2,99,98,42,1,0,0,115,2,0,0,0,
+    0,1,122,28,95,103,101,116,95,109,111,100,117,108,101,95,
+    108,111,99,107,46,60,108,111,99,97,108,115,62,46,99,98,
+    41,7,114,125,0,0,0,114,96,0,0,0,114,102,0,0,
+    0,114,118,0,0,0,114,100,0,0,0,218,8,95,119,101,
+    97,107,114,101,102,90,3,114,101,102,41,3,114,84,0,0,
+    0,114,103,0,0,0,114,126,0,0,0,114,5,0,0,0,
+    41,1,114,84,0,0,0,114,6,0,0,0,114,121,0,0,
+    0,28,1,0,0,115,24,0,0,0,0,4,6,1,3,1,
+    17,1,13,1,5,1,12,1,12,1,15,2,12,1,18,2,
+    25,1,114,121,0,0,0,99,1,0,0,0,0,0,0,0,
+    2,0,0,0,11,0,0,0,67,0,0,0,115,71,0,0,
+    0,116,0,0,124,0,0,131,1,0,125,1,0,116,1,0,
+    106,2,0,131,0,0,1,121,14,0,124,1,0,106,3,0,
+    131,0,0,1,87,110,18,0,4,116,4,0,107,10,0,114,
+    56,0,1,1,1,89,110,11,0,88,124,1,0,106,5,0,
+    131,0,0,1,100,1,0,83,41,2,97,21,1,0,0,82,
+    101,108,101,97,115,101,32,116,104,101,32,103,108,111,98,97,
+    108,32,105,109,112,111,114,116,32,108,111,99,107,44,32,97,
+    110,100,32,97,99,113,117,105,114,101,115,32,116,104,101,110,
+    32,114,101,108,101,97,115,101,32,116,104,101,10,32,32,32,
+    32,109,111,100,117,108,101,32,108,111,99,107,32,102,111,114,
+    32,97,32,103,105,118,101,110,32,109,111,100,117,108,101,32,
+    110,97,109,101,46,10,32,32,32,32,84,104,105,115,32,105,
+    115,32,117,115,101,100,32,116,111,32,101,110,115,117,114,101,
+    32,97,32,109,111,100,117,108,101,32,105,115,32,99,111,109,
+    112,108,101,116,101,108,121,32,105,110,105,116,105,97,108,105,
+    122,101,100,44,32,105,110,32,116,104,101,10,32,32,32,32,
+    101,118,101,110,116,32,105,116,32,105,115,32,98,101,105,110,
+    103,32,105,109,112,111,114,116,101,100,32,98,121,32,97,110,
+    111,116,104,101,114,32,116,104,114,101,97,100,46,10,10,32,
+    32,32,32,83,104,111,117,108,100,32,111,110,108,121,32,98,
+    101,32,99,97,108,108,101,100,32,119,105,116,104,32,116,104,
+    101,32,105,109,112,111,114,116,32,108,111,99,107,32,116,97,
+    107,101,110,46,78,41,6,114,121,0,0,0,114,122,0,0,
+    0,114,123,0,0,0,114,113,0,0,0,114,99,0,0,0,
+    114,114,0,0,0,41,2,114,84,0,0,0,114,103,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
+    218,19,95,108,111,99,107,95,117,110,108,111,99,107,95,109,
+    111,100,117,108,101,47,1,0,0,115,14,0,0,0,0,7,
+    12,1,10,1,3,1,14,1,13,3,5,2,114,128,0,0,
+    0,99,1,0,0,0,0,0,0,0,3,0,0,0,3,0,
+    0,0,79,0,0,0,115,13,0,0,0,124,0,0,124,1,
+    0,124,2,0,142,0,0,83,41,1,97,46,1,0,0,114,
+    101,109,111,118,101,95,105,109,112,111,114,116,108,105,98,95,
+    102,114,97,109,101,115,32,105,110,32,105,109,112,111,114,116,
+    46,99,32,119,105,108,108,32,97,108,119,97,121,115,32,114,
+    101,109,111,118,101,32,115,101,113,117,101,110,99,101,115,10,
+    32,32,32,32,111,102,32,105,109,112,111,114,116,108,105,98,
+    32,102,114,97,109,101,115,32,116,104,97,116,32,101,110,100,
+    32,119,105,116,104,32,97,32,99,97,108,108,32,116,111,32,
+    116,104,105,115,32,102,117,110,99,116,105,111,110,10,10,32,
+    32,32,32,85,115,101,32,105,116,32,105,110,115,116,101,97,
+    100,32,111,102,32,97,32,110,111,114,109,97,108,32,99,97,
+    108,108,32,105,110,32,112,108,97,99,101,115,32,119,104,101,
+    114,101,32,105,110,99,108,117,100,105,110,103,32,116,104,101,
+    32,105,109,112,111,114,116,108,105,98,10,32,32,32,32,102,
+    114,97,109,101,115,32,105,110,116,114,111,100,117,99,101,115,
+    32,117,110,119,97,110,116,101,100,32,110,111,105,115,101,32,
+    105,110,116,111,32,116,104,101,32,116,114,97,99,101,98,97,
+    99,107,32,40,101,46,103,46,32,119,104,101,110,32,101,120,
+    101,99,117,116,105,110,103,10,32,32,32,32,109,111,100,117,
+    108,101,32,99,111,100,101,41,10,32,32,32,32,114,5,0,
+    0,0,41,3,218,1,102,114,97,0,0,0,90,4,107,119,
+    100,115,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,218,25,95,99,97,108,108,95,119,105,116,104,95,102,114,
+    97,109,101,115,95,114,101,109,111,118,101,100,67,1,0,0,
+    115,2,0,0,0,0,8,114,130,0,0,0,105,228,12,0,
+    0,233,2,0,0,0,114,23,0,0,0,115,2,0,0,0,
+    13,10,90,11,95,95,112,121,99,97,99,104,101,95,95,122,
+    9,46,100,105,114,105,110,100,101,120,115,10,0,0,0,100,
+    105,114,105,110,100,101,120,49,32,122,3,46,112,121,122,4,
+    46,112,121,99,122,4,46,112,121,111,78,99,2,0,0,0,
+    0,0,0,0,11,0,0,0,6,0,0,0,67,0,0,0,
+    115,180,0,0,0,124,1,0,100,1,0,107,8,0,114,25,
+    0,116,0,0,106,1,0,106,2,0,12,110,3,0,124,1,
+    0,125,2,0,124,2,0,114,46,0,116,3,0,125,3,0,
+    110,6,0,116,4,0,125,3,0,116,5,0,124,0,0,131,
+    1,0,92,2,0,125,4,0,125,5,0,124,5,0,106,6,
+    0,100,2,0,131,1,0,92,3,0,125,6,0,125,7,0,
+    125,8,0,116,0,0,106,7,0,106,8,0,125,9,0,124,
+    9,0,100,1,0,107,8,0,114,133,0,116,9,0,100,3,
+    0,131,1,0,130,1,0,110,0,0,100,4,0,106,10,0,
+    124,6,0,124,7,0,124,9,0,124,3,0,100,5,0,25,
+    103,4,0,131,1,0,125,10,0,116,11,0,124,4,0,116,
+    12,0,124,10,0,131,3,0,83,41,6,97,244,1,0,0,
+    71,105,118,101,110,32,116,104,101,32,112,97,116,104,32,116,
+    111,32,97,32,46,112,121,32,102,105,108,101,44,32,114,101,
+    116,117,114,110,32,116,104,101,32,112,97,116,104,32,116,111,
+    32,105,116,115,32,46,112,121,99,47,46,112,121,111,32,102,
+    105,108,101,46,10,10,32,32,32,32,84,104,101,32,46,112,
+    121,32,102,105,108,101,32,100,111,101,115,32,110,111,116,32,
+    110,101,101,100,32,116,111,32,101,120,105,115,116,59,32,116,
+    104,105,115,32,115,105,109,112,108,121,32,114,101,116,117,114,
+    110,115,32,116,104,101,32,112,97,116,104,32,116,111,32,116,
+    104,101,10,32,32,32,32,46,112,121,99,47,46,112,121,111,
+    32,102,105,108,101,32,99,97,108,99,117,108,97,116,101,100,
+    32,97,115,32,105,102,32,116,104,101,32,46,112,121,32,102,
+    105,108,101,32,119,101,114,101,32,105,109,112,111,114,116,101,
+    100,46,32,32,84,104,101,32,101,120,116,101,110,115,105,111,
+    110,10,32,32,32,32,119,105,108,108,32,98,101,32,46,112,
+    121,99,32,117,110,108,101,115,115,32,115,121,115,46,102,108,
+    97,103,115,46,111,112,116,105,109,105,122,101,32,105,115,32,
+    110,111,110,45,122,101,114,111,44,32,116,104,101,110,32,105,
+    116,32,119,105,108,108,32,98,101,32,46,112,121,111,46,10,
+    10,32,32,32,32,73,102,32,100,101,98,117,103,95,111,118,
+    101,114,114,105,100,101,32,105,115,32,110,111,116,32,78,111,
+    110,101,44,32,116,104,101,110,32,105,116,32,109,117,115,116,
+    32,98,101,32,97,32,98,111,111,108,101,97,110,32,97,110,
+    100,32,105,115,32,117,115,101,100,32,105,110,10,32,32,32,
+    32,112,108,97,99,101,32,111,102,32,115,121,115,46,102,108,
+    97,103,115,46,111,112,116,105,109,105,122,101,46,10,10,32,
+    32,32,32,73,102,32,115,121,115,46,105,109,112,108,101,109,
+    101,110,116,97,116,105,111,110,46,99,97,99,104,101,95,116,
+    97,103,32,105,115,32,78,111,110,101,32,116,104,101,110,32,
     78,111,116,73,109,112,108,101,109,101,110,116,101,100,69,114,
-    114,111,114,114,26,0,0,0,114,28,0,0,0,218,8,95,
-    80,89,67,65,67,72,69,41,11,114,35,0,0,0,90,14,
-    100,101,98,117,103,95,111,118,101,114,114,105,100,101,218,5,
-    100,101,98,117,103,218,8,115,117,102,102,105,120,101,115,218,
-    4,104,101,97,100,114,37,0,0,0,218,13,98,97,115,101,
-    95,102,105,108,101,110,97,109,101,218,3,115,101,112,114,36,
-    0,0,0,90,3,116,97,103,218,8,102,105,108,101,110,97,
-    109,101,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
-    0,218,17,99,97,99,104,101,95,102,114,111,109,95,115,111,
-    117,114,99,101,180,1,0,0,115,22,0,0,0,0,13,31,
-    1,6,1,9,2,6,1,18,1,24,1,12,1,12,1,15,
-    1,31,1,114,132,0,0,0,99,1,0,0,0,0,0,0,
-    0,5,0,0,0,5,0,0,0,67,0,0,0,115,193,0,
-    0,0,116,0,0,106,1,0,106,2,0,100,1,0,107,8,
-    0,114,33,0,116,3,0,100,2,0,131,1,0,130,1,0,
-    110,0,0,116,4,0,124,0,0,131,1,0,92,2,0,125,
-    1,0,125,2,0,116,4,0,124,1,0,131,1,0,92,2,
-    0,125,1,0,125,3,0,124,3,0,116,5,0,107,3,0,
-    114,108,0,116,6,0,100,3,0,106,7,0,116,5,0,124,
-    0,0,131,2,0,131,1,0,130,1,0,110,0,0,124,2,
-    0,106,8,0,100,4,0,131,1,0,100,5,0,107,3,0,
-    114,153,0,116,6,0,100,6,0,106,7,0,124,2,0,131,
-    1,0,131,1,0,130,1,0,110,0,0,124,2,0,106,9,
-    0,100,4,0,131,1,0,100,7,0,25,125,4,0,116,10,
-    0,124,1,0,124,4,0,116,11,0,100,7,0,25,23,131,
-    2,0,83,41,8,97,121,1,0,0,71,105,118,101,110,32,
-    116,104,101,32,112,97,116,104,32,116,111,32,97,32,46,112,
-    121,99,46,47,46,112,121,111,32,102,105,108,101,44,32,114,
-    101,116,117,114,110,32,116,104,101,32,112,97,116,104,32,116,
-    111,32,105,116,115,32,46,112,121,32,102,105,108,101,46,10,
-    10,32,32,32,32,84,104,101,32,46,112,121,99,47,46,112,
-    121,111,32,102,105,108,101,32,100,111,101,115,32,110,111,116,
-    32,110,101,101,100,32,116,111,32,101,120,105,115,116,59,32,
-    116,104,105,115,32,115,105,109,112,108,121,32,114,101,116,117,
-    114,110,115,32,116,104,101,32,112,97,116,104,32,116,111,10,
-    32,32,32,32,116,104,101,32,46,112,121,32,102,105,108,101,
-    32,99,97,108,99,117,108,97,116,101,100,32,116,111,32,99,
-    111,114,114,101,115,112,111,110,100,32,116,111,32,116,104,101,
-    32,46,112,121,99,47,46,112,121,111,32,102,105,108,101,46,
-    32,32,73,102,32,112,97,116,104,32,100,111,101,115,10,32,
-    32,32,32,110,111,116,32,99,111,110,102,111,114,109,32,116,
-    111,32,80,69,80,32,51,49,52,55,32,102,111,114,109,97,
-    116,44,32,86,97,108,117,101,69,114,114,111,114,32,119,105,
-    108,108,32,98,101,32,114,97,105,115,101,100,46,32,73,102,
-    10,32,32,32,32,115,121,115,46,105,109,112,108,101,109,101,
-    110,116,97,116,105,111,110,46,99,97,99,104,101,95,116,97,
-    103,32,105,115,32,78,111,110,101,32,116,104,101,110,32,78,
-    111,116,73,109,112,108,101,109,101,110,116,101,100,69,114,114,
-    111,114,32,105,115,32,114,97,105,115,101,100,46,10,10,32,
-    32,32,32,78,122,36,115,121,115,46,105,109,112,108,101,109,
+    114,111,114,32,105,115,32,114,97,105,115,101,100,46,10,10,
+    32,32,32,32,78,218,1,46,122,36,115,121,115,46,105,109,
+    112,108,101,109,101,110,116,97,116,105,111,110,46,99,97,99,
+    104,101,95,116,97,103,32,105,115,32,78,111,110,101,114,40,
+    0,0,0,114,101,0,0,0,41,13,114,8,0,0,0,114,
+    15,0,0,0,218,8,111,112,116,105,109,105,122,101,218,23,
+    68,69,66,85,71,95,66,89,84,69,67,79,68,69,95,83,
+    85,70,70,73,88,69,83,218,27,79,80,84,73,77,73,90,
+    69,68,95,66,89,84,69,67,79,68,69,95,83,85,70,70,
+    73,88,69,83,114,48,0,0,0,218,9,112,97,114,116,105,
+    116,105,111,110,218,14,105,109,112,108,101,109,101,110,116,97,
+    116,105,111,110,218,9,99,97,99,104,101,95,116,97,103,218,
+    19,78,111,116,73,109,112,108,101,109,101,110,116,101,100,69,
+    114,114,111,114,114,36,0,0,0,114,38,0,0,0,218,8,
+    95,80,89,67,65,67,72,69,41,11,114,45,0,0,0,90,
+    14,100,101,98,117,103,95,111,118,101,114,114,105,100,101,218,
+    5,100,101,98,117,103,218,8,115,117,102,102,105,120,101,115,
+    218,4,104,101,97,100,114,47,0,0,0,218,13,98,97,115,
+    101,95,102,105,108,101,110,97,109,101,218,3,115,101,112,114,
+    46,0,0,0,218,3,116,97,103,218,8,102,105,108,101,110,
+    97,109,101,114,5,0,0,0,114,5,0,0,0,114,6,0,
+    0,0,218,17,99,97,99,104,101,95,102,114,111,109,95,115,
+    111,117,114,99,101,196,1,0,0,115,22,0,0,0,0,13,
+    31,1,6,1,9,2,6,1,18,1,24,1,12,1,12,1,
+    15,1,31,1,114,148,0,0,0,99,1,0,0,0,0,0,
+    0,0,5,0,0,0,5,0,0,0,67,0,0,0,115,193,
+    0,0,0,116,0,0,106,1,0,106,2,0,100,1,0,107,
+    8,0,114,33,0,116,3,0,100,2,0,131,1,0,130,1,
+    0,110,0,0,116,4,0,124,0,0,131,1,0,92,2,0,
+    125,1,0,125,2,0,116,4,0,124,1,0,131,1,0,92,
+    2,0,125,1,0,125,3,0,124,3,0,116,5,0,107,3,
+    0,114,108,0,116,6,0,100,3,0,106,7,0,116,5,0,
+    124,0,0,131,2,0,131,1,0,130,1,0,110,0,0,124,
+    2,0,106,8,0,100,4,0,131,1,0,100,5,0,107,3,
+    0,114,153,0,116,6,0,100,6,0,106,7,0,124,2,0,
+    131,1,0,131,1,0,130,1,0,110,0,0,124,2,0,106,
+    9,0,100,4,0,131,1,0,100,7,0,25,125,4,0,116,
+    10,0,124,1,0,124,4,0,116,11,0,100,7,0,25,23,
+    131,2,0,83,41,8,97,121,1,0,0,71,105,118,101,110,
+    32,116,104,101,32,112,97,116,104,32,116,111,32,97,32,46,
+    112,121,99,46,47,46,112,121,111,32,102,105,108,101,44,32,
+    114,101,116,117,114,110,32,116,104,101,32,112,97,116,104,32,
+    116,111,32,105,116,115,32,46,112,121,32,102,105,108,101,46,
+    10,10,32,32,32,32,84,104,101,32,46,112,121,99,47,46,
+    112,121,111,32,102,105,108,101,32,100,111,101,115,32,110,111,
+    116,32,110,101,101,100,32,116,111,32,101,120,105,115,116,59,
+    32,116,104,105,115,32,115,105,109,112,108,121,32,114,101,116,
+    117,114,110,115,32,116,104,101,32,112,97,116,104,32,116,111,
+    10,32,32,32,32,116,104,101,32,46,112,121,32,102,105,108,
+    101,32,99,97,108,99,117,108,97,116,101,100,32,116,111,32,
+    99,111,114,114,101,115,112,111,110,100,32,116,111,32,116,104,
+    101,32,46,112,121,99,47,46,112,121,111,32,102,105,108,101,
+    46,32,32,73,102,32,112,97,116,104,32,100,111,101,115,10,
+    32,32,32,32,110,111,116,32,99,111,110,102,111,114,109,32,
+    116,111,32,80,69,80,32,51,49,52,55,32,102,111,114,109,
+    97,116,44,32,86,97,108,117,101,69,114,114,111,114,32,119,
+    105,108,108,32,98,101,32,114,97,105,115,101,100,46,32,73,
+    102,10,32,32,32,32,115,121,115,46,105,109,112,108,101,109,
     101,110,116,97,116,105,111,110,46,99,97,99,104,101,95,116,
-    97,103,32,105,115,32,78,111,110,101,122,37,123,125,32,110,
-    111,116,32,98,111,116,116,111,109,45,108,101,118,101,108,32,
-    100,105,114,101,99,116,111,114,121,32,105,110,32,123,33,114,
-    125,114,116,0,0,0,114,115,0,0,0,122,28,101,120,112,
-    101,99,116,101,100,32,111,110,108,121,32,50,32,100,111,116,
-    115,32,105,110,32,123,33,114,125,114,84,0,0,0,41,12,
-    114,7,0,0,0,114,122,0,0,0,114,123,0,0,0,114,
-    124,0,0,0,114,38,0,0,0,114,125,0,0,0,218,10,
-    86,97,108,117,101,69,114,114,111,114,114,47,0,0,0,114,
-    89,0,0,0,114,121,0,0,0,114,28,0,0,0,218,15,
-    83,79,85,82,67,69,95,83,85,70,70,73,88,69,83,41,
-    5,114,35,0,0,0,114,128,0,0,0,90,16,112,121,99,
-    97,99,104,101,95,102,105,108,101,110,97,109,101,90,7,112,
-    121,99,97,99,104,101,114,129,0,0,0,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,218,17,115,111,117,114,
-    99,101,95,102,114,111,109,95,99,97,99,104,101,207,1,0,
-    0,115,24,0,0,0,0,9,18,1,15,1,18,1,18,1,
-    12,1,3,1,24,1,21,1,3,1,21,1,19,1,114,135,
-    0,0,0,99,1,0,0,0,0,0,0,0,5,0,0,0,
-    13,0,0,0,67,0,0,0,115,164,0,0,0,116,0,0,
-    124,0,0,131,1,0,100,1,0,107,2,0,114,22,0,100,
-    2,0,83,124,0,0,106,1,0,100,3,0,131,1,0,92,
-    3,0,125,1,0,125,2,0,125,3,0,124,1,0,12,115,
-    81,0,124,3,0,106,2,0,131,0,0,100,7,0,100,8,
-    0,133,2,0,25,100,6,0,107,3,0,114,85,0,124,0,
-    0,83,121,16,0,116,3,0,124,0,0,131,1,0,125,4,
-    0,87,110,40,0,4,116,4,0,116,5,0,102,2,0,107,
-    10,0,114,143,0,1,1,1,124,0,0,100,2,0,100,9,
-    0,133,2,0,25,125,4,0,89,110,1,0,88,116,6,0,
-    124,4,0,131,1,0,114,160,0,124,4,0,83,124,0,0,
-    83,41,10,122,188,67,111,110,118,101,114,116,32,97,32,98,
-    121,116,101,99,111,100,101,32,102,105,108,101,32,112,97,116,
-    104,32,116,111,32,97,32,115,111,117,114,99,101,32,112,97,
-    116,104,32,40,105,102,32,112,111,115,115,105,98,108,101,41,
-    46,10,10,32,32,32,32,84,104,105,115,32,102,117,110,99,
-    116,105,111,110,32,101,120,105,115,116,115,32,112,117,114,101,
-    108,121,32,102,111,114,32,98,97,99,107,119,97,114,100,115,
-    45,99,111,109,112,97,116,105,98,105,108,105,116,121,32,102,
-    111,114,10,32,32,32,32,80,121,73,109,112,111,114,116,95,
-    69,120,101,99,67,111,100,101,77,111,100,117,108,101,87,105,
-    116,104,70,105,108,101,110,97,109,101,115,40,41,32,105,110,
-    32,116,104,101,32,67,32,65,80,73,46,10,10,32,32,32,
-    32,114,84,0,0,0,78,114,116,0,0,0,233,3,0,0,
-    0,114,29,0,0,0,90,2,112,121,233,253,255,255,255,233,
-    255,255,255,255,114,138,0,0,0,41,7,114,31,0,0,0,
-    114,32,0,0,0,218,5,108,111,119,101,114,114,135,0,0,
-    0,114,124,0,0,0,114,133,0,0,0,114,44,0,0,0,
-    41,5,218,13,98,121,116,101,99,111,100,101,95,112,97,116,
-    104,90,4,114,101,115,116,114,36,0,0,0,90,9,101,120,
-    116,101,110,115,105,111,110,218,11,115,111,117,114,99,101,95,
-    112,97,116,104,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,218,15,95,103,101,116,95,115,111,117,114,99,101,
-    102,105,108,101,230,1,0,0,115,20,0,0,0,0,7,18,
-    1,4,1,24,1,35,1,4,1,3,1,16,1,19,1,21,
-    1,114,142,0,0,0,99,1,0,0,0,0,0,0,0,2,
-    0,0,0,11,0,0,0,67,0,0,0,115,60,0,0,0,
-    121,19,0,116,0,0,124,0,0,131,1,0,106,1,0,125,
-    1,0,87,110,24,0,4,116,2,0,107,10,0,114,45,0,
-    1,1,1,100,1,0,125,1,0,89,110,1,0,88,124,1,
-    0,100,2,0,79,125,1,0,124,1,0,83,41,3,122,51,
-    67,97,108,99,117,108,97,116,101,32,116,104,101,32,109,111,
-    100,101,32,112,101,114,109,105,115,115,105,111,110,115,32,102,
-    111,114,32,97,32,98,121,116,101,99,111,100,101,32,102,105,
-    108,101,46,105,182,1,0,0,233,128,0,0,0,41,3,114,
-    39,0,0,0,114,41,0,0,0,114,40,0,0,0,41,2,
-    114,35,0,0,0,114,42,0,0,0,114,4,0,0,0,114,
-    4,0,0,0,114,5,0,0,0,218,10,95,99,97,108,99,
-    95,109,111,100,101,249,1,0,0,115,12,0,0,0,0,2,
-    3,1,19,1,13,1,11,3,10,1,114,144,0,0,0,218,
-    9,118,101,114,98,111,115,105,116,121,114,29,0,0,0,99,
-    1,0,0,0,1,0,0,0,3,0,0,0,4,0,0,0,
-    71,0,0,0,115,81,0,0,0,116,0,0,106,1,0,106,
-    2,0,124,1,0,107,5,0,114,77,0,124,0,0,106,3,
-    0,100,6,0,131,1,0,115,46,0,100,3,0,124,0,0,
-    23,125,0,0,110,0,0,116,4,0,124,0,0,106,5,0,
-    124,2,0,140,0,0,100,4,0,116,0,0,106,6,0,131,
-    1,1,1,110,0,0,100,5,0,83,41,7,122,61,80,114,
-    105,110,116,32,116,104,101,32,109,101,115,115,97,103,101,32,
-    116,111,32,115,116,100,101,114,114,32,105,102,32,45,118,47,
-    80,89,84,72,79,78,86,69,82,66,79,83,69,32,105,115,
-    32,116,117,114,110,101,100,32,111,110,46,250,1,35,250,7,
-    105,109,112,111,114,116,32,122,2,35,32,114,54,0,0,0,
-    78,41,2,114,146,0,0,0,114,147,0,0,0,41,7,114,
-    7,0,0,0,114,117,0,0,0,218,7,118,101,114,98,111,
-    115,101,114,9,0,0,0,218,5,112,114,105,110,116,114,47,
-    0,0,0,218,6,115,116,100,101,114,114,41,3,218,7,109,
-    101,115,115,97,103,101,114,145,0,0,0,114,80,0,0,0,
-    114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,218,
-    16,95,118,101,114,98,111,115,101,95,109,101,115,115,97,103,
-    101,5,2,0,0,115,8,0,0,0,0,2,18,1,15,1,
-    13,1,114,152,0,0,0,99,1,0,0,0,0,0,0,0,
-    2,0,0,0,4,0,0,0,3,0,0,0,115,38,0,0,
-    0,100,1,0,135,0,0,102,1,0,100,2,0,100,3,0,
-    134,1,0,125,1,0,116,0,0,124,1,0,136,0,0,131,
-    2,0,1,124,1,0,83,41,4,122,252,68,101,99,111,114,
-    97,116,111,114,32,116,111,32,118,101,114,105,102,121,32,116,
-    104,97,116,32,116,104,101,32,109,111,100,117,108,101,32,98,
-    101,105,110,103,32,114,101,113,117,101,115,116,101,100,32,109,
-    97,116,99,104,101,115,32,116,104,101,32,111,110,101,32,116,
-    104,101,10,32,32,32,32,108,111,97,100,101,114,32,99,97,
-    110,32,104,97,110,100,108,101,46,10,10,32,32,32,32,84,
-    104,101,32,102,105,114,115,116,32,97,114,103,117,109,101,110,
-    116,32,40,115,101,108,102,41,32,109,117,115,116,32,100,101,
-    102,105,110,101,32,95,110,97,109,101,32,119,104,105,99,104,
-    32,116,104,101,32,115,101,99,111,110,100,32,97,114,103,117,
-    109,101,110,116,32,105,115,10,32,32,32,32,99,111,109,112,
-    97,114,101,100,32,97,103,97,105,110,115,116,46,32,73,102,
-    32,116,104,101,32,99,111,109,112,97,114,105,115,111,110,32,
-    102,97,105,108,115,32,116,104,101,110,32,73,109,112,111,114,
-    116,69,114,114,111,114,32,105,115,32,114,97,105,115,101,100,
-    46,10,10,32,32,32,32,78,99,2,0,0,0,0,0,0,
-    0,4,0,0,0,5,0,0,0,31,0,0,0,115,83,0,
-    0,0,124,1,0,100,0,0,107,8,0,114,24,0,124,0,
-    0,106,0,0,125,1,0,110,40,0,124,0,0,106,0,0,
-    124,1,0,107,3,0,114,64,0,116,1,0,100,1,0,124,
-    1,0,22,100,2,0,124,1,0,131,1,1,130,1,0,110,
-    0,0,136,0,0,124,0,0,124,1,0,124,2,0,124,3,
-    0,142,2,0,83,41,3,78,122,23,108,111,97,100,101,114,
-    32,99,97,110,110,111,116,32,104,97,110,100,108,101,32,37,
-    115,114,67,0,0,0,41,2,114,67,0,0,0,218,11,73,
-    109,112,111,114,116,69,114,114,111,114,41,4,114,71,0,0,
-    0,114,67,0,0,0,114,80,0,0,0,114,108,0,0,0,
-    41,1,218,6,109,101,116,104,111,100,114,4,0,0,0,114,
-    5,0,0,0,218,19,95,99,104,101,99,107,95,110,97,109,
-    101,95,119,114,97,112,112,101,114,21,2,0,0,115,10,0,
-    0,0,0,1,12,1,12,1,15,1,25,1,122,40,95,99,
-    104,101,99,107,95,110,97,109,101,46,60,108,111,99,97,108,
-    115,62,46,95,99,104,101,99,107,95,110,97,109,101,95,119,
-    114,97,112,112,101,114,41,1,114,65,0,0,0,41,2,114,
-    154,0,0,0,114,155,0,0,0,114,4,0,0,0,41,1,
-    114,154,0,0,0,114,5,0,0,0,218,11,95,99,104,101,
-    99,107,95,110,97,109,101,13,2,0,0,115,6,0,0,0,
-    0,8,21,6,13,1,114,156,0,0,0,99,1,0,0,0,
-    0,0,0,0,2,0,0,0,3,0,0,0,3,0,0,0,
-    115,35,0,0,0,135,0,0,102,1,0,100,1,0,100,2,
-    0,134,0,0,125,1,0,116,0,0,124,1,0,136,0,0,
-    131,2,0,1,124,1,0,83,41,3,122,49,68,101,99,111,
+    97,103,32,105,115,32,78,111,110,101,32,116,104,101,110,32,
+    78,111,116,73,109,112,108,101,109,101,110,116,101,100,69,114,
+    114,111,114,32,105,115,32,114,97,105,115,101,100,46,10,10,
+    32,32,32,32,78,122,36,115,121,115,46,105,109,112,108,101,
+    109,101,110,116,97,116,105,111,110,46,99,97,99,104,101,95,
+    116,97,103,32,105,115,32,78,111,110,101,122,37,123,125,32,
+    110,111,116,32,98,111,116,116,111,109,45,108,101,118,101,108,
+    32,100,105,114,101,99,116,111,114,121,32,105,110,32,123,33,
+    114,125,114,132,0,0,0,114,131,0,0,0,122,28,101,120,
+    112,101,99,116,101,100,32,111,110,108,121,32,50,32,100,111,
+    116,115,32,105,110,32,123,33,114,125,114,101,0,0,0,41,
+    12,114,8,0,0,0,114,137,0,0,0,114,138,0,0,0,
+    114,139,0,0,0,114,48,0,0,0,114,140,0,0,0,218,
+    10,86,97,108,117,101,69,114,114,111,114,114,58,0,0,0,
+    114,106,0,0,0,114,136,0,0,0,114,38,0,0,0,218,
+    15,83,79,85,82,67,69,95,83,85,70,70,73,88,69,83,
+    41,5,114,45,0,0,0,114,143,0,0,0,90,16,112,121,
+    99,97,99,104,101,95,102,105,108,101,110,97,109,101,90,7,
+    112,121,99,97,99,104,101,114,144,0,0,0,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,218,17,115,111,117,
+    114,99,101,95,102,114,111,109,95,99,97,99,104,101,223,1,
+    0,0,115,24,0,0,0,0,9,18,1,15,1,18,1,18,
+    1,12,1,3,1,24,1,21,1,3,1,21,1,19,1,114,
+    151,0,0,0,99,1,0,0,0,0,0,0,0,5,0,0,
+    0,13,0,0,0,67,0,0,0,115,164,0,0,0,116,0,
+    0,124,0,0,131,1,0,100,1,0,107,2,0,114,22,0,
+    100,2,0,83,124,0,0,106,1,0,100,3,0,131,1,0,
+    92,3,0,125,1,0,125,2,0,125,3,0,124,1,0,12,
+    115,81,0,124,3,0,106,2,0,131,0,0,100,7,0,100,
+    8,0,133,2,0,25,100,6,0,107,3,0,114,85,0,124,
+    0,0,83,121,16,0,116,3,0,124,0,0,131,1,0,125,
+    4,0,87,110,40,0,4,116,4,0,116,5,0,102,2,0,
+    107,10,0,114,143,0,1,1,1,124,0,0,100,2,0,100,
+    9,0,133,2,0,25,125,4,0,89,110,1,0,88,116,6,
+    0,124,4,0,131,1,0,114,160,0,124,4,0,83,124,0,
+    0,83,41,10,122,188,67,111,110,118,101,114,116,32,97,32,
+    98,121,116,101,99,111,100,101,32,102,105,108,101,32,112,97,
+    116,104,32,116,111,32,97,32,115,111,117,114,99,101,32,112,
+    97,116,104,32,40,105,102,32,112,111,115,115,105,98,108,101,
+    41,46,10,10,32,32,32,32,84,104,105,115,32,102,117,110,
+    99,116,105,111,110,32,101,120,105,115,116,115,32,112,117,114,
+    101,108,121,32,102,111,114,32,98,97,99,107,119,97,114,100,
+    115,45,99,111,109,112,97,116,105,98,105,108,105,116,121,32,
+    102,111,114,10,32,32,32,32,80,121,73,109,112,111,114,116,
+    95,69,120,101,99,67,111,100,101,77,111,100,117,108,101,87,
+    105,116,104,70,105,108,101,110,97,109,101,115,40,41,32,105,
+    110,32,116,104,101,32,67,32,65,80,73,46,10,10,32,32,
+    32,32,114,101,0,0,0,78,114,132,0,0,0,233,3,0,
+    0,0,114,39,0,0,0,90,2,112,121,233,253,255,255,255,
+    233,255,255,255,255,114,154,0,0,0,41,7,114,41,0,0,
+    0,114,42,0,0,0,218,5,108,111,119,101,114,114,151,0,
+    0,0,114,139,0,0,0,114,149,0,0,0,114,54,0,0,
+    0,41,5,218,13,98,121,116,101,99,111,100,101,95,112,97,
+    116,104,90,4,114,101,115,116,114,46,0,0,0,90,9,101,
+    120,116,101,110,115,105,111,110,218,11,115,111,117,114,99,101,
+    95,112,97,116,104,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,218,15,95,103,101,116,95,115,111,117,114,99,
+    101,102,105,108,101,246,1,0,0,115,20,0,0,0,0,7,
+    18,1,4,1,24,1,35,1,4,1,3,1,16,1,19,1,
+    21,1,114,158,0,0,0,99,1,0,0,0,0,0,0,0,
+    2,0,0,0,11,0,0,0,67,0,0,0,115,60,0,0,
+    0,121,19,0,116,0,0,124,0,0,131,1,0,106,1,0,
+    125,1,0,87,110,24,0,4,116,2,0,107,10,0,114,45,
+    0,1,1,1,100,1,0,125,1,0,89,110,1,0,88,124,
+    1,0,100,2,0,79,125,1,0,124,1,0,83,41,3,122,
+    51,67,97,108,99,117,108,97,116,101,32,116,104,101,32,109,
+    111,100,101,32,112,101,114,109,105,115,115,105,111,110,115,32,
+    102,111,114,32,97,32,98,121,116,101,99,111,100,101,32,102,
+    105,108,101,46,105,182,1,0,0,233,128,0,0,0,41,3,
+    114,49,0,0,0,114,51,0,0,0,114,50,0,0,0,41,
+    2,114,45,0,0,0,114,52,0,0,0,114,5,0,0,0,
+    114,5,0,0,0,114,6,0,0,0,218,10,95,99,97,108,
+    99,95,109,111,100,101,9,2,0,0,115,12,0,0,0,0,
+    2,3,1,19,1,13,1,11,3,10,1,114,160,0,0,0,
+    218,9,118,101,114,98,111,115,105,116,121,114,39,0,0,0,
+    99,1,0,0,0,1,0,0,0,3,0,0,0,4,0,0,
+    0,71,0,0,0,115,81,0,0,0,116,0,0,106,1,0,
+    106,2,0,124,1,0,107,5,0,114,77,0,124,0,0,106,
+    3,0,100,6,0,131,1,0,115,46,0,100,3,0,124,0,
+    0,23,125,0,0,110,0,0,116,4,0,124,0,0,106,5,
+    0,124,2,0,140,0,0,100,4,0,116,0,0,106,6,0,
+    131,1,1,1,110,0,0,100,5,0,83,41,7,122,61,80,
+    114,105,110,116,32,116,104,101,32,109,101,115,115,97,103,101,
+    32,116,111,32,115,116,100,101,114,114,32,105,102,32,45,118,
+    47,80,89,84,72,79,78,86,69,82,66,79,83,69,32,105,
+    115,32,116,117,114,110,101,100,32,111,110,46,250,1,35,250,
+    7,105,109,112,111,114,116,32,122,2,35,32,114,72,0,0,
+    0,78,41,2,114,162,0,0,0,114,163,0,0,0,41,7,
+    114,8,0,0,0,114,15,0,0,0,218,7,118,101,114,98,
+    111,115,101,114,10,0,0,0,218,5,112,114,105,110,116,114,
+    58,0,0,0,218,6,115,116,100,101,114,114,41,3,218,7,
+    109,101,115,115,97,103,101,114,161,0,0,0,114,97,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
+    218,16,95,118,101,114,98,111,115,101,95,109,101,115,115,97,
+    103,101,21,2,0,0,115,8,0,0,0,0,2,18,1,15,
+    1,13,1,114,168,0,0,0,99,1,0,0,0,0,0,0,
+    0,2,0,0,0,4,0,0,0,3,0,0,0,115,38,0,
+    0,0,100,1,0,135,0,0,102,1,0,100,2,0,100,3,
+    0,134,1,0,125,1,0,116,0,0,124,1,0,136,0,0,
+    131,2,0,1,124,1,0,83,41,4,122,252,68,101,99,111,
     114,97,116,111,114,32,116,111,32,118,101,114,105,102,121,32,
-    116,104,101,32,110,97,109,101,100,32,109,111,100,117,108,101,
-    32,105,115,32,98,117,105,108,116,45,105,110,46,99,2,0,
-    0,0,0,0,0,0,2,0,0,0,4,0,0,0,19,0,
-    0,0,115,58,0,0,0,124,1,0,116,0,0,106,1,0,
-    107,7,0,114,45,0,116,2,0,100,1,0,106,3,0,124,
-    1,0,131,1,0,100,2,0,124,1,0,131,1,1,130,1,
-    0,110,0,0,136,0,0,124,0,0,124,1,0,131,2,0,
-    83,41,3,78,122,29,123,33,114,125,32,105,115,32,110,111,
-    116,32,97,32,98,117,105,108,116,45,105,110,32,109,111,100,
-    117,108,101,114,67,0,0,0,41,4,114,7,0,0,0,218,
-    20,98,117,105,108,116,105,110,95,109,111,100,117,108,101,95,
-    110,97,109,101,115,114,153,0,0,0,114,47,0,0,0,41,
-    2,114,71,0,0,0,218,8,102,117,108,108,110,97,109,101,
-    41,1,218,3,102,120,110,114,4,0,0,0,114,5,0,0,
-    0,218,25,95,114,101,113,117,105,114,101,115,95,98,117,105,
-    108,116,105,110,95,119,114,97,112,112,101,114,33,2,0,0,
-    115,8,0,0,0,0,1,15,1,18,1,12,1,122,52,95,
-    114,101,113,117,105,114,101,115,95,98,117,105,108,116,105,110,
-    46,60,108,111,99,97,108,115,62,46,95,114,101,113,117,105,
-    114,101,115,95,98,117,105,108,116,105,110,95,119,114,97,112,
-    112,101,114,41,1,114,65,0,0,0,41,2,114,159,0,0,
-    0,114,160,0,0,0,114,4,0,0,0,41,1,114,159,0,
-    0,0,114,5,0,0,0,218,17,95,114,101,113,117,105,114,
-    101,115,95,98,117,105,108,116,105,110,31,2,0,0,115,6,
-    0,0,0,0,2,18,5,13,1,114,161,0,0,0,99,1,
-    0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,3,
-    0,0,0,115,35,0,0,0,135,0,0,102,1,0,100,1,
-    0,100,2,0,134,0,0,125,1,0,116,0,0,124,1,0,
-    136,0,0,131,2,0,1,124,1,0,83,41,3,122,47,68,
-    101,99,111,114,97,116,111,114,32,116,111,32,118,101,114,105,
-    102,121,32,116,104,101,32,110,97,109,101,100,32,109,111,100,
-    117,108,101,32,105,115,32,102,114,111,122,101,110,46,99,2,
+    116,104,97,116,32,116,104,101,32,109,111,100,117,108,101,32,
+    98,101,105,110,103,32,114,101,113,117,101,115,116,101,100,32,
+    109,97,116,99,104,101,115,32,116,104,101,32,111,110,101,32,
+    116,104,101,10,32,32,32,32,108,111,97,100,101,114,32,99,
+    97,110,32,104,97,110,100,108,101,46,10,10,32,32,32,32,
+    84,104,101,32,102,105,114,115,116,32,97,114,103,117,109,101,
+    110,116,32,40,115,101,108,102,41,32,109,117,115,116,32,100,
+    101,102,105,110,101,32,95,110,97,109,101,32,119,104,105,99,
+    104,32,116,104,101,32,115,101,99,111,110,100,32,97,114,103,
+    117,109,101,110,116,32,105,115,10,32,32,32,32,99,111,109,
+    112,97,114,101,100,32,97,103,97,105,110,115,116,46,32,73,
+    102,32,116,104,101,32,99,111,109,112,97,114,105,115,111,110,
+    32,102,97,105,108,115,32,116,104,101,110,32,73,109,112,111,
+    114,116,69,114,114,111,114,32,105,115,32,114,97,105,115,101,
+    100,46,10,10,32,32,32,32,78,99,2,0,0,0,0,0,
+    0,0,4,0,0,0,5,0,0,0,31,0,0,0,115,83,
+    0,0,0,124,1,0,100,0,0,107,8,0,114,24,0,124,
+    0,0,106,0,0,125,1,0,110,40,0,124,0,0,106,0,
+    0,124,1,0,107,3,0,114,64,0,116,1,0,100,1,0,
+    124,1,0,22,100,2,0,124,1,0,131,1,1,130,1,0,
+    110,0,0,136,0,0,124,0,0,124,1,0,124,2,0,124,
+    3,0,142,2,0,83,41,3,78,122,23,108,111,97,100,101,
+    114,32,99,97,110,110,111,116,32,104,97,110,100,108,101,32,
+    37,115,114,84,0,0,0,41,2,114,84,0,0,0,218,11,
+    73,109,112,111,114,116,69,114,114,111,114,41,4,114,88,0,
+    0,0,114,84,0,0,0,114,97,0,0,0,114,124,0,0,
+    0,41,1,218,6,109,101,116,104,111,100,114,5,0,0,0,
+    114,6,0,0,0,218,19,95,99,104,101,99,107,95,110,97,
+    109,101,95,119,114,97,112,112,101,114,37,2,0,0,115,10,
+    0,0,0,0,1,12,1,12,1,15,1,25,1,122,40,95,
+    99,104,101,99,107,95,110,97,109,101,46,60,108,111,99,97,
+    108,115,62,46,95,99,104,101,99,107,95,110,97,109,101,95,
+    119,114,97,112,112,101,114,41,1,114,82,0,0,0,41,2,
+    114,170,0,0,0,114,171,0,0,0,114,5,0,0,0,41,
+    1,114,170,0,0,0,114,6,0,0,0,218,11,95,99,104,
+    101,99,107,95,110,97,109,101,29,2,0,0,115,6,0,0,
+    0,0,8,21,6,13,1,114,172,0,0,0,99,1,0,0,
+    0,0,0,0,0,2,0,0,0,3,0,0,0,3,0,0,
+    0,115,35,0,0,0,135,0,0,102,1,0,100,1,0,100,
+    2,0,134,0,0,125,1,0,116,0,0,124,1,0,136,0,
+    0,131,2,0,1,124,1,0,83,41,3,122,49,68,101,99,
+    111,114,97,116,111,114,32,116,111,32,118,101,114,105,102,121,
+    32,116,104,101,32,110,97,109,101,100,32,109,111,100,117,108,
+    101,32,105,115,32,98,117,105,108,116,45,105,110,46,99,2,
     0,0,0,0,0,0,0,2,0,0,0,4,0,0,0,19,
-    0,0,0,115,58,0,0,0,116,0,0,106,1,0,124,1,
-    0,131,1,0,115,45,0,116,2,0,100,1,0,106,3,0,
+    0,0,0,115,58,0,0,0,124,1,0,116,0,0,106,1,
+    0,107,7,0,114,45,0,116,2,0,100,1,0,106,3,0,
     124,1,0,131,1,0,100,2,0,124,1,0,131,1,1,130,
     1,0,110,0,0,136,0,0,124,0,0,124,1,0,131,2,
-    0,83,41,3,78,122,27,123,33,114,125,32,105,115,32,110,
-    111,116,32,97,32,102,114,111,122,101,110,32,109,111,100,117,
-    108,101,114,67,0,0,0,41,4,114,106,0,0,0,218,9,
-    105,115,95,102,114,111,122,101,110,114,153,0,0,0,114,47,
-    0,0,0,41,2,114,71,0,0,0,114,158,0,0,0,41,
-    1,114,159,0,0,0,114,4,0,0,0,114,5,0,0,0,
-    218,24,95,114,101,113,117,105,114,101,115,95,102,114,111,122,
-    101,110,95,119,114,97,112,112,101,114,44,2,0,0,115,8,
-    0,0,0,0,1,15,1,18,1,12,1,122,50,95,114,101,
-    113,117,105,114,101,115,95,102,114,111,122,101,110,46,60,108,
-    111,99,97,108,115,62,46,95,114,101,113,117,105,114,101,115,
-    95,102,114,111,122,101,110,95,119,114,97,112,112,101,114,41,
-    1,114,65,0,0,0,41,2,114,159,0,0,0,114,163,0,
-    0,0,114,4,0,0,0,41,1,114,159,0,0,0,114,5,
-    0,0,0,218,16,95,114,101,113,117,105,114,101,115,95,102,
-    114,111,122,101,110,42,2,0,0,115,6,0,0,0,0,2,
-    18,5,13,1,114,164,0,0,0,99,2,0,0,0,0,0,
-    0,0,5,0,0,0,5,0,0,0,67,0,0,0,115,87,
-    0,0,0,124,0,0,106,0,0,124,1,0,131,1,0,92,
-    2,0,125,2,0,125,3,0,124,2,0,100,1,0,107,8,
-    0,114,83,0,116,1,0,124,3,0,131,1,0,114,83,0,
-    100,2,0,125,4,0,116,2,0,106,3,0,124,4,0,106,
-    4,0,124,3,0,100,3,0,25,131,1,0,116,5,0,131,
-    2,0,1,110,0,0,124,2,0,83,41,4,122,86,84,114,
-    121,32,116,111,32,102,105,110,100,32,97,32,108,111,97,100,
-    101,114,32,102,111,114,32,116,104,101,32,115,112,101,99,105,
-    102,105,101,100,32,109,111,100,117,108,101,32,98,121,32,100,
-    101,108,101,103,97,116,105,110,103,32,116,111,10,32,32,32,
-    32,115,101,108,102,46,102,105,110,100,95,108,111,97,100,101,
-    114,40,41,46,78,122,44,78,111,116,32,105,109,112,111,114,
-    116,105,110,103,32,100,105,114,101,99,116,111,114,121,32,123,
-    125,58,32,109,105,115,115,105,110,103,32,95,95,105,110,105,
-    116,95,95,114,84,0,0,0,41,6,218,11,102,105,110,100,
-    95,108,111,97,100,101,114,114,31,0,0,0,218,9,95,119,
-    97,114,110,105,110,103,115,218,4,119,97,114,110,114,47,0,
-    0,0,218,13,73,109,112,111,114,116,87,97,114,110,105,110,
-    103,41,5,114,71,0,0,0,114,158,0,0,0,218,6,108,
-    111,97,100,101,114,218,8,112,111,114,116,105,111,110,115,218,
-    3,109,115,103,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,218,17,95,102,105,110,100,95,109,111,100,117,108,
-    101,95,115,104,105,109,53,2,0,0,115,10,0,0,0,0,
-    6,21,1,24,1,6,1,32,1,114,172,0,0,0,99,2,
-    0,0,0,0,0,0,0,5,0,0,0,3,0,0,0,67,
-    0,0,0,115,93,0,0,0,116,0,0,124,1,0,124,0,
-    0,131,2,0,125,2,0,116,1,0,124,2,0,131,1,0,
-    125,3,0,124,1,0,116,2,0,106,3,0,107,6,0,114,
-    79,0,116,2,0,106,3,0,124,1,0,25,125,4,0,124,
-    3,0,106,4,0,124,4,0,131,1,0,1,116,2,0,106,
-    3,0,124,1,0,25,83,124,3,0,106,5,0,131,0,0,
-    83,100,1,0,83,41,2,122,57,76,111,97,100,32,116,104,
-    101,32,115,112,101,99,105,102,105,101,100,32,109,111,100,117,
-    108,101,32,105,110,116,111,32,115,121,115,46,109,111,100,117,
-    108,101,115,32,97,110,100,32,114,101,116,117,114,110,32,105,
-    116,46,78,41,6,218,16,115,112,101,99,95,102,114,111,109,
-    95,108,111,97,100,101,114,218,12,95,83,112,101,99,77,101,
-    116,104,111,100,115,114,7,0,0,0,114,73,0,0,0,218,
-    4,101,120,101,99,218,4,108,111,97,100,41,5,114,71,0,
-    0,0,114,158,0,0,0,218,4,115,112,101,99,218,7,109,
-    101,116,104,111,100,115,218,6,109,111,100,117,108,101,114,4,
-    0,0,0,114,4,0,0,0,114,5,0,0,0,218,17,95,
-    108,111,97,100,95,109,111,100,117,108,101,95,115,104,105,109,
-    66,2,0,0,115,14,0,0,0,0,3,15,1,12,1,15,
-    1,13,1,13,1,11,2,114,180,0,0,0,99,4,0,0,
-    0,0,0,0,0,11,0,0,0,19,0,0,0,67,0,0,
-    0,115,243,1,0,0,105,0,0,125,4,0,124,2,0,100,
-    1,0,107,9,0,114,31,0,124,2,0,124,4,0,100,2,
-    0,60,110,6,0,100,3,0,125,2,0,124,3,0,100,1,
-    0,107,9,0,114,62,0,124,3,0,124,4,0,100,4,0,
-    60,110,0,0,124,0,0,100,1,0,100,5,0,133,2,0,
-    25,125,5,0,124,0,0,100,5,0,100,6,0,133,2,0,
-    25,125,6,0,124,0,0,100,6,0,100,7,0,133,2,0,
-    25,125,7,0,124,5,0,116,0,0,107,3,0,114,168,0,
-    100,8,0,106,1,0,124,2,0,124,5,0,131,2,0,125,
-    8,0,116,2,0,124,8,0,131,1,0,1,116,3,0,124,
-    8,0,124,4,0,141,1,0,130,1,0,110,116,0,116,4,
-    0,124,6,0,131,1,0,100,5,0,107,3,0,114,226,0,
-    100,9,0,106,1,0,124,2,0,131,1,0,125,8,0,116,
-    2,0,124,8,0,131,1,0,1,116,5,0,124,8,0,131,
-    1,0,130,1,0,110,58,0,116,4,0,124,7,0,131,1,
-    0,100,5,0,107,3,0,114,28,1,100,10,0,106,1,0,
+    0,83,41,3,78,122,29,123,33,114,125,32,105,115,32,110,
+    111,116,32,97,32,98,117,105,108,116,45,105,110,32,109,111,
+    100,117,108,101,114,84,0,0,0,41,4,114,8,0,0,0,
+    218,20,98,117,105,108,116,105,110,95,109,111,100,117,108,101,
+    95,110,97,109,101,115,114,169,0,0,0,114,58,0,0,0,
+    41,2,114,88,0,0,0,218,8,102,117,108,108,110,97,109,
+    101,41,1,218,3,102,120,110,114,5,0,0,0,114,6,0,
+    0,0,218,25,95,114,101,113,117,105,114,101,115,95,98,117,
+    105,108,116,105,110,95,119,114,97,112,112,101,114,49,2,0,
+    0,115,8,0,0,0,0,1,15,1,18,1,12,1,122,52,
+    95,114,101,113,117,105,114,101,115,95,98,117,105,108,116,105,
+    110,46,60,108,111,99,97,108,115,62,46,95,114,101,113,117,
+    105,114,101,115,95,98,117,105,108,116,105,110,95,119,114,97,
+    112,112,101,114,41,1,114,82,0,0,0,41,2,114,175,0,
+    0,0,114,176,0,0,0,114,5,0,0,0,41,1,114,175,
+    0,0,0,114,6,0,0,0,218,17,95,114,101,113,117,105,
+    114,101,115,95,98,117,105,108,116,105,110,47,2,0,0,115,
+    6,0,0,0,0,2,18,5,13,1,114,177,0,0,0,99,
+    1,0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,
+    3,0,0,0,115,35,0,0,0,135,0,0,102,1,0,100,
+    1,0,100,2,0,134,0,0,125,1,0,116,0,0,124,1,
+    0,136,0,0,131,2,0,1,124,1,0,83,41,3,122,47,
+    68,101,99,111,114,97,116,111,114,32,116,111,32,118,101,114,
+    105,102,121,32,116,104,101,32,110,97,109,101,100,32,109,111,
+    100,117,108,101,32,105,115,32,102,114,111,122,101,110,46,99,
+    2,0,0,0,0,0,0,0,2,0,0,0,4,0,0,0,
+    19,0,0,0,115,58,0,0,0,116,0,0,106,1,0,124,
+    1,0,131,1,0,115,45,0,116,2,0,100,1,0,106,3,
+    0,124,1,0,131,1,0,100,2,0,124,1,0,131,1,1,
+    130,1,0,110,0,0,136,0,0,124,0,0,124,1,0,131,
+    2,0,83,41,3,78,122,27,123,33,114,125,32,105,115,32,
+    110,111,116,32,97,32,102,114,111,122,101,110,32,109,111,100,
+    117,108,101,114,84,0,0,0,41,4,114,122,0,0,0,218,
+    9,105,115,95,102,114,111,122,101,110,114,169,0,0,0,114,
+    58,0,0,0,41,2,114,88,0,0,0,114,174,0,0,0,
+    41,1,114,175,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,218,24,95,114,101,113,117,105,114,101,115,95,102,114,111,
+    122,101,110,95,119,114,97,112,112,101,114,60,2,0,0,115,
+    8,0,0,0,0,1,15,1,18,1,12,1,122,50,95,114,
+    101,113,117,105,114,101,115,95,102,114,111,122,101,110,46,60,
+    108,111,99,97,108,115,62,46,95,114,101,113,117,105,114,101,
+    115,95,102,114,111,122,101,110,95,119,114,97,112,112,101,114,
+    41,1,114,82,0,0,0,41,2,114,175,0,0,0,114,179,
+    0,0,0,114,5,0,0,0,41,1,114,175,0,0,0,114,
+    6,0,0,0,218,16,95,114,101,113,117,105,114,101,115,95,
+    102,114,111,122,101,110,58,2,0,0,115,6,0,0,0,0,
+    2,18,5,13,1,114,180,0,0,0,99,2,0,0,0,0,
+    0,0,0,5,0,0,0,5,0,0,0,67,0,0,0,115,
+    87,0,0,0,124,0,0,106,0,0,124,1,0,131,1,0,
+    92,2,0,125,2,0,125,3,0,124,2,0,100,1,0,107,
+    8,0,114,83,0,116,1,0,124,3,0,131,1,0,114,83,
+    0,100,2,0,125,4,0,116,2,0,106,3,0,124,4,0,
+    106,4,0,124,3,0,100,3,0,25,131,1,0,116,5,0,
+    131,2,0,1,110,0,0,124,2,0,83,41,4,122,86,84,
+    114,121,32,116,111,32,102,105,110,100,32,97,32,108,111,97,
+    100,101,114,32,102,111,114,32,116,104,101,32,115,112,101,99,
+    105,102,105,101,100,32,109,111,100,117,108,101,32,98,121,32,
+    100,101,108,101,103,97,116,105,110,103,32,116,111,10,32,32,
+    32,32,115,101,108,102,46,102,105,110,100,95,108,111,97,100,
+    101,114,40,41,46,78,122,44,78,111,116,32,105,109,112,111,
+    114,116,105,110,103,32,100,105,114,101,99,116,111,114,121,32,
+    123,125,58,32,109,105,115,115,105,110,103,32,95,95,105,110,
+    105,116,95,95,114,101,0,0,0,41,6,218,11,102,105,110,
+    100,95,108,111,97,100,101,114,114,41,0,0,0,218,9,95,
+    119,97,114,110,105,110,103,115,218,4,119,97,114,110,114,58,
+    0,0,0,218,13,73,109,112,111,114,116,87,97,114,110,105,
+    110,103,41,5,114,88,0,0,0,114,174,0,0,0,218,6,
+    108,111,97,100,101,114,218,8,112,111,114,116,105,111,110,115,
+    218,3,109,115,103,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,218,17,95,102,105,110,100,95,109,111,100,117,
+    108,101,95,115,104,105,109,69,2,0,0,115,10,0,0,0,
+    0,6,21,1,24,1,6,1,32,1,114,188,0,0,0,99,
+    2,0,0,0,0,0,0,0,5,0,0,0,3,0,0,0,
+    67,0,0,0,115,93,0,0,0,116,0,0,124,1,0,124,
+    0,0,131,2,0,125,2,0,116,1,0,124,2,0,131,1,
+    0,125,3,0,124,1,0,116,2,0,106,3,0,107,6,0,
+    114,79,0,116,2,0,106,3,0,124,1,0,25,125,4,0,
+    124,3,0,106,4,0,124,4,0,131,1,0,1,116,2,0,
+    106,3,0,124,1,0,25,83,124,3,0,106,5,0,131,0,
+    0,83,100,1,0,83,41,2,122,57,76,111,97,100,32,116,
+    104,101,32,115,112,101,99,105,102,105,101,100,32,109,111,100,
+    117,108,101,32,105,110,116,111,32,115,121,115,46,109,111,100,
+    117,108,101,115,32,97,110,100,32,114,101,116,117,114,110,32,
+    105,116,46,78,41,6,218,16,115,112,101,99,95,102,114,111,
+    109,95,108,111,97,100,101,114,218,12,95,83,112,101,99,77,
+    101,116,104,111,100,115,114,8,0,0,0,114,90,0,0,0,
+    218,4,101,120,101,99,218,4,108,111,97,100,41,5,114,88,
+    0,0,0,114,174,0,0,0,218,4,115,112,101,99,218,7,
+    109,101,116,104,111,100,115,218,6,109,111,100,117,108,101,114,
+    5,0,0,0,114,5,0,0,0,114,6,0,0,0,218,17,
+    95,108,111,97,100,95,109,111,100,117,108,101,95,115,104,105,
+    109,82,2,0,0,115,14,0,0,0,0,3,15,1,12,1,
+    15,1,13,1,13,1,11,2,114,196,0,0,0,99,4,0,
+    0,0,0,0,0,0,11,0,0,0,19,0,0,0,67,0,
+    0,0,115,243,1,0,0,105,0,0,125,4,0,124,2,0,
+    100,1,0,107,9,0,114,31,0,124,2,0,124,4,0,100,
+    2,0,60,110,6,0,100,3,0,125,2,0,124,3,0,100,
+    1,0,107,9,0,114,62,0,124,3,0,124,4,0,100,4,
+    0,60,110,0,0,124,0,0,100,1,0,100,5,0,133,2,
+    0,25,125,5,0,124,0,0,100,5,0,100,6,0,133,2,
+    0,25,125,6,0,124,0,0,100,6,0,100,7,0,133,2,
+    0,25,125,7,0,124,5,0,116,0,0,107,3,0,114,168,
+    0,100,8,0,106,1,0,124,2,0,124,5,0,131,2,0,
+    125,8,0,116,2,0,124,8,0,131,1,0,1,116,3,0,
+    124,8,0,124,4,0,141,1,0,130,1,0,110,116,0,116,
+    4,0,124,6,0,131,1,0,100,5,0,107,3,0,114,226,
+    0,100,9,0,106,1,0,124,2,0,131,1,0,125,8,0,
+    116,2,0,124,8,0,131,1,0,1,116,5,0,124,8,0,
+    131,1,0,130,1,0,110,58,0,116,4,0,124,7,0,131,
+    1,0,100,5,0,107,3,0,114,28,1,100,10,0,106,1,
+    0,124,2,0,131,1,0,125,8,0,116,2,0,124,8,0,
+    131,1,0,1,116,5,0,124,8,0,131,1,0,130,1,0,
+    110,0,0,124,1,0,100,1,0,107,9,0,114,229,1,121,
+    20,0,116,6,0,124,1,0,100,11,0,25,131,1,0,125,
+    9,0,87,110,18,0,4,116,7,0,107,10,0,114,80,1,
+    1,1,1,89,110,62,0,88,116,8,0,124,6,0,131,1,
+    0,124,9,0,107,3,0,114,142,1,100,12,0,106,1,0,
     124,2,0,131,1,0,125,8,0,116,2,0,124,8,0,131,
-    1,0,1,116,5,0,124,8,0,131,1,0,130,1,0,110,
-    0,0,124,1,0,100,1,0,107,9,0,114,229,1,121,20,
-    0,116,6,0,124,1,0,100,11,0,25,131,1,0,125,9,
-    0,87,110,18,0,4,116,7,0,107,10,0,114,80,1,1,
-    1,1,89,110,62,0,88,116,8,0,124,6,0,131,1,0,
-    124,9,0,107,3,0,114,142,1,100,12,0,106,1,0,124,
-    2,0,131,1,0,125,8,0,116,2,0,124,8,0,131,1,
-    0,1,116,3,0,124,8,0,124,4,0,141,1,0,130,1,
-    0,110,0,0,121,18,0,124,1,0,100,13,0,25,100,14,
-    0,64,125,10,0,87,110,18,0,4,116,7,0,107,10,0,
-    114,180,1,1,1,1,89,113,229,1,88,116,8,0,124,7,
-    0,131,1,0,124,10,0,107,3,0,114,229,1,116,3,0,
-    100,12,0,106,1,0,124,2,0,131,1,0,124,4,0,141,
-    1,0,130,1,0,113,229,1,110,0,0,124,0,0,100,7,
-    0,100,1,0,133,2,0,25,83,41,15,97,122,1,0,0,
-    86,97,108,105,100,97,116,101,32,116,104,101,32,104,101,97,
-    100,101,114,32,111,102,32,116,104,101,32,112,97,115,115,101,
-    100,45,105,110,32,98,121,116,101,99,111,100,101,32,97,103,
-    97,105,110,115,116,32,115,111,117,114,99,101,95,115,116,97,
-    116,115,32,40,105,102,10,32,32,32,32,103,105,118,101,110,
-    41,32,97,110,100,32,114,101,116,117,114,110,105,110,103,32,
-    116,104,101,32,98,121,116,101,99,111,100,101,32,116,104,97,
-    116,32,99,97,110,32,98,101,32,99,111,109,112,105,108,101,
-    100,32,98,121,32,99,111,109,112,105,108,101,40,41,46,10,
-    10,32,32,32,32,65,108,108,32,111,116,104,101,114,32,97,
-    114,103,117,109,101,110,116,115,32,97,114,101,32,117,115,101,
-    100,32,116,111,32,101,110,104,97,110,99,101,32,101,114,114,
-    111,114,32,114,101,112,111,114,116,105,110,103,46,10,10,32,
-    32,32,32,73,109,112,111,114,116,69,114,114,111,114,32,105,
-    115,32,114,97,105,115,101,100,32,119,104,101,110,32,116,104,
-    101,32,109,97,103,105,99,32,110,117,109,98,101,114,32,105,
-    115,32,105,110,99,111,114,114,101,99,116,32,111,114,32,116,
-    104,101,32,98,121,116,101,99,111,100,101,32,105,115,10,32,
-    32,32,32,102,111,117,110,100,32,116,111,32,98,101,32,115,
-    116,97,108,101,46,32,69,79,70,69,114,114,111,114,32,105,
-    115,32,114,97,105,115,101,100,32,119,104,101,110,32,116,104,
-    101,32,100,97,116,97,32,105,115,32,102,111,117,110,100,32,
-    116,111,32,98,101,10,32,32,32,32,116,114,117,110,99,97,
-    116,101,100,46,10,10,32,32,32,32,78,114,67,0,0,0,
-    122,10,60,98,121,116,101,99,111,100,101,62,114,35,0,0,
-    0,114,12,0,0,0,233,8,0,0,0,233,12,0,0,0,
-    122,30,98,97,100,32,109,97,103,105,99,32,110,117,109,98,
-    101,114,32,105,110,32,123,33,114,125,58,32,123,33,114,125,
-    122,43,114,101,97,99,104,101,100,32,69,79,70,32,119,104,
-    105,108,101,32,114,101,97,100,105,110,103,32,116,105,109,101,
-    115,116,97,109,112,32,105,110,32,123,33,114,125,122,48,114,
-    101,97,99,104,101,100,32,69,79,70,32,119,104,105,108,101,
-    32,114,101,97,100,105,110,103,32,115,105,122,101,32,111,102,
-    32,115,111,117,114,99,101,32,105,110,32,123,33,114,125,218,
-    5,109,116,105,109,101,122,26,98,121,116,101,99,111,100,101,
-    32,105,115,32,115,116,97,108,101,32,102,111,114,32,123,33,
-    114,125,218,4,115,105,122,101,108,3,0,0,0,255,127,255,
-    127,3,0,41,9,218,12,77,65,71,73,67,95,78,85,77,
-    66,69,82,114,47,0,0,0,114,152,0,0,0,114,153,0,
-    0,0,114,31,0,0,0,218,8,69,79,70,69,114,114,111,
-    114,114,14,0,0,0,114,79,0,0,0,114,19,0,0,0,
-    41,11,114,53,0,0,0,218,12,115,111,117,114,99,101,95,
-    115,116,97,116,115,114,67,0,0,0,114,35,0,0,0,90,
-    11,101,120,99,95,100,101,116,97,105,108,115,90,5,109,97,
-    103,105,99,90,13,114,97,119,95,116,105,109,101,115,116,97,
-    109,112,90,8,114,97,119,95,115,105,122,101,114,151,0,0,
-    0,218,12,115,111,117,114,99,101,95,109,116,105,109,101,218,
-    11,115,111,117,114,99,101,95,115,105,122,101,114,4,0,0,
-    0,114,4,0,0,0,114,5,0,0,0,218,25,95,118,97,
-    108,105,100,97,116,101,95,98,121,116,101,99,111,100,101,95,
-    104,101,97,100,101,114,79,2,0,0,115,76,0,0,0,0,
-    11,6,1,12,1,13,3,6,1,12,1,13,1,16,1,16,
-    1,16,1,12,1,18,1,10,1,18,1,18,1,15,1,10,
-    1,15,1,18,1,15,1,10,1,15,1,12,1,3,1,20,
-    1,13,1,5,2,18,1,15,1,10,1,18,1,3,1,18,
-    1,13,1,5,2,18,1,15,1,15,1,114,190,0,0,0,
-    99,4,0,0,0,0,0,0,0,5,0,0,0,6,0,0,
-    0,67,0,0,0,115,115,0,0,0,116,0,0,106,1,0,
-    124,0,0,131,1,0,125,4,0,116,2,0,124,4,0,116,
-    3,0,131,2,0,114,78,0,116,4,0,100,1,0,124,2,
-    0,131,2,0,1,124,3,0,100,2,0,107,9,0,114,74,
-    0,116,5,0,106,6,0,124,4,0,124,3,0,131,2,0,
-    1,110,0,0,124,4,0,83,116,7,0,100,3,0,106,8,
-    0,124,2,0,131,1,0,100,4,0,124,1,0,100,5,0,
-    124,2,0,131,1,2,130,1,0,100,2,0,83,41,6,122,
-    60,67,111,109,112,105,108,101,32,98,121,116,101,99,111,100,
-    101,32,97,115,32,114,101,116,117,114,110,101,100,32,98,121,
-    32,95,118,97,108,105,100,97,116,101,95,98,121,116,101,99,
-    111,100,101,95,104,101,97,100,101,114,40,41,46,122,21,99,
-    111,100,101,32,111,98,106,101,99,116,32,102,114,111,109,32,
-    123,33,114,125,78,122,23,78,111,110,45,99,111,100,101,32,
-    111,98,106,101,99,116,32,105,110,32,123,33,114,125,114,67,
-    0,0,0,114,35,0,0,0,41,9,218,7,109,97,114,115,
-    104,97,108,90,5,108,111,97,100,115,218,10,105,115,105,110,
-    115,116,97,110,99,101,218,10,95,99,111,100,101,95,116,121,
-    112,101,114,152,0,0,0,114,106,0,0,0,90,16,95,102,
-    105,120,95,99,111,95,102,105,108,101,110,97,109,101,114,153,
-    0,0,0,114,47,0,0,0,41,5,114,53,0,0,0,114,
-    67,0,0,0,114,140,0,0,0,114,141,0,0,0,218,4,
-    99,111,100,101,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,218,17,95,99,111,109,112,105,108,101,95,98,121,
-    116,101,99,111,100,101,134,2,0,0,115,16,0,0,0,0,
-    2,15,1,15,1,13,1,12,1,19,1,4,2,18,1,114,
-    195,0,0,0,114,84,0,0,0,99,3,0,0,0,0,0,
-    0,0,4,0,0,0,3,0,0,0,67,0,0,0,115,76,
-    0,0,0,116,0,0,116,1,0,131,1,0,125,3,0,124,
-    3,0,106,2,0,116,3,0,124,1,0,131,1,0,131,1,
-    0,1,124,3,0,106,2,0,116,3,0,124,2,0,131,1,
-    0,131,1,0,1,124,3,0,106,2,0,116,4,0,106,5,
-    0,124,0,0,131,1,0,131,1,0,1,124,3,0,83,41,
-    1,122,80,67,111,109,112,105,108,101,32,97,32,99,111,100,
-    101,32,111,98,106,101,99,116,32,105,110,116,111,32,98,121,
-    116,101,99,111,100,101,32,102,111,114,32,119,114,105,116,105,
-    110,103,32,111,117,116,32,116,111,32,97,32,98,121,116,101,
-    45,99,111,109,112,105,108,101,100,10,32,32,32,32,102,105,
-    108,101,46,41,6,218,9,98,121,116,101,97,114,114,97,121,
-    114,185,0,0,0,218,6,101,120,116,101,110,100,114,17,0,
-    0,0,114,191,0,0,0,90,5,100,117,109,112,115,41,4,
-    114,194,0,0,0,114,183,0,0,0,114,189,0,0,0,114,
-    53,0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,218,17,95,99,111,100,101,95,116,111,95,98,121,
-    116,101,99,111,100,101,146,2,0,0,115,10,0,0,0,0,
-    3,12,1,19,1,19,1,22,1,114,198,0,0,0,99,1,
-    0,0,0,0,0,0,0,5,0,0,0,4,0,0,0,67,
-    0,0,0,115,89,0,0,0,100,1,0,100,2,0,108,0,
-    0,125,1,0,116,1,0,106,2,0,124,0,0,131,1,0,
-    106,3,0,125,2,0,124,1,0,106,4,0,124,2,0,131,
-    1,0,125,3,0,116,1,0,106,5,0,100,2,0,100,3,
-    0,131,2,0,125,4,0,124,4,0,106,6,0,124,0,0,
-    106,6,0,124,3,0,100,1,0,25,131,1,0,131,1,0,
-    83,41,4,122,121,68,101,99,111,100,101,32,98,121,116,101,
-    115,32,114,101,112,114,101,115,101,110,116,105,110,103,32,115,
-    111,117,114,99,101,32,99,111,100,101,32,97,110,100,32,114,
-    101,116,117,114,110,32,116,104,101,32,115,116,114,105,110,103,
-    46,10,10,32,32,32,32,85,110,105,118,101,114,115,97,108,
-    32,110,101,119,108,105,110,101,32,115,117,112,112,111,114,116,
-    32,105,115,32,117,115,101,100,32,105,110,32,116,104,101,32,
-    100,101,99,111,100,105,110,103,46,10,32,32,32,32,114,84,
-    0,0,0,78,84,41,7,218,8,116,111,107,101,110,105,122,
-    101,114,49,0,0,0,90,7,66,121,116,101,115,73,79,90,
-    8,114,101,97,100,108,105,110,101,90,15,100,101,116,101,99,
-    116,95,101,110,99,111,100,105,110,103,90,25,73,110,99,114,
-    101,109,101,110,116,97,108,78,101,119,108,105,110,101,68,101,
-    99,111,100,101,114,218,6,100,101,99,111,100,101,41,5,218,
-    12,115,111,117,114,99,101,95,98,121,116,101,115,114,199,0,
-    0,0,90,21,115,111,117,114,99,101,95,98,121,116,101,115,
-    95,114,101,97,100,108,105,110,101,218,8,101,110,99,111,100,
-    105,110,103,90,15,110,101,119,108,105,110,101,95,100,101,99,
-    111,100,101,114,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,218,13,100,101,99,111,100,101,95,115,111,117,114,
-    99,101,156,2,0,0,115,10,0,0,0,0,5,12,1,18,
-    1,15,1,18,1,114,203,0,0,0,99,1,0,0,0,0,
-    0,0,0,5,0,0,0,35,0,0,0,67,0,0,0,115,
-    15,1,0,0,116,0,0,124,0,0,100,1,0,100,0,0,
-    131,3,0,125,1,0,116,1,0,124,1,0,100,2,0,131,
-    2,0,114,74,0,121,17,0,124,1,0,106,2,0,124,0,
-    0,131,1,0,83,87,113,74,0,4,116,3,0,107,10,0,
-    114,70,0,1,1,1,89,113,74,0,88,110,0,0,121,13,
-    0,124,0,0,106,4,0,125,2,0,87,110,18,0,4,116,
-    5,0,107,10,0,114,107,0,1,1,1,89,110,29,0,88,
-    124,2,0,100,0,0,107,9,0,114,136,0,116,6,0,124,
-    2,0,131,1,0,106,2,0,131,0,0,83,121,13,0,124,
-    0,0,106,7,0,125,3,0,87,110,24,0,4,116,5,0,
-    107,10,0,114,175,0,1,1,1,100,3,0,125,3,0,89,
-    110,1,0,88,121,13,0,124,0,0,106,8,0,125,4,0,
-    87,110,59,0,4,116,5,0,107,10,0,114,250,0,1,1,
-    1,124,1,0,100,0,0,107,8,0,114,230,0,100,4,0,
-    106,9,0,124,3,0,131,1,0,83,100,5,0,106,9,0,
-    124,3,0,124,1,0,131,2,0,83,89,110,17,0,88,100,
-    6,0,106,9,0,124,3,0,124,4,0,131,2,0,83,100,
-    0,0,83,41,7,78,218,10,95,95,108,111,97,100,101,114,
-    95,95,218,11,109,111,100,117,108,101,95,114,101,112,114,250,
-    1,63,122,13,60,109,111,100,117,108,101,32,123,33,114,125,
-    62,122,20,60,109,111,100,117,108,101,32,123,33,114,125,32,
-    40,123,33,114,125,41,62,122,23,60,109,111,100,117,108,101,
-    32,123,33,114,125,32,102,114,111,109,32,123,33,114,125,62,
-    41,10,114,62,0,0,0,114,60,0,0,0,114,205,0,0,
-    0,218,9,69,120,99,101,112,116,105,111,110,218,8,95,95,
-    115,112,101,99,95,95,218,14,65,116,116,114,105,98,117,116,
-    101,69,114,114,111,114,114,174,0,0,0,114,57,0,0,0,
-    218,8,95,95,102,105,108,101,95,95,114,47,0,0,0,41,
-    5,114,179,0,0,0,114,169,0,0,0,114,177,0,0,0,
-    114,67,0,0,0,114,131,0,0,0,114,4,0,0,0,114,
-    4,0,0,0,114,5,0,0,0,218,12,95,109,111,100,117,
-    108,101,95,114,101,112,114,170,2,0,0,115,46,0,0,0,
-    0,2,18,1,15,2,3,1,17,1,13,1,8,1,3,1,
-    13,1,13,1,5,2,12,1,16,4,3,1,13,1,13,1,
-    11,1,3,1,13,1,13,1,12,1,13,2,21,2,114,211,
-    0,0,0,99,0,0,0,0,0,0,0,0,0,0,0,0,
-    2,0,0,0,64,0,0,0,115,52,0,0,0,101,0,0,
-    90,1,0,100,0,0,90,2,0,100,1,0,100,2,0,132,
-    0,0,90,3,0,100,3,0,100,4,0,132,0,0,90,4,
-    0,100,5,0,100,6,0,132,0,0,90,5,0,100,7,0,
-    83,41,8,218,17,95,105,110,115,116,97,108,108,101,100,95,
-    115,97,102,101,108,121,99,2,0,0,0,0,0,0,0,2,
-    0,0,0,2,0,0,0,67,0,0,0,115,25,0,0,0,
-    124,1,0,124,0,0,95,0,0,124,1,0,106,1,0,124,
-    0,0,95,2,0,100,0,0,83,41,1,78,41,3,218,7,
-    95,109,111,100,117,108,101,114,208,0,0,0,218,5,95,115,
-    112,101,99,41,2,114,71,0,0,0,114,179,0,0,0,114,
-    4,0,0,0,114,4,0,0,0,114,5,0,0,0,114,72,
-    0,0,0,206,2,0,0,115,4,0,0,0,0,1,9,1,
-    122,26,95,105,110,115,116,97,108,108,101,100,95,115,97,102,
-    101,108,121,46,95,95,105,110,105,116,95,95,99,1,0,0,
-    0,0,0,0,0,1,0,0,0,3,0,0,0,67,0,0,
-    0,115,38,0,0,0,100,1,0,124,0,0,106,0,0,95,
-    1,0,124,0,0,106,2,0,116,3,0,106,4,0,124,0,
-    0,106,0,0,106,5,0,60,100,0,0,83,41,2,78,84,
-    41,6,114,214,0,0,0,218,13,95,105,110,105,116,105,97,
-    108,105,122,105,110,103,114,213,0,0,0,114,7,0,0,0,
-    114,73,0,0,0,114,67,0,0,0,41,1,114,71,0,0,
-    0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,
-    114,75,0,0,0,210,2,0,0,115,4,0,0,0,0,4,
-    12,1,122,27,95,105,110,115,116,97,108,108,101,100,95,115,
-    97,102,101,108,121,46,95,95,101,110,116,101,114,95,95,99,
-    1,0,0,0,0,0,0,0,3,0,0,0,17,0,0,0,
-    71,0,0,0,115,121,0,0,0,122,101,0,124,0,0,106,
-    0,0,125,2,0,116,1,0,100,1,0,100,2,0,132,0,
-    0,124,1,0,68,131,1,0,131,1,0,114,78,0,121,17,
-    0,116,2,0,106,3,0,124,2,0,106,4,0,61,87,113,
-    100,0,4,116,5,0,107,10,0,114,74,0,1,1,1,89,
-    113,100,0,88,110,22,0,116,6,0,100,3,0,124,2,0,
-    106,4,0,124,2,0,106,7,0,131,3,0,1,87,100,0,
-    0,100,4,0,124,0,0,106,0,0,95,8,0,88,100,0,
-    0,83,41,5,78,99,1,0,0,0,0,0,0,0,2,0,
-    0,0,3,0,0,0,115,0,0,0,115,27,0,0,0,124,
-    0,0,93,17,0,125,1,0,124,1,0,100,0,0,107,9,
-    0,86,1,113,3,0,100,0,0,83,41,1,78,114,4,0,
-    0,0,41,2,114,22,0,0,0,114,76,0,0,0,114,4,
-    0,0,0,114,4,0,0,0,114,5,0,0,0,114,77,0,
-    0,0,220,2,0,0,115,2,0,0,0,6,0,122,45,95,
-    105,110,115,116,97,108,108,101,100,95,115,97,102,101,108,121,
-    46,95,95,101,120,105,116,95,95,46,60,108,111,99,97,108,
-    115,62,46,60,103,101,110,101,120,112,114,62,122,18,105,109,
-    112,111,114,116,32,123,33,114,125,32,35,32,123,33,114,125,
-    70,41,9,114,214,0,0,0,114,78,0,0,0,114,7,0,
-    0,0,114,73,0,0,0,114,67,0,0,0,114,79,0,0,
-    0,114,152,0,0,0,114,169,0,0,0,114,215,0,0,0,
-    41,3,114,71,0,0,0,114,80,0,0,0,114,177,0,0,
-    0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,
-    114,81,0,0,0,217,2,0,0,115,18,0,0,0,0,1,
-    3,1,9,1,25,1,3,1,17,1,13,1,8,2,26,2,
-    122,26,95,105,110,115,116,97,108,108,101,100,95,115,97,102,
-    101,108,121,46,95,95,101,120,105,116,95,95,78,41,6,114,
-    57,0,0,0,114,56,0,0,0,114,58,0,0,0,114,72,
-    0,0,0,114,75,0,0,0,114,81,0,0,0,114,4,0,
-    0,0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
-    0,114,212,0,0,0,204,2,0,0,115,6,0,0,0,12,
-    2,12,4,12,7,114,212,0,0,0,99,0,0,0,0,0,
-    0,0,0,0,0,0,0,8,0,0,0,64,0,0,0,115,
-    172,0,0,0,101,0,0,90,1,0,100,0,0,90,2,0,
-    100,1,0,90,3,0,100,2,0,100,3,0,100,4,0,100,
-    3,0,100,5,0,100,3,0,100,6,0,100,7,0,132,0,
-    3,90,4,0,100,8,0,100,9,0,132,0,0,90,5,0,
-    100,10,0,100,11,0,132,0,0,90,6,0,101,7,0,100,
-    12,0,100,13,0,132,0,0,131,1,0,90,8,0,101,8,
-    0,106,9,0,100,14,0,100,13,0,132,0,0,131,1,0,
-    90,8,0,101,7,0,100,15,0,100,16,0,132,0,0,131,
-    1,0,90,10,0,101,7,0,100,17,0,100,18,0,132,0,
-    0,131,1,0,90,11,0,101,11,0,106,9,0,100,19,0,
-    100,18,0,132,0,0,131,1,0,90,11,0,100,3,0,83,
-    41,20,218,10,77,111,100,117,108,101,83,112,101,99,97,208,
-    5,0,0,84,104,101,32,115,112,101,99,105,102,105,99,97,
-    116,105,111,110,32,102,111,114,32,97,32,109,111,100,117,108,
-    101,44,32,117,115,101,100,32,102,111,114,32,108,111,97,100,
-    105,110,103,46,10,10,32,32,32,32,65,32,109,111,100,117,
-    108,101,39,115,32,115,112,101,99,32,105,115,32,116,104,101,
-    32,115,111,117,114,99,101,32,102,111,114,32,105,110,102,111,
-    114,109,97,116,105,111,110,32,97,98,111,117,116,32,116,104,
-    101,32,109,111,100,117,108,101,46,32,32,70,111,114,10,32,
-    32,32,32,100,97,116,97,32,97,115,115,111,99,105,97,116,
-    101,100,32,119,105,116,104,32,116,104,101,32,109,111,100,117,
-    108,101,44,32,105,110,99,108,117,100,105,110,103,32,115,111,
-    117,114,99,101,44,32,117,115,101,32,116,104,101,32,115,112,
-    101,99,39,115,10,32,32,32,32,108,111,97,100,101,114,46,
-    10,10,32,32,32,32,96,110,97,109,101,96,32,105,115,32,
-    116,104,101,32,97,98,115,111,108,117,116,101,32,110,97,109,
-    101,32,111,102,32,116,104,101,32,109,111,100,117,108,101,46,
-    32,32,96,108,111,97,100,101,114,96,32,105,115,32,116,104,
-    101,32,108,111,97,100,101,114,10,32,32,32,32,116,111,32,
-    117,115,101,32,119,104,101,110,32,108,111,97,100,105,110,103,
-    32,116,104,101,32,109,111,100,117,108,101,46,32,32,96,112,
-    97,114,101,110,116,96,32,105,115,32,116,104,101,32,110,97,
-    109,101,32,111,102,32,116,104,101,10,32,32,32,32,112,97,
-    99,107,97,103,101,32,116,104,101,32,109,111,100,117,108,101,
-    32,105,115,32,105,110,46,32,32,84,104,101,32,112,97,114,
-    101,110,116,32,105,115,32,100,101,114,105,118,101,100,32,102,
-    114,111,109,32,116,104,101,32,110,97,109,101,46,10,10,32,
-    32,32,32,96,105,115,95,112,97,99,107,97,103,101,96,32,
-    100,101,116,101,114,109,105,110,101,115,32,105,102,32,116,104,
-    101,32,109,111,100,117,108,101,32,105,115,32,99,111,110,115,
-    105,100,101,114,101,100,32,97,32,112,97,99,107,97,103,101,
-    32,111,114,10,32,32,32,32,110,111,116,46,32,32,79,110,
-    32,109,111,100,117,108,101,115,32,116,104,105,115,32,105,115,
-    32,114,101,102,108,101,99,116,101,100,32,98,121,32,116,104,
-    101,32,96,95,95,112,97,116,104,95,95,96,32,97,116,116,
-    114,105,98,117,116,101,46,10,10,32,32,32,32,96,111,114,
-    105,103,105,110,96,32,105,115,32,116,104,101,32,115,112,101,
-    99,105,102,105,99,32,108,111,99,97,116,105,111,110,32,117,
-    115,101,100,32,98,121,32,116,104,101,32,108,111,97,100,101,
-    114,32,102,114,111,109,32,119,104,105,99,104,32,116,111,10,
-    32,32,32,32,108,111,97,100,32,116,104,101,32,109,111,100,
-    117,108,101,44,32,105,102,32,116,104,97,116,32,105,110,102,
-    111,114,109,97,116,105,111,110,32,105,115,32,97,118,97,105,
-    108,97,98,108,101,46,32,32,87,104,101,110,32,102,105,108,
-    101,110,97,109,101,32,105,115,10,32,32,32,32,115,101,116,
-    44,32,111,114,105,103,105,110,32,119,105,108,108,32,109,97,
-    116,99,104,46,10,10,32,32,32,32,96,104,97,115,95,108,
-    111,99,97,116,105,111,110,96,32,105,110,100,105,99,97,116,
-    101,115,32,116,104,97,116,32,97,32,115,112,101,99,39,115,
-    32,34,111,114,105,103,105,110,34,32,114,101,102,108,101,99,
-    116,115,32,97,32,108,111,99,97,116,105,111,110,46,10,32,
-    32,32,32,87,104,101,110,32,116,104,105,115,32,105,115,32,
-    84,114,117,101,44,32,96,95,95,102,105,108,101,95,95,96,
-    32,97,116,116,114,105,98,117,116,101,32,111,102,32,116,104,
-    101,32,109,111,100,117,108,101,32,105,115,32,115,101,116,46,
-    10,10,32,32,32,32,96,99,97,99,104,101,100,96,32,105,
-    115,32,116,104,101,32,108,111,99,97,116,105,111,110,32,111,
-    102,32,116,104,101,32,99,97,99,104,101,100,32,98,121,116,
-    101,99,111,100,101,32,102,105,108,101,44,32,105,102,32,97,
-    110,121,46,32,32,73,116,10,32,32,32,32,99,111,114,114,
-    101,115,112,111,110,100,115,32,116,111,32,116,104,101,32,96,
-    95,95,99,97,99,104,101,100,95,95,96,32,97,116,116,114,
-    105,98,117,116,101,46,10,10,32,32,32,32,96,115,117,98,
-    109,111,100,117,108,101,95,115,101,97,114,99,104,95,108,111,
-    99,97,116,105,111,110,115,96,32,105,115,32,116,104,101,32,
-    115,101,113,117,101,110,99,101,32,111,102,32,112,97,116,104,
-    32,101,110,116,114,105,101,115,32,116,111,10,32,32,32,32,
-    115,101,97,114,99,104,32,119,104,101,110,32,105,109,112,111,
-    114,116,105,110,103,32,115,117,98,109,111,100,117,108,101,115,
-    46,32,32,73,102,32,115,101,116,44,32,105,115,95,112,97,
-    99,107,97,103,101,32,115,104,111,117,108,100,32,98,101,10,
-    32,32,32,32,84,114,117,101,45,45,97,110,100,32,70,97,
-    108,115,101,32,111,116,104,101,114,119,105,115,101,46,10,10,
-    32,32,32,32,80,97,99,107,97,103,101,115,32,97,114,101,
-    32,115,105,109,112,108,121,32,109,111,100,117,108,101,115,32,
-    116,104,97,116,32,40,109,97,121,41,32,104,97,118,101,32,
-    115,117,98,109,111,100,117,108,101,115,46,32,32,73,102,32,
-    97,32,115,112,101,99,10,32,32,32,32,104,97,115,32,97,
-    32,110,111,110,45,78,111,110,101,32,118,97,108,117,101,32,
-    105,110,32,96,115,117,98,109,111,100,117,108,101,95,115,101,
-    97,114,99,104,95,108,111,99,97,116,105,111,110,115,96,44,
-    32,116,104,101,32,105,109,112,111,114,116,10,32,32,32,32,
-    115,121,115,116,101,109,32,119,105,108,108,32,99,111,110,115,
-    105,100,101,114,32,109,111,100,117,108,101,115,32,108,111,97,
-    100,101,100,32,102,114,111,109,32,116,104,101,32,115,112,101,
-    99,32,97,115,32,112,97,99,107,97,103,101,115,46,10,10,
-    32,32,32,32,79,110,108,121,32,102,105,110,100,101,114,115,
-    32,40,115,101,101,32,105,109,112,111,114,116,108,105,98,46,
-    97,98,99,46,77,101,116,97,80,97,116,104,70,105,110,100,
-    101,114,32,97,110,100,10,32,32,32,32,105,109,112,111,114,
-    116,108,105,98,46,97,98,99,46,80,97,116,104,69,110,116,
-    114,121,70,105,110,100,101,114,41,32,115,104,111,117,108,100,
-    32,109,111,100,105,102,121,32,77,111,100,117,108,101,83,112,
-    101,99,32,105,110,115,116,97,110,99,101,115,46,10,10,32,
-    32,32,32,218,6,111,114,105,103,105,110,78,218,12,108,111,
-    97,100,101,114,95,115,116,97,116,101,218,10,105,115,95,112,
-    97,99,107,97,103,101,99,3,0,0,0,3,0,0,0,6,
-    0,0,0,2,0,0,0,67,0,0,0,115,79,0,0,0,
-    124,1,0,124,0,0,95,0,0,124,2,0,124,0,0,95,
-    1,0,124,3,0,124,0,0,95,2,0,124,4,0,124,0,
-    0,95,3,0,124,5,0,114,48,0,103,0,0,110,3,0,
-    100,0,0,124,0,0,95,4,0,100,1,0,124,0,0,95,
-    5,0,100,0,0,124,0,0,95,6,0,100,0,0,83,41,
-    2,78,70,41,7,114,67,0,0,0,114,169,0,0,0,114,
-    217,0,0,0,114,218,0,0,0,218,26,115,117,98,109,111,
+    1,0,1,116,3,0,124,8,0,124,4,0,141,1,0,130,
+    1,0,110,0,0,121,18,0,124,1,0,100,13,0,25,100,
+    14,0,64,125,10,0,87,110,18,0,4,116,7,0,107,10,
+    0,114,180,1,1,1,1,89,113,229,1,88,116,8,0,124,
+    7,0,131,1,0,124,10,0,107,3,0,114,229,1,116,3,
+    0,100,12,0,106,1,0,124,2,0,131,1,0,124,4,0,
+    141,1,0,130,1,0,113,229,1,110,0,0,124,0,0,100,
+    7,0,100,1,0,133,2,0,25,83,41,15,97,122,1,0,
+    0,86,97,108,105,100,97,116,101,32,116,104,101,32,104,101,
+    97,100,101,114,32,111,102,32,116,104,101,32,112,97,115,115,
+    101,100,45,105,110,32,98,121,116,101,99,111,100,101,32,97,
+    103,97,105,110,115,116,32,115,111,117,114,99,101,95,115,116,
+    97,116,115,32,40,105,102,10,32,32,32,32,103,105,118,101,
+    110,41,32,97,110,100,32,114,101,116,117,114,110,105,110,103,
+    32,116,104,101,32,98,121,116,101,99,111,100,101,32,116,104,
+    97,116,32,99,97,110,32,98,101,32,99,111,109,112,105,108,
+    101,100,32,98,121,32,99,111,109,112,105,108,101,40,41,46,
+    10,10,32,32,32,32,65,108,108,32,111,116,104,101,114,32,
+    97,114,103,117,109,101,110,116,115,32,97,114,101,32,117,115,
+    101,100,32,116,111,32,101,110,104,97,110,99,101,32,101,114,
+    114,111,114,32,114,101,112,111,114,116,105,110,103,46,10,10,
+    32,32,32,32,73,109,112,111,114,116,69,114,114,111,114,32,
+    105,115,32,114,97,105,115,101,100,32,119,104,101,110,32,116,
+    104,101,32,109,97,103,105,99,32,110,117,109,98,101,114,32,
+    105,115,32,105,110,99,111,114,114,101,99,116,32,111,114,32,
+    116,104,101,32,98,121,116,101,99,111,100,101,32,105,115,10,
+    32,32,32,32,102,111,117,110,100,32,116,111,32,98,101,32,
+    115,116,97,108,101,46,32,69,79,70,69,114,114,111,114,32,
+    105,115,32,114,97,105,115,101,100,32,119,104,101,110,32,116,
+    104,101,32,100,97,116,97,32,105,115,32,102,111,117,110,100,
+    32,116,111,32,98,101,10,32,32,32,32,116,114,117,110,99,
+    97,116,101,100,46,10,10,32,32,32,32,78,114,84,0,0,
+    0,122,10,60,98,121,116,101,99,111,100,101,62,114,45,0,
+    0,0,114,22,0,0,0,233,8,0,0,0,233,12,0,0,
+    0,122,30,98,97,100,32,109,97,103,105,99,32,110,117,109,
+    98,101,114,32,105,110,32,123,33,114,125,58,32,123,33,114,
+    125,122,43,114,101,97,99,104,101,100,32,69,79,70,32,119,
+    104,105,108,101,32,114,101,97,100,105,110,103,32,116,105,109,
+    101,115,116,97,109,112,32,105,110,32,123,33,114,125,122,48,
+    114,101,97,99,104,101,100,32,69,79,70,32,119,104,105,108,
+    101,32,114,101,97,100,105,110,103,32,115,105,122,101,32,111,
+    102,32,115,111,117,114,99,101,32,105,110,32,123,33,114,125,
+    218,5,109,116,105,109,101,122,26,98,121,116,101,99,111,100,
+    101,32,105,115,32,115,116,97,108,101,32,102,111,114,32,123,
+    33,114,125,218,4,115,105,122,101,108,3,0,0,0,255,127,
+    255,127,3,0,41,9,218,12,77,65,71,73,67,95,78,85,
+    77,66,69,82,114,58,0,0,0,114,168,0,0,0,114,169,
+    0,0,0,114,41,0,0,0,218,8,69,79,70,69,114,114,
+    111,114,114,24,0,0,0,114,96,0,0,0,114,29,0,0,
+    0,41,11,114,69,0,0,0,218,12,115,111,117,114,99,101,
+    95,115,116,97,116,115,114,84,0,0,0,114,45,0,0,0,
+    90,11,101,120,99,95,100,101,116,97,105,108,115,90,5,109,
+    97,103,105,99,90,13,114,97,119,95,116,105,109,101,115,116,
+    97,109,112,90,8,114,97,119,95,115,105,122,101,114,167,0,
+    0,0,218,12,115,111,117,114,99,101,95,109,116,105,109,101,
+    218,11,115,111,117,114,99,101,95,115,105,122,101,114,5,0,
+    0,0,114,5,0,0,0,114,6,0,0,0,218,25,95,118,
+    97,108,105,100,97,116,101,95,98,121,116,101,99,111,100,101,
+    95,104,101,97,100,101,114,95,2,0,0,115,76,0,0,0,
+    0,11,6,1,12,1,13,3,6,1,12,1,13,1,16,1,
+    16,1,16,1,12,1,18,1,10,1,18,1,18,1,15,1,
+    10,1,15,1,18,1,15,1,10,1,15,1,12,1,3,1,
+    20,1,13,1,5,2,18,1,15,1,10,1,18,1,3,1,
+    18,1,13,1,5,2,18,1,15,1,15,1,114,206,0,0,
+    0,99,4,0,0,0,0,0,0,0,5,0,0,0,6,0,
+    0,0,67,0,0,0,115,115,0,0,0,116,0,0,106,1,
+    0,124,0,0,131,1,0,125,4,0,116,2,0,124,4,0,
+    116,3,0,131,2,0,114,78,0,116,4,0,100,1,0,124,
+    2,0,131,2,0,1,124,3,0,100,2,0,107,9,0,114,
+    74,0,116,5,0,106,6,0,124,4,0,124,3,0,131,2,
+    0,1,110,0,0,124,4,0,83,116,7,0,100,3,0,106,
+    8,0,124,2,0,131,1,0,100,4,0,124,1,0,100,5,
+    0,124,2,0,131,1,2,130,1,0,100,2,0,83,41,6,
+    122,60,67,111,109,112,105,108,101,32,98,121,116,101,99,111,
+    100,101,32,97,115,32,114,101,116,117,114,110,101,100,32,98,
+    121,32,95,118,97,108,105,100,97,116,101,95,98,121,116,101,
+    99,111,100,101,95,104,101,97,100,101,114,40,41,46,122,21,
+    99,111,100,101,32,111,98,106,101,99,116,32,102,114,111,109,
+    32,123,33,114,125,78,122,23,78,111,110,45,99,111,100,101,
+    32,111,98,106,101,99,116,32,105,110,32,123,33,114,125,114,
+    84,0,0,0,114,45,0,0,0,41,9,218,7,109,97,114,
+    115,104,97,108,90,5,108,111,97,100,115,218,10,105,115,105,
+    110,115,116,97,110,99,101,218,10,95,99,111,100,101,95,116,
+    121,112,101,114,168,0,0,0,114,122,0,0,0,90,16,95,
+    102,105,120,95,99,111,95,102,105,108,101,110,97,109,101,114,
+    169,0,0,0,114,58,0,0,0,41,5,114,69,0,0,0,
+    114,84,0,0,0,114,156,0,0,0,114,157,0,0,0,218,
+    4,99,111,100,101,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,218,17,95,99,111,109,112,105,108,101,95,98,
+    121,116,101,99,111,100,101,150,2,0,0,115,16,0,0,0,
+    0,2,15,1,15,1,13,1,12,1,19,1,4,2,18,1,
+    114,211,0,0,0,114,101,0,0,0,99,3,0,0,0,0,
+    0,0,0,4,0,0,0,3,0,0,0,67,0,0,0,115,
+    76,0,0,0,116,0,0,116,1,0,131,1,0,125,3,0,
+    124,3,0,106,2,0,116,3,0,124,1,0,131,1,0,131,
+    1,0,1,124,3,0,106,2,0,116,3,0,124,2,0,131,
+    1,0,131,1,0,1,124,3,0,106,2,0,116,4,0,106,
+    5,0,124,0,0,131,1,0,131,1,0,1,124,3,0,83,
+    41,1,122,80,67,111,109,112,105,108,101,32,97,32,99,111,
+    100,101,32,111,98,106,101,99,116,32,105,110,116,111,32,98,
+    121,116,101,99,111,100,101,32,102,111,114,32,119,114,105,116,
+    105,110,103,32,111,117,116,32,116,111,32,97,32,98,121,116,
+    101,45,99,111,109,112,105,108,101,100,10,32,32,32,32,102,
+    105,108,101,46,41,6,218,9,98,121,116,101,97,114,114,97,
+    121,114,201,0,0,0,218,6,101,120,116,101,110,100,114,27,
+    0,0,0,114,207,0,0,0,90,5,100,117,109,112,115,41,
+    4,114,210,0,0,0,114,199,0,0,0,114,205,0,0,0,
+    114,69,0,0,0,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,218,17,95,99,111,100,101,95,116,111,95,98,
+    121,116,101,99,111,100,101,162,2,0,0,115,10,0,0,0,
+    0,3,12,1,19,1,19,1,22,1,114,214,0,0,0,99,
+    1,0,0,0,0,0,0,0,5,0,0,0,4,0,0,0,
+    67,0,0,0,115,89,0,0,0,100,1,0,100,2,0,108,
+    0,0,125,1,0,116,1,0,106,2,0,124,0,0,131,1,
+    0,106,3,0,125,2,0,124,1,0,106,4,0,124,2,0,
+    131,1,0,125,3,0,116,1,0,106,5,0,100,2,0,100,
+    3,0,131,2,0,125,4,0,124,4,0,106,6,0,124,0,
+    0,106,6,0,124,3,0,100,1,0,25,131,1,0,131,1,
+    0,83,41,4,122,121,68,101,99,111,100,101,32,98,121,116,
+    101,115,32,114,101,112,114,101,115,101,110,116,105,110,103,32,
+    115,111,117,114,99,101,32,99,111,100,101,32,97,110,100,32,
+    114,101,116,117,114,110,32,116,104,101,32,115,116,114,105,110,
+    103,46,10,10,32,32,32,32,85,110,105,118,101,114,115,97,
+    108,32,110,101,119,108,105,110,101,32,115,117,112,112,111,114,
+    116,32,105,115,32,117,115,101,100,32,105,110,32,116,104,101,
+    32,100,101,99,111,100,105,110,103,46,10,32,32,32,32,114,
+    101,0,0,0,78,84,41,7,218,8,116,111,107,101,110,105,
+    122,101,114,64,0,0,0,90,7,66,121,116,101,115,73,79,
+    90,8,114,101,97,100,108,105,110,101,90,15,100,101,116,101,
+    99,116,95,101,110,99,111,100,105,110,103,90,25,73,110,99,
+    114,101,109,101,110,116,97,108,78,101,119,108,105,110,101,68,
+    101,99,111,100,101,114,218,6,100,101,99,111,100,101,41,5,
+    218,12,115,111,117,114,99,101,95,98,121,116,101,115,114,215,
+    0,0,0,90,21,115,111,117,114,99,101,95,98,121,116,101,
+    115,95,114,101,97,100,108,105,110,101,218,8,101,110,99,111,
+    100,105,110,103,90,15,110,101,119,108,105,110,101,95,100,101,
+    99,111,100,101,114,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,218,13,100,101,99,111,100,101,95,115,111,117,
+    114,99,101,172,2,0,0,115,10,0,0,0,0,5,12,1,
+    18,1,15,1,18,1,114,219,0,0,0,99,1,0,0,0,
+    0,0,0,0,5,0,0,0,35,0,0,0,67,0,0,0,
+    115,15,1,0,0,116,0,0,124,0,0,100,1,0,100,0,
+    0,131,3,0,125,1,0,116,1,0,124,1,0,100,2,0,
+    131,2,0,114,74,0,121,17,0,124,1,0,106,2,0,124,
+    0,0,131,1,0,83,87,113,74,0,4,116,3,0,107,10,
+    0,114,70,0,1,1,1,89,113,74,0,88,110,0,0,121,
+    13,0,124,0,0,106,4,0,125,2,0,87,110,18,0,4,
+    116,5,0,107,10,0,114,107,0,1,1,1,89,110,29,0,
+    88,124,2,0,100,0,0,107,9,0,114,136,0,116,6,0,
+    124,2,0,131,1,0,106,2,0,131,0,0,83,121,13,0,
+    124,0,0,106,7,0,125,3,0,87,110,24,0,4,116,5,
+    0,107,10,0,114,175,0,1,1,1,100,3,0,125,3,0,
+    89,110,1,0,88,121,13,0,124,0,0,106,8,0,125,4,
+    0,87,110,59,0,4,116,5,0,107,10,0,114,250,0,1,
+    1,1,124,1,0,100,0,0,107,8,0,114,230,0,100,4,
+    0,106,9,0,124,3,0,131,1,0,83,100,5,0,106,9,
+    0,124,3,0,124,1,0,131,2,0,83,89,110,17,0,88,
+    100,6,0,106,9,0,124,3,0,124,4,0,131,2,0,83,
+    100,0,0,83,41,7,78,218,10,95,95,108,111,97,100,101,
+    114,95,95,218,11,109,111,100,117,108,101,95,114,101,112,114,
+    250,1,63,122,13,60,109,111,100,117,108,101,32,123,33,114,
+    125,62,122,20,60,109,111,100,117,108,101,32,123,33,114,125,
+    32,40,123,33,114,125,41,62,122,23,60,109,111,100,117,108,
+    101,32,123,33,114,125,32,102,114,111,109,32,123,33,114,125,
+    62,41,10,114,79,0,0,0,114,77,0,0,0,114,221,0,
+    0,0,218,9,69,120,99,101,112,116,105,111,110,218,8,95,
+    95,115,112,101,99,95,95,218,14,65,116,116,114,105,98,117,
+    116,101,69,114,114,111,114,114,190,0,0,0,114,17,0,0,
+    0,218,8,95,95,102,105,108,101,95,95,114,58,0,0,0,
+    41,5,114,195,0,0,0,114,185,0,0,0,114,193,0,0,
+    0,114,84,0,0,0,114,147,0,0,0,114,5,0,0,0,
+    114,5,0,0,0,114,6,0,0,0,218,12,95,109,111,100,
+    117,108,101,95,114,101,112,114,186,2,0,0,115,46,0,0,
+    0,0,2,18,1,15,2,3,1,17,1,13,1,8,1,3,
+    1,13,1,13,1,5,2,12,1,16,4,3,1,13,1,13,
+    1,11,1,3,1,13,1,13,1,12,1,13,2,21,2,114,
+    227,0,0,0,99,0,0,0,0,0,0,0,0,0,0,0,
+    0,2,0,0,0,64,0,0,0,115,52,0,0,0,101,0,
+    0,90,1,0,100,0,0,90,2,0,100,1,0,100,2,0,
+    132,0,0,90,3,0,100,3,0,100,4,0,132,0,0,90,
+    4,0,100,5,0,100,6,0,132,0,0,90,5,0,100,7,
+    0,83,41,8,218,17,95,105,110,115,116,97,108,108,101,100,
+    95,115,97,102,101,108,121,99,2,0,0,0,0,0,0,0,
+    2,0,0,0,2,0,0,0,67,0,0,0,115,25,0,0,
+    0,124,1,0,124,0,0,95,0,0,124,1,0,106,1,0,
+    124,0,0,95,2,0,100,0,0,83,41,1,78,41,3,218,
+    7,95,109,111,100,117,108,101,114,224,0,0,0,218,5,95,
+    115,112,101,99,41,2,114,88,0,0,0,114,195,0,0,0,
+    114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,
+    89,0,0,0,222,2,0,0,115,4,0,0,0,0,1,9,
+    1,122,26,95,105,110,115,116,97,108,108,101,100,95,115,97,
+    102,101,108,121,46,95,95,105,110,105,116,95,95,99,1,0,
+    0,0,0,0,0,0,1,0,0,0,3,0,0,0,67,0,
+    0,0,115,38,0,0,0,100,1,0,124,0,0,106,0,0,
+    95,1,0,124,0,0,106,2,0,116,3,0,106,4,0,124,
+    0,0,106,0,0,106,5,0,60,100,0,0,83,41,2,78,
+    84,41,6,114,230,0,0,0,218,13,95,105,110,105,116,105,
+    97,108,105,122,105,110,103,114,229,0,0,0,114,8,0,0,
+    0,114,90,0,0,0,114,84,0,0,0,41,1,114,88,0,
+    0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,114,92,0,0,0,226,2,0,0,115,4,0,0,0,0,
+    4,12,1,122,27,95,105,110,115,116,97,108,108,101,100,95,
+    115,97,102,101,108,121,46,95,95,101,110,116,101,114,95,95,
+    99,1,0,0,0,0,0,0,0,3,0,0,0,17,0,0,
+    0,71,0,0,0,115,121,0,0,0,122,101,0,124,0,0,
+    106,0,0,125,2,0,116,1,0,100,1,0,100,2,0,132,
+    0,0,124,1,0,68,131,1,0,131,1,0,114,78,0,121,
+    17,0,116,2,0,106,3,0,124,2,0,106,4,0,61,87,
+    113,100,0,4,116,5,0,107,10,0,114,74,0,1,1,1,
+    89,113,100,0,88,110,22,0,116,6,0,100,3,0,124,2,
+    0,106,4,0,124,2,0,106,7,0,131,3,0,1,87,100,
+    0,0,100,4,0,124,0,0,106,0,0,95,8,0,88,100,
+    0,0,83,41,5,78,99,1,0,0,0,0,0,0,0,2,
+    0,0,0,3,0,0,0,115,0,0,0,115,27,0,0,0,
+    124,0,0,93,17,0,125,1,0,124,1,0,100,0,0,107,
+    9,0,86,1,113,3,0,100,0,0,83,41,1,78,114,5,
+    0,0,0,41,2,114,32,0,0,0,114,93,0,0,0,114,
+    5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,94,
+    0,0,0,236,2,0,0,115,2,0,0,0,6,0,122,45,
+    95,105,110,115,116,97,108,108,101,100,95,115,97,102,101,108,
+    121,46,95,95,101,120,105,116,95,95,46,60,108,111,99,97,
+    108,115,62,46,60,103,101,110,101,120,112,114,62,122,18,105,
+    109,112,111,114,116,32,123,33,114,125,32,35,32,123,33,114,
+    125,70,41,9,114,230,0,0,0,114,95,0,0,0,114,8,
+    0,0,0,114,90,0,0,0,114,84,0,0,0,114,96,0,
+    0,0,114,168,0,0,0,114,185,0,0,0,114,231,0,0,
+    0,41,3,114,88,0,0,0,114,97,0,0,0,114,193,0,
+    0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,114,98,0,0,0,233,2,0,0,115,18,0,0,0,0,
+    1,3,1,9,1,25,1,3,1,17,1,13,1,8,2,26,
+    2,122,26,95,105,110,115,116,97,108,108,101,100,95,115,97,
+    102,101,108,121,46,95,95,101,120,105,116,95,95,78,41,6,
+    114,17,0,0,0,114,74,0,0,0,114,75,0,0,0,114,
+    89,0,0,0,114,92,0,0,0,114,98,0,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,
+    0,0,114,228,0,0,0,220,2,0,0,115,6,0,0,0,
+    12,2,12,4,12,7,114,228,0,0,0,99,0,0,0,0,
+    0,0,0,0,0,0,0,0,8,0,0,0,64,0,0,0,
+    115,172,0,0,0,101,0,0,90,1,0,100,0,0,90,2,
+    0,100,1,0,90,3,0,100,2,0,100,3,0,100,4,0,
+    100,3,0,100,5,0,100,3,0,100,6,0,100,7,0,132,
+    0,3,90,4,0,100,8,0,100,9,0,132,0,0,90,5,
+    0,100,10,0,100,11,0,132,0,0,90,6,0,101,7,0,
+    100,12,0,100,13,0,132,0,0,131,1,0,90,8,0,101,
+    8,0,106,9,0,100,14,0,100,13,0,132,0,0,131,1,
+    0,90,8,0,101,7,0,100,15,0,100,16,0,132,0,0,
+    131,1,0,90,10,0,101,7,0,100,17,0,100,18,0,132,
+    0,0,131,1,0,90,11,0,101,11,0,106,9,0,100,19,
+    0,100,18,0,132,0,0,131,1,0,90,11,0,100,3,0,
+    83,41,20,218,10,77,111,100,117,108,101,83,112,101,99,97,
+    208,5,0,0,84,104,101,32,115,112,101,99,105,102,105,99,
+    97,116,105,111,110,32,102,111,114,32,97,32,109,111,100,117,
+    108,101,44,32,117,115,101,100,32,102,111,114,32,108,111,97,
+    100,105,110,103,46,10,10,32,32,32,32,65,32,109,111,100,
+    117,108,101,39,115,32,115,112,101,99,32,105,115,32,116,104,
+    101,32,115,111,117,114,99,101,32,102,111,114,32,105,110,102,
+    111,114,109,97,116,105,111,110,32,97,98,111,117,116,32,116,
+    104,101,32,109,111,100,117,108,101,46,32,32,70,111,114,10,
+    32,32,32,32,100,97,116,97,32,97,115,115,111,99,105,97,
+    116,101,100,32,119,105,116,104,32,116,104,101,32,109,111,100,
+    117,108,101,44,32,105,110,99,108,117,100,105,110,103,32,115,
+    111,117,114,99,101,44,32,117,115,101,32,116,104,101,32,115,
+    112,101,99,39,115,10,32,32,32,32,108,111,97,100,101,114,
+    46,10,10,32,32,32,32,96,110,97,109,101,96,32,105,115,
+    32,116,104,101,32,97,98,115,111,108,117,116,101,32,110,97,
+    109,101,32,111,102,32,116,104,101,32,109,111,100,117,108,101,
+    46,32,32,96,108,111,97,100,101,114,96,32,105,115,32,116,
+    104,101,32,108,111,97,100,101,114,10,32,32,32,32,116,111,
+    32,117,115,101,32,119,104,101,110,32,108,111,97,100,105,110,
+    103,32,116,104,101,32,109,111,100,117,108,101,46,32,32,96,
+    112,97,114,101,110,116,96,32,105,115,32,116,104,101,32,110,
+    97,109,101,32,111,102,32,116,104,101,10,32,32,32,32,112,
+    97,99,107,97,103,101,32,116,104,101,32,109,111,100,117,108,
+    101,32,105,115,32,105,110,46,32,32,84,104,101,32,112,97,
+    114,101,110,116,32,105,115,32,100,101,114,105,118,101,100,32,
+    102,114,111,109,32,116,104,101,32,110,97,109,101,46,10,10,
+    32,32,32,32,96,105,115,95,112,97,99,107,97,103,101,96,
+    32,100,101,116,101,114,109,105,110,101,115,32,105,102,32,116,
+    104,101,32,109,111,100,117,108,101,32,105,115,32,99,111,110,
+    115,105,100,101,114,101,100,32,97,32,112,97,99,107,97,103,
+    101,32,111,114,10,32,32,32,32,110,111,116,46,32,32,79,
+    110,32,109,111,100,117,108,101,115,32,116,104,105,115,32,105,
+    115,32,114,101,102,108,101,99,116,101,100,32,98,121,32,116,
+    104,101,32,96,95,95,112,97,116,104,95,95,96,32,97,116,
+    116,114,105,98,117,116,101,46,10,10,32,32,32,32,96,111,
+    114,105,103,105,110,96,32,105,115,32,116,104,101,32,115,112,
+    101,99,105,102,105,99,32,108,111,99,97,116,105,111,110,32,
+    117,115,101,100,32,98,121,32,116,104,101,32,108,111,97,100,
+    101,114,32,102,114,111,109,32,119,104,105,99,104,32,116,111,
+    10,32,32,32,32,108,111,97,100,32,116,104,101,32,109,111,
+    100,117,108,101,44,32,105,102,32,116,104,97,116,32,105,110,
+    102,111,114,109,97,116,105,111,110,32,105,115,32,97,118,97,
+    105,108,97,98,108,101,46,32,32,87,104,101,110,32,102,105,
+    108,101,110,97,109,101,32,105,115,10,32,32,32,32,115,101,
+    116,44,32,111,114,105,103,105,110,32,119,105,108,108,32,109,
+    97,116,99,104,46,10,10,32,32,32,32,96,104,97,115,95,
+    108,111,99,97,116,105,111,110,96,32,105,110,100,105,99,97,
+    116,101,115,32,116,104,97,116,32,97,32,115,112,101,99,39,
+    115,32,34,111,114,105,103,105,110,34,32,114,101,102,108,101,
+    99,116,115,32,97,32,108,111,99,97,116,105,111,110,46,10,
+    32,32,32,32,87,104,101,110,32,116,104,105,115,32,105,115,
+    32,84,114,117,101,44,32,96,95,95,102,105,108,101,95,95,
+    96,32,97,116,116,114,105,98,117,116,101,32,111,102,32,116,
+    104,101,32,109,111,100,117,108,101,32,105,115,32,115,101,116,
+    46,10,10,32,32,32,32,96,99,97,99,104,101,100,96,32,
+    105,115,32,116,104,101,32,108,111,99,97,116,105,111,110,32,
+    111,102,32,116,104,101,32,99,97,99,104,101,100,32,98,121,
+    116,101,99,111,100,101,32,102,105,108,101,44,32,105,102,32,
+    97,110,121,46,32,32,73,116,10,32,32,32,32,99,111,114,
+    114,101,115,112,111,110,100,115,32,116,111,32,116,104,101,32,
+    96,95,95,99,97,99,104,101,100,95,95,96,32,97,116,116,
+    114,105,98,117,116,101,46,10,10,32,32,32,32,96,115,117,
+    98,109,111,100,117,108,101,95,115,101,97,114,99,104,95,108,
+    111,99,97,116,105,111,110,115,96,32,105,115,32,116,104,101,
+    32,115,101,113,117,101,110,99,101,32,111,102,32,112,97,116,
+    104,32,101,110,116,114,105,101,115,32,116,111,10,32,32,32,
+    32,115,101,97,114,99,104,32,119,104,101,110,32,105,109,112,
+    111,114,116,105,110,103,32,115,117,98,109,111,100,117,108,101,
+    115,46,32,32,73,102,32,115,101,116,44,32,105,115,95,112,
+    97,99,107,97,103,101,32,115,104,111,117,108,100,32,98,101,
+    10,32,32,32,32,84,114,117,101,45,45,97,110,100,32,70,
+    97,108,115,101,32,111,116,104,101,114,119,105,115,101,46,10,
+    10,32,32,32,32,80,97,99,107,97,103,101,115,32,97,114,
+    101,32,115,105,109,112,108,121,32,109,111,100,117,108,101,115,
+    32,116,104,97,116,32,40,109,97,121,41,32,104,97,118,101,
+    32,115,117,98,109,111,100,117,108,101,115,46,32,32,73,102,
+    32,97,32,115,112,101,99,10,32,32,32,32,104,97,115,32,
+    97,32,110,111,110,45,78,111,110,101,32,118,97,108,117,101,
+    32,105,110,32,96,115,117,98,109,111,100,117,108,101,95,115,
+    101,97,114,99,104,95,108,111,99,97,116,105,111,110,115,96,
+    44,32,116,104,101,32,105,109,112,111,114,116,10,32,32,32,
+    32,115,121,115,116,101,109,32,119,105,108,108,32,99,111,110,
+    115,105,100,101,114,32,109,111,100,117,108,101,115,32,108,111,
+    97,100,101,100,32,102,114,111,109,32,116,104,101,32,115,112,
+    101,99,32,97,115,32,112,97,99,107,97,103,101,115,46,10,
+    10,32,32,32,32,79,110,108,121,32,102,105,110,100,101,114,
+    115,32,40,115,101,101,32,105,109,112,111,114,116,108,105,98,
+    46,97,98,99,46,77,101,116,97,80,97,116,104,70,105,110,
+    100,101,114,32,97,110,100,10,32,32,32,32,105,109,112,111,
+    114,116,108,105,98,46,97,98,99,46,80,97,116,104,69,110,
+    116,114,121,70,105,110,100,101,114,41,32,115,104,111,117,108,
+    100,32,109,111,100,105,102,121,32,77,111,100,117,108,101,83,
+    112,101,99,32,105,110,115,116,97,110,99,101,115,46,10,10,
+    32,32,32,32,218,6,111,114,105,103,105,110,78,218,12,108,
+    111,97,100,101,114,95,115,116,97,116,101,218,10,105,115,95,
+    112,97,99,107,97,103,101,99,3,0,0,0,3,0,0,0,
+    6,0,0,0,2,0,0,0,67,0,0,0,115,79,0,0,
+    0,124,1,0,124,0,0,95,0,0,124,2,0,124,0,0,
+    95,1,0,124,3,0,124,0,0,95,2,0,124,4,0,124,
+    0,0,95,3,0,124,5,0,114,48,0,103,0,0,110,3,
+    0,100,0,0,124,0,0,95,4,0,100,1,0,124,0,0,
+    95,5,0,100,0,0,124,0,0,95,6,0,100,0,0,83,
+    41,2,78,70,41,7,114,84,0,0,0,114,185,0,0,0,
+    114,233,0,0,0,114,234,0,0,0,218,26,115,117,98,109,
+    111,100,117,108,101,95,115,101,97,114,99,104,95,108,111,99,
+    97,116,105,111,110,115,218,13,95,115,101,116,95,102,105,108,
+    101,97,116,116,114,218,7,95,99,97,99,104,101,100,41,6,
+    114,88,0,0,0,114,84,0,0,0,114,185,0,0,0,114,
+    233,0,0,0,114,234,0,0,0,114,235,0,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,114,89,0,
+    0,0,28,3,0,0,115,14,0,0,0,0,2,9,1,9,
+    1,9,1,9,1,21,3,9,1,122,19,77,111,100,117,108,
+    101,83,112,101,99,46,95,95,105,110,105,116,95,95,99,1,
+    0,0,0,0,0,0,0,2,0,0,0,4,0,0,0,67,
+    0,0,0,115,153,0,0,0,100,1,0,106,0,0,124,0,
+    0,106,1,0,131,1,0,100,2,0,106,0,0,124,0,0,
+    106,2,0,131,1,0,103,2,0,125,1,0,124,0,0,106,
+    3,0,100,0,0,107,9,0,114,79,0,124,1,0,106,4,
+    0,100,3,0,106,0,0,124,0,0,106,3,0,131,1,0,
+    131,1,0,1,110,0,0,124,0,0,106,5,0,100,0,0,
+    107,9,0,114,122,0,124,1,0,106,4,0,100,4,0,106,
+    0,0,124,0,0,106,5,0,131,1,0,131,1,0,1,110,
+    0,0,100,5,0,106,0,0,124,0,0,106,6,0,106,7,
+    0,100,6,0,106,8,0,124,1,0,131,1,0,131,2,0,
+    83,41,7,78,122,9,110,97,109,101,61,123,33,114,125,122,
+    11,108,111,97,100,101,114,61,123,33,114,125,122,11,111,114,
+    105,103,105,110,61,123,33,114,125,122,29,115,117,98,109,111,
     100,117,108,101,95,115,101,97,114,99,104,95,108,111,99,97,
-    116,105,111,110,115,218,13,95,115,101,116,95,102,105,108,101,
-    97,116,116,114,218,7,95,99,97,99,104,101,100,41,6,114,
-    71,0,0,0,114,67,0,0,0,114,169,0,0,0,114,217,
-    0,0,0,114,218,0,0,0,114,219,0,0,0,114,4,0,
-    0,0,114,4,0,0,0,114,5,0,0,0,114,72,0,0,
-    0,12,3,0,0,115,14,0,0,0,0,2,9,1,9,1,
-    9,1,9,1,21,3,9,1,122,19,77,111,100,117,108,101,
-    83,112,101,99,46,95,95,105,110,105,116,95,95,99,1,0,
-    0,0,0,0,0,0,2,0,0,0,4,0,0,0,67,0,
-    0,0,115,153,0,0,0,100,1,0,106,0,0,124,0,0,
-    106,1,0,131,1,0,100,2,0,106,0,0,124,0,0,106,
-    2,0,131,1,0,103,2,0,125,1,0,124,0,0,106,3,
-    0,100,0,0,107,9,0,114,79,0,124,1,0,106,4,0,
-    100,3,0,106,0,0,124,0,0,106,3,0,131,1,0,131,
-    1,0,1,110,0,0,124,0,0,106,5,0,100,0,0,107,
-    9,0,114,122,0,124,1,0,106,4,0,100,4,0,106,0,
-    0,124,0,0,106,5,0,131,1,0,131,1,0,1,110,0,
-    0,100,5,0,106,0,0,124,0,0,106,6,0,106,7,0,
-    100,6,0,106,8,0,124,1,0,131,1,0,131,2,0,83,
-    41,7,78,122,9,110,97,109,101,61,123,33,114,125,122,11,
-    108,111,97,100,101,114,61,123,33,114,125,122,11,111,114,105,
-    103,105,110,61,123,33,114,125,122,29,115,117,98,109,111,100,
-    117,108,101,95,115,101,97,114,99,104,95,108,111,99,97,116,
-    105,111,110,115,61,123,125,122,6,123,125,40,123,125,41,122,
-    2,44,32,41,9,114,47,0,0,0,114,67,0,0,0,114,
-    169,0,0,0,114,217,0,0,0,218,6,97,112,112,101,110,
-    100,114,220,0,0,0,218,9,95,95,99,108,97,115,115,95,
-    95,114,57,0,0,0,114,26,0,0,0,41,2,114,71,0,
-    0,0,114,80,0,0,0,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,114,101,0,0,0,24,3,0,0,115,
-    16,0,0,0,0,1,15,1,21,1,15,1,28,1,15,1,
-    6,1,22,1,122,19,77,111,100,117,108,101,83,112,101,99,
-    46,95,95,114,101,112,114,95,95,99,2,0,0,0,0,0,
-    0,0,3,0,0,0,13,0,0,0,67,0,0,0,115,145,
-    0,0,0,124,0,0,106,0,0,125,2,0,121,107,0,124,
-    0,0,106,1,0,124,1,0,106,1,0,107,2,0,111,114,
-    0,124,0,0,106,2,0,124,1,0,106,2,0,107,2,0,
-    111,114,0,124,0,0,106,3,0,124,1,0,106,3,0,107,
-    2,0,111,114,0,124,2,0,124,1,0,106,0,0,107,2,
-    0,111,114,0,124,0,0,106,4,0,124,1,0,106,4,0,
-    107,2,0,111,114,0,124,0,0,106,5,0,124,1,0,106,
-    5,0,107,2,0,83,87,110,22,0,4,116,6,0,107,10,
-    0,114,140,0,1,1,1,100,1,0,83,89,110,1,0,88,
-    100,0,0,83,41,2,78,70,41,7,114,220,0,0,0,114,
-    67,0,0,0,114,169,0,0,0,114,217,0,0,0,218,6,
-    99,97,99,104,101,100,218,12,104,97,115,95,108,111,99,97,
-    116,105,111,110,114,209,0,0,0,41,3,114,71,0,0,0,
-    90,5,111,116,104,101,114,90,4,115,109,115,108,114,4,0,
-    0,0,114,4,0,0,0,114,5,0,0,0,218,6,95,95,
-    101,113,95,95,34,3,0,0,115,20,0,0,0,0,1,9,
-    1,3,1,18,1,18,1,18,1,15,1,18,1,20,1,13,
-    1,122,17,77,111,100,117,108,101,83,112,101,99,46,95,95,
-    101,113,95,95,99,1,0,0,0,0,0,0,0,2,0,0,
-    0,12,0,0,0,67,0,0,0,115,158,0,0,0,124,0,
-    0,106,0,0,100,0,0,107,8,0,114,151,0,124,0,0,
-    106,1,0,100,0,0,107,9,0,114,151,0,124,0,0,106,
-    2,0,114,151,0,124,0,0,106,1,0,125,1,0,124,1,
-    0,106,3,0,116,4,0,116,5,0,131,1,0,131,1,0,
-    114,112,0,121,19,0,116,6,0,124,1,0,131,1,0,124,
-    0,0,95,0,0,87,113,145,0,4,116,7,0,107,10,0,
-    114,108,0,1,1,1,89,113,145,0,88,113,148,0,124,1,
-    0,106,3,0,116,4,0,116,8,0,131,1,0,131,1,0,
-    114,148,0,124,1,0,124,0,0,95,0,0,113,148,0,113,
-    151,0,110,0,0,124,0,0,106,0,0,83,41,1,78,41,
-    9,114,222,0,0,0,114,217,0,0,0,114,221,0,0,0,
-    218,8,101,110,100,115,119,105,116,104,218,5,116,117,112,108,
-    101,114,134,0,0,0,114,132,0,0,0,114,124,0,0,0,
-    218,17,66,89,84,69,67,79,68,69,95,83,85,70,70,73,
-    88,69,83,41,2,114,71,0,0,0,114,131,0,0,0,114,
-    4,0,0,0,114,4,0,0,0,114,5,0,0,0,114,225,
-    0,0,0,46,3,0,0,115,22,0,0,0,0,2,15,1,
-    24,1,9,1,21,1,3,1,19,1,13,1,8,1,21,1,
-    18,1,122,17,77,111,100,117,108,101,83,112,101,99,46,99,
-    97,99,104,101,100,99,2,0,0,0,0,0,0,0,2,0,
-    0,0,2,0,0,0,67,0,0,0,115,13,0,0,0,124,
-    1,0,124,0,0,95,0,0,100,0,0,83,41,1,78,41,
-    1,114,222,0,0,0,41,2,114,71,0,0,0,114,225,0,
-    0,0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
-    0,114,225,0,0,0,60,3,0,0,115,2,0,0,0,0,
-    2,99,1,0,0,0,0,0,0,0,1,0,0,0,2,0,
-    0,0,67,0,0,0,115,46,0,0,0,124,0,0,106,0,
-    0,100,1,0,107,8,0,114,35,0,124,0,0,106,1,0,
-    106,2,0,100,2,0,131,1,0,100,3,0,25,83,124,0,
-    0,106,1,0,83,100,1,0,83,41,4,122,32,84,104,101,
-    32,110,97,109,101,32,111,102,32,116,104,101,32,109,111,100,
-    117,108,101,39,115,32,112,97,114,101,110,116,46,78,114,116,
-    0,0,0,114,84,0,0,0,41,3,114,220,0,0,0,114,
-    67,0,0,0,114,32,0,0,0,41,1,114,71,0,0,0,
-    114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,218,
-    6,112,97,114,101,110,116,64,3,0,0,115,6,0,0,0,
-    0,3,15,1,20,2,122,17,77,111,100,117,108,101,83,112,
-    101,99,46,112,97,114,101,110,116,99,1,0,0,0,0,0,
-    0,0,1,0,0,0,1,0,0,0,67,0,0,0,115,7,
-    0,0,0,124,0,0,106,0,0,83,41,1,78,41,1,114,
-    221,0,0,0,41,1,114,71,0,0,0,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,114,226,0,0,0,72,
-    3,0,0,115,2,0,0,0,0,2,122,23,77,111,100,117,
-    108,101,83,112,101,99,46,104,97,115,95,108,111,99,97,116,
-    105,111,110,99,2,0,0,0,0,0,0,0,2,0,0,0,
-    2,0,0,0,67,0,0,0,115,19,0,0,0,116,0,0,
-    124,1,0,131,1,0,124,0,0,95,1,0,100,0,0,83,
-    41,1,78,41,2,218,4,98,111,111,108,114,221,0,0,0,
-    41,2,114,71,0,0,0,218,5,118,97,108,117,101,114,4,
-    0,0,0,114,4,0,0,0,114,5,0,0,0,114,226,0,
-    0,0,76,3,0,0,115,2,0,0,0,0,2,41,12,114,
-    57,0,0,0,114,56,0,0,0,114,58,0,0,0,114,59,
-    0,0,0,114,72,0,0,0,114,101,0,0,0,114,227,0,
-    0,0,218,8,112,114,111,112,101,114,116,121,114,225,0,0,
-    0,218,6,115,101,116,116,101,114,114,231,0,0,0,114,226,
-    0,0,0,114,4,0,0,0,114,4,0,0,0,114,4,0,
-    0,0,114,5,0,0,0,114,216,0,0,0,231,2,0,0,
+    116,105,111,110,115,61,123,125,122,6,123,125,40,123,125,41,
+    122,2,44,32,41,9,114,58,0,0,0,114,84,0,0,0,
+    114,185,0,0,0,114,233,0,0,0,218,6,97,112,112,101,
+    110,100,114,236,0,0,0,218,9,95,95,99,108,97,115,115,
+    95,95,114,17,0,0,0,114,36,0,0,0,41,2,114,88,
+    0,0,0,114,97,0,0,0,114,5,0,0,0,114,5,0,
+    0,0,114,6,0,0,0,114,117,0,0,0,40,3,0,0,
+    115,16,0,0,0,0,1,15,1,21,1,15,1,28,1,15,
+    1,6,1,22,1,122,19,77,111,100,117,108,101,83,112,101,
+    99,46,95,95,114,101,112,114,95,95,99,2,0,0,0,0,
+    0,0,0,3,0,0,0,13,0,0,0,67,0,0,0,115,
+    145,0,0,0,124,0,0,106,0,0,125,2,0,121,107,0,
+    124,0,0,106,1,0,124,1,0,106,1,0,107,2,0,111,
+    114,0,124,0,0,106,2,0,124,1,0,106,2,0,107,2,
+    0,111,114,0,124,0,0,106,3,0,124,1,0,106,3,0,
+    107,2,0,111,114,0,124,2,0,124,1,0,106,0,0,107,
+    2,0,111,114,0,124,0,0,106,4,0,124,1,0,106,4,
+    0,107,2,0,111,114,0,124,0,0,106,5,0,124,1,0,
+    106,5,0,107,2,0,83,87,110,22,0,4,116,6,0,107,
+    10,0,114,140,0,1,1,1,100,1,0,83,89,110,1,0,
+    88,100,0,0,83,41,2,78,70,41,7,114,236,0,0,0,
+    114,84,0,0,0,114,185,0,0,0,114,233,0,0,0,218,
+    6,99,97,99,104,101,100,218,12,104,97,115,95,108,111,99,
+    97,116,105,111,110,114,225,0,0,0,41,3,114,88,0,0,
+    0,90,5,111,116,104,101,114,90,4,115,109,115,108,114,5,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,218,6,95,
+    95,101,113,95,95,50,3,0,0,115,20,0,0,0,0,1,
+    9,1,3,1,18,1,18,1,18,1,15,1,18,1,20,1,
+    13,1,122,17,77,111,100,117,108,101,83,112,101,99,46,95,
+    95,101,113,95,95,99,1,0,0,0,0,0,0,0,2,0,
+    0,0,12,0,0,0,67,0,0,0,115,158,0,0,0,124,
+    0,0,106,0,0,100,0,0,107,8,0,114,151,0,124,0,
+    0,106,1,0,100,0,0,107,9,0,114,151,0,124,0,0,
+    106,2,0,114,151,0,124,0,0,106,1,0,125,1,0,124,
+    1,0,106,3,0,116,4,0,116,5,0,131,1,0,131,1,
+    0,114,112,0,121,19,0,116,6,0,124,1,0,131,1,0,
+    124,0,0,95,0,0,87,113,145,0,4,116,7,0,107,10,
+    0,114,108,0,1,1,1,89,113,145,0,88,113,148,0,124,
+    1,0,106,3,0,116,4,0,116,8,0,131,1,0,131,1,
+    0,114,148,0,124,1,0,124,0,0,95,0,0,113,148,0,
+    113,151,0,110,0,0,124,0,0,106,0,0,83,41,1,78,
+    41,9,114,238,0,0,0,114,233,0,0,0,114,237,0,0,
+    0,218,8,101,110,100,115,119,105,116,104,218,5,116,117,112,
+    108,101,114,150,0,0,0,114,148,0,0,0,114,139,0,0,
+    0,218,17,66,89,84,69,67,79,68,69,95,83,85,70,70,
+    73,88,69,83,41,2,114,88,0,0,0,114,147,0,0,0,
+    114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,
+    241,0,0,0,62,3,0,0,115,22,0,0,0,0,2,15,
+    1,24,1,9,1,21,1,3,1,19,1,13,1,8,1,21,
+    1,18,1,122,17,77,111,100,117,108,101,83,112,101,99,46,
+    99,97,99,104,101,100,99,2,0,0,0,0,0,0,0,2,
+    0,0,0,2,0,0,0,67,0,0,0,115,13,0,0,0,
+    124,1,0,124,0,0,95,0,0,100,0,0,83,41,1,78,
+    41,1,114,238,0,0,0,41,2,114,88,0,0,0,114,241,
+    0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,
+    0,0,114,241,0,0,0,76,3,0,0,115,2,0,0,0,
+    0,2,99,1,0,0,0,0,0,0,0,1,0,0,0,2,
+    0,0,0,67,0,0,0,115,46,0,0,0,124,0,0,106,
+    0,0,100,1,0,107,8,0,114,35,0,124,0,0,106,1,
+    0,106,2,0,100,2,0,131,1,0,100,3,0,25,83,124,
+    0,0,106,1,0,83,100,1,0,83,41,4,122,32,84,104,
+    101,32,110,97,109,101,32,111,102,32,116,104,101,32,109,111,
+    100,117,108,101,39,115,32,112,97,114,101,110,116,46,78,114,
+    132,0,0,0,114,101,0,0,0,41,3,114,236,0,0,0,
+    114,84,0,0,0,114,42,0,0,0,41,1,114,88,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
+    218,6,112,97,114,101,110,116,80,3,0,0,115,6,0,0,
+    0,0,3,15,1,20,2,122,17,77,111,100,117,108,101,83,
+    112,101,99,46,112,97,114,101,110,116,99,1,0,0,0,0,
+    0,0,0,1,0,0,0,1,0,0,0,67,0,0,0,115,
+    7,0,0,0,124,0,0,106,0,0,83,41,1,78,41,1,
+    114,237,0,0,0,41,1,114,88,0,0,0,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,114,242,0,0,0,
+    88,3,0,0,115,2,0,0,0,0,2,122,23,77,111,100,
+    117,108,101,83,112,101,99,46,104,97,115,95,108,111,99,97,
+    116,105,111,110,99,2,0,0,0,0,0,0,0,2,0,0,
+    0,2,0,0,0,67,0,0,0,115,19,0,0,0,116,0,
+    0,124,1,0,131,1,0,124,0,0,95,1,0,100,0,0,
+    83,41,1,78,41,2,114,18,0,0,0,114,237,0,0,0,
+    41,2,114,88,0,0,0,218,5,118,97,108,117,101,114,5,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,114,242,0,
+    0,0,92,3,0,0,115,2,0,0,0,0,2,41,12,114,
+    17,0,0,0,114,74,0,0,0,114,75,0,0,0,114,76,
+    0,0,0,114,89,0,0,0,114,117,0,0,0,114,243,0,
+    0,0,218,8,112,114,111,112,101,114,116,121,114,241,0,0,
+    0,218,6,115,101,116,116,101,114,114,247,0,0,0,114,242,
+    0,0,0,114,5,0,0,0,114,5,0,0,0,114,5,0,
+    0,0,114,6,0,0,0,114,232,0,0,0,247,2,0,0,
     115,20,0,0,0,12,35,6,2,15,1,15,11,12,10,12,
-    12,18,14,21,4,18,8,18,4,114,216,0,0,0,114,217,
-    0,0,0,114,219,0,0,0,99,2,0,0,0,2,0,0,
+    12,18,14,21,4,18,8,18,4,114,232,0,0,0,114,233,
+    0,0,0,114,235,0,0,0,99,2,0,0,0,2,0,0,
     0,5,0,0,0,15,0,0,0,67,0,0,0,115,193,0,
     0,0,116,0,0,124,1,0,100,1,0,131,2,0,114,83,
     0,124,3,0,100,2,0,107,8,0,114,43,0,116,1,0,
@@ -1561,18 +1586,18 @@ const unsigned char _Py_M__importlib[] = {
     109,111,100,117,108,101,32,115,112,101,99,32,98,97,115,101,
     100,32,111,110,32,118,97,114,105,111,117,115,32,108,111,97,
     100,101,114,32,109,101,116,104,111,100,115,46,218,12,103,101,
-    116,95,102,105,108,101,110,97,109,101,78,114,169,0,0,0,
-    114,220,0,0,0,114,219,0,0,0,70,114,217,0,0,0,
-    41,5,114,60,0,0,0,218,23,115,112,101,99,95,102,114,
+    116,95,102,105,108,101,110,97,109,101,78,114,185,0,0,0,
+    114,236,0,0,0,114,235,0,0,0,70,114,233,0,0,0,
+    41,5,114,77,0,0,0,218,23,115,112,101,99,95,102,114,
     111,109,95,102,105,108,101,95,108,111,99,97,116,105,111,110,
-    114,219,0,0,0,114,153,0,0,0,114,216,0,0,0,41,
-    5,114,67,0,0,0,114,169,0,0,0,114,217,0,0,0,
-    114,219,0,0,0,90,6,115,101,97,114,99,104,114,4,0,
-    0,0,114,4,0,0,0,114,5,0,0,0,114,173,0,0,
-    0,81,3,0,0,115,28,0,0,0,0,2,15,1,12,1,
+    114,235,0,0,0,114,169,0,0,0,114,232,0,0,0,41,
+    5,114,84,0,0,0,114,185,0,0,0,114,233,0,0,0,
+    114,235,0,0,0,90,6,115,101,97,114,99,104,114,5,0,
+    0,0,114,5,0,0,0,114,6,0,0,0,114,189,0,0,
+    0,97,3,0,0,115,28,0,0,0,0,2,15,1,12,1,
     16,1,18,1,15,1,7,2,12,1,15,1,3,1,19,1,
-    13,1,14,3,9,2,114,173,0,0,0,114,169,0,0,0,
-    114,220,0,0,0,99,2,0,0,0,2,0,0,0,9,0,
+    13,1,14,3,9,2,114,189,0,0,0,114,185,0,0,0,
+    114,236,0,0,0,99,2,0,0,0,2,0,0,0,9,0,
     0,0,19,0,0,0,67,0,0,0,115,110,1,0,0,124,
     1,0,100,1,0,107,8,0,114,79,0,100,2,0,125,1,
     0,116,0,0,124,2,0,100,3,0,131,2,0,114,79,0,
@@ -1617,25 +1642,25 @@ const unsigned char _Py_M__importlib[] = {
     117,115,116,32,116,97,107,101,32,97,32,115,112,101,99,32,
     97,115,32,105,116,115,32,111,110,108,121,32,95,95,105,110,
     105,116,95,95,40,41,32,97,114,103,46,10,10,32,32,32,
-    32,78,122,9,60,117,110,107,110,111,119,110,62,114,236,0,
-    0,0,114,217,0,0,0,84,114,219,0,0,0,114,84,0,
-    0,0,41,14,114,60,0,0,0,114,236,0,0,0,114,153,
-    0,0,0,114,216,0,0,0,114,221,0,0,0,218,27,95,
+    32,78,122,9,60,117,110,107,110,111,119,110,62,114,251,0,
+    0,0,114,233,0,0,0,84,114,235,0,0,0,114,101,0,
+    0,0,41,14,114,77,0,0,0,114,251,0,0,0,114,169,
+    0,0,0,114,232,0,0,0,114,237,0,0,0,218,27,95,
     103,101,116,95,115,117,112,112,111,114,116,101,100,95,102,105,
-    108,101,95,108,111,97,100,101,114,115,114,228,0,0,0,114,
-    229,0,0,0,114,169,0,0,0,218,9,95,80,79,80,85,
-    76,65,84,69,114,219,0,0,0,114,220,0,0,0,114,38,
-    0,0,0,114,223,0,0,0,41,9,114,67,0,0,0,218,
-    8,108,111,99,97,116,105,111,110,114,169,0,0,0,114,220,
-    0,0,0,114,177,0,0,0,218,12,108,111,97,100,101,114,
-    95,99,108,97,115,115,114,127,0,0,0,114,219,0,0,0,
-    90,7,100,105,114,110,97,109,101,114,4,0,0,0,114,4,
-    0,0,0,114,5,0,0,0,114,237,0,0,0,106,3,0,
+    108,101,95,108,111,97,100,101,114,115,114,244,0,0,0,114,
+    245,0,0,0,114,185,0,0,0,218,9,95,80,79,80,85,
+    76,65,84,69,114,235,0,0,0,114,236,0,0,0,114,48,
+    0,0,0,114,239,0,0,0,41,9,114,84,0,0,0,218,
+    8,108,111,99,97,116,105,111,110,114,185,0,0,0,114,236,
+    0,0,0,114,193,0,0,0,218,12,108,111,97,100,101,114,
+    95,99,108,97,115,115,114,142,0,0,0,114,235,0,0,0,
+    90,7,100,105,114,110,97,109,101,114,5,0,0,0,114,5,
+    0,0,0,114,6,0,0,0,114,252,0,0,0,122,3,0,
     0,115,60,0,0,0,0,12,12,4,6,1,15,2,3,1,
     19,1,13,1,11,8,21,1,9,3,12,1,22,1,21,1,
     15,1,9,1,8,2,7,3,12,2,15,1,3,1,19,1,
     13,1,5,2,6,1,18,2,9,1,15,1,6,1,16,1,
-    22,2,114,237,0,0,0,99,3,0,0,0,0,0,0,0,
+    22,2,114,252,0,0,0,99,3,0,0,0,0,0,0,0,
     8,0,0,0,53,0,0,0,67,0,0,0,115,124,1,0,
     0,121,13,0,124,0,0,106,0,0,125,3,0,87,110,18,
     0,4,116,1,0,107,10,0,114,33,0,1,1,1,89,110,
@@ -1661,22 +1686,22 @@ const unsigned char _Py_M__importlib[] = {
     0,0,107,8,0,114,93,1,100,2,0,110,3,0,100,3,
     0,124,3,0,95,10,0,124,6,0,124,3,0,95,11,0,
     124,7,0,124,3,0,95,12,0,124,3,0,83,41,4,78,
-    114,217,0,0,0,70,84,41,13,114,208,0,0,0,114,209,
-    0,0,0,114,57,0,0,0,114,204,0,0,0,114,210,0,
+    114,233,0,0,0,70,84,41,13,114,224,0,0,0,114,225,
+    0,0,0,114,17,0,0,0,114,220,0,0,0,114,226,0,
     0,0,90,7,95,79,82,73,71,73,78,218,10,95,95,99,
     97,99,104,101,100,95,95,218,4,108,105,115,116,218,8,95,
-    95,112,97,116,104,95,95,114,216,0,0,0,114,221,0,0,
-    0,114,225,0,0,0,114,220,0,0,0,41,8,114,179,0,
-    0,0,114,169,0,0,0,114,217,0,0,0,114,177,0,0,
-    0,114,67,0,0,0,114,240,0,0,0,114,225,0,0,0,
-    114,220,0,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,218,17,95,115,112,101,99,95,102,114,111,109,
-    95,109,111,100,117,108,101,170,3,0,0,115,72,0,0,0,
+    95,112,97,116,104,95,95,114,232,0,0,0,114,237,0,0,
+    0,114,241,0,0,0,114,236,0,0,0,41,8,114,195,0,
+    0,0,114,185,0,0,0,114,233,0,0,0,114,193,0,0,
+    0,114,84,0,0,0,114,255,0,0,0,114,241,0,0,0,
+    114,236,0,0,0,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,218,17,95,115,112,101,99,95,102,114,111,109,
+    95,109,111,100,117,108,101,186,3,0,0,115,72,0,0,0,
     0,2,3,1,13,1,13,1,5,2,12,1,4,2,9,1,
     12,1,3,1,13,1,13,2,8,1,3,1,13,1,13,1,
     11,1,12,1,12,1,3,1,13,1,13,1,14,2,9,1,
     3,1,13,1,13,1,11,1,3,1,19,1,13,1,11,2,
-    21,1,27,1,9,1,9,1,114,245,0,0,0,99,0,0,
+    21,1,27,1,9,1,9,1,114,4,1,0,0,99,0,0,
     0,0,0,0,0,0,0,0,0,0,6,0,0,0,64,0,
     0,0,115,172,0,0,0,101,0,0,90,1,0,100,0,0,
     90,2,0,100,1,0,90,3,0,100,2,0,100,3,0,132,
@@ -1689,7 +1714,7 @@ const unsigned char _Py_M__importlib[] = {
     20,0,100,21,0,132,0,0,90,12,0,100,22,0,100,23,
     0,132,0,0,90,13,0,100,24,0,100,25,0,132,0,0,
     90,14,0,100,26,0,100,27,0,132,0,0,90,15,0,100,
-    28,0,83,41,29,114,174,0,0,0,122,77,67,111,110,118,
+    28,0,83,41,29,114,190,0,0,0,122,77,67,111,110,118,
     101,110,105,101,110,99,101,32,119,114,97,112,112,101,114,32,
     97,114,111,117,110,100,32,115,112,101,99,32,111,98,106,101,
     99,116,115,32,116,111,32,112,114,111,118,105,100,101,32,115,
@@ -1697,9 +1722,9 @@ const unsigned char _Py_M__importlib[] = {
     32,109,101,116,104,111,100,115,46,99,2,0,0,0,0,0,
     0,0,2,0,0,0,2,0,0,0,67,0,0,0,115,13,
     0,0,0,124,1,0,124,0,0,95,0,0,100,0,0,83,
-    41,1,78,41,1,114,177,0,0,0,41,2,114,71,0,0,
-    0,114,177,0,0,0,114,4,0,0,0,114,4,0,0,0,
-    114,5,0,0,0,114,72,0,0,0,220,3,0,0,115,2,
+    41,1,78,41,1,114,193,0,0,0,41,2,114,88,0,0,
+    0,114,193,0,0,0,114,5,0,0,0,114,5,0,0,0,
+    114,6,0,0,0,114,89,0,0,0,236,3,0,0,115,2,
     0,0,0,0,1,122,21,95,83,112,101,99,77,101,116,104,
     111,100,115,46,95,95,105,110,105,116,95,95,99,2,0,0,
     0,0,0,0,0,4,0,0,0,17,0,0,0,67,0,0,
@@ -1715,12 +1740,12 @@ const unsigned char _Py_M__importlib[] = {
     2,0,131,1,0,83,41,2,122,41,67,114,101,97,116,101,
     32,97,32,115,112,101,99,32,102,114,111,109,32,97,32,109,
     111,100,117,108,101,39,115,32,97,116,116,114,105,98,117,116,
-    101,115,46,78,41,6,114,208,0,0,0,114,209,0,0,0,
-    114,204,0,0,0,218,10,95,102,105,110,100,95,115,112,101,
-    99,114,57,0,0,0,114,173,0,0,0,41,4,218,3,99,
-    108,115,114,179,0,0,0,114,177,0,0,0,114,169,0,0,
-    0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,
-    218,11,102,114,111,109,95,109,111,100,117,108,101,223,3,0,
+    101,115,46,78,41,6,114,224,0,0,0,114,225,0,0,0,
+    114,220,0,0,0,218,10,95,102,105,110,100,95,115,112,101,
+    99,114,17,0,0,0,114,189,0,0,0,41,4,218,3,99,
+    108,115,114,195,0,0,0,114,193,0,0,0,114,185,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
+    218,11,102,114,111,109,95,109,111,100,117,108,101,239,3,0,
     0,115,22,0,0,0,0,3,3,1,13,1,13,1,3,1,
     13,1,13,1,15,1,12,1,26,2,23,1,122,24,95,83,
     112,101,99,77,101,116,104,111,100,115,46,102,114,111,109,95,
@@ -1738,17 +1763,17 @@ const unsigned char _Py_M__importlib[] = {
     124,1,0,106,2,0,131,2,0,83,100,1,0,83,41,7,
     122,38,82,101,116,117,114,110,32,116,104,101,32,114,101,112,
     114,32,116,111,32,117,115,101,32,102,111,114,32,116,104,101,
-    32,109,111,100,117,108,101,46,78,114,206,0,0,0,122,13,
+    32,109,111,100,117,108,101,46,78,114,222,0,0,0,122,13,
     60,109,111,100,117,108,101,32,123,33,114,125,62,122,20,60,
     109,111,100,117,108,101,32,123,33,114,125,32,40,123,33,114,
     125,41,62,122,23,60,109,111,100,117,108,101,32,123,33,114,
     125,32,102,114,111,109,32,123,33,114,125,62,122,18,60,109,
     111,100,117,108,101,32,123,33,114,125,32,40,123,125,41,62,
-    41,6,114,177,0,0,0,114,67,0,0,0,114,217,0,0,
-    0,114,169,0,0,0,114,47,0,0,0,114,226,0,0,0,
-    41,3,114,71,0,0,0,114,177,0,0,0,114,67,0,0,
-    0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,
-    114,205,0,0,0,239,3,0,0,115,18,0,0,0,0,3,
+    41,6,114,193,0,0,0,114,84,0,0,0,114,233,0,0,
+    0,114,185,0,0,0,114,58,0,0,0,114,242,0,0,0,
+    41,3,114,88,0,0,0,114,193,0,0,0,114,84,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
+    114,221,0,0,0,255,3,0,0,115,18,0,0,0,0,3,
     9,1,30,1,15,1,15,1,13,2,22,2,9,1,19,2,
     122,24,95,83,112,101,99,77,101,116,104,111,100,115,46,109,
     111,100,117,108,101,95,114,101,112,114,218,9,95,111,118,101,
@@ -1825,22 +1850,22 @@ const unsigned char _Py_M__importlib[] = {
     109,111,100,117,108,101,95,115,101,97,114,99,104,95,108,111,
     99,97,116,105,111,110,115,32,45,62,32,109,111,100,117,108,
     101,46,95,95,112,97,116,104,95,95,32,40,105,102,32,115,
-    101,116,41,10,10,32,32,32,32,32,32,32,32,114,57,0,
-    0,0,78,114,204,0,0,0,218,11,95,95,112,97,99,107,
-    97,103,101,95,95,114,244,0,0,0,114,210,0,0,0,114,
-    242,0,0,0,41,20,114,177,0,0,0,114,62,0,0,0,
-    114,67,0,0,0,114,57,0,0,0,114,209,0,0,0,114,
-    169,0,0,0,114,220,0,0,0,218,16,95,78,97,109,101,
+    101,116,41,10,10,32,32,32,32,32,32,32,32,114,17,0,
+    0,0,78,114,220,0,0,0,218,11,95,95,112,97,99,107,
+    97,103,101,95,95,114,3,1,0,0,114,226,0,0,0,114,
+    1,1,0,0,41,20,114,193,0,0,0,114,79,0,0,0,
+    114,84,0,0,0,114,17,0,0,0,114,225,0,0,0,114,
+    185,0,0,0,114,236,0,0,0,218,16,95,78,97,109,101,
     115,112,97,99,101,76,111,97,100,101,114,218,7,95,95,110,
-    101,119,95,95,218,5,95,112,97,116,104,114,204,0,0,0,
-    114,231,0,0,0,114,251,0,0,0,114,208,0,0,0,114,
-    244,0,0,0,114,226,0,0,0,114,217,0,0,0,114,210,
-    0,0,0,114,225,0,0,0,114,242,0,0,0,41,6,114,
-    71,0,0,0,114,179,0,0,0,114,249,0,0,0,114,250,
-    0,0,0,114,177,0,0,0,114,169,0,0,0,114,4,0,
-    0,0,114,4,0,0,0,114,5,0,0,0,218,17,105,110,
-    105,116,95,109,111,100,117,108,101,95,97,116,116,114,115,255,
-    3,0,0,115,88,0,0,0,0,17,9,6,12,1,24,1,
+    101,119,95,95,218,5,95,112,97,116,104,114,220,0,0,0,
+    114,247,0,0,0,114,10,1,0,0,114,224,0,0,0,114,
+    3,1,0,0,114,242,0,0,0,114,233,0,0,0,114,226,
+    0,0,0,114,241,0,0,0,114,1,1,0,0,41,6,114,
+    88,0,0,0,114,195,0,0,0,114,8,1,0,0,114,9,
+    1,0,0,114,193,0,0,0,114,185,0,0,0,114,5,0,
+    0,0,114,5,0,0,0,114,6,0,0,0,218,17,105,110,
+    105,116,95,109,111,100,117,108,101,95,97,116,116,114,115,15,
+    4,0,0,115,88,0,0,0,0,17,9,6,12,1,24,1,
     3,1,16,1,13,1,8,3,30,1,9,1,12,2,15,1,
     15,1,18,1,3,1,13,1,13,1,8,3,30,1,3,1,
     16,1,13,1,8,3,3,1,13,1,13,1,5,3,30,1,
@@ -1866,12 +1891,12 @@ const unsigned char _Py_M__importlib[] = {
     32,97,112,112,114,111,112,114,105,97,116,101,32,118,97,108,
     117,101,115,32,102,114,111,109,32,116,104,101,32,115,112,101,
     99,46,10,10,32,32,32,32,32,32,32,32,218,13,99,114,
-    101,97,116,101,95,109,111,100,117,108,101,78,41,7,114,177,
-    0,0,0,114,60,0,0,0,114,169,0,0,0,114,0,1,
-    0,0,114,68,0,0,0,114,67,0,0,0,114,255,0,0,
-    0,41,3,114,71,0,0,0,114,177,0,0,0,114,179,0,
-    0,0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
-    0,218,6,99,114,101,97,116,101,79,4,0,0,115,16,0,
+    101,97,116,101,95,109,111,100,117,108,101,78,41,7,114,193,
+    0,0,0,114,77,0,0,0,114,185,0,0,0,114,15,1,
+    0,0,114,85,0,0,0,114,84,0,0,0,114,14,1,0,
+    0,41,3,114,88,0,0,0,114,193,0,0,0,114,195,0,
+    0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,218,6,99,114,101,97,116,101,95,4,0,0,115,16,0,
     0,0,0,7,9,2,18,3,21,2,6,1,12,4,18,1,
     13,1,122,19,95,83,112,101,99,77,101,116,104,111,100,115,
     46,99,114,101,97,116,101,99,2,0,0,0,0,0,0,0,
@@ -1889,11 +1914,11 @@ const unsigned char _Py_M__importlib[] = {
     101,116,104,111,100,32,117,115,101,115,32,116,104,101,32,108,
     111,97,100,101,114,39,115,32,96,101,120,101,99,95,109,111,
     100,117,108,101,40,41,96,32,109,101,116,104,111,100,46,10,
-    10,32,32,32,32,32,32,32,32,78,41,3,114,177,0,0,
-    0,114,169,0,0,0,218,11,101,120,101,99,95,109,111,100,
-    117,108,101,41,2,114,71,0,0,0,114,179,0,0,0,114,
-    4,0,0,0,114,4,0,0,0,114,5,0,0,0,218,5,
-    95,101,120,101,99,102,4,0,0,115,2,0,0,0,0,7,
+    10,32,32,32,32,32,32,32,32,78,41,3,114,193,0,0,
+    0,114,185,0,0,0,218,11,101,120,101,99,95,109,111,100,
+    117,108,101,41,2,114,88,0,0,0,114,195,0,0,0,114,
+    5,0,0,0,114,5,0,0,0,114,6,0,0,0,218,5,
+    95,101,120,101,99,118,4,0,0,115,2,0,0,0,0,7,
     122,18,95,83,112,101,99,77,101,116,104,111,100,115,46,95,
     101,120,101,99,99,2,0,0,0,0,0,0,0,4,0,0,
     0,11,0,0,0,67,0,0,0,115,17,1,0,0,124,0,
@@ -1919,18 +1944,18 @@ const unsigned char _Py_M__importlib[] = {
     110,103,32,109,111,100,117,108,101,39,115,32,110,97,109,101,
     115,112,97,99,101,46,122,30,109,111,100,117,108,101,32,123,
     33,114,125,32,110,111,116,32,105,110,32,115,121,115,46,109,
-    111,100,117,108,101,115,114,67,0,0,0,78,122,14,109,105,
-    115,115,105,110,103,32,108,111,97,100,101,114,114,249,0,0,
-    0,84,114,2,1,0,0,41,16,114,177,0,0,0,114,67,
-    0,0,0,114,106,0,0,0,218,12,97,99,113,117,105,114,
-    101,95,108,111,99,107,114,103,0,0,0,114,7,0,0,0,
-    114,73,0,0,0,114,93,0,0,0,114,47,0,0,0,114,
-    153,0,0,0,114,169,0,0,0,114,220,0,0,0,114,255,
-    0,0,0,114,60,0,0,0,218,11,108,111,97,100,95,109,
-    111,100,117,108,101,114,3,1,0,0,41,4,114,71,0,0,
-    0,114,179,0,0,0,114,67,0,0,0,114,171,0,0,0,
-    114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,114,
-    175,0,0,0,112,4,0,0,115,32,0,0,0,0,2,12,
+    111,100,117,108,101,115,114,84,0,0,0,78,122,14,109,105,
+    115,115,105,110,103,32,108,111,97,100,101,114,114,8,1,0,
+    0,84,114,17,1,0,0,41,16,114,193,0,0,0,114,84,
+    0,0,0,114,122,0,0,0,218,12,97,99,113,117,105,114,
+    101,95,108,111,99,107,114,119,0,0,0,114,8,0,0,0,
+    114,90,0,0,0,114,19,0,0,0,114,58,0,0,0,114,
+    169,0,0,0,114,185,0,0,0,114,236,0,0,0,114,14,
+    1,0,0,114,77,0,0,0,218,11,108,111,97,100,95,109,
+    111,100,117,108,101,114,18,1,0,0,41,4,114,88,0,0,
+    0,114,195,0,0,0,114,84,0,0,0,114,187,0,0,0,
+    114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,
+    191,0,0,0,128,4,0,0,115,32,0,0,0,0,2,12,
     1,10,1,13,1,24,1,15,1,21,1,18,1,18,1,27,
     2,19,1,4,1,19,1,21,2,22,2,19,1,122,17,95,
     83,112,101,99,77,101,116,104,111,100,115,46,101,120,101,99,
@@ -1953,17 +1978,17 @@ const unsigned char _Py_M__importlib[] = {
     100,0,0,107,8,0,114,20,1,121,13,0,124,1,0,124,
     2,0,95,13,0,87,113,20,1,4,116,8,0,107,10,0,
     114,16,1,1,1,1,89,113,20,1,88,110,0,0,124,2,
-    0,83,41,7,78,114,204,0,0,0,114,251,0,0,0,114,
-    244,0,0,0,114,116,0,0,0,114,84,0,0,0,114,208,
-    0,0,0,41,14,114,177,0,0,0,114,169,0,0,0,114,
-    5,1,0,0,114,67,0,0,0,114,7,0,0,0,114,73,
-    0,0,0,114,62,0,0,0,114,204,0,0,0,114,209,0,
-    0,0,114,57,0,0,0,114,251,0,0,0,114,60,0,0,
-    0,114,32,0,0,0,114,208,0,0,0,41,3,114,71,0,
-    0,0,114,177,0,0,0,114,179,0,0,0,114,4,0,0,
-    0,114,4,0,0,0,114,5,0,0,0,218,25,95,108,111,
+    0,83,41,7,78,114,220,0,0,0,114,10,1,0,0,114,
+    3,1,0,0,114,132,0,0,0,114,101,0,0,0,114,224,
+    0,0,0,41,14,114,193,0,0,0,114,185,0,0,0,114,
+    20,1,0,0,114,84,0,0,0,114,8,0,0,0,114,90,
+    0,0,0,114,79,0,0,0,114,220,0,0,0,114,225,0,
+    0,0,114,17,0,0,0,114,10,1,0,0,114,77,0,0,
+    0,114,42,0,0,0,114,224,0,0,0,41,3,114,88,0,
+    0,0,114,193,0,0,0,114,195,0,0,0,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,218,25,95,108,111,
     97,100,95,98,97,99,107,119,97,114,100,95,99,111,109,112,
-    97,116,105,98,108,101,134,4,0,0,115,42,0,0,0,0,
+    97,116,105,98,108,101,150,4,0,0,115,42,0,0,0,0,
     2,9,2,19,1,16,1,24,1,3,1,16,1,13,1,8,
     1,24,1,3,4,12,1,15,1,32,1,13,1,8,1,24,
     1,3,1,13,1,13,1,8,1,122,38,95,83,112,101,99,
@@ -1977,11 +2002,11 @@ const unsigned char _Py_M__importlib[] = {
     101,99,39,101,100,32,109,111,100,117,108,101,32,105,110,116,
     111,32,97,110,32,101,120,105,115,116,105,110,103,32,109,111,
     100,117,108,101,39,115,32,110,97,109,101,115,112,97,99,101,
-    46,78,41,2,114,212,0,0,0,114,175,0,0,0,41,3,
-    114,71,0,0,0,114,179,0,0,0,90,6,108,111,97,100,
-    101,100,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
+    46,78,41,2,114,228,0,0,0,114,191,0,0,0,41,3,
+    114,88,0,0,0,114,195,0,0,0,90,6,108,111,97,100,
+    101,100,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
     0,218,14,95,108,111,97,100,95,101,120,105,115,116,105,110,
-    103,164,4,0,0,115,6,0,0,0,0,3,13,1,21,1,
+    103,180,4,0,0,115,6,0,0,0,0,3,13,1,21,1,
     122,27,95,83,112,101,99,77,101,116,104,111,100,115,46,95,
     108,111,97,100,95,101,120,105,115,116,105,110,103,99,1,0,
     0,0,0,0,0,0,2,0,0,0,11,0,0,0,67,0,
@@ -1996,16 +2021,16 @@ const unsigned char _Py_M__importlib[] = {
     0,124,0,0,106,0,0,106,8,0,131,1,1,130,1,0,
     113,156,0,110,13,0,124,0,0,106,9,0,124,1,0,131,
     1,0,1,87,100,0,0,81,88,116,10,0,106,11,0,124,
-    0,0,106,0,0,106,8,0,25,83,41,4,78,114,2,1,
+    0,0,106,0,0,106,8,0,25,83,41,4,78,114,17,1,
     0,0,122,14,109,105,115,115,105,110,103,32,108,111,97,100,
-    101,114,114,67,0,0,0,41,12,114,177,0,0,0,114,169,
-    0,0,0,114,60,0,0,0,114,6,1,0,0,114,1,1,
-    0,0,114,212,0,0,0,114,220,0,0,0,114,153,0,0,
-    0,114,67,0,0,0,114,3,1,0,0,114,7,0,0,0,
-    114,73,0,0,0,41,2,114,71,0,0,0,114,179,0,0,
-    0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,
+    101,114,114,84,0,0,0,41,12,114,193,0,0,0,114,185,
+    0,0,0,114,77,0,0,0,114,21,1,0,0,114,16,1,
+    0,0,114,228,0,0,0,114,236,0,0,0,114,169,0,0,
+    0,114,84,0,0,0,114,18,1,0,0,114,8,0,0,0,
+    114,90,0,0,0,41,2,114,88,0,0,0,114,195,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
     218,14,95,108,111,97,100,95,117,110,108,111,99,107,101,100,
-    171,4,0,0,115,20,0,0,0,0,2,18,2,21,1,13,
+    187,4,0,0,115,20,0,0,0,0,2,18,2,21,1,13,
     2,12,1,13,1,18,1,18,1,30,3,19,5,122,27,95,
     83,112,101,99,77,101,116,104,111,100,115,46,95,108,111,97,
     100,95,117,110,108,111,99,107,101,100,99,1,0,0,0,0,
@@ -2026,22 +2051,22 @@ const unsigned char _Py_M__importlib[] = {
     44,32,116,104,97,116,32,101,120,105,115,116,105,110,103,32,
     109,111,100,117,108,101,32,103,101,116,115,10,32,32,32,32,
     32,32,32,32,99,108,111,98,98,101,114,101,100,46,10,10,
-    32,32,32,32,32,32,32,32,78,41,6,114,106,0,0,0,
-    114,4,1,0,0,114,103,0,0,0,114,177,0,0,0,114,
-    67,0,0,0,114,8,1,0,0,41,1,114,71,0,0,0,
-    114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,114,
-    176,0,0,0,194,4,0,0,115,6,0,0,0,0,9,10,
+    32,32,32,32,32,32,32,32,78,41,6,114,122,0,0,0,
+    114,19,1,0,0,114,119,0,0,0,114,193,0,0,0,114,
+    84,0,0,0,114,23,1,0,0,41,1,114,88,0,0,0,
+    114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,
+    192,0,0,0,210,4,0,0,115,6,0,0,0,0,9,10,
     1,19,1,122,17,95,83,112,101,99,77,101,116,104,111,100,
-    115,46,108,111,97,100,78,41,16,114,57,0,0,0,114,56,
-    0,0,0,114,58,0,0,0,114,59,0,0,0,114,72,0,
+    115,46,108,111,97,100,78,41,16,114,17,0,0,0,114,74,
+    0,0,0,114,75,0,0,0,114,76,0,0,0,114,89,0,
     0,0,218,11,99,108,97,115,115,109,101,116,104,111,100,114,
-    248,0,0,0,114,205,0,0,0,114,255,0,0,0,114,1,
-    1,0,0,114,3,1,0,0,114,175,0,0,0,114,6,1,
-    0,0,114,7,1,0,0,114,8,1,0,0,114,176,0,0,
-    0,114,4,0,0,0,114,4,0,0,0,114,4,0,0,0,
-    114,5,0,0,0,114,174,0,0,0,215,3,0,0,115,24,
+    7,1,0,0,114,221,0,0,0,114,14,1,0,0,114,16,
+    1,0,0,114,18,1,0,0,114,191,0,0,0,114,21,1,
+    0,0,114,22,1,0,0,114,23,1,0,0,114,192,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,5,0,0,0,
+    114,6,0,0,0,114,190,0,0,0,231,3,0,0,115,24,
     0,0,0,12,3,6,2,12,3,18,16,12,16,24,80,12,
-    23,12,10,12,22,12,30,12,7,12,23,114,174,0,0,0,
+    23,12,10,12,22,12,30,12,7,12,23,114,190,0,0,0,
     99,0,0,0,0,0,0,0,0,0,0,0,0,5,0,0,
     0,64,0,0,0,115,181,0,0,0,101,0,0,90,1,0,
     100,0,0,90,2,0,100,1,0,90,3,0,101,4,0,100,
@@ -2069,10 +2094,10 @@ const unsigned char _Py_M__importlib[] = {
     0,2,0,0,0,67,0,0,0,115,16,0,0,0,100,1,
     0,106,0,0,124,0,0,106,1,0,131,1,0,83,41,2,
     78,122,24,60,109,111,100,117,108,101,32,123,33,114,125,32,
-    40,98,117,105,108,116,45,105,110,41,62,41,2,114,47,0,
-    0,0,114,57,0,0,0,41,1,114,179,0,0,0,114,4,
-    0,0,0,114,4,0,0,0,114,5,0,0,0,114,205,0,
-    0,0,219,4,0,0,115,2,0,0,0,0,3,122,27,66,
+    40,98,117,105,108,116,45,105,110,41,62,41,2,114,58,0,
+    0,0,114,17,0,0,0,41,1,114,195,0,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,114,221,0,
+    0,0,235,4,0,0,115,2,0,0,0,0,3,122,27,66,
     117,105,108,116,105,110,73,109,112,111,114,116,101,114,46,109,
     111,100,117,108,101,95,114,101,112,114,78,99,4,0,0,0,
     0,0,0,0,4,0,0,0,5,0,0,0,67,0,0,0,
@@ -2080,12 +2105,12 @@ const unsigned char _Py_M__importlib[] = {
     0,100,0,0,83,116,0,0,106,1,0,124,1,0,131,1,
     0,114,50,0,116,2,0,124,1,0,124,0,0,100,1,0,
     100,2,0,131,2,1,83,100,0,0,83,100,0,0,83,41,
-    3,78,114,217,0,0,0,122,8,98,117,105,108,116,45,105,
-    110,41,3,114,106,0,0,0,90,10,105,115,95,98,117,105,
-    108,116,105,110,114,173,0,0,0,41,4,114,247,0,0,0,
-    114,158,0,0,0,114,35,0,0,0,218,6,116,97,114,103,
-    101,116,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
-    0,218,9,102,105,110,100,95,115,112,101,99,224,4,0,0,
+    3,78,114,233,0,0,0,122,8,98,117,105,108,116,45,105,
+    110,41,3,114,122,0,0,0,90,10,105,115,95,98,117,105,
+    108,116,105,110,114,189,0,0,0,41,4,114,6,1,0,0,
+    114,174,0,0,0,114,45,0,0,0,218,6,116,97,114,103,
+    101,116,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,218,9,102,105,110,100,95,115,112,101,99,240,4,0,0,
     115,10,0,0,0,0,2,12,1,4,1,15,1,19,2,122,
     25,66,117,105,108,116,105,110,73,109,112,111,114,116,101,114,
     46,102,105,110,100,95,115,112,101,99,99,3,0,0,0,0,
@@ -2100,11 +2125,11 @@ const unsigned char _Py_M__importlib[] = {
     116,104,101,110,32,116,104,101,32,115,101,97,114,99,104,32,
     105,115,32,99,111,110,115,105,100,101,114,101,100,32,97,32,
     102,97,105,108,117,114,101,46,10,10,32,32,32,32,32,32,
-    32,32,78,41,2,114,12,1,0,0,114,169,0,0,0,41,
-    4,114,247,0,0,0,114,158,0,0,0,114,35,0,0,0,
-    114,177,0,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,218,11,102,105,110,100,95,109,111,100,117,108,
-    101,233,4,0,0,115,4,0,0,0,0,7,18,1,122,27,
+    32,32,78,41,2,114,27,1,0,0,114,185,0,0,0,41,
+    4,114,6,1,0,0,114,174,0,0,0,114,45,0,0,0,
+    114,193,0,0,0,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,218,11,102,105,110,100,95,109,111,100,117,108,
+    101,249,4,0,0,115,4,0,0,0,0,7,18,1,122,27,
     66,117,105,108,116,105,110,73,109,112,111,114,116,101,114,46,
     102,105,110,100,95,109,111,100,117,108,101,99,2,0,0,0,
     0,0,0,0,3,0,0,0,10,0,0,0,67,0,0,0,
@@ -2113,13 +2138,13 @@ const unsigned char _Py_M__importlib[] = {
     0,125,2,0,87,100,1,0,81,88,124,0,0,124,2,0,
     95,4,0,100,2,0,124,2,0,95,5,0,124,2,0,83,
     41,3,122,23,76,111,97,100,32,97,32,98,117,105,108,116,
-    45,105,110,32,109,111,100,117,108,101,46,78,114,30,0,0,
-    0,41,6,114,69,0,0,0,114,114,0,0,0,114,106,0,
+    45,105,110,32,109,111,100,117,108,101,46,78,114,40,0,0,
+    0,41,6,114,86,0,0,0,114,130,0,0,0,114,122,0,
     0,0,90,12,105,110,105,116,95,98,117,105,108,116,105,110,
-    114,204,0,0,0,114,251,0,0,0,41,3,114,247,0,0,
-    0,114,158,0,0,0,114,179,0,0,0,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,114,5,1,0,0,243,
-    4,0,0,115,10,0,0,0,0,4,13,1,24,1,9,1,
+    114,220,0,0,0,114,10,1,0,0,41,3,114,6,1,0,
+    0,114,174,0,0,0,114,195,0,0,0,114,5,0,0,0,
+    114,5,0,0,0,114,6,0,0,0,114,20,1,0,0,3,
+    5,0,0,115,10,0,0,0,0,4,13,1,24,1,9,1,
     9,1,122,27,66,117,105,108,116,105,110,73,109,112,111,114,
     116,101,114,46,108,111,97,100,95,109,111,100,117,108,101,99,
     2,0,0,0,0,0,0,0,2,0,0,0,1,0,0,0,
@@ -2127,10 +2152,10 @@ const unsigned char _Py_M__importlib[] = {
     57,82,101,116,117,114,110,32,78,111,110,101,32,97,115,32,
     98,117,105,108,116,45,105,110,32,109,111,100,117,108,101,115,
     32,100,111,32,110,111,116,32,104,97,118,101,32,99,111,100,
-    101,32,111,98,106,101,99,116,115,46,78,114,4,0,0,0,
-    41,2,114,247,0,0,0,114,158,0,0,0,114,4,0,0,
-    0,114,4,0,0,0,114,5,0,0,0,218,8,103,101,116,
-    95,99,111,100,101,253,4,0,0,115,2,0,0,0,0,4,
+    101,32,111,98,106,101,99,116,115,46,78,114,5,0,0,0,
+    41,2,114,6,1,0,0,114,174,0,0,0,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,218,8,103,101,116,
+    95,99,111,100,101,13,5,0,0,115,2,0,0,0,0,4,
     122,24,66,117,105,108,116,105,110,73,109,112,111,114,116,101,
     114,46,103,101,116,95,99,111,100,101,99,2,0,0,0,0,
     0,0,0,2,0,0,0,1,0,0,0,67,0,0,0,115,
@@ -2138,10 +2163,10 @@ const unsigned char _Py_M__importlib[] = {
     114,110,32,78,111,110,101,32,97,115,32,98,117,105,108,116,
     45,105,110,32,109,111,100,117,108,101,115,32,100,111,32,110,
     111,116,32,104,97,118,101,32,115,111,117,114,99,101,32,99,
-    111,100,101,46,78,114,4,0,0,0,41,2,114,247,0,0,
-    0,114,158,0,0,0,114,4,0,0,0,114,4,0,0,0,
-    114,5,0,0,0,218,10,103,101,116,95,115,111,117,114,99,
-    101,3,5,0,0,115,2,0,0,0,0,4,122,26,66,117,
+    111,100,101,46,78,114,5,0,0,0,41,2,114,6,1,0,
+    0,114,174,0,0,0,114,5,0,0,0,114,5,0,0,0,
+    114,6,0,0,0,218,10,103,101,116,95,115,111,117,114,99,
+    101,19,5,0,0,115,2,0,0,0,0,4,122,26,66,117,
     105,108,116,105,110,73,109,112,111,114,116,101,114,46,103,101,
     116,95,115,111,117,114,99,101,99,2,0,0,0,0,0,0,
     0,2,0,0,0,1,0,0,0,67,0,0,0,115,4,0,
@@ -2149,20 +2174,20 @@ const unsigned char _Py_M__importlib[] = {
     32,70,97,108,115,101,32,97,115,32,98,117,105,108,116,45,
     105,110,32,109,111,100,117,108,101,115,32,97,114,101,32,110,
     101,118,101,114,32,112,97,99,107,97,103,101,115,46,70,114,
-    4,0,0,0,41,2,114,247,0,0,0,114,158,0,0,0,
-    114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,114,
-    219,0,0,0,9,5,0,0,115,2,0,0,0,0,5,122,
+    5,0,0,0,41,2,114,6,1,0,0,114,174,0,0,0,
+    114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,
+    235,0,0,0,25,5,0,0,115,2,0,0,0,0,5,122,
     26,66,117,105,108,116,105,110,73,109,112,111,114,116,101,114,
-    46,105,115,95,112,97,99,107,97,103,101,41,14,114,57,0,
-    0,0,114,56,0,0,0,114,58,0,0,0,114,59,0,0,
+    46,105,115,95,112,97,99,107,97,103,101,41,14,114,17,0,
+    0,0,114,74,0,0,0,114,75,0,0,0,114,76,0,0,
     0,218,12,115,116,97,116,105,99,109,101,116,104,111,100,114,
-    205,0,0,0,114,9,1,0,0,114,12,1,0,0,114,13,
-    1,0,0,114,161,0,0,0,114,5,1,0,0,114,14,1,
-    0,0,114,15,1,0,0,114,219,0,0,0,114,4,0,0,
-    0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,
-    114,10,1,0,0,210,4,0,0,115,28,0,0,0,12,7,
+    221,0,0,0,114,24,1,0,0,114,27,1,0,0,114,28,
+    1,0,0,114,177,0,0,0,114,20,1,0,0,114,29,1,
+    0,0,114,30,1,0,0,114,235,0,0,0,114,5,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
+    114,25,1,0,0,226,4,0,0,115,28,0,0,0,12,7,
     6,2,18,5,3,1,21,8,3,1,18,9,3,1,21,9,
-    3,1,21,5,3,1,21,5,3,1,114,10,1,0,0,99,
+    3,1,21,5,3,1,21,5,3,1,114,25,1,0,0,99,
     0,0,0,0,0,0,0,0,0,0,0,0,5,0,0,0,
     64,0,0,0,115,193,0,0,0,101,0,0,90,1,0,100,
     0,0,90,2,0,100,1,0,90,3,0,101,4,0,100,2,
@@ -2191,20 +2216,20 @@ const unsigned char _Py_M__importlib[] = {
     0,115,16,0,0,0,100,1,0,106,0,0,124,0,0,106,
     1,0,131,1,0,83,41,2,78,122,22,60,109,111,100,117,
     108,101,32,123,33,114,125,32,40,102,114,111,122,101,110,41,
-    62,41,2,114,47,0,0,0,114,57,0,0,0,41,1,218,
-    1,109,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
-    0,114,205,0,0,0,26,5,0,0,115,2,0,0,0,0,
+    62,41,2,114,58,0,0,0,114,17,0,0,0,41,1,218,
+    1,109,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,114,221,0,0,0,42,5,0,0,115,2,0,0,0,0,
     3,122,26,70,114,111,122,101,110,73,109,112,111,114,116,101,
     114,46,109,111,100,117,108,101,95,114,101,112,114,78,99,4,
     0,0,0,0,0,0,0,4,0,0,0,5,0,0,0,67,
     0,0,0,115,42,0,0,0,116,0,0,106,1,0,124,1,
     0,131,1,0,114,34,0,116,2,0,124,1,0,124,0,0,
     100,1,0,100,2,0,131,2,1,83,100,0,0,83,100,0,
-    0,83,41,3,78,114,217,0,0,0,90,6,102,114,111,122,
-    101,110,41,3,114,106,0,0,0,114,162,0,0,0,114,173,
-    0,0,0,41,4,114,247,0,0,0,114,158,0,0,0,114,
-    35,0,0,0,114,11,1,0,0,114,4,0,0,0,114,4,
-    0,0,0,114,5,0,0,0,114,12,1,0,0,31,5,0,
+    0,83,41,3,78,114,233,0,0,0,90,6,102,114,111,122,
+    101,110,41,3,114,122,0,0,0,114,178,0,0,0,114,189,
+    0,0,0,41,4,114,6,1,0,0,114,174,0,0,0,114,
+    45,0,0,0,114,26,1,0,0,114,5,0,0,0,114,5,
+    0,0,0,114,6,0,0,0,114,27,1,0,0,47,5,0,
     0,115,6,0,0,0,0,2,15,1,19,2,122,24,70,114,
     111,122,101,110,73,109,112,111,114,116,101,114,46,102,105,110,
     100,95,115,112,101,99,99,3,0,0,0,0,0,0,0,3,
@@ -2212,10 +2237,10 @@ const unsigned char _Py_M__importlib[] = {
     116,0,0,106,1,0,124,1,0,131,1,0,114,19,0,124,
     0,0,83,100,1,0,83,41,2,122,21,70,105,110,100,32,
     97,32,102,114,111,122,101,110,32,109,111,100,117,108,101,46,
-    78,41,2,114,106,0,0,0,114,162,0,0,0,41,3,114,
-    247,0,0,0,114,158,0,0,0,114,35,0,0,0,114,4,
-    0,0,0,114,4,0,0,0,114,5,0,0,0,114,13,1,
-    0,0,38,5,0,0,115,2,0,0,0,0,3,122,26,70,
+    78,41,2,114,122,0,0,0,114,178,0,0,0,41,3,114,
+    6,1,0,0,114,174,0,0,0,114,45,0,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,114,28,1,
+    0,0,54,5,0,0,115,2,0,0,0,0,3,122,26,70,
     114,111,122,101,110,73,109,112,111,114,116,101,114,46,102,105,
     110,100,95,109,111,100,117,108,101,99,1,0,0,0,0,0,
     0,0,3,0,0,0,4,0,0,0,67,0,0,0,115,95,
@@ -2227,13 +2252,13 @@ const unsigned char _Py_M__importlib[] = {
     0,124,2,0,124,0,0,106,9,0,131,2,0,1,100,0,
     0,83,41,3,78,122,27,123,33,114,125,32,105,115,32,110,
     111,116,32,97,32,102,114,111,122,101,110,32,109,111,100,117,
-    108,101,114,67,0,0,0,41,10,114,208,0,0,0,114,67,
-    0,0,0,114,106,0,0,0,114,162,0,0,0,114,153,0,
-    0,0,114,47,0,0,0,114,114,0,0,0,218,17,103,101,
+    108,101,114,84,0,0,0,41,10,114,224,0,0,0,114,84,
+    0,0,0,114,122,0,0,0,114,178,0,0,0,114,169,0,
+    0,0,114,58,0,0,0,114,130,0,0,0,218,17,103,101,
     116,95,102,114,111,122,101,110,95,111,98,106,101,99,116,114,
-    175,0,0,0,114,63,0,0,0,41,3,114,179,0,0,0,
-    114,67,0,0,0,114,194,0,0,0,114,4,0,0,0,114,
-    4,0,0,0,114,5,0,0,0,114,2,1,0,0,43,5,
+    191,0,0,0,114,80,0,0,0,41,3,114,195,0,0,0,
+    114,84,0,0,0,114,210,0,0,0,114,5,0,0,0,114,
+    5,0,0,0,114,6,0,0,0,114,17,1,0,0,59,5,
     0,0,115,12,0,0,0,0,2,12,1,15,1,18,1,12,
     1,18,1,122,26,70,114,111,122,101,110,73,109,112,111,114,
     116,101,114,46,101,120,101,99,95,109,111,100,117,108,101,99,
@@ -2241,9 +2266,9 @@ const unsigned char _Py_M__importlib[] = {
     67,0,0,0,115,13,0,0,0,116,0,0,124,0,0,124,
     1,0,131,2,0,83,41,1,122,21,76,111,97,100,32,97,
     32,102,114,111,122,101,110,32,109,111,100,117,108,101,46,41,
-    1,114,180,0,0,0,41,2,114,247,0,0,0,114,158,0,
-    0,0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
-    0,114,5,1,0,0,52,5,0,0,115,2,0,0,0,0,
+    1,114,196,0,0,0,41,2,114,6,1,0,0,114,174,0,
+    0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,114,20,1,0,0,68,5,0,0,115,2,0,0,0,0,
     3,122,26,70,114,111,122,101,110,73,109,112,111,114,116,101,
     114,46,108,111,97,100,95,109,111,100,117,108,101,99,2,0,
     0,0,0,0,0,0,2,0,0,0,2,0,0,0,67,0,
@@ -2251,20 +2276,20 @@ const unsigned char _Py_M__importlib[] = {
     131,1,0,83,41,1,122,45,82,101,116,117,114,110,32,116,
     104,101,32,99,111,100,101,32,111,98,106,101,99,116,32,102,
     111,114,32,116,104,101,32,102,114,111,122,101,110,32,109,111,
-    100,117,108,101,46,41,2,114,106,0,0,0,114,19,1,0,
-    0,41,2,114,247,0,0,0,114,158,0,0,0,114,4,0,
-    0,0,114,4,0,0,0,114,5,0,0,0,114,14,1,0,
-    0,57,5,0,0,115,2,0,0,0,0,4,122,23,70,114,
+    100,117,108,101,46,41,2,114,122,0,0,0,114,34,1,0,
+    0,41,2,114,6,1,0,0,114,174,0,0,0,114,5,0,
+    0,0,114,5,0,0,0,114,6,0,0,0,114,29,1,0,
+    0,73,5,0,0,115,2,0,0,0,0,4,122,23,70,114,
     111,122,101,110,73,109,112,111,114,116,101,114,46,103,101,116,
     95,99,111,100,101,99,2,0,0,0,0,0,0,0,2,0,
     0,0,1,0,0,0,67,0,0,0,115,4,0,0,0,100,
     1,0,83,41,2,122,54,82,101,116,117,114,110,32,78,111,
     110,101,32,97,115,32,102,114,111,122,101,110,32,109,111,100,
     117,108,101,115,32,100,111,32,110,111,116,32,104,97,118,101,
-    32,115,111,117,114,99,101,32,99,111,100,101,46,78,114,4,
-    0,0,0,41,2,114,247,0,0,0,114,158,0,0,0,114,
-    4,0,0,0,114,4,0,0,0,114,5,0,0,0,114,15,
-    1,0,0,63,5,0,0,115,2,0,0,0,0,4,122,25,
+    32,115,111,117,114,99,101,32,99,111,100,101,46,78,114,5,
+    0,0,0,41,2,114,6,1,0,0,114,174,0,0,0,114,
+    5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,30,
+    1,0,0,79,5,0,0,115,2,0,0,0,0,4,122,25,
     70,114,111,122,101,110,73,109,112,111,114,116,101,114,46,103,
     101,116,95,115,111,117,114,99,101,99,2,0,0,0,0,0,
     0,0,2,0,0,0,2,0,0,0,67,0,0,0,115,13,
@@ -2272,21 +2297,21 @@ const unsigned char _Py_M__importlib[] = {
     41,1,122,46,82,101,116,117,114,110,32,84,114,117,101,32,
     105,102,32,116,104,101,32,102,114,111,122,101,110,32,109,111,
     100,117,108,101,32,105,115,32,97,32,112,97,99,107,97,103,
-    101,46,41,2,114,106,0,0,0,90,17,105,115,95,102,114,
-    111,122,101,110,95,112,97,99,107,97,103,101,41,2,114,247,
-    0,0,0,114,158,0,0,0,114,4,0,0,0,114,4,0,
-    0,0,114,5,0,0,0,114,219,0,0,0,69,5,0,0,
+    101,46,41,2,114,122,0,0,0,90,17,105,115,95,102,114,
+    111,122,101,110,95,112,97,99,107,97,103,101,41,2,114,6,
+    1,0,0,114,174,0,0,0,114,5,0,0,0,114,5,0,
+    0,0,114,6,0,0,0,114,235,0,0,0,85,5,0,0,
     115,2,0,0,0,0,4,122,25,70,114,111,122,101,110,73,
     109,112,111,114,116,101,114,46,105,115,95,112,97,99,107,97,
-    103,101,41,15,114,57,0,0,0,114,56,0,0,0,114,58,
-    0,0,0,114,59,0,0,0,114,16,1,0,0,114,205,0,
-    0,0,114,9,1,0,0,114,12,1,0,0,114,13,1,0,
-    0,114,2,1,0,0,114,5,1,0,0,114,164,0,0,0,
-    114,14,1,0,0,114,15,1,0,0,114,219,0,0,0,114,
-    4,0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,114,17,1,0,0,17,5,0,0,115,28,0,0,
+    103,101,41,15,114,17,0,0,0,114,74,0,0,0,114,75,
+    0,0,0,114,76,0,0,0,114,31,1,0,0,114,221,0,
+    0,0,114,24,1,0,0,114,27,1,0,0,114,28,1,0,
+    0,114,17,1,0,0,114,20,1,0,0,114,180,0,0,0,
+    114,29,1,0,0,114,30,1,0,0,114,235,0,0,0,114,
+    5,0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,114,32,1,0,0,33,5,0,0,115,28,0,0,
     0,12,7,6,2,18,5,3,1,21,6,3,1,18,4,18,
-    9,18,5,3,1,21,5,3,1,21,5,3,1,114,17,1,
+    9,18,5,3,1,21,5,3,1,21,5,3,1,114,32,1,
     0,0,99,0,0,0,0,0,0,0,0,0,0,0,0,5,
     0,0,0,64,0,0,0,115,121,0,0,0,101,0,0,90,
     1,0,100,0,0,90,2,0,100,1,0,90,3,0,100,2,
@@ -2318,11 +2343,11 @@ const unsigned char _Py_M__importlib[] = {
     2,0,83,89,110,1,0,88,100,0,0,83,41,1,78,41,
     5,218,7,95,119,105,110,114,101,103,90,7,79,112,101,110,
     75,101,121,90,17,72,75,69,89,95,67,85,82,82,69,78,
-    84,95,85,83,69,82,114,40,0,0,0,90,18,72,75,69,
+    84,95,85,83,69,82,114,50,0,0,0,90,18,72,75,69,
     89,95,76,79,67,65,76,95,77,65,67,72,73,78,69,41,
-    2,114,247,0,0,0,218,3,107,101,121,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,218,14,95,111,112,101,
-    110,95,114,101,103,105,115,116,114,121,88,5,0,0,115,8,
+    2,114,6,1,0,0,114,20,0,0,0,114,5,0,0,0,
+    114,5,0,0,0,114,6,0,0,0,218,14,95,111,112,101,
+    110,95,114,101,103,105,115,116,114,121,104,5,0,0,115,8,
     0,0,0,0,2,3,1,23,1,13,1,122,36,87,105,110,
     100,111,119,115,82,101,103,105,115,116,114,121,70,105,110,100,
     101,114,46,95,111,112,101,110,95,114,101,103,105,115,116,114,
@@ -2336,20 +2361,20 @@ const unsigned char _Py_M__importlib[] = {
     125,4,0,116,7,0,106,8,0,124,4,0,100,4,0,131,
     2,0,125,5,0,87,100,0,0,81,88,87,110,22,0,4,
     116,9,0,107,10,0,114,137,0,1,1,1,100,0,0,83,
-    89,110,1,0,88,124,5,0,83,41,5,78,114,158,0,0,
-    0,90,11,115,121,115,95,118,101,114,115,105,111,110,114,136,
-    0,0,0,114,30,0,0,0,41,10,218,11,68,69,66,85,
+    89,110,1,0,88,124,5,0,83,41,5,78,114,174,0,0,
+    0,90,11,115,121,115,95,118,101,114,115,105,111,110,114,152,
+    0,0,0,114,40,0,0,0,41,10,218,11,68,69,66,85,
     71,95,66,85,73,76,68,218,18,82,69,71,73,83,84,82,
     89,95,75,69,89,95,68,69,66,85,71,218,12,82,69,71,
-    73,83,84,82,89,95,75,69,89,114,47,0,0,0,114,7,
-    0,0,0,218,7,118,101,114,115,105,111,110,114,23,1,0,
-    0,114,21,1,0,0,90,10,81,117,101,114,121,86,97,108,
-    117,101,114,40,0,0,0,41,6,114,247,0,0,0,114,158,
+    73,83,84,82,89,95,75,69,89,114,58,0,0,0,114,8,
+    0,0,0,218,7,118,101,114,115,105,111,110,114,37,1,0,
+    0,114,36,1,0,0,90,10,81,117,101,114,121,86,97,108,
+    117,101,114,50,0,0,0,41,6,114,6,1,0,0,114,174,
     0,0,0,90,12,114,101,103,105,115,116,114,121,95,107,101,
-    121,114,22,1,0,0,90,4,104,107,101,121,218,8,102,105,
-    108,101,112,97,116,104,114,4,0,0,0,114,4,0,0,0,
-    114,5,0,0,0,218,16,95,115,101,97,114,99,104,95,114,
-    101,103,105,115,116,114,121,95,5,0,0,115,22,0,0,0,
+    121,114,20,0,0,0,90,4,104,107,101,121,218,8,102,105,
+    108,101,112,97,116,104,114,5,0,0,0,114,5,0,0,0,
+    114,6,0,0,0,218,16,95,115,101,97,114,99,104,95,114,
+    101,103,105,115,116,114,121,111,5,0,0,115,22,0,0,0,
     0,2,9,1,12,2,9,1,15,1,22,1,3,1,18,1,
     28,1,13,1,9,1,122,38,87,105,110,100,111,119,115,82,
     101,103,105,115,116,114,121,70,105,110,100,101,114,46,95,115,
@@ -2365,13 +2390,13 @@ const unsigned char _Py_M__importlib[] = {
     0,131,1,0,131,1,0,114,80,0,116,6,0,124,1,0,
     124,5,0,124,1,0,124,4,0,131,2,0,100,1,0,124,
     4,0,131,2,1,125,7,0,124,7,0,83,113,80,0,87,
-    100,0,0,83,41,2,78,114,217,0,0,0,41,7,114,29,
-    1,0,0,114,39,0,0,0,114,40,0,0,0,114,238,0,
-    0,0,114,228,0,0,0,114,229,0,0,0,114,173,0,0,
-    0,41,8,114,247,0,0,0,114,158,0,0,0,114,35,0,
-    0,0,114,11,1,0,0,114,28,1,0,0,114,169,0,0,
-    0,114,127,0,0,0,114,177,0,0,0,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,114,12,1,0,0,110,
+    100,0,0,83,41,2,78,114,233,0,0,0,41,7,114,43,
+    1,0,0,114,49,0,0,0,114,50,0,0,0,114,253,0,
+    0,0,114,244,0,0,0,114,245,0,0,0,114,189,0,0,
+    0,41,8,114,6,1,0,0,114,174,0,0,0,114,45,0,
+    0,0,114,26,1,0,0,114,42,1,0,0,114,185,0,0,
+    0,114,142,0,0,0,114,193,0,0,0,114,5,0,0,0,
+    114,5,0,0,0,114,6,0,0,0,114,27,1,0,0,126,
     5,0,0,115,24,0,0,0,0,3,15,1,12,1,4,1,
     3,1,14,1,13,1,9,1,22,1,21,1,21,1,9,1,
     122,31,87,105,110,100,111,119,115,82,101,103,105,115,116,114,
@@ -2383,21 +2408,21 @@ const unsigned char _Py_M__importlib[] = {
     100,1,0,83,100,1,0,83,41,2,122,34,70,105,110,100,
     32,109,111,100,117,108,101,32,110,97,109,101,100,32,105,110,
     32,116,104,101,32,114,101,103,105,115,116,114,121,46,78,41,
-    3,114,71,0,0,0,114,12,1,0,0,114,169,0,0,0,
-    41,4,114,247,0,0,0,114,158,0,0,0,114,35,0,0,
-    0,114,177,0,0,0,114,4,0,0,0,114,4,0,0,0,
-    114,5,0,0,0,114,13,1,0,0,126,5,0,0,115,8,
+    3,114,88,0,0,0,114,27,1,0,0,114,185,0,0,0,
+    41,4,114,6,1,0,0,114,174,0,0,0,114,45,0,0,
+    0,114,193,0,0,0,114,5,0,0,0,114,5,0,0,0,
+    114,6,0,0,0,114,28,1,0,0,142,5,0,0,115,8,
     0,0,0,0,3,18,1,12,1,7,2,122,33,87,105,110,
     100,111,119,115,82,101,103,105,115,116,114,121,70,105,110,100,
     101,114,46,102,105,110,100,95,109,111,100,117,108,101,41,12,
-    114,57,0,0,0,114,56,0,0,0,114,58,0,0,0,114,
-    59,0,0,0,114,26,1,0,0,114,25,1,0,0,114,24,
-    1,0,0,114,9,1,0,0,114,23,1,0,0,114,29,1,
-    0,0,114,12,1,0,0,114,13,1,0,0,114,4,0,0,
-    0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,
-    114,20,1,0,0,76,5,0,0,115,20,0,0,0,12,2,
+    114,17,0,0,0,114,74,0,0,0,114,75,0,0,0,114,
+    76,0,0,0,114,40,1,0,0,114,39,1,0,0,114,38,
+    1,0,0,114,24,1,0,0,114,37,1,0,0,114,43,1,
+    0,0,114,27,1,0,0,114,28,1,0,0,114,5,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
+    114,35,1,0,0,92,5,0,0,115,20,0,0,0,12,2,
     6,3,6,3,6,2,6,2,18,7,18,15,3,1,21,15,
-    3,1,114,20,1,0,0,99,0,0,0,0,0,0,0,0,
+    3,1,114,35,1,0,0,99,0,0,0,0,0,0,0,0,
     0,0,0,0,2,0,0,0,64,0,0,0,115,52,0,0,
     0,101,0,0,90,1,0,100,0,0,90,2,0,100,1,0,
     90,3,0,100,2,0,100,3,0,132,0,0,90,4,0,100,
@@ -2424,14 +2449,14 @@ const unsigned char _Py_M__importlib[] = {
     112,97,116,104,32,114,101,116,117,114,110,101,100,32,98,121,
     32,103,101,116,95,102,105,108,101,110,97,109,101,32,104,97,
     115,32,97,32,102,105,108,101,110,97,109,101,32,111,102,32,
-    39,95,95,105,110,105,116,95,95,46,112,121,39,46,114,29,
-    0,0,0,114,116,0,0,0,114,84,0,0,0,114,115,0,
-    0,0,114,72,0,0,0,41,4,114,38,0,0,0,114,236,
-    0,0,0,114,34,0,0,0,114,32,0,0,0,41,5,114,
-    71,0,0,0,114,158,0,0,0,114,131,0,0,0,90,13,
+    39,95,95,105,110,105,116,95,95,46,112,121,39,46,114,39,
+    0,0,0,114,132,0,0,0,114,101,0,0,0,114,131,0,
+    0,0,114,89,0,0,0,41,4,114,48,0,0,0,114,251,
+    0,0,0,114,44,0,0,0,114,42,0,0,0,41,5,114,
+    88,0,0,0,114,174,0,0,0,114,147,0,0,0,90,13,
     102,105,108,101,110,97,109,101,95,98,97,115,101,90,9,116,
-    97,105,108,95,110,97,109,101,114,4,0,0,0,114,4,0,
-    0,0,114,5,0,0,0,114,219,0,0,0,142,5,0,0,
+    97,105,108,95,110,97,109,101,114,5,0,0,0,114,5,0,
+    0,0,114,6,0,0,0,114,235,0,0,0,158,5,0,0,
     115,8,0,0,0,0,3,25,1,22,1,19,1,122,24,95,
     76,111,97,100,101,114,66,97,115,105,99,115,46,105,115,95,
     112,97,99,107,97,103,101,99,2,0,0,0,0,0,0,0,
@@ -2446,19 +2471,19 @@ const unsigned char _Py_M__importlib[] = {
     116,32,108,111,97,100,32,109,111,100,117,108,101,32,123,33,
     114,125,32,119,104,101,110,32,103,101,116,95,99,111,100,101,
     40,41,32,114,101,116,117,114,110,115,32,78,111,110,101,41,
-    7,114,14,1,0,0,114,57,0,0,0,114,153,0,0,0,
-    114,47,0,0,0,114,114,0,0,0,114,175,0,0,0,114,
-    63,0,0,0,41,3,114,71,0,0,0,114,179,0,0,0,
-    114,194,0,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,114,2,1,0,0,150,5,0,0,115,10,0,
+    7,114,29,1,0,0,114,17,0,0,0,114,169,0,0,0,
+    114,58,0,0,0,114,130,0,0,0,114,191,0,0,0,114,
+    80,0,0,0,41,3,114,88,0,0,0,114,195,0,0,0,
+    114,210,0,0,0,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,114,17,1,0,0,166,5,0,0,115,10,0,
     0,0,0,2,18,1,12,1,3,1,24,1,122,25,95,76,
     111,97,100,101,114,66,97,115,105,99,115,46,101,120,101,99,
-    95,109,111,100,117,108,101,78,41,8,114,57,0,0,0,114,
-    56,0,0,0,114,58,0,0,0,114,59,0,0,0,114,219,
-    0,0,0,114,2,1,0,0,114,180,0,0,0,114,5,1,
-    0,0,114,4,0,0,0,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,114,30,1,0,0,136,5,0,0,115,
-    8,0,0,0,12,3,6,3,12,8,12,8,114,30,1,0,
+    95,109,111,100,117,108,101,78,41,8,114,17,0,0,0,114,
+    74,0,0,0,114,75,0,0,0,114,76,0,0,0,114,235,
+    0,0,0,114,17,1,0,0,114,196,0,0,0,114,20,1,
+    0,0,114,5,0,0,0,114,5,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,114,44,1,0,0,152,5,0,0,115,
+    8,0,0,0,12,3,6,3,12,8,12,8,114,44,1,0,
     0,99,0,0,0,0,0,0,0,0,0,0,0,0,4,0,
     0,0,64,0,0,0,115,106,0,0,0,101,0,0,90,1,
     0,100,0,0,90,2,0,100,1,0,100,2,0,132,0,0,
@@ -2482,10 +2507,10 @@ const unsigned char _Py_M__importlib[] = {
     69,114,114,111,114,32,119,104,101,110,32,116,104,101,32,112,
     97,116,104,32,99,97,110,110,111,116,32,98,101,32,104,97,
     110,100,108,101,100,46,10,32,32,32,32,32,32,32,32,78,
-    41,1,218,7,73,79,69,114,114,111,114,41,2,114,71,0,
-    0,0,114,35,0,0,0,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,218,10,112,97,116,104,95,109,116,105,
-    109,101,163,5,0,0,115,2,0,0,0,0,6,122,23,83,
+    41,1,218,7,73,79,69,114,114,111,114,41,2,114,88,0,
+    0,0,114,45,0,0,0,114,5,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,218,10,112,97,116,104,95,109,116,105,
+    109,101,179,5,0,0,115,2,0,0,0,0,6,122,23,83,
     111,117,114,99,101,76,111,97,100,101,114,46,112,97,116,104,
     95,109,116,105,109,101,99,2,0,0,0,0,0,0,0,2,
     0,0,0,3,0,0,0,67,0,0,0,115,20,0,0,0,
@@ -2517,10 +2542,10 @@ const unsigned char _Py_M__importlib[] = {
     115,101,115,32,73,79,69,114,114,111,114,32,119,104,101,110,
     32,116,104,101,32,112,97,116,104,32,99,97,110,110,111,116,
     32,98,101,32,104,97,110,100,108,101,100,46,10,32,32,32,
-    32,32,32,32,32,114,183,0,0,0,41,1,114,33,1,0,
-    0,41,2,114,71,0,0,0,114,35,0,0,0,114,4,0,
-    0,0,114,4,0,0,0,114,5,0,0,0,218,10,112,97,
-    116,104,95,115,116,97,116,115,171,5,0,0,115,2,0,0,
+    32,32,32,32,32,114,199,0,0,0,41,1,114,47,1,0,
+    0,41,2,114,88,0,0,0,114,45,0,0,0,114,5,0,
+    0,0,114,5,0,0,0,114,6,0,0,0,218,10,112,97,
+    116,104,95,115,116,97,116,115,187,5,0,0,115,2,0,0,
     0,0,11,122,23,83,111,117,114,99,101,76,111,97,100,101,
     114,46,112,97,116,104,95,115,116,97,116,115,99,4,0,0,
     0,0,0,0,0,4,0,0,0,3,0,0,0,67,0,0,
@@ -2540,11 +2565,11 @@ const unsigned char _Py_M__importlib[] = {
     100,101,114,32,116,111,32,99,111,114,114,101,99,116,108,121,
     32,116,114,97,110,115,102,101,114,32,112,101,114,109,105,115,
     115,105,111,110,115,10,32,32,32,32,32,32,32,32,41,1,
-    218,8,115,101,116,95,100,97,116,97,41,4,114,71,0,0,
-    0,114,141,0,0,0,90,10,99,97,99,104,101,95,112,97,
-    116,104,114,53,0,0,0,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,218,15,95,99,97,99,104,101,95,98,
-    121,116,101,99,111,100,101,184,5,0,0,115,2,0,0,0,
+    218,8,115,101,116,95,100,97,116,97,41,4,114,88,0,0,
+    0,114,157,0,0,0,90,10,99,97,99,104,101,95,112,97,
+    116,104,114,69,0,0,0,114,5,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,218,15,95,99,97,99,104,101,95,98,
+    121,116,101,99,111,100,101,200,5,0,0,115,2,0,0,0,
     0,8,122,28,83,111,117,114,99,101,76,111,97,100,101,114,
     46,95,99,97,99,104,101,95,98,121,116,101,99,111,100,101,
     99,3,0,0,0,0,0,0,0,3,0,0,0,1,0,0,
@@ -2558,10 +2583,10 @@ const unsigned char _Py_M__importlib[] = {
     101,116,104,111,100,32,97,108,108,111,119,115,32,102,111,114,
     32,116,104,101,32,119,114,105,116,105,110,103,32,111,102,32,
     98,121,116,101,99,111,100,101,32,102,105,108,101,115,46,10,
-    32,32,32,32,32,32,32,32,78,114,4,0,0,0,41,3,
-    114,71,0,0,0,114,35,0,0,0,114,53,0,0,0,114,
-    4,0,0,0,114,4,0,0,0,114,5,0,0,0,114,35,
-    1,0,0,194,5,0,0,115,0,0,0,0,122,21,83,111,
+    32,32,32,32,32,32,32,32,78,114,5,0,0,0,41,3,
+    114,88,0,0,0,114,45,0,0,0,114,69,0,0,0,114,
+    5,0,0,0,114,5,0,0,0,114,6,0,0,0,114,49,
+    1,0,0,210,5,0,0,115,0,0,0,0,122,21,83,111,
     117,114,99,101,76,111,97,100,101,114,46,115,101,116,95,100,
     97,116,97,99,2,0,0,0,0,0,0,0,5,0,0,0,
     16,0,0,0,67,0,0,0,115,105,0,0,0,124,0,0,
@@ -2577,16 +2602,16 @@ const unsigned char _Py_M__importlib[] = {
     101,114,46,103,101,116,95,115,111,117,114,99,101,46,122,39,
     115,111,117,114,99,101,32,110,111,116,32,97,118,97,105,108,
     97,98,108,101,32,116,104,114,111,117,103,104,32,103,101,116,
-    95,100,97,116,97,40,41,114,67,0,0,0,78,41,5,114,
-    236,0,0,0,218,8,103,101,116,95,100,97,116,97,114,40,
-    0,0,0,114,153,0,0,0,114,203,0,0,0,41,5,114,
-    71,0,0,0,114,158,0,0,0,114,35,0,0,0,114,201,
-    0,0,0,218,3,101,120,99,114,4,0,0,0,114,4,0,
-    0,0,114,5,0,0,0,114,15,1,0,0,201,5,0,0,
+    95,100,97,116,97,40,41,114,84,0,0,0,78,41,5,114,
+    251,0,0,0,218,8,103,101,116,95,100,97,116,97,114,50,
+    0,0,0,114,169,0,0,0,114,219,0,0,0,41,5,114,
+    88,0,0,0,114,174,0,0,0,114,45,0,0,0,114,217,
+    0,0,0,218,3,101,120,99,114,5,0,0,0,114,5,0,
+    0,0,114,6,0,0,0,114,30,1,0,0,217,5,0,0,
     115,14,0,0,0,0,2,15,1,3,1,19,1,18,1,9,
     1,31,1,122,23,83,111,117,114,99,101,76,111,97,100,101,
     114,46,103,101,116,95,115,111,117,114,99,101,218,9,95,111,
-    112,116,105,109,105,122,101,114,29,0,0,0,99,3,0,0,
+    112,116,105,109,105,122,101,114,39,0,0,0,99,3,0,0,
     0,1,0,0,0,4,0,0,0,9,0,0,0,67,0,0,
     0,115,31,0,0,0,116,0,0,116,1,0,124,1,0,124,
     2,0,100,1,0,100,2,0,100,3,0,100,4,0,124,3,
@@ -2598,13 +2623,13 @@ const unsigned char _Py_M__importlib[] = {
     110,116,32,99,97,110,32,98,101,32,97,110,121,32,111,98,
     106,101,99,116,32,116,121,112,101,32,116,104,97,116,32,99,
     111,109,112,105,108,101,40,41,32,115,117,112,112,111,114,116,
-    115,46,10,32,32,32,32,32,32,32,32,114,175,0,0,0,
+    115,46,10,32,32,32,32,32,32,32,32,114,191,0,0,0,
     218,12,100,111,110,116,95,105,110,104,101,114,105,116,84,114,
-    118,0,0,0,41,2,114,114,0,0,0,218,7,99,111,109,
-    112,105,108,101,41,4,114,71,0,0,0,114,53,0,0,0,
-    114,35,0,0,0,114,39,1,0,0,114,4,0,0,0,114,
-    4,0,0,0,114,5,0,0,0,218,14,115,111,117,114,99,
-    101,95,116,111,95,99,111,100,101,211,5,0,0,115,4,0,
+    133,0,0,0,41,2,114,130,0,0,0,218,7,99,111,109,
+    112,105,108,101,41,4,114,88,0,0,0,114,69,0,0,0,
+    114,45,0,0,0,114,53,1,0,0,114,5,0,0,0,114,
+    5,0,0,0,114,6,0,0,0,218,14,115,111,117,114,99,
+    101,95,116,111,95,99,111,100,101,227,5,0,0,115,4,0,
     0,0,0,5,18,1,122,27,83,111,117,114,99,101,76,111,
     97,100,101,114,46,115,111,117,114,99,101,95,116,111,95,99,
     111,100,101,99,2,0,0,0,0,0,0,0,10,0,0,0,
@@ -2648,37 +2673,37 @@ const unsigned char _Py_M__importlib[] = {
     100,101,44,32,115,101,116,95,100,97,116,97,32,109,117,115,
     116,32,97,108,115,111,32,98,101,32,105,109,112,108,101,109,
     101,110,116,101,100,46,10,10,32,32,32,32,32,32,32,32,
-    78,114,183,0,0,0,114,187,0,0,0,114,67,0,0,0,
-    114,35,0,0,0,122,13,123,125,32,109,97,116,99,104,101,
-    115,32,123,125,114,140,0,0,0,114,141,0,0,0,122,19,
+    78,114,199,0,0,0,114,203,0,0,0,114,84,0,0,0,
+    114,45,0,0,0,122,13,123,125,32,109,97,116,99,104,101,
+    115,32,123,125,114,156,0,0,0,114,157,0,0,0,122,19,
     99,111,100,101,32,111,98,106,101,99,116,32,102,114,111,109,
     32,123,125,122,10,119,114,111,116,101,32,123,33,114,125,41,
-    19,114,236,0,0,0,114,132,0,0,0,114,124,0,0,0,
-    114,34,1,0,0,114,32,1,0,0,114,14,0,0,0,114,
-    37,1,0,0,114,40,0,0,0,114,190,0,0,0,114,153,
-    0,0,0,114,186,0,0,0,114,152,0,0,0,114,195,0,
-    0,0,114,42,1,0,0,114,7,0,0,0,218,19,100,111,
+    19,114,251,0,0,0,114,148,0,0,0,114,139,0,0,0,
+    114,48,1,0,0,114,46,1,0,0,114,24,0,0,0,114,
+    51,1,0,0,114,50,0,0,0,114,206,0,0,0,114,169,
+    0,0,0,114,202,0,0,0,114,168,0,0,0,114,211,0,
+    0,0,114,56,1,0,0,114,8,0,0,0,218,19,100,111,
     110,116,95,119,114,105,116,101,95,98,121,116,101,99,111,100,
-    101,114,198,0,0,0,114,31,0,0,0,114,36,1,0,0,
-    41,10,114,71,0,0,0,114,158,0,0,0,114,141,0,0,
-    0,114,188,0,0,0,114,140,0,0,0,218,2,115,116,114,
-    53,0,0,0,218,10,98,121,116,101,115,95,100,97,116,97,
-    114,201,0,0,0,90,11,99,111,100,101,95,111,98,106,101,
-    99,116,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
-    0,114,14,1,0,0,219,5,0,0,115,78,0,0,0,0,
+    101,114,214,0,0,0,114,41,0,0,0,114,50,1,0,0,
+    41,10,114,88,0,0,0,114,174,0,0,0,114,157,0,0,
+    0,114,204,0,0,0,114,156,0,0,0,218,2,115,116,114,
+    69,0,0,0,218,10,98,121,116,101,115,95,100,97,116,97,
+    114,217,0,0,0,90,11,99,111,100,101,95,111,98,106,101,
+    99,116,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,114,29,1,0,0,235,5,0,0,115,78,0,0,0,0,
     7,15,1,6,1,3,1,16,1,13,1,11,2,3,1,19,
     1,13,1,5,2,16,1,3,1,19,1,13,1,5,2,3,
     1,9,1,12,1,13,1,19,1,5,2,9,1,7,1,15,
     1,6,1,7,1,15,1,18,1,13,1,22,1,12,1,9,
     1,15,1,3,1,19,1,17,1,13,1,8,1,122,21,83,
     111,117,114,99,101,76,111,97,100,101,114,46,103,101,116,95,
-    99,111,100,101,78,114,138,0,0,0,41,10,114,57,0,0,
-    0,114,56,0,0,0,114,58,0,0,0,114,33,1,0,0,
-    114,34,1,0,0,114,36,1,0,0,114,35,1,0,0,114,
-    15,1,0,0,114,42,1,0,0,114,14,1,0,0,114,4,
-    0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,0,
-    0,0,114,31,1,0,0,161,5,0,0,115,14,0,0,0,
-    12,2,12,8,12,13,12,10,12,7,12,10,18,8,114,31,
+    99,111,100,101,78,114,154,0,0,0,41,10,114,17,0,0,
+    0,114,74,0,0,0,114,75,0,0,0,114,47,1,0,0,
+    114,48,1,0,0,114,50,1,0,0,114,49,1,0,0,114,
+    30,1,0,0,114,56,1,0,0,114,29,1,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,
+    0,0,114,45,1,0,0,177,5,0,0,115,14,0,0,0,
+    12,2,12,8,12,13,12,10,12,7,12,10,18,8,114,45,
     1,0,0,99,0,0,0,0,0,0,0,0,0,0,0,0,
     4,0,0,0,0,0,0,0,115,88,0,0,0,101,0,0,
     90,1,0,100,0,0,90,2,0,100,1,0,90,3,0,100,
@@ -2701,10 +2726,10 @@ const unsigned char _Py_M__importlib[] = {
     32,110,97,109,101,32,97,110,100,32,116,104,101,32,112,97,
     116,104,32,116,111,32,116,104,101,32,102,105,108,101,32,102,
     111,117,110,100,32,98,121,32,116,104,101,10,32,32,32,32,
-    32,32,32,32,102,105,110,100,101,114,46,78,41,2,114,67,
-    0,0,0,114,35,0,0,0,41,3,114,71,0,0,0,114,
-    158,0,0,0,114,35,0,0,0,114,4,0,0,0,114,4,
-    0,0,0,114,5,0,0,0,114,72,0,0,0,20,6,0,
+    32,32,32,32,102,105,110,100,101,114,46,78,41,2,114,84,
+    0,0,0,114,45,0,0,0,41,3,114,88,0,0,0,114,
+    174,0,0,0,114,45,0,0,0,114,5,0,0,0,114,5,
+    0,0,0,114,6,0,0,0,114,89,0,0,0,36,6,0,
     0,115,4,0,0,0,0,3,9,1,122,19,70,105,108,101,
     76,111,97,100,101,114,46,95,95,105,110,105,116,95,95,99,
     2,0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,
@@ -2712,10 +2737,10 @@ const unsigned char _Py_M__importlib[] = {
     0,0,131,2,0,106,2,0,124,1,0,131,1,0,83,41,
     1,122,26,76,111,97,100,32,97,32,109,111,100,117,108,101,
     32,102,114,111,109,32,97,32,102,105,108,101,46,41,3,218,
-    5,115,117,112,101,114,114,46,1,0,0,114,5,1,0,0,
-    41,2,114,71,0,0,0,114,158,0,0,0,41,1,114,224,
-    0,0,0,114,4,0,0,0,114,5,0,0,0,114,5,1,
-    0,0,26,6,0,0,115,2,0,0,0,0,7,122,22,70,
+    5,115,117,112,101,114,114,60,1,0,0,114,20,1,0,0,
+    41,2,114,88,0,0,0,114,174,0,0,0,41,1,114,240,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,114,20,1,
+    0,0,42,6,0,0,115,2,0,0,0,0,7,122,22,70,
     105,108,101,76,111,97,100,101,114,46,108,111,97,100,95,109,
     111,100,117,108,101,99,2,0,0,0,0,0,0,0,2,0,
     0,0,1,0,0,0,67,0,0,0,115,7,0,0,0,124,
@@ -2723,9 +2748,9 @@ const unsigned char _Py_M__importlib[] = {
     32,116,104,101,32,112,97,116,104,32,116,111,32,116,104,101,
     32,115,111,117,114,99,101,32,102,105,108,101,32,97,115,32,
     102,111,117,110,100,32,98,121,32,116,104,101,32,102,105,110,
-    100,101,114,46,41,1,114,35,0,0,0,41,2,114,71,0,
-    0,0,114,158,0,0,0,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,114,236,0,0,0,35,6,0,0,115,
+    100,101,114,46,41,1,114,45,0,0,0,41,2,114,88,0,
+    0,0,114,174,0,0,0,114,5,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,114,251,0,0,0,51,6,0,0,115,
     2,0,0,0,0,3,122,23,70,105,108,101,76,111,97,100,
     101,114,46,103,101,116,95,102,105,108,101,110,97,109,101,99,
     2,0,0,0,0,0,0,0,3,0,0,0,8,0,0,0,
@@ -2735,18 +2760,18 @@ const unsigned char _Py_M__importlib[] = {
     0,83,41,3,122,39,82,101,116,117,114,110,32,116,104,101,
     32,100,97,116,97,32,102,114,111,109,32,112,97,116,104,32,
     97,115,32,114,97,119,32,98,121,116,101,115,46,218,1,114,
-    78,41,3,114,49,0,0,0,114,50,0,0,0,90,4,114,
-    101,97,100,41,3,114,71,0,0,0,114,35,0,0,0,114,
-    54,0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,114,37,1,0,0,40,6,0,0,115,4,0,0,
+    78,41,3,114,64,0,0,0,114,65,0,0,0,218,4,114,
+    101,97,100,41,3,114,88,0,0,0,114,45,0,0,0,114,
+    72,0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,114,51,1,0,0,56,6,0,0,115,4,0,0,
     0,0,2,21,1,122,19,70,105,108,101,76,111,97,100,101,
-    114,46,103,101,116,95,100,97,116,97,41,9,114,57,0,0,
-    0,114,56,0,0,0,114,58,0,0,0,114,59,0,0,0,
-    114,72,0,0,0,114,156,0,0,0,114,5,1,0,0,114,
-    236,0,0,0,114,37,1,0,0,114,4,0,0,0,114,4,
-    0,0,0,41,1,114,224,0,0,0,114,5,0,0,0,114,
-    46,1,0,0,15,6,0,0,115,10,0,0,0,12,3,6,
-    2,12,6,24,9,18,5,114,46,1,0,0,99,0,0,0,
+    114,46,103,101,116,95,100,97,116,97,41,9,114,17,0,0,
+    0,114,74,0,0,0,114,75,0,0,0,114,76,0,0,0,
+    114,89,0,0,0,114,172,0,0,0,114,20,1,0,0,114,
+    251,0,0,0,114,51,1,0,0,114,5,0,0,0,114,5,
+    0,0,0,41,1,114,240,0,0,0,114,6,0,0,0,114,
+    60,1,0,0,31,6,0,0,115,10,0,0,0,12,3,6,
+    2,12,6,24,9,18,5,114,60,1,0,0,99,0,0,0,
     0,0,0,0,0,0,0,0,0,4,0,0,0,64,0,0,
     0,115,64,0,0,0,101,0,0,90,1,0,100,0,0,90,
     2,0,100,1,0,90,3,0,100,2,0,100,3,0,132,0,
@@ -2763,26 +2788,26 @@ const unsigned char _Py_M__importlib[] = {
     105,2,0,124,2,0,106,1,0,100,1,0,54,124,2,0,
     106,2,0,100,2,0,54,83,41,3,122,33,82,101,116,117,
     114,110,32,116,104,101,32,109,101,116,97,100,97,116,97,32,
-    102,111,114,32,116,104,101,32,112,97,116,104,46,114,183,0,
-    0,0,114,184,0,0,0,41,3,114,39,0,0,0,218,8,
+    102,111,114,32,116,104,101,32,112,97,116,104,46,114,199,0,
+    0,0,114,200,0,0,0,41,3,114,49,0,0,0,218,8,
     115,116,95,109,116,105,109,101,90,7,115,116,95,115,105,122,
-    101,41,3,114,71,0,0,0,114,35,0,0,0,114,44,1,
-    0,0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
-    0,114,34,1,0,0,50,6,0,0,115,4,0,0,0,0,
+    101,41,3,114,88,0,0,0,114,45,0,0,0,114,58,1,
+    0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,114,48,1,0,0,66,6,0,0,115,4,0,0,0,0,
     2,12,1,122,27,83,111,117,114,99,101,70,105,108,101,76,
     111,97,100,101,114,46,112,97,116,104,95,115,116,97,116,115,
     99,4,0,0,0,0,0,0,0,5,0,0,0,5,0,0,
     0,67,0,0,0,115,34,0,0,0,116,0,0,124,1,0,
     131,1,0,125,4,0,124,0,0,106,1,0,124,2,0,124,
     3,0,100,1,0,124,4,0,131,2,1,83,41,2,78,218,
-    5,95,109,111,100,101,41,2,114,144,0,0,0,114,35,1,
-    0,0,41,5,114,71,0,0,0,114,141,0,0,0,114,140,
-    0,0,0,114,53,0,0,0,114,42,0,0,0,114,4,0,
-    0,0,114,4,0,0,0,114,5,0,0,0,114,36,1,0,
-    0,55,6,0,0,115,4,0,0,0,0,2,12,1,122,32,
+    5,95,109,111,100,101,41,2,114,160,0,0,0,114,49,1,
+    0,0,41,5,114,88,0,0,0,114,157,0,0,0,114,156,
+    0,0,0,114,69,0,0,0,114,52,0,0,0,114,5,0,
+    0,0,114,5,0,0,0,114,6,0,0,0,114,50,1,0,
+    0,71,6,0,0,115,4,0,0,0,0,2,12,1,122,32,
     83,111,117,114,99,101,70,105,108,101,76,111,97,100,101,114,
     46,95,99,97,99,104,101,95,98,121,116,101,99,111,100,101,
-    114,51,1,0,0,105,182,1,0,0,99,3,0,0,0,1,
+    114,66,1,0,0,105,182,1,0,0,99,3,0,0,0,1,
     0,0,0,9,0,0,0,18,0,0,0,67,0,0,0,115,
     53,1,0,0,116,0,0,124,1,0,131,1,0,92,2,0,
     125,4,0,125,5,0,103,0,0,125,6,0,120,54,0,124,
@@ -2808,25 +2833,25 @@ const unsigned char _Py_M__importlib[] = {
     32,97,32,102,105,108,101,46,122,27,99,111,117,108,100,32,
     110,111,116,32,99,114,101,97,116,101,32,123,33,114,125,58,
     32,123,33,114,125,78,122,12,99,114,101,97,116,101,100,32,
-    123,33,114,125,41,11,114,38,0,0,0,114,46,0,0,0,
-    114,223,0,0,0,114,33,0,0,0,114,28,0,0,0,114,
-    3,0,0,0,90,5,109,107,100,105,114,218,15,70,105,108,
-    101,69,120,105,115,116,115,69,114,114,111,114,114,40,0,0,
-    0,114,152,0,0,0,114,55,0,0,0,41,9,114,71,0,
-    0,0,114,35,0,0,0,114,53,0,0,0,114,51,1,0,
-    0,114,231,0,0,0,114,131,0,0,0,114,27,0,0,0,
-    114,23,0,0,0,114,38,1,0,0,114,4,0,0,0,114,
-    4,0,0,0,114,5,0,0,0,114,35,1,0,0,60,6,
+    123,33,114,125,41,11,114,48,0,0,0,114,56,0,0,0,
+    114,239,0,0,0,114,43,0,0,0,114,38,0,0,0,114,
+    3,0,0,0,218,5,109,107,100,105,114,218,15,70,105,108,
+    101,69,120,105,115,116,115,69,114,114,111,114,114,50,0,0,
+    0,114,168,0,0,0,114,73,0,0,0,41,9,114,88,0,
+    0,0,114,45,0,0,0,114,69,0,0,0,114,66,1,0,
+    0,114,247,0,0,0,114,147,0,0,0,114,37,0,0,0,
+    114,33,0,0,0,114,52,1,0,0,114,5,0,0,0,114,
+    5,0,0,0,114,6,0,0,0,114,49,1,0,0,76,6,
     0,0,115,38,0,0,0,0,2,18,1,6,2,22,1,18,
     1,17,2,19,1,15,1,3,1,17,1,13,2,7,1,18,
     3,16,1,27,1,3,1,16,1,17,1,18,2,122,25,83,
     111,117,114,99,101,70,105,108,101,76,111,97,100,101,114,46,
-    115,101,116,95,100,97,116,97,78,41,7,114,57,0,0,0,
-    114,56,0,0,0,114,58,0,0,0,114,59,0,0,0,114,
-    34,1,0,0,114,36,1,0,0,114,35,1,0,0,114,4,
-    0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,0,
-    0,0,114,49,1,0,0,46,6,0,0,115,8,0,0,0,
-    12,2,6,2,12,5,12,5,114,49,1,0,0,99,0,0,
+    115,101,116,95,100,97,116,97,78,41,7,114,17,0,0,0,
+    114,74,0,0,0,114,75,0,0,0,114,76,0,0,0,114,
+    48,1,0,0,114,50,1,0,0,114,49,1,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,
+    0,0,114,64,1,0,0,62,6,0,0,115,8,0,0,0,
+    12,2,6,2,12,5,12,5,114,64,1,0,0,99,0,0,
     0,0,0,0,0,0,0,0,0,0,2,0,0,0,64,0,
     0,0,115,46,0,0,0,101,0,0,90,1,0,100,0,0,
     90,2,0,100,1,0,90,3,0,100,2,0,100,3,0,132,
@@ -2842,12 +2867,12 @@ const unsigned char _Py_M__importlib[] = {
     0,125,3,0,116,2,0,124,3,0,100,1,0,124,1,0,
     100,2,0,124,2,0,131,1,2,125,4,0,116,3,0,124,
     4,0,100,1,0,124,1,0,100,3,0,124,2,0,131,1,
-    2,83,41,4,78,114,67,0,0,0,114,35,0,0,0,114,
-    140,0,0,0,41,4,114,236,0,0,0,114,37,1,0,0,
-    114,190,0,0,0,114,195,0,0,0,41,5,114,71,0,0,
-    0,114,158,0,0,0,114,35,0,0,0,114,53,0,0,0,
-    114,45,1,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,114,14,1,0,0,93,6,0,0,115,8,0,
+    2,83,41,4,78,114,84,0,0,0,114,45,0,0,0,114,
+    156,0,0,0,41,4,114,251,0,0,0,114,51,1,0,0,
+    114,206,0,0,0,114,211,0,0,0,41,5,114,88,0,0,
+    0,114,174,0,0,0,114,45,0,0,0,114,69,0,0,0,
+    114,59,1,0,0,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,114,29,1,0,0,109,6,0,0,115,8,0,
     0,0,0,1,15,1,15,1,24,1,122,29,83,111,117,114,
     99,101,108,101,115,115,70,105,108,101,76,111,97,100,101,114,
     46,103,101,116,95,99,111,100,101,99,2,0,0,0,0,0,
@@ -2855,16 +2880,16 @@ const unsigned char _Py_M__importlib[] = {
     0,0,0,100,1,0,83,41,2,122,39,82,101,116,117,114,
     110,32,78,111,110,101,32,97,115,32,116,104,101,114,101,32,
     105,115,32,110,111,32,115,111,117,114,99,101,32,99,111,100,
-    101,46,78,114,4,0,0,0,41,2,114,71,0,0,0,114,
-    158,0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,114,15,1,0,0,99,6,0,0,115,2,0,0,
+    101,46,78,114,5,0,0,0,41,2,114,88,0,0,0,114,
+    174,0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,114,30,1,0,0,115,6,0,0,115,2,0,0,
     0,0,2,122,31,83,111,117,114,99,101,108,101,115,115,70,
     105,108,101,76,111,97,100,101,114,46,103,101,116,95,115,111,
-    117,114,99,101,78,41,6,114,57,0,0,0,114,56,0,0,
-    0,114,58,0,0,0,114,59,0,0,0,114,14,1,0,0,
-    114,15,1,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    4,0,0,0,114,5,0,0,0,114,53,1,0,0,89,6,
-    0,0,115,6,0,0,0,12,2,6,2,12,6,114,53,1,
+    117,114,99,101,78,41,6,114,17,0,0,0,114,74,0,0,
+    0,114,75,0,0,0,114,76,0,0,0,114,29,1,0,0,
+    114,30,1,0,0,114,5,0,0,0,114,5,0,0,0,114,
+    5,0,0,0,114,6,0,0,0,114,69,1,0,0,105,6,
+    0,0,115,6,0,0,0,12,2,6,2,12,6,114,69,1,
     0,0,99,0,0,0,0,0,0,0,0,0,0,0,0,3,
     0,0,0,64,0,0,0,115,106,0,0,0,101,0,0,90,
     1,0,100,0,0,90,2,0,100,1,0,90,3,0,100,2,
@@ -2884,10 +2909,10 @@ const unsigned char _Py_M__importlib[] = {
     0,0,0,0,0,3,0,0,0,2,0,0,0,67,0,0,
     0,115,22,0,0,0,124,1,0,124,0,0,95,0,0,124,
     2,0,124,0,0,95,1,0,100,0,0,83,41,1,78,41,
-    2,114,67,0,0,0,114,35,0,0,0,41,3,114,71,0,
-    0,0,114,67,0,0,0,114,35,0,0,0,114,4,0,0,
-    0,114,4,0,0,0,114,5,0,0,0,114,72,0,0,0,
-    116,6,0,0,115,4,0,0,0,0,1,9,1,122,28,69,
+    2,114,84,0,0,0,114,45,0,0,0,41,3,114,88,0,
+    0,0,114,84,0,0,0,114,45,0,0,0,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,114,89,0,0,0,
+    132,6,0,0,115,4,0,0,0,0,1,9,1,122,28,69,
     120,116,101,110,115,105,111,110,70,105,108,101,76,111,97,100,
     101,114,46,95,95,105,110,105,116,95,95,99,2,0,0,0,
     0,0,0,0,4,0,0,0,11,0,0,0,67,0,0,0,
@@ -2906,16 +2931,16 @@ const unsigned char _Py_M__importlib[] = {
     76,111,97,100,32,97,110,32,101,120,116,101,110,115,105,111,
     110,32,109,111,100,117,108,101,46,78,122,33,101,120,116,101,
     110,115,105,111,110,32,109,111,100,117,108,101,32,108,111,97,
-    100,101,100,32,102,114,111,109,32,123,33,114,125,114,244,0,
-    0,0,114,84,0,0,0,114,116,0,0,0,41,14,114,69,
-    0,0,0,114,114,0,0,0,114,106,0,0,0,90,12,108,
-    111,97,100,95,100,121,110,97,109,105,99,114,35,0,0,0,
-    114,152,0,0,0,114,219,0,0,0,114,60,0,0,0,114,
-    38,0,0,0,114,244,0,0,0,114,204,0,0,0,114,57,
-    0,0,0,114,251,0,0,0,114,32,0,0,0,41,4,114,
-    71,0,0,0,114,158,0,0,0,114,179,0,0,0,114,219,
-    0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,0,
-    0,0,114,5,1,0,0,120,6,0,0,115,24,0,0,0,
+    100,101,100,32,102,114,111,109,32,123,33,114,125,114,3,1,
+    0,0,114,101,0,0,0,114,132,0,0,0,41,14,114,86,
+    0,0,0,114,130,0,0,0,114,122,0,0,0,90,12,108,
+    111,97,100,95,100,121,110,97,109,105,99,114,45,0,0,0,
+    114,168,0,0,0,114,235,0,0,0,114,77,0,0,0,114,
+    48,0,0,0,114,3,1,0,0,114,220,0,0,0,114,17,
+    0,0,0,114,10,1,0,0,114,42,0,0,0,41,4,114,
+    88,0,0,0,114,174,0,0,0,114,195,0,0,0,114,235,
+    0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,
+    0,0,114,20,1,0,0,136,6,0,0,115,24,0,0,0,
     0,3,13,1,9,1,21,1,16,1,15,1,22,1,28,1,
     9,1,12,1,6,1,28,1,122,31,69,120,116,101,110,115,
     105,111,110,70,105,108,101,76,111,97,100,101,114,46,108,111,
@@ -2927,23 +2952,23 @@ const unsigned char _Py_M__importlib[] = {
     1,0,83,41,4,122,49,82,101,116,117,114,110,32,84,114,
     117,101,32,105,102,32,116,104,101,32,101,120,116,101,110,115,
     105,111,110,32,109,111,100,117,108,101,32,105,115,32,97,32,
-    112,97,99,107,97,103,101,46,114,29,0,0,0,99,1,0,
+    112,97,99,107,97,103,101,46,114,39,0,0,0,99,1,0,
     0,0,0,0,0,0,2,0,0,0,4,0,0,0,51,0,
     0,0,115,31,0,0,0,124,0,0,93,21,0,125,1,0,
     136,0,0,100,0,0,124,1,0,23,107,2,0,86,1,113,
-    3,0,100,1,0,83,41,2,114,72,0,0,0,78,114,4,
-    0,0,0,41,2,114,22,0,0,0,218,6,115,117,102,102,
+    3,0,100,1,0,83,41,2,114,89,0,0,0,78,114,5,
+    0,0,0,41,2,114,32,0,0,0,218,6,115,117,102,102,
     105,120,41,1,218,9,102,105,108,101,95,110,97,109,101,114,
-    4,0,0,0,114,5,0,0,0,114,77,0,0,0,139,6,
+    5,0,0,0,114,6,0,0,0,114,94,0,0,0,155,6,
     0,0,115,2,0,0,0,6,1,122,49,69,120,116,101,110,
     115,105,111,110,70,105,108,101,76,111,97,100,101,114,46,105,
     115,95,112,97,99,107,97,103,101,46,60,108,111,99,97,108,
-    115,62,46,60,103,101,110,101,120,112,114,62,41,4,114,38,
-    0,0,0,114,35,0,0,0,114,78,0,0,0,218,18,69,
+    115,62,46,60,103,101,110,101,120,112,114,62,41,4,114,48,
+    0,0,0,114,45,0,0,0,114,95,0,0,0,218,18,69,
     88,84,69,78,83,73,79,78,95,83,85,70,70,73,88,69,
-    83,41,2,114,71,0,0,0,114,158,0,0,0,114,4,0,
-    0,0,41,1,114,56,1,0,0,114,5,0,0,0,114,219,
-    0,0,0,136,6,0,0,115,6,0,0,0,0,2,19,1,
+    83,41,2,114,88,0,0,0,114,174,0,0,0,114,5,0,
+    0,0,41,1,114,72,1,0,0,114,6,0,0,0,114,235,
+    0,0,0,152,6,0,0,115,6,0,0,0,0,2,19,1,
     18,1,122,30,69,120,116,101,110,115,105,111,110,70,105,108,
     101,76,111,97,100,101,114,46,105,115,95,112,97,99,107,97,
     103,101,99,2,0,0,0,0,0,0,0,2,0,0,0,1,
@@ -2952,9 +2977,9 @@ const unsigned char _Py_M__importlib[] = {
     97,115,32,97,110,32,101,120,116,101,110,115,105,111,110,32,
     109,111,100,117,108,101,32,99,97,110,110,111,116,32,99,114,
     101,97,116,101,32,97,32,99,111,100,101,32,111,98,106,101,
-    99,116,46,78,114,4,0,0,0,41,2,114,71,0,0,0,
-    114,158,0,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,114,14,1,0,0,142,6,0,0,115,2,0,
+    99,116,46,78,114,5,0,0,0,41,2,114,88,0,0,0,
+    114,174,0,0,0,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,114,29,1,0,0,158,6,0,0,115,2,0,
     0,0,0,2,122,28,69,120,116,101,110,115,105,111,110,70,
     105,108,101,76,111,97,100,101,114,46,103,101,116,95,99,111,
     100,101,99,2,0,0,0,0,0,0,0,2,0,0,0,1,
@@ -2962,9 +2987,9 @@ const unsigned char _Py_M__importlib[] = {
     41,2,122,53,82,101,116,117,114,110,32,78,111,110,101,32,
     97,115,32,101,120,116,101,110,115,105,111,110,32,109,111,100,
     117,108,101,115,32,104,97,118,101,32,110,111,32,115,111,117,
-    114,99,101,32,99,111,100,101,46,78,114,4,0,0,0,41,
-    2,114,71,0,0,0,114,158,0,0,0,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,114,15,1,0,0,146,
+    114,99,101,32,99,111,100,101,46,78,114,5,0,0,0,41,
+    2,114,88,0,0,0,114,174,0,0,0,114,5,0,0,0,
+    114,5,0,0,0,114,6,0,0,0,114,30,1,0,0,162,
     6,0,0,115,2,0,0,0,0,2,122,30,69,120,116,101,
     110,115,105,111,110,70,105,108,101,76,111,97,100,101,114,46,
     103,101,116,95,115,111,117,114,99,101,99,2,0,0,0,0,
@@ -2973,19 +2998,19 @@ const unsigned char _Py_M__importlib[] = {
     101,116,117,114,110,32,116,104,101,32,112,97,116,104,32,116,
     111,32,116,104,101,32,115,111,117,114,99,101,32,102,105,108,
     101,32,97,115,32,102,111,117,110,100,32,98,121,32,116,104,
-    101,32,102,105,110,100,101,114,46,41,1,114,35,0,0,0,
-    41,2,114,71,0,0,0,114,158,0,0,0,114,4,0,0,
-    0,114,4,0,0,0,114,5,0,0,0,114,236,0,0,0,
-    150,6,0,0,115,2,0,0,0,0,3,122,32,69,120,116,
+    101,32,102,105,110,100,101,114,46,41,1,114,45,0,0,0,
+    41,2,114,88,0,0,0,114,174,0,0,0,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,114,251,0,0,0,
+    166,6,0,0,115,2,0,0,0,0,3,122,32,69,120,116,
     101,110,115,105,111,110,70,105,108,101,76,111,97,100,101,114,
     46,103,101,116,95,102,105,108,101,110,97,109,101,78,41,11,
-    114,57,0,0,0,114,56,0,0,0,114,58,0,0,0,114,
-    59,0,0,0,114,72,0,0,0,114,156,0,0,0,114,5,
-    1,0,0,114,219,0,0,0,114,14,1,0,0,114,15,1,
-    0,0,114,236,0,0,0,114,4,0,0,0,114,4,0,0,
-    0,114,4,0,0,0,114,5,0,0,0,114,54,1,0,0,
-    108,6,0,0,115,14,0,0,0,12,6,6,2,12,4,18,
-    16,12,6,12,4,12,4,114,54,1,0,0,99,0,0,0,
+    114,17,0,0,0,114,74,0,0,0,114,75,0,0,0,114,
+    76,0,0,0,114,89,0,0,0,114,172,0,0,0,114,20,
+    1,0,0,114,235,0,0,0,114,29,1,0,0,114,30,1,
+    0,0,114,251,0,0,0,114,5,0,0,0,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,114,70,1,0,0,
+    124,6,0,0,115,14,0,0,0,12,6,6,2,12,4,18,
+    16,12,6,12,4,12,4,114,70,1,0,0,99,0,0,0,
     0,0,0,0,0,0,0,0,0,2,0,0,0,64,0,0,
     0,115,130,0,0,0,101,0,0,90,1,0,100,0,0,90,
     2,0,100,1,0,90,3,0,100,2,0,100,3,0,132,0,
@@ -3020,14 +3045,14 @@ const unsigned char _Py_M__importlib[] = {
     1,0,124,0,0,95,0,0,124,2,0,124,0,0,95,1,
     0,116,2,0,124,0,0,106,3,0,131,0,0,131,1,0,
     124,0,0,95,4,0,124,3,0,124,0,0,95,5,0,100,
-    0,0,83,41,1,78,41,6,114,70,0,0,0,114,254,0,
-    0,0,114,229,0,0,0,218,16,95,103,101,116,95,112,97,
+    0,0,83,41,1,78,41,6,114,87,0,0,0,114,13,1,
+    0,0,114,245,0,0,0,218,16,95,103,101,116,95,112,97,
     114,101,110,116,95,112,97,116,104,218,17,95,108,97,115,116,
     95,112,97,114,101,110,116,95,112,97,116,104,218,12,95,112,
-    97,116,104,95,102,105,110,100,101,114,41,4,114,71,0,0,
-    0,114,67,0,0,0,114,35,0,0,0,218,11,112,97,116,
-    104,95,102,105,110,100,101,114,114,4,0,0,0,114,4,0,
-    0,0,114,5,0,0,0,114,72,0,0,0,163,6,0,0,
+    97,116,104,95,102,105,110,100,101,114,41,4,114,88,0,0,
+    0,114,84,0,0,0,114,45,0,0,0,218,11,112,97,116,
+    104,95,102,105,110,100,101,114,114,5,0,0,0,114,5,0,
+    0,0,114,6,0,0,0,114,89,0,0,0,179,6,0,0,
     115,8,0,0,0,0,1,9,1,9,1,21,1,122,23,95,
     78,97,109,101,115,112,97,99,101,80,97,116,104,46,95,95,
     105,110,105,116,95,95,99,1,0,0,0,0,0,0,0,4,
@@ -3039,14 +3064,14 @@ const unsigned char _Py_M__importlib[] = {
     32,97,32,116,117,112,108,101,32,111,102,32,40,112,97,114,
     101,110,116,45,109,111,100,117,108,101,45,110,97,109,101,44,
     32,112,97,114,101,110,116,45,112,97,116,104,45,97,116,116,
-    114,45,110,97,109,101,41,114,116,0,0,0,114,30,0,0,
-    0,114,7,0,0,0,114,35,0,0,0,114,244,0,0,0,
+    114,45,110,97,109,101,41,114,132,0,0,0,114,40,0,0,
+    0,114,8,0,0,0,114,45,0,0,0,114,3,1,0,0,
     41,2,122,3,115,121,115,122,4,112,97,116,104,41,2,114,
-    70,0,0,0,114,32,0,0,0,41,4,114,71,0,0,0,
-    114,231,0,0,0,218,3,100,111,116,114,94,0,0,0,114,
-    4,0,0,0,114,4,0,0,0,114,5,0,0,0,218,23,
+    87,0,0,0,114,42,0,0,0,41,4,114,88,0,0,0,
+    114,247,0,0,0,218,3,100,111,116,114,110,0,0,0,114,
+    5,0,0,0,114,5,0,0,0,114,6,0,0,0,218,23,
     95,102,105,110,100,95,112,97,114,101,110,116,95,112,97,116,
-    104,95,110,97,109,101,115,169,6,0,0,115,8,0,0,0,
+    104,95,110,97,109,101,115,185,6,0,0,115,8,0,0,0,
     0,2,27,1,12,2,4,3,122,38,95,78,97,109,101,115,
     112,97,99,101,80,97,116,104,46,95,102,105,110,100,95,112,
     97,114,101,110,116,95,112,97,116,104,95,110,97,109,101,115,
@@ -3054,12 +3079,12 @@ const unsigned char _Py_M__importlib[] = {
     0,67,0,0,0,115,38,0,0,0,124,0,0,106,0,0,
     131,0,0,92,2,0,125,1,0,125,2,0,116,1,0,116,
     2,0,106,3,0,124,1,0,25,124,2,0,131,2,0,83,
-    41,1,78,41,4,114,64,1,0,0,114,62,0,0,0,114,
-    7,0,0,0,114,73,0,0,0,41,3,114,71,0,0,0,
+    41,1,78,41,4,114,80,1,0,0,114,79,0,0,0,114,
+    8,0,0,0,114,90,0,0,0,41,3,114,88,0,0,0,
     90,18,112,97,114,101,110,116,95,109,111,100,117,108,101,95,
     110,97,109,101,90,14,112,97,116,104,95,97,116,116,114,95,
-    110,97,109,101,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,114,59,1,0,0,179,6,0,0,115,4,0,0,
+    110,97,109,101,114,5,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,114,75,1,0,0,195,6,0,0,115,4,0,0,
     0,0,1,18,1,122,31,95,78,97,109,101,115,112,97,99,
     101,80,97,116,104,46,95,103,101,116,95,112,97,114,101,110,
     116,95,112,97,116,104,99,1,0,0,0,0,0,0,0,3,
@@ -3072,64 +3097,64 @@ const unsigned char _Py_M__importlib[] = {
     0,124,2,0,106,6,0,114,108,0,124,2,0,106,6,0,
     124,0,0,95,7,0,113,108,0,110,0,0,124,1,0,124,
     0,0,95,2,0,110,0,0,124,0,0,106,7,0,83,41,
-    1,78,41,8,114,229,0,0,0,114,59,1,0,0,114,60,
-    1,0,0,114,61,1,0,0,114,70,0,0,0,114,169,0,
-    0,0,114,220,0,0,0,114,254,0,0,0,41,3,114,71,
+    1,78,41,8,114,245,0,0,0,114,75,1,0,0,114,76,
+    1,0,0,114,77,1,0,0,114,87,0,0,0,114,185,0,
+    0,0,114,236,0,0,0,114,13,1,0,0,41,3,114,88,
     0,0,0,90,11,112,97,114,101,110,116,95,112,97,116,104,
-    114,177,0,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,218,12,95,114,101,99,97,108,99,117,108,97,
-    116,101,183,6,0,0,115,16,0,0,0,0,2,18,1,15,
+    114,193,0,0,0,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,218,12,95,114,101,99,97,108,99,117,108,97,
+    116,101,199,6,0,0,115,16,0,0,0,0,2,18,1,15,
     1,21,3,27,1,9,1,18,1,12,1,122,27,95,78,97,
     109,101,115,112,97,99,101,80,97,116,104,46,95,114,101,99,
     97,108,99,117,108,97,116,101,99,1,0,0,0,0,0,0,
     0,1,0,0,0,2,0,0,0,67,0,0,0,115,16,0,
     0,0,116,0,0,124,0,0,106,1,0,131,0,0,131,1,
-    0,83,41,1,78,41,2,218,4,105,116,101,114,114,65,1,
-    0,0,41,1,114,71,0,0,0,114,4,0,0,0,114,4,
-    0,0,0,114,5,0,0,0,218,8,95,95,105,116,101,114,
-    95,95,196,6,0,0,115,2,0,0,0,0,1,122,23,95,
+    0,83,41,1,78,41,2,218,4,105,116,101,114,114,81,1,
+    0,0,41,1,114,88,0,0,0,114,5,0,0,0,114,5,
+    0,0,0,114,6,0,0,0,218,8,95,95,105,116,101,114,
+    95,95,212,6,0,0,115,2,0,0,0,0,1,122,23,95,
     78,97,109,101,115,112,97,99,101,80,97,116,104,46,95,95,
     105,116,101,114,95,95,99,1,0,0,0,0,0,0,0,1,
     0,0,0,2,0,0,0,67,0,0,0,115,16,0,0,0,
     116,0,0,124,0,0,106,1,0,131,0,0,131,1,0,83,
-    41,1,78,41,2,114,31,0,0,0,114,65,1,0,0,41,
-    1,114,71,0,0,0,114,4,0,0,0,114,4,0,0,0,
-    114,5,0,0,0,218,7,95,95,108,101,110,95,95,199,6,
+    41,1,78,41,2,114,41,0,0,0,114,81,1,0,0,41,
+    1,114,88,0,0,0,114,5,0,0,0,114,5,0,0,0,
+    114,6,0,0,0,218,7,95,95,108,101,110,95,95,215,6,
     0,0,115,2,0,0,0,0,1,122,22,95,78,97,109,101,
     115,112,97,99,101,80,97,116,104,46,95,95,108,101,110,95,
     95,99,1,0,0,0,0,0,0,0,1,0,0,0,2,0,
     0,0,67,0,0,0,115,16,0,0,0,100,1,0,106,0,
     0,124,0,0,106,1,0,131,1,0,83,41,2,78,122,20,
     95,78,97,109,101,115,112,97,99,101,80,97,116,104,40,123,
-    33,114,125,41,41,2,114,47,0,0,0,114,254,0,0,0,
-    41,1,114,71,0,0,0,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,114,101,0,0,0,202,6,0,0,115,
+    33,114,125,41,41,2,114,58,0,0,0,114,13,1,0,0,
+    41,1,114,88,0,0,0,114,5,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,114,117,0,0,0,218,6,0,0,115,
     2,0,0,0,0,1,122,23,95,78,97,109,101,115,112,97,
     99,101,80,97,116,104,46,95,95,114,101,112,114,95,95,99,
     2,0,0,0,0,0,0,0,2,0,0,0,2,0,0,0,
     67,0,0,0,115,16,0,0,0,124,1,0,124,0,0,106,
-    0,0,131,0,0,107,6,0,83,41,1,78,41,1,114,65,
-    1,0,0,41,2,114,71,0,0,0,218,4,105,116,101,109,
-    114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,218,
-    12,95,95,99,111,110,116,97,105,110,115,95,95,205,6,0,
+    0,0,131,0,0,107,6,0,83,41,1,78,41,1,114,81,
+    1,0,0,41,2,114,88,0,0,0,218,4,105,116,101,109,
+    114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,218,
+    12,95,95,99,111,110,116,97,105,110,115,95,95,221,6,0,
     0,115,2,0,0,0,0,1,122,27,95,78,97,109,101,115,
     112,97,99,101,80,97,116,104,46,95,95,99,111,110,116,97,
     105,110,115,95,95,99,2,0,0,0,0,0,0,0,2,0,
     0,0,2,0,0,0,67,0,0,0,115,20,0,0,0,124,
     0,0,106,0,0,106,1,0,124,1,0,131,1,0,1,100,
-    0,0,83,41,1,78,41,2,114,254,0,0,0,114,223,0,
-    0,0,41,2,114,71,0,0,0,114,69,1,0,0,114,4,
-    0,0,0,114,4,0,0,0,114,5,0,0,0,114,223,0,
-    0,0,208,6,0,0,115,2,0,0,0,0,1,122,21,95,
+    0,0,83,41,1,78,41,2,114,13,1,0,0,114,239,0,
+    0,0,41,2,114,88,0,0,0,114,85,1,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,114,239,0,
+    0,0,224,6,0,0,115,2,0,0,0,0,1,122,21,95,
     78,97,109,101,115,112,97,99,101,80,97,116,104,46,97,112,
-    112,101,110,100,78,41,13,114,57,0,0,0,114,56,0,0,
-    0,114,58,0,0,0,114,59,0,0,0,114,72,0,0,0,
-    114,64,1,0,0,114,59,1,0,0,114,65,1,0,0,114,
-    67,1,0,0,114,68,1,0,0,114,101,0,0,0,114,70,
-    1,0,0,114,223,0,0,0,114,4,0,0,0,114,4,0,
-    0,0,114,4,0,0,0,114,5,0,0,0,114,58,1,0,
-    0,156,6,0,0,115,20,0,0,0,12,5,6,2,12,6,
-    12,10,12,4,12,13,12,3,12,3,12,3,12,3,114,58,
+    112,101,110,100,78,41,13,114,17,0,0,0,114,74,0,0,
+    0,114,75,0,0,0,114,76,0,0,0,114,89,0,0,0,
+    114,80,1,0,0,114,75,1,0,0,114,81,1,0,0,114,
+    83,1,0,0,114,84,1,0,0,114,117,0,0,0,114,86,
+    1,0,0,114,239,0,0,0,114,5,0,0,0,114,5,0,
+    0,0,114,5,0,0,0,114,6,0,0,0,114,74,1,0,
+    0,172,6,0,0,115,20,0,0,0,12,5,6,2,12,6,
+    12,10,12,4,12,13,12,3,12,3,12,3,12,3,114,74,
     1,0,0,99,0,0,0,0,0,0,0,0,0,0,0,0,
     3,0,0,0,64,0,0,0,115,94,0,0,0,101,0,0,
     90,1,0,100,0,0,90,2,0,100,1,0,100,2,0,132,
@@ -3137,48 +3162,48 @@ const unsigned char _Py_M__importlib[] = {
     0,131,1,0,90,5,0,100,5,0,100,6,0,132,0,0,
     90,6,0,100,7,0,100,8,0,132,0,0,90,7,0,100,
     9,0,100,10,0,132,0,0,90,8,0,100,11,0,100,12,
-    0,132,0,0,90,9,0,100,13,0,83,41,14,114,252,0,
+    0,132,0,0,90,9,0,100,13,0,83,41,14,114,11,1,
     0,0,99,4,0,0,0,0,0,0,0,4,0,0,0,4,
     0,0,0,67,0,0,0,115,25,0,0,0,116,0,0,124,
     1,0,124,2,0,124,3,0,131,3,0,124,0,0,95,1,
-    0,100,0,0,83,41,1,78,41,2,114,58,1,0,0,114,
-    254,0,0,0,41,4,114,71,0,0,0,114,67,0,0,0,
-    114,35,0,0,0,114,62,1,0,0,114,4,0,0,0,114,
-    4,0,0,0,114,5,0,0,0,114,72,0,0,0,214,6,
+    0,100,0,0,83,41,1,78,41,2,114,74,1,0,0,114,
+    13,1,0,0,41,4,114,88,0,0,0,114,84,0,0,0,
+    114,45,0,0,0,114,78,1,0,0,114,5,0,0,0,114,
+    5,0,0,0,114,6,0,0,0,114,89,0,0,0,230,6,
     0,0,115,2,0,0,0,0,1,122,25,95,78,97,109,101,
     115,112,97,99,101,76,111,97,100,101,114,46,95,95,105,110,
     105,116,95,95,99,2,0,0,0,0,0,0,0,2,0,0,
     0,2,0,0,0,67,0,0,0,115,16,0,0,0,100,1,
     0,106,0,0,124,1,0,106,1,0,131,1,0,83,41,2,
     78,122,25,60,109,111,100,117,108,101,32,123,33,114,125,32,
-    40,110,97,109,101,115,112,97,99,101,41,62,41,2,114,47,
-    0,0,0,114,57,0,0,0,41,2,114,247,0,0,0,114,
-    179,0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,114,205,0,0,0,218,6,0,0,115,2,0,0,
+    40,110,97,109,101,115,112,97,99,101,41,62,41,2,114,58,
+    0,0,0,114,17,0,0,0,41,2,114,6,1,0,0,114,
+    195,0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,114,221,0,0,0,234,6,0,0,115,2,0,0,
     0,0,2,122,28,95,78,97,109,101,115,112,97,99,101,76,
     111,97,100,101,114,46,109,111,100,117,108,101,95,114,101,112,
     114,99,2,0,0,0,0,0,0,0,2,0,0,0,1,0,
     0,0,67,0,0,0,115,4,0,0,0,100,1,0,83,41,
-    2,78,84,114,4,0,0,0,41,2,114,71,0,0,0,114,
-    158,0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,
-    0,0,0,114,219,0,0,0,222,6,0,0,115,2,0,0,
+    2,78,84,114,5,0,0,0,41,2,114,88,0,0,0,114,
+    174,0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,114,235,0,0,0,238,6,0,0,115,2,0,0,
     0,0,1,122,27,95,78,97,109,101,115,112,97,99,101,76,
     111,97,100,101,114,46,105,115,95,112,97,99,107,97,103,101,
     99,2,0,0,0,0,0,0,0,2,0,0,0,1,0,0,
     0,67,0,0,0,115,4,0,0,0,100,1,0,83,41,2,
-    78,114,30,0,0,0,114,4,0,0,0,41,2,114,71,0,
-    0,0,114,158,0,0,0,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,114,15,1,0,0,225,6,0,0,115,
+    78,114,40,0,0,0,114,5,0,0,0,41,2,114,88,0,
+    0,0,114,174,0,0,0,114,5,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,114,30,1,0,0,241,6,0,0,115,
     2,0,0,0,0,1,122,27,95,78,97,109,101,115,112,97,
     99,101,76,111,97,100,101,114,46,103,101,116,95,115,111,117,
     114,99,101,99,2,0,0,0,0,0,0,0,2,0,0,0,
     6,0,0,0,67,0,0,0,115,22,0,0,0,116,0,0,
     100,1,0,100,2,0,100,3,0,100,4,0,100,5,0,131,
-    3,1,83,41,6,78,114,30,0,0,0,122,8,60,115,116,
-    114,105,110,103,62,114,175,0,0,0,114,40,1,0,0,84,
-    41,1,114,41,1,0,0,41,2,114,71,0,0,0,114,158,
-    0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,0,
-    0,0,114,14,1,0,0,228,6,0,0,115,2,0,0,0,
+    3,1,83,41,6,78,114,40,0,0,0,122,8,60,115,116,
+    114,105,110,103,62,114,191,0,0,0,114,54,1,0,0,84,
+    41,1,114,55,1,0,0,41,2,114,88,0,0,0,114,174,
+    0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,
+    0,0,114,29,1,0,0,244,6,0,0,115,2,0,0,0,
     0,1,122,25,95,78,97,109,101,115,112,97,99,101,76,111,
     97,100,101,114,46,103,101,116,95,99,111,100,101,99,2,0,
     0,0,0,0,0,0,2,0,0,0,3,0,0,0,67,0,
@@ -3188,19 +3213,19 @@ const unsigned char _Py_M__importlib[] = {
     97,109,101,115,112,97,99,101,32,109,111,100,117,108,101,46,
     122,38,110,97,109,101,115,112,97,99,101,32,109,111,100,117,
     108,101,32,108,111,97,100,101,100,32,119,105,116,104,32,112,
-    97,116,104,32,123,33,114,125,41,3,114,152,0,0,0,114,
-    254,0,0,0,114,180,0,0,0,41,2,114,71,0,0,0,
-    114,158,0,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,114,5,1,0,0,232,6,0,0,115,4,0,
+    97,116,104,32,123,33,114,125,41,3,114,168,0,0,0,114,
+    13,1,0,0,114,196,0,0,0,41,2,114,88,0,0,0,
+    114,174,0,0,0,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,114,20,1,0,0,248,6,0,0,115,4,0,
     0,0,0,2,16,1,122,28,95,78,97,109,101,115,112,97,
     99,101,76,111,97,100,101,114,46,108,111,97,100,95,109,111,
-    100,117,108,101,78,41,10,114,57,0,0,0,114,56,0,0,
-    0,114,58,0,0,0,114,72,0,0,0,114,9,1,0,0,
-    114,205,0,0,0,114,219,0,0,0,114,15,1,0,0,114,
-    14,1,0,0,114,5,1,0,0,114,4,0,0,0,114,4,
-    0,0,0,114,4,0,0,0,114,5,0,0,0,114,252,0,
-    0,0,213,6,0,0,115,12,0,0,0,12,1,12,4,18,
-    4,12,3,12,3,12,4,114,252,0,0,0,99,0,0,0,
+    100,117,108,101,78,41,10,114,17,0,0,0,114,74,0,0,
+    0,114,75,0,0,0,114,89,0,0,0,114,24,1,0,0,
+    114,221,0,0,0,114,235,0,0,0,114,30,1,0,0,114,
+    29,1,0,0,114,20,1,0,0,114,5,0,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,114,11,1,
+    0,0,229,6,0,0,115,12,0,0,0,12,1,12,4,18,
+    4,12,3,12,3,12,4,114,11,1,0,0,99,0,0,0,
     0,0,0,0,0,0,0,0,0,5,0,0,0,64,0,0,
     0,115,160,0,0,0,101,0,0,90,1,0,100,0,0,90,
     2,0,100,1,0,90,3,0,101,4,0,100,2,0,100,3,
@@ -3232,11 +3257,11 @@ const unsigned char _Py_M__importlib[] = {
     99,104,101,115,32,40,119,104,101,114,101,32,105,109,112,108,
     101,109,101,110,116,101,100,41,46,218,17,105,110,118,97,108,
     105,100,97,116,101,95,99,97,99,104,101,115,78,41,5,114,
-    7,0,0,0,218,19,112,97,116,104,95,105,109,112,111,114,
+    8,0,0,0,218,19,112,97,116,104,95,105,109,112,111,114,
     116,101,114,95,99,97,99,104,101,218,6,118,97,108,117,101,
-    115,114,60,0,0,0,114,72,1,0,0,41,2,114,247,0,
-    0,0,218,6,102,105,110,100,101,114,114,4,0,0,0,114,
-    4,0,0,0,114,5,0,0,0,114,72,1,0,0,244,6,
+    115,114,77,0,0,0,114,88,1,0,0,41,2,114,6,1,
+    0,0,218,6,102,105,110,100,101,114,114,5,0,0,0,114,
+    5,0,0,0,114,6,0,0,0,114,88,1,0,0,4,7,
     0,0,115,6,0,0,0,0,4,22,1,15,1,122,28,80,
     97,116,104,70,105,110,100,101,114,46,105,110,118,97,108,105,
     100,97,116,101,95,99,97,99,104,101,115,99,2,0,0,0,
@@ -3256,12 +3281,12 @@ const unsigned char _Py_M__importlib[] = {
     121,115,46,112,97,116,104,95,104,111,111,107,115,46,10,10,
     32,32,32,32,32,32,32,32,122,23,115,121,115,46,112,97,
     116,104,95,104,111,111,107,115,32,105,115,32,101,109,112,116,
-    121,78,41,6,114,7,0,0,0,218,10,112,97,116,104,95,
-    104,111,111,107,115,114,166,0,0,0,114,167,0,0,0,114,
-    168,0,0,0,114,153,0,0,0,41,3,114,247,0,0,0,
-    114,35,0,0,0,90,4,104,111,111,107,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,218,11,95,112,97,116,
-    104,95,104,111,111,107,115,252,6,0,0,115,16,0,0,0,
+    121,78,41,6,114,8,0,0,0,218,10,112,97,116,104,95,
+    104,111,111,107,115,114,182,0,0,0,114,183,0,0,0,114,
+    184,0,0,0,114,169,0,0,0,41,3,114,6,1,0,0,
+    114,45,0,0,0,90,4,104,111,111,107,114,5,0,0,0,
+    114,5,0,0,0,114,6,0,0,0,218,11,95,112,97,116,
+    104,95,104,111,111,107,115,12,7,0,0,115,16,0,0,0,
     0,7,9,1,19,1,16,1,3,1,14,1,13,1,12,2,
     122,22,80,97,116,104,70,105,110,100,101,114,46,95,112,97,
     116,104,95,104,111,111,107,115,99,2,0,0,0,0,0,0,
@@ -3285,13 +3310,13 @@ const unsigned char _Py_M__importlib[] = {
     97,99,104,101,32,105,116,46,32,73,102,32,110,111,32,102,
     105,110,100,101,114,32,105,115,32,97,118,97,105,108,97,98,
     108,101,44,32,115,116,111,114,101,32,78,111,110,101,46,10,
-    10,32,32,32,32,32,32,32,32,114,30,0,0,0,41,6,
-    114,3,0,0,0,114,45,0,0,0,114,7,0,0,0,114,
-    73,1,0,0,114,79,0,0,0,114,77,1,0,0,41,3,
-    114,247,0,0,0,114,35,0,0,0,114,75,1,0,0,114,
-    4,0,0,0,114,4,0,0,0,114,5,0,0,0,218,20,
+    10,32,32,32,32,32,32,32,32,114,40,0,0,0,41,6,
+    114,3,0,0,0,114,55,0,0,0,114,8,0,0,0,114,
+    89,1,0,0,114,96,0,0,0,114,93,1,0,0,41,3,
+    114,6,1,0,0,114,45,0,0,0,114,91,1,0,0,114,
+    5,0,0,0,114,5,0,0,0,114,6,0,0,0,218,20,
     95,112,97,116,104,95,105,109,112,111,114,116,101,114,95,99,
-    97,99,104,101,13,7,0,0,115,16,0,0,0,0,8,12,
+    97,99,104,101,29,7,0,0,115,16,0,0,0,0,8,12,
     1,15,1,3,1,17,1,13,1,15,1,18,1,122,31,80,
     97,116,104,70,105,110,100,101,114,46,95,112,97,116,104,95,
     105,109,112,111,114,116,101,114,95,99,97,99,104,101,99,3,
@@ -3303,14 +3328,14 @@ const unsigned char _Py_M__importlib[] = {
     0,125,4,0,124,3,0,100,0,0,107,9,0,114,85,0,
     116,3,0,124,1,0,124,3,0,131,2,0,83,116,4,0,
     124,1,0,100,0,0,131,2,0,125,5,0,124,4,0,124,
-    5,0,95,5,0,124,5,0,83,41,2,78,114,165,0,0,
-    0,41,6,114,60,0,0,0,114,165,0,0,0,114,13,1,
-    0,0,114,173,0,0,0,114,216,0,0,0,114,220,0,0,
-    0,41,6,114,247,0,0,0,114,158,0,0,0,114,75,1,
-    0,0,114,169,0,0,0,114,170,0,0,0,114,177,0,0,
-    0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,
+    5,0,95,5,0,124,5,0,83,41,2,78,114,181,0,0,
+    0,41,6,114,77,0,0,0,114,181,0,0,0,114,28,1,
+    0,0,114,189,0,0,0,114,232,0,0,0,114,236,0,0,
+    0,41,6,114,6,1,0,0,114,174,0,0,0,114,91,1,
+    0,0,114,185,0,0,0,114,186,0,0,0,114,193,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
     218,16,95,108,101,103,97,99,121,95,103,101,116,95,115,112,
-    101,99,30,7,0,0,115,18,0,0,0,0,2,15,1,24,
+    101,99,46,7,0,0,115,18,0,0,0,0,2,15,1,24,
     2,15,1,6,1,12,1,13,1,15,1,9,1,122,27,80,
     97,116,104,70,105,110,100,101,114,46,95,108,101,103,97,99,
     121,95,103,101,116,95,115,112,101,99,78,99,4,0,0,0,
@@ -3335,18 +3360,18 @@ const unsigned char _Py_M__importlib[] = {
     97,100,101,114,32,111,114,32,110,97,109,101,115,112,97,99,
     101,95,112,97,116,104,32,102,111,114,32,116,104,105,115,32,
     109,111,100,117,108,101,47,112,97,99,107,97,103,101,32,110,
-    97,109,101,46,78,114,12,1,0,0,122,19,115,112,101,99,
+    97,109,101,46,78,114,27,1,0,0,122,19,115,112,101,99,
     32,109,105,115,115,105,110,103,32,108,111,97,100,101,114,41,
-    12,114,192,0,0,0,218,3,115,116,114,218,5,98,121,116,
-    101,115,114,78,1,0,0,114,60,0,0,0,114,12,1,0,
-    0,114,79,1,0,0,114,169,0,0,0,114,220,0,0,0,
-    114,153,0,0,0,114,197,0,0,0,114,216,0,0,0,41,
-    9,114,247,0,0,0,114,158,0,0,0,114,35,0,0,0,
-    114,11,1,0,0,218,14,110,97,109,101,115,112,97,99,101,
-    95,112,97,116,104,90,5,101,110,116,114,121,114,75,1,0,
-    0,114,177,0,0,0,114,170,0,0,0,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,218,9,95,103,101,116,
-    95,115,112,101,99,43,7,0,0,115,40,0,0,0,0,5,
+    12,114,208,0,0,0,218,3,115,116,114,218,5,98,121,116,
+    101,115,114,94,1,0,0,114,77,0,0,0,114,27,1,0,
+    0,114,95,1,0,0,114,185,0,0,0,114,236,0,0,0,
+    114,169,0,0,0,114,213,0,0,0,114,232,0,0,0,41,
+    9,114,6,1,0,0,114,174,0,0,0,114,45,0,0,0,
+    114,26,1,0,0,218,14,110,97,109,101,115,112,97,99,101,
+    95,112,97,116,104,90,5,101,110,116,114,121,114,91,1,0,
+    0,114,193,0,0,0,114,186,0,0,0,114,5,0,0,0,
+    114,5,0,0,0,114,6,0,0,0,218,9,95,103,101,116,
+    95,115,112,101,99,59,7,0,0,115,40,0,0,0,0,5,
     6,1,13,1,21,1,6,1,15,1,12,1,15,1,21,2,
     18,1,12,1,6,1,15,1,4,1,9,1,12,1,15,5,
     20,2,15,1,9,1,122,20,80,97,116,104,70,105,110,100,
@@ -3368,13 +3393,13 @@ const unsigned char _Py_M__importlib[] = {
     95,104,111,111,107,115,32,97,110,100,10,32,32,32,32,32,
     32,32,32,115,121,115,46,112,97,116,104,95,105,109,112,111,
     114,116,101,114,95,99,97,99,104,101,46,78,90,9,110,97,
-    109,101,115,112,97,99,101,41,7,114,7,0,0,0,114,35,
-    0,0,0,114,83,1,0,0,114,169,0,0,0,114,220,0,
-    0,0,114,217,0,0,0,114,58,1,0,0,41,6,114,247,
-    0,0,0,114,158,0,0,0,114,35,0,0,0,114,11,1,
-    0,0,114,177,0,0,0,114,82,1,0,0,114,4,0,0,
-    0,114,4,0,0,0,114,5,0,0,0,114,12,1,0,0,
-    75,7,0,0,115,26,0,0,0,0,4,12,1,12,1,21,
+    109,101,115,112,97,99,101,41,7,114,8,0,0,0,114,45,
+    0,0,0,114,99,1,0,0,114,185,0,0,0,114,236,0,
+    0,0,114,233,0,0,0,114,74,1,0,0,41,6,114,6,
+    1,0,0,114,174,0,0,0,114,45,0,0,0,114,26,1,
+    0,0,114,193,0,0,0,114,98,1,0,0,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,114,27,1,0,0,
+    91,7,0,0,115,26,0,0,0,0,4,12,1,12,1,21,
     1,12,1,4,1,15,1,9,1,6,3,9,1,24,1,4,
     2,7,2,122,20,80,97,116,104,70,105,110,100,101,114,46,
     102,105,110,100,95,115,112,101,99,99,3,0,0,0,0,0,
@@ -3388,883 +3413,1070 @@ const unsigned char _Py_M__importlib[] = {
     121,115,46,112,97,116,104,95,104,111,111,107,115,32,97,110,
     100,10,32,32,32,32,32,32,32,32,115,121,115,46,112,97,
     116,104,95,105,109,112,111,114,116,101,114,95,99,97,99,104,
-    101,46,78,41,2,114,12,1,0,0,114,169,0,0,0,41,
-    4,114,247,0,0,0,114,158,0,0,0,114,35,0,0,0,
-    114,177,0,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,114,13,1,0,0,97,7,0,0,115,8,0,
+    101,46,78,41,2,114,27,1,0,0,114,185,0,0,0,41,
+    4,114,6,1,0,0,114,174,0,0,0,114,45,0,0,0,
+    114,193,0,0,0,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,114,28,1,0,0,113,7,0,0,115,8,0,
     0,0,0,5,18,1,12,1,4,1,122,22,80,97,116,104,
     70,105,110,100,101,114,46,102,105,110,100,95,109,111,100,117,
-    108,101,41,12,114,57,0,0,0,114,56,0,0,0,114,58,
-    0,0,0,114,59,0,0,0,114,9,1,0,0,114,72,1,
-    0,0,114,77,1,0,0,114,78,1,0,0,114,79,1,0,
-    0,114,83,1,0,0,114,12,1,0,0,114,13,1,0,0,
-    114,4,0,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,114,71,1,0,0,240,6,0,0,115,22,0,
+    108,101,41,12,114,17,0,0,0,114,74,0,0,0,114,75,
+    0,0,0,114,76,0,0,0,114,24,1,0,0,114,88,1,
+    0,0,114,93,1,0,0,114,94,1,0,0,114,95,1,0,
+    0,114,99,1,0,0,114,27,1,0,0,114,28,1,0,0,
+    114,5,0,0,0,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,114,87,1,0,0,0,7,0,0,115,22,0,
     0,0,12,2,6,2,18,8,18,17,18,17,18,13,3,1,
-    18,31,3,1,21,21,3,1,114,71,1,0,0,99,0,0,
+    18,31,3,1,21,21,3,1,114,87,1,0,0,99,0,0,
     0,0,0,0,0,0,0,0,0,0,3,0,0,0,64,0,
-    0,0,115,133,0,0,0,101,0,0,90,1,0,100,0,0,
+    0,0,115,190,0,0,0,101,0,0,90,1,0,100,0,0,
     90,2,0,100,1,0,90,3,0,100,2,0,100,3,0,132,
-    0,0,90,4,0,100,4,0,100,5,0,132,0,0,90,5,
-    0,101,6,0,90,7,0,100,6,0,100,7,0,132,0,0,
-    90,8,0,100,8,0,100,9,0,132,0,0,90,9,0,100,
-    10,0,100,11,0,100,12,0,132,1,0,90,10,0,100,13,
-    0,100,14,0,132,0,0,90,11,0,101,12,0,100,15,0,
-    100,16,0,132,0,0,131,1,0,90,13,0,100,17,0,100,
-    18,0,132,0,0,90,14,0,100,10,0,83,41,19,218,10,
-    70,105,108,101,70,105,110,100,101,114,122,172,70,105,108,101,
-    45,98,97,115,101,100,32,102,105,110,100,101,114,46,10,10,
-    32,32,32,32,73,110,116,101,114,97,99,116,105,111,110,115,
-    32,119,105,116,104,32,116,104,101,32,102,105,108,101,32,115,
-    121,115,116,101,109,32,97,114,101,32,99,97,99,104,101,100,
-    32,102,111,114,32,112,101,114,102,111,114,109,97,110,99,101,
-    44,32,98,101,105,110,103,10,32,32,32,32,114,101,102,114,
-    101,115,104,101,100,32,119,104,101,110,32,116,104,101,32,100,
-    105,114,101,99,116,111,114,121,32,116,104,101,32,102,105,110,
-    100,101,114,32,105,115,32,104,97,110,100,108,105,110,103,32,
-    104,97,115,32,98,101,101,110,32,109,111,100,105,102,105,101,
-    100,46,10,10,32,32,32,32,99,2,0,0,0,0,0,0,
-    0,5,0,0,0,5,0,0,0,7,0,0,0,115,122,0,
-    0,0,103,0,0,125,3,0,120,52,0,124,2,0,68,93,
-    44,0,92,2,0,137,0,0,125,4,0,124,3,0,106,0,
-    0,135,0,0,102,1,0,100,1,0,100,2,0,134,0,0,
-    124,4,0,68,131,1,0,131,1,0,1,113,13,0,87,124,
-    3,0,124,0,0,95,1,0,124,1,0,112,79,0,100,3,
-    0,124,0,0,95,2,0,100,6,0,124,0,0,95,3,0,
-    116,4,0,131,0,0,124,0,0,95,5,0,116,4,0,131,
-    0,0,124,0,0,95,6,0,100,5,0,83,41,7,122,154,
-    73,110,105,116,105,97,108,105,122,101,32,119,105,116,104,32,
-    116,104,101,32,112,97,116,104,32,116,111,32,115,101,97,114,
-    99,104,32,111,110,32,97,110,100,32,97,32,118,97,114,105,
-    97,98,108,101,32,110,117,109,98,101,114,32,111,102,10,32,
-    32,32,32,32,32,32,32,50,45,116,117,112,108,101,115,32,
-    99,111,110,116,97,105,110,105,110,103,32,116,104,101,32,108,
-    111,97,100,101,114,32,97,110,100,32,116,104,101,32,102,105,
-    108,101,32,115,117,102,102,105,120,101,115,32,116,104,101,32,
-    108,111,97,100,101,114,10,32,32,32,32,32,32,32,32,114,
-    101,99,111,103,110,105,122,101,115,46,99,1,0,0,0,0,
-    0,0,0,2,0,0,0,3,0,0,0,51,0,0,0,115,
-    27,0,0,0,124,0,0,93,17,0,125,1,0,124,1,0,
-    136,0,0,102,2,0,86,1,113,3,0,100,0,0,83,41,
-    1,78,114,4,0,0,0,41,2,114,22,0,0,0,114,55,
-    1,0,0,41,1,114,169,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,114,77,0,0,0,123,7,0,0,115,2,0,
-    0,0,6,0,122,38,70,105,108,101,70,105,110,100,101,114,
-    46,95,95,105,110,105,116,95,95,46,60,108,111,99,97,108,
-    115,62,46,60,103,101,110,101,120,112,114,62,114,116,0,0,
-    0,114,29,0,0,0,78,114,138,0,0,0,41,7,114,197,
-    0,0,0,218,8,95,108,111,97,100,101,114,115,114,35,0,
-    0,0,218,11,95,112,97,116,104,95,109,116,105,109,101,218,
-    3,115,101,116,218,11,95,112,97,116,104,95,99,97,99,104,
-    101,218,19,95,114,101,108,97,120,101,100,95,112,97,116,104,
-    95,99,97,99,104,101,41,5,114,71,0,0,0,114,35,0,
-    0,0,218,14,108,111,97,100,101,114,95,100,101,116,97,105,
-    108,115,90,7,108,111,97,100,101,114,115,114,127,0,0,0,
-    114,4,0,0,0,41,1,114,169,0,0,0,114,5,0,0,
-    0,114,72,0,0,0,117,7,0,0,115,16,0,0,0,0,
-    4,6,1,19,1,36,1,9,2,15,1,9,1,12,1,122,
-    19,70,105,108,101,70,105,110,100,101,114,46,95,95,105,110,
-    105,116,95,95,99,1,0,0,0,0,0,0,0,1,0,0,
-    0,2,0,0,0,67,0,0,0,115,13,0,0,0,100,3,
-    0,124,0,0,95,0,0,100,2,0,83,41,4,122,31,73,
-    110,118,97,108,105,100,97,116,101,32,116,104,101,32,100,105,
-    114,101,99,116,111,114,121,32,109,116,105,109,101,46,114,29,
-    0,0,0,78,114,138,0,0,0,41,1,114,86,1,0,0,
-    41,1,114,71,0,0,0,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,114,72,1,0,0,131,7,0,0,115,
-    2,0,0,0,0,2,122,28,70,105,108,101,70,105,110,100,
-    101,114,46,105,110,118,97,108,105,100,97,116,101,95,99,97,
-    99,104,101,115,99,2,0,0,0,0,0,0,0,3,0,0,
-    0,3,0,0,0,67,0,0,0,115,59,0,0,0,124,0,
-    0,106,0,0,124,1,0,131,1,0,125,2,0,124,2,0,
-    100,1,0,107,8,0,114,37,0,100,1,0,103,0,0,102,
-    2,0,83,124,2,0,106,1,0,124,2,0,106,2,0,112,
-    55,0,103,0,0,102,2,0,83,41,2,122,125,84,114,121,
-    32,116,111,32,102,105,110,100,32,97,32,108,111,97,100,101,
-    114,32,102,111,114,32,116,104,101,32,115,112,101,99,105,102,
-    105,101,100,32,109,111,100,117,108,101,44,32,111,114,32,116,
-    104,101,32,110,97,109,101,115,112,97,99,101,10,32,32,32,
-    32,32,32,32,32,112,97,99,107,97,103,101,32,112,111,114,
-    116,105,111,110,115,46,32,82,101,116,117,114,110,115,32,40,
-    108,111,97,100,101,114,44,32,108,105,115,116,45,111,102,45,
-    112,111,114,116,105,111,110,115,41,46,78,41,3,114,12,1,
-    0,0,114,169,0,0,0,114,220,0,0,0,41,3,114,71,
-    0,0,0,114,158,0,0,0,114,177,0,0,0,114,4,0,
-    0,0,114,4,0,0,0,114,5,0,0,0,114,165,0,0,
-    0,137,7,0,0,115,8,0,0,0,0,3,15,1,12,1,
-    10,1,122,22,70,105,108,101,70,105,110,100,101,114,46,102,
-    105,110,100,95,108,111,97,100,101,114,99,6,0,0,0,0,
-    0,0,0,8,0,0,0,13,0,0,0,67,0,0,0,115,
-    97,0,0,0,124,1,0,124,2,0,124,3,0,131,2,0,
-    125,6,0,121,13,0,124,6,0,106,0,0,125,7,0,87,
-    110,43,0,4,116,1,0,107,10,0,114,73,0,1,1,1,
-    116,2,0,124,2,0,124,3,0,100,1,0,124,6,0,100,
-    2,0,124,4,0,131,2,2,83,89,110,20,0,88,124,7,
-    0,124,2,0,124,3,0,124,4,0,124,5,0,131,4,0,
-    83,100,0,0,83,41,3,78,114,169,0,0,0,114,220,0,
-    0,0,41,3,114,83,1,0,0,114,209,0,0,0,114,237,
-    0,0,0,41,8,114,71,0,0,0,114,241,0,0,0,114,
-    158,0,0,0,114,35,0,0,0,114,220,0,0,0,114,11,
-    1,0,0,114,169,0,0,0,90,8,103,101,116,95,115,112,
-    101,99,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
-    0,114,83,1,0,0,145,7,0,0,115,14,0,0,0,0,
-    1,15,1,3,1,13,1,13,1,18,1,12,2,122,20,70,
-    105,108,101,70,105,110,100,101,114,46,95,103,101,116,95,115,
-    112,101,99,78,99,3,0,0,0,0,0,0,0,14,0,0,
-    0,15,0,0,0,67,0,0,0,115,240,1,0,0,100,1,
-    0,125,3,0,124,1,0,106,0,0,100,2,0,131,1,0,
-    100,3,0,25,125,4,0,121,34,0,116,1,0,124,0,0,
-    106,2,0,112,49,0,116,3,0,106,4,0,131,0,0,131,
-    1,0,106,5,0,125,5,0,87,110,24,0,4,116,6,0,
-    107,10,0,114,85,0,1,1,1,100,10,0,125,5,0,89,
-    110,1,0,88,124,5,0,124,0,0,106,7,0,107,3,0,
-    114,123,0,124,0,0,106,8,0,131,0,0,1,124,5,0,
-    124,0,0,95,7,0,110,0,0,116,9,0,131,0,0,114,
-    156,0,124,0,0,106,10,0,125,6,0,124,4,0,106,11,
-    0,131,0,0,125,7,0,110,15,0,124,0,0,106,12,0,
-    125,6,0,124,4,0,125,7,0,124,7,0,124,6,0,107,
-    6,0,114,51,1,116,13,0,124,0,0,106,2,0,124,4,
-    0,131,2,0,125,8,0,120,103,0,124,0,0,106,14,0,
-    68,93,77,0,92,2,0,125,9,0,125,10,0,100,5,0,
-    124,9,0,23,125,11,0,116,13,0,124,8,0,124,11,0,
-    131,2,0,125,12,0,116,15,0,124,12,0,131,1,0,114,
-    211,0,124,0,0,106,16,0,124,10,0,124,1,0,124,12,
-    0,124,8,0,103,1,0,124,2,0,131,5,0,83,113,211,
-    0,87,116,17,0,124,8,0,131,1,0,125,3,0,110,0,
-    0,120,126,0,124,0,0,106,14,0,68,93,115,0,92,2,
-    0,125,9,0,125,10,0,116,13,0,124,0,0,106,2,0,
-    124,4,0,124,9,0,23,131,2,0,125,12,0,116,18,0,
-    100,6,0,106,19,0,124,12,0,131,1,0,100,7,0,100,
-    3,0,131,1,1,1,124,7,0,124,9,0,23,124,6,0,
-    107,6,0,114,61,1,116,15,0,124,12,0,131,1,0,114,
-    176,1,124,0,0,106,16,0,124,10,0,124,1,0,124,12,
-    0,100,8,0,124,2,0,131,5,0,83,113,61,1,113,61,
-    1,87,124,3,0,114,236,1,116,18,0,100,9,0,106,19,
-    0,124,8,0,131,1,0,131,1,0,1,116,20,0,124,1,
-    0,100,8,0,131,2,0,125,13,0,124,8,0,103,1,0,
-    124,13,0,95,21,0,124,13,0,83,100,8,0,83,41,11,
-    122,125,84,114,121,32,116,111,32,102,105,110,100,32,97,32,
-    108,111,97,100,101,114,32,102,111,114,32,116,104,101,32,115,
-    112,101,99,105,102,105,101,100,32,109,111,100,117,108,101,44,
-    32,111,114,32,116,104,101,32,110,97,109,101,115,112,97,99,
-    101,10,32,32,32,32,32,32,32,32,112,97,99,107,97,103,
-    101,32,112,111,114,116,105,111,110,115,46,32,82,101,116,117,
-    114,110,115,32,40,108,111,97,100,101,114,44,32,108,105,115,
-    116,45,111,102,45,112,111,114,116,105,111,110,115,41,46,70,
-    114,116,0,0,0,114,115,0,0,0,114,29,0,0,0,114,
-    72,0,0,0,122,9,116,114,121,105,110,103,32,123,125,114,
-    145,0,0,0,78,122,25,112,111,115,115,105,98,108,101,32,
-    110,97,109,101,115,112,97,99,101,32,102,111,114,32,123,125,
-    114,138,0,0,0,41,22,114,32,0,0,0,114,39,0,0,
-    0,114,35,0,0,0,114,3,0,0,0,114,45,0,0,0,
-    114,50,1,0,0,114,40,0,0,0,114,86,1,0,0,218,
-    11,95,102,105,108,108,95,99,97,99,104,101,114,6,0,0,
-    0,114,89,1,0,0,114,139,0,0,0,114,88,1,0,0,
-    114,28,0,0,0,114,85,1,0,0,114,44,0,0,0,114,
-    83,1,0,0,114,46,0,0,0,114,152,0,0,0,114,47,
-    0,0,0,114,216,0,0,0,114,220,0,0,0,41,14,114,
-    71,0,0,0,114,158,0,0,0,114,11,1,0,0,90,12,
-    105,115,95,110,97,109,101,115,112,97,99,101,90,11,116,97,
-    105,108,95,109,111,100,117,108,101,114,183,0,0,0,90,5,
-    99,97,99,104,101,90,12,99,97,99,104,101,95,109,111,100,
-    117,108,101,90,9,98,97,115,101,95,112,97,116,104,114,55,
-    1,0,0,114,241,0,0,0,90,13,105,110,105,116,95,102,
-    105,108,101,110,97,109,101,90,9,102,117,108,108,95,112,97,
-    116,104,114,177,0,0,0,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,114,12,1,0,0,155,7,0,0,115,
-    68,0,0,0,0,3,6,1,19,1,3,1,34,1,13,1,
-    11,1,15,1,10,1,12,2,9,1,9,1,15,2,9,1,
-    6,2,12,1,18,1,22,1,10,1,15,1,12,1,32,4,
-    15,2,22,1,22,1,25,1,16,1,12,1,32,1,6,1,
-    19,1,15,1,12,1,4,1,122,20,70,105,108,101,70,105,
-    110,100,101,114,46,102,105,110,100,95,115,112,101,99,99,1,
-    0,0,0,0,0,0,0,9,0,0,0,13,0,0,0,67,
-    0,0,0,115,14,1,0,0,124,0,0,106,0,0,125,1,
-    0,121,31,0,116,1,0,106,2,0,124,1,0,112,33,0,
-    116,1,0,106,3,0,131,0,0,131,1,0,125,2,0,87,
-    110,33,0,4,116,4,0,116,5,0,116,6,0,102,3,0,
-    107,10,0,114,75,0,1,1,1,103,0,0,125,2,0,89,
-    110,1,0,88,116,7,0,106,8,0,106,9,0,100,1,0,
-    131,1,0,115,112,0,116,10,0,124,2,0,131,1,0,124,
-    0,0,95,11,0,110,111,0,116,10,0,131,0,0,125,3,
-    0,120,90,0,124,2,0,68,93,82,0,125,4,0,124,4,
-    0,106,12,0,100,2,0,131,1,0,92,3,0,125,5,0,
-    125,6,0,125,7,0,124,6,0,114,191,0,100,3,0,106,
-    13,0,124,5,0,124,7,0,106,14,0,131,0,0,131,2,
-    0,125,8,0,110,6,0,124,5,0,125,8,0,124,3,0,
-    106,15,0,124,8,0,131,1,0,1,113,128,0,87,124,3,
-    0,124,0,0,95,11,0,116,7,0,106,8,0,106,9,0,
-    116,16,0,131,1,0,114,10,1,100,4,0,100,5,0,132,
-    0,0,124,2,0,68,131,1,0,124,0,0,95,17,0,110,
-    0,0,100,6,0,83,41,7,122,68,70,105,108,108,32,116,
-    104,101,32,99,97,99,104,101,32,111,102,32,112,111,116,101,
-    110,116,105,97,108,32,109,111,100,117,108,101,115,32,97,110,
-    100,32,112,97,99,107,97,103,101,115,32,102,111,114,32,116,
-    104,105,115,32,100,105,114,101,99,116,111,114,121,46,114,0,
-    0,0,0,114,116,0,0,0,122,5,123,125,46,123,125,99,
-    1,0,0,0,0,0,0,0,2,0,0,0,3,0,0,0,
-    83,0,0,0,115,28,0,0,0,104,0,0,124,0,0,93,
-    18,0,125,1,0,124,1,0,106,0,0,131,0,0,146,2,
-    0,113,6,0,83,114,4,0,0,0,41,1,114,139,0,0,
-    0,41,2,114,22,0,0,0,90,2,102,110,114,4,0,0,
-    0,114,4,0,0,0,114,5,0,0,0,250,9,60,115,101,
-    116,99,111,109,112,62,229,7,0,0,115,2,0,0,0,9,
-    0,122,41,70,105,108,101,70,105,110,100,101,114,46,95,102,
-    105,108,108,95,99,97,99,104,101,46,60,108,111,99,97,108,
-    115,62,46,60,115,101,116,99,111,109,112,62,78,41,18,114,
-    35,0,0,0,114,3,0,0,0,90,7,108,105,115,116,100,
-    105,114,114,45,0,0,0,218,17,70,105,108,101,78,111,116,
-    70,111,117,110,100,69,114,114,111,114,218,15,80,101,114,109,
-    105,115,115,105,111,110,69,114,114,111,114,218,18,78,111,116,
-    65,68,105,114,101,99,116,111,114,121,69,114,114,111,114,114,
-    7,0,0,0,114,8,0,0,0,114,9,0,0,0,114,87,
-    1,0,0,114,88,1,0,0,114,121,0,0,0,114,47,0,
-    0,0,114,139,0,0,0,218,3,97,100,100,114,10,0,0,
-    0,114,89,1,0,0,41,9,114,71,0,0,0,114,35,0,
-    0,0,90,8,99,111,110,116,101,110,116,115,90,21,108,111,
-    119,101,114,95,115,117,102,102,105,120,95,99,111,110,116,101,
-    110,116,115,114,69,1,0,0,114,67,0,0,0,114,63,1,
-    0,0,114,55,1,0,0,90,8,110,101,119,95,110,97,109,
-    101,114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,
-    114,91,1,0,0,200,7,0,0,115,34,0,0,0,0,2,
-    9,1,3,1,31,1,22,3,11,3,18,1,18,7,9,1,
-    13,1,24,1,6,1,27,2,6,1,17,1,9,1,18,1,
-    122,22,70,105,108,101,70,105,110,100,101,114,46,95,102,105,
-    108,108,95,99,97,99,104,101,99,1,0,0,0,0,0,0,
-    0,3,0,0,0,3,0,0,0,7,0,0,0,115,25,0,
-    0,0,135,0,0,135,1,0,102,2,0,100,1,0,100,2,
-    0,134,0,0,125,2,0,124,2,0,83,41,3,97,20,1,
-    0,0,65,32,99,108,97,115,115,32,109,101,116,104,111,100,
-    32,119,104,105,99,104,32,114,101,116,117,114,110,115,32,97,
-    32,99,108,111,115,117,114,101,32,116,111,32,117,115,101,32,
-    111,110,32,115,121,115,46,112,97,116,104,95,104,111,111,107,
-    10,32,32,32,32,32,32,32,32,119,104,105,99,104,32,119,
-    105,108,108,32,114,101,116,117,114,110,32,97,110,32,105,110,
-    115,116,97,110,99,101,32,117,115,105,110,103,32,116,104,101,
-    32,115,112,101,99,105,102,105,101,100,32,108,111,97,100,101,
-    114,115,32,97,110,100,32,116,104,101,32,112,97,116,104,10,
-    32,32,32,32,32,32,32,32,99,97,108,108,101,100,32,111,
-    110,32,116,104,101,32,99,108,111,115,117,114,101,46,10,10,
-    32,32,32,32,32,32,32,32,73,102,32,116,104,101,32,112,
-    97,116,104,32,99,97,108,108,101,100,32,111,110,32,116,104,
-    101,32,99,108,111,115,117,114,101,32,105,115,32,110,111,116,
-    32,97,32,100,105,114,101,99,116,111,114,121,44,32,73,109,
-    112,111,114,116,69,114,114,111,114,32,105,115,10,32,32,32,
-    32,32,32,32,32,114,97,105,115,101,100,46,10,10,32,32,
-    32,32,32,32,32,32,99,1,0,0,0,0,0,0,0,1,
-    0,0,0,4,0,0,0,19,0,0,0,115,46,0,0,0,
-    116,0,0,124,0,0,131,1,0,115,33,0,116,1,0,100,
-    1,0,100,2,0,124,0,0,131,1,1,130,1,0,110,0,
-    0,136,0,0,124,0,0,136,1,0,140,1,0,83,41,3,
-    122,45,80,97,116,104,32,104,111,111,107,32,102,111,114,32,
-    105,109,112,111,114,116,108,105,98,46,109,97,99,104,105,110,
-    101,114,121,46,70,105,108,101,70,105,110,100,101,114,46,122,
-    30,111,110,108,121,32,100,105,114,101,99,116,111,114,105,101,
-    115,32,97,114,101,32,115,117,112,112,111,114,116,101,100,114,
-    35,0,0,0,41,2,114,46,0,0,0,114,153,0,0,0,
-    41,1,114,35,0,0,0,41,2,114,247,0,0,0,114,90,
-    1,0,0,114,4,0,0,0,114,5,0,0,0,218,24,112,
-    97,116,104,95,104,111,111,107,95,102,111,114,95,70,105,108,
-    101,70,105,110,100,101,114,241,7,0,0,115,6,0,0,0,
-    0,2,12,1,21,1,122,54,70,105,108,101,70,105,110,100,
-    101,114,46,112,97,116,104,95,104,111,111,107,46,60,108,111,
-    99,97,108,115,62,46,112,97,116,104,95,104,111,111,107,95,
-    102,111,114,95,70,105,108,101,70,105,110,100,101,114,114,4,
-    0,0,0,41,3,114,247,0,0,0,114,90,1,0,0,114,
-    97,1,0,0,114,4,0,0,0,41,2,114,247,0,0,0,
-    114,90,1,0,0,114,5,0,0,0,218,9,112,97,116,104,
-    95,104,111,111,107,231,7,0,0,115,4,0,0,0,0,10,
-    21,6,122,20,70,105,108,101,70,105,110,100,101,114,46,112,
-    97,116,104,95,104,111,111,107,99,1,0,0,0,0,0,0,
-    0,1,0,0,0,2,0,0,0,67,0,0,0,115,16,0,
-    0,0,100,1,0,106,0,0,124,0,0,106,1,0,131,1,
-    0,83,41,2,78,122,16,70,105,108,101,70,105,110,100,101,
-    114,40,123,33,114,125,41,41,2,114,47,0,0,0,114,35,
-    0,0,0,41,1,114,71,0,0,0,114,4,0,0,0,114,
-    4,0,0,0,114,5,0,0,0,114,101,0,0,0,249,7,
-    0,0,115,2,0,0,0,0,1,122,19,70,105,108,101,70,
-    105,110,100,101,114,46,95,95,114,101,112,114,95,95,41,15,
-    114,57,0,0,0,114,56,0,0,0,114,58,0,0,0,114,
-    59,0,0,0,114,72,0,0,0,114,72,1,0,0,114,172,
-    0,0,0,114,13,1,0,0,114,165,0,0,0,114,83,1,
-    0,0,114,12,1,0,0,114,91,1,0,0,114,9,1,0,
-    0,114,98,1,0,0,114,101,0,0,0,114,4,0,0,0,
-    114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,114,
-    84,1,0,0,108,7,0,0,115,20,0,0,0,12,7,6,
-    2,12,14,12,4,6,2,12,8,12,10,15,45,12,31,18,
-    18,114,84,1,0,0,99,0,0,0,0,0,0,0,0,0,
-    0,0,0,2,0,0,0,64,0,0,0,115,46,0,0,0,
-    101,0,0,90,1,0,100,0,0,90,2,0,100,1,0,90,
-    3,0,100,2,0,100,3,0,132,0,0,90,4,0,100,4,
-    0,100,5,0,132,0,0,90,5,0,100,6,0,83,41,7,
-    218,18,95,73,109,112,111,114,116,76,111,99,107,67,111,110,
-    116,101,120,116,122,36,67,111,110,116,101,120,116,32,109,97,
-    110,97,103,101,114,32,102,111,114,32,116,104,101,32,105,109,
-    112,111,114,116,32,108,111,99,107,46,99,1,0,0,0,0,
-    0,0,0,1,0,0,0,1,0,0,0,67,0,0,0,115,
-    14,0,0,0,116,0,0,106,1,0,131,0,0,1,100,1,
-    0,83,41,2,122,24,65,99,113,117,105,114,101,32,116,104,
-    101,32,105,109,112,111,114,116,32,108,111,99,107,46,78,41,
-    2,114,106,0,0,0,114,4,1,0,0,41,1,114,71,0,
-    0,0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
-    0,114,75,0,0,0,3,8,0,0,115,2,0,0,0,0,
-    2,122,28,95,73,109,112,111,114,116,76,111,99,107,67,111,
-    110,116,101,120,116,46,95,95,101,110,116,101,114,95,95,99,
-    4,0,0,0,0,0,0,0,4,0,0,0,1,0,0,0,
-    67,0,0,0,115,14,0,0,0,116,0,0,106,1,0,131,
-    0,0,1,100,1,0,83,41,2,122,60,82,101,108,101,97,
-    115,101,32,116,104,101,32,105,109,112,111,114,116,32,108,111,
-    99,107,32,114,101,103,97,114,100,108,101,115,115,32,111,102,
-    32,97,110,121,32,114,97,105,115,101,100,32,101,120,99,101,
-    112,116,105,111,110,115,46,78,41,2,114,106,0,0,0,114,
-    107,0,0,0,41,4,114,71,0,0,0,90,8,101,120,99,
-    95,116,121,112,101,90,9,101,120,99,95,118,97,108,117,101,
-    90,13,101,120,99,95,116,114,97,99,101,98,97,99,107,114,
-    4,0,0,0,114,4,0,0,0,114,5,0,0,0,114,81,
-    0,0,0,7,8,0,0,115,2,0,0,0,0,2,122,27,
-    95,73,109,112,111,114,116,76,111,99,107,67,111,110,116,101,
-    120,116,46,95,95,101,120,105,116,95,95,78,41,6,114,57,
-    0,0,0,114,56,0,0,0,114,58,0,0,0,114,59,0,
-    0,0,114,75,0,0,0,114,81,0,0,0,114,4,0,0,
-    0,114,4,0,0,0,114,4,0,0,0,114,5,0,0,0,
-    114,99,1,0,0,255,7,0,0,115,6,0,0,0,12,2,
-    6,2,12,4,114,99,1,0,0,99,3,0,0,0,0,0,
-    0,0,5,0,0,0,4,0,0,0,67,0,0,0,115,91,
-    0,0,0,124,1,0,106,0,0,100,1,0,124,2,0,100,
-    2,0,24,131,2,0,125,3,0,116,1,0,124,3,0,131,
-    1,0,124,2,0,107,0,0,114,55,0,116,2,0,100,3,
-    0,131,1,0,130,1,0,110,0,0,124,3,0,100,4,0,
-    25,125,4,0,124,0,0,114,87,0,100,5,0,106,3,0,
-    124,4,0,124,0,0,131,2,0,83,124,4,0,83,41,6,
-    122,50,82,101,115,111,108,118,101,32,97,32,114,101,108,97,
-    116,105,118,101,32,109,111,100,117,108,101,32,110,97,109,101,
-    32,116,111,32,97,110,32,97,98,115,111,108,117,116,101,32,
-    111,110,101,46,114,116,0,0,0,114,29,0,0,0,122,50,
-    97,116,116,101,109,112,116,101,100,32,114,101,108,97,116,105,
-    118,101,32,105,109,112,111,114,116,32,98,101,121,111,110,100,
-    32,116,111,112,45,108,101,118,101,108,32,112,97,99,107,97,
-    103,101,114,84,0,0,0,122,5,123,125,46,123,125,41,4,
-    114,34,0,0,0,114,31,0,0,0,114,133,0,0,0,114,
-    47,0,0,0,41,5,114,67,0,0,0,218,7,112,97,99,
-    107,97,103,101,218,5,108,101,118,101,108,90,4,98,105,116,
-    115,90,4,98,97,115,101,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,218,13,95,114,101,115,111,108,118,101,
-    95,110,97,109,101,12,8,0,0,115,10,0,0,0,0,2,
-    22,1,18,1,15,1,10,1,114,102,1,0,0,99,3,0,
-    0,0,0,0,0,0,10,0,0,0,27,0,0,0,67,0,
-    0,0,115,49,1,0,0,116,0,0,106,1,0,115,28,0,
-    116,2,0,106,3,0,100,1,0,116,4,0,131,2,0,1,
-    110,0,0,124,0,0,116,0,0,106,5,0,107,6,0,125,
-    3,0,120,255,0,116,0,0,106,1,0,68,93,240,0,125,
-    4,0,116,6,0,131,0,0,143,108,0,1,121,13,0,124,
-    4,0,106,7,0,125,5,0,87,110,69,0,4,116,8,0,
-    107,10,0,114,153,0,1,1,1,124,4,0,106,9,0,124,
-    0,0,124,1,0,131,2,0,125,6,0,124,6,0,100,2,
-    0,107,8,0,114,134,0,119,53,0,110,0,0,116,10,0,
-    124,0,0,124,6,0,131,2,0,125,7,0,89,110,19,0,
-    88,124,5,0,124,0,0,124,1,0,124,2,0,131,3,0,
-    125,7,0,87,100,2,0,81,88,124,7,0,100,2,0,107,
-    9,0,114,53,0,124,3,0,12,114,30,1,124,0,0,116,
-    0,0,106,5,0,107,6,0,114,30,1,116,0,0,106,5,
-    0,124,0,0,25,125,8,0,121,13,0,124,8,0,106,11,
-    0,125,9,0,87,110,22,0,4,116,8,0,107,10,0,114,
-    6,1,1,1,1,124,7,0,83,89,113,34,1,88,124,9,
-    0,100,2,0,107,8,0,114,23,1,124,7,0,83,124,9,
-    0,83,113,37,1,124,7,0,83,113,53,0,113,53,0,87,
-    100,2,0,83,100,2,0,83,41,3,122,23,70,105,110,100,
-    32,97,32,109,111,100,117,108,101,39,115,32,108,111,97,100,
-    101,114,46,122,22,115,121,115,46,109,101,116,97,95,112,97,
-    116,104,32,105,115,32,101,109,112,116,121,78,41,12,114,7,
-    0,0,0,218,9,109,101,116,97,95,112,97,116,104,114,166,
-    0,0,0,114,167,0,0,0,114,168,0,0,0,114,73,0,
-    0,0,114,99,1,0,0,114,12,1,0,0,114,209,0,0,
-    0,114,13,1,0,0,114,173,0,0,0,114,208,0,0,0,
-    41,10,114,67,0,0,0,114,35,0,0,0,114,11,1,0,
-    0,90,9,105,115,95,114,101,108,111,97,100,114,75,1,0,
-    0,114,12,1,0,0,114,169,0,0,0,114,177,0,0,0,
-    114,179,0,0,0,114,208,0,0,0,114,4,0,0,0,114,
-    4,0,0,0,114,5,0,0,0,114,246,0,0,0,21,8,
-    0,0,115,50,0,0,0,0,2,9,1,19,4,15,1,16,
-    1,10,1,3,1,13,1,13,1,18,1,12,1,6,1,20,
-    2,24,1,12,2,22,1,13,1,3,1,13,1,13,4,9,
-    2,12,1,4,2,7,2,11,2,114,246,0,0,0,99,3,
-    0,0,0,0,0,0,0,4,0,0,0,4,0,0,0,67,
-    0,0,0,115,194,0,0,0,116,0,0,124,0,0,116,1,
-    0,131,2,0,115,45,0,116,2,0,100,1,0,106,3,0,
-    116,4,0,124,0,0,131,1,0,131,1,0,131,1,0,130,
-    1,0,110,0,0,124,2,0,100,2,0,107,0,0,114,72,
-    0,116,5,0,100,3,0,131,1,0,130,1,0,110,0,0,
-    124,1,0,114,156,0,116,0,0,124,1,0,116,1,0,131,
-    2,0,115,108,0,116,2,0,100,4,0,131,1,0,130,1,
-    0,113,156,0,124,1,0,116,6,0,106,7,0,107,7,0,
-    114,156,0,100,5,0,125,3,0,116,8,0,124,3,0,106,
-    3,0,124,1,0,131,1,0,131,1,0,130,1,0,113,156,
-    0,110,0,0,124,0,0,12,114,190,0,124,2,0,100,2,
-    0,107,2,0,114,190,0,116,5,0,100,6,0,131,1,0,
-    130,1,0,110,0,0,100,7,0,83,41,8,122,28,86,101,
-    114,105,102,121,32,97,114,103,117,109,101,110,116,115,32,97,
-    114,101,32,34,115,97,110,101,34,46,122,31,109,111,100,117,
-    108,101,32,110,97,109,101,32,109,117,115,116,32,98,101,32,
-    115,116,114,44,32,110,111,116,32,123,125,114,84,0,0,0,
-    122,18,108,101,118,101,108,32,109,117,115,116,32,98,101,32,
-    62,61,32,48,122,31,95,95,112,97,99,107,97,103,101,95,
-    95,32,110,111,116,32,115,101,116,32,116,111,32,97,32,115,
-    116,114,105,110,103,122,61,80,97,114,101,110,116,32,109,111,
-    100,117,108,101,32,123,33,114,125,32,110,111,116,32,108,111,
-    97,100,101,100,44,32,99,97,110,110,111,116,32,112,101,114,
-    102,111,114,109,32,114,101,108,97,116,105,118,101,32,105,109,
-    112,111,114,116,122,17,69,109,112,116,121,32,109,111,100,117,
-    108,101,32,110,97,109,101,78,41,9,114,192,0,0,0,114,
-    80,1,0,0,218,9,84,121,112,101,69,114,114,111,114,114,
-    47,0,0,0,114,66,0,0,0,114,133,0,0,0,114,7,
-    0,0,0,114,73,0,0,0,218,11,83,121,115,116,101,109,
-    69,114,114,111,114,41,4,114,67,0,0,0,114,100,1,0,
-    0,114,101,1,0,0,114,171,0,0,0,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,218,13,95,115,97,110,
-    105,116,121,95,99,104,101,99,107,62,8,0,0,115,24,0,
-    0,0,0,2,15,1,30,1,12,1,15,1,6,1,15,1,
-    15,1,15,1,6,2,27,1,19,1,114,106,1,0,0,122,
-    16,78,111,32,109,111,100,117,108,101,32,110,97,109,101,100,
-    32,122,4,123,33,114,125,99,2,0,0,0,0,0,0,0,
-    8,0,0,0,12,0,0,0,67,0,0,0,115,52,1,0,
-    0,100,0,0,125,2,0,124,0,0,106,0,0,100,1,0,
-    131,1,0,100,2,0,25,125,3,0,124,3,0,114,178,0,
-    124,3,0,116,1,0,106,2,0,107,7,0,114,62,0,116,
-    3,0,124,1,0,124,3,0,131,2,0,1,110,0,0,124,
-    0,0,116,1,0,106,2,0,107,6,0,114,88,0,116,1,
-    0,106,2,0,124,0,0,25,83,116,1,0,106,2,0,124,
-    3,0,25,125,4,0,121,13,0,124,4,0,106,4,0,125,
-    2,0,87,113,178,0,4,116,5,0,107,10,0,114,174,0,
-    1,1,1,116,6,0,100,3,0,23,106,7,0,124,0,0,
-    124,3,0,131,2,0,125,5,0,116,8,0,124,5,0,100,
-    4,0,124,0,0,131,1,1,130,1,0,89,113,178,0,88,
-    110,0,0,116,9,0,124,0,0,124,2,0,131,2,0,125,
-    6,0,124,6,0,100,0,0,107,8,0,114,235,0,116,8,
-    0,116,6,0,106,7,0,124,0,0,131,1,0,100,4,0,
-    124,0,0,131,1,1,130,1,0,110,18,0,116,10,0,124,
-    6,0,131,1,0,106,11,0,131,0,0,125,7,0,124,3,
-    0,114,48,1,116,1,0,106,2,0,124,3,0,25,125,4,
-    0,116,12,0,124,4,0,124,0,0,106,0,0,100,1,0,
-    131,1,0,100,5,0,25,124,7,0,131,3,0,1,110,0,
-    0,124,7,0,83,41,6,78,114,116,0,0,0,114,84,0,
-    0,0,122,23,59,32,123,33,114,125,32,105,115,32,110,111,
-    116,32,97,32,112,97,99,107,97,103,101,114,67,0,0,0,
-    114,115,0,0,0,41,13,114,32,0,0,0,114,7,0,0,
-    0,114,73,0,0,0,114,114,0,0,0,114,244,0,0,0,
-    114,209,0,0,0,218,8,95,69,82,82,95,77,83,71,114,
-    47,0,0,0,114,153,0,0,0,114,246,0,0,0,114,174,
-    0,0,0,114,8,1,0,0,114,61,0,0,0,41,8,114,
-    67,0,0,0,218,7,105,109,112,111,114,116,95,114,35,0,
-    0,0,114,231,0,0,0,90,13,112,97,114,101,110,116,95,
-    109,111,100,117,108,101,114,171,0,0,0,114,177,0,0,0,
-    114,179,0,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,218,23,95,102,105,110,100,95,97,110,100,95,
-    108,111,97,100,95,117,110,108,111,99,107,101,100,82,8,0,
-    0,115,42,0,0,0,0,1,6,1,19,1,6,1,15,1,
-    16,2,15,1,11,1,13,1,3,1,13,1,13,1,22,1,
-    26,1,15,1,12,1,30,2,18,1,6,2,13,1,32,1,
-    114,109,1,0,0,99,2,0,0,0,0,0,0,0,2,0,
-    0,0,10,0,0,0,67,0,0,0,115,36,0,0,0,116,
-    0,0,124,0,0,131,1,0,143,18,0,1,116,1,0,124,
-    0,0,124,1,0,131,2,0,83,87,100,1,0,81,88,100,
-    1,0,83,41,2,122,54,70,105,110,100,32,97,110,100,32,
-    108,111,97,100,32,116,104,101,32,109,111,100,117,108,101,44,
-    32,97,110,100,32,114,101,108,101,97,115,101,32,116,104,101,
-    32,105,109,112,111,114,116,32,108,111,99,107,46,78,41,2,
-    114,103,0,0,0,114,109,1,0,0,41,2,114,67,0,0,
-    0,114,108,1,0,0,114,4,0,0,0,114,4,0,0,0,
-    114,5,0,0,0,218,14,95,102,105,110,100,95,97,110,100,
-    95,108,111,97,100,109,8,0,0,115,4,0,0,0,0,2,
-    13,1,114,110,1,0,0,99,3,0,0,0,0,0,0,0,
-    5,0,0,0,4,0,0,0,67,0,0,0,115,172,0,0,
-    0,116,0,0,124,0,0,124,1,0,124,2,0,131,3,0,
-    1,124,2,0,100,1,0,107,4,0,114,49,0,116,1,0,
-    124,0,0,124,1,0,124,2,0,131,3,0,125,0,0,110,
-    0,0,116,2,0,106,3,0,131,0,0,1,124,0,0,116,
-    4,0,106,5,0,107,7,0,114,87,0,116,6,0,124,0,
-    0,116,7,0,131,2,0,83,116,4,0,106,5,0,124,0,
-    0,25,125,3,0,124,3,0,100,2,0,107,8,0,114,158,
-    0,116,2,0,106,8,0,131,0,0,1,100,3,0,106,9,
-    0,124,0,0,131,1,0,125,4,0,116,10,0,124,4,0,
-    100,4,0,124,0,0,131,1,1,130,1,0,110,0,0,116,
-    11,0,124,0,0,131,1,0,1,124,3,0,83,41,5,97,
-    50,1,0,0,73,109,112,111,114,116,32,97,110,100,32,114,
-    101,116,117,114,110,32,116,104,101,32,109,111,100,117,108,101,
-    32,98,97,115,101,100,32,111,110,32,105,116,115,32,110,97,
-    109,101,44,32,116,104,101,32,112,97,99,107,97,103,101,32,
-    116,104,101,32,99,97,108,108,32,105,115,10,32,32,32,32,
-    98,101,105,110,103,32,109,97,100,101,32,102,114,111,109,44,
-    32,97,110,100,32,116,104,101,32,108,101,118,101,108,32,97,
-    100,106,117,115,116,109,101,110,116,46,10,10,32,32,32,32,
-    84,104,105,115,32,102,117,110,99,116,105,111,110,32,114,101,
-    112,114,101,115,101,110,116,115,32,116,104,101,32,103,114,101,
-    97,116,101,115,116,32,99,111,109,109,111,110,32,100,101,110,
-    111,109,105,110,97,116,111,114,32,111,102,32,102,117,110,99,
-    116,105,111,110,97,108,105,116,121,10,32,32,32,32,98,101,
-    116,119,101,101,110,32,105,109,112,111,114,116,95,109,111,100,
-    117,108,101,32,97,110,100,32,95,95,105,109,112,111,114,116,
-    95,95,46,32,84,104,105,115,32,105,110,99,108,117,100,101,
-    115,32,115,101,116,116,105,110,103,32,95,95,112,97,99,107,
-    97,103,101,95,95,32,105,102,10,32,32,32,32,116,104,101,
-    32,108,111,97,100,101,114,32,100,105,100,32,110,111,116,46,
-    10,10,32,32,32,32,114,84,0,0,0,78,122,40,105,109,
-    112,111,114,116,32,111,102,32,123,125,32,104,97,108,116,101,
-    100,59,32,78,111,110,101,32,105,110,32,115,121,115,46,109,
-    111,100,117,108,101,115,114,67,0,0,0,41,12,114,106,1,
-    0,0,114,102,1,0,0,114,106,0,0,0,114,4,1,0,
-    0,114,7,0,0,0,114,73,0,0,0,114,110,1,0,0,
-    218,11,95,103,99,100,95,105,109,112,111,114,116,114,107,0,
-    0,0,114,47,0,0,0,114,153,0,0,0,114,112,0,0,
-    0,41,5,114,67,0,0,0,114,100,1,0,0,114,101,1,
-    0,0,114,179,0,0,0,114,151,0,0,0,114,4,0,0,
-    0,114,4,0,0,0,114,5,0,0,0,114,111,1,0,0,
-    115,8,0,0,115,26,0,0,0,0,9,16,1,12,1,21,
-    1,10,1,15,1,13,1,13,1,12,1,10,2,15,1,21,
-    1,10,1,114,111,1,0,0,99,3,0,0,0,0,0,0,
-    0,6,0,0,0,17,0,0,0,67,0,0,0,115,1,1,
-    0,0,116,0,0,124,0,0,100,1,0,131,2,0,114,253,
-    0,100,2,0,124,1,0,107,6,0,114,89,0,116,1,0,
-    124,1,0,131,1,0,125,1,0,124,1,0,106,2,0,100,
-    2,0,131,1,0,1,116,0,0,124,0,0,100,3,0,131,
-    2,0,114,89,0,124,1,0,106,3,0,124,0,0,106,4,
-    0,131,1,0,1,113,89,0,110,0,0,120,161,0,124,1,
-    0,68,93,150,0,125,3,0,116,0,0,124,0,0,124,3,
-    0,131,2,0,115,96,0,100,4,0,106,5,0,124,0,0,
-    106,6,0,124,3,0,131,2,0,125,4,0,121,17,0,116,
-    7,0,124,2,0,124,4,0,131,2,0,1,87,113,246,0,
-    4,116,8,0,107,10,0,114,242,0,1,125,5,0,1,122,
-    53,0,116,9,0,124,5,0,131,1,0,106,10,0,116,11,
-    0,131,1,0,114,221,0,124,5,0,106,12,0,124,4,0,
-    107,2,0,114,221,0,119,96,0,113,221,0,110,0,0,130,
-    0,0,87,89,100,5,0,100,5,0,125,5,0,126,5,0,
-    88,113,246,0,88,113,96,0,113,96,0,87,110,0,0,124,
-    0,0,83,41,6,122,238,70,105,103,117,114,101,32,111,117,
-    116,32,119,104,97,116,32,95,95,105,109,112,111,114,116,95,
-    95,32,115,104,111,117,108,100,32,114,101,116,117,114,110,46,
-    10,10,32,32,32,32,84,104,101,32,105,109,112,111,114,116,
-    95,32,112,97,114,97,109,101,116,101,114,32,105,115,32,97,
-    32,99,97,108,108,97,98,108,101,32,119,104,105,99,104,32,
-    116,97,107,101,115,32,116,104,101,32,110,97,109,101,32,111,
-    102,32,109,111,100,117,108,101,32,116,111,10,32,32,32,32,
-    105,109,112,111,114,116,46,32,73,116,32,105,115,32,114,101,
-    113,117,105,114,101,100,32,116,111,32,100,101,99,111,117,112,
-    108,101,32,116,104,101,32,102,117,110,99,116,105,111,110,32,
-    102,114,111,109,32,97,115,115,117,109,105,110,103,32,105,109,
-    112,111,114,116,108,105,98,39,115,10,32,32,32,32,105,109,
-    112,111,114,116,32,105,109,112,108,101,109,101,110,116,97,116,
-    105,111,110,32,105,115,32,100,101,115,105,114,101,100,46,10,
-    10,32,32,32,32,114,244,0,0,0,250,1,42,218,7,95,
-    95,97,108,108,95,95,122,5,123,125,46,123,125,78,41,13,
-    114,60,0,0,0,114,243,0,0,0,218,6,114,101,109,111,
-    118,101,114,197,0,0,0,114,113,1,0,0,114,47,0,0,
-    0,114,57,0,0,0,114,114,0,0,0,114,153,0,0,0,
-    114,80,1,0,0,114,9,0,0,0,218,15,95,69,82,82,
-    95,77,83,71,95,80,82,69,70,73,88,114,67,0,0,0,
-    41,6,114,179,0,0,0,218,8,102,114,111,109,108,105,115,
-    116,114,108,1,0,0,114,16,0,0,0,90,9,102,114,111,
-    109,95,110,97,109,101,114,38,1,0,0,114,4,0,0,0,
-    114,4,0,0,0,114,5,0,0,0,218,16,95,104,97,110,
-    100,108,101,95,102,114,111,109,108,105,115,116,139,8,0,0,
-    115,34,0,0,0,0,10,15,1,12,1,12,1,13,1,15,
-    1,22,1,13,1,15,1,21,1,3,1,17,1,18,4,21,
-    1,15,1,9,1,32,1,114,117,1,0,0,99,1,0,0,
-    0,0,0,0,0,2,0,0,0,2,0,0,0,67,0,0,
-    0,115,78,0,0,0,124,0,0,106,0,0,100,1,0,131,
-    1,0,125,1,0,124,1,0,100,2,0,107,8,0,114,74,
-    0,124,0,0,100,3,0,25,125,1,0,100,4,0,124,0,
-    0,107,7,0,114,74,0,124,1,0,106,1,0,100,5,0,
-    131,1,0,100,6,0,25,125,1,0,113,74,0,110,0,0,
-    124,1,0,83,41,7,122,167,67,97,108,99,117,108,97,116,
-    101,32,119,104,97,116,32,95,95,112,97,99,107,97,103,101,
-    95,95,32,115,104,111,117,108,100,32,98,101,46,10,10,32,
-    32,32,32,95,95,112,97,99,107,97,103,101,95,95,32,105,
-    115,32,110,111,116,32,103,117,97,114,97,110,116,101,101,100,
-    32,116,111,32,98,101,32,100,101,102,105,110,101,100,32,111,
-    114,32,99,111,117,108,100,32,98,101,32,115,101,116,32,116,
-    111,32,78,111,110,101,10,32,32,32,32,116,111,32,114,101,
-    112,114,101,115,101,110,116,32,116,104,97,116,32,105,116,115,
-    32,112,114,111,112,101,114,32,118,97,108,117,101,32,105,115,
-    32,117,110,107,110,111,119,110,46,10,10,32,32,32,32,114,
-    251,0,0,0,78,114,57,0,0,0,114,244,0,0,0,114,
-    116,0,0,0,114,84,0,0,0,41,2,114,93,0,0,0,
-    114,32,0,0,0,41,2,218,7,103,108,111,98,97,108,115,
-    114,100,1,0,0,114,4,0,0,0,114,4,0,0,0,114,
-    5,0,0,0,218,17,95,99,97,108,99,95,95,95,112,97,
-    99,107,97,103,101,95,95,171,8,0,0,115,12,0,0,0,
-    0,7,15,1,12,1,10,1,12,1,25,1,114,119,1,0,
-    0,99,0,0,0,0,0,0,0,0,3,0,0,0,3,0,
-    0,0,67,0,0,0,115,55,0,0,0,116,0,0,116,1,
-    0,106,2,0,131,0,0,102,2,0,125,0,0,116,3,0,
-    116,4,0,102,2,0,125,1,0,116,5,0,116,6,0,102,
-    2,0,125,2,0,124,0,0,124,1,0,124,2,0,103,3,
-    0,83,41,1,122,95,82,101,116,117,114,110,115,32,97,32,
-    108,105,115,116,32,111,102,32,102,105,108,101,45,98,97,115,
-    101,100,32,109,111,100,117,108,101,32,108,111,97,100,101,114,
-    115,46,10,10,32,32,32,32,69,97,99,104,32,105,116,101,
-    109,32,105,115,32,97,32,116,117,112,108,101,32,40,108,111,
-    97,100,101,114,44,32,115,117,102,102,105,120,101,115,41,46,
-    10,32,32,32,32,41,7,114,54,1,0,0,114,106,0,0,
-    0,218,18,101,120,116,101,110,115,105,111,110,95,115,117,102,
-    102,105,120,101,115,114,49,1,0,0,114,134,0,0,0,114,
-    53,1,0,0,114,230,0,0,0,41,3,90,10,101,120,116,
-    101,110,115,105,111,110,115,90,6,115,111,117,114,99,101,90,
-    8,98,121,116,101,99,111,100,101,114,4,0,0,0,114,4,
-    0,0,0,114,5,0,0,0,114,238,0,0,0,186,8,0,
-    0,115,8,0,0,0,0,5,18,1,12,1,12,1,114,238,
-    0,0,0,99,5,0,0,0,0,0,0,0,9,0,0,0,
-    5,0,0,0,67,0,0,0,115,227,0,0,0,124,4,0,
-    100,1,0,107,2,0,114,27,0,116,0,0,124,0,0,131,
-    1,0,125,5,0,110,54,0,124,1,0,100,2,0,107,9,
-    0,114,45,0,124,1,0,110,3,0,105,0,0,125,6,0,
-    116,1,0,124,6,0,131,1,0,125,7,0,116,0,0,124,
-    0,0,124,7,0,124,4,0,131,3,0,125,5,0,124,3,
-    0,115,207,0,124,4,0,100,1,0,107,2,0,114,122,0,
-    116,0,0,124,0,0,106,2,0,100,3,0,131,1,0,100,
-    1,0,25,131,1,0,83,124,0,0,115,132,0,124,5,0,
-    83,116,3,0,124,0,0,131,1,0,116,3,0,124,0,0,
-    106,2,0,100,3,0,131,1,0,100,1,0,25,131,1,0,
-    24,125,8,0,116,4,0,106,5,0,124,5,0,106,6,0,
-    100,2,0,116,3,0,124,5,0,106,6,0,131,1,0,124,
-    8,0,24,133,2,0,25,25,83,110,16,0,116,7,0,124,
-    5,0,124,3,0,116,0,0,131,3,0,83,100,2,0,83,
-    41,4,97,214,1,0,0,73,109,112,111,114,116,32,97,32,
-    109,111,100,117,108,101,46,10,10,32,32,32,32,84,104,101,
-    32,39,103,108,111,98,97,108,115,39,32,97,114,103,117,109,
-    101,110,116,32,105,115,32,117,115,101,100,32,116,111,32,105,
-    110,102,101,114,32,119,104,101,114,101,32,116,104,101,32,105,
-    109,112,111,114,116,32,105,115,32,111,99,99,117,114,105,110,
-    103,32,102,114,111,109,10,32,32,32,32,116,111,32,104,97,
-    110,100,108,101,32,114,101,108,97,116,105,118,101,32,105,109,
-    112,111,114,116,115,46,32,84,104,101,32,39,108,111,99,97,
-    108,115,39,32,97,114,103,117,109,101,110,116,32,105,115,32,
-    105,103,110,111,114,101,100,46,32,84,104,101,10,32,32,32,
-    32,39,102,114,111,109,108,105,115,116,39,32,97,114,103,117,
-    109,101,110,116,32,115,112,101,99,105,102,105,101,115,32,119,
-    104,97,116,32,115,104,111,117,108,100,32,101,120,105,115,116,
-    32,97,115,32,97,116,116,114,105,98,117,116,101,115,32,111,
-    110,32,116,104,101,32,109,111,100,117,108,101,10,32,32,32,
-    32,98,101,105,110,103,32,105,109,112,111,114,116,101,100,32,
-    40,101,46,103,46,32,96,96,102,114,111,109,32,109,111,100,
-    117,108,101,32,105,109,112,111,114,116,32,60,102,114,111,109,
-    108,105,115,116,62,96,96,41,46,32,32,84,104,101,32,39,
-    108,101,118,101,108,39,10,32,32,32,32,97,114,103,117,109,
-    101,110,116,32,114,101,112,114,101,115,101,110,116,115,32,116,
-    104,101,32,112,97,99,107,97,103,101,32,108,111,99,97,116,
-    105,111,110,32,116,111,32,105,109,112,111,114,116,32,102,114,
-    111,109,32,105,110,32,97,32,114,101,108,97,116,105,118,101,
-    10,32,32,32,32,105,109,112,111,114,116,32,40,101,46,103,
-    46,32,96,96,102,114,111,109,32,46,46,112,107,103,32,105,
-    109,112,111,114,116,32,109,111,100,96,96,32,119,111,117,108,
-    100,32,104,97,118,101,32,97,32,39,108,101,118,101,108,39,
-    32,111,102,32,50,41,46,10,10,32,32,32,32,114,84,0,
-    0,0,78,114,116,0,0,0,41,8,114,111,1,0,0,114,
-    119,1,0,0,114,121,0,0,0,114,31,0,0,0,114,7,
-    0,0,0,114,73,0,0,0,114,57,0,0,0,114,117,1,
-    0,0,41,9,114,67,0,0,0,114,118,1,0,0,218,6,
-    108,111,99,97,108,115,114,116,1,0,0,114,101,1,0,0,
-    114,179,0,0,0,90,8,103,108,111,98,97,108,115,95,114,
-    100,1,0,0,90,7,99,117,116,95,111,102,102,114,4,0,
-    0,0,114,4,0,0,0,114,5,0,0,0,218,10,95,95,
-    105,109,112,111,114,116,95,95,197,8,0,0,115,26,0,0,
-    0,0,11,12,1,15,2,24,1,12,1,18,1,6,3,12,
-    1,23,1,6,1,4,4,35,3,40,2,114,122,1,0,0,
-    99,1,0,0,0,0,0,0,0,3,0,0,0,3,0,0,
-    0,67,0,0,0,115,68,0,0,0,116,0,0,106,1,0,
-    124,0,0,131,1,0,125,1,0,124,1,0,100,0,0,107,
-    8,0,114,46,0,116,2,0,100,1,0,124,0,0,23,131,
-    1,0,130,1,0,110,0,0,116,3,0,124,1,0,131,1,
-    0,125,2,0,124,2,0,106,4,0,131,0,0,83,41,2,
-    78,122,25,110,111,32,98,117,105,108,116,45,105,110,32,109,
-    111,100,117,108,101,32,110,97,109,101,100,32,41,5,114,10,
-    1,0,0,114,12,1,0,0,114,153,0,0,0,114,174,0,
-    0,0,114,8,1,0,0,41,3,114,67,0,0,0,114,177,
-    0,0,0,114,178,0,0,0,114,4,0,0,0,114,4,0,
-    0,0,114,5,0,0,0,218,18,95,98,117,105,108,116,105,
-    110,95,102,114,111,109,95,110,97,109,101,232,8,0,0,115,
-    10,0,0,0,0,1,15,1,12,1,19,1,12,1,114,123,
-    1,0,0,99,2,0,0,0,0,0,0,0,19,0,0,0,
-    12,0,0,0,67,0,0,0,115,232,2,0,0,124,1,0,
-    97,0,0,124,0,0,97,1,0,116,1,0,106,2,0,106,
-    3,0,114,33,0,116,4,0,97,5,0,110,6,0,116,6,
-    0,97,5,0,116,7,0,116,1,0,131,1,0,125,2,0,
-    120,138,0,116,1,0,106,8,0,106,9,0,131,0,0,68,
-    93,121,0,92,2,0,125,3,0,125,4,0,116,10,0,124,
-    4,0,124,2,0,131,2,0,114,67,0,124,3,0,116,1,
-    0,106,11,0,107,6,0,114,118,0,116,12,0,125,5,0,
-    110,27,0,116,0,0,106,13,0,124,3,0,131,1,0,114,
-    67,0,116,14,0,125,5,0,110,3,0,113,67,0,116,15,
-    0,124,4,0,124,5,0,131,2,0,125,6,0,116,16,0,
-    124,6,0,131,1,0,125,7,0,124,7,0,106,17,0,124,
-    4,0,131,1,0,1,113,67,0,113,67,0,87,116,1,0,
-    106,8,0,116,18,0,25,125,8,0,120,73,0,100,26,0,
-    68,93,65,0,125,9,0,124,9,0,116,1,0,106,8,0,
-    107,7,0,114,248,0,116,19,0,124,9,0,131,1,0,125,
-    10,0,110,13,0,116,1,0,106,8,0,124,9,0,25,125,
-    10,0,116,20,0,124,8,0,124,9,0,124,10,0,131,3,
-    0,1,113,212,0,87,100,5,0,100,6,0,103,1,0,102,
-    2,0,100,7,0,100,8,0,100,6,0,103,2,0,102,2,
-    0,102,2,0,125,11,0,120,146,0,124,11,0,68,93,126,
-    0,92,2,0,125,12,0,125,13,0,116,21,0,100,9,0,
-    100,10,0,132,0,0,124,13,0,68,131,1,0,131,1,0,
-    115,108,1,116,22,0,130,1,0,124,13,0,100,11,0,25,
-    125,14,0,124,12,0,116,1,0,106,8,0,107,6,0,114,
-    150,1,116,1,0,106,8,0,124,12,0,25,125,15,0,80,
-    113,65,1,121,17,0,116,19,0,124,12,0,131,1,0,125,
-    15,0,80,87,113,65,1,4,116,23,0,107,10,0,114,190,
-    1,1,1,1,119,65,1,89,113,65,1,88,113,65,1,87,
-    116,23,0,100,12,0,131,1,0,130,1,0,116,20,0,124,
-    8,0,100,13,0,124,15,0,131,3,0,1,116,20,0,124,
-    8,0,100,14,0,124,14,0,131,3,0,1,116,20,0,124,
-    8,0,100,15,0,100,16,0,106,24,0,124,13,0,131,1,
-    0,131,3,0,1,121,16,0,116,19,0,100,17,0,131,1,
-    0,125,16,0,87,110,24,0,4,116,23,0,107,10,0,114,
-    50,2,1,1,1,100,18,0,125,16,0,89,110,1,0,88,
-    116,20,0,124,8,0,100,17,0,124,16,0,131,3,0,1,
-    116,19,0,100,19,0,131,1,0,125,17,0,116,20,0,124,
-    8,0,100,19,0,124,17,0,131,3,0,1,124,12,0,100,
-    7,0,107,2,0,114,138,2,116,19,0,100,20,0,131,1,
-    0,125,18,0,116,20,0,124,8,0,100,21,0,124,18,0,
-    131,3,0,1,110,0,0,116,20,0,124,8,0,100,22,0,
-    116,25,0,131,0,0,131,3,0,1,116,26,0,106,27,0,
-    116,0,0,106,28,0,131,0,0,131,1,0,1,124,12,0,
-    100,7,0,107,2,0,114,228,2,116,29,0,106,30,0,100,
-    23,0,131,1,0,1,100,24,0,116,26,0,107,6,0,114,
-    228,2,100,25,0,116,31,0,95,32,0,113,228,2,110,0,
-    0,100,18,0,83,41,27,122,250,83,101,116,117,112,32,105,
-    109,112,111,114,116,108,105,98,32,98,121,32,105,109,112,111,
-    114,116,105,110,103,32,110,101,101,100,101,100,32,98,117,105,
-    108,116,45,105,110,32,109,111,100,117,108,101,115,32,97,110,
-    100,32,105,110,106,101,99,116,105,110,103,32,116,104,101,109,
-    10,32,32,32,32,105,110,116,111,32,116,104,101,32,103,108,
-    111,98,97,108,32,110,97,109,101,115,112,97,99,101,46,10,
-    10,32,32,32,32,65,115,32,115,121,115,32,105,115,32,110,
-    101,101,100,101,100,32,102,111,114,32,115,121,115,46,109,111,
-    100,117,108,101,115,32,97,99,99,101,115,115,32,97,110,100,
-    32,95,105,109,112,32,105,115,32,110,101,101,100,101,100,32,
-    116,111,32,108,111,97,100,32,98,117,105,108,116,45,105,110,
-    10,32,32,32,32,109,111,100,117,108,101,115,44,32,116,104,
-    111,115,101,32,116,119,111,32,109,111,100,117,108,101,115,32,
-    109,117,115,116,32,98,101,32,101,120,112,108,105,99,105,116,
-    108,121,32,112,97,115,115,101,100,32,105,110,46,10,10,32,
-    32,32,32,114,49,0,0,0,114,166,0,0,0,218,8,98,
-    117,105,108,116,105,110,115,114,191,0,0,0,90,5,112,111,
-    115,105,120,250,1,47,218,2,110,116,250,1,92,99,1,0,
-    0,0,0,0,0,0,2,0,0,0,3,0,0,0,115,0,
-    0,0,115,33,0,0,0,124,0,0,93,23,0,125,1,0,
-    116,0,0,124,1,0,131,1,0,100,0,0,107,2,0,86,
-    1,113,3,0,100,1,0,83,41,2,114,29,0,0,0,78,
-    41,1,114,31,0,0,0,41,2,114,22,0,0,0,114,130,
-    0,0,0,114,4,0,0,0,114,4,0,0,0,114,5,0,
-    0,0,114,77,0,0,0,28,9,0,0,115,2,0,0,0,
-    6,0,122,25,95,115,101,116,117,112,46,60,108,111,99,97,
-    108,115,62,46,60,103,101,110,101,120,112,114,62,114,84,0,
-    0,0,122,30,105,109,112,111,114,116,108,105,98,32,114,101,
-    113,117,105,114,101,115,32,112,111,115,105,120,32,111,114,32,
-    110,116,114,3,0,0,0,114,25,0,0,0,114,21,0,0,
-    0,114,30,0,0,0,114,85,0,0,0,78,114,111,0,0,
-    0,90,6,119,105,110,114,101,103,114,21,1,0,0,114,6,
-    0,0,0,122,4,46,112,121,119,122,6,95,100,46,112,121,
-    100,84,41,4,122,3,95,105,111,122,9,95,119,97,114,110,
-    105,110,103,115,122,8,98,117,105,108,116,105,110,115,122,7,
-    109,97,114,115,104,97,108,41,33,114,106,0,0,0,114,7,
-    0,0,0,114,117,0,0,0,114,118,0,0,0,114,120,0,
-    0,0,114,230,0,0,0,114,119,0,0,0,114,66,0,0,
-    0,114,73,0,0,0,218,5,105,116,101,109,115,114,192,0,
-    0,0,114,157,0,0,0,114,10,1,0,0,114,162,0,0,
-    0,114,17,1,0,0,114,245,0,0,0,114,174,0,0,0,
-    114,255,0,0,0,114,57,0,0,0,114,123,1,0,0,114,
-    61,0,0,0,218,3,97,108,108,114,100,0,0,0,114,153,
-    0,0,0,114,26,0,0,0,114,11,0,0,0,114,57,1,
-    0,0,114,197,0,0,0,114,120,1,0,0,114,134,0,0,
-    0,114,223,0,0,0,114,20,1,0,0,114,24,1,0,0,
-    41,19,218,10,115,121,115,95,109,111,100,117,108,101,218,11,
-    95,105,109,112,95,109,111,100,117,108,101,90,11,109,111,100,
-    117,108,101,95,116,121,112,101,114,67,0,0,0,114,179,0,
-    0,0,114,169,0,0,0,114,177,0,0,0,114,178,0,0,
-    0,90,11,115,101,108,102,95,109,111,100,117,108,101,90,12,
-    98,117,105,108,116,105,110,95,110,97,109,101,90,14,98,117,
-    105,108,116,105,110,95,109,111,100,117,108,101,90,10,111,115,
-    95,100,101,116,97,105,108,115,90,10,98,117,105,108,116,105,
-    110,95,111,115,114,21,0,0,0,114,25,0,0,0,90,9,
-    111,115,95,109,111,100,117,108,101,90,13,116,104,114,101,97,
-    100,95,109,111,100,117,108,101,90,14,119,101,97,107,114,101,
-    102,95,109,111,100,117,108,101,90,13,119,105,110,114,101,103,
-    95,109,111,100,117,108,101,114,4,0,0,0,114,4,0,0,
-    0,114,5,0,0,0,218,6,95,115,101,116,117,112,240,8,
-    0,0,115,108,0,0,0,0,9,6,1,6,2,12,1,9,
-    2,6,3,12,1,28,1,15,1,15,1,9,1,15,1,9,
-    2,3,1,15,1,12,1,20,3,13,1,13,1,15,1,15,
-    2,13,1,20,3,33,1,19,2,31,1,10,1,15,1,13,
-    1,4,2,3,1,12,1,5,1,13,1,12,2,12,1,16,
-    1,16,1,25,3,3,1,16,1,13,2,11,1,16,3,12,
-    1,16,3,12,1,12,1,19,3,19,1,19,1,12,1,13,
-    1,12,1,114,132,1,0,0,99,2,0,0,0,0,0,0,
-    0,3,0,0,0,3,0,0,0,67,0,0,0,115,136,0,
-    0,0,116,0,0,124,0,0,124,1,0,131,2,0,1,116,
-    1,0,131,0,0,125,2,0,116,2,0,106,3,0,106,4,
-    0,116,5,0,106,6,0,124,2,0,140,0,0,103,1,0,
-    131,1,0,1,116,2,0,106,7,0,106,8,0,116,9,0,
-    131,1,0,1,116,2,0,106,7,0,106,8,0,116,10,0,
-    131,1,0,1,116,11,0,106,12,0,100,1,0,107,2,0,
-    114,116,0,116,2,0,106,7,0,106,8,0,116,13,0,131,
-    1,0,1,110,0,0,116,2,0,106,7,0,106,8,0,116,
-    14,0,131,1,0,1,100,2,0,83,41,3,122,50,73,110,
-    115,116,97,108,108,32,105,109,112,111,114,116,108,105,98,32,
-    97,115,32,116,104,101,32,105,109,112,108,101,109,101,110,116,
-    97,116,105,111,110,32,111,102,32,105,109,112,111,114,116,46,
-    114,126,1,0,0,78,41,15,114,132,1,0,0,114,238,0,
-    0,0,114,7,0,0,0,114,76,1,0,0,114,197,0,0,
-    0,114,84,1,0,0,114,98,1,0,0,114,103,1,0,0,
-    114,223,0,0,0,114,10,1,0,0,114,17,1,0,0,114,
-    3,0,0,0,114,57,0,0,0,114,20,1,0,0,114,71,
-    1,0,0,41,3,114,130,1,0,0,114,131,1,0,0,90,
-    17,115,117,112,112,111,114,116,101,100,95,108,111,97,100,101,
-    114,115,114,4,0,0,0,114,4,0,0,0,114,5,0,0,
-    0,218,8,95,105,110,115,116,97,108,108,71,9,0,0,115,
-    16,0,0,0,0,2,13,1,9,1,28,1,16,1,16,1,
-    15,1,19,1,114,133,1,0,0,41,3,122,3,119,105,110,
-    114,1,0,0,0,114,2,0,0,0,41,90,114,59,0,0,
-    0,114,10,0,0,0,114,11,0,0,0,114,17,0,0,0,
-    114,19,0,0,0,114,28,0,0,0,114,38,0,0,0,114,
-    39,0,0,0,114,43,0,0,0,114,44,0,0,0,114,46,
-    0,0,0,114,55,0,0,0,114,65,0,0,0,114,68,0,
-    0,0,114,66,0,0,0,218,8,95,95,99,111,100,101,95,
-    95,114,193,0,0,0,114,69,0,0,0,114,109,0,0,0,
-    114,92,0,0,0,114,99,0,0,0,114,82,0,0,0,114,
-    83,0,0,0,114,102,0,0,0,114,103,0,0,0,114,105,
-    0,0,0,114,112,0,0,0,114,114,0,0,0,114,15,0,
-    0,0,114,185,0,0,0,114,14,0,0,0,114,18,0,0,
-    0,90,17,95,82,65,87,95,77,65,71,73,67,95,78,85,
-    77,66,69,82,114,125,0,0,0,114,134,0,0,0,114,119,
-    0,0,0,114,120,0,0,0,114,132,0,0,0,114,135,0,
-    0,0,114,142,0,0,0,114,144,0,0,0,114,152,0,0,
-    0,114,156,0,0,0,114,161,0,0,0,114,164,0,0,0,
-    114,172,0,0,0,114,180,0,0,0,114,190,0,0,0,114,
-    195,0,0,0,114,198,0,0,0,114,203,0,0,0,114,211,
-    0,0,0,114,212,0,0,0,114,216,0,0,0,114,173,0,
-    0,0,218,6,111,98,106,101,99,116,114,239,0,0,0,114,
-    237,0,0,0,114,245,0,0,0,114,174,0,0,0,114,10,
-    1,0,0,114,17,1,0,0,114,20,1,0,0,114,30,1,
-    0,0,114,31,1,0,0,114,46,1,0,0,114,49,1,0,
-    0,114,53,1,0,0,114,57,1,0,0,114,54,1,0,0,
-    114,58,1,0,0,114,252,0,0,0,114,71,1,0,0,114,
-    84,1,0,0,114,99,1,0,0,114,102,1,0,0,114,246,
-    0,0,0,114,106,1,0,0,114,115,1,0,0,114,107,1,
-    0,0,114,109,1,0,0,114,110,1,0,0,114,111,1,0,
-    0,114,117,1,0,0,114,119,1,0,0,114,238,0,0,0,
-    114,122,1,0,0,114,123,1,0,0,114,132,1,0,0,114,
-    133,1,0,0,114,4,0,0,0,114,4,0,0,0,114,4,
-    0,0,0,114,5,0,0,0,218,8,60,109,111,100,117,108,
-    101,62,8,0,0,0,115,166,0,0,0,6,17,6,3,12,
-    12,12,5,12,5,12,6,12,12,12,10,12,9,12,5,12,
-    7,15,22,12,8,12,4,15,4,19,20,6,2,6,3,22,
-    4,19,68,19,21,19,19,12,19,12,20,12,113,22,1,18,
-    2,6,2,9,2,9,1,9,2,15,27,12,23,12,19,12,
-    12,18,8,12,18,12,11,12,11,12,13,12,13,21,55,21,
-    12,18,10,12,14,12,34,19,27,19,106,24,22,9,3,12,
-    1,15,63,18,45,19,251,19,63,19,59,19,60,19,25,22,
-    110,19,31,25,43,25,16,6,3,19,48,19,57,19,27,19,
-    124,19,147,19,13,12,9,15,41,12,17,6,1,10,2,12,
-    27,12,6,18,24,12,32,12,15,12,11,24,35,12,8,12,
-    87,
+    0,0,90,4,0,100,4,0,90,5,0,100,5,0,100,6,
+    0,132,0,0,90,6,0,101,7,0,90,8,0,100,7,0,
+    100,8,0,132,0,0,90,9,0,100,9,0,100,10,0,132,
+    0,0,90,10,0,100,11,0,100,12,0,100,13,0,132,1,
+    0,90,11,0,100,29,0,100,15,0,100,16,0,132,1,0,
+    90,12,0,100,17,0,100,18,0,132,0,0,90,13,0,100,
+    19,0,100,20,0,132,0,0,90,14,0,100,21,0,100,22,
+    0,132,0,0,90,15,0,100,23,0,100,24,0,132,0,0,
+    90,16,0,101,17,0,100,25,0,100,26,0,132,0,0,131,
+    1,0,90,18,0,100,27,0,100,28,0,132,0,0,90,19,
+    0,100,11,0,83,41,30,218,10,70,105,108,101,70,105,110,
+    100,101,114,122,172,70,105,108,101,45,98,97,115,101,100,32,
+    102,105,110,100,101,114,46,10,10,32,32,32,32,73,110,116,
+    101,114,97,99,116,105,111,110,115,32,119,105,116,104,32,116,
+    104,101,32,102,105,108,101,32,115,121,115,116,101,109,32,97,
+    114,101,32,99,97,99,104,101,100,32,102,111,114,32,112,101,
+    114,102,111,114,109,97,110,99,101,44,32,98,101,105,110,103,
+    10,32,32,32,32,114,101,102,114,101,115,104,101,100,32,119,
+    104,101,110,32,116,104,101,32,100,105,114,101,99,116,111,114,
+    121,32,116,104,101,32,102,105,110,100,101,114,32,105,115,32,
+    104,97,110,100,108,105,110,103,32,104,97,115,32,98,101,101,
+    110,32,109,111,100,105,102,105,101,100,46,10,10,32,32,32,
+    32,99,2,0,0,0,0,0,0,0,5,0,0,0,5,0,
+    0,0,7,0,0,0,115,122,0,0,0,103,0,0,125,3,
+    0,120,52,0,124,2,0,68,93,44,0,92,2,0,137,0,
+    0,125,4,0,124,3,0,106,0,0,135,0,0,102,1,0,
+    100,1,0,100,2,0,134,0,0,124,4,0,68,131,1,0,
+    131,1,0,1,113,13,0,87,124,3,0,124,0,0,95,1,
+    0,124,1,0,112,79,0,100,3,0,124,0,0,95,2,0,
+    100,6,0,124,0,0,95,3,0,116,4,0,131,0,0,124,
+    0,0,95,5,0,116,4,0,131,0,0,124,0,0,95,6,
+    0,100,5,0,83,41,7,122,154,73,110,105,116,105,97,108,
+    105,122,101,32,119,105,116,104,32,116,104,101,32,112,97,116,
+    104,32,116,111,32,115,101,97,114,99,104,32,111,110,32,97,
+    110,100,32,97,32,118,97,114,105,97,98,108,101,32,110,117,
+    109,98,101,114,32,111,102,10,32,32,32,32,32,32,32,32,
+    50,45,116,117,112,108,101,115,32,99,111,110,116,97,105,110,
+    105,110,103,32,116,104,101,32,108,111,97,100,101,114,32,97,
+    110,100,32,116,104,101,32,102,105,108,101,32,115,117,102,102,
+    105,120,101,115,32,116,104,101,32,108,111,97,100,101,114,10,
+    32,32,32,32,32,32,32,32,114,101,99,111,103,110,105,122,
+    101,115,46,99,1,0,0,0,0,0,0,0,2,0,0,0,
+    3,0,0,0,51,0,0,0,115,27,0,0,0,124,0,0,
+    93,17,0,125,1,0,124,1,0,136,0,0,102,2,0,86,
+    1,113,3,0,100,0,0,83,41,1,78,114,5,0,0,0,
+    41,2,114,32,0,0,0,114,71,1,0,0,41,1,114,185,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,114,94,0,
+    0,0,139,7,0,0,115,2,0,0,0,6,0,122,38,70,
+    105,108,101,70,105,110,100,101,114,46,95,95,105,110,105,116,
+    95,95,46,60,108,111,99,97,108,115,62,46,60,103,101,110,
+    101,120,112,114,62,114,132,0,0,0,114,39,0,0,0,78,
+    114,154,0,0,0,41,7,114,213,0,0,0,218,8,95,108,
+    111,97,100,101,114,115,114,45,0,0,0,218,11,95,112,97,
+    116,104,95,109,116,105,109,101,218,3,115,101,116,218,11,95,
+    112,97,116,104,95,99,97,99,104,101,218,19,95,114,101,108,
+    97,120,101,100,95,112,97,116,104,95,99,97,99,104,101,41,
+    5,114,88,0,0,0,114,45,0,0,0,218,14,108,111,97,
+    100,101,114,95,100,101,116,97,105,108,115,90,7,108,111,97,
+    100,101,114,115,114,142,0,0,0,114,5,0,0,0,41,1,
+    114,185,0,0,0,114,6,0,0,0,114,89,0,0,0,133,
+    7,0,0,115,16,0,0,0,0,4,6,1,19,1,36,1,
+    9,2,15,1,9,1,12,1,122,19,70,105,108,101,70,105,
+    110,100,101,114,46,95,95,105,110,105,116,95,95,70,99,1,
+    0,0,0,0,0,0,0,1,0,0,0,2,0,0,0,67,
+    0,0,0,115,13,0,0,0,100,3,0,124,0,0,95,0,
+    0,100,2,0,83,41,4,122,31,73,110,118,97,108,105,100,
+    97,116,101,32,116,104,101,32,100,105,114,101,99,116,111,114,
+    121,32,109,116,105,109,101,46,114,39,0,0,0,78,114,154,
+    0,0,0,41,1,114,102,1,0,0,41,1,114,88,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
+    114,88,1,0,0,151,7,0,0,115,2,0,0,0,0,2,
+    122,28,70,105,108,101,70,105,110,100,101,114,46,105,110,118,
+    97,108,105,100,97,116,101,95,99,97,99,104,101,115,99,2,
+    0,0,0,0,0,0,0,3,0,0,0,3,0,0,0,67,
+    0,0,0,115,59,0,0,0,124,0,0,106,0,0,124,1,
+    0,131,1,0,125,2,0,124,2,0,100,1,0,107,8,0,
+    114,37,0,100,1,0,103,0,0,102,2,0,83,124,2,0,
+    106,1,0,124,2,0,106,2,0,112,55,0,103,0,0,102,
+    2,0,83,41,2,122,125,84,114,121,32,116,111,32,102,105,
+    110,100,32,97,32,108,111,97,100,101,114,32,102,111,114,32,
+    116,104,101,32,115,112,101,99,105,102,105,101,100,32,109,111,
+    100,117,108,101,44,32,111,114,32,116,104,101,32,110,97,109,
+    101,115,112,97,99,101,10,32,32,32,32,32,32,32,32,112,
+    97,99,107,97,103,101,32,112,111,114,116,105,111,110,115,46,
+    32,82,101,116,117,114,110,115,32,40,108,111,97,100,101,114,
+    44,32,108,105,115,116,45,111,102,45,112,111,114,116,105,111,
+    110,115,41,46,78,41,3,114,27,1,0,0,114,185,0,0,
+    0,114,236,0,0,0,41,3,114,88,0,0,0,114,174,0,
+    0,0,114,193,0,0,0,114,5,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,114,181,0,0,0,157,7,0,0,115,
+    8,0,0,0,0,3,15,1,12,1,10,1,122,22,70,105,
+    108,101,70,105,110,100,101,114,46,102,105,110,100,95,108,111,
+    97,100,101,114,99,6,0,0,0,0,0,0,0,8,0,0,
+    0,13,0,0,0,67,0,0,0,115,97,0,0,0,124,1,
+    0,124,2,0,124,3,0,131,2,0,125,6,0,121,13,0,
+    124,6,0,106,0,0,125,7,0,87,110,43,0,4,116,1,
+    0,107,10,0,114,73,0,1,1,1,116,2,0,124,2,0,
+    124,3,0,100,1,0,124,6,0,100,2,0,124,4,0,131,
+    2,2,83,89,110,20,0,88,124,7,0,124,2,0,124,3,
+    0,124,4,0,124,5,0,131,4,0,83,100,0,0,83,41,
+    3,78,114,185,0,0,0,114,236,0,0,0,41,3,114,99,
+    1,0,0,114,225,0,0,0,114,252,0,0,0,41,8,114,
+    88,0,0,0,114,0,1,0,0,114,174,0,0,0,114,45,
+    0,0,0,114,236,0,0,0,114,26,1,0,0,114,185,0,
+    0,0,90,8,103,101,116,95,115,112,101,99,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,114,99,1,0,0,
+    165,7,0,0,115,14,0,0,0,0,1,15,1,3,1,13,
+    1,13,1,18,1,12,2,122,20,70,105,108,101,70,105,110,
+    100,101,114,46,95,103,101,116,95,115,112,101,99,78,99,3,
+    0,0,0,0,0,0,0,14,0,0,0,15,0,0,0,67,
+    0,0,0,115,243,1,0,0,100,1,0,125,3,0,124,1,
+    0,106,0,0,100,2,0,131,1,0,100,3,0,25,125,4,
+    0,121,34,0,116,1,0,124,0,0,106,2,0,112,49,0,
+    116,3,0,106,4,0,131,0,0,131,1,0,106,5,0,125,
+    5,0,87,110,24,0,4,116,6,0,107,10,0,114,85,0,
+    1,1,1,100,10,0,125,5,0,89,110,1,0,88,124,5,
+    0,124,0,0,106,7,0,107,3,0,114,126,0,124,0,0,
+    106,8,0,124,5,0,131,1,0,1,124,5,0,124,0,0,
+    95,7,0,110,0,0,116,9,0,131,0,0,114,159,0,124,
+    0,0,106,10,0,125,6,0,124,4,0,106,11,0,131,0,
+    0,125,7,0,110,15,0,124,0,0,106,12,0,125,6,0,
+    124,4,0,125,7,0,124,7,0,124,6,0,107,6,0,114,
+    54,1,116,13,0,124,0,0,106,2,0,124,4,0,131,2,
+    0,125,8,0,120,103,0,124,0,0,106,14,0,68,93,77,
+    0,92,2,0,125,9,0,125,10,0,100,5,0,124,9,0,
+    23,125,11,0,116,13,0,124,8,0,124,11,0,131,2,0,
+    125,12,0,116,15,0,124,12,0,131,1,0,114,214,0,124,
+    0,0,106,16,0,124,10,0,124,1,0,124,12,0,124,8,
+    0,103,1,0,124,2,0,131,5,0,83,113,214,0,87,116,
+    17,0,124,8,0,131,1,0,125,3,0,110,0,0,120,126,
+    0,124,0,0,106,14,0,68,93,115,0,92,2,0,125,9,
+    0,125,10,0,116,13,0,124,0,0,106,2,0,124,4,0,
+    124,9,0,23,131,2,0,125,12,0,116,18,0,100,6,0,
+    106,19,0,124,12,0,131,1,0,100,7,0,100,3,0,131,
+    1,1,1,124,7,0,124,9,0,23,124,6,0,107,6,0,
+    114,64,1,116,15,0,124,12,0,131,1,0,114,179,1,124,
+    0,0,106,16,0,124,10,0,124,1,0,124,12,0,100,8,
+    0,124,2,0,131,5,0,83,113,64,1,113,64,1,87,124,
+    3,0,114,239,1,116,18,0,100,9,0,106,19,0,124,8,
+    0,131,1,0,131,1,0,1,116,20,0,124,1,0,100,8,
+    0,131,2,0,125,13,0,124,8,0,103,1,0,124,13,0,
+    95,21,0,124,13,0,83,100,8,0,83,41,11,122,125,84,
+    114,121,32,116,111,32,102,105,110,100,32,97,32,108,111,97,
+    100,101,114,32,102,111,114,32,116,104,101,32,115,112,101,99,
+    105,102,105,101,100,32,109,111,100,117,108,101,44,32,111,114,
+    32,116,104,101,32,110,97,109,101,115,112,97,99,101,10,32,
+    32,32,32,32,32,32,32,112,97,99,107,97,103,101,32,112,
+    111,114,116,105,111,110,115,46,32,82,101,116,117,114,110,115,
+    32,40,108,111,97,100,101,114,44,32,108,105,115,116,45,111,
+    102,45,112,111,114,116,105,111,110,115,41,46,70,114,132,0,
+    0,0,114,131,0,0,0,114,39,0,0,0,114,89,0,0,
+    0,122,9,116,114,121,105,110,103,32,123,125,114,161,0,0,
+    0,78,122,25,112,111,115,115,105,98,108,101,32,110,97,109,
+    101,115,112,97,99,101,32,102,111,114,32,123,125,114,154,0,
+    0,0,41,22,114,42,0,0,0,114,49,0,0,0,114,45,
+    0,0,0,114,3,0,0,0,114,55,0,0,0,114,65,1,
+    0,0,114,50,0,0,0,114,102,1,0,0,218,11,95,102,
+    105,108,108,95,99,97,99,104,101,114,7,0,0,0,114,105,
+    1,0,0,114,155,0,0,0,114,104,1,0,0,114,38,0,
+    0,0,114,101,1,0,0,114,54,0,0,0,114,99,1,0,
+    0,114,56,0,0,0,114,168,0,0,0,114,58,0,0,0,
+    114,232,0,0,0,114,236,0,0,0,41,14,114,88,0,0,
+    0,114,174,0,0,0,114,26,1,0,0,90,12,105,115,95,
+    110,97,109,101,115,112,97,99,101,90,11,116,97,105,108,95,
+    109,111,100,117,108,101,114,199,0,0,0,90,5,99,97,99,
+    104,101,90,12,99,97,99,104,101,95,109,111,100,117,108,101,
+    90,9,98,97,115,101,95,112,97,116,104,114,71,1,0,0,
+    114,0,1,0,0,90,13,105,110,105,116,95,102,105,108,101,
+    110,97,109,101,90,9,102,117,108,108,95,112,97,116,104,114,
+    193,0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,114,27,1,0,0,175,7,0,0,115,68,0,0,
+    0,0,3,6,1,19,1,3,1,34,1,13,1,11,1,15,
+    1,13,1,12,2,9,1,9,1,15,2,9,1,6,2,12,
+    1,18,1,22,1,10,1,15,1,12,1,32,4,15,2,22,
+    1,22,1,25,1,16,1,12,1,32,1,6,1,19,1,15,
+    1,12,1,4,1,122,20,70,105,108,101,70,105,110,100,101,
+    114,46,102,105,110,100,95,115,112,101,99,114,39,0,0,0,
+    99,2,0,0,0,0,0,0,0,9,0,0,0,5,0,0,
+    0,67,0,0,0,115,19,1,0,0,124,0,0,106,0,0,
+    114,69,0,124,1,0,100,8,0,107,3,0,114,69,0,124,
+    0,0,106,1,0,124,1,0,131,1,0,125,2,0,124,2,
+    0,100,2,0,107,8,0,114,81,0,124,0,0,106,2,0,
+    124,1,0,131,1,0,125,2,0,113,81,0,110,12,0,124,
+    0,0,106,3,0,131,0,0,125,2,0,116,4,0,106,5,
+    0,106,6,0,100,3,0,131,1,0,115,117,0,116,7,0,
+    124,2,0,131,1,0,124,0,0,95,8,0,110,111,0,116,
+    7,0,131,0,0,125,3,0,120,90,0,124,2,0,68,93,
+    82,0,125,4,0,124,4,0,106,9,0,100,4,0,131,1,
+    0,92,3,0,125,5,0,125,6,0,125,7,0,124,6,0,
+    114,196,0,100,5,0,106,10,0,124,5,0,124,7,0,106,
+    11,0,131,0,0,131,2,0,125,8,0,110,6,0,124,5,
+    0,125,8,0,124,3,0,106,12,0,124,8,0,131,1,0,
+    1,113,133,0,87,124,3,0,124,0,0,95,8,0,116,4,
+    0,106,5,0,106,6,0,116,13,0,131,1,0,114,15,1,
+    100,6,0,100,7,0,132,0,0,124,2,0,68,131,1,0,
+    124,0,0,95,14,0,110,0,0,100,2,0,83,41,9,97,
+    59,1,0,0,70,105,108,108,32,116,104,101,32,99,97,99,
+    104,101,32,111,102,32,112,111,116,101,110,116,105,97,108,32,
+    109,111,100,117,108,101,115,32,97,110,100,32,112,97,99,107,
+    97,103,101,115,32,102,111,114,32,116,104,105,115,32,100,105,
+    114,101,99,116,111,114,121,46,10,10,32,32,32,32,32,32,
+    32,32,73,102,32,116,104,101,32,112,101,114,115,105,115,116,
+    101,110,116,32,100,105,114,101,99,116,111,114,121,32,105,110,
+    100,101,120,32,105,115,32,101,110,97,98,108,101,100,32,97,
+    110,100,32,116,104,101,32,100,105,114,101,99,116,111,114,121,
+    10,32,32,32,32,32,32,32,32,109,116,105,109,101,32,105,
+    115,32,103,105,118,101,110,44,32,116,104,101,32,108,105,115,
+    116,105,110,103,32,99,111,109,101,115,32,102,114,111,109,32,
+    116,104,101,32,105,110,100,101,120,32,119,104,101,110,32,105,
+    116,32,119,97,115,32,116,97,107,101,110,10,32,32,32,32,
+    32,32,32,32,97,116,32,116,104,97,116,32,109,116,105,109,
+    101,59,32,111,116,104,101,114,119,105,115,101,32,116,104,101,
+    32,100,105,114,101,99,116,111,114,121,32,105,115,32,108,105,
+    115,116,101,100,32,97,110,100,32,116,104,101,32,105,110,100,
+    101,120,10,32,32,32,32,32,32,32,32,114,101,102,114,101,
+    115,104,101,100,46,10,10,32,32,32,32,32,32,32,32,114,
+    39,0,0,0,78,114,0,0,0,0,114,132,0,0,0,122,
+    5,123,125,46,123,125,99,1,0,0,0,0,0,0,0,2,
+    0,0,0,3,0,0,0,83,0,0,0,115,28,0,0,0,
+    104,0,0,124,0,0,93,18,0,125,1,0,124,1,0,106,
+    0,0,131,0,0,146,2,0,113,6,0,83,114,5,0,0,
+    0,41,1,114,155,0,0,0,41,2,114,32,0,0,0,90,
+    2,102,110,114,5,0,0,0,114,5,0,0,0,114,6,0,
+    0,0,250,9,60,115,101,116,99,111,109,112,62,255,7,0,
+    0,115,2,0,0,0,9,0,122,41,70,105,108,101,70,105,
+    110,100,101,114,46,95,102,105,108,108,95,99,97,99,104,101,
+    46,60,108,111,99,97,108,115,62,46,60,115,101,116,99,111,
+    109,112,62,114,154,0,0,0,41,15,218,10,95,117,115,101,
+    95,105,110,100,101,120,218,11,95,114,101,97,100,95,105,110,
+    100,101,120,218,18,95,108,105,115,116,100,105,114,95,97,110,
+    100,95,105,110,100,101,120,218,8,95,108,105,115,116,100,105,
+    114,114,8,0,0,0,114,9,0,0,0,114,10,0,0,0,
+    114,103,1,0,0,114,104,1,0,0,114,136,0,0,0,114,
+    58,0,0,0,114,155,0,0,0,218,3,97,100,100,114,11,
+    0,0,0,114,105,1,0,0,41,9,114,88,0,0,0,114,
+    199,0,0,0,218,8,99,111,110,116,101,110,116,115,90,21,
+    108,111,119,101,114,95,115,117,102,102,105,120,95,99,111,110,
+    116,101,110,116,115,114,85,1,0,0,114,84,0,0,0,114,
+    79,1,0,0,114,71,1,0,0,90,8,110,101,119,95,110,
+    97,109,101,114,5,0,0,0,114,5,0,0,0,114,6,0,
+    0,0,114,107,1,0,0,220,7,0,0,115,34,0,0,0,
+    0,9,21,1,15,1,12,1,21,2,12,3,18,1,18,7,
+    9,1,13,1,24,1,6,1,27,2,6,1,17,1,9,1,
+    18,1,122,22,70,105,108,101,70,105,110,100,101,114,46,95,
+    102,105,108,108,95,99,97,99,104,101,99,1,0,0,0,0,
+    0,0,0,1,0,0,0,13,0,0,0,67,0,0,0,115,
+    70,0,0,0,121,32,0,116,0,0,106,1,0,124,0,0,
+    106,2,0,112,27,0,116,0,0,106,3,0,131,0,0,131,
+    1,0,83,87,110,31,0,4,116,4,0,116,5,0,116,6,
+    0,102,3,0,107,10,0,114,65,0,1,1,1,103,0,0,
+    83,89,110,1,0,88,100,1,0,83,41,2,122,54,76,105,
+    115,116,32,116,104,101,32,100,105,114,101,99,116,111,114,121,
+    44,32,116,114,101,97,116,105,110,103,32,97,110,32,117,110,
+    117,115,97,98,108,101,32,111,110,101,32,97,115,32,101,109,
+    112,116,121,46,78,41,7,114,3,0,0,0,90,7,108,105,
+    115,116,100,105,114,114,45,0,0,0,114,55,0,0,0,218,
+    17,70,105,108,101,78,111,116,70,111,117,110,100,69,114,114,
+    111,114,218,15,80,101,114,109,105,115,115,105,111,110,69,114,
+    114,111,114,218,18,78,111,116,65,68,105,114,101,99,116,111,
+    114,121,69,114,114,111,114,41,1,114,88,0,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,114,112,1,
+    0,0,1,8,0,0,115,8,0,0,0,0,2,3,1,32,
+    1,22,3,122,19,70,105,108,101,70,105,110,100,101,114,46,
+    95,108,105,115,116,100,105,114,99,1,0,0,0,0,0,0,
+    0,3,0,0,0,4,0,0,0,67,0,0,0,115,65,0,
+    0,0,116,0,0,106,1,0,106,2,0,125,1,0,124,1,
+    0,100,1,0,107,8,0,114,28,0,100,1,0,83,100,2,
+    0,106,3,0,124,1,0,116,4,0,131,2,0,125,2,0,
+    116,5,0,124,0,0,106,6,0,116,7,0,124,2,0,131,
+    3,0,83,41,3,122,48,82,101,116,117,114,110,32,116,104,
+    101,32,112,97,116,104,32,116,111,32,116,104,101,32,100,105,
+    114,101,99,116,111,114,121,32,105,110,100,101,120,44,32,111,
+    114,32,78,111,110,101,46,78,122,4,123,125,123,125,41,8,
+    114,8,0,0,0,114,137,0,0,0,114,138,0,0,0,114,
+    58,0,0,0,218,17,95,68,73,82,95,73,78,68,69,88,
+    95,83,85,70,70,73,88,114,38,0,0,0,114,45,0,0,
+    0,114,140,0,0,0,41,3,114,88,0,0,0,114,146,0,
+    0,0,114,147,0,0,0,114,5,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,218,11,95,105,110,100,101,120,95,112,
+    97,116,104,10,8,0,0,115,10,0,0,0,0,2,12,1,
+    12,1,4,1,18,1,122,22,70,105,108,101,70,105,110,100,
+    101,114,46,95,105,110,100,101,120,95,112,97,116,104,99,2,
+    0,0,0,0,0,0,0,8,0,0,0,19,0,0,0,67,
+    0,0,0,115,219,0,0,0,124,0,0,106,0,0,131,0,
+    0,125,2,0,124,2,0,100,1,0,107,8,0,114,28,0,
+    100,1,0,83,121,43,0,116,1,0,106,2,0,124,2,0,
+    100,2,0,131,2,0,143,19,0,125,3,0,124,3,0,106,
+    3,0,131,0,0,125,4,0,87,100,1,0,81,88,87,110,
+    22,0,4,116,4,0,107,10,0,114,95,0,1,1,1,100,
+    1,0,83,89,110,1,0,88,124,4,0,106,5,0,100,3,
+    0,131,1,0,92,3,0,125,5,0,125,6,0,125,7,0,
+    124,6,0,12,115,155,0,124,5,0,116,6,0,116,7,0,
+    124,1,0,131,1,0,106,8,0,131,0,0,23,107,3,0,
+    114,159,0,100,1,0,83,116,9,0,100,4,0,124,2,0,
+    124,0,0,106,10,0,100,5,0,100,6,0,131,3,1,1,
+    124,7,0,115,194,0,103,0,0,83,124,7,0,106,11,0,
+    100,7,0,100,8,0,131,2,0,106,12,0,100,9,0,131,
+    1,0,83,41,10,122,167,82,101,116,117,114,110,32,116,104,
+    101,32,108,105,115,116,105,110,103,32,115,116,111,114,101,100,
+    32,105,110,32,116,104,101,32,100,105,114,101,99,116,111,114,
+    121,32,105,110,100,101,120,46,10,10,32,32,32,32,32,32,
+    32,32,78,111,110,101,32,105,115,32,114,101,116,117,114,110,
+    101,100,32,105,102,32,116,104,101,114,101,32,105,115,32,110,
+    111,32,105,110,100,101,120,32,111,114,32,105,102,32,105,116,
+    32,119,97,115,32,110,111,116,32,116,97,107,101,110,32,97,
+    116,32,116,104,101,10,32,32,32,32,32,32,32,32,103,105,
+    118,101,110,32,100,105,114,101,99,116,111,114,121,32,109,116,
+    105,109,101,46,10,10,32,32,32,32,32,32,32,32,78,114,
+    62,1,0,0,115,1,0,0,0,10,122,13,123,125,32,109,
+    97,116,99,104,101,115,32,123,125,114,161,0,0,0,114,131,
+    0,0,0,122,5,117,116,102,45,56,218,13,115,117,114,114,
+    111,103,97,116,101,112,97,115,115,218,1,0,41,13,114,119,
+    1,0,0,114,64,0,0,0,114,65,0,0,0,114,63,1,
+    0,0,114,50,0,0,0,114,136,0,0,0,218,16,95,68,
+    73,82,95,73,78,68,69,88,95,77,65,71,73,67,218,4,
+    114,101,112,114,218,6,101,110,99,111,100,101,114,168,0,0,
+    0,114,45,0,0,0,114,216,0,0,0,218,5,115,112,108,
+    105,116,41,8,114,88,0,0,0,114,199,0,0,0,218,10,
+    105,110,100,101,120,95,112,97,116,104,114,72,0,0,0,114,
+    69,0,0,0,90,6,104,101,97,100,101,114,114,145,0,0,
+    0,218,4,98,111,100,121,114,5,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,114,110,1,0,0,18,8,0,0,115,
+    32,0,0,0,0,7,12,1,12,1,4,1,3,1,21,1,
+    22,1,13,1,9,1,24,1,35,1,4,1,18,1,7,1,
+    6,1,4,1,122,22,70,105,108,101,70,105,110,100,101,114,
+    46,95,114,101,97,100,95,105,110,100,101,120,99,2,0,0,
+    0,0,0,0,0,8,0,0,0,32,0,0,0,67,0,0,
+    0,115,247,1,0,0,124,0,0,106,0,0,131,0,0,125,
+    2,0,124,2,0,100,1,0,107,8,0,115,33,0,116,1,
+    0,106,2,0,114,43,0,124,0,0,106,3,0,131,0,0,
+    83,100,2,0,106,4,0,124,2,0,116,5,0,124,0,0,
+    131,1,0,131,2,0,125,3,0,121,42,0,116,6,0,106,
+    7,0,124,3,0,116,6,0,106,8,0,116,6,0,106,9,
+    0,66,116,6,0,106,10,0,66,100,3,0,131,3,0,125,
+    4,0,87,110,103,0,4,116,11,0,107,10,0,114,187,0,
+    1,1,1,121,27,0,116,6,0,106,12,0,116,13,0,124,
+    2,0,131,1,0,100,4,0,25,131,1,0,1,87,110,18,
+    0,4,116,14,0,107,10,0,114,172,0,1,1,1,89,110,
+    1,0,88,124,0,0,106,3,0,131,0,0,83,89,110,28,
+    0,4,116,14,0,107,10,0,114,214,0,1,1,1,124,0,
+    0,106,3,0,131,0,0,83,89,110,1,0,88,100,1,0,
+    125,5,0,121,197,0,116,15,0,106,16,0,124,4,0,100,
+    5,0,131,2,0,143,110,0,125,6,0,124,1,0,116,6,
+    0,106,17,0,124,4,0,131,1,0,106,18,0,107,0,0,
+    114,92,1,124,0,0,106,3,0,131,0,0,125,5,0,100,
+    6,0,106,19,0,124,5,0,131,1,0,106,20,0,100,7,
+    0,100,8,0,131,2,0,125,7,0,124,6,0,106,21,0,
+    116,22,0,116,23,0,124,1,0,131,1,0,106,20,0,131,
+    0,0,23,100,9,0,23,124,7,0,23,131,1,0,1,110,
+    0,0,87,100,1,0,81,88,124,5,0,100,1,0,107,8,
+    0,114,126,1,116,6,0,106,24,0,124,3,0,131,1,0,
+    1,110,35,0,116,6,0,106,25,0,124,3,0,124,2,0,
+    131,2,0,1,116,26,0,100,10,0,124,2,0,100,11,0,
+    100,12,0,131,2,1,1,87,110,56,0,4,116,14,0,107,
+    10,0,114,220,1,1,1,1,121,17,0,116,6,0,106,24,
+    0,124,3,0,131,1,0,1,87,110,18,0,4,116,14,0,
+    107,10,0,114,215,1,1,1,1,89,110,1,0,88,89,110,
+    1,0,88,124,5,0,100,1,0,107,8,0,114,243,1,124,
+    0,0,106,3,0,131,0,0,83,124,5,0,83,41,13,97,
+    139,1,0,0,76,105,115,116,32,116,104,101,32,100,105,114,
+    101,99,116,111,114,121,32,97,110,100,32,115,116,111,114,101,
+    32,116,104,101,32,108,105,115,116,105,110,103,32,105,110,32,
+    116,104,101,32,100,105,114,101,99,116,111,114,121,32,105,110,
+    100,101,120,46,10,10,32,32,32,32,32,32,32,32,70,105,
+    108,101,115,121,115,116,101,109,32,116,105,109,101,115,116,97,
+    109,112,115,32,97,114,101,32,99,111,97,114,115,101,44,32,
+    115,111,32,97,32,99,104,97,110,103,101,32,109,97,100,101,
+    32,116,111,32,116,104,101,32,100,105,114,101,99,116,111,114,
+    121,10,32,32,32,32,32,32,32,32,105,110,32,116,104,101,
+    32,115,97,109,101,32,116,105,99,107,32,97,115,32,105,116,
+    115,32,108,105,115,116,105,110,103,32,119,111,117,108,100,32,
+    110,111,116,32,115,104,111,119,32,105,110,32,105,116,115,32,
+    109,116,105,109,101,46,32,32,84,104,101,10,32,32,32,32,
+    32,32,32,32,105,110,100,101,120,32,105,115,32,116,104,101,
+    114,101,102,111,114,101,32,111,110,108,121,32,119,114,105,116,
+    116,101,110,32,105,102,32,116,104,101,32,100,105,114,101,99,
+    116,111,114,121,32,119,97,115,32,108,97,115,116,32,109,111,
+    100,105,102,105,101,100,10,32,32,32,32,32,32,32,32,98,
+    101,102,111,114,101,32,116,104,101,32,99,114,101,97,116,105,
+    111,110,32,111,102,32,116,104,101,32,116,101,109,112,111,114,
+    97,114,121,32,105,110,100,101,120,32,102,105,108,101,44,32,
+    119,104,105,99,104,32,105,115,32,100,111,110,101,10,32,32,
+    32,32,32,32,32,32,98,101,102,111,114,101,32,108,105,115,
+    116,105,110,103,46,10,10,32,32,32,32,32,32,32,32,78,
+    122,5,123,125,46,123,125,105,182,1,0,0,114,101,0,0,
+    0,114,57,0,0,0,114,121,1,0,0,122,5,117,116,102,
+    45,56,114,120,1,0,0,115,1,0,0,0,10,122,10,119,
+    114,111,116,101,32,123,33,114,125,114,161,0,0,0,114,131,
+    0,0,0,41,27,114,119,1,0,0,114,8,0,0,0,114,
+    57,1,0,0,114,112,1,0,0,114,58,0,0,0,114,59,
+    0,0,0,114,3,0,0,0,114,60,0,0,0,114,61,0,
+    0,0,114,62,0,0,0,114,63,0,0,0,114,115,1,0,
+    0,114,67,1,0,0,114,48,0,0,0,114,50,0,0,0,
+    114,64,0,0,0,114,65,0,0,0,90,5,102,115,116,97,
+    116,114,65,1,0,0,114,36,0,0,0,114,124,1,0,0,
+    114,66,0,0,0,114,122,1,0,0,114,123,1,0,0,114,
+    68,0,0,0,114,67,0,0,0,114,168,0,0,0,41,8,
+    114,88,0,0,0,114,199,0,0,0,114,126,1,0,0,114,
+    70,0,0,0,114,71,0,0,0,114,114,1,0,0,114,72,
+    0,0,0,114,127,1,0,0,114,5,0,0,0,114,5,0,
+    0,0,114,6,0,0,0,114,111,1,0,0,42,8,0,0,
+    115,72,0,0,0,0,10,12,1,21,1,10,1,24,1,3,
+    1,9,1,33,1,13,3,3,1,27,1,13,1,5,1,14,
+    1,13,1,15,1,6,1,3,1,21,1,24,1,12,1,18,
+    1,9,1,6,1,40,1,12,1,16,2,16,1,23,1,13,
+    1,3,1,17,1,13,1,10,1,12,2,10,1,122,29,70,
+    105,108,101,70,105,110,100,101,114,46,95,108,105,115,116,100,
+    105,114,95,97,110,100,95,105,110,100,101,120,99,1,0,0,
+    0,0,0,0,0,3,0,0,0,3,0,0,0,7,0,0,
+    0,115,25,0,0,0,135,0,0,135,1,0,102,2,0,100,
+    1,0,100,2,0,134,0,0,125,2,0,124,2,0,83,41,
+    3,97,20,1,0,0,65,32,99,108,97,115,115,32,109,101,
+    116,104,111,100,32,119,104,105,99,104,32,114,101,116,117,114,
+    110,115,32,97,32,99,108,111,115,117,114,101,32,116,111,32,
+    117,115,101,32,111,110,32,115,121,115,46,112,97,116,104,95,
+    104,111,111,107,10,32,32,32,32,32,32,32,32,119,104,105,
+    99,104,32,119,105,108,108,32,114,101,116,117,114,110,32,97,
+    110,32,105,110,115,116,97,110,99,101,32,117,115,105,110,103,
+    32,116,104,101,32,115,112,101,99,105,102,105,101,100,32,108,
+    111,97,100,101,114,115,32,97,110,100,32,116,104,101,32,112,
+    97,116,104,10,32,32,32,32,32,32,32,32,99,97,108,108,
+    101,100,32,111,110,32,116,104,101,32,99,108,111,115,117,114,
+    101,46,10,10,32,32,32,32,32,32,32,32,73,102,32,116,
+    104,101,32,112,97,116,104,32,99,97,108,108,101,100,32,111,
+    110,32,116,104,101,32,99,108,111,115,117,114,101,32,105,115,
+    32,110,111,116,32,97,32,100,105,114,101,99,116,111,114,121,
+    44,32,73,109,112,111,114,116,69,114,114,111,114,32,105,115,
+    10,32,32,32,32,32,32,32,32,114,97,105,115,101,100,46,
+    10,10,32,32,32,32,32,32,32,32,99,1,0,0,0,0,
+    0,0,0,1,0,0,0,4,0,0,0,19,0,0,0,115,
+    46,0,0,0,116,0,0,124,0,0,131,1,0,115,33,0,
+    116,1,0,100,1,0,100,2,0,124,0,0,131,1,1,130,
+    1,0,110,0,0,136,0,0,124,0,0,136,1,0,140,1,
+    0,83,41,3,122,45,80,97,116,104,32,104,111,111,107,32,
+    102,111,114,32,105,109,112,111,114,116,108,105,98,46,109,97,
+    99,104,105,110,101,114,121,46,70,105,108,101,70,105,110,100,
+    101,114,46,122,30,111,110,108,121,32,100,105,114,101,99,116,
+    111,114,105,101,115,32,97,114,101,32,115,117,112,112,111,114,
+    116,101,100,114,45,0,0,0,41,2,114,56,0,0,0,114,
+    169,0,0,0,41,1,114,45,0,0,0,41,2,114,6,1,
+    0,0,114,106,1,0,0,114,5,0,0,0,114,6,0,0,
+    0,218,24,112,97,116,104,95,104,111,111,107,95,102,111,114,
+    95,70,105,108,101,70,105,110,100,101,114,103,8,0,0,115,
+    6,0,0,0,0,2,12,1,21,1,122,54,70,105,108,101,
+    70,105,110,100,101,114,46,112,97,116,104,95,104,111,111,107,
+    46,60,108,111,99,97,108,115,62,46,112,97,116,104,95,104,
+    111,111,107,95,102,111,114,95,70,105,108,101,70,105,110,100,
+    101,114,114,5,0,0,0,41,3,114,6,1,0,0,114,106,
+    1,0,0,114,128,1,0,0,114,5,0,0,0,41,2,114,
+    6,1,0,0,114,106,1,0,0,114,6,0,0,0,218,9,
+    112,97,116,104,95,104,111,111,107,93,8,0,0,115,4,0,
+    0,0,0,10,21,6,122,20,70,105,108,101,70,105,110,100,
+    101,114,46,112,97,116,104,95,104,111,111,107,99,1,0,0,
+    0,0,0,0,0,1,0,0,0,2,0,0,0,67,0,0,
+    0,115,16,0,0,0,100,1,0,106,0,0,124,0,0,106,
+    1,0,131,1,0,83,41,2,78,122,16,70,105,108,101,70,
+    105,110,100,101,114,40,123,33,114,125,41,41,2,114,58,0,
+    0,0,114,45,0,0,0,41,1,114,88,0,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,114,117,0,
+    0,0,111,8,0,0,115,2,0,0,0,0,1,122,19,70,
+    105,108,101,70,105,110,100,101,114,46,95,95,114,101,112,114,
+    95,95,114,154,0,0,0,41,20,114,17,0,0,0,114,74,
+    0,0,0,114,75,0,0,0,114,76,0,0,0,114,89,0,
+    0,0,114,109,1,0,0,114,88,1,0,0,114,188,0,0,
+    0,114,28,1,0,0,114,181,0,0,0,114,99,1,0,0,
+    114,27,1,0,0,114,107,1,0,0,114,112,1,0,0,114,
+    119,1,0,0,114,110,1,0,0,114,111,1,0,0,114,24,
+    1,0,0,114,129,1,0,0,114,117,0,0,0,114,5,0,
+    0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,114,100,1,0,0,124,7,0,0,115,30,0,0,0,12,
+    7,6,2,12,16,6,2,12,4,6,2,12,8,12,10,15,
+    45,15,37,12,9,12,8,12,24,12,51,18,18,114,100,1,
+    0,0,99,0,0,0,0,0,0,0,0,0,0,0,0,2,
+    0,0,0,64,0,0,0,115,46,0,0,0,101,0,0,90,
+    1,0,100,0,0,90,2,0,100,1,0,90,3,0,100,2,
+    0,100,3,0,132,0,0,90,4,0,100,4,0,100,5,0,
+    132,0,0,90,5,0,100,6,0,83,41,7,218,18,95,73,
+    109,112,111,114,116,76,111,99,107,67,111,110,116,101,120,116,
+    122,36,67,111,110,116,101,120,116,32,109,97,110,97,103,101,
+    114,32,102,111,114,32,116,104,101,32,105,109,112,111,114,116,
+    32,108,111,99,107,46,99,1,0,0,0,0,0,0,0,1,
+    0,0,0,1,0,0,0,67,0,0,0,115,14,0,0,0,
+    116,0,0,106,1,0,131,0,0,1,100,1,0,83,41,2,
+    122,24,65,99,113,117,105,114,101,32,116,104,101,32,105,109,
+    112,111,114,116,32,108,111,99,107,46,78,41,2,114,122,0,
+    0,0,114,19,1,0,0,41,1,114,88,0,0,0,114,5,
+    0,0,0,114,5,0,0,0,114,6,0,0,0,114,92,0,
+    0,0,121,8,0,0,115,2,0,0,0,0,2,122,28,95,
+    73,109,112,111,114,116,76,111,99,107,67,111,110,116,101,120,
+    116,46,95,95,101,110,116,101,114,95,95,99,4,0,0,0,
+    0,0,0,0,4,0,0,0,1,0,0,0,67,0,0,0,
+    115,14,0,0,0,116,0,0,106,1,0,131,0,0,1,100,
+    1,0,83,41,2,122,60,82,101,108,101,97,115,101,32,116,
+    104,101,32,105,109,112,111,114,116,32,108,111,99,107,32,114,
+    101,103,97,114,100,108,101,115,115,32,111,102,32,97,110,121,
+    32,114,97,105,115,101,100,32,101,120,99,101,112,116,105,111,
+    110,115,46,78,41,2,114,122,0,0,0,114,123,0,0,0,
+    41,4,114,88,0,0,0,90,8,101,120,99,95,116,121,112,
+    101,90,9,101,120,99,95,118,97,108,117,101,90,13,101,120,
+    99,95,116,114,97,99,101,98,97,99,107,114,5,0,0,0,
+    114,5,0,0,0,114,6,0,0,0,114,98,0,0,0,125,
+    8,0,0,115,2,0,0,0,0,2,122,27,95,73,109,112,
+    111,114,116,76,111,99,107,67,111,110,116,101,120,116,46,95,
+    95,101,120,105,116,95,95,78,41,6,114,17,0,0,0,114,
+    74,0,0,0,114,75,0,0,0,114,76,0,0,0,114,92,
+    0,0,0,114,98,0,0,0,114,5,0,0,0,114,5,0,
+    0,0,114,5,0,0,0,114,6,0,0,0,114,130,1,0,
+    0,117,8,0,0,115,6,0,0,0,12,2,6,2,12,4,
+    114,130,1,0,0,99,3,0,0,0,0,0,0,0,5,0,
+    0,0,4,0,0,0,67,0,0,0,115,91,0,0,0,124,
+    1,0,106,0,0,100,1,0,124,2,0,100,2,0,24,131,
+    2,0,125,3,0,116,1,0,124,3,0,131,1,0,124,2,
+    0,107,0,0,114,55,0,116,2,0,100,3,0,131,1,0,
+    130,1,0,110,0,0,124,3,0,100,4,0,25,125,4,0,
+    124,0,0,114,87,0,100,5,0,106,3,0,124,4,0,124,
+    0,0,131,2,0,83,124,4,0,83,41,6,122,50,82,101,
+    115,111,108,118,101,32,97,32,114,101,108,97,116,105,118,101,
+    32,109,111,100,117,108,101,32,110,97,109,101,32,116,111,32,
+    97,110,32,97,98,115,111,108,117,116,101,32,111,110,101,46,
+    114,132,0,0,0,114,39,0,0,0,122,50,97,116,116,101,
+    109,112,116,101,100,32,114,101,108,97,116,105,118,101,32,105,
+    109,112,111,114,116,32,98,101,121,111,110,100,32,116,111,112,
+    45,108,101,118,101,108,32,112,97,99,107,97,103,101,114,101,
+    0,0,0,122,5,123,125,46,123,125,41,4,114,44,0,0,
+    0,114,41,0,0,0,114,149,0,0,0,114,58,0,0,0,
+    41,5,114,84,0,0,0,218,7,112,97,99,107,97,103,101,
+    218,5,108,101,118,101,108,90,4,98,105,116,115,90,4,98,
+    97,115,101,114,5,0,0,0,114,5,0,0,0,114,6,0,
+    0,0,218,13,95,114,101,115,111,108,118,101,95,110,97,109,
+    101,130,8,0,0,115,10,0,0,0,0,2,22,1,18,1,
+    15,1,10,1,114,133,1,0,0,99,3,0,0,0,0,0,
+    0,0,10,0,0,0,27,0,0,0,67,0,0,0,115,49,
+    1,0,0,116,0,0,106,1,0,115,28,0,116,2,0,106,
+    3,0,100,1,0,116,4,0,131,2,0,1,110,0,0,124,
+    0,0,116,0,0,106,5,0,107,6,0,125,3,0,120,255,
+    0,116,0,0,106,1,0,68,93,240,0,125,4,0,116,6,
+    0,131,0,0,143,108,0,1,121,13,0,124,4,0,106,7,
+    0,125,5,0,87,110,69,0,4,116,8,0,107,10,0,114,
+    153,0,1,1,1,124,4,0,106,9,0,124,0,0,124,1,
+    0,131,2,0,125,6,0,124,6,0,100,2,0,107,8,0,
+    114,134,0,119,53,0,110,0,0,116,10,0,124,0,0,124,
+    6,0,131,2,0,125,7,0,89,110,19,0,88,124,5,0,
+    124,0,0,124,1,0,124,2,0,131,3,0,125,7,0,87,
+    100,2,0,81,88,124,7,0,100,2,0,107,9,0,114,53,
+    0,124,3,0,12,114,30,1,124,0,0,116,0,0,106,5,
+    0,107,6,0,114,30,1,116,0,0,106,5,0,124,0,0,
+    25,125,8,0,121,13,0,124,8,0,106,11,0,125,9,0,
+    87,110,22,0,4,116,8,0,107,10,0,114,6,1,1,1,
+    1,124,7,0,83,89,113,34,1,88,124,9,0,100,2,0,
+    107,8,0,114,23,1,124,7,0,83,124,9,0,83,113,37,
+    1,124,7,0,83,113,53,0,113,53,0,87,100,2,0,83,
+    100,2,0,83,41,3,122,23,70,105,110,100,32,97,32,109,
+    111,100,117,108,101,39,115,32,108,111,97,100,101,114,46,122,
+    22,115,121,115,46,109,101,116,97,95,112,97,116,104,32,105,
+    115,32,101,109,112,116,121,78,41,12,114,8,0,0,0,218,
+    9,109,101,116,97,95,112,97,116,104,114,182,0,0,0,114,
+    183,0,0,0,114,184,0,0,0,114,90,0,0,0,114,130,
+    1,0,0,114,27,1,0,0,114,225,0,0,0,114,28,1,
+    0,0,114,189,0,0,0,114,224,0,0,0,41,10,114,84,
+    0,0,0,114,45,0,0,0,114,26,1,0,0,90,9,105,
+    115,95,114,101,108,111,97,100,114,91,1,0,0,114,27,1,
+    0,0,114,185,0,0,0,114,193,0,0,0,114,195,0,0,
+    0,114,224,0,0,0,114,5,0,0,0,114,5,0,0,0,
+    114,6,0,0,0,114,5,1,0,0,139,8,0,0,115,50,
+    0,0,0,0,2,9,1,19,4,15,1,16,1,10,1,3,
+    1,13,1,13,1,18,1,12,1,6,1,20,2,24,1,12,
+    2,22,1,13,1,3,1,13,1,13,4,9,2,12,1,4,
+    2,7,2,11,2,114,5,1,0,0,99,3,0,0,0,0,
+    0,0,0,4,0,0,0,4,0,0,0,67,0,0,0,115,
+    194,0,0,0,116,0,0,124,0,0,116,1,0,131,2,0,
+    115,45,0,116,2,0,100,1,0,106,3,0,116,4,0,124,
+    0,0,131,1,0,131,1,0,131,1,0,130,1,0,110,0,
+    0,124,2,0,100,2,0,107,0,0,114,72,0,116,5,0,
+    100,3,0,131,1,0,130,1,0,110,0,0,124,1,0,114,
+    156,0,116,0,0,124,1,0,116,1,0,131,2,0,115,108,
+    0,116,2,0,100,4,0,131,1,0,130,1,0,113,156,0,
+    124,1,0,116,6,0,106,7,0,107,7,0,114,156,0,100,
+    5,0,125,3,0,116,8,0,124,3,0,106,3,0,124,1,
+    0,131,1,0,131,1,0,130,1,0,113,156,0,110,0,0,
+    124,0,0,12,114,190,0,124,2,0,100,2,0,107,2,0,
+    114,190,0,116,5,0,100,6,0,131,1,0,130,1,0,110,
+    0,0,100,7,0,83,41,8,122,28,86,101,114,105,102,121,
+    32,97,114,103,117,109,101,110,116,115,32,97,114,101,32,34,
+    115,97,110,101,34,46,122,31,109,111,100,117,108,101,32,110,
+    97,109,101,32,109,117,115,116,32,98,101,32,115,116,114,44,
+    32,110,111,116,32,123,125,114,101,0,0,0,122,18,108,101,
+    118,101,108,32,109,117,115,116,32,98,101,32,62,61,32,48,
+    122,31,95,95,112,97,99,107,97,103,101,95,95,32,110,111,
+    116,32,115,101,116,32,116,111,32,97,32,115,116,114,105,110,
+    103,122,61,80,97,114,101,110,116,32,109,111,100,117,108,101,
+    32,123,33,114,125,32,110,111,116,32,108,111,97,100,101,100,
+    44,32,99,97,110,110,111,116,32,112,101,114,102,111,114,109,
+    32,114,101,108,97,116,105,118,101,32,105,109,112,111,114,116,
+    122,17,69,109,112,116,121,32,109,111,100,117,108,101,32,110,
+    97,109,101,78,41,9,114,208,0,0,0,114,96,1,0,0,
+    218,9,84,121,112,101,69,114,114,111,114,114,58,0,0,0,
+    114,83,0,0,0,114,149,0,0,0,114,8,0,0,0,114,
+    90,0,0,0,218,11,83,121,115,116,101,109,69,114,114,111,
+    114,41,4,114,84,0,0,0,114,131,1,0,0,114,132,1,
+    0,0,114,187,0,0,0,114,5,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,218,13,95,115,97,110,105,116,121,95,
+    99,104,101,99,107,180,8,0,0,115,24,0,0,0,0,2,
+    15,1,30,1,12,1,15,1,6,1,15,1,15,1,15,1,
+    6,2,27,1,19,1,114,137,1,0,0,122,16,78,111,32,
+    109,111,100,117,108,101,32,110,97,109,101,100,32,122,4,123,
+    33,114,125,99,2,0,0,0,0,0,0,0,8,0,0,0,
+    12,0,0,0,67,0,0,0,115,52,1,0,0,100,0,0,
+    125,2,0,124,0,0,106,0,0,100,1,0,131,1,0,100,
+    2,0,25,125,3,0,124,3,0,114,178,0,124,3,0,116,
+    1,0,106,2,0,107,7,0,114,62,0,116,3,0,124,1,
+    0,124,3,0,131,2,0,1,110,0,0,124,0,0,116,1,
+    0,106,2,0,107,6,0,114,88,0,116,1,0,106,2,0,
+    124,0,0,25,83,116,1,0,106,2,0,124,3,0,25,125,
+    4,0,121,13,0,124,4,0,106,4,0,125,2,0,87,113,
+    178,0,4,116,5,0,107,10,0,114,174,0,1,1,1,116,
+    6,0,100,3,0,23,106,7,0,124,0,0,124,3,0,131,
+    2,0,125,5,0,116,8,0,124,5,0,100,4,0,124,0,
+    0,131,1,1,130,1,0,89,113,178,0,88,110,0,0,116,
+    9,0,124,0,0,124,2,0,131,2,0,125,6,0,124,6,
+    0,100,0,0,107,8,0,114,235,0,116,8,0,116,6,0,
+    106,7,0,124,0,0,131,1,0,100,4,0,124,0,0,131,
+    1,1,130,1,0,110,18,0,116,10,0,124,6,0,131,1,
+    0,106,11,0,131,0,0,125,7,0,124,3,0,114,48,1,
+    116,1,0,106,2,0,124,3,0,25,125,4,0,116,12,0,
+    124,4,0,124,0,0,106,0,0,100,1,0,131,1,0,100,
+    5,0,25,124,7,0,131,3,0,1,110,0,0,124,7,0,
+    83,41,6,78,114,132,0,0,0,114,101,0,0,0,122,23,
+    59,32,123,33,114,125,32,105,115,32,110,111,116,32,97,32,
+    112,97,99,107,97,103,101,114,84,0,0,0,114,131,0,0,
+    0,41,13,114,42,0,0,0,114,8,0,0,0,114,90,0,
+    0,0,114,130,0,0,0,114,3,1,0,0,114,225,0,0,
+    0,218,8,95,69,82,82,95,77,83,71,114,58,0,0,0,
+    114,169,0,0,0,114,5,1,0,0,114,190,0,0,0,114,
+    23,1,0,0,114,78,0,0,0,41,8,114,84,0,0,0,
+    218,7,105,109,112,111,114,116,95,114,45,0,0,0,114,247,
+    0,0,0,90,13,112,97,114,101,110,116,95,109,111,100,117,
+    108,101,114,187,0,0,0,114,193,0,0,0,114,195,0,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
+    218,23,95,102,105,110,100,95,97,110,100,95,108,111,97,100,
+    95,117,110,108,111,99,107,101,100,200,8,0,0,115,42,0,
+    0,0,0,1,6,1,19,1,6,1,15,1,16,2,15,1,
+    11,1,13,1,3,1,13,1,13,1,22,1,26,1,15,1,
+    12,1,30,2,18,1,6,2,13,1,32,1,114,140,1,0,
+    0,99,2,0,0,0,0,0,0,0,2,0,0,0,10,0,
+    0,0,67,0,0,0,115,36,0,0,0,116,0,0,124,0,
+    0,131,1,0,143,18,0,1,116,1,0,124,0,0,124,1,
+    0,131,2,0,83,87,100,1,0,81,88,100,1,0,83,41,
+    2,122,54,70,105,110,100,32,97,110,100,32,108,111,97,100,
+    32,116,104,101,32,109,111,100,117,108,101,44,32,97,110,100,
+    32,114,101,108,101,97,115,101,32,116,104,101,32,105,109,112,
+    111,114,116,32,108,111,99,107,46,78,41,2,114,119,0,0,
+    0,114,140,1,0,0,41,2,114,84,0,0,0,114,139,1,
+    0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,218,14,95,102,105,110,100,95,97,110,100,95,108,111,97,
+    100,227,8,0,0,115,4,0,0,0,0,2,13,1,114,141,
+    1,0,0,99,3,0,0,0,0,0,0,0,5,0,0,0,
+    4,0,0,0,67,0,0,0,115,172,0,0,0,116,0,0,
+    124,0,0,124,1,0,124,2,0,131,3,0,1,124,2,0,
+    100,1,0,107,4,0,114,49,0,116,1,0,124,0,0,124,
+    1,0,124,2,0,131,3,0,125,0,0,110,0,0,116,2,
+    0,106,3,0,131,0,0,1,124,0,0,116,4,0,106,5,
+    0,107,7,0,114,87,0,116,6,0,124,0,0,116,7,0,
+    131,2,0,83,116,4,0,106,5,0,124,0,0,25,125,3,
+    0,124,3,0,100,2,0,107,8,0,114,158,0,116,2,0,
+    106,8,0,131,0,0,1,100,3,0,106,9,0,124,0,0,
+    131,1,0,125,4,0,116,10,0,124,4,0,100,4,0,124,
+    0,0,131,1,1,130,1,0,110,0,0,116,11,0,124,0,
+    0,131,1,0,1,124,3,0,83,41,5,97,50,1,0,0,
+    73,109,112,111,114,116,32,97,110,100,32,114,101,116,117,114,
+    110,32,116,104,101,32,109,111,100,117,108,101,32,98,97,115,
+    101,100,32,111,110,32,105,116,115,32,110,97,109,101,44,32,
+    116,104,101,32,112,97,99,107,97,103,101,32,116,104,101,32,
+    99,97,108,108,32,105,115,10,32,32,32,32,98,101,105,110,
+    103,32,109,97,100,101,32,102,114,111,109,44,32,97,110,100,
+    32,116,104,101,32,108,101,118,101,108,32,97,100,106,117,115,
+    116,109,101,110,116,46,10,10,32,32,32,32,84,104,105,115,
+    32,102,117,110,99,116,105,111,110,32,114,101,112,114,101,115,
+    101,110,116,115,32,116,104,101,32,103,114,101,97,116,101,115,
+    116,32,99,111,109,109,111,110,32,100,101,110,111,109,105,110,
+    97,116,111,114,32,111,102,32,102,117,110,99,116,105,111,110,
+    97,108,105,116,121,10,32,32,32,32,98,101,116,119,101,101,
+    110,32,105,109,112,111,114,116,95,109,111,100,117,108,101,32,
+    97,110,100,32,95,95,105,109,112,111,114,116,95,95,46,32,
+    84,104,105,115,32,105,110,99,108,117,100,101,115,32,115,101,
+    116,116,105,110,103,32,95,95,112,97,99,107,97,103,101,95,
+    95,32,105,102,10,32,32,32,32,116,104,101,32,108,111,97,
+    100,101,114,32,100,105,100,32,110,111,116,46,10,10,32,32,
+    32,32,114,101,0,0,0,78,122,40,105,109,112,111,114,116,
+    32,111,102,32,123,125,32,104,97,108,116,101,100,59,32,78,
+    111,110,101,32,105,110,32,115,121,115,46,109,111,100,117,108,
+    101,115,114,84,0,0,0,41,12,114,137,1,0,0,114,133,
+    1,0,0,114,122,0,0,0,114,19,1,0,0,114,8,0,
+    0,0,114,90,0,0,0,114,141,1,0,0,218,11,95,103,
+    99,100,95,105,109,112,111,114,116,114,123,0,0,0,114,58,
+    0,0,0,114,169,0,0,0,114,128,0,0,0,41,5,114,
+    84,0,0,0,114,131,1,0,0,114,132,1,0,0,114,195,
+    0,0,0,114,167,0,0,0,114,5,0,0,0,114,5,0,
+    0,0,114,6,0,0,0,114,142,1,0,0,233,8,0,0,
+    115,26,0,0,0,0,9,16,1,12,1,21,1,10,1,15,
+    1,13,1,13,1,12,1,10,2,15,1,21,1,10,1,114,
+    142,1,0,0,99,3,0,0,0,0,0,0,0,6,0,0,
+    0,17,0,0,0,67,0,0,0,115,1,1,0,0,116,0,
+    0,124,0,0,100,1,0,131,2,0,114,253,0,100,2,0,
+    124,1,0,107,6,0,114,89,0,116,1,0,124,1,0,131,
+    1,0,125,1,0,124,1,0,106,2,0,100,2,0,131,1,
+    0,1,116,0,0,124,0,0,100,3,0,131,2,0,114,89,
+    0,124,1,0,106,3,0,124,0,0,106,4,0,131,1,0,
+    1,113,89,0,110,0,0,120,161,0,124,1,0,68,93,150,
+    0,125,3,0,116,0,0,124,0,0,124,3,0,131,2,0,
+    115,96,0,100,4,0,106,5,0,124,0,0,106,6,0,124,
+    3,0,131,2,0,125,4,0,121,17,0,116,7,0,124,2,
+    0,124,4,0,131,2,0,1,87,113,246,0,4,116,8,0,
+    107,10,0,114,242,0,1,125,5,0,1,122,53,0,116,9,
+    0,124,5,0,131,1,0,106,10,0,116,11,0,131,1,0,
+    114,221,0,124,5,0,106,12,0,124,4,0,107,2,0,114,
+    221,0,119,96,0,113,221,0,110,0,0,130,0,0,87,89,
+    100,5,0,100,5,0,125,5,0,126,5,0,88,113,246,0,
+    88,113,96,0,113,96,0,87,110,0,0,124,0,0,83,41,
+    6,122,238,70,105,103,117,114,101,32,111,117,116,32,119,104,
+    97,116,32,95,95,105,109,112,111,114,116,95,95,32,115,104,
+    111,117,108,100,32,114,101,116,117,114,110,46,10,10,32,32,
+    32,32,84,104,101,32,105,109,112,111,114,116,95,32,112,97,
+    114,97,109,101,116,101,114,32,105,115,32,97,32,99,97,108,
+    108,97,98,108,101,32,119,104,105,99,104,32,116,97,107,101,
+    115,32,116,104,101,32,110,97,109,101,32,111,102,32,109,111,
+    100,117,108,101,32,116,111,10,32,32,32,32,105,109,112,111,
+    114,116,46,32,73,116,32,105,115,32,114,101,113,117,105,114,
+    101,100,32,116,111,32,100,101,99,111,117,112,108,101,32,116,
+    104,101,32,102,117,110,99,116,105,111,110,32,102,114,111,109,
+    32,97,115,115,117,109,105,110,103,32,105,109,112,111,114,116,
+    108,105,98,39,115,10,32,32,32,32,105,109,112,111,114,116,
+    32,105,109,112,108,101,109,101,110,116,97,116,105,111,110,32,
+    105,115,32,100,101,115,105,114,101,100,46,10,10,32,32,32,
+    32,114,3,1,0,0,250,1,42,218,7,95,95,97,108,108,
+    95,95,122,5,123,125,46,123,125,78,41,13,114,77,0,0,
+    0,114,2,1,0,0,218,6,114,101,109,111,118,101,114,213,
+    0,0,0,114,144,1,0,0,114,58,0,0,0,114,17,0,
+    0,0,114,130,0,0,0,114,169,0,0,0,114,96,1,0,
+    0,114,10,0,0,0,218,15,95,69,82,82,95,77,83,71,
+    95,80,82,69,70,73,88,114,84,0,0,0,41,6,114,195,
+    0,0,0,218,8,102,114,111,109,108,105,115,116,114,139,1,
+    0,0,114,26,0,0,0,90,9,102,114,111,109,95,110,97,
+    109,101,114,52,1,0,0,114,5,0,0,0,114,5,0,0,
+    0,114,6,0,0,0,218,16,95,104,97,110,100,108,101,95,
+    102,114,111,109,108,105,115,116,1,9,0,0,115,34,0,0,
+    0,0,10,15,1,12,1,12,1,13,1,15,1,22,1,13,
+    1,15,1,21,1,3,1,17,1,18,4,21,1,15,1,9,
+    1,32,1,114,148,1,0,0,99,1,0,0,0,0,0,0,
+    0,2,0,0,0,2,0,0,0,67,0,0,0,115,78,0,
+    0,0,124,0,0,106,0,0,100,1,0,131,1,0,125,1,
+    0,124,1,0,100,2,0,107,8,0,114,74,0,124,0,0,
+    100,3,0,25,125,1,0,100,4,0,124,0,0,107,7,0,
+    114,74,0,124,1,0,106,1,0,100,5,0,131,1,0,100,
+    6,0,25,125,1,0,113,74,0,110,0,0,124,1,0,83,
+    41,7,122,167,67,97,108,99,117,108,97,116,101,32,119,104,
+    97,116,32,95,95,112,97,99,107,97,103,101,95,95,32,115,
+    104,111,117,108,100,32,98,101,46,10,10,32,32,32,32,95,
+    95,112,97,99,107,97,103,101,95,95,32,105,115,32,110,111,
+    116,32,103,117,97,114,97,110,116,101,101,100,32,116,111,32,
+    98,101,32,100,101,102,105,110,101,100,32,111,114,32,99,111,
+    117,108,100,32,98,101,32,115,101,116,32,116,111,32,78,111,
+    110,101,10,32,32,32,32,116,111,32,114,101,112,114,101,115,
+    101,110,116,32,116,104,97,116,32,105,116,115,32,112,114,111,
+    112,101,114,32,118,97,108,117,101,32,105,115,32,117,110,107,
+    110,111,119,110,46,10,10,32,32,32,32,114,10,1,0,0,
+    78,114,17,0,0,0,114,3,1,0,0,114,132,0,0,0,
+    114,101,0,0,0,41,2,114,19,0,0,0,114,42,0,0,
+    0,41,2,218,7,103,108,111,98,97,108,115,114,131,1,0,
+    0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,0,
+    218,17,95,99,97,108,99,95,95,95,112,97,99,107,97,103,
+    101,95,95,33,9,0,0,115,12,0,0,0,0,7,15,1,
+    12,1,10,1,12,1,25,1,114,150,1,0,0,99,0,0,
+    0,0,0,0,0,0,3,0,0,0,3,0,0,0,67,0,
+    0,0,115,55,0,0,0,116,0,0,116,1,0,106,2,0,
+    131,0,0,102,2,0,125,0,0,116,3,0,116,4,0,102,
+    2,0,125,1,0,116,5,0,116,6,0,102,2,0,125,2,
+    0,124,0,0,124,1,0,124,2,0,103,3,0,83,41,1,
+    122,95,82,101,116,117,114,110,115,32,97,32,108,105,115,116,
+    32,111,102,32,102,105,108,101,45,98,97,115,101,100,32,109,
+    111,100,117,108,101,32,108,111,97,100,101,114,115,46,10,10,
+    32,32,32,32,69,97,99,104,32,105,116,101,109,32,105,115,
+    32,97,32,116,117,112,108,101,32,40,108,111,97,100,101,114,
+    44,32,115,117,102,102,105,120,101,115,41,46,10,32,32,32,
+    32,41,7,114,70,1,0,0,114,122,0,0,0,218,18,101,
+    120,116,101,110,115,105,111,110,95,115,117,102,102,105,120,101,
+    115,114,64,1,0,0,114,150,0,0,0,114,69,1,0,0,
+    114,246,0,0,0,41,3,90,10,101,120,116,101,110,115,105,
+    111,110,115,90,6,115,111,117,114,99,101,90,8,98,121,116,
+    101,99,111,100,101,114,5,0,0,0,114,5,0,0,0,114,
+    6,0,0,0,114,253,0,0,0,48,9,0,0,115,8,0,
+    0,0,0,5,18,1,12,1,12,1,114,253,0,0,0,99,
+    5,0,0,0,0,0,0,0,9,0,0,0,5,0,0,0,
+    67,0,0,0,115,227,0,0,0,124,4,0,100,1,0,107,
+    2,0,114,27,0,116,0,0,124,0,0,131,1,0,125,5,
+    0,110,54,0,124,1,0,100,2,0,107,9,0,114,45,0,
+    124,1,0,110,3,0,105,0,0,125,6,0,116,1,0,124,
+    6,0,131,1,0,125,7,0,116,0,0,124,0,0,124,7,
+    0,124,4,0,131,3,0,125,5,0,124,3,0,115,207,0,
+    124,4,0,100,1,0,107,2,0,114,122,0,116,0,0,124,
+    0,0,106,2,0,100,3,0,131,1,0,100,1,0,25,131,
+    1,0,83,124,0,0,115,132,0,124,5,0,83,116,3,0,
+    124,0,0,131,1,0,116,3,0,124,0,0,106,2,0,100,
+    3,0,131,1,0,100,1,0,25,131,1,0,24,125,8,0,
+    116,4,0,106,5,0,124,5,0,106,6,0,100,2,0,116,
+    3,0,124,5,0,106,6,0,131,1,0,124,8,0,24,133,
+    2,0,25,25,83,110,16,0,116,7,0,124,5,0,124,3,
+    0,116,0,0,131,3,0,83,100,2,0,83,41,4,97,214,
+    1,0,0,73,109,112,111,114,116,32,97,32,109,111,100,117,
+    108,101,46,10,10,32,32,32,32,84,104,101,32,39,103,108,
+    111,98,97,108,115,39,32,97,114,103,117,109,101,110,116,32,
+    105,115,32,117,115,101,100,32,116,111,32,105,110,102,101,114,
+    32,119,104,101,114,101,32,116,104,101,32,105,109,112,111,114,
+    116,32,105,115,32,111,99,99,117,114,105,110,103,32,102,114,
+    111,109,10,32,32,32,32,116,111,32,104,97,110,100,108,101,
+    32,114,101,108,97,116,105,118,101,32,105,109,112,111,114,116,
+    115,46,32,84,104,101,32,39,108,111,99,97,108,115,39,32,
+    97,114,103,117,109,101,110,116,32,105,115,32,105,103,110,111,
+    114,101,100,46,32,84,104,101,10,32,32,32,32,39,102,114,
+    111,109,108,105,115,116,39,32,97,114,103,117,109,101,110,116,
+    32,115,112,101,99,105,102,105,101,115,32,119,104,97,116,32,
+    115,104,111,117,108,100,32,101,120,105,115,116,32,97,115,32,
+    97,116,116,114,105,98,117,116,101,115,32,111,110,32,116,104,
+    101,32,109,111,100,117,108,101,10,32,32,32,32,98,101,105,
+    110,103,32,105,109,112,111,114,116,101,100,32,40,101,46,103,
+    46,32,96,96,102,114,111,109,32,109,111,100,117,108,101,32,
+    105,109,112,111,114,116,32,60,102,114,111,109,108,105,115,116,
+    62,96,96,41,46,32,32,84,104,101,32,39,108,101,118,101,
+    108,39,10,32,32,32,32,97,114,103,117,109,101,110,116,32,
+    114,101,112,114,101,115,101,110,116,115,32,116,104,101,32,112,
+    97,99,107,97,103,101,32,108,111,99,97,116,105,111,110,32,
+    116,111,32,105,109,112,111,114,116,32,102,114,111,109,32,105,
+    110,32,97,32,114,101,108,97,116,105,118,101,10,32,32,32,
+    32,105,109,112,111,114,116,32,40,101,46,103,46,32,96,96,
+    102,114,111,109,32,46,46,112,107,103,32,105,109,112,111,114,
+    116,32,109,111,100,96,96,32,119,111,117,108,100,32,104,97,
+    118,101,32,97,32,39,108,101,118,101,108,39,32,111,102,32,
+    50,41,46,10,10,32,32,32,32,114,101,0,0,0,78,114,
+    132,0,0,0,41,8,114,142,1,0,0,114,150,1,0,0,
+    114,136,0,0,0,114,41,0,0,0,114,8,0,0,0,114,
+    90,0,0,0,114,17,0,0,0,114,148,1,0,0,41,9,
+    114,84,0,0,0,114,149,1,0,0,218,6,108,111,99,97,
+    108,115,114,147,1,0,0,114,132,1,0,0,114,195,0,0,
+    0,90,8,103,108,111,98,97,108,115,95,114,131,1,0,0,
+    90,7,99,117,116,95,111,102,102,114,5,0,0,0,114,5,
+    0,0,0,114,6,0,0,0,218,10,95,95,105,109,112,111,
+    114,116,95,95,59,9,0,0,115,26,0,0,0,0,11,12,
+    1,15,2,24,1,12,1,18,1,6,3,12,1,23,1,6,
+    1,4,4,35,3,40,2,114,153,1,0,0,99,1,0,0,
+    0,0,0,0,0,3,0,0,0,3,0,0,0,67,0,0,
+    0,115,68,0,0,0,116,0,0,106,1,0,124,0,0,131,
+    1,0,125,1,0,124,1,0,100,0,0,107,8,0,114,46,
+    0,116,2,0,100,1,0,124,0,0,23,131,1,0,130,1,
+    0,110,0,0,116,3,0,124,1,0,131,1,0,125,2,0,
+    124,2,0,106,4,0,131,0,0,83,41,2,78,122,25,110,
+    111,32,98,117,105,108,116,45,105,110,32,109,111,100,117,108,
+    101,32,110,97,109,101,100,32,41,5,114,25,1,0,0,114,
+    27,1,0,0,114,169,0,0,0,114,190,0,0,0,114,23,
+    1,0,0,41,3,114,84,0,0,0,114,193,0,0,0,114,
+    194,0,0,0,114,5,0,0,0,114,5,0,0,0,114,6,
+    0,0,0,218,18,95,98,117,105,108,116,105,110,95,102,114,
+    111,109,95,110,97,109,101,94,9,0,0,115,10,0,0,0,
+    0,1,15,1,12,1,19,1,12,1,114,154,1,0,0,99,
+    2,0,0,0,0,0,0,0,19,0,0,0,12,0,0,0,
+    67,0,0,0,115,244,2,0,0,124,1,0,97,0,0,124,
+    0,0,97,1,0,116,1,0,106,2,0,106,3,0,114,33,
+    0,116,4,0,97,5,0,110,6,0,116,6,0,97,5,0,
+    116,7,0,116,1,0,131,1,0,125,2,0,120,138,0,116,
+    1,0,106,8,0,106,9,0,131,0,0,68,93,121,0,92,
+    2,0,125,3,0,125,4,0,116,10,0,124,4,0,124,2,
+    0,131,2,0,114,67,0,124,3,0,116,1,0,106,11,0,
+    107,6,0,114,118,0,116,12,0,125,5,0,110,27,0,116,
+    0,0,106,13,0,124,3,0,131,1,0,114,67,0,116,14,
+    0,125,5,0,110,3,0,113,67,0,116,15,0,124,4,0,
+    124,5,0,131,2,0,125,6,0,116,16,0,124,6,0,131,
+    1,0,125,7,0,124,7,0,106,17,0,124,4,0,131,1,
+    0,1,113,67,0,113,67,0,87,116,1,0,106,8,0,116,
+    18,0,25,125,8,0,120,73,0,100,26,0,68,93,65,0,
+    125,9,0,124,9,0,116,1,0,106,8,0,107,7,0,114,
+    248,0,116,19,0,124,9,0,131,1,0,125,10,0,110,13,
+    0,116,1,0,106,8,0,124,9,0,25,125,10,0,116,20,
+    0,124,8,0,124,9,0,124,10,0,131,3,0,1,113,212,
+    0,87,100,5,0,100,6,0,103,1,0,102,2,0,100,7,
+    0,100,8,0,100,6,0,103,2,0,102,2,0,102,2,0,
+    125,11,0,120,146,0,124,11,0,68,93,126,0,92,2,0,
+    125,12,0,125,13,0,116,21,0,100,9,0,100,10,0,132,
+    0,0,124,13,0,68,131,1,0,131,1,0,115,108,1,116,
+    22,0,130,1,0,124,13,0,100,11,0,25,125,14,0,124,
+    12,0,116,1,0,106,8,0,107,6,0,114,150,1,116,1,
+    0,106,8,0,124,12,0,25,125,15,0,80,113,65,1,121,
+    17,0,116,19,0,124,12,0,131,1,0,125,15,0,80,87,
+    113,65,1,4,116,23,0,107,10,0,114,190,1,1,1,1,
+    119,65,1,89,113,65,1,88,113,65,1,87,116,23,0,100,
+    12,0,131,1,0,130,1,0,116,20,0,124,8,0,100,13,
+    0,124,15,0,131,3,0,1,116,20,0,124,8,0,100,14,
+    0,124,14,0,131,3,0,1,116,20,0,124,8,0,100,15,
+    0,100,16,0,106,24,0,124,13,0,131,1,0,131,3,0,
+    1,121,16,0,116,19,0,100,17,0,131,1,0,125,16,0,
+    87,110,24,0,4,116,23,0,107,10,0,114,50,2,1,1,
+    1,100,18,0,125,16,0,89,110,1,0,88,116,20,0,124,
+    8,0,100,17,0,124,16,0,131,3,0,1,116,19,0,100,
+    19,0,131,1,0,125,17,0,116,20,0,124,8,0,100,19,
+    0,124,17,0,131,3,0,1,124,12,0,100,7,0,107,2,
+    0,114,138,2,116,19,0,100,20,0,131,1,0,125,18,0,
+    116,20,0,124,8,0,100,21,0,124,18,0,131,3,0,1,
+    110,0,0,116,20,0,124,8,0,100,22,0,116,25,0,131,
+    0,0,131,3,0,1,116,26,0,131,0,0,116,27,0,95,
+    28,0,116,29,0,106,30,0,116,0,0,106,31,0,131,0,
+    0,131,1,0,1,124,12,0,100,7,0,107,2,0,114,240,
+    2,116,32,0,106,33,0,100,23,0,131,1,0,1,100,24,
+    0,116,29,0,107,6,0,114,240,2,100,25,0,116,34,0,
+    95,35,0,113,240,2,110,0,0,100,18,0,83,41,27,122,
+    250,83,101,116,117,112,32,105,109,112,111,114,116,108,105,98,
+    32,98,121,32,105,109,112,111,114,116,105,110,103,32,110,101,
+    101,100,101,100,32,98,117,105,108,116,45,105,110,32,109,111,
+    100,117,108,101,115,32,97,110,100,32,105,110,106,101,99,116,
+    105,110,103,32,116,104,101,109,10,32,32,32,32,105,110,116,
+    111,32,116,104,101,32,103,108,111,98,97,108,32,110,97,109,
+    101,115,112,97,99,101,46,10,10,32,32,32,32,65,115,32,
+    115,121,115,32,105,115,32,110,101,101,100,101,100,32,102,111,
+    114,32,115,121,115,46,109,111,100,117,108,101,115,32,97,99,
+    99,101,115,115,32,97,110,100,32,95,105,109,112,32,105,115,
+    32,110,101,101,100,101,100,32,116,111,32,108,111,97,100,32,
+    98,117,105,108,116,45,105,110,10,32,32,32,32,109,111,100,
+    117,108,101,115,44,32,116,104,111,115,101,32,116,119,111,32,
+    109,111,100,117,108,101,115,32,109,117,115,116,32,98,101,32,
+    101,120,112,108,105,99,105,116,108,121,32,112,97,115,115,101,
+    100,32,105,110,46,10,10,32,32,32,32,114,64,0,0,0,
+    114,182,0,0,0,218,8,98,117,105,108,116,105,110,115,114,
+    207,0,0,0,90,5,112,111,115,105,120,250,1,47,114,13,
+    0,0,0,250,1,92,99,1,0,0,0,0,0,0,0,2,
+    0,0,0,3,0,0,0,115,0,0,0,115,33,0,0,0,
+    124,0,0,93,23,0,125,1,0,116,0,0,124,1,0,131,
+    1,0,100,0,0,107,2,0,86,1,113,3,0,100,1,0,
+    83,41,2,114,39,0,0,0,78,41,1,114,41,0,0,0,
+    41,2,114,32,0,0,0,114,145,0,0,0,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,114,94,0,0,0,
+    146,9,0,0,115,2,0,0,0,6,0,122,25,95,115,101,
+    116,117,112,46,60,108,111,99,97,108,115,62,46,60,103,101,
+    110,101,120,112,114,62,114,101,0,0,0,122,30,105,109,112,
+    111,114,116,108,105,98,32,114,101,113,117,105,114,101,115,32,
+    112,111,115,105,120,32,111,114,32,110,116,114,3,0,0,0,
+    114,35,0,0,0,114,31,0,0,0,114,40,0,0,0,114,
+    102,0,0,0,78,114,127,0,0,0,90,6,119,105,110,114,
+    101,103,114,36,1,0,0,114,7,0,0,0,122,4,46,112,
+    121,119,122,6,95,100,46,112,121,100,84,41,4,122,3,95,
+    105,111,122,9,95,119,97,114,110,105,110,103,115,122,8,98,
+    117,105,108,116,105,110,115,122,7,109,97,114,115,104,97,108,
+    41,36,114,122,0,0,0,114,8,0,0,0,114,15,0,0,
+    0,114,133,0,0,0,114,135,0,0,0,114,246,0,0,0,
+    114,134,0,0,0,114,83,0,0,0,114,90,0,0,0,218,
+    5,105,116,101,109,115,114,208,0,0,0,114,173,0,0,0,
+    114,25,1,0,0,114,178,0,0,0,114,32,1,0,0,114,
+    4,1,0,0,114,190,0,0,0,114,14,1,0,0,114,17,
+    0,0,0,114,154,1,0,0,114,78,0,0,0,218,3,97,
+    108,108,114,116,0,0,0,114,169,0,0,0,114,36,0,0,
+    0,114,12,0,0,0,114,21,0,0,0,114,100,1,0,0,
+    114,109,1,0,0,114,73,1,0,0,114,213,0,0,0,114,
+    151,1,0,0,114,150,0,0,0,114,239,0,0,0,114,35,
+    1,0,0,114,38,1,0,0,41,19,218,10,115,121,115,95,
+    109,111,100,117,108,101,218,11,95,105,109,112,95,109,111,100,
+    117,108,101,90,11,109,111,100,117,108,101,95,116,121,112,101,
+    114,84,0,0,0,114,195,0,0,0,114,185,0,0,0,114,
+    193,0,0,0,114,194,0,0,0,90,11,115,101,108,102,95,
+    109,111,100,117,108,101,90,12,98,117,105,108,116,105,110,95,
+    110,97,109,101,90,14,98,117,105,108,116,105,110,95,109,111,
+    100,117,108,101,90,10,111,115,95,100,101,116,97,105,108,115,
+    90,10,98,117,105,108,116,105,110,95,111,115,114,31,0,0,
+    0,114,35,0,0,0,90,9,111,115,95,109,111,100,117,108,
+    101,90,13,116,104,114,101,97,100,95,109,111,100,117,108,101,
+    90,14,119,101,97,107,114,101,102,95,109,111,100,117,108,101,
+    90,13,119,105,110,114,101,103,95,109,111,100,117,108,101,114,
+    5,0,0,0,114,5,0,0,0,114,6,0,0,0,218,6,
+    95,115,101,116,117,112,102,9,0,0,115,110,0,0,0,0,
+    9,6,1,6,2,12,1,9,2,6,3,12,1,28,1,15,
+    1,15,1,9,1,15,1,9,2,3,1,15,1,12,1,20,
+    3,13,1,13,1,15,1,15,2,13,1,20,3,33,1,19,
+    2,31,1,10,1,15,1,13,1,4,2,3,1,12,1,5,
+    1,13,1,12,2,12,1,16,1,16,1,25,3,3,1,16,
+    1,13,2,11,1,16,3,12,1,16,3,12,1,12,1,19,
+    3,19,1,12,1,19,1,12,1,13,1,12,1,114,162,1,
+    0,0,99,2,0,0,0,0,0,0,0,3,0,0,0,3,
+    0,0,0,67,0,0,0,115,136,0,0,0,116,0,0,124,
+    0,0,124,1,0,131,2,0,1,116,1,0,131,0,0,125,
+    2,0,116,2,0,106,3,0,106,4,0,116,5,0,106,6,
+    0,124,2,0,140,0,0,103,1,0,131,1,0,1,116,2,
+    0,106,7,0,106,8,0,116,9,0,131,1,0,1,116,2,
+    0,106,7,0,106,8,0,116,10,0,131,1,0,1,116,11,
+    0,106,12,0,100,1,0,107,2,0,114,116,0,116,2,0,
+    106,7,0,106,8,0,116,13,0,131,1,0,1,110,0,0,
+    116,2,0,106,7,0,106,8,0,116,14,0,131,1,0,1,
+    100,2,0,83,41,3,122,50,73,110,115,116,97,108,108,32,
+    105,109,112,111,114,116,108,105,98,32,97,115,32,116,104,101,
+    32,105,109,112,108,101,109,101,110,116,97,116,105,111,110,32,
+    111,102,32,105,109,112,111,114,116,46,114,13,0,0,0,78,
+    41,15,114,162,1,0,0,114,253,0,0,0,114,8,0,0,
+    0,114,92,1,0,0,114,213,0,0,0,114,100,1,0,0,
+    114,129,1,0,0,114,134,1,0,0,114,239,0,0,0,114,
+    25,1,0,0,114,32,1,0,0,114,3,0,0,0,114,17,
+    0,0,0,114,35,1,0,0,114,87,1,0,0,41,3,114,
+    160,1,0,0,114,161,1,0,0,90,17,115,117,112,112,111,
+    114,116,101,100,95,108,111,97,100,101,114,115,114,5,0,0,
+    0,114,5,0,0,0,114,6,0,0,0,218,8,95,105,110,
+    115,116,97,108,108,190,9,0,0,115,16,0,0,0,0,2,
+    13,1,9,1,28,1,16,1,16,1,15,1,19,1,114,163,
+    1,0,0,41,3,122,3,119,105,110,114,1,0,0,0,114,
+    2,0,0,0,41,93,114,76,0,0,0,114,11,0,0,0,
+    114,12,0,0,0,114,21,0,0,0,114,27,0,0,0,114,
+    29,0,0,0,114,38,0,0,0,114,48,0,0,0,114,49,
+    0,0,0,114,53,0,0,0,114,54,0,0,0,114,56,0,
+    0,0,114,73,0,0,0,114,82,0,0,0,114,85,0,0,
+    0,114,83,0,0,0,218,8,95,95,99,111,100,101,95,95,
+    114,209,0,0,0,114,86,0,0,0,114,125,0,0,0,114,
+    109,0,0,0,114,115,0,0,0,114,99,0,0,0,114,100,
+    0,0,0,114,118,0,0,0,114,119,0,0,0,114,121,0,
+    0,0,114,128,0,0,0,114,130,0,0,0,114,25,0,0,
+    0,114,201,0,0,0,114,24,0,0,0,114,28,0,0,0,
+    90,17,95,82,65,87,95,77,65,71,73,67,95,78,85,77,
+    66,69,82,114,140,0,0,0,114,118,1,0,0,114,122,1,
+    0,0,114,150,0,0,0,114,134,0,0,0,114,135,0,0,
+    0,114,148,0,0,0,114,151,0,0,0,114,158,0,0,0,
+    114,160,0,0,0,114,168,0,0,0,114,172,0,0,0,114,
+    177,0,0,0,114,180,0,0,0,114,188,0,0,0,114,196,
+    0,0,0,114,206,0,0,0,114,211,0,0,0,114,214,0,
+    0,0,114,219,0,0,0,114,227,0,0,0,114,228,0,0,
+    0,114,232,0,0,0,114,189,0,0,0,218,6,111,98,106,
+    101,99,116,114,254,0,0,0,114,252,0,0,0,114,4,1,
+    0,0,114,190,0,0,0,114,25,1,0,0,114,32,1,0,
+    0,114,35,1,0,0,114,44,1,0,0,114,45,1,0,0,
+    114,60,1,0,0,114,64,1,0,0,114,69,1,0,0,114,
+    73,1,0,0,114,70,1,0,0,114,74,1,0,0,114,11,
+    1,0,0,114,87,1,0,0,114,100,1,0,0,114,130,1,
+    0,0,114,133,1,0,0,114,5,1,0,0,114,137,1,0,
+    0,114,146,1,0,0,114,138,1,0,0,114,140,1,0,0,
+    114,141,1,0,0,114,142,1,0,0,114,148,1,0,0,114,
+    150,1,0,0,114,253,0,0,0,114,153,1,0,0,114,154,
+    1,0,0,114,162,1,0,0,114,163,1,0,0,114,5,0,
+    0,0,114,5,0,0,0,114,5,0,0,0,114,6,0,0,
+    0,218,8,60,109,111,100,117,108,101,62,8,0,0,0,115,
+    172,0,0,0,6,17,6,3,12,12,12,10,12,5,12,5,
+    12,6,12,12,12,10,12,9,12,5,12,7,15,22,12,8,
+    12,4,15,4,19,20,6,2,6,3,22,4,19,68,19,21,
+    19,19,12,19,12,20,12,113,22,1,18,2,6,5,6,1,
+    6,2,9,2,9,1,9,2,15,27,12,23,12,19,12,12,
+    18,8,12,18,12,11,12,11,12,13,12,13,21,55,21,12,
+    18,10,12,14,12,34,19,27,19,106,24,22,9,3,12,1,
+    15,63,18,45,19,251,19,63,19,59,19,60,19,25,22,110,
+    19,31,25,43,25,16,6,3,19,48,19,57,19,27,19,124,
+    19,249,19,13,12,9,15,41,12,17,6,1,10,2,12,27,
+    12,6,18,24,12,32,12,15,12,11,24,35,12,8,12,88,
 };
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""Benchmark scheduling and cancelling timers on the asyncio event loop.
+
+This models the timeout pattern of a busy server: every request arms a
+timer with call_later() and cancels it almost always before it fires.
+Each run schedules a number of timers far in the future, cancels a
+fraction of them and lets the loop run one iteration, in rounds, and
+reports the throughput together with the size of the loop's heap of
+scheduled calls at the end, e.g.
+
+    ./python Tools/asynciobench/timerbench.py -n 100000 -c 0.99
+
+With lazy cancellation only, the heap keeps growing with the cancelled
+timers; it should stay close to the number of live timers.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+
+def noop():
+    pass
+
+def run_one(loop, number, cancel_ratio, batch):
+    handles = []
+    cancel_every = None
+    if cancel_ratio < 1.0:
+        cancel_every = max(1, round(1 / (1 - cancel_ratio)))
+    t0 = time.perf_counter()
+    for i in range(number):
+        handles.append(loop.call_later(3600, noop))
+        if len(handles) == batch:
+            for j, handle in enumerate(handles):
+                if cancel_every is None or j % cancel_every:
+                    handle.cancel()
+            handles = []
+            loop.call_soon(loop.stop)
+            loop.run_forever()
+    elapsed = time.perf_counter() - t0
+    for handle in handles:
+        handle.cancel()
+    loop.call_soon(loop.stop)
+    loop.run_forever()
+    return elapsed, len(loop._scheduled)
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark asyncio timer scheduling and cancellation.')
+    parser.add_argument('-n', '--number', type=int, default=100000,
+                        help='number of timers per run (default: %(default)s)')
+    parser.add_argument('-c', '--cancel-ratio', type=float, default=0.99,
+                        help='fraction of the timers which are cancelled '
+                             '(default: %(default)s)')
+    parser.add_argument('-b', '--batch', type=int, default=100,
+                        help='number of timers scheduled per loop '
+                             'iteration (default: %(default)s)')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of runs, the best one being kept '
+                             '(default: %(default)s)')
+    args = parser.parse_args()
+    if not 0.0 <= args.cancel_ratio <= 1.0:
+        parser.error('the cancel ratio must be between 0 and 1')
+
+    print('Python %s' % sys.version.split()[0])
+    best = None
+    for i in range(args.repeat):
+        loop = asyncio.new_event_loop()
+        try:
+            elapsed, heap_size = run_one(loop, args.number,
+                                         args.cancel_ratio, args.batch)
+        finally:
+            loop.close()
+        if best is None or elapsed < best:
+            best = elapsed
+    print('%d timers, %.0f%% cancelled: %.1f us per timer, '
+          '%.0f timers/s, %d handles left in the heap'
+          % (args.number, args.cancel_ratio * 100, best / args.number * 1e6,
+             args.number / best, heap_size))
+
+if __name__ == '__main__':
+    main()
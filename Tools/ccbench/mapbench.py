@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""Benchmark ProcessPoolExecutor.map() throughput versus chunksize.
+
+Each run maps a cheap function over a range of inputs with a given
+chunksize and reports the number of calls completed per second, e.g.
+
+    ./python Tools/ccbench/mapbench.py -n 100000 -c 1,10,100,1000
+
+With a chunksize of 1 every input travels through the call and result
+queues on its own, so the inter-process overhead dominates for cheap
+functions; bigger chunks amortize it over many calls.  The --work option
+makes each call more expensive to show where chunking stops mattering.
+"""
+
+import argparse
+import concurrent.futures
+import os
+import sys
+import time
+
+
+def task(x, work=0):
+    for i in range(work):
+        x = (x * 31 + i) % 1000003
+    return x
+
+def run_one(executor, count, chunksize, work, repeat):
+    best = None
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        for result in executor.map(task, range(count), [work] * count,
+                                   chunksize=chunksize):
+            pass
+        elapsed = time.perf_counter() - t0
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark ProcessPoolExecutor.map() chunksizes.')
+    parser.add_argument('-n', '--count', type=int, default=20000,
+                        help='number of calls per run (default: %(default)s)')
+    parser.add_argument('-c', '--chunksizes', default='1,4,16,64,256,1024',
+                        help='comma-separated chunksizes to try '
+                             '(default: %(default)s)')
+    parser.add_argument('-w', '--workers', type=int, default=None,
+                        help='number of worker processes '
+                             '(default: number of CPUs)')
+    parser.add_argument('--work', type=int, default=0,
+                        help='loop iterations done by each call, to make '
+                             'the calls more expensive (default: %(default)s)')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of runs per chunksize, the best one '
+                             'being kept (default: %(default)s)')
+    args = parser.parse_args()
+
+    chunksizes = [int(c) for c in args.chunksizes.split(',')]
+    workers = args.workers or os.cpu_count() or 1
+
+    print('Python %s, %d workers, %d calls, work=%d'
+          % (sys.version.split()[0], workers, args.count, args.work))
+    print('%10s %12s %14s' % ('chunksize', 'time', 'calls/s'))
+    with concurrent.futures.ProcessPoolExecutor(workers) as executor:
+        # Start the worker processes before timing anything.
+        list(executor.map(task, range(workers)))
+        for chunksize in chunksizes:
+            elapsed = run_one(executor, args.count, chunksize, args.work,
+                              args.repeat)
+            print('%10d %10.3f s %14.0f'
+                  % (chunksize, elapsed, args.count / elapsed))
+            sys.stdout.flush()
+
+if __name__ == '__main__':
+    main()
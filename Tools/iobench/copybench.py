@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""Benchmark the file copy strategies used by shutil.copyfile().
+
+Each strategy copies the same source file a number of times and the best
+throughput is reported.  Sizes range from a few KB (where per-call overhead
+dominates) to multi-GB files (where the number of copies through user space
+dominates); the bigger sizes have to be requested explicitly, e.g.
+
+    ./python Tools/iobench/copybench.py -s 4K,1M,64M,4G
+
+The source files are created once in the chosen directory (the current one
+by default) and removed afterwards.  Use -k to keep them around for
+subsequent runs.
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import time
+
+
+def legacy_copyfileobj(fsrc, fdst, length=16 * 1024):
+    # The read()/write() loop shutil used before the fast paths existed.
+    while 1:
+        buf = fsrc.read(length)
+        if not buf:
+            break
+        fdst.write(buf)
+
+def copy_read_write(src, dst):
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        legacy_copyfileobj(fsrc, fdst)
+
+def copy_copyfileobj(src, dst):
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        shutil.copyfileobj(fsrc, fdst)
+
+def copy_readinto(src, dst):
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        shutil._copyfileobj_readinto(fsrc, fdst)
+
+def copy_sendfile(src, dst):
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        shutil._fastcopy_sendfile(fsrc, fdst)
+
+def copy_copyfile(src, dst):
+    shutil.copyfile(src, dst)
+
+STRATEGIES = [
+    ('read/write 16K', copy_read_write),
+    ('copyfileobj', copy_copyfileobj),
+    ('readinto', copy_readinto),
+]
+if shutil._USE_CP_SENDFILE:
+    STRATEGIES.append(('sendfile', copy_sendfile))
+STRATEGIES.append(('copyfile', copy_copyfile))
+
+
+UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+
+def parse_size(text):
+    text = text.strip().upper().rstrip('B')
+    unit = text[-1:] if text[-1:] in UNITS else ''
+    return int(float(text[:len(text) - len(unit)]) * UNITS[unit])
+
+def format_size(size):
+    for unit in ('G', 'M', 'K'):
+        if size >= UNITS[unit] and size % UNITS[unit] == 0:
+            return '%d%sB' % (size // UNITS[unit], unit)
+    return '%dB' % size
+
+def make_file(path, size):
+    if os.path.exists(path) and os.path.getsize(path) == size:
+        return
+    chunk = os.urandom(min(size, 1024 * 1024))
+    with open(path, 'wb') as f:
+        remaining = size
+        while remaining:
+            n = min(remaining, len(chunk))
+            f.write(chunk[:n])
+            remaining -= n
+
+def run_one(func, src, dst, size, repeat):
+    # Copy at least a few times, but don't spend too long on big files.
+    number = max(1, min(1000, (64 * 1024 * 1024) // max(size, 1)))
+    best = None
+    for i in range(repeat):
+        t0 = time.perf_counter()
+        for j in range(number):
+            func(src, dst)
+        elapsed = (time.perf_counter() - t0) / number
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark shutil file copy strategies.')
+    parser.add_argument('-s', '--sizes', default='4K,64K,1M,64M',
+                        help='comma-separated file sizes, with an optional '
+                             'K, M or G suffix (default: %(default)s)')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of runs per strategy, the best one '
+                             'being kept (default: %(default)s)')
+    parser.add_argument('-d', '--directory', default=os.curdir,
+                        help='directory to create the files in')
+    parser.add_argument('-k', '--keep', action='store_true',
+                        help="don't remove the source files at the end")
+    parser.add_argument('strategies', nargs='*', metavar='strategy',
+                        help='strategies to run, among: %s' %
+                             ', '.join(name for name, func in STRATEGIES))
+    args = parser.parse_args()
+
+    strategies = STRATEGIES
+    if args.strategies:
+        strategies = [(name, func) for name, func in STRATEGIES
+                      if name.split()[0] in args.strategies]
+        if not strategies:
+            parser.error('no such strategy')
+    sizes = [parse_size(s) for s in args.sizes.split(',')]
+
+    print('Python %s' % sys.version.split()[0])
+    print('%-16s' % 'size' +
+          ''.join('%16s' % name for name, func in strategies))
+    dst = os.path.join(args.directory, 'copybench-dst.bin')
+    for size in sizes:
+        src = os.path.join(args.directory,
+                           'copybench-%s.bin' % format_size(size))
+        make_file(src, size)
+        try:
+            row = []
+            for name, func in strategies:
+                elapsed = run_one(func, src, dst, size, args.repeat)
+                if size >= 1024 * 1024:
+                    row.append('%10.1f MB/s' % (size / elapsed / 1e6))
+                else:
+                    row.append('%11.1f us' % (elapsed * 1e6))
+            print('%-16s' % format_size(size) +
+                  ''.join('%16s' % cell for cell in row))
+            sys.stdout.flush()
+        finally:
+            if os.path.exists(dst):
+                os.unlink(dst)
+            if not args.keep:
+                os.unlink(src)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Benchmark the cost of disabled logging calls against hierarchy depth.
+
+A logger named "a.a.a..." is created at each depth, only the root logger
+has a level set, and logger.debug() is called repeatedly while the root
+level is WARNING, so that no call gets past Logger.isEnabledFor().
+The time per call is reported for each depth, e.g.
+
+    ./python Tools/loggingbench/disabledbench.py -d 1 5 10 20
+
+With the enabled-level cache the cost should not depend on the depth.
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+
+def run_one(logger, number):
+    debug = logger.debug
+    t0 = time.perf_counter()
+    for i in range(number):
+        debug('disabled %d', i)
+    return time.perf_counter() - t0
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark disabled logging calls.')
+    parser.add_argument('-n', '--number', type=int, default=1000000,
+                        help='number of calls per run (default: %(default)s)')
+    parser.add_argument('-d', '--depth', type=int, nargs='+',
+                        default=[1, 2, 5, 10, 20],
+                        help='depths of the loggers in the hierarchy '
+                             '(default: %(default)s)')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of runs, the best one being kept '
+                             '(default: %(default)s)')
+    args = parser.parse_args()
+    if min(args.depth) < 1:
+        parser.error('the depth must be at least 1')
+
+    print('Python %s' % sys.version.split()[0])
+    logging.root.setLevel(logging.WARNING)
+    logging.root.addHandler(logging.NullHandler())
+    for depth in args.depth:
+        logger = logging.getLogger('.'.join(['a'] * depth))
+        best = min(run_one(logger, args.number) for i in range(args.repeat))
+        print('depth %3d: %.3f us per disabled call'
+              % (depth, best / args.number * 1e6))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Benchmark the cost of enabled logging calls against the record fields used.
+
+logger.info() is called repeatedly with a StreamHandler writing to a
+stream which discards its output, for each combination of the record factory (LogRecord or
+LazyLogRecord) and of a format string which does or does not reference
+the location of the call, e.g.
+
+    ./python Tools/loggingbench/recordbench.py -n 100000
+
+Logger._log() only calls findCaller() when a format string references the
+location of the call, and LazyLogRecord only computes the fields a format
+string references, so the calls whose format string only uses the message
+should be the cheapest.
+"""
+
+import argparse
+import logging
+import sys
+import time
+
+
+FORMATS = [
+    ('message', '%(message)s'),
+    ('levelname, message', '%(levelname)s %(message)s'),
+    ('lineno, message', '%(lineno)d %(message)s'),
+    ('asctime, filename, lineno, message',
+     '%(asctime)s %(filename)s:%(lineno)d %(message)s'),
+]
+
+FACTORIES = [
+    ('LogRecord', logging.LogRecord),
+    ('LazyLogRecord', logging.LazyLogRecord),
+]
+
+class NullStream:
+    """A stream which discards what is written, so that no I/O is timed."""
+
+    def write(self, s):
+        pass
+
+    def flush(self):
+        pass
+
+def run_one(logger, number):
+    info = logger.info
+    t0 = time.perf_counter()
+    for i in range(number):
+        info('enabled %d', i)
+    return time.perf_counter() - t0
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Benchmark enabled logging calls.')
+    parser.add_argument('-n', '--number', type=int, default=100000,
+                        help='number of calls per run (default: %(default)s)')
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of runs, the best one being kept '
+                             '(default: %(default)s)')
+    args = parser.parse_args()
+
+    print('Python %s' % sys.version.split()[0])
+    logger = logging.getLogger('bench')
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    logger.addHandler(logging.StreamHandler(NullStream()))
+    for factory_name, factory in FACTORIES:
+        logging.setLogRecordFactory(factory)
+        for format_name, fmt in FORMATS:
+            logger.handlers[0].setFormatter(logging.Formatter(fmt))
+            best = min(run_one(logger, args.number)
+                       for i in range(args.repeat))
+            print('%-14s %-35s %.3f us per call'
+                  % (factory_name, format_name, best / args.number * 1e6))
+
+if __name__ == '__main__':
+    main()
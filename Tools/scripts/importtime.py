@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""Analyze the output of python -X importtime.
+
+Reads the "import time:" lines written to stderr by -X importtime (or
+PYTHONPROFILEIMPORTTIME), from the given files or from stdin, and prints:
+
+* by default, the total import time and the modules with the largest self
+  and cumulative times; when several files are given, each holding the
+  output of one run, the median and mean times of each module across the
+  runs and the number of runs which imported it;
+* with --tree, the import tree, heaviest subtrees first, leaving out the
+  subtrees below a cumulative time threshold;
+* with --folded, one "parent;child;grandchild self_us" line per module,
+  the input format of flame graph generators.
+
+Example:
+
+    python -X importtime -c 'import asyncio' 2> imports.log
+    python Tools/scripts/importtime.py --tree --min 1000 imports.log
+
+With several runs, --tree and --folded use the median times.
+"""
+
+import argparse
+import re
+import statistics
+import sys
+
+LINE_RE = re.compile(r'^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)\s*$')
+
+
+class Import:
+
+    def __init__(self, name):
+        self.name = name
+        # Times of the import in each run.
+        self.self_times = []
+        self.cumulative_times = []
+        self.children = []
+
+    @property
+    def self_us(self):
+        return statistics.median(self.self_times)
+
+    @property
+    def cumulative_us(self):
+        return statistics.median(self.cumulative_times)
+
+    def walk(self, parents=()):
+        path = parents + (self.name,)
+        yield path, self
+        for child in self.children:
+            yield from child.walk(path)
+
+
+def parse(lines):
+    """Return the list of top-level imports found in lines.
+
+    Modules are reported after the imports they trigger, so the children of
+    an import are the entries one level deeper seen since the previous entry
+    at its own level.
+    """
+    pending = {}
+    for line in lines:
+        match = LINE_RE.match(line)
+        if match is None:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        level = len(indent) // 2
+        node = Import(name)
+        node.self_times.append(int(self_us))
+        node.cumulative_times.append(int(cumulative_us))
+        node.children = pending.pop(level + 1, [])
+        pending.setdefault(level, []).append(node)
+    return pending.get(0, [])
+
+
+def merge(runs, merged=None):
+    """Merge the lists of top-level imports of several runs.
+
+    Imports are matched by their path from the top-level import, and the
+    times of each run are appended to the merged nodes.
+    """
+    if merged is None:
+        merged = []
+    for nodes in runs:
+        by_name = {node.name: node for node in merged}
+        for node in nodes:
+            target = by_name.get(node.name)
+            if target is None:
+                target = by_name[node.name] = Import(node.name)
+                merged.append(target)
+            target.self_times.extend(node.self_times)
+            target.cumulative_times.extend(node.cumulative_times)
+            merge([node.children], target.children)
+    return merged
+
+
+def format_us(us):
+    if us >= 1000000:
+        return '%.2f s' % (us / 1e6)
+    if us >= 1000:
+        return '%.1f ms' % (us / 1e3)
+    return '%d us' % us
+
+
+def print_runs_summary(runs, count):
+    # A module can be imported from different parents in different runs,
+    # so times are aggregated by module name.
+    modules = {}
+    totals = []
+    for roots in runs:
+        totals.append(sum(root.cumulative_us for root in roots))
+        for root in roots:
+            for path, node in root.walk():
+                times = modules.setdefault(node.name, ([], []))
+                times[0].extend(node.self_times)
+                times[1].extend(node.cumulative_times)
+    print('%d modules imported in %s (median of %d runs, mean %s)'
+          % (len(modules), format_us(statistics.median(totals)), len(runs),
+             format_us(statistics.mean(totals))))
+    for title, index in (('self', 0), ('cumulative', 1)):
+        print()
+        print('Top %d by median %s time:' % (count, title))
+        print('  %10s %10s %5s  %s' % ('median', 'mean', 'runs', 'module'))
+        medians = {name: statistics.median(times[index])
+                   for name, times in modules.items()}
+        names = sorted(medians, key=medians.get, reverse=True)
+        for name in names[:count]:
+            times = modules[name][index]
+            print('  %10s %10s %5d  %s' % (format_us(medians[name]),
+                                          format_us(statistics.mean(times)),
+                                          len(times), name))
+
+
+def print_summary(roots, count):
+    nodes = [node for root in roots for path, node in root.walk()]
+    total = sum(root.cumulative_us for root in roots)
+    print('%d modules imported in %s' % (len(nodes), format_us(total)))
+    for title, key in (('self', 'self_us'), ('cumulative', 'cumulative_us')):
+        print()
+        print('Top %d by %s time:' % (count, title))
+        nodes.sort(key=lambda node: getattr(node, key), reverse=True)
+        for node in nodes[:count]:
+            percent = 100.0 * getattr(node, key) / total if total else 0.0
+            print('  %10s %5.1f%%  %s' % (format_us(getattr(node, key)),
+                                         percent, node.name))
+
+
+def print_tree(nodes, threshold, level=0):
+    for node in sorted(nodes, key=lambda node: node.cumulative_us,
+                       reverse=True):
+        if node.cumulative_us < threshold:
+            continue
+        print('%10s %10s  %s%s' % (format_us(node.cumulative_us),
+                                   format_us(node.self_us),
+                                   '  ' * level, node.name))
+        print_tree(node.children, threshold, level + 1)
+
+
+def print_folded(roots):
+    for root in roots:
+        for path, node in root.walk():
+            print('%s %d' % (';'.join(path), node.self_us))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Analyze the output of python -X importtime.')
+    parser.add_argument('files', nargs='*', type=argparse.FileType('r'),
+                        metavar='file',
+                        help='file holding the -X importtime output of a '
+                             'run (default: stdin)')
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--tree', action='store_true',
+                       help='print the import tree, heaviest first')
+    group.add_argument('--folded', action='store_true',
+                       help='print folded stacks for flame graphs')
+    parser.add_argument('-n', '--count', type=int, default=15,
+                        help='number of modules in the summary '
+                             '(default: %(default)s)')
+    parser.add_argument('--min', type=int, default=0, metavar='US',
+                        help='with --tree, hide imports whose cumulative '
+                             'time is below US microseconds')
+    args = parser.parse_args()
+
+    runs = []
+    for file in args.files or [sys.stdin]:
+        with file:
+            roots = parse(file)
+        if not roots:
+            sys.exit('no -X importtime output found in %s' % file.name)
+        runs.append(roots)
+    if args.tree:
+        print('%10s %10s  %s' % ('cumulative', 'self', 'module'))
+        print_tree(merge(runs), args.min)
+    elif args.folded:
+        print_folded(merge(runs))
+    elif len(runs) > 1:
+        print_runs_summary(runs, args.count)
+    else:
+        print_summary(runs[0], args.count)
+
+
+if __name__ == '__main__':
+    main()
@@ -1514,6 +1514,15 @@ class PyBuildExt(build_ext):
                                     include_dirs=["Modules/_multiprocessing"]))
         else:
             missing.append('_multiprocessing')
+
+        # POSIX named shared memory for multiprocessing.shared_memory
+        if host_platform != 'win32':
+            shm_libs = []
+            if self.compiler.find_library_file(lib_dirs, 'rt'):
+                shm_libs.append('rt')
+            exts.append ( Extension('_posixshmem',
+                                    ['_multiprocessing/posixshmem.c'],
+                                    libraries=shm_libs))
         # End multiprocessing
 
         # Platform-specific libraries